@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""Benchmark build.py against synthetic palette collections.
+
+Generates palette.toml plus palettes/*.toml with 10, 100 and 1000 variants
+(each with a full extended table), then builds every target into a scratch
+tree and reports, per stage, the best wall time, peak Python memory and
+output bytes. Output digests are compared with bench_golden.json so a faster
+build can show it still writes exactly the same files.
+
+  bench_build.py                      # all sizes, check goldens
+  bench_build.py --sizes 10,100       # just these sizes
+  bench_build.py --update-golden      # accept the current output
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import build
+
+GOLDEN_FILE = Path(__file__).resolve().parent / "bench_golden.json"
+DEFAULT_SIZES = (10, 100, 1000)
+VARIANTS_PER_FRAGMENT = 10
+EXTENDED_SIZE = 240
+HUES = ("red", "green", "yellow", "blue", "magenta", "cyan")
+HUE_SUFFIXES = ("", "_warmer", "_cooler", "_faint", "_intense", "_subtle", "_nuanced")
+CORE_KEYS = ("bg_main", "bg_dim", "bg_alt", "fg_main", "fg_dim", "fg_alt", "border", "border_highlight", "comment")
+DOTFILES_PATHS = {
+    name: value.relative_to(build.ROOT)
+    for name, value in vars(build).items()
+    if isinstance(value, Path) and name != "ROOT" and value.is_relative_to(build.ROOT)
+}
+
+
+def extended_keys() -> list[str]:
+    keys = list(CORE_KEYS)
+    keys += [f"{prefix}{hue}{suffix}" for prefix in ("", "bg_") for hue in HUES for suffix in HUE_SUFFIXES]
+    keys += [f"ext_{index:03d}" for index in range(EXTENDED_SIZE - len(keys))]
+    return keys
+
+
+def _toml_value(value) -> str:
+    if isinstance(value, list):
+        return "[\n" + "".join(f"  '{item}',\n" for item in value) + "]"
+    return f"'{value}'"
+
+
+def synthetic_palette(root: Path, size: int, seed: int = 0) -> None:
+    """Write palette.toml and palettes/*.toml defining size variants under root."""
+    rng = random.Random(seed)
+    color = lambda: f"#{rng.randrange(0x1000000):06x}"
+    keys = extended_keys()
+    fragments = root / "palettes"
+    fragments.mkdir(parents=True)
+
+    (root / "palette.toml").write_text("default_variant = 'synthetic_000_light'\ndefault_family = 'synthetic_000'\n")
+    for start in range(0, size, VARIANTS_PER_FRAGMENT):
+        lines = [f"# Synthetic palette fragment {start // VARIANTS_PER_FRAGMENT}", ""]
+        for index in range(start, min(start + VARIANTS_PER_FRAGMENT, size)):
+            family = f"synthetic_{index // 2:03d}"
+            flavor = "light" if index % 2 == 0 else "dark"
+            if flavor == "light":
+                lines += [
+                    f"[families.{family}]",
+                    f"name = 'Synthetic {index // 2}'",
+                    "license = 'GPL v3'",
+                    f"light_variant = '{family}_light'",
+                    f"dark_variant = '{family}_dark'",
+                    "",
+                ]
+            variant = {
+                "family": family,
+                "flavor": flavor,
+                "foreground": color(),
+                "background": color(),
+                "cursor": color(),
+                "selection_background": color(),
+                "selection_foreground": color(),
+                "ansi": [color() for _ in range(16)],
+            }
+            lines.append(f"[variants.{family}_{flavor}]")
+            lines += [f"{key} = {_toml_value(value)}" for key, value in variant.items()]
+            lines += ["", f"[variants.{family}_{flavor}.extended]"]
+            lines += [f"{key} = '{color()}'" for key in keys]
+            lines.append("")
+        (fragments / f"synthetic_{start // VARIANTS_PER_FRAGMENT:03d}.toml").write_text("\n".join(lines))
+
+
+def redirect_build(root: Path) -> None:
+    """Point build.py's inputs, outputs and caches into root instead of the dotfiles."""
+    for name, relative in DOTFILES_PATHS.items():
+        setattr(build, name, root / relative)
+    build.PALETTE_CACHE_FILE = root / "cache" / "palette.pickle"
+    build.BUILD_MANIFEST_FILE = root / "cache" / "build_manifest.json"
+
+
+class WriteTimer:
+    """Accumulates time spent in build.write_if_changed while installed."""
+
+    def __init__(self):
+        self.original = build.write_if_changed
+        self.seconds = 0.0
+
+    def __call__(self, path: Path, content: str) -> bool:
+        started = time.perf_counter()
+        try:
+            return self.original(path, content)
+        finally:
+            self.seconds += time.perf_counter() - started
+
+    def __enter__(self):
+        build.write_if_changed = self
+        return self
+
+    def __exit__(self, *exc_info):
+        build.write_if_changed = self.original
+
+
+def measure(stage, repeat: int, setup=None, timer: WriteTimer | None = None) -> dict:
+    """Best wall time of stage() over repeat runs, plus its peak traced memory.
+
+    With a timer, also the time the best run spent in write_if_changed.
+    """
+    best = None
+    write_seconds = None
+    for _ in range(repeat):
+        if setup:
+            setup()
+        writes_before = timer.seconds if timer else 0.0
+        started = time.perf_counter()
+        result = stage()
+        elapsed = time.perf_counter() - started
+        if best is None or elapsed < best:
+            best = elapsed
+            write_seconds = timer.seconds - writes_before if timer else None
+    if setup:
+        setup()
+    tracemalloc.start()
+    stage()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": best, "write_seconds": write_seconds, "peak_bytes": peak, "result": result}
+
+
+def output_digests(root: Path, paths: list[Path]) -> dict:
+    """Per-target file count, bytes and a digest over relative paths and contents."""
+    digest = hashlib.sha256()
+    size = 0
+    for path in sorted(paths):
+        data = path.read_bytes()
+        size += len(data)
+        digest.update(str(path.relative_to(root)).encode() + b"\0" + data + b"\0")
+    return {"files": len(paths), "bytes": size, "sha256": digest.hexdigest()}
+
+
+def target_outputs(target: str, root: Path) -> list[Path]:
+    """Every file target owns in the scratch tree (written or unchanged)."""
+    manifest = json.loads(build.BUILD_MANIFEST_FILE.read_text())
+    return [Path(path) for path, entry in manifest["outputs"].items() if entry.get("target") == target]
+
+
+def remove_outputs(root: Path) -> None:
+    for path in root.rglob("*"):
+        if path.is_file() and not path.is_relative_to(root / "colors") and not path.is_relative_to(root / "cache"):
+            path.unlink()
+
+
+def bench_size(size: int, repeat: int) -> tuple[list[tuple], dict]:
+    rows = []
+    with tempfile.TemporaryDirectory(prefix=f"colors-bench-{size}-") as tmp:
+        root = Path(tmp)
+        redirect_build(root)
+        synthetic_palette(build.PALETTE_FILE.parent, size)
+
+        stage = measure(lambda: build.load_palette(use_cache=False), repeat)
+        rows.append(("load_palette (cold)", stage, None))
+        palette = stage["result"]
+        rows.append(("load_palette (cached)", measure(build.load_palette, repeat), None))
+        rows.append(("lua_serialize", measure(lambda: build.lua_serialize(palette), repeat), None))
+
+        for target in build.BUILD_TARGETS:
+            with WriteTimer() as timer:
+                stage = measure(lambda: build.build(palette, [target]), repeat, lambda: remove_outputs(root), timer)
+            rows.append((f"render {target}", stage, sum(map(_size, stage["result"].written[target]))))
+
+        manifest_path = build.BUILD_MANIFEST_FILE
+        fresh_build = lambda: build.build(palette, manifest=build.BuildManifest(manifest_path))
+        clean = lambda: (remove_outputs(root), manifest_path.unlink(missing_ok=True))
+        rows.append(("build (clean, manifest)", measure(fresh_build, repeat, clean), None))
+        rows.append(("build (unchanged, manifest)", measure(fresh_build, repeat), None))
+
+        digests = {target: output_digests(root, target_outputs(target, root)) for target in build.BUILD_TARGETS}
+    return rows, digests
+
+
+def _size(path: Path) -> int:
+    return path.stat().st_size if path.exists() else 0
+
+
+def print_rows(size: int, rows: list[tuple]) -> None:
+    print(f"\n{size} variants")
+    print(f"  {'stage':<30} {'time':>10} {'writes':>10} {'peak mem':>10} {'output':>10}")
+    for name, stage, output in rows:
+        writes = f"{stage['write_seconds'] * 1000:.1f} ms" if stage["write_seconds"] is not None else ""
+        written = f"{output / 1024:.0f} KiB" if output is not None else ""
+        print(
+            f"  {name:<30} {stage['seconds'] * 1000:>7.1f} ms {writes:>10} "
+            f"{stage['peak_bytes'] / 1024:>6.0f} KiB {written:>10}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark build.py on synthetic palettes.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="Comma-separated variant counts")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage (best is reported)")
+    parser.add_argument("--update-golden", action="store_true", help=f"Record output digests in {GOLDEN_FILE.name}")
+    args = parser.parse_args()
+
+    os.environ["COLOR_HOST"] = "colors-bench"  # keep host overrides out of the output
+    golden = json.loads(GOLDEN_FILE.read_text()) if GOLDEN_FILE.exists() else {}
+    mismatches = []
+    for size in (int(value) for value in args.sizes.split(",")):
+        rows, digests = bench_size(size, args.repeat)
+        print_rows(size, rows)
+        if args.update_golden:
+            golden[str(size)] = digests
+            continue
+        expected = golden.get(str(size))
+        if expected is None:
+            print(f"  (no golden output for {size} variants; run with --update-golden)")
+            continue
+        for target, digest in digests.items():
+            if expected.get(target) != digest:
+                mismatches.append(f"{size} variants: {target} output differs from {GOLDEN_FILE.name}")
+
+    if args.update_golden:
+        GOLDEN_FILE.write_text(json.dumps(golden, indent=2, sort_keys=True) + "\n")
+        print(f"\nUpdated {GOLDEN_FILE}")
+    for mismatch in mismatches:
+        print(f"error: {mismatch}", file=sys.stderr)
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,9 +3,23 @@
 
 from __future__ import annotations
 
+import argparse
+import concurrent.futures
+import contextlib
+import ctypes
+import ctypes.util
+import hashlib
+import io
+import json
+import math
+import pickle
+import select
 import sys
 import os
 import socket
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
 
 try:
@@ -13,17 +27,50 @@ try:
 except ModuleNotFoundError:  # pragma: no cover - fallback for older Pythons
     tomllib = None
 
+try:
+    import numpy
+except ModuleNotFoundError:  # pragma: no cover - optional: batches blends and the contrast audit
+    numpy = None  # pure-Python paths give the same results (system Python without the uv env)
+
 ROOT = Path(__file__).resolve().parent.parent.parent.parent  # dotfiles root
 PALETTE_FILE = Path(__file__).resolve().parent / "palette.toml"  # same dir as build.py
 PALETTES_DIR = Path(__file__).resolve().parent / "palettes"
 GHOSTTY_THEME_DIR = ROOT / "ghostty" / ".config" / "ghostty" / "themes"
-NVIM_PALETTE_MODULE = ROOT / "nvim" / ".config" / "nvim" / "lua" / "phajas" / "colors" / "palette.lua"
-NVIM_WALLPAPER_MODULE = ROOT / "nvim" / ".config" / "nvim" / "lua" / "phajas" / "colors" / "palette_wallpaper.lua"
+NVIM_COLORS_DIR = ROOT / "nvim" / ".config" / "nvim" / "lua" / "phajas" / "colors"
+NVIM_PALETTE_MODULE = NVIM_COLORS_DIR / "palette.lua"
+NVIM_WALLPAPER_MODULE = NVIM_COLORS_DIR / "palette_wallpaper.lua"
+NVIM_INDEX_MODULE = NVIM_COLORS_DIR / "index.lua"
+NVIM_WALLPAPER_INDEX_MODULE = NVIM_COLORS_DIR / "index_wallpaper.lua"
+NVIM_VARIANT_DIR = NVIM_COLORS_DIR / "variants"
+NVIM_HIGHLIGHT_DIR = NVIM_COLORS_DIR / "highlights"
 NVIM_COLORSCHEME_FILE = ROOT / "nvim" / ".config" / "nvim" / "colors" / "phajas_palette.lua"
 RANGER_CONFIG_DIR = ROOT / "ranger" / ".config" / "ranger"
 RANGER_COLORSCHEME_DIR = RANGER_CONFIG_DIR / "colorschemes"
 RANGER_RC_FILE = RANGER_CONFIG_DIR / "rc.conf"
 WALLPAPER_FAMILY = "from_wallpaper"
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "colors"
+BUILD_MANIFEST_FILE = CACHE_DIR / "build_manifest.json"
+PALETTE_CACHE_FILE = CACHE_DIR / "palette.pickle"
+FRAGMENT_INDEX_FILE = CACHE_DIR / "fragment_index.json"
+FRAGMENT_INDEX_FORMAT = 2
+HOST_TREES_DIR = CACHE_DIR / "hosts"
+# Colors compared by build.py --audit, and the (kind, text, background) pairs it
+# checks. ANSI 0/8 and 7/15 are the terminal's blacks and whites, which sit next
+# to the background or foreground by design, so only the hues are audited.
+AUDIT_COLORS = ("background", "foreground", "selection_background", "selection_foreground") + tuple(
+    f"ansi_{slot}" for slot in range(16)
+)
+AUDIT_PAIRS = (
+    ("foreground", "foreground", "background"),
+    ("selection", "selection_foreground", "selection_background"),
+    *(("ansi", f"ansi_{slot}", "background") for slot in (1, 2, 3, 4, 5, 6, 9, 10, 11, 12, 13, 14)),
+)
+AUDIT_THRESHOLDS = {"foreground": 4.5, "selection": 4.5, "ansi": 3.0}  # WCAG AA text / UI
+PARALLEL_RENDER_MIN_JOBS = 64  # below this, starting a process pool costs more than it saves
+WATCH_DEBOUNCE_SECONDS = 0.3
+WATCH_POLL_INTERVAL = 0.5
+COLORSCHEME_STATE_DIR = Path.home() / ".config" / "colorscheme"
+GENERATION_FILE = COLORSCHEME_STATE_DIR / "generation"
 
 
 class PaletteError(Exception):
@@ -101,35 +148,96 @@ def _load_toml(path: Path) -> dict:
     return tomllib.loads(raw_text) if tomllib else parse_simple_toml(raw_text)
 
 
-def load_palette() -> dict:
-    """Load and validate palette data from the TOML source."""
+def palette_sources() -> list[Path]:
+    """Palette input files in the order load_palette reads them."""
+    sources = [PALETTE_FILE]
+    if PALETTES_DIR.exists():
+        sources.extend(sorted(PALETTES_DIR.glob("*.toml")))
+    return sources
+
+
+def write_cache_file(path: Path, data: bytes) -> None:
+    """Atomically replace a cache file; failures only cost a rebuild next time."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        print(f"warning: could not write {path}: {exc}", file=sys.stderr)
+
+
+def publish_generation() -> int:
+    """Bump the generation counter that Neovim and Hammerspoon watch for theme changes.
+
+    The file is replaced atomically, so a directory watcher sees one rename per bump.
+    """
+    try:
+        generation = int(GENERATION_FILE.read_text().strip() or 0) + 1
+    except (OSError, ValueError):
+        generation = 1
+    write_cache_file(GENERATION_FILE, f"{generation}\n".encode())
+    return generation
+
+
+def _palette_cache_key() -> list:
+    """Identify the palette inputs (and this loader) by path, mtime and size."""
+    key = []
+    for path in [Path(__file__).resolve(), *palette_sources()]:
+        stat = path.stat()
+        key.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return key
+
+
+def load_palette(use_cache: bool = True) -> dict:
+    """Load and validate palette data, reusing the compiled cache when fresh."""
     if not PALETTE_FILE.exists():
         raise PaletteError(f"Palette file missing: {PALETTE_FILE}")
 
-    data = _load_toml(PALETTE_FILE)
-    families = data.get("families", {})
-    variants = data.get("variants", {})
+    key = _palette_cache_key()
+    if use_cache:
+        try:
+            cached = pickle.loads(PALETTE_CACHE_FILE.read_bytes())
+        except Exception:
+            cached = None
+        if isinstance(cached, dict) and cached.get("key") == key:
+            return cached["palette"]
+
+    palette = compile_palette()
+    write_cache_file(PALETTE_CACHE_FILE, pickle.dumps({"key": key, "palette": palette}, pickle.HIGHEST_PROTOCOL))
+    return palette
 
-    if PALETTES_DIR.exists():
-        for path in sorted(PALETTES_DIR.glob("*.toml")):
-            fragment = _load_toml(path)
-            extra_keys = set(fragment.keys()) - {"families", "variants"}
-            if extra_keys:
-                raise PaletteError(
-                    f"Palette fragment {path} contains unsupported keys: {', '.join(sorted(extra_keys))}"
-                )
 
-            frag_families = fragment.get("families", {})
-            for name, payload in frag_families.items():
-                if name in families and families[name] != payload:
-                    raise PaletteError(f"Family {name} redefined in {path}")
-                families[name] = payload
+def compile_palette(parsed: dict | None = None) -> dict:
+    """Parse, merge and validate palette.toml and every fragment.
+
+    parsed optionally maps source paths to already-parsed TOML (see
+    FragmentCache); it is not modified.
+    """
+    parsed = parsed or {}
+
+    def load(path: Path) -> dict:
+        return parsed[path] if path in parsed else _load_toml(path)
 
-            frag_variants = fragment.get("variants", {})
-            for name, payload in frag_variants.items():
-                if name in variants and variants[name] != payload:
-                    raise PaletteError(f"Variant {name} redefined in {path}")
-                variants[name] = payload
+    data = dict(load(PALETTE_FILE))
+    families = dict(data.get("families", {}))
+    variants = dict(data.get("variants", {}))
+
+    for path in palette_sources()[1:]:
+        fragment = load(path)
+        validate_fragment(path, fragment)
+
+        frag_families = fragment.get("families", {})
+        for name, payload in frag_families.items():
+            if name in families and families[name] != payload:
+                raise PaletteError(f"Family {name} redefined in {path}")
+            families[name] = payload
+
+        frag_variants = fragment.get("variants", {})
+        for name, payload in frag_variants.items():
+            if name in variants and variants[name] != payload:
+                raise PaletteError(f"Variant {name} redefined in {path}")
+            variants[name] = payload
 
     if not isinstance(variants, dict) or not variants:
         raise PaletteError("Palette must define at least one [variants] table.")
@@ -139,25 +247,7 @@ def load_palette() -> dict:
     data["variants"] = variants
 
     for name, payload in variants.items():
-        if not isinstance(payload, dict):
-            raise PaletteError(f"Variant {name} must be a table.")
-
-        required_keys = {
-            "flavor",
-            "foreground",
-            "background",
-            "cursor",
-            "selection_background",
-            "selection_foreground",
-            "ansi",
-        }
-        missing = required_keys - set(payload)
-        if missing:
-            raise PaletteError(f"Variant {name} is missing keys: {', '.join(sorted(missing))}")
-
-        ansi = payload["ansi"]
-        if not isinstance(ansi, list) or len(ansi) != 16:
-            raise PaletteError(f"Variant {name} must define 16 ANSI colors.")
+        validate_variant(name, payload)
 
     if default_variant and default_variant not in variants:
         raise PaletteError(f"default_variant '{default_variant}' not found in variants.")
@@ -165,10 +255,7 @@ def load_palette() -> dict:
     # Validate families
     families = data.get("families", {})
     for family_name, family_data in families.items():
-        required = {"name", "license", "light_variant", "dark_variant"}
-        missing = required - set(family_data)
-        if missing:
-            raise PaletteError(f"Family {family_name} missing: {', '.join(missing)}")
+        validate_family(family_name, family_data)
 
     # Validate variant family references
     for variant_name, variant_data in variants.items():
@@ -185,10 +272,198 @@ def load_palette() -> dict:
     }
 
 
-def apply_host_override(palette: dict) -> dict:
-    """Override default variant based on host-specific settings in the palette."""
+def validate_fragment(path: Path, fragment: dict) -> None:
+    extra_keys = set(fragment.keys()) - {"families", "variants"}
+    if extra_keys:
+        raise PaletteError(
+            f"Palette fragment {path} contains unsupported keys: {', '.join(sorted(extra_keys))}"
+        )
+
+
+def validate_variant(name: str, payload) -> None:
+    if not isinstance(payload, dict):
+        raise PaletteError(f"Variant {name} must be a table.")
+
+    required_keys = {
+        "flavor",
+        "foreground",
+        "background",
+        "cursor",
+        "selection_background",
+        "selection_foreground",
+        "ansi",
+    }
+    missing = required_keys - set(payload)
+    if missing:
+        raise PaletteError(f"Variant {name} is missing keys: {', '.join(sorted(missing))}")
+
+    ansi = payload["ansi"]
+    if not isinstance(ansi, list) or len(ansi) != 16:
+        raise PaletteError(f"Variant {name} must define 16 ANSI colors.")
+
+
+def validate_family(name: str, data: dict) -> None:
+    required = {"name", "license", "light_variant", "dark_variant"}
+    missing = required - set(data)
+    if missing:
+        raise PaletteError(f"Family {name} missing: {', '.join(missing)}")
+
+
+def _stat_stamp(path: Path) -> list | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _load_source(path: Path) -> dict:
+    try:
+        return _load_toml(path)
+    except ValueError as exc:  # tomllib.TOMLDecodeError
+        raise PaletteError(f"{path}: {exc}") from exc
+
+
+def load_fragment_index(verify: bool = False, rebuild: bool = False) -> dict:
+    """Which palette sources define each family and variant, cached with mtimes and sizes.
+
+    families maps a name to every source defining it; variants maps a name to
+    [source, family] per definition. The cached index is reused while
+    palette.toml and the palettes/ directory are unchanged (adding, removing or
+    atomically saving a fragment touches the directory); verify also checks
+    every source. Rebuilding (or rebuild=True) parses everything.
+    """
+    try:
+        index = json.loads(FRAGMENT_INDEX_FILE.read_text())
+    except (OSError, ValueError):
+        index = None
+    if (
+        not rebuild
+        and isinstance(index, dict)
+        and index.get("format") == FRAGMENT_INDEX_FORMAT
+        and index.get("palette") == _stat_stamp(PALETTE_FILE)
+        and index.get("directory") == _stat_stamp(PALETTES_DIR)
+        and (not verify or all(_stat_stamp(Path(path)) == stamp for path, stamp in index["sources"].items()))
+    ):
+        return index
+
+    index = {
+        "format": FRAGMENT_INDEX_FORMAT,
+        "palette": _stat_stamp(PALETTE_FILE),
+        "directory": _stat_stamp(PALETTES_DIR),
+        "sources": {},
+        "families": {},
+        "variants": {},
+    }
+    for path in palette_sources():
+        stamp = _stat_stamp(path)  # before parsing, so a concurrent edit shows up as stale
+        data = _load_source(path)
+        index["sources"][str(path)] = stamp
+        if path == PALETTE_FILE:
+            index["default_family"] = data.get("default_family")
+            index["default_variant"] = data.get("default_variant")
+        for name in data.get("families", {}):
+            index["families"].setdefault(name, []).append(str(path))
+        for name, payload in data.get("variants", {}).items():
+            family = payload.get("family") if isinstance(payload, dict) else None
+            index["variants"].setdefault(name, []).append([str(path), family])
+    write_cache_file(FRAGMENT_INDEX_FILE, json.dumps(index, indent=2, sort_keys=True).encode())
+    return index
+
+
+def family_names() -> list[str]:
+    return list(load_fragment_index(verify=True)["families"])
+
+
+class _StaleIndex(Exception):
+    """A source no longer defines what the fragment index says it does."""
+
+
+def load_family(name: str) -> dict:
+    """Palette limited to one family and its variants, parsing only the sources that define them.
+
+    Every source is stat'ed against load_fragment_index(), which only reparses
+    when something changed, so a variant added to or moved between fragments
+    is found. The loaded definitions get compile_palette()'s checks. The
+    result has load_palette()'s shape; default_variant may name a variant
+    outside it, so do not pass it to apply_host_override().
+    """
+    try:
+        return _family_from_index(name, load_fragment_index(verify=True))
+    except _StaleIndex:
+        # Edited within one mtime tick of indexing, or while we were parsing
+        pass
+    try:
+        return _family_from_index(name, load_fragment_index(rebuild=True))
+    except _StaleIndex as exc:
+        raise PaletteError(f"Palette sources changed while loading family {name}: {exc}") from exc
+
+
+def _family_from_index(name: str, index: dict) -> dict:
+    if name not in index["families"]:
+        raise PaletteError(f"Unknown family: {name}")
+
+    parsed = {}
+    labels = {"families": "Family", "variants": "Variant"}
+
+    def definition(kind: str, item: str, paths: list[str]):
+        """The payload every listed source gives item; they must agree, as in compile_palette()."""
+        payload = None
+        for path in paths:
+            if path not in parsed:
+                parsed[path] = _load_source(Path(path))
+                if path != str(PALETTE_FILE):
+                    validate_fragment(Path(path), parsed[path])
+            table = parsed[path].get(kind, {})
+            if item not in table:
+                raise _StaleIndex(f"{path} no longer defines {item}")
+            if payload is not None and table[item] != payload:
+                raise PaletteError(f"{labels[kind]} {item} redefined in {path}")
+            payload = table[item]
+        return payload
+
+    family = definition("families", name, index["families"][name])
+    validate_family(name, family)
+    variant_names = [
+        variant
+        for variant, definitions in index["variants"].items()
+        if any(owner == name for _, owner in definitions)
+    ]
+    # light/dark variants may belong to another family (e.g. shared light variants)
+    for key in ("light_variant", "dark_variant"):
+        if family.get(key) in index["variants"] and family[key] not in variant_names:
+            variant_names.append(family[key])
+    variants = {}
+    for variant in variant_names:
+        payload = definition("variants", variant, [path for path, _ in index["variants"][variant]])
+        validate_variant(variant, payload)
+        owner = payload.get("family")
+        if owner and owner not in index["families"]:
+            raise PaletteError(f"Variant {variant} references unknown family: {owner}")
+        variants[variant] = payload
+
+    root = parsed.get(str(PALETTE_FILE)) or _load_source(PALETTE_FILE)
+    default_variant = root.get("default_variant")
+    if default_variant and default_variant not in index["variants"]:
+        raise PaletteError(f"default_variant '{default_variant}' not found in variants.")
+    return {
+        "default_variant": default_variant,
+        "default_family": root.get("default_family"),
+        "variants": variants,
+        "families": {name: family},
+        "hosts": root.get("hosts", {}),
+    }
+
+
+def color_host() -> str:
+    """Host name used to select per-host palette overrides."""
+    return os.environ.get("COLOR_HOST") or socket.gethostname()
+
+
+def apply_host_override(palette: dict, host_name: str | None = None) -> dict:
+    """Override default variant based on host-specific settings (default: this host's)."""
     host_overrides = palette.get("hosts") or {}
-    host_name = os.environ.get("COLOR_HOST") or socket.gethostname()
+    host_name = host_name or color_host()
     override = host_overrides.get(host_name)
     if not override:
         return palette
@@ -237,7 +512,7 @@ def split_wallpaper_palette(palette: dict, family_name: str = WALLPAPER_FAMILY)
     return base, wallpaper
 
 
-def lua_wallpaper_merge_lines() -> list[str]:
+def lua_wallpaper_merge_lines(module_name: str = "palette_wallpaper.lua") -> list[str]:
     return [
         "local function merge_palette(target, extra)",
         "  if type(extra) ~= \"table\" then",
@@ -261,7 +536,7 @@ def lua_wallpaper_merge_lines() -> list[str]:
         "  if type(vim) ~= \"table\" or not vim.fn or not vim.fn.stdpath then",
         "    return",
         "  end",
-        "  local path = vim.fn.stdpath(\"config\") .. \"/lua/phajas/colors/palette_wallpaper.lua\"",
+        f"  local path = vim.fn.stdpath(\"config\") .. \"/lua/phajas/colors/{module_name}\"",
         "  local ok, extra = pcall(dofile, path)",
         "  if ok then",
         "    merge_palette(palette, extra)",
@@ -284,6 +559,182 @@ def write_if_changed(path: Path, content: str) -> bool:
     return True
 
 
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class BuildManifest:
+    """Record of the last build: input hashes, renderer version and output hashes.
+
+    Each output is stored with a key derived from exactly the data its renderer
+    consumes, plus the hash, size and mtime of what was written. A target whose
+    key is unchanged and whose file still has the recorded size and mtime is
+    skipped without rendering or reading it back. Targets additionally record
+    a key over the palette fields they declare (see RENDERERS), so a target
+    whose inputs are unchanged is not even visited.
+    """
+
+    def __init__(self, path: Path = BUILD_MANIFEST_FILE):
+        self.path = path
+        self.renderer = _sha256(Path(__file__).read_bytes())
+        self.inputs: dict = {}
+        self.outputs: dict = {}
+        self.targets: dict = {}
+        self.observed_inputs: dict | None = None
+        self.target: str | None = None
+        self._touched: dict = {}
+        self._built: dict = {}
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("renderer") != self.renderer:
+            return
+        self.inputs = data.get("inputs") or {}
+        self.outputs = data.get("outputs") or {}
+        self.targets = data.get("targets") or {}
+
+    @staticmethod
+    def input_hashes() -> dict:
+        hashes = {str(path): _sha256(path.read_bytes()) for path in palette_sources()}
+        hashes["host"] = color_host()
+        return hashes
+
+    @staticmethod
+    def key_for(inputs) -> str:
+        return _sha256(json.dumps(inputs, sort_keys=True).encode())
+
+    @staticmethod
+    def _stat_matches(path: Path, entry: dict) -> bool:
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        return stat.st_size == entry.get("size") and stat.st_mtime_ns == entry.get("mtime_ns")
+
+    def observe_inputs(self) -> None:
+        """Hash the palette sources before they are loaded; save() records these."""
+        self.observed_inputs = self.input_hashes()
+
+    def up_to_date(self) -> bool:
+        """True when observed inputs match the last build and every output is untouched."""
+        if not self.outputs or self.observed_inputs != self.inputs:
+            return False
+        return all(self._stat_matches(Path(path), entry) for path, entry in self.outputs.items())
+
+    def is_fresh(self, path: Path, key: str) -> bool:
+        entry = self.outputs.get(str(path))
+        if not entry or entry.get("key") != key or not self._stat_matches(path, entry):
+            return False
+        self._touched[str(path)] = entry
+        return True
+
+    def target_fresh(self, target: str, key: str) -> bool:
+        """True when target was last built from key and none of its outputs were touched since."""
+        if self.targets.get(target) != key:
+            return False
+        entries = {path: entry for path, entry in self.outputs.items() if entry.get("target") == target}
+        if not all(self._stat_matches(Path(path), entry) for path, entry in entries.items()):
+            return False
+        self._touched.update(entries)
+        return True
+
+    def built(self, target: str, key: str) -> None:
+        """Remember the input key target was just built from; save() records it."""
+        self._built[target] = key
+
+    def write(self, path: Path, key: str, content: str) -> bool:
+        encoded = content.encode()
+        digest = _sha256(encoded)
+        entry = self.outputs.get(str(path))
+        if entry and entry.get("hash") == digest and self._stat_matches(path, entry):
+            changed = False
+        else:
+            changed = write_if_changed(path, content)
+        stat = path.stat()
+        self._touched[str(path)] = {
+            "target": self.target,
+            "key": key,
+            "hash": digest,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+        return changed
+
+    def save(self, targets) -> None:
+        """Persist the manifest after building targets.
+
+        Outputs of the built targets that were not produced this time are
+        dropped. Input hashes are only recorded after a full build of observed
+        inputs, since the fast path in main() skips every target at once.
+        """
+        outputs = {path: entry for path, entry in self.outputs.items() if entry.get("target") not in targets}
+        outputs.update(self._touched)
+        target_keys = {target: key for target, key in self.targets.items() if target not in targets}
+        target_keys.update(self._built)
+        full_build = set(targets) >= set(BUILD_TARGETS)
+        inputs = self.observed_inputs if full_build and self.observed_inputs else {}
+        payload = {"renderer": self.renderer, "inputs": inputs, "outputs": outputs, "targets": target_keys}
+        write_cache_file(self.path, json.dumps(payload, indent=2, sort_keys=True).encode())
+        # Stay usable for the next build in the same process (build.py --watch)
+        self.inputs = inputs
+        self.outputs = outputs
+        self.targets = target_keys
+        self._touched = {}
+        self._built = {}
+
+
+def write_target(path: Path, inputs, render, manifest: BuildManifest | None = None) -> bool:
+    """Render and write path unless the manifest shows its inputs are unchanged."""
+    if manifest is None:
+        return write_if_changed(path, render())
+    key = manifest.key_for(inputs)
+    if manifest.is_fresh(path, key):
+        return False
+    return manifest.write(path, key, render())
+
+
+def _run_render_job(job):
+    render, args = job
+    return render(*args)
+
+
+def render_all(jobs: list, min_jobs: int = PARALLEL_RENDER_MIN_JOBS) -> list:
+    """Run (render, args) jobs and return their results in job order.
+
+    Large batches fan out over a process pool; render functions must be
+    module-level so they pickle. Since results keep job order and writing
+    stays in this process, output is identical to rendering serially.
+    """
+    workers = min(os.cpu_count() or 1, len(jobs))
+    if len(jobs) < min_jobs or workers < 2:
+        return [render(*args) for render, args in jobs]
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_run_render_job, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+    except (OSError, NotImplementedError, concurrent.futures.process.BrokenProcessPool):
+        # No usable multiprocessing here (e.g. a sandbox without semaphores)
+        return [render(*args) for render, args in jobs]
+
+
+def write_targets(jobs: list, manifest: BuildManifest | None = None) -> list[Path]:
+    """Write (path, inputs, render, args) jobs, rendering the stale ones via render_all."""
+    stale = []
+    for path, inputs, render, args in jobs:
+        key = manifest.key_for(inputs) if manifest else None
+        if manifest and manifest.is_fresh(path, key):
+            continue
+        stale.append((path, key, (render, args)))
+
+    written = []
+    contents = render_all([job for _, _, job in stale])
+    for (path, key, _), content in zip(stale, contents):
+        changed = manifest.write(path, key, content) if manifest else write_if_changed(path, content)
+        if changed:
+            written.append(path)
+    return written
+
+
 def get_license_header(variant_name: str, variant: dict, families: dict) -> str:
     """Generate appropriate license header based on variant family."""
     family_name = variant.get("family", "modus")
@@ -349,30 +800,90 @@ def ghostty_theme_name(variant_name: str, variant: dict, families: dict) -> str:
     return f"{family}_{variant_name}"
 
 
-def lua_serialize(data, indent: int = 0) -> str:
+def _lua_scalar(value) -> str:
+    if isinstance(value, str):
+        return f'"{value}"'
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _dump_lua_pretty(data, write, indent: int) -> None:
     pad = "  " * indent
     if isinstance(data, dict):
-        parts = ["{"] if indent == 0 else ["{"]  # explicit for readability
+        write("{")
         for key, value in data.items():
-            parts.append(f'{pad}  ["{key}"] = {lua_serialize(value, indent + 1)},')
-        parts.append(f"{pad}}}")
-        return "\n".join(parts)
-    if isinstance(data, list):
-        parts = ["{"] if indent == 0 else ["{"]
+            if isinstance(value, (dict, list)):
+                write(f'\n{pad}  ["{key}"] = ')
+                _dump_lua_pretty(value, write, indent + 1)
+                write(",")
+            else:
+                write(f'\n{pad}  ["{key}"] = {_lua_scalar(value)},')
+        write(f"\n{pad}}}")
+    elif isinstance(data, list):
+        write("{")
         for value in data:
-            parts.append(f"{pad}  {lua_serialize(value, indent + 1)},")
-        parts.append(f"{pad}}}")
-        return "\n".join(parts)
-    if isinstance(data, str):
-        return f'"{data}"'
-    if isinstance(data, bool):
-        return "true" if data else "false"
-    return str(data)
-
-
-def write_nvim_palette(data: dict) -> bool:
-    lua_table = lua_serialize(data)
-    content = "\n".join(
+            if isinstance(value, (dict, list)):
+                write(f"\n{pad}  ")
+                _dump_lua_pretty(value, write, indent + 1)
+                write(",")
+            else:
+                write(f"\n{pad}  {_lua_scalar(value)},")
+        write(f"\n{pad}}}")
+    else:
+        write(_lua_scalar(data))
+
+
+def _dump_lua_compact(data, write) -> None:
+    if isinstance(data, dict):
+        write("{")
+        for key, value in data.items():
+            write(f'["{key}"]=')
+            _dump_lua_compact(value, write)
+            write(",")
+        write("}")
+    elif isinstance(data, list):
+        write("{")
+        for value in data:
+            _dump_lua_compact(value, write)
+            write(",")
+        write("}")
+    else:
+        write(_lua_scalar(data))
+
+
+def dump_lua(data, out, indent: int = 0, compact: bool = False) -> None:
+    """Stream data as a Lua table expression into the text stream out.
+
+    Nothing is built up per nesting level; tokens go straight to out (a
+    StringIO or a buffered file). Keys are written in insertion order, which
+    follows the palette sources, so output is stable between builds. The
+    pretty form puts one entry per line for readable diffs; compact drops the
+    whitespace for modules only machines read.
+    """
+    if compact:
+        _dump_lua_compact(data, out.write)
+    else:
+        _dump_lua_pretty(data, out.write, indent)
+
+
+def lua_serialize(data, indent: int = 0, compact: bool = False) -> str:
+    out = io.StringIO()
+    dump_lua(data, out, indent, compact)
+    return out.getvalue()
+
+
+def render_lua_module(header: list[str], prefix: str, data, footer: list[str] = (), compact: bool = False) -> str:
+    """header lines, then prefix and data as a Lua table, then footer lines, in one buffer."""
+    out = io.StringIO()
+    out.write("\n".join([*header, prefix]))
+    dump_lua(data, out, compact=compact)
+    out.write("\n".join(["", *footer, ""]))
+    return out.getvalue()
+
+
+def render_nvim_palette(data: dict) -> str:
+    return render_lua_module(
         [
             "-- Generated by colors/build.py from colors/palette.toml",
             "-- This file contains color palettes from multiple sources:",
@@ -380,32 +891,695 @@ def write_nvim_palette(data: dict) -> bool:
             "--   Ef themes: GPL v3 (see colors/LICENSE)",
             "--   Catppuccin themes: MIT (see https://github.com/catppuccin/catppuccin/blob/main/LICENSE)",
             "-- Palette data for Lua consumers (generated)",
-            "local palette = " + lua_table,
-            "",
-            *lua_wallpaper_merge_lines(),
-            "return palette",
-            "",
-        ]
+        ],
+        "local palette = ",
+        data,
+        ["", *lua_wallpaper_merge_lines(), "return palette"],
     )
-    return write_if_changed(NVIM_PALETTE_MODULE, content)
 
 
-def write_nvim_wallpaper_palette(data: dict) -> bool:
-    lua_table = lua_serialize(data)
-    content = "\n".join(
+def write_nvim_palette(data: dict, manifest: BuildManifest | None = None) -> list[Path]:
+    written = write_target(NVIM_PALETTE_MODULE, data, lambda: render_nvim_palette(data), manifest)
+    return [NVIM_PALETTE_MODULE] if written else []
+
+
+def render_nvim_wallpaper_palette(data: dict) -> str:
+    # Regenerated on every wallpaper switch and never committed, so nobody diffs it
+    return render_lua_module(
         [
             "-- Generated by colors/build.py from colors/palette.toml",
             "-- Wallpaper palette data for Lua consumers (generated)",
-            "return " + lua_table,
-            "",
+        ],
+        "return ",
+        data,
+        compact=True,
+    )
+
+
+def write_nvim_wallpaper_palette(data: dict, manifest: BuildManifest | None = None) -> list[Path]:
+    written = write_target(NVIM_WALLPAPER_MODULE, data, lambda: render_nvim_wallpaper_palette(data), manifest)
+    return [NVIM_WALLPAPER_MODULE] if written else []
+
+
+def palette_index(data: dict) -> dict:
+    """Families plus each variant's family and flavor: enough to pick a variant."""
+    index = {}
+    for key in ("default_variant", "default_family"):
+        if data.get(key):
+            index[key] = data[key]
+    index["families"] = data.get("families") or {}
+    index["variants"] = {
+        name: {key: variant[key] for key in ("family", "flavor") if key in variant}
+        for name, variant in (data.get("variants") or {}).items()
+    }
+    return index
+
+
+def render_nvim_index(index: dict) -> str:
+    return render_lua_module(
+        [
+            "-- Generated by colors/build.py from colors/palette.toml",
+            "-- Palette index for Lua consumers (generated); variant data lives in variants/<name>.lua",
+        ],
+        "local palette = ",
+        index,
+        ["", *lua_wallpaper_merge_lines("index_wallpaper.lua"), "return palette"],
+    )
+
+
+def render_nvim_wallpaper_index(index: dict) -> str:
+    return render_lua_module(
+        [
+            "-- Generated by colors/build.py from colors/palette.toml",
+            "-- Wallpaper palette index for Lua consumers (generated)",
+        ],
+        "return ",
+        index,
+        compact=True,
+    )
+
+
+def write_nvim_index(data: dict, manifest: BuildManifest | None = None) -> list[Path]:
+    index = palette_index(data)
+    written = write_target(NVIM_INDEX_MODULE, index, lambda: render_nvim_index(index), manifest)
+    return [NVIM_INDEX_MODULE] if written else []
+
+
+def write_nvim_wallpaper_index(data: dict, manifest: BuildManifest | None = None) -> list[Path]:
+    index = palette_index(data)
+    written = write_target(NVIM_WALLPAPER_INDEX_MODULE, index, lambda: render_nvim_wallpaper_index(index), manifest)
+    return [NVIM_WALLPAPER_INDEX_MODULE] if written else []
+
+
+def render_nvim_variant(variant_name: str, variant: dict, families: dict) -> str:
+    header = get_license_header(variant_name, variant, families)
+    return render_lua_module(
+        [*("--" + line[1:] for line in header.split("\n")), "-- Palette variant module for Lua consumers (generated)"],
+        "return ",
+        variant,
+    )
+
+
+def write_nvim_variants(variants: dict, families: dict, manifest: BuildManifest | None = None) -> list[Path]:
+    jobs = []
+    for name, variant in variants.items():
+        inputs = [name, variant, families.get(variant.get("family", "modus"))]
+        jobs.append((NVIM_VARIANT_DIR / f"{name}.lua", inputs, render_nvim_variant, (name, variant, families)))
+
+    written = write_targets(jobs, manifest)
+    written.extend(prune_stale_modules(NVIM_VARIANT_DIR, {path.name for path, *_ in jobs}))
+    return written
+
+
+def prune_stale_modules(directory: Path, expected: set) -> list[Path]:
+    """Drop modules for variants that no longer exist (e.g. a removed wallpaper palette)."""
+    removed = []
+    if directory.exists():
+        for stale in sorted(directory.glob("*.lua")):
+            if stale.name not in expected:
+                stale.unlink()
+                removed.append(stale)
+    return removed
+
+
+class _LuaTable(dict):
+    """Dict read with Lua semantics: missing keys and attributes are None."""
+
+    def __missing__(self, key):
+        return None
+
+    __getattr__ = dict.get
+
+
+DIAGNOSTIC_SOURCES = (
+    ("error", ("red_intense", "error", "red")),
+    ("warn", ("yellow_intense", "warning", "yellow")),
+    ("info", ("blue_intense", "info", "blue")),
+    ("hint", ("cyan_intense", "hint", "cyan")),
+    ("ok", ("green_intense", "ok", "green")),
+)
+# (key prefix, color blended toward, alpha) for each diagnostic color
+DIAGNOSTIC_BLENDS = (
+    ("", "fg_main", 0.7),
+    ("bg_", "bg_main", 0.28),
+    ("line_", "bg_main", 0.14),
+)
+
+
+def _hex_to_rgb(value) -> tuple[int, int, int] | None:
+    if not isinstance(value, str):
+        return None
+    value = value.replace("#", "")
+    if len(value) != 6:
+        return None
+    try:
+        return int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16)
+    except ValueError:
+        return None
+
+
+def blend_colors(requests: list[tuple]) -> list:
+    """Blend (fg, bg, alpha) requests in one batch, vectorized when numpy is available.
+
+    Matches the rounding of the Lua blend() this replaces; requests whose colors
+    are not #rrggbb fall back to fg or bg.
+    """
+    results = [None] * len(requests)
+    rows, fgs, bgs, alphas = [], [], [], []
+    for row, (fg, bg, alpha) in enumerate(requests):
+        fg_rgb, bg_rgb = _hex_to_rgb(fg), _hex_to_rgb(bg)
+        if fg_rgb is None or bg_rgb is None:
+            results[row] = fg or bg
+            continue
+        rows.append(row)
+        fgs.append(fg_rgb)
+        bgs.append(bg_rgb)
+        alphas.append(alpha)
+    if not rows:
+        return results
+
+    if numpy is not None:
+        alpha = numpy.array(alphas, dtype=float)[:, None]
+        fg_arr = numpy.array(fgs, dtype=float)
+        bg_arr = numpy.array(bgs, dtype=float)
+        mixed = numpy.floor((alpha * fg_arr) + ((1 - alpha) * bg_arr) + 0.5).astype(int).tolist()
+    else:
+        mixed = [
+            [math.floor((alpha * f) + ((1 - alpha) * b) + 0.5) for f, b in zip(fg_rgb, bg_rgb)]
+            for fg_rgb, bg_rgb, alpha in zip(fgs, bgs, alphas)
         ]
+    for row, (r, g, b) in zip(rows, mixed):
+        results[row] = f"#{r:02x}{g:02x}{b:02x}"
+    return results
+
+
+def _relative_luminance(rgb) -> float:
+    linear = [c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4 for c in (v / 255 for v in rgb)]
+    return 0.2126 * linear[0] + 0.7152 * linear[1] + 0.0722 * linear[2]
+
+
+def audit_contrast(variants: dict, thresholds: dict = AUDIT_THRESHOLDS) -> tuple[int, list[tuple]]:
+    """Check AUDIT_PAIRS in every variant against the WCAG contrast thresholds.
+
+    With numpy (declared in pyproject.toml, so present under uv run), every
+    variant's AUDIT_COLORS go into one array and the full contrast matrix is
+    computed in a single pass. Without it, the per-pair loop below is the
+    supported path and reports the same failures. Returns the number of pairs
+    checked and (variant, text, background, ratio, minimum) for each failure;
+    colors that are not #rrggbb are skipped.
+    """
+    names = list(variants)
+    pairs = [(kind, text, bg) for kind, text, bg in AUDIT_PAIRS if kind in thresholds]
+    column = {color: index for index, color in enumerate(AUDIT_COLORS)}
+
+    def color_of(variant: dict, color: str):
+        if color.startswith("ansi_"):
+            ansi = variant.get("ansi") or []
+            slot = int(color[5:])
+            return _hex_to_rgb(ansi[slot] if slot < len(ansi) else None)
+        return _hex_to_rgb(variant.get(color))
+
+    rgb = [[color_of(variants[name], color) for color in AUDIT_COLORS] for name in names]
+    failures = []
+    checked = 0
+    if numpy is not None and names:
+        arr = numpy.array([[c if c else (numpy.nan,) * 3 for c in row] for row in rgb], dtype=float) / 255
+        linear = numpy.where(arr <= 0.04045, arr / 12.92, ((arr + 0.055) / 1.055) ** 2.4)
+        luma = linear @ numpy.array([0.2126, 0.7152, 0.0722])  # (variants, colors)
+        hi = numpy.maximum(luma[:, :, None], luma[:, None, :])
+        lo = numpy.minimum(luma[:, :, None], luma[:, None, :])
+        ratios = (hi + 0.05) / (lo + 0.05)  # (variants, colors, colors)
+        for kind, text, bg in pairs:
+            pair = ratios[:, column[text], column[bg]]
+            checked += int(numpy.count_nonzero(~numpy.isnan(pair)))
+            for row in numpy.nonzero(pair < thresholds[kind])[0]:
+                failures.append((names[row], text, bg, float(pair[row]), thresholds[kind]))
+    else:
+        for name, row in zip(names, rgb):
+            for kind, text, bg in pairs:
+                a, b = row[column[text]], row[column[bg]]
+                if a is None or b is None:
+                    continue
+                checked += 1
+                la, lb = _relative_luminance(a), _relative_luminance(b)
+                ratio = (max(la, lb) + 0.05) / (min(la, lb) + 0.05)
+                if ratio < thresholds[kind]:
+                    failures.append((name, text, bg, ratio, thresholds[kind]))
+    order = {name: index for index, name in enumerate(names)}
+    failures.sort(key=lambda failure: order[failure[0]])
+    return checked, failures
+
+
+def nvim_semantic_colors(variant: dict) -> _LuaTable:
+    """Semantic editor colors for a variant: its extended table, completed from ANSI slots."""
+    a = _LuaTable(enumerate(variant.get("ansi") or [], start=1))  # 1-based, as in Lua
+    fg = variant.get("foreground")
+    bg = variant.get("background")
+    base = {
+        "bg_main": bg,
+        "fg_main": fg,
+        "fg_dim": a[9] or a[8],
+        "fg_alt": a[5] or fg,
+        "border": a[8],
+        "border_highlight": a[9] or a[8],
+        "red": a[2], "green": a[3], "yellow": a[4], "blue": a[5], "magenta": a[6], "cyan": a[7],
+        "bg_dim": a[8],
+        "bg_alt": bg,
+        "bg_hl_line": a[8],
+        "bg_paren_match": a[12] or a[5],
+        "fg_inactive": a[9] or a[8],
+        "fg_active": a[15] or a[7],
+        "bg_active": a[8],
+        "bg_inactive": a[8],
+        "fg_tab_other": a[9] or a[8],
+        "bg_tab_other": a[8],
+        "fg_status_line_active": a[15] or a[7],
+        "bg_status_line_active": a[1] or bg,
+        "fg_status_line_inactive": a[9] or a[8],
+        "bg_status_line_inactive": a[1] or bg,
+        "visual": variant.get("selection_background"),
+        "fg_added": a[3], "fg_changed": a[4], "fg_removed": a[2],
+        "bg_added": bg, "bg_changed": bg, "bg_removed": bg,
+        "fg_added_intense": a[11] or a[3],
+        "fg_changed_intense": a[12] or a[4],
+        "fg_removed_intense": a[10] or a[2],
+        "bg_added_refine": bg,
+        "bg_changed_refine": bg,
+        "bg_removed_refine": bg,
+        "bg_completion": a[13] or a[5],
+        "error": a[10] or a[2],
+        "warning": a[12] or a[4],
+        "info": a[13] or a[5],
+        "hint": a[15] or a[7],
+        "ok": a[11] or a[3],
+    }
+    c = _LuaTable(variant.get("extended") or {})
+    for key, value in base.items():
+        if c[key] is None:
+            c[key] = value
+    c["blue"] = c.blue or base["blue"]
+    c["magenta"] = c.magenta or base["magenta"]
+    c["red"] = c.red or base["red"]
+    c["yellow"] = c.yellow or base["yellow"]
+    c["green"] = c.green or base["green"]
+    c["cyan"] = c.cyan or base["cyan"]
+    c["red_intense"] = c.red_intense or a[10] or c.red
+    c["green_intense"] = c.green_intense or a[11] or c.green
+    c["yellow_intense"] = c.yellow_intense or a[12] or c.yellow
+    c["blue_intense"] = c.blue_intense or a[13] or c.blue
+    c["magenta_intense"] = c.magenta_intense or a[14] or c.magenta
+    c["cyan_intense"] = c.cyan_intense or a[15] or c.cyan
+    c["blue_warmer"] = c.blue_warmer or c.blue
+    c["blue_cooler"] = c.blue_cooler or c.blue
+    c["blue_faint"] = c.blue_faint or c.blue
+    c["magenta_cooler"] = c.magenta_cooler or c.magenta
+    c["red_cooler"] = c.red_cooler or c.red
+    c["yellow_cooler"] = c.yellow_cooler or c.yellow
+    c["cyan_cooler"] = c.cyan_cooler or c.cyan
+    c["cyan_warmer"] = c.cyan_warmer or c.cyan
+    c["cyan_faint"] = c.cyan_faint or c.cyan
+    c["green_cooler"] = c.green_cooler or c.green
+    c["green_faint"] = c.green_faint or c.green
+    c["bg_magenta_intense"] = c.bg_magenta_intense or c.magenta
+    c["bg_green_intense"] = c.bg_green_intense or c.green
+    c["bg_yellow_intense"] = c.bg_yellow_intense or c.yellow
+    c["bg_red_intense"] = c.bg_red_intense or c.red
+    # Derived fields to complete the extended palette
+    c["bg_sidebar"] = c.bg_sidebar or c.bg_dim
+    c["fg_sidebar"] = c.fg_sidebar or c.fg_main
+    c["cursor"] = c.cursor or c.fg_main
+    c["comment"] = c.comment or c.fg_dim
+    c["error"] = c.error or c.red_cooler or c.red or base["error"]
+    c["warning"] = c.warning or c.yellow_cooler or c.yellow or base["warning"]
+    c["info"] = c.info or c.blue_cooler or c.blue or base["info"]
+    c["hint"] = c.hint or c.cyan_faint or c.cyan or base["hint"]
+    c["ok"] = c.ok or c.green_cooler or c.green or base["ok"]
+    c["success"] = c.success or c.fg_added
+    c["visual"] = c.visual or c.bg_magenta_intense or c.magenta
+    c["accent_light"] = c.accent_light or c.blue_faint or c.blue
+    c["accent"] = c.accent or c.blue_warmer or c.blue
+    c["accent_darker"] = c.accent_darker or c.blue or c.accent
+    c["accent_dark"] = c.accent_dark or c.blue_intense or c.blue
+    # Default (non-tinted/non-accessibility variants) only for now
+    return c
+
+
+def nvim_highlight_groups(c: _LuaTable, diag: dict) -> dict:
+    return {
+        # UI
+        "Normal": {"fg": c.fg_main, "bg": c.bg_main},
+        "NormalFloat": {"fg": c.fg_active or c.fg_main, "bg": c.bg_active or c.bg_main},
+        "FloatBorder": {"fg": c.border_highlight or c.border, "bg": c.bg_main},
+        "FloatTitle": {"fg": c.border_highlight or c.border, "bg": c.bg_main},
+        "Folded": {"fg": c.green_faint or c.green or c.fg_dim, "bg": c.bg_dim or c.bg_main},
+        "LineNr": {"fg": c.fg_main, "bg": c.bg_dim or c.bg_main},
+        "LineNrAbove": {"fg": c.fg_dim, "bg": c.bg_dim or c.bg_main},
+        "LineNrBelow": {"fg": c.fg_dim, "bg": c.bg_dim or c.bg_main},
+        "CursorLineNr": {"fg": c.fg_active or c.fg_main, "bg": c.bg_active or c.bg_dim, "bold": True},
+        "SignColumn": {"fg": c.fg_dim, "bg": c.bg_dim or c.bg_main},
+        "CursorLine": {"bg": c.bg_hl_line or c.bg_dim},
+        "CursorColumn": {"bg": c.bg_hl_line or c.bg_dim},
+        "NonText": {"fg": c.fg_dim},
+        "ColorColumn": {"bg": c.bg_dim or c.bg_main},
+        "FoldColumn": {"fg": c.fg_inactive or c.fg_dim, "bg": c.bg_inactive or c.bg_dim or c.bg_main},
+        "Search": {"fg": c.fg_main, "bg": c.bg_green_intense or c.bg_completion or c.green},
+        "IncSearch": {"fg": c.fg_main, "bg": c.bg_yellow_intense or c.yellow},
+        "CurSearch": {"link": "IncSearch"},
+        "Substitute": {"fg": c.fg_main, "bg": c.bg_red_intense or c.red},
+        "QuickFixLine": {"fg": c.fg_main, "bg": c.visual or c.bg_hl_line},
+        "Pmenu": {"fg": c.fg_active or c.fg_main, "bg": c.bg_active or c.bg_main},
+        "PmenuSel": {"fg": c.bg_active or c.bg_main, "bg": c.fg_active or c.fg_main},
+        "PmenuSbar": {"fg": c.fg_active or c.fg_main, "bg": c.bg_dim or c.bg_main},
+        "PmenuThumb": {"fg": c.bg_main, "bg": c.cursor or c.fg_main},
+        "Directory": {"fg": c.blue},
+        "Title": {"fg": c.fg_alt or c.blue, "bold": True},
+        "Visual": {"fg": c.fg_main, "bg": c.visual or c.bg_hl_line},
+        "VisualNOS": {"link": "Visual"},
+        "WildMenu": {"fg": c.fg_main, "bg": c.visual or c.bg_hl_line},
+        "Whitespace": {"fg": c.fg_dim},
+        "StatusLine": {"fg": c.fg_status_line_active or c.fg_main, "bg": c.bg_status_line_active or c.bg_main},
+        "StatusLineNC": {"fg": c.fg_status_line_inactive or c.fg_dim, "bg": c.bg_status_line_inactive or c.bg_main},
+        "TabLine": {"fg": c.fg_tab_other or c.fg_dim, "bg": c.bg_tab_other or c.bg_dim},
+        "TabLineSel": {"fg": c.fg_main, "bg": c.bg_tab_current or c.bg_main, "bold": True},
+        "TabLineFill": {"fg": c.fg_dim, "bg": c.bg_tab_bar or c.bg_dim},
+        "WinBar": {"link": "TabLineSel"},
+        "WinBarNC": {"link": "TabLine"},
+        "EndOfBuffer": {"fg": c.fg_inactive or c.fg_dim},
+        "MatchParen": {"fg": c.fg_main, "bg": c.bg_paren_match or c.bg_completion},
+        "ModeMsg": {"fg": c.fg_dim, "bold": True},
+        "MsgArea": {"fg": c.fg_main},
+        "MoreMsg": {"fg": c.blue},
+        "VertSplit": {"fg": c.border},
+        "WinSeparator": {"fg": c.border, "bold": True},
+        "DiffAdd": {"fg": c.fg_added, "bg": c.bg_added},
+        "DiffDelete": {"fg": c.fg_removed, "bg": c.bg_removed},
+        "DiffChange": {"fg": c.fg_changed, "bg": c.bg_changed},
+        "DiffText": {"fg": c.fg_changed, "bg": c.bg_changed},
+        "SpecialKey": {"fg": c.fg_dim},
+        "SpellBad": {"sp": c.error, "undercurl": True},
+        "SpellCap": {"sp": c.warning, "undercurl": True},
+        "SpellLocal": {"sp": c.info, "undercurl": True},
+        "SpellRare": {"sp": c.hint, "undercurl": True},
+        "WarningMsg": {"fg": c.warning},
+        "Question": {"fg": c.blue},
+
+        # Syntax
+        "Comment": {"fg": c.comment or c.fg_dim, "italic": True},
+        "String": {"fg": c.blue_warmer or c.green},
+        "Character": {"fg": c.blue_warmer or c.green},
+        "Boolean": {"fg": c.blue or c.magenta, "bold": True},
+        "Statement": {"fg": c.magenta_cooler or c.magenta},
+        "Conditional": {"fg": c.magenta_cooler or c.magenta},
+        "Repeat": {"fg": c.magenta_cooler or c.magenta},
+        "Label": {"fg": c.cyan},
+        "Keyword": {"fg": c.magenta_cooler or c.magenta},
+        "Exception": {"fg": c.magenta_cooler or c.magenta},
+        "StorageClass": {"fg": c.magenta_cooler or c.magenta},
+        "Structure": {"fg": c.magenta_cooler or c.magenta},
+        "Constant": {"fg": c.fg_main},
+        "Function": {"fg": c.magenta},
+        "Identifier": {"fg": c.cyan},
+        "PreProc": {"fg": c.red_cooler or c.red},
+        "Include": {"fg": c.red_cooler or c.red},
+        "Define": {"fg": c.red_cooler or c.red},
+        "Macro": {"fg": c.red_cooler or c.red},
+        "PreCondit": {"fg": c.red_cooler or c.red},
+        "Todo": {"fg": c.magenta, "bold": True},
+        "Type": {"fg": c.cyan_cooler or c.cyan},
+        "TypeDef": {"fg": c.cyan_warmer or c.cyan},
+        "Number": {"fg": c.blue_faint or c.magenta},
+        "Float": {"link": "Number"},
+        "Operator": {"fg": c.fg_main},
+        "Tag": {"fg": c.magenta},
+        "Delimiter": {"fg": c.fg_main},
+        "Special": {"link": "Type"},
+        "SpecialChar": {"fg": c.cyan_faint or c.cyan},
+        "Underlined": {"fg": c.fg_alt or c.blue, "underline": True},
+        "Error": {"fg": c.fg_main, "bg": c.bg_red_intense or c.red},
+
+        # Diagnostics
+        "DiagnosticError": {"fg": diag["error"], "bold": True},
+        "DiagnosticWarn": {"fg": diag["warn"], "bold": True},
+        "DiagnosticInfo": {"fg": diag["info"], "bold": True},
+        "DiagnosticHint": {"fg": diag["hint"], "bold": True},
+        "DiagnosticOk": {"fg": diag["ok"], "bold": True},
+        "DiagnosticUnnecessary": {"fg": c.fg_dim},
+        "DiagnosticVirtualTextError": {"fg": diag["error"], "bg": diag["bg_error"], "bold": True},
+        "DiagnosticVirtualTextWarn": {"fg": diag["warn"], "bg": diag["bg_warn"], "bold": True},
+        "DiagnosticVirtualTextInfo": {"fg": diag["info"], "bg": diag["bg_info"], "bold": True},
+        "DiagnosticVirtualTextHint": {"fg": diag["hint"], "bg": diag["bg_hint"], "bold": True},
+        "DiagnosticVirtualTextOk": {"fg": diag["ok"], "bg": diag["bg_ok"], "bold": True},
+        "DiagnosticUnderlineError": {"undercurl": True, "sp": diag["error"]},
+        "DiagnosticUnderlineWarn": {"undercurl": True, "sp": diag["warn"]},
+        "DiagnosticUnderlineInfo": {"undercurl": True, "sp": diag["info"]},
+        "DiagnosticUnderlineHint": {"undercurl": True, "sp": diag["hint"]},
+        "DiagnosticUnderlineOk": {"undercurl": True, "sp": diag["ok"]},
+        "DiagnosticSignError": {"fg": diag["error"], "bg": c.bg_dim or c.bg_main},
+        "DiagnosticSignWarn": {"fg": diag["warn"], "bg": c.bg_dim or c.bg_main},
+        "DiagnosticSignInfo": {"fg": diag["info"], "bg": c.bg_dim or c.bg_main},
+        "DiagnosticSignHint": {"fg": diag["hint"], "bg": c.bg_dim or c.bg_main},
+        "DiagnosticSignOk": {"fg": diag["ok"], "bg": c.bg_dim or c.bg_main},
+        "DiagnosticFloatingError": {"fg": diag["error"], "bg": diag["bg_error"]},
+        "DiagnosticFloatingWarn": {"fg": diag["warn"], "bg": diag["bg_warn"]},
+        "DiagnosticFloatingInfo": {"fg": diag["info"], "bg": diag["bg_info"]},
+        "DiagnosticFloatingHint": {"fg": diag["hint"], "bg": diag["bg_hint"]},
+        "DiagnosticFloatingOk": {"fg": diag["ok"], "bg": diag["bg_ok"]},
+        "DiagnosticLineError": {"bg": diag["line_error"]},
+        "DiagnosticLineWarn": {"bg": diag["line_warn"]},
+        "DiagnosticLineInfo": {"bg": diag["line_info"]},
+        "DiagnosticLineHint": {"bg": diag["line_hint"]},
+        "DiagnosticLineOk": {"bg": diag["line_ok"]},
+
+        # Diff/Git
+        "GitSignsAdd": {"fg": c.fg_added_intense or c.fg_added, "bg": c.bg_added or c.bg_main},
+        "GitSignsChange": {"fg": c.fg_changed_intense or c.fg_changed, "bg": c.bg_changed or c.bg_main},
+        "GitSignsDelete": {"fg": c.fg_removed_intense or c.fg_removed, "bg": c.bg_removed or c.bg_main},
+
+        # LSP
+        "LspReferenceText": {"bg": c.bg_blue_intense or c.bg_hl_line, "fg": c.fg_main},
+        "LspReferenceRead": {"bg": c.bg_blue_intense or c.bg_hl_line, "fg": c.fg_main},
+        "LspReferenceWrite": {"bg": c.bg_blue_intense or c.bg_hl_line, "fg": c.fg_main},
+
+        # Telescope (basic alignment with palette intent)
+        "TelescopeNormal": {"link": "Normal"},
+        "TelescopeBorder": {"fg": c.border or c.fg_dim, "bg": c.bg_main},
+        "TelescopeTitle": {"fg": c.fg_dim, "bg": c.bg_main},
+        "TelescopeSelection": {"fg": c.selection_foreground or c.fg_main, "bg": c.selection_background or c.visual or c.bg_hl_line, "bold": True},
+        "TelescopeSelectionCaret": {"fg": c.selection_foreground or c.fg_main, "bg": c.selection_background or c.visual or c.bg_hl_line, "bold": True},
+        "TelescopeMultiSelection": {"fg": c.accent or c.blue, "bg": c.bg_dim or c.bg_main},
+        "TelescopeMultiIcon": {"fg": c.accent or c.blue, "bg": c.bg_dim or c.bg_main},
+        "TelescopePromptBorder": {"fg": c.border_highlight or c.border, "bg": c.bg_main},
+        "TelescopePromptTitle": {"fg": c.border_highlight or c.border, "bg": c.bg_main},
+        "TelescopeResultsComment": {"fg": c.fg_dim},
+        "TelescopePromptNormal": {"link": "Normal"},
+        "TelescopePromptPrefix": {"fg": c.accent_darker or c.blue, "bg": c.bg_main},
+        "TelescopeMatching": {"fg": c.accent_dark or c.blue_intense, "bold": True},
+
+        # Treesitter (core captures)
+        "@comment": {"link": "Comment"},
+        "@error": {"link": "Error"},
+        "@punctuation": {"fg": c.fg_dim},
+        "@punctuation.delimiter": {"link": "Delimiter"},
+        "@punctuation.bracket": {"fg": c.fg_main},
+        "@punctuation.special": {"fg": c.fg_main},
+        "@string": {"link": "String"},
+        "@character": {"link": "Character"},
+        "@number": {"link": "Number"},
+        "@boolean": {"link": "Boolean"},
+        "@float": {"link": "Float"},
+        "@constant": {"link": "Constant"},
+        "@constant.builtin": {"fg": c.magenta},
+        "@constant.macro": {"fg": c.red_cooler or c.red},
+        "@namespace": {"fg": c.fg_alt or c.blue},
+        "@symbol": {"fg": c.magenta},
+        "@variable": {"fg": c.fg_main},
+        "@variable.builtin": {"fg": c.magenta_cooler or c.magenta},
+        "@variable.parameter": {"fg": c.fg_main},
+        "@variable.member": {"fg": c.cyan},
+        "@property": {"link": "@field"},
+        "@field": {"fg": c.fg_main},
+        "@function": {"link": "Function"},
+        "@function.builtin": {"fg": c.blue_warmer or c.blue},
+        "@function.macro": {"fg": c.red_cooler or c.red},
+        "@method": {"link": "Function"},
+        "@constructor": {"fg": c.blue},
+        "@parameter": {"fg": c.fg_main},
+        "@keyword": {"link": "Keyword"},
+        "@keyword.function": {"link": "Keyword"},
+        "@keyword.operator": {"link": "Operator"},
+        "@keyword.return": {"link": "Keyword"},
+        "@conditional": {"link": "Conditional"},
+        "@repeat": {"link": "Repeat"},
+        "@debug": {"fg": c.red_cooler or c.red},
+        "@label": {"link": "Label"},
+        "@include": {"link": "Include"},
+        "@exception": {"link": "Exception"},
+        "@type": {"link": "Type"},
+        "@type.builtin": {"fg": c.cyan_cooler or c.cyan},
+        "@type.definition": {"link": "Typedef"},
+        "@storageclass": {"link": "StorageClass"},
+        "@attribute": {"fg": c.blue_warmer or c.blue},
+        "@field.yaml": {"fg": c.cyan},
+        "@string.regex": {"fg": c.blue_warmer or c.blue},
+        "@string.escape": {"fg": c.magenta},
+        "@string.special": {"fg": c.blue},
+        "@text.title": {"fg": c.blue, "bold": True},
+        "@text.emphasis": {"italic": True},
+        "@text.strong": {"bold": True},
+        "@text.uri": {"fg": c.blue, "underline": True},
+        "@text.reference": {"fg": c.magenta},
+        "@text.literal": {"fg": c.green},
+        "@text.note": {"fg": c.blue, "bold": True},
+        "@text.warning": {"fg": c.warning or c.yellow},
+        "@text.danger": {"fg": c.error or c.red},
+
+        # Treesitter context
+        "TreesitterContext": {"bg": c.bg_dim or c.bg_main},
+        "TreesitterContextLineNumber": {"fg": c.fg_dim, "bg": c.bg_dim or c.bg_main},
+
+        # NvimTree
+        "NvimTreeNormal": {"fg": c.fg_main, "bg": c.bg_alt or c.bg_main},
+        "NvimTreeNormalNC": {"fg": c.fg_main, "bg": c.bg_alt or c.bg_main},
+        "NvimTreeFolderName": {"fg": c.blue},
+        "NvimTreeFolderIcon": {"fg": c.blue},
+        "NvimTreeRootFolder": {"fg": c.magenta, "bold": True},
+        "NvimTreeSymlink": {"fg": c.cyan},
+        "NvimTreeExecFile": {"fg": c.green},
+        "NvimTreeSpecialFile": {"fg": c.magenta_warmer or c.magenta, "bold": True},
+        "NvimTreeIndentMarker": {"fg": c.fg_dim},
+        "NvimTreeGitNew": {"fg": c.fg_added_intense or c.fg_added},
+        "NvimTreeGitDirty": {"fg": c.fg_changed_intense or c.fg_changed},
+        "NvimTreeGitDeleted": {"fg": c.fg_removed_intense or c.fg_removed},
+        "NvimTreeWinSeparator": {"fg": c.border, "bg": c.bg_alt or c.bg_main},
+
+        # DAP / DAP UI
+        "DapBreakpoint": {"fg": c.red},
+        "DapBreakpointCondition": {"fg": c.yellow},
+        "DapBreakpointRejected": {"fg": c.red_intense or c.red},
+        "DapStopped": {"fg": c.green},
+        "DapLogPoint": {"fg": c.cyan},
+        "DapUIScope": {"fg": c.cyan},
+        "DapUIType": {"fg": c.magenta},
+        "DapUIValue": {"fg": c.fg_main},
+        "DapUIThread": {"fg": c.green},
+        "DapUIStoppedThread": {"fg": c.red},
+        "DapUISource": {"fg": c.blue},
+        "DapUILineNumber": {"fg": c.accent or c.blue},
+        "DapUIFloatBorder": {"fg": c.border_highlight or c.border, "bg": c.bg_main},
+        "DapUIWatchesValue": {"fg": c.green},
+        "DapUIWatchesError": {"fg": c.red},
+        "NvimDapVirtualText": {"fg": c.fg_dim, "italic": True},
+
+        # Completion (cmp-style groups used by blink.cmp too)
+        "CmpItemAbbr": {"fg": c.fg_main},
+        "CmpItemAbbrDeprecated": {"fg": c.fg_dim, "strikethrough": True},
+        "CmpItemAbbrMatch": {"fg": c.accent or c.blue, "bold": True},
+        "CmpItemAbbrMatchFuzzy": {"fg": c.accent_dark or c.blue_intense, "bold": True},
+        "CmpItemMenu": {"fg": c.fg_dim},
+        "CmpItemKindText": {"fg": c.fg_main},
+        "CmpItemKindMethod": {"fg": c.blue},
+        "CmpItemKindFunction": {"fg": c.blue},
+        "CmpItemKindConstructor": {"fg": c.magenta},
+        "CmpItemKindField": {"fg": c.cyan},
+        "CmpItemKindVariable": {"fg": c.fg_main},
+        "CmpItemKindClass": {"fg": c.cyan},
+        "CmpItemKindInterface": {"fg": c.cyan},
+        "CmpItemKindModule": {"fg": c.fg_alt or c.blue},
+        "CmpItemKindProperty": {"fg": c.cyan},
+        "CmpItemKindUnit": {"fg": c.yellow},
+        "CmpItemKindValue": {"fg": c.fg_main},
+        "CmpItemKindEnum": {"fg": c.yellow},
+        "CmpItemKindKeyword": {"fg": c.magenta},
+        "CmpItemKindSnippet": {"fg": c.green},
+        "CmpItemKindColor": {"fg": c.magenta},
+        "CmpItemKindFile": {"fg": c.fg_main},
+        "CmpItemKindReference": {"fg": c.magenta},
+        "CmpItemKindFolder": {"fg": c.blue},
+        "CmpItemKindEnumMember": {"fg": c.yellow},
+        "CmpItemKindConstant": {"fg": c.fg_main},
+        "CmpItemKindStruct": {"fg": c.cyan},
+        "CmpItemKindEvent": {"fg": c.magenta},
+        "CmpItemKindOperator": {"fg": c.fg_main},
+        "CmpItemKindTypeParameter": {"fg": c.cyan},
+    }
+
+
+def nvim_highlight_tables(variants: dict) -> dict:
+    """Resolved highlight groups per variant, with every variant's blends done in one batch."""
+    colors = {name: nvim_semantic_colors(variant) for name, variant in variants.items()}
+    requests = []
+    for c in colors.values():
+        for _, sources in DIAGNOSTIC_SOURCES:
+            base = next((c[key] for key in sources if c[key]), c.fg_main)
+            requests.extend((base, c[target], alpha) for _, target, alpha in DIAGNOSTIC_BLENDS)
+
+    blended = iter(blend_colors(requests))
+    tables = {}
+    for name, c in colors.items():
+        diag = {}
+        for kind, _ in DIAGNOSTIC_SOURCES:
+            for prefix, _, _ in DIAGNOSTIC_BLENDS:
+                diag[prefix + kind] = next(blended)
+        tables[name] = {
+            group: {key: value for key, value in opts.items() if value is not None}
+            for group, opts in nvim_highlight_groups(c, diag).items()
+        }
+    return tables
+
+
+def render_nvim_highlights(variant_name: str, variant: dict, families: dict, highlights: dict) -> str:
+    header = get_license_header(variant_name, variant, families)
+    return render_lua_module(
+        [*("--" + line[1:] for line in header.split("\n")), "-- Resolved highlight groups for phajas_palette (generated)"],
+        "return ",
+        highlights,
     )
-    return write_if_changed(NVIM_WALLPAPER_MODULE, content)
 
 
-def write_nvim_colorscheme(data: dict) -> bool:
-    lua_table = lua_serialize(data)
-    content = "\n".join(
+def render_nvim_highlight_chunk(variants: dict, families: dict) -> dict:
+    """Rendered highlight modules for a batch of variants, keyed by variant name."""
+    tables = nvim_highlight_tables(variants)
+    return {name: render_nvim_highlights(name, variant, families, tables[name]) for name, variant in variants.items()}
+
+
+def write_nvim_highlights(variants: dict, families: dict, manifest: BuildManifest | None = None) -> list[Path]:
+    pending = {}
+    for name, variant in variants.items():
+        highlight_file = NVIM_HIGHLIGHT_DIR / f"{name}.lua"
+        inputs = [name, variant, families.get(variant.get("family", "modus"))]
+        key = manifest.key_for(inputs) if manifest else None
+        if manifest and manifest.is_fresh(highlight_file, key):
+            continue
+        pending[name] = (highlight_file, key)
+
+    # Blends stay batched within a chunk; variants are only split into
+    # chunks when there are enough to be worth a process pool
+    names = list(pending)
+    chunks = 1 if len(names) < PARALLEL_RENDER_MIN_JOBS else os.cpu_count() or 1
+    jobs = [
+        (render_nvim_highlight_chunk, ({name: variants[name] for name in names[start::chunks]}, families))
+        for start in range(min(chunks, len(names)))
+    ]
+    contents = {}
+    for rendered in render_all(jobs, min_jobs=2):
+        contents.update(rendered)
+
+    written = []
+    for name, (highlight_file, key) in pending.items():
+        content = contents[name]
+        if manifest:
+            changed = manifest.write(highlight_file, key, content)
+        else:
+            changed = write_if_changed(highlight_file, content)
+        if changed:
+            written.append(highlight_file)
+
+    written.extend(prune_stale_modules(NVIM_HIGHLIGHT_DIR, {f"{name}.lua" for name in variants}))
+    return written
+
+
+def render_nvim_colorscheme() -> str:
+    return "\n".join(
         [
             "-- Generated by colors/build.py from colors/palette.toml",
             "-- This colorscheme includes palettes from multiple sources:",
@@ -414,30 +1588,48 @@ def write_nvim_colorscheme(data: dict) -> bool:
             "--   Catppuccin themes: MIT (see https://github.com/catppuccin/catppuccin/blob/main/LICENSE)",
             "-- Generated colorscheme file is GPL v3 as derivative work",
             "-- Neovim colorscheme entry point (loaded via :colorscheme phajas_palette)",
-            "local palette = " + lua_table,
+            "-- Only the palette index and the selected variant module are loaded.",
+            "local colors_dir = vim.fn.stdpath(\"config\") .. \"/lua/phajas/colors\"",
+            "",
+            "local function load_module(path)",
+            "  local ok, data = pcall(dofile, path)",
+            "  if ok and type(data) == \"table\" then",
+            "    return data",
+            "  end",
+            "end",
+            "",
+            "local palette = load_module(colors_dir .. \"/index.lua\") or { families = {}, variants = {} }",
             "",
-            *lua_wallpaper_merge_lines(),
+            "local function load_variant(name)",
+            "  if not name or not (palette.variants and palette.variants[name]) then",
+            "    return",
+            "  end",
+            "  return load_module(colors_dir .. \"/variants/\" .. name .. \".lua\")",
+            "end",
             "",
             "local function select_variant(flavor)",
             "  -- Check if a specific variant was requested via global variable",
             "  if vim.g.phajas_palette_variant then",
             "    local requested = vim.g.phajas_palette_variant",
-            "    if palette.variants and palette.variants[requested] then",
-            "      return requested, palette.variants[requested]",
+            "    local variant = load_variant(requested)",
+            "    if variant then",
+            "      return requested, variant",
             "    end",
             "  end",
             "  ",
             "  -- Fall back to flavor-based selection",
-            "  for name, variant in pairs(palette.variants or {}) do",
-            "    if variant.flavor == flavor then",
-            "      return name, variant",
+            "  for name, info in pairs(palette.variants or {}) do",
+            "    if info.flavor == flavor then",
+            "      return name, load_variant(name)",
             "    end",
             "  end",
-            "  if palette.default_variant and palette.variants and palette.variants[palette.default_variant] then",
-            "    return palette.default_variant, palette.variants[palette.default_variant]",
+            "  local default = load_variant(palette.default_variant)",
+            "  if default then",
+            "    return palette.default_variant, default",
             "  end",
             "  if palette.variants then",
-            "    return next(palette.variants)",
+            "    local name = next(palette.variants)",
+            "    return name, load_variant(name)",
             "  end",
             "end",
             "",
@@ -456,425 +1648,9 @@ def write_nvim_colorscheme(data: dict) -> bool:
             "  vim.api.nvim_set_hl(0, group, opts)",
             "end",
             "",
-            "local function hex_to_rgb(hex)",
-            "  if type(hex) ~= \"string\" then return end",
-            "  hex = hex:gsub(\"#\", \"\")",
-            "  if #hex ~= 6 then return end",
-            "  local r = tonumber(hex:sub(1, 2), 16)",
-            "  local g = tonumber(hex:sub(3, 4), 16)",
-            "  local b = tonumber(hex:sub(5, 6), 16)",
-            "  if not r or not g or not b then return end",
-            "  return r, g, b",
-            "end",
-            "",
-            "local function blend(fg, bg, alpha)",
-            "  local fr, fg2, fb = hex_to_rgb(fg)",
-            "  local br, bg2, bb = hex_to_rgb(bg)",
-            "  if not fr or not br then",
-            "    return fg or bg",
-            "  end",
-            "  local function mix(a, b)",
-            "    return math.floor((alpha * a) + ((1 - alpha) * b) + 0.5)",
-            "  end",
-            "  return string.format(\"#%02x%02x%02x\", mix(fr, br), mix(fg2, bg2), mix(fb, bb))",
-            "end",
-            "",
-            "local function colors_for(variant)",
-            "  local a = variant.ansi or {}",
-            "  local base = {",
-            "    bg_main = variant.background,",
-            "    fg_main = variant.foreground,",
-            "    fg_dim = a[9] or a[8],",
-            "    fg_alt = a[5] or variant.foreground,",
-            "    border = a[8],",
-            "    border_highlight = a[9] or a[8],",
-            "    red = a[2], green = a[3], yellow = a[4], blue = a[5], magenta = a[6], cyan = a[7],",
-            "    bg_dim = a[8],",
-            "    bg_alt = variant.background,",
-            "    bg_hl_line = a[8],",
-            "    bg_paren_match = a[12] or a[5],",
-            "    fg_inactive = a[9] or a[8],",
-            "    fg_active = a[15] or a[7],",
-            "    bg_active = a[8],",
-            "    bg_inactive = a[8],",
-            "    fg_tab_other = a[9] or a[8],",
-            "    bg_tab_other = a[8],",
-            "    fg_status_line_active = a[15] or a[7],",
-            "    bg_status_line_active = a[1] or variant.background,",
-            "    fg_status_line_inactive = a[9] or a[8],",
-            "    bg_status_line_inactive = a[1] or variant.background,",
-            "    visual = variant.selection_background,",
-            "    fg_added = a[3], fg_changed = a[4], fg_removed = a[2],",
-            "    bg_added = variant.background, bg_changed = variant.background, bg_removed = variant.background,",
-            "    fg_added_intense = a[11] or a[3],",
-            "    fg_changed_intense = a[12] or a[4],",
-            "    fg_removed_intense = a[10] or a[2],",
-            "    bg_added_refine = variant.background,",
-            "    bg_changed_refine = variant.background,",
-            "    bg_removed_refine = variant.background,",
-            "    bg_completion = a[13] or a[5],",
-            "    error = a[10] or a[2],",
-            "    warning = a[12] or a[4],",
-            "    info = a[13] or a[5],",
-            "    hint = a[15] or a[7],",
-            "    ok = a[11] or a[3],",
-            "  }",
-            "  local c = {}",
-            "  if variant.extended then",
-            "    c = vim.deepcopy(variant.extended)",
-            "  end",
-            "  for key, value in pairs(base) do",
-            "    if c[key] == nil then",
-            "      c[key] = value",
-            "    end",
-            "  end",
-            "  c.blue = c.blue or base.blue",
-            "  c.magenta = c.magenta or base.magenta",
-            "  c.red = c.red or base.red",
-            "  c.yellow = c.yellow or base.yellow",
-            "  c.green = c.green or base.green",
-            "  c.cyan = c.cyan or base.cyan",
-            "  c.red_intense = c.red_intense or a[10] or c.red",
-            "  c.green_intense = c.green_intense or a[11] or c.green",
-            "  c.yellow_intense = c.yellow_intense or a[12] or c.yellow",
-            "  c.blue_intense = c.blue_intense or a[13] or c.blue",
-            "  c.magenta_intense = c.magenta_intense or a[14] or c.magenta",
-            "  c.cyan_intense = c.cyan_intense or a[15] or c.cyan",
-            "  c.blue_warmer = c.blue_warmer or c.blue",
-            "  c.blue_cooler = c.blue_cooler or c.blue",
-            "  c.blue_faint = c.blue_faint or c.blue",
-            "  c.magenta_cooler = c.magenta_cooler or c.magenta",
-            "  c.red_cooler = c.red_cooler or c.red",
-            "  c.yellow_cooler = c.yellow_cooler or c.yellow",
-            "  c.cyan_cooler = c.cyan_cooler or c.cyan",
-            "  c.cyan_warmer = c.cyan_warmer or c.cyan",
-            "  c.cyan_faint = c.cyan_faint or c.cyan",
-            "  c.green_cooler = c.green_cooler or c.green",
-            "  c.green_faint = c.green_faint or c.green",
-            "  c.bg_magenta_intense = c.bg_magenta_intense or c.magenta",
-            "  c.bg_green_intense = c.bg_green_intense or c.green",
-            "  c.bg_yellow_intense = c.bg_yellow_intense or c.yellow",
-            "  c.bg_red_intense = c.bg_red_intense or c.red",
-            "  -- Derived fields to complete the extended palette",
-            "  c.bg_sidebar = c.bg_sidebar or c.bg_dim",
-            "  c.fg_sidebar = c.fg_sidebar or c.fg_main",
-            "  c.cursor = c.cursor or c.fg_main",
-            "  c.comment = c.comment or c.fg_dim",
-            "  c.error = c.error or c.red_cooler or c.red or base.error",
-            "  c.warning = c.warning or c.yellow_cooler or c.yellow or base.warning",
-            "  c.info = c.info or c.blue_cooler or c.blue or base.info",
-            "  c.hint = c.hint or c.cyan_faint or c.cyan or base.hint",
-            "  c.ok = c.ok or c.green_cooler or c.green or base.ok",
-            "  c.success = c.success or c.fg_added",
-            "  c.visual = c.visual or c.bg_magenta_intense or c.magenta",
-            "  c.accent_light = c.accent_light or c.blue_faint or c.blue",
-            "  c.accent = c.accent or c.blue_warmer or c.blue",
-            "  c.accent_darker = c.accent_darker or c.blue or c.accent",
-            "  c.accent_dark = c.accent_dark or c.blue_intense or c.blue",
-            "  -- Default (non-tinted/non-accessibility variants) only for now",
-            "  return c",
-            "end",
-            "",
-            "local function apply_highlights(variant)",
-            "  local c = colors_for(variant)",
-            "  local diag_base_error = c.red_intense or c.error or c.red or c.fg_main",
-            "  local diag_base_warn = c.yellow_intense or c.warning or c.yellow or c.fg_main",
-            "  local diag_base_info = c.blue_intense or c.info or c.blue or c.fg_main",
-            "  local diag_base_hint = c.cyan_intense or c.hint or c.cyan or c.fg_main",
-            "  local diag_base_ok = c.green_intense or c.ok or c.green or c.fg_main",
-            "  local diag_error = blend(diag_base_error, c.fg_main, 0.7)",
-            "  local diag_warn = blend(diag_base_warn, c.fg_main, 0.7)",
-            "  local diag_info = blend(diag_base_info, c.fg_main, 0.7)",
-            "  local diag_hint = blend(diag_base_hint, c.fg_main, 0.7)",
-            "  local diag_ok = blend(diag_base_ok, c.fg_main, 0.7)",
-            "  local diag_bg_error = blend(diag_base_error, c.bg_main, 0.28)",
-            "  local diag_bg_warn = blend(diag_base_warn, c.bg_main, 0.28)",
-            "  local diag_bg_info = blend(diag_base_info, c.bg_main, 0.28)",
-            "  local diag_bg_hint = blend(diag_base_hint, c.bg_main, 0.28)",
-            "  local diag_bg_ok = blend(diag_base_ok, c.bg_main, 0.28)",
-            "  local diag_line_error = blend(diag_base_error, c.bg_main, 0.14)",
-            "  local diag_line_warn = blend(diag_base_warn, c.bg_main, 0.14)",
-            "  local diag_line_info = blend(diag_base_info, c.bg_main, 0.14)",
-            "  local diag_line_hint = blend(diag_base_hint, c.bg_main, 0.14)",
-            "  local diag_line_ok = blend(diag_base_ok, c.bg_main, 0.14)",
-            "  local hls = {",
-            "    -- UI",
-            "    Normal = { fg = c.fg_main, bg = c.bg_main },",
-            "    NormalFloat = { fg = c.fg_active or c.fg_main, bg = c.bg_active or c.bg_main },",
-            "    FloatBorder = { fg = c.border_highlight or c.border, bg = c.bg_main },",
-            "    FloatTitle = { fg = c.border_highlight or c.border, bg = c.bg_main },",
-            "    Folded = { fg = c.green_faint or c.green or c.fg_dim, bg = c.bg_dim or c.bg_main },",
-            "    LineNr = { fg = c.fg_main, bg = c.bg_dim or c.bg_main },",
-            "    LineNrAbove = { fg = c.fg_dim, bg = c.bg_dim or c.bg_main },",
-            "    LineNrBelow = { fg = c.fg_dim, bg = c.bg_dim or c.bg_main },",
-            "    CursorLineNr = { fg = c.fg_active or c.fg_main, bg = c.bg_active or c.bg_dim, bold = true },",
-            "    SignColumn = { fg = c.fg_dim, bg = c.bg_dim or c.bg_main },",
-            "    CursorLine = { bg = c.bg_hl_line or c.bg_dim },",
-            "    CursorColumn = { bg = c.bg_hl_line or c.bg_dim },",
-            "    NonText = { fg = c.fg_dim },",
-            "    ColorColumn = { bg = c.bg_dim or c.bg_main },",
-            "    FoldColumn = { fg = c.fg_inactive or c.fg_dim, bg = c.bg_inactive or c.bg_dim or c.bg_main },",
-            "    Search = { fg = c.fg_main, bg = c.bg_green_intense or c.bg_completion or c.green },",
-            "    IncSearch = { fg = c.fg_main, bg = c.bg_yellow_intense or c.yellow },",
-            "    CurSearch = { link = \"IncSearch\" },",
-            "    Substitute = { fg = c.fg_main, bg = c.bg_red_intense or c.red },",
-            "    QuickFixLine = { fg = c.fg_main, bg = c.visual or c.bg_hl_line },",
-            "    Pmenu = { fg = c.fg_active or c.fg_main, bg = c.bg_active or c.bg_main },",
-            "    PmenuSel = { fg = c.bg_active or c.bg_main, bg = c.fg_active or c.fg_main },",
-            "    PmenuSbar = { fg = c.fg_active or c.fg_main, bg = c.bg_dim or c.bg_main },",
-            "    PmenuThumb = { fg = c.bg_main, bg = c.cursor or c.fg_main },",
-            "    Directory = { fg = c.blue },",
-            "    Title = { fg = c.fg_alt or c.blue, bold = true },",
-            "    Visual = { fg = c.fg_main, bg = c.visual or c.bg_hl_line },",
-            "    VisualNOS = { link = \"Visual\" },",
-            "    WildMenu = { fg = c.fg_main, bg = c.visual or c.bg_hl_line },",
-            "    Whitespace = { fg = c.fg_dim },",
-            "    StatusLine = { fg = c.fg_status_line_active or c.fg_main, bg = c.bg_status_line_active or c.bg_main },",
-            "    StatusLineNC = { fg = c.fg_status_line_inactive or c.fg_dim, bg = c.bg_status_line_inactive or c.bg_main },",
-            "    TabLine = { fg = c.fg_tab_other or c.fg_dim, bg = c.bg_tab_other or c.bg_dim },",
-            "    TabLineSel = { fg = c.fg_main, bg = c.bg_tab_current or c.bg_main, bold = true },",
-            "    TabLineFill = { fg = c.fg_dim, bg = c.bg_tab_bar or c.bg_dim },",
-            "    WinBar = { link = \"TabLineSel\" },",
-            "    WinBarNC = { link = \"TabLine\" },",
-            "    EndOfBuffer = { fg = c.fg_inactive or c.fg_dim },",
-            "    MatchParen = { fg = c.fg_main, bg = c.bg_paren_match or c.bg_completion },",
-            "    ModeMsg = { fg = c.fg_dim, bold = true },",
-            "    MsgArea = { fg = c.fg_main },",
-            "    MoreMsg = { fg = c.blue },",
-            "    VertSplit = { fg = c.border },",
-            "    WinSeparator = { fg = c.border, bold = true },",
-            "    DiffAdd = { fg = c.fg_added, bg = c.bg_added },",
-            "    DiffDelete = { fg = c.fg_removed, bg = c.bg_removed },",
-            "    DiffChange = { fg = c.fg_changed, bg = c.bg_changed },",
-            "    DiffText = { fg = c.fg_changed, bg = c.bg_changed },",
-            "    SpecialKey = { fg = c.fg_dim },",
-            "    SpellBad = { sp = c.error, undercurl = true },",
-            "    SpellCap = { sp = c.warning, undercurl = true },",
-            "    SpellLocal = { sp = c.info, undercurl = true },",
-            "    SpellRare = { sp = c.hint, undercurl = true },",
-            "    WarningMsg = { fg = c.warning },",
-            "    Question = { fg = c.blue },",
-            "",
-            "    -- Syntax",
-            "    Comment = { fg = c.comment or c.fg_dim, italic = true },",
-            "    String = { fg = c.blue_warmer or c.green },",
-            "    Character = { fg = c.blue_warmer or c.green },",
-            "    Boolean = { fg = c.blue or c.magenta, bold = true },",
-            "    Statement = { fg = c.magenta_cooler or c.magenta },",
-            "    Conditional = { fg = c.magenta_cooler or c.magenta },",
-            "    Repeat = { fg = c.magenta_cooler or c.magenta },",
-            "    Label = { fg = c.cyan },",
-            "    Keyword = { fg = c.magenta_cooler or c.magenta },",
-            "    Exception = { fg = c.magenta_cooler or c.magenta },",
-            "    StorageClass = { fg = c.magenta_cooler or c.magenta },",
-            "    Structure = { fg = c.magenta_cooler or c.magenta },",
-            "    Constant = { fg = c.fg_main },",
-            "    Function = { fg = c.magenta },",
-            "    Identifier = { fg = c.cyan },",
-            "    PreProc = { fg = c.red_cooler or c.red },",
-            "    Include = { fg = c.red_cooler or c.red },",
-            "    Define = { fg = c.red_cooler or c.red },",
-            "    Macro = { fg = c.red_cooler or c.red },",
-            "    PreCondit = { fg = c.red_cooler or c.red },",
-            "    Todo = { fg = c.magenta, bold = true },",
-            "    Type = { fg = c.cyan_cooler or c.cyan },",
-            "    TypeDef = { fg = c.cyan_warmer or c.cyan },",
-            "    Number = { fg = c.blue_faint or c.magenta },",
-            "    Float = { link = \"Number\" },",
-            "    Operator = { fg = c.fg_main },",
-            "    Tag = { fg = c.magenta },",
-            "    Delimiter = { fg = c.fg_main },",
-            "    Special = { link = \"Type\" },",
-            "    SpecialChar = { fg = c.cyan_faint or c.cyan },",
-            "    Underlined = { fg = c.fg_alt or c.blue, underline = true },",
-            "    Error = { fg = c.fg_main, bg = c.bg_red_intense or c.red },",
-            "",
-            "    -- Diagnostics",
-            "    DiagnosticError = { fg = diag_error, bold = true },",
-            "    DiagnosticWarn = { fg = diag_warn, bold = true },",
-            "    DiagnosticInfo = { fg = diag_info, bold = true },",
-            "    DiagnosticHint = { fg = diag_hint, bold = true },",
-            "    DiagnosticOk = { fg = diag_ok, bold = true },",
-            "    DiagnosticUnnecessary = { fg = c.fg_dim },",
-            "    DiagnosticVirtualTextError = { fg = diag_error, bg = diag_bg_error, bold = true },",
-            "    DiagnosticVirtualTextWarn = { fg = diag_warn, bg = diag_bg_warn, bold = true },",
-            "    DiagnosticVirtualTextInfo = { fg = diag_info, bg = diag_bg_info, bold = true },",
-            "    DiagnosticVirtualTextHint = { fg = diag_hint, bg = diag_bg_hint, bold = true },",
-            "    DiagnosticVirtualTextOk = { fg = diag_ok, bg = diag_bg_ok, bold = true },",
-            "    DiagnosticUnderlineError = { undercurl = true, sp = diag_error },",
-            "    DiagnosticUnderlineWarn = { undercurl = true, sp = diag_warn },",
-            "    DiagnosticUnderlineInfo = { undercurl = true, sp = diag_info },",
-            "    DiagnosticUnderlineHint = { undercurl = true, sp = diag_hint },",
-            "    DiagnosticUnderlineOk = { undercurl = true, sp = diag_ok },",
-            "    DiagnosticSignError = { fg = diag_error, bg = c.bg_dim or c.bg_main },",
-            "    DiagnosticSignWarn = { fg = diag_warn, bg = c.bg_dim or c.bg_main },",
-            "    DiagnosticSignInfo = { fg = diag_info, bg = c.bg_dim or c.bg_main },",
-            "    DiagnosticSignHint = { fg = diag_hint, bg = c.bg_dim or c.bg_main },",
-            "    DiagnosticSignOk = { fg = diag_ok, bg = c.bg_dim or c.bg_main },",
-            "    DiagnosticFloatingError = { fg = diag_error, bg = diag_bg_error },",
-            "    DiagnosticFloatingWarn = { fg = diag_warn, bg = diag_bg_warn },",
-            "    DiagnosticFloatingInfo = { fg = diag_info, bg = diag_bg_info },",
-            "    DiagnosticFloatingHint = { fg = diag_hint, bg = diag_bg_hint },",
-            "    DiagnosticFloatingOk = { fg = diag_ok, bg = diag_bg_ok },",
-            "    DiagnosticLineError = { bg = diag_line_error },",
-            "    DiagnosticLineWarn = { bg = diag_line_warn },",
-            "    DiagnosticLineInfo = { bg = diag_line_info },",
-            "    DiagnosticLineHint = { bg = diag_line_hint },",
-            "    DiagnosticLineOk = { bg = diag_line_ok },",
-            "",
-            "    -- Diff/Git",
-            "    GitSignsAdd = { fg = c.fg_added_intense or c.fg_added, bg = c.bg_added or c.bg_main },",
-            "    GitSignsChange = { fg = c.fg_changed_intense or c.fg_changed, bg = c.bg_changed or c.bg_main },",
-            "    GitSignsDelete = { fg = c.fg_removed_intense or c.fg_removed, bg = c.bg_removed or c.bg_main },",
-            "",
-            "    -- LSP",
-            "    LspReferenceText = { bg = c.bg_blue_intense or c.bg_hl_line, fg = c.fg_main },",
-            "    LspReferenceRead = { bg = c.bg_blue_intense or c.bg_hl_line, fg = c.fg_main },",
-            "    LspReferenceWrite = { bg = c.bg_blue_intense or c.bg_hl_line, fg = c.fg_main },",
-            "",
-            "    -- Telescope (basic alignment with palette intent)",
-            "    TelescopeNormal = { link = 'Normal' },",
-            "    TelescopeBorder = { fg = c.border or c.fg_dim, bg = c.bg_main },",
-            "    TelescopeTitle = { fg = c.fg_dim, bg = c.bg_main },",
-            "    TelescopeSelection = { fg = c.selection_foreground or c.fg_main, bg = c.selection_background or c.visual or c.bg_hl_line, bold = true },",
-            "    TelescopeSelectionCaret = { fg = c.selection_foreground or c.fg_main, bg = c.selection_background or c.visual or c.bg_hl_line, bold = true },",
-            "    TelescopeMultiSelection = { fg = c.accent or c.blue, bg = c.bg_dim or c.bg_main },",
-            "    TelescopeMultiIcon = { fg = c.accent or c.blue, bg = c.bg_dim or c.bg_main },",
-            "    TelescopePromptBorder = { fg = c.border_highlight or c.border, bg = c.bg_main },",
-            "    TelescopePromptTitle = { fg = c.border_highlight or c.border, bg = c.bg_main },",
-            "    TelescopeResultsComment = { fg = c.fg_dim },",
-            "    TelescopePromptNormal = { link = 'Normal' },",
-            "    TelescopePromptPrefix = { fg = c.accent_darker or c.blue, bg = c.bg_main },",
-            "    TelescopeMatching = { fg = c.accent_dark or c.blue_intense, bold = true },",
-            "",
-            "    -- Treesitter (core captures)",
-            "    ['@comment'] = { link = 'Comment' },",
-            "    ['@error'] = { link = 'Error' },",
-            "    ['@punctuation'] = { fg = c.fg_dim },",
-            "    ['@punctuation.delimiter'] = { link = 'Delimiter' },",
-            "    ['@punctuation.bracket'] = { fg = c.fg_main },",
-            "    ['@punctuation.special'] = { fg = c.fg_main },",
-            "    ['@string'] = { link = 'String' },",
-            "    ['@character'] = { link = 'Character' },",
-            "    ['@number'] = { link = 'Number' },",
-            "    ['@boolean'] = { link = 'Boolean' },",
-            "    ['@float'] = { link = 'Float' },",
-            "    ['@constant'] = { link = 'Constant' },",
-            "    ['@constant.builtin'] = { fg = c.magenta },",
-            "    ['@constant.macro'] = { fg = c.red_cooler or c.red },",
-            "    ['@namespace'] = { fg = c.fg_alt or c.blue },",
-            "    ['@symbol'] = { fg = c.magenta },",
-            "    ['@variable'] = { fg = c.fg_main },",
-            "    ['@variable.builtin'] = { fg = c.magenta_cooler or c.magenta },",
-            "    ['@variable.parameter'] = { fg = c.fg_main },",
-            "    ['@variable.member'] = { fg = c.cyan },",
-            "    ['@property'] = { link = '@field' },",
-            "    ['@field'] = { fg = c.fg_main },",
-            "    ['@function'] = { link = 'Function' },",
-            "    ['@function.builtin'] = { fg = c.blue_warmer or c.blue },",
-            "    ['@function.macro'] = { fg = c.red_cooler or c.red },",
-            "    ['@method'] = { link = 'Function' },",
-            "    ['@constructor'] = { fg = c.blue },",
-            "    ['@parameter'] = { fg = c.fg_main },",
-            "    ['@keyword'] = { link = 'Keyword' },",
-            "    ['@keyword.function'] = { link = 'Keyword' },",
-            "    ['@keyword.operator'] = { link = 'Operator' },",
-            "    ['@keyword.return'] = { link = 'Keyword' },",
-            "    ['@conditional'] = { link = 'Conditional' },",
-            "    ['@repeat'] = { link = 'Repeat' },",
-            "    ['@debug'] = { fg = c.red_cooler or c.red },",
-            "    ['@label'] = { link = 'Label' },",
-            "    ['@include'] = { link = 'Include' },",
-            "    ['@exception'] = { link = 'Exception' },",
-            "    ['@type'] = { link = 'Type' },",
-            "    ['@type.builtin'] = { fg = c.cyan_cooler or c.cyan },",
-            "    ['@type.definition'] = { link = 'Typedef' },",
-            "    ['@storageclass'] = { link = 'StorageClass' },",
-            "    ['@attribute'] = { fg = c.blue_warmer or c.blue },",
-            "    ['@field.yaml'] = { fg = c.cyan },",
-            "    ['@string.regex'] = { fg = c.blue_warmer or c.blue },",
-            "    ['@string.escape'] = { fg = c.magenta },",
-            "    ['@string.special'] = { fg = c.blue },",
-            "    ['@text.title'] = { fg = c.blue, bold = true },",
-            "    ['@text.emphasis'] = { italic = true },",
-            "    ['@text.strong'] = { bold = true },",
-            "    ['@text.uri'] = { fg = c.blue, underline = true },",
-            "    ['@text.reference'] = { fg = c.magenta },",
-            "    ['@text.literal'] = { fg = c.green },",
-            "    ['@text.note'] = { fg = c.blue, bold = true },",
-            "    ['@text.warning'] = { fg = c.warning or c.yellow },",
-            "    ['@text.danger'] = { fg = c.error or c.red },",
-            "",
-            "    -- Treesitter context",
-            "    TreesitterContext = { bg = c.bg_dim or c.bg_main },",
-            "    TreesitterContextLineNumber = { fg = c.fg_dim, bg = c.bg_dim or c.bg_main },",
-            "",
-            "    -- NvimTree",
-            "    NvimTreeNormal = { fg = c.fg_main, bg = c.bg_alt or c.bg_main },",
-            "    NvimTreeNormalNC = { fg = c.fg_main, bg = c.bg_alt or c.bg_main },",
-            "    NvimTreeFolderName = { fg = c.blue },",
-            "    NvimTreeFolderIcon = { fg = c.blue },",
-            "    NvimTreeRootFolder = { fg = c.magenta, bold = true },",
-            "    NvimTreeSymlink = { fg = c.cyan },",
-            "    NvimTreeExecFile = { fg = c.green },",
-            "    NvimTreeSpecialFile = { fg = c.magenta_warmer or c.magenta, bold = true },",
-            "    NvimTreeIndentMarker = { fg = c.fg_dim },",
-            "    NvimTreeGitNew = { fg = c.fg_added_intense or c.fg_added },",
-            "    NvimTreeGitDirty = { fg = c.fg_changed_intense or c.fg_changed },",
-            "    NvimTreeGitDeleted = { fg = c.fg_removed_intense or c.fg_removed },",
-            "    NvimTreeWinSeparator = { fg = c.border, bg = c.bg_alt or c.bg_main },",
-            "",
-            "    -- DAP / DAP UI",
-            "    DapBreakpoint = { fg = c.red },",
-            "    DapBreakpointCondition = { fg = c.yellow },",
-            "    DapBreakpointRejected = { fg = c.red_intense or c.red },",
-            "    DapStopped = { fg = c.green },",
-            "    DapLogPoint = { fg = c.cyan },",
-            "    DapUIScope = { fg = c.cyan },",
-            "    DapUIType = { fg = c.magenta },",
-            "    DapUIValue = { fg = c.fg_main },",
-            "    DapUIThread = { fg = c.green },",
-            "    DapUIStoppedThread = { fg = c.red },",
-            "    DapUISource = { fg = c.blue },",
-            "    DapUILineNumber = { fg = c.accent or c.blue },",
-            "    DapUIFloatBorder = { fg = c.border_highlight or c.border, bg = c.bg_main },",
-            "    DapUIWatchesValue = { fg = c.green },",
-            "    DapUIWatchesError = { fg = c.red },",
-            "    NvimDapVirtualText = { fg = c.fg_dim, italic = true },",
-            "",
-            "    -- Completion (cmp-style groups used by blink.cmp too)",
-            "    CmpItemAbbr = { fg = c.fg_main },",
-            "    CmpItemAbbrDeprecated = { fg = c.fg_dim, strikethrough = true },",
-            "    CmpItemAbbrMatch = { fg = c.accent or c.blue, bold = true },",
-            "    CmpItemAbbrMatchFuzzy = { fg = c.accent_dark or c.blue_intense, bold = true },",
-            "    CmpItemMenu = { fg = c.fg_dim },",
-            "    CmpItemKindText = { fg = c.fg_main },",
-            "    CmpItemKindMethod = { fg = c.blue },",
-            "    CmpItemKindFunction = { fg = c.blue },",
-            "    CmpItemKindConstructor = { fg = c.magenta },",
-            "    CmpItemKindField = { fg = c.cyan },",
-            "    CmpItemKindVariable = { fg = c.fg_main },",
-            "    CmpItemKindClass = { fg = c.cyan },",
-            "    CmpItemKindInterface = { fg = c.cyan },",
-            "    CmpItemKindModule = { fg = c.fg_alt or c.blue },",
-            "    CmpItemKindProperty = { fg = c.cyan },",
-            "    CmpItemKindUnit = { fg = c.yellow },",
-            "    CmpItemKindValue = { fg = c.fg_main },",
-            "    CmpItemKindEnum = { fg = c.yellow },",
-            "    CmpItemKindKeyword = { fg = c.magenta },",
-            "    CmpItemKindSnippet = { fg = c.green },",
-            "    CmpItemKindColor = { fg = c.magenta },",
-            "    CmpItemKindFile = { fg = c.fg_main },",
-            "    CmpItemKindReference = { fg = c.magenta },",
-            "    CmpItemKindFolder = { fg = c.blue },",
-            "    CmpItemKindEnumMember = { fg = c.yellow },",
-            "    CmpItemKindConstant = { fg = c.fg_main },",
-            "    CmpItemKindStruct = { fg = c.cyan },",
-            "    CmpItemKindEvent = { fg = c.magenta },",
-            "    CmpItemKindOperator = { fg = c.fg_main },",
-            "    CmpItemKindTypeParameter = { fg = c.cyan },",
-            "  }",
-            "",
+            "local function apply_highlights(name)",
+            "  -- Highlight groups are resolved at build time; see nvim_highlight_tables in build.py",
+            "  local hls = load_module(colors_dir .. \"/highlights/\" .. name .. \".lua\") or {}",
             "  for group, opts in pairs(hls) do",
             "    set_hl(group, opts)",
             "  end",
@@ -887,7 +1663,7 @@ def write_nvim_colorscheme(data: dict) -> bool:
             "    return",
             "  end",
             "  apply_terminal(variant)",
-            "  apply_highlights(variant)",
+            "  apply_highlights(name)",
             "  vim.g.colors_name = \"phajas_palette\"",
             "  return name, variant",
             "end",
@@ -897,16 +1673,21 @@ def write_nvim_colorscheme(data: dict) -> bool:
             "return {",
             "  palette = palette,",
             "  apply = apply,",
+            "  load_variant = load_variant,",
             "  select_variant = select_variant,",
             "}",
             "",
         ]
     )
-    return write_if_changed(NVIM_COLORSCHEME_FILE, content)
 
 
-def write_ghostty_palettes(variants: dict, families: dict) -> bool:
-    changed = False
+def write_nvim_colorscheme(manifest: BuildManifest | None = None) -> list[Path]:
+    written = write_target(NVIM_COLORSCHEME_FILE, [], render_nvim_colorscheme, manifest)
+    return [NVIM_COLORSCHEME_FILE] if written else []
+
+
+def write_ghostty_palettes(variants: dict, families: dict, manifest: BuildManifest | None = None) -> list[Path]:
+    jobs = []
     seen = {}
     for name, variant in variants.items():
         file_name = ghostty_theme_name(name, variant, families)
@@ -916,11 +1697,9 @@ def write_ghostty_palettes(variants: dict, families: dict) -> bool:
             )
         seen[file_name] = name
 
-        ghostty_file = GHOSTTY_THEME_DIR / file_name
-        rendered = render_ghostty_variant(file_name, name, variant, families)
-        if write_if_changed(ghostty_file, rendered):
-            changed = True
-    return changed
+        inputs = [file_name, name, variant, families.get(variant.get("family", "modus"))]
+        jobs.append((GHOSTTY_THEME_DIR / file_name, inputs, render_ghostty_variant, (file_name, name, variant, families)))
+    return write_targets(jobs, manifest)
 
 
 def ranger_scheme_name(variant_name: str, variant: dict) -> str:
@@ -1044,42 +1823,411 @@ def render_ranger_rc(scheme_name: str, variant_name: str | None) -> str:
     )
 
 
-def write_ranger_configs(palette: dict) -> bool:
-    changed = False
+def write_ranger_colorschemes(palette: dict, manifest: BuildManifest | None = None) -> list[Path]:
+    # Several variants share a scheme file (e.g. every light variant renders
+    # phajas_light.py); the last one wins, so only render that one.
+    schemes = {}
+    for name, variant in (palette.get("variants") or {}).items():
+        schemes[ranger_scheme_name(name, variant)] = (name, variant)
+
+    jobs = [
+        (RANGER_COLORSCHEME_DIR / f"{scheme_name}.py", [name, variant.get("flavor")], render_ranger_colorscheme, (name, variant))
+        for scheme_name, (name, variant) in schemes.items()
+    ]
+    return write_targets(jobs, manifest)
+
+
+def write_ranger_rc(palette: dict, manifest: BuildManifest | None = None) -> list[Path]:
     variants = palette.get("variants") or {}
-    for name, variant in variants.items():
-        scheme_name = ranger_scheme_name(name, variant)
-        scheme_file = RANGER_COLORSCHEME_DIR / f"{scheme_name}.py"
-        rendered = render_ranger_colorscheme(name, variant)
-        if write_if_changed(scheme_file, rendered):
-            changed = True
+    if not variants:
+        return []
+    default_variant = palette.get("default_variant") or next(iter(variants))
+    default_scheme = ranger_scheme_name(default_variant, variants[default_variant])
+
+    def render() -> str:
+        return render_ranger_rc(default_scheme, default_variant)
+
+    written = write_target(RANGER_RC_FILE, [default_scheme, default_variant], render, manifest)
+    return [RANGER_RC_FILE] if written else []
+
+
+@dataclass
+class BuildResult:
+    """Outputs written (or removed) by build(), per target."""
+
+    written: dict[str, list[Path]] = field(default_factory=dict)
+
+    @property
+    def changed(self) -> bool:
+        return any(self.written.values())
+
+    def summary(self) -> str:
+        """The changed.<target>= / changed= lines printed by the CLI."""
+        lines = [f"changed.{target}={'true' if paths else 'false'}" for target, paths in self.written.items()]
+        lines.append(f"changed={'true' if self.changed else 'false'}")
+        return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class Renderer:
+    """A named build target: its writer and the palette data it consumes.
+
+    scope picks the variants the writer sees ("all", or the "base"/"wallpaper"
+    halves of split_wallpaper_palette) and fields the top-level palette keys it
+    reads within that scope; None means the whole scoped palette. build() keys
+    each target on exactly that data and skips targets whose key is unchanged.
+    """
+
+    name: str
+    group: str
+    scope: str
+    fields: tuple[str, ...] | None
+    write: Callable[[dict, BuildManifest | None], list[Path]]
+
+
+RENDERERS = {
+    renderer.name: renderer
+    for renderer in (
+        Renderer(
+            "ghostty", "ghostty", "all", ("variants", "families"),
+            lambda palette, manifest: write_ghostty_palettes(palette["variants"], palette["families"], manifest),
+        ),
+        Renderer("nvim_palette", "nvim", "base", None, write_nvim_palette),
+        Renderer("nvim_wallpaper", "nvim", "wallpaper", None, write_nvim_wallpaper_palette),
+        Renderer(
+            "nvim_index", "nvim", "base", ("variants", "families", "default_variant", "default_family"),
+            write_nvim_index,
+        ),
+        Renderer("nvim_wallpaper_index", "nvim", "wallpaper", ("variants", "families"), write_nvim_wallpaper_index),
+        Renderer(
+            "nvim_variants", "nvim", "all", ("variants", "families"),
+            lambda palette, manifest: write_nvim_variants(palette["variants"], palette["families"], manifest),
+        ),
+        Renderer(
+            "nvim_highlights", "nvim", "all", ("variants", "families"),
+            lambda palette, manifest: write_nvim_highlights(palette["variants"], palette["families"], manifest),
+        ),
+        Renderer("nvim_colorscheme", "nvim", "all", (), lambda palette, manifest: write_nvim_colorscheme(manifest)),
+        Renderer("ranger", "ranger", "all", ("variants",), write_ranger_colorschemes),
+        Renderer("ranger_rc", "ranger", "all", ("variants", "default_variant"), write_ranger_rc),
+    )
+}
+BUILD_TARGETS = tuple(RENDERERS)
+
+
+def resolve_targets(names) -> tuple[str, ...]:
+    """Expand target and group names (e.g. "ghostty", "nvim") into BUILD_TARGETS order."""
+    selected = set()
+    for name in names:
+        matches = {target for target, renderer in RENDERERS.items() if name in (target, renderer.group)}
+        if not matches:
+            raise PaletteError(f"Unknown build target: {name}")
+        selected |= matches
+    return tuple(target for target in BUILD_TARGETS if target in selected)
+
+
+def scoped_palettes(palette: dict) -> dict:
+    """The palette as seen by each Renderer.scope."""
+    scoped = {"all": dict(palette, families=palette.get("families") or {})}
+    scoped["base"], scoped["wallpaper"] = split_wallpaper_palette(palette)
+    return scoped
+
+
+def target_keys(scoped: dict, targets=BUILD_TARGETS) -> dict:
+    """Key per target over exactly the scoped palette fields its renderer declares."""
+    field_keys = {}
+    keys = {}
+    for target in targets:
+        renderer = RENDERERS[target]
+        data = scoped[renderer.scope]
+        fields = sorted(data) if renderer.fields is None else renderer.fields
+        for name in fields:
+            if (renderer.scope, name) not in field_keys:
+                field_keys[renderer.scope, name] = BuildManifest.key_for(data.get(name))
+        keys[target] = BuildManifest.key_for([renderer.scope, [[name, field_keys[renderer.scope, name]] for name in fields]])
+    return keys
+
+
+def build(palette: dict, targets=None, manifest: BuildManifest | None = None) -> BuildResult:
+    """Render targets (default: all of BUILD_TARGETS) from an already-loaded palette.
+
+    With a manifest, targets and outputs whose inputs are unchanged are
+    skipped and the manifest is saved.
+    """
+    selected = tuple(BUILD_TARGETS if targets is None else targets)
+    unknown = sorted(set(selected) - set(BUILD_TARGETS))
+    if unknown:
+        raise PaletteError(f"Unknown build target(s): {', '.join(unknown)}")
+
+    scoped = scoped_palettes(palette)
+    keys = target_keys(scoped, selected) if manifest is not None else {}
+    result = BuildResult()
+    for target in BUILD_TARGETS:
+        if target not in selected:
+            continue
+        renderer = RENDERERS[target]
+        if manifest is None:
+            result.written[target] = renderer.write(scoped[renderer.scope], None)
+            continue
+        key = keys[target]
+        if manifest.target_fresh(target, key):
+            result.written[target] = []
+            continue
+        manifest.target = target
+        result.written[target] = renderer.write(scoped[renderer.scope], manifest)
+        manifest.built(target, key)
+    if manifest is not None:
+        manifest.save(selected)
+    return result
+
+
+@contextlib.contextmanager
+def output_tree(root: Path):
+    """Point every generated output path into root (same layout as the dotfiles) for the block."""
+    saved = {
+        name: value
+        for name, value in globals().items()
+        if isinstance(value, Path)
+        and name not in ("ROOT", "PALETTE_FILE", "PALETTES_DIR")
+        and value.is_relative_to(ROOT)
+    }
+    globals().update({name: root / value.relative_to(ROOT) for name, value in saved.items()})
+    try:
+        yield
+    finally:
+        globals().update(saved)
+
+
+def build_host_tree(palette: dict, targets, root: Path) -> list[Path]:
+    with output_tree(root):
+        result = build(palette, targets)
+    return [path for paths in result.written.values() for path in paths]
+
+
+def build_all_hosts(palette: dict, root: Path = HOST_TREES_DIR) -> dict[str, list[Path]]:
+    """Render host-dependent targets for every [hosts.<name>] into root/<name>.
+
+    palette must not have a host override applied. A target is host-dependent
+    when its key (see target_keys) differs between any of the hosts' palettes,
+    so host-independent outputs are only the shared ones built by main(). The
+    default-variant outputs (ranger rc.conf, the Neovim palette and index) are
+    targets of their own for this reason. Hosts render in parallel through
+    render_all.
+    """
+    hosts = sorted(palette.get("hosts") or {})
+    palettes = {host: apply_host_override(dict(palette), host) for host in hosts}
+    keys = [target_keys(scoped_palettes(data)) for data in [palette, *palettes.values()]]
+    dependent = tuple(target for target in BUILD_TARGETS if len({key[target] for key in keys}) > 1)
+    if not dependent:
+        return {host: [] for host in hosts}
+    jobs = [(build_host_tree, (palettes[host], dependent, root / host)) for host in hosts]
+    return dict(zip(hosts, render_all(jobs, min_jobs=2)))
+
+
+class FragmentCache:
+    """Parsed palette sources kept in memory between --watch rebuilds."""
+
+    def __init__(self):
+        self.entries: dict = {}
+
+    def load(self) -> tuple[dict, list[Path]]:
+        """Return parsed TOML per source and the sources that had to be re-parsed."""
+        entries = {}
+        reparsed = []
+        for path in palette_sources():
+            stat = path.stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            cached = self.entries.get(path)
+            if cached and cached[0] == stamp:
+                entries[path] = cached
+            else:
+                try:
+                    entries[path] = (stamp, _load_toml(path))
+                except ValueError as exc:  # tomllib.TOMLDecodeError
+                    raise PaletteError(f"{path}: {exc}") from exc
+                reparsed.append(path)
+        self.entries = entries
+        return {path: data for path, (_, data) in entries.items()}, reparsed
+
+
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+
+
+def _inotify_fd(directories: list[Path]) -> int | None:
+    """An inotify descriptor watching directories, or None where inotify is unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    mask = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+    for directory in directories:
+        if libc.inotify_add_watch(fd, str(directory).encode(), mask) < 0:
+            os.close(fd)
+            return None
+    return fd
+
+
+def _palette_stamp() -> list | None:
+    try:
+        return _palette_cache_key()
+    except OSError:  # a fragment vanished mid-scan (editor save); look again shortly
+        return None
+
+
+def wait_for_palette_change(stamp: list, fd: int | None) -> list:
+    """Block until the palette sources differ from stamp and have settled; return the new stamp."""
+    while True:
+        if fd is not None:
+            select.select([fd], [], [])
+            os.read(fd, 65536)
+            # Absorb the rest of the burst (editors write, rename and chmod)
+            while select.select([fd], [], [], WATCH_DEBOUNCE_SECONDS)[0]:
+                os.read(fd, 65536)
+            current = _palette_stamp()
+        else:
+            time.sleep(WATCH_POLL_INTERVAL)
+            current = _palette_stamp()
+            if current == stamp:
+                continue
+            while True:
+                time.sleep(WATCH_DEBOUNCE_SECONDS)
+                settled = _palette_stamp()
+                if settled == current:
+                    break
+                current = settled
+        if current is not None and current != stamp:
+            return current
 
-    if variants:
-        default_variant = palette.get("default_variant") or next(iter(variants))
-        default_scheme = ranger_scheme_name(default_variant, variants[default_variant])
-        rc_content = render_ranger_rc(default_scheme, default_variant)
-        if write_if_changed(RANGER_RC_FILE, rc_content):
-            changed = True
 
-    return changed
+def watch(manifest: BuildManifest, targets=BUILD_TARGETS) -> int:
+    """Rebuild whenever palette.toml or palettes/ change, until interrupted."""
+    fragments = FragmentCache()
+    directories = [PALETTE_FILE.parent] + ([PALETTES_DIR] if PALETTES_DIR.exists() else [])
+    fd = _inotify_fd(directories)
+    mode = "inotify" if fd is not None else f"polling every {WATCH_POLL_INTERVAL}s"
+    print(f"Watching {', '.join(str(d) for d in directories)} ({mode}); Ctrl-C to stop", flush=True)
 
+    stamp = _palette_stamp()
+    try:
+        while True:
+            started = time.monotonic()
+            try:
+                parsed, reparsed = fragments.load()
+                palette = apply_host_override(compile_palette(parsed))
+                result = build(palette, targets, manifest)
+            except (PaletteError, OSError, ValueError) as exc:
+                print(f"error: {exc}", file=sys.stderr, flush=True)
+            else:
+                if result.changed:
+                    publish_generation()
+                written = [path.name for paths in result.written.values() for path in paths]
+                elapsed_ms = (time.monotonic() - started) * 1000
+                print(
+                    f"[{time.strftime('%H:%M:%S')}] parsed {len(reparsed)} source(s), "
+                    f"wrote {len(written)} file(s) in {elapsed_ms:.0f} ms"
+                    + (f": {', '.join(written)}" if written else ""),
+                    flush=True,
+                )
+            stamp = wait_for_palette_change(stamp, fd)
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        if fd is not None:
+            os.close(fd)
 
-def main() -> int:
+
+def audit(thresholds: dict) -> int:
+    """Print contrast failures across all variants; non-zero exit when there are any."""
     try:
-        palette = apply_host_override(load_palette())
+        variants = load_palette()["variants"]
     except PaletteError as exc:
         print(f"error: {exc}", file=sys.stderr)
         return 1
 
-    changed = False
-    changed |= write_ghostty_palettes(palette["variants"], palette.get("families", {}))
-    nvim_palette, wallpaper_palette = split_wallpaper_palette(palette)
-    changed |= write_nvim_palette(nvim_palette)
-    changed |= write_nvim_wallpaper_palette(wallpaper_palette)
-    changed |= write_nvim_colorscheme(nvim_palette)
-    changed |= write_ranger_configs(palette)
+    checked, failures = audit_contrast(variants, thresholds)
+    for name, text, bg, ratio, minimum in failures:
+        print(f"{name}: {text} on {bg} {ratio:.2f}:1 (min {minimum:g}:1)")
+    print(f"audit: {len(failures)} of {checked} pair(s) below threshold across {len(variants)} variant(s)")
+    return 1 if failures else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate color artifacts from the palette.")
+    parser.add_argument("--force", action="store_true", help="Ignore the build manifest and re-render everything")
+    parser.add_argument("--watch", action="store_true", help="Rebuild incrementally whenever the palette changes")
+    parser.add_argument("--audit", action="store_true", help="Check WCAG contrast of every variant instead of building")
+    parser.add_argument(
+        "--min-contrast",
+        action="append",
+        default=[],
+        metavar="KIND=RATIO",
+        help=f"Override an --audit threshold ({', '.join(f'{k}={v}' for k, v in AUDIT_THRESHOLDS.items())})",
+    )
+    parser.add_argument(
+        "--all-hosts",
+        action="store_true",
+        help=f"Also render host-dependent outputs for every [hosts.<name>] into {HOST_TREES_DIR}/<name>",
+    )
+    parser.add_argument(
+        "--only",
+        metavar="TARGETS",
+        help=f"Comma-separated targets or groups to build (e.g. ghostty,nvim); default: all of {', '.join(BUILD_TARGETS)}",
+    )
+    args = parser.parse_args()
+
+    targets = BUILD_TARGETS
+    if args.only:
+        try:
+            targets = resolve_targets(name.strip() for name in args.only.split(",") if name.strip())
+        except PaletteError as exc:
+            parser.error(str(exc))
+
+    if args.audit:
+        thresholds = dict(AUDIT_THRESHOLDS)
+        for override in args.min_contrast:
+            kind, _, ratio = override.partition("=")
+            if kind not in thresholds:
+                parser.error(f"Unknown contrast kind: {kind} (expected one of {', '.join(thresholds)})")
+            try:
+                thresholds[kind] = float(ratio)
+            except ValueError:
+                parser.error(f"Invalid contrast ratio for {kind}: {ratio!r}")
+        return audit(thresholds)
+
+    manifest = BuildManifest()
+    if args.force:
+        manifest.outputs = {}
+        manifest.targets = {}
+    if args.watch:
+        return watch(manifest, targets)
+    manifest.observe_inputs()
+    if manifest.up_to_date() and not args.all_hosts:
+        print(BuildResult({target: [] for target in targets}).summary())
+        return 0
+
+    try:
+        palette = load_palette()
+        result = build(apply_host_override(dict(palette)), targets, manifest)
+        host_trees = build_all_hosts(palette) if args.all_hosts else {}
+    except PaletteError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
 
-    print(f"changed={'true' if changed else 'false'}")
+    if result.changed:
+        publish_generation()
+    print(result.summary())
+    for host, written in host_trees.items():
+        print(f"changed.host.{host}={'true' if written else 'false'}")
     return 0
 
 
@@ -5,11 +5,65 @@ import cv2
 import numpy as np
 import subprocess
 import shutil
+from functools import cached_property
 from pathlib import Path
 from PIL import Image
 import colorsys
 
 
+ANALYSIS_SIZE = (256, 256)
+TILE_MAX_SIZE = 512
+UPSCALE_SIZE = (3840, 2160)
+
+
+class WallpaperSource:
+    """
+    A wallpaper image decoded once and shared by every wallpaper stage.
+
+    Construction reads only the header. The first stage that needs pixels
+    decodes the file at full resolution; the analysis thumbnail is reduced
+    from that raster and cached alongside it.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with Image.open(self.path) as img:
+            self.size = img.size
+
+    @property
+    def tiled(self) -> bool:
+        """Whether the image is a small pattern to tile rather than scale."""
+        width, height = self.size
+        return width < TILE_MAX_SIZE or height < TILE_MAX_SIZE
+
+    @property
+    def covers_4k(self) -> bool:
+        """Whether the image already fills UPSCALE_SIZE."""
+        width, height = self.size
+        return width >= UPSCALE_SIZE[0] and height >= UPSCALE_SIZE[1]
+
+    @cached_property
+    def raster(self) -> Image.Image:
+        """Full-resolution image, in the file's own mode."""
+        img = Image.open(self.path)
+        img.load()
+        return img
+
+    @cached_property
+    def thumbnail(self) -> Image.Image:
+        """RGBA analysis copy no larger than ANALYSIS_SIZE."""
+        img = self.raster.convert("RGBA")
+        img.thumbnail(ANALYSIS_SIZE, Image.Resampling.LANCZOS)
+        return img
+
+
+def wallpaper_source(image) -> WallpaperSource:
+    """Return image as a WallpaperSource, opening it if given a path."""
+    if isinstance(image, WallpaperSource):
+        return image
+    return WallpaperSource(image)
+
+
 def _relative_luminance(rgb: tuple) -> float:
     """Return WCAG relative luminance for an sRGB color."""
     def to_linear(channel: float) -> float:
@@ -45,12 +99,9 @@ def _color_entry(rgb: tuple, proportion: float, index: int) -> dict:
     }
 
 
-def _extract_kmeans_colors(image_path: Path, k: int = 12) -> list:
+def _extract_kmeans_colors(source: WallpaperSource, k: int = 12) -> list:
     """Extract dominant colors via k-means clustering."""
-    with Image.open(image_path) as img:
-        img = img.convert("RGBA")
-        img.thumbnail((256, 256), Image.Resampling.LANCZOS)
-        pixels = np.array(img)
+    pixels = np.array(source.thumbnail)
 
     if pixels.ndim != 3 or pixels.shape[2] < 3:
         raise ValueError("Unsupported image format for palette extraction")
@@ -92,21 +143,21 @@ def _extract_kmeans_colors(image_path: Path, k: int = 12) -> list:
     return color_data
 
 
-def _extract_colors_from_colorgram(image_path: Path, count: int = 32) -> list:
+def _extract_colors_from_colorgram(source: WallpaperSource, count: int = 32) -> list:
     """Fallback palette extraction using colorgram."""
-    colors = colorgram.extract(str(image_path), count)
+    colors = colorgram.extract(source.raster, count)
     return [
         _color_entry((color.rgb.r, color.rgb.g, color.rgb.b), color.proportion, idx)
         for idx, color in enumerate(colors)
     ]
 
 
-def _extract_image_colors(image_path: Path) -> list:
+def _extract_image_colors(source: WallpaperSource) -> list:
     """Extract palette from an image with a k-means primary and colorgram fallback."""
     try:
-        return _extract_kmeans_colors(image_path)
+        return _extract_kmeans_colors(source)
     except Exception:
-        return _extract_colors_from_colorgram(image_path)
+        return _extract_colors_from_colorgram(source)
 
 
 def extract_dominant_hue(image_path: Path) -> float:
@@ -272,79 +323,73 @@ def set_wallpaper(image_path: Path, tile: bool = False):
     # Users should configure tiling manually if needed
 
 
-def should_tile(image_path: Path) -> bool:
+def should_tile(image) -> bool:
     """
     Determine if image should be tiled based on dimensions.
 
     Args:
-        image_path: Path to image file
+        image: WallpaperSource or path to image file
 
     Returns:
         True if image should be tiled (small pattern)
     """
     try:
-        with Image.open(image_path) as img:
-            width, height = img.size
-            return width < 512 or height < 512
+        return wallpaper_source(image).tiled
     except Exception:
         return False
 
 
-def upscale_to_4k(input_path: Path, output_path: Path) -> Path:
+def upscale_to_4k(image, output_path: Path) -> Path:
     """
     Upscale image to 4K (3840x2160) if smaller, preserving aspect ratio.
 
     Args:
-        input_path: Source image path
+        image: WallpaperSource or path to source image
         output_path: Destination path for upscaled image
 
     Returns:
         Path to output image (same as output_path)
     """
-    TARGET_WIDTH = 3840
-    TARGET_HEIGHT = 2160
-
-    with Image.open(input_path) as img:
-        width, height = img.size
+    source = wallpaper_source(image)
 
-        # Check if already 4K or larger
-        if width >= TARGET_WIDTH and height >= TARGET_HEIGHT:
-            # Just copy the file
-            if input_path != output_path:
-                import shutil
-                shutil.copy2(input_path, output_path)
-            return output_path
+    # Check if already 4K or larger
+    if source.covers_4k:
+        # Just copy the file
+        if source.path != output_path:
+            shutil.copy2(source.path, output_path)
+        return output_path
 
-        # Calculate scaling to fill 4K
-        scale_w = TARGET_WIDTH / width
-        scale_h = TARGET_HEIGHT / height
-        scale = max(scale_w, scale_h)
+    # Calculate scaling to fill 4K
+    width, height = source.size
+    scale_w = UPSCALE_SIZE[0] / width
+    scale_h = UPSCALE_SIZE[1] / height
+    scale = max(scale_w, scale_h)
 
-        new_width = int(width * scale)
-        new_height = int(height * scale)
+    new_width = int(width * scale)
+    new_height = int(height * scale)
 
-        # Upscale using high-quality Lanczos resampling
-        upscaled = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+    # Upscale using high-quality Lanczos resampling
+    upscaled = source.raster.resize((new_width, new_height), Image.Resampling.LANCZOS)
 
-        # Save as PNG for quality
-        upscaled.save(output_path, "PNG")
+    # Save as PNG for quality
+    upscaled.save(output_path, "PNG")
 
     return output_path
 
 
-def extract_color_palette(image_path: Path, variant_light: str = None, variant_dark: str = None) -> dict:
+def extract_color_palette(image, variant_light: str = None, variant_dark: str = None) -> dict:
     """
     Extract color palette from image and map to ANSI colors.
 
     Args:
-        image_path: Path to image file
+        image: WallpaperSource or path to image file
         variant_light: Name of light variant (for extended palette)
         variant_dark: Name of dark variant (for extended palette)
 
     Returns:
         Dictionary with 'light_toml', 'dark_toml', 'light_extended', 'dark_extended' keys
     """
-    color_data = _extract_image_colors(image_path)
+    color_data = _extract_image_colors(wallpaper_source(image))
 
     if not color_data:
         raise ValueError("No usable colors found in image")
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Tests for colors/build.py: the build manifest, palette cache and renderers.
+
+Each test builds a small synthetic palette (see bench_build.py) into a
+temporary tree, never the dotfiles.
+"""
+
+import concurrent.futures
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+CONFIG_DIR = Path(__file__).resolve().parent.parent / ".config" / "colors"
+sys.path.insert(0, str(CONFIG_DIR))
+
+import bench_build
+import build
+
+
+class BuildTreeTestCase(unittest.TestCase):
+    """Points build.py's inputs, outputs and caches at a fresh temporary tree."""
+
+    SIZE = 6
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self._saved = {name: value for name, value in vars(build).items() if isinstance(value, Path)}
+        # Dotfiles under root/dotfiles; caches beside it, outside build.ROOT as in ~/.cache
+        build.ROOT = self.root / "dotfiles"
+        bench_build.redirect_build(build.ROOT)
+        cache = self.root / "cache"
+        build.PALETTE_CACHE_FILE = cache / "palette.pickle"
+        build.BUILD_MANIFEST_FILE = cache / "build_manifest.json"
+        build.FRAGMENT_INDEX_FILE = cache / "fragment_index.json"
+        build.HOST_TREES_DIR = cache / "hosts"
+        build.GENERATION_FILE = self.root / "state" / "generation"
+        bench_build.synthetic_palette(build.PALETTE_FILE.parent, self.SIZE)
+        self.manifest_path = build.BUILD_MANIFEST_FILE
+
+    def tearDown(self):
+        for name, value in self._saved.items():
+            setattr(build, name, value)
+        self._tmp.cleanup()
+
+    def fragment(self, index: int = 0) -> Path:
+        return build.PALETTES_DIR / f"synthetic_{index:03d}.toml"
+
+    def manifest_build(self, palette=None, targets=None):
+        """Build with a manifest loaded from disk, as separate build.py runs do."""
+        palette = palette or build.load_palette()
+        return build.build(palette, targets, build.BuildManifest(self.manifest_path))
+
+
+class TestBuildManifest(BuildTreeTestCase):
+    """Tests for skipping unchanged targets and outputs via the manifest."""
+
+    def test_second_build_changes_nothing(self):
+        """Rebuilding unchanged inputs writes nothing."""
+        self.assertTrue(self.manifest_build().changed)
+        second = self.manifest_build()
+        self.assertFalse(second.changed)
+        self.assertEqual(set(second.written), set(build.BUILD_TARGETS))
+
+    def test_edited_fragment_rebuilds(self):
+        """Changing a color in a fragment rebuilds the outputs that use it."""
+        self.manifest_build()
+        text = self.fragment().read_text()
+        background = text.split("background = '", 1)[1][:7]
+        self.fragment().write_text(text.replace(background, "#123456", 1))
+        result = self.manifest_build()
+        self.assertTrue(result.written["ghostty"])
+        self.assertTrue(result.written["nvim_variants"])
+        self.assertFalse(result.written["nvim_colorscheme"])
+
+    def test_touched_output_rebuilds(self):
+        """An output edited behind the manifest's back is rendered again."""
+        first = self.manifest_build()
+        theme = first.written["ghostty"][0]
+        original = theme.read_text()
+        theme.write_text("edited\n")
+        result = self.manifest_build()
+        self.assertEqual(result.written["ghostty"], [theme])
+        self.assertEqual(theme.read_text(), original)
+
+    def test_removed_variant_is_pruned(self):
+        """Modules of a variant that no longer exists are removed and forgotten."""
+        palette = build.load_palette()
+        self.manifest_build(palette)
+        removed = "synthetic_002_light"
+        module = build.NVIM_VARIANT_DIR / f"{removed}.lua"
+        self.assertTrue(module.exists())
+
+        palette = dict(palette, variants=dict(palette["variants"]))
+        del palette["variants"][removed]
+        result = self.manifest_build(palette)
+        self.assertIn(module, result.written["nvim_variants"])
+        self.assertFalse(module.exists())
+        self.assertNotIn(str(module), build.BuildManifest(self.manifest_path).outputs)
+
+
+class TestPaletteCache(BuildTreeTestCase):
+    """Tests for the compiled palette cache keyed on source stamps."""
+
+    def test_unchanged_sources_reuse_cache(self):
+        """A second load does not recompile."""
+        first = build.load_palette()
+        with patch.object(build, "compile_palette") as compile_palette:
+            self.assertEqual(build.load_palette(), first)
+        compile_palette.assert_not_called()
+
+    def test_touched_fragment_recompiles(self):
+        """A fragment with a new mtime invalidates the cache."""
+        build.load_palette()
+        stat = self.fragment().stat()
+        os.utime(self.fragment(), ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        with patch.object(build, "compile_palette", wraps=build.compile_palette) as compile_palette:
+            build.load_palette()
+        compile_palette.assert_called_once()
+
+    def test_changed_build_script_recompiles(self):
+        """The loader itself is part of the key, so editing build.py recompiles."""
+        script = self.root / "build.py"
+        shutil.copy(build.__file__, script)
+        with patch.object(build, "__file__", str(script)):
+            build.load_palette()
+            with script.open("a") as f:
+                f.write("\n# edited\n")
+            with patch.object(build, "compile_palette", wraps=build.compile_palette) as compile_palette:
+                build.load_palette()
+        compile_palette.assert_called_once()
+
+
+class TestLoadFamily(BuildTreeTestCase):
+    """Tests for loading one family through the fragment index."""
+
+    # Two fragments: families 000-004 in the first, 005-009 in the second
+    SIZE = 20
+
+    def family_subset(self, name: str) -> dict:
+        """The variants load_palette() gives family name."""
+        palette = build.load_palette()
+        return {variant: payload for variant, payload in palette["variants"].items() if payload["family"] == name}
+
+    def split_variant(self, index: int, variant: str) -> tuple[str, str]:
+        """A fragment's TOML without variant (and its subtables), and the variant's TOML."""
+        kept, taken = [], []
+        for section in toml_sections(self.fragment(index).read_text()):
+            header = section.split("]", 1)[0]
+            target = taken if header in (f"[variants.{variant}", f"[variants.{variant}.extended") else kept
+            target.append(section)
+        return "".join(kept), "".join(taken)
+
+    def take_variant(self, index: int, variant: str) -> str:
+        """Remove variant from a fragment in place, returning its TOML."""
+        kept, taken = self.split_variant(index, variant)
+        self.fragment(index).write_text(kept)
+        return taken
+
+    def append(self, index: int, text: str):
+        """Edit a fragment in place, leaving the palettes/ directory stamp alone."""
+        with self.fragment(index).open("a") as f:
+            f.write("\n" + text)
+
+    def test_matches_full_palette(self):
+        """Each family's variants are exactly those of the compiled palette."""
+        for name in build.family_names():
+            family = build.load_family(name)
+            self.assertEqual(family["variants"], self.family_subset(name))
+            self.assertEqual(list(family["families"]), [name])
+
+    def test_variant_added_to_unrelated_fragment(self):
+        """A variant appended to a fragment the index did not link to the family is found."""
+        build.load_family("synthetic_000")
+        _, block = self.split_variant(0, "synthetic_000_dark")
+        self.append(1, block.replace("synthetic_000_dark", "synthetic_000_extra"))
+        family = build.load_family("synthetic_000")
+        self.assertIn("synthetic_000_extra", family["variants"])
+        self.assertEqual(family["variants"], self.family_subset("synthetic_000"))
+
+    def test_variant_moved_between_fragments(self):
+        """A variant moved to another fragment is loaded from its new home."""
+        expected = self.family_subset("synthetic_000")
+        build.load_family("synthetic_000")
+        self.append(1, self.take_variant(0, "synthetic_000_dark"))
+        self.assertEqual(build.load_family("synthetic_000")["variants"], expected)
+
+    def test_stale_index_is_rebuilt(self):
+        """An index whose stamps still match but which names the wrong source is rebuilt."""
+        expected = self.family_subset("synthetic_000")
+        index = build.load_fragment_index()
+        index["variants"]["synthetic_000_dark"] = [[str(self.fragment(1)), "synthetic_000"]]
+        build.FRAGMENT_INDEX_FILE.write_text(json.dumps(index))
+        self.assertEqual(build.load_family("synthetic_000")["variants"], expected)
+
+    def test_conflicting_definition_is_rejected(self):
+        """A variant defined differently in two fragments fails as in compile_palette."""
+        block = self.take_variant(0, "synthetic_000_dark")
+        self.append(0, block)
+        self.append(1, block.replace("flavor = 'dark'", "flavor = 'light'"))
+        with self.assertRaisesRegex(build.PaletteError, "Variant synthetic_000_dark redefined"):
+            build.compile_palette()
+        with self.assertRaisesRegex(build.PaletteError, "Variant synthetic_000_dark redefined"):
+            build.load_family("synthetic_000")
+
+    def test_unknown_family_reference_is_rejected(self):
+        """A light/dark variant belonging to a missing family fails as in compile_palette."""
+        block = self.take_variant(0, "synthetic_000_dark")
+        self.append(0, block.replace("family = 'synthetic_000'", "family = 'missing'"))
+        with self.assertRaisesRegex(build.PaletteError, "references unknown family: missing"):
+            build.compile_palette()
+        with self.assertRaisesRegex(build.PaletteError, "references unknown family: missing"):
+            build.load_family("synthetic_000")
+
+
+class TestParallelRender(BuildTreeTestCase):
+    """Tests that the process pool in render_all matches serial rendering."""
+
+    def setUp(self):
+        super().setUp()
+        # One CPU here would keep render_all serial; pretend there are two
+        cpu_count = patch.object(build.os, "cpu_count", return_value=2)
+        cpu_count.start()
+        self.addCleanup(cpu_count.stop)
+
+    def ghostty_jobs(self) -> list:
+        palette = build.load_palette()
+        families = palette["families"]
+        return [
+            (build.render_ghostty_variant, (build.ghostty_theme_name(name, variant, families), name, variant, families))
+            for name, variant in palette["variants"].items()
+        ]
+
+    def test_pool_matches_serial(self):
+        """Forcing the pool (threshold 1) gives the serial results in job order."""
+        jobs = self.ghostty_jobs()
+        serial = build.render_all(jobs, min_jobs=len(jobs) + 1)
+        with patch.object(
+            concurrent.futures, "ProcessPoolExecutor", wraps=concurrent.futures.ProcessPoolExecutor
+        ) as pool:
+            parallel = build.render_all(jobs, min_jobs=1)
+        pool.assert_called_once()
+        self.assertEqual(parallel, serial)
+
+    def test_unavailable_pool_falls_back_to_serial(self):
+        """Without working multiprocessing the jobs still render, serially."""
+        jobs = self.ghostty_jobs()
+        serial = build.render_all(jobs, min_jobs=len(jobs) + 1)
+        with patch.object(concurrent.futures, "ProcessPoolExecutor", side_effect=OSError("no semaphores")):
+            self.assertEqual(build.render_all(jobs, min_jobs=1), serial)
+
+    def test_worker_errors_propagate(self):
+        """An exception raised in a worker reaches the caller."""
+        jobs = [(build.validate_variant, ("broken", "not a table"))] * 2
+        with self.assertRaisesRegex(build.PaletteError, "broken must be a table"):
+            build.render_all(jobs, min_jobs=1)
+
+    def test_parallel_build_writes_identical_tree(self):
+        """A full build through the pool writes byte-identical files."""
+        palette = build.load_palette()
+        serial = self.root / "serial"
+        with build.output_tree(serial):
+            build.build(palette)
+
+        render_all = build.render_all
+
+        def forced(jobs, min_jobs=1):
+            return render_all(jobs, 1)
+
+        with patch.object(build, "render_all", side_effect=forced), build.output_tree(self.root / "parallel"):
+            build.build(palette)
+        self.assertEqual(tree_contents(self.root / "parallel"), tree_contents(serial))
+
+
+class TestHostTrees(BuildTreeTestCase):
+    """Tests for output_tree and the per-host trees of build.py --all-hosts."""
+
+    def test_output_tree_restores_paths_after_error(self):
+        """Output paths point back at the dotfiles even when the block raises."""
+        before = {name: value for name, value in vars(build).items() if isinstance(value, Path)}
+        with self.assertRaises(build.PaletteError):
+            with build.output_tree(self.root / "elsewhere"):
+                self.assertNotEqual(build.GHOSTTY_THEME_DIR, before["GHOSTTY_THEME_DIR"])
+                raise build.PaletteError("boom")
+        after = {name: value for name, value in vars(build).items() if isinstance(value, Path)}
+        self.assertEqual(after, before)
+
+    def test_host_trees_match_single_host_builds(self):
+        """Each host tree holds exactly the host-dependent files of that host's own build."""
+        palette = build.load_palette()
+        palette = dict(
+            palette,
+            hosts={
+                "alpha": {"default_variant": "synthetic_001_dark"},
+                "beta": {"default_variant": "synthetic_002_light"},
+            },
+        )
+        hosts_root = self.root / "hosts"
+        # Two hosts are enough for render_all to use the process pool
+        with patch.object(build.os, "cpu_count", return_value=2):
+            written = build.build_all_hosts(palette, hosts_root)
+
+        for host in ("alpha", "beta"):
+            single = self.root / "single" / host
+            with build.output_tree(single):
+                build.build(build.apply_host_override(dict(palette), host))
+            host_files = tree_contents(hosts_root / host)
+            self.assertEqual(
+                sorted(host_files),
+                sorted(str(path.relative_to(hosts_root / host)) for path in written[host]),
+            )
+            self.assertEqual(
+                {Path(path).name for path in host_files}, {"index.lua", "palette.lua", "rc.conf"}
+            )
+            single_files = tree_contents(single)
+            for path, data in host_files.items():
+                self.assertEqual(data, single_files[path], path)
+
+
+class TestContrastAudit(unittest.TestCase):
+    """Tests for the WCAG contrast audit."""
+
+    VARIANTS = {
+        "readable": {
+            "foreground": "#000000",
+            "background": "#ffffff",
+            "selection_foreground": "#000000",
+            "selection_background": "#dddddd",
+            "ansi": ["#000000"] + ["#1a1a80"] * 6 + ["#ffffff"] * 2 + ["#4d0000"] * 6 + ["#ffffff"],
+        },
+        "washed_out": {
+            "foreground": "#777777",
+            "background": "#888888",
+            "selection_foreground": "#eeeeee",
+            "selection_background": "#ffffff",
+            "ansi": ["#888888"] * 16,
+        },
+        "partial": {
+            "foreground": "not a color",
+            "background": "#101010",
+            "selection_foreground": "#f0f0f0",
+            "selection_background": "#101010",
+            "ansi": ["#101010"] * 3,
+        },
+    }
+
+    def audit_without_numpy(self):
+        with patch.object(build, "numpy", None):
+            return build.audit_contrast(self.VARIANTS)
+
+    def test_failures_without_numpy(self):
+        """The pure-Python path flags low-contrast pairs and skips missing colors."""
+        checked, failures = self.audit_without_numpy()
+        failing = {(name, text) for name, text, *_ in failures}
+        self.assertFalse([failure for failure in failures if failure[0] == "readable"])
+        self.assertIn(("washed_out", "foreground"), failing)
+        self.assertIn(("washed_out", "ansi_1"), failing)
+        self.assertIn(("partial", "ansi_1"), failing)
+        self.assertNotIn(("partial", "foreground"), failing)
+        # readable and washed_out check every pair; partial only selection and ansi_1/ansi_2
+        self.assertEqual(checked, 2 * len(build.AUDIT_PAIRS) + 3)
+
+    @unittest.skipIf(build.numpy is None, "numpy not installed")
+    def test_numpy_matches_pure_python(self):
+        """The vectorized path reports the same pairs and ratios."""
+        checked, failures = build.audit_contrast(self.VARIANTS)
+        expected_checked, expected = self.audit_without_numpy()
+        self.assertEqual(checked, expected_checked)
+        self.assertEqual([failure[:3] for failure in failures], [failure[:3] for failure in expected])
+        for failure, reference in zip(failures, expected):
+            self.assertAlmostEqual(failure[3], reference[3], places=9)
+
+
+def toml_sections(text: str) -> list[str]:
+    """Split TOML text before each table header, keeping every line."""
+    sections = [""]
+    for line in text.splitlines(keepends=True):
+        if line.startswith("["):
+            sections.append("")
+        sections[-1] += line
+    return sections
+
+
+def tree_contents(root: Path) -> dict:
+    """Relative path -> bytes for every file under root."""
+    return {str(path.relative_to(root)): path.read_bytes() for path in root.rglob("*") if path.is_file()}
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Tests for the colorscheme CLI's chooser socket, reload deadline and appearance providers.
+"""
+
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+script_dir = Path(__file__).parent
+script_path = script_dir / "colorscheme"
+if not script_path.exists():
+    print(f"Error: Could not find colorscheme at {script_path}", file=sys.stderr)
+    sys.exit(1)
+
+# The script has no .py extension, so load it into a module by hand
+cs = types.ModuleType("colorscheme")
+cs.__file__ = str(script_path)
+with open(script_path, "r") as f:
+    exec(compile(f.read(), str(script_path), "exec"), cs.__dict__)
+sys.modules["colorscheme"] = cs
+
+
+def send_choice(path: str, line: str):
+    """Connect to a ChoiceListener socket and write one line, as hs.socket does."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(path)
+        client.sendall(line.encode() + b"\n")
+
+
+class StubAppearance(cs.AppearanceProvider):
+    """Appearance source that counts how often it is read."""
+
+    def __init__(self, value: str):
+        self.value = value
+        self.reads = 0
+
+    def read(self) -> str:
+        self.reads += 1
+        return self.value
+
+
+class TestChoiceListener(unittest.TestCase):
+    """Tests for the one-shot socket the Hammerspoon chooser reports to."""
+
+    def test_receives_written_choice(self):
+        """A line written by a client is returned by receive()."""
+        with cs.ChoiceListener(timeout=5.0) as listener:
+            client = threading.Thread(target=send_choice, args=(listener.path, "modus"))
+            client.start()
+            self.assertEqual(listener.receive(), "modus")
+            client.join()
+
+    def test_times_out_without_a_client(self):
+        """receive() gives up after the timeout when nobody connects."""
+        with cs.ChoiceListener(timeout=0.1) as listener:
+            self.assertIsNone(listener.receive())
+
+    def test_close_removes_socket_directory(self):
+        """Leaving the context removes the socket and its private directory."""
+        with cs.ChoiceListener(timeout=0.1) as listener:
+            self.assertTrue(os.path.exists(listener.path))
+        self.assertFalse(os.path.exists(listener.directory))
+
+
+class TestSwitchInteractive(unittest.TestCase):
+    """Tests for delivering the chooser pick to switch_interactive."""
+
+    def setUp(self):
+        self.manager = cs.ColorschemeManager.__new__(cs.ColorschemeManager)
+        self.manager.appearance = cs.CachedAppearance(StubAppearance("light"))
+        self.manager.state = {"family": "modus"}
+        self.manager.palette = {
+            "families": {"modus": {"light_variant": "modus_operandi", "dark_variant": "modus_vivendi"}},
+            "variants": {"modus_operandi": {"family": "modus", "flavor": "light"}},
+        }
+        self.listeners = []
+        self.scripts = []
+
+    def pick(self, line: str):
+        """Run switch_interactive with an hs stand-in that answers with line."""
+        listeners = self.listeners
+        scripts = self.scripts
+
+        class RecordingListener(cs.ChoiceListener):
+            def __init__(self):
+                super().__init__(timeout=5.0)
+                listeners.append(self)
+
+        def fake_hs(command, **kwargs):
+            scripts.append(command[-1])
+            send_choice(listeners[-1].path, line)
+
+        with patch.object(cs, "ChoiceListener", RecordingListener), \
+             patch.object(self.manager, "hs_path", return_value="hs"), \
+             patch.object(cs.subprocess, "run", side_effect=fake_hs), \
+             patch.object(self.manager, "switch_family") as switch_family:
+            self.manager.switch_interactive()
+        return switch_family
+
+    def test_pick_switches_family(self):
+        """The family written to the socket is switched to."""
+        switch_family = self.pick("modus")
+        switch_family.assert_called_once_with("modus")
+        self.assertFalse(os.path.exists(self.listeners[-1].directory))
+
+    def test_nothing_picked_does_not_switch(self):
+        """Dismissing the chooser sends NOTHING_PICKED and leaves the family alone."""
+        switch_family = self.pick(cs.NOTHING_PICKED)
+        switch_family.assert_not_called()
+        self.assertFalse(os.path.exists(self.listeners[-1].directory))
+
+    def test_chooser_is_rebuilt_each_time(self):
+        """Each run replaces the chooser, so one left by an older script is not reused."""
+        self.pick("modus")
+        script = self.scripts[-1]
+        self.assertIn("_G.colorschemeChooser:delete()", script)
+        self.assertIn("_G.colorschemeChooser = hs.chooser.new(", script)
+        self.assertNotIn("_G.colorschemeChooser == nil", script)
+        self.assertIn(self.listeners[-1].path, script)
+
+
+class TestRunReloads(unittest.TestCase):
+    """Tests for the shared deadline of the concurrent application reloads."""
+
+    def setUp(self):
+        self.manager = cs.ColorschemeManager.__new__(cs.ColorschemeManager)
+
+    def test_jobs_get_the_time_left(self):
+        """A job starting late is given what remains of the deadline, not all of it."""
+        timeouts = []
+        original_thread = threading.Thread
+
+        def late_thread(target, args, daemon):
+            def run():
+                time.sleep(0.2)
+                target(*args)
+            return original_thread(target=run, daemon=daemon)
+
+        def recording(timeout):
+            timeouts.append(timeout)
+            return "✓", "ok"
+
+        with patch.object(cs.threading, "Thread", side_effect=late_thread):
+            results = self.manager.run_reloads({"recording": recording}, deadline=5.0)
+        self.assertEqual(results["recording"][:2], ("✓", "ok"))
+        self.assertLessEqual(timeouts[0], 4.8)
+
+    def test_hung_subprocess_is_killed_at_deadline(self):
+        """A subprocess still running at the deadline is killed and reported as timed out."""
+        processes = []
+        original_popen = subprocess.Popen
+
+        def recording_popen(*args, **kwargs):
+            process = original_popen(*args, **kwargs)
+            processes.append(process)
+            return process
+
+        def hung(timeout):
+            subprocess.run(["sleep", "30"], timeout=timeout)
+            return "✓", "reloaded"
+
+        started = time.monotonic()
+        with patch.object(cs.subprocess, "Popen", side_effect=recording_popen):
+            results = self.manager.run_reloads({"hung": hung}, deadline=0.3)
+        self.assertLess(time.monotonic() - started, 5.0)
+        self.assertEqual(results["hung"][:2], ("⊘", "timeout"))
+        # subprocess.run kills it as its own timeout expires, around the deadline
+        self.assertEqual(processes[0].wait(timeout=5.0), -signal.SIGKILL)
+
+    def test_stuck_job_does_not_block(self):
+        """A job that ignores its timeout is reported as timed out on a daemon thread."""
+        release = threading.Event()
+        self.addCleanup(release.set)
+        threads = []
+        original_thread = threading.Thread
+
+        def recording_thread(*args, **kwargs):
+            thread = original_thread(*args, **kwargs)
+            threads.append(thread)
+            return thread
+
+        def stuck(timeout):
+            release.wait()
+            return "✓", "late"
+
+        with patch.object(cs.threading, "Thread", side_effect=recording_thread):
+            results = self.manager.run_reloads({"stuck": stuck, "quick": lambda timeout: ("✓", "ok")}, deadline=0.2)
+        self.assertEqual(results["stuck"], ("⊘", "timeout", 0.2))
+        self.assertEqual(results["quick"][:2], ("✓", "ok"))
+        self.assertTrue(all(thread.daemon for thread in threads))
+
+
+class TestAppearanceProviders(unittest.TestCase):
+    """Tests for reading and caching the light/dark appearance."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_provider_requires_read(self):
+        """AppearanceProvider is abstract until read() is implemented."""
+        with self.assertRaises(TypeError):
+            cs.AppearanceProvider()
+
+    def test_file_appearance(self):
+        """FileAppearance reads "dark"; anything else, or no file, is light."""
+        path = self.root / "appearance"
+        provider = cs.FileAppearance(path)
+        self.assertEqual(provider.appearance(), "light")
+        path.write_text("dark\n")
+        self.assertEqual(provider.appearance(), "dark")
+        path.write_text("sepia\n")
+        self.assertEqual(provider.appearance(), "light")
+
+    def test_appearance_file_env_selects_file_source(self):
+        """COLORSCHEME_APPEARANCE_FILE replaces the macOS defaults source."""
+        path = self.root / "appearance"
+        path.write_text("dark")
+        with patch.dict(os.environ, {cs.APPEARANCE_FILE_ENV: str(path)}):
+            source = cs.appearance_source()
+        self.assertIsInstance(source, cs.FileAppearance)
+        self.assertEqual(source.read(), "dark")
+
+    def test_cached_appearance_reads_once(self):
+        """CachedAppearance asks its source once per invocation."""
+        source = StubAppearance("dark")
+        cached = cs.CachedAppearance(source)
+        self.assertEqual([cached.appearance() for _ in range(3)], ["dark"] * 3)
+        self.assertEqual(source.reads, 1)
+
+    def test_watched_appearance_rereads_on_generation_change(self):
+        """WatchedAppearance re-reads only when the generation stamp changes."""
+        generation = self.root / "generation"
+        generation.write_text("1\n")
+        source = StubAppearance("light")
+        watched = cs.WatchedAppearance(source, interval=3600.0)
+        with patch.object(cs, "GENERATION_FILE", generation):
+            self.assertEqual(watched.appearance(), "light")
+            watched.appearance()
+            self.assertEqual(source.reads, 1)
+
+            source.value = "dark"
+            generation.write_text("22\n")
+            self.assertEqual(watched.appearance(), "dark")
+            self.assertEqual(source.reads, 2)
+
+    def test_watched_appearance_rereads_after_interval(self):
+        """Without a generation bump the interval bounds how stale it gets."""
+        source = StubAppearance("light")
+        watched = cs.WatchedAppearance(source, interval=0.0)
+        with patch.object(cs, "GENERATION_FILE", self.root / "missing"):
+            watched.appearance()
+            watched.appearance()
+        self.assertEqual(source.reads, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,7 +7,9 @@ local colors = {}
 -- Private state for change detection
 local lastAppearance = nil
 local lastStateMtime = 0
-local stateFile = os.getenv("HOME") .. "/.config/colorscheme/current"
+local stateDir = os.getenv("HOME") .. "/.config/colorscheme"
+local stateFile = stateDir .. "/current"
+local generationFile = stateDir .. "/generation"
 local colorsChangeListeners = {}
 
 -- System Colors
@@ -142,6 +144,25 @@ local function hasStateFileChanged()
     return false
 end
 
+-- Bump the generation counter that Neovim watches (same format as
+-- colors/build.py publish_generation: a single integer, replaced atomically)
+local function publishGeneration()
+    local generation = 0
+    local f = io.open(generationFile, "r")
+    if f then
+        generation = tonumber(f:read("*l")) or 0
+        f:close()
+    end
+    local tmpFile = generationFile .. ".hammerspoon.tmp"
+    f = io.open(tmpFile, "w")
+    if not f then
+        return
+    end
+    f:write(tostring(generation + 1) .. "\n")
+    f:close()
+    os.rename(tmpFile, generationFile)
+end
+
 local function notifyColorsChanged()
     for _, listener in ipairs(colorsChangeListeners) do
         local ok, err = pcall(listener)
@@ -179,10 +200,32 @@ if stat then
     lastStateMtime = stat.modification
 end
 
--- Set up timer to poll for changes every 3 seconds (matches Neovim)
-local colorTimer = hs.timer.new(3, checkAndUpdateColors)
+-- Appearance changes are pushed by macOS; publish them so Neovim follows immediately
+local appearanceWatcher = hs.distributednotifications.new(function()
+    -- Give the defaults database a moment to reflect the new appearance
+    hs.timer.doAfter(0.3, function()
+        local before = lastAppearance
+        checkAndUpdateColors()
+        if lastAppearance ~= before then
+            publishGeneration()
+        end
+    end)
+end, "AppleInterfaceThemeChangedNotification")
+appearanceWatcher:start()
+
+-- Family switches: the colorscheme CLI rewrites the state file and bumps the generation
+local stateWatcher = hs.pathwatcher.new(stateDir, function()
+    checkAndUpdateColors()
+end)
+stateWatcher:start()
+
+-- Slow safety net in case a notification is missed
+local colorTimer = hs.timer.new(60, checkAndUpdateColors)
 colorTimer:start()
 
+-- Keep watcher references alive (unreferenced watchers can be garbage collected)
+colors.watchers = { appearanceWatcher, stateWatcher, colorTimer }
+
 -- Export functions for external use
 colors.updateThemeColors = updateThemeColors
 colors.checkAndUpdateColors = checkAndUpdateColors
@@ -5,6219 +5,48 @@
 --   Catppuccin themes: MIT (see https://github.com/catppuccin/catppuccin/blob/main/LICENSE)
 -- Generated colorscheme file is GPL v3 as derivative work
 -- Neovim colorscheme entry point (loaded via :colorscheme phajas_palette)
-local palette = {
-  ["default_variant"] = "modus_operandi",
-  ["default_family"] = "modus",
-  ["variants"] = {
-    ["catppuccin_latte"] = {
-      ["family"] = "catppuccin",
-      ["flavor"] = "light",
-      ["foreground"] = "#4c4f69",
-      ["background"] = "#eff1f5",
-      ["cursor"] = "#4c4f69",
-      ["selection_background"] = "#8839ef",
-      ["selection_foreground"] = "#eff1f5",
-      ["ansi"] = {
-        "#5c5f77",
-        "#d20f39",
-        "#40a02b",
-        "#df8e1d",
-        "#1e66f5",
-        "#ea76cb",
-        "#179299",
-        "#acb0be",
-        "#6c6f85",
-        "#de293e",
-        "#49af3d",
-        "#eea02d",
-        "#456eff",
-        "#fe85d8",
-        "#2d9fa8",
-        "#bcc0cc",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#eff1f5",
-        ["bg_dim"] = "#e6e9ef",
-        ["bg_alt"] = "#dce0e8",
-        ["fg_main"] = "#4c4f69",
-        ["fg_dim"] = "#5c5f77",
-        ["fg_alt"] = "#6c6f85",
-        ["border"] = "#9ca0b0",
-        ["border_highlight"] = "#8c8fa1",
-        ["red"] = "#d20f39",
-        ["red_warmer"] = "#fe640b",
-        ["red_cooler"] = "#e64553",
-        ["red_faint"] = "#ea76cb",
-        ["green"] = "#40a02b",
-        ["green_warmer"] = "#40a02b",
-        ["green_cooler"] = "#179299",
-        ["green_faint"] = "#179299",
-        ["yellow"] = "#df8e1d",
-        ["yellow_warmer"] = "#fe640b",
-        ["yellow_cooler"] = "#df8e1d",
-        ["yellow_faint"] = "#df8e1d",
-        ["blue"] = "#1e66f5",
-        ["blue_warmer"] = "#7287fd",
-        ["blue_cooler"] = "#209fb5",
-        ["blue_faint"] = "#04a5e5",
-        ["magenta"] = "#8839ef",
-        ["magenta_warmer"] = "#ea76cb",
-        ["magenta_cooler"] = "#8839ef",
-        ["magenta_faint"] = "#ea76cb",
-        ["cyan"] = "#179299",
-        ["cyan_warmer"] = "#04a5e5",
-        ["cyan_cooler"] = "#209fb5",
-        ["cyan_faint"] = "#04a5e5",
-        ["rust"] = "#fe640b",
-        ["gold"] = "#df8e1d",
-        ["olive"] = "#40a02b",
-        ["slate"] = "#1e66f5",
-        ["indigo"] = "#8839ef",
-        ["maroon"] = "#e64553",
-        ["pink"] = "#ea76cb",
-        ["red_intense"] = "#d20f39",
-        ["green_intense"] = "#40a02b",
-        ["yellow_intense"] = "#df8e1d",
-        ["blue_intense"] = "#1e66f5",
-        ["magenta_intense"] = "#8839ef",
-        ["cyan_intense"] = "#179299",
-        ["bg_red_intense"] = "#dc8a78",
-        ["bg_green_intense"] = "#40a02b",
-        ["bg_yellow_intense"] = "#df8e1d",
-        ["bg_blue_intense"] = "#1e66f5",
-        ["bg_magenta_intense"] = "#8839ef",
-        ["bg_cyan_intense"] = "#04a5e5",
-        ["bg_red_subtle"] = "#dd7878",
-        ["bg_green_subtle"] = "#179299",
-        ["bg_yellow_subtle"] = "#fe640b",
-        ["bg_blue_subtle"] = "#7287fd",
-        ["bg_magenta_subtle"] = "#ea76cb",
-        ["bg_cyan_subtle"] = "#209fb5",
-        ["bg_red_nuanced"] = "#dd7878",
-        ["bg_green_nuanced"] = "#179299",
-        ["bg_yellow_nuanced"] = "#fe640b",
-        ["bg_blue_nuanced"] = "#7287fd",
-        ["bg_magenta_nuanced"] = "#ea76cb",
-        ["bg_cyan_nuanced"] = "#209fb5",
-        ["bg_active"] = "#ccd0da",
-        ["fg_active"] = "#4c4f69",
-        ["bg_inactive"] = "#bcc0cc",
-        ["fg_inactive"] = "#5c5f77",
-        ["bg_active_argument"] = "#ccd0da",
-        ["bg_active_value"] = "#ccd0da",
-        ["bg_completion"] = "#ccd0da",
-        ["bg_hl_line"] = "#e6e9ef",
-        ["bg_paren_match"] = "#04a5e5",
-        ["bg_paren_expression"] = "#8839ef",
-        ["bg_char_0"] = "#04a5e5",
-        ["bg_char_1"] = "#ea76cb",
-        ["bg_char_2"] = "#df8e1d",
-        ["bg_region"] = "#8839ef",
-        ["bg_status_line_active"] = "#dce0e8",
-        ["fg_status_line_active"] = "#4c4f69",
-        ["bg_status_line_inactive"] = "#e6e9ef",
-        ["fg_status_line_inactive"] = "#5c5f77",
-        ["bg_tab_bar"] = "#dce0e8",
-        ["bg_tab_current"] = "#eff1f5",
-        ["bg_tab_other"] = "#e6e9ef",
-        ["fg_tab_other"] = "#5c5f77",
-        ["bg_tab_alternate"] = "#8839ef",
-        ["bg_added"] = "#ccd0da",
-        ["bg_added_faint"] = "#eff1f5",
-        ["bg_added_refine"] = "#40a02b",
-        ["bg_added_fringe"] = "#40a02b",
-        ["fg_added"] = "#40a02b",
-        ["fg_added_intense"] = "#40a02b",
-        ["bg_changed"] = "#ccd0da",
-        ["bg_changed_faint"] = "#eff1f5",
-        ["bg_changed_refine"] = "#df8e1d",
-        ["bg_changed_fringe"] = "#df8e1d",
-        ["fg_changed"] = "#df8e1d",
-        ["fg_changed_intense"] = "#df8e1d",
-        ["bg_removed"] = "#ccd0da",
-        ["bg_removed_faint"] = "#eff1f5",
-        ["bg_removed_refine"] = "#d20f39",
-        ["bg_removed_fringe"] = "#d20f39",
-        ["fg_removed"] = "#d20f39",
-        ["fg_removed_intense"] = "#d20f39",
-        ["bg_diff_context"] = "#eff1f5",
-        ["tinted_bg_main"] = "#e6e9ef",
-        ["tinted_bg_dim"] = "#dce0e8",
-        ["tinted_border"] = "#9ca0b0",
-        ["tinted_border_highlight"] = "#8c8fa1",
-        ["tinted_bg_active"] = "#bcc0cc",
-        ["tinted_bg_inactive"] = "#ccd0da",
-        ["tinted_red_faint"] = "#dd7878",
-        ["tinted_bg_red_nuanced"] = "#e6e9ef",
-        ["tinted_bg_green_nuanced"] = "#e6e9ef",
-        ["tinted_bg_yellow_nuanced"] = "#e6e9ef",
-        ["tinted_bg_blue_nuanced"] = "#e6e9ef",
-        ["tinted_bg_magenta_nuanced"] = "#e6e9ef",
-        ["tinted_bg_cyan_nuanced"] = "#e6e9ef",
-        ["tinted_bg_completion"] = "#bcc0cc",
-        ["tinted_bg_hl_line"] = "#dce0e8",
-        ["tinted_bg_paren_match"] = "#04a5e5",
-        ["tinted_bg_status_line_active"] = "#dce0e8",
-        ["tinted_bg_status_line_inactive"] = "#e6e9ef",
-        ["tinted_bg_tab_bar"] = "#dce0e8",
-        ["tinted_bg_tab_current"] = "#e6e9ef",
-        ["tinted_bg_tab_other"] = "#bcc0cc",
-        ["tinted_bg_tab_alternate"] = "#8839ef",
-        ["tinted_bg_added"] = "#ccd0da",
-        ["tinted_bg_added_faint"] = "#e6e9ef",
-        ["tinted_bg_added_refine"] = "#40a02b",
-        ["tinted_bg_added_fringe"] = "#40a02b",
-        ["tinted_bg_changed_fringe"] = "#df8e1d",
-        ["tinted_bg_removed"] = "#ccd0da",
-        ["tinted_bg_removed_faint"] = "#e6e9ef",
-        ["tinted_bg_removed_refine"] = "#d20f39",
-        ["tinted_bg_removed_fringe"] = "#d20f39",
-        ["tinted_bg_diff_context"] = "#e6e9ef",
-        ["visual"] = "#8839ef",
-        ["link"] = "#1e66f5",
-        ["link_visited"] = "#8839ef",
-        ["link_symbolic"] = "#179299",
-        ["string"] = "#40a02b",
-        ["comment"] = "#8c8fa1",
-        ["constant"] = "#fe640b",
-        ["identifier"] = "#1e66f5",
-        ["keyword"] = "#8839ef",
-        ["type"] = "#df8e1d",
-        ["fnname"] = "#1e66f5",
-        ["variable"] = "#d20f39",
-        ["rainbow_0"] = "#d20f39",
-        ["rainbow_1"] = "#40a02b",
-        ["rainbow_2"] = "#df8e1d",
-        ["rainbow_3"] = "#1e66f5",
-        ["rainbow_4"] = "#8839ef",
-        ["rainbow_5"] = "#179299",
-        ["rainbow_6"] = "#ea76cb",
-        ["rainbow_7"] = "#fe640b",
-        ["prose_todo"] = "#d20f39",
-        ["prose_done"] = "#40a02b",
-        ["prose_tag"] = "#8839ef",
-        ["prose_table"] = "#1e66f5",
-        ["err"] = "#d20f39",
-        ["warning"] = "#df8e1d",
-        ["info"] = "#1e66f5",
-      },
-    },
-    ["catppuccin_frappe"] = {
-      ["family"] = "catppuccin",
-      ["flavor"] = "dark",
-      ["foreground"] = "#c6d0f5",
-      ["background"] = "#303446",
-      ["cursor"] = "#c6d0f5",
-      ["selection_background"] = "#ca9ee6",
-      ["selection_foreground"] = "#303446",
-      ["ansi"] = {
-        "#51576d",
-        "#e78284",
-        "#a6d189",
-        "#e5c890",
-        "#8caaee",
-        "#f4b8e4",
-        "#81c8be",
-        "#a5adce",
-        "#626880",
-        "#e67172",
-        "#8ec772",
-        "#d9ba73",
-        "#7b9ef0",
-        "#f2a4db",
-        "#5abfb5",
-        "#b5bfe2",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#303446",
-        ["bg_dim"] = "#292c3c",
-        ["bg_alt"] = "#232634",
-        ["fg_main"] = "#c6d0f5",
-        ["fg_dim"] = "#b5bfe2",
-        ["fg_alt"] = "#a5adce",
-        ["border"] = "#737994",
-        ["border_highlight"] = "#838ba7",
-        ["red"] = "#e78284",
-        ["red_warmer"] = "#ef9f76",
-        ["red_cooler"] = "#ea999c",
-        ["red_faint"] = "#f4b8e4",
-        ["green"] = "#a6d189",
-        ["green_warmer"] = "#a6d189",
-        ["green_cooler"] = "#81c8be",
-        ["green_faint"] = "#81c8be",
-        ["yellow"] = "#e5c890",
-        ["yellow_warmer"] = "#ef9f76",
-        ["yellow_cooler"] = "#e5c890",
-        ["yellow_faint"] = "#e5c890",
-        ["blue"] = "#8caaee",
-        ["blue_warmer"] = "#babbf1",
-        ["blue_cooler"] = "#85c1dc",
-        ["blue_faint"] = "#99d1db",
-        ["magenta"] = "#ca9ee6",
-        ["magenta_warmer"] = "#f4b8e4",
-        ["magenta_cooler"] = "#ca9ee6",
-        ["magenta_faint"] = "#f4b8e4",
-        ["cyan"] = "#81c8be",
-        ["cyan_warmer"] = "#99d1db",
-        ["cyan_cooler"] = "#85c1dc",
-        ["cyan_faint"] = "#99d1db",
-        ["rust"] = "#ef9f76",
-        ["gold"] = "#e5c890",
-        ["olive"] = "#a6d189",
-        ["slate"] = "#8caaee",
-        ["indigo"] = "#ca9ee6",
-        ["maroon"] = "#ea999c",
-        ["pink"] = "#f4b8e4",
-        ["red_intense"] = "#e78284",
-        ["green_intense"] = "#a6d189",
-        ["yellow_intense"] = "#e5c890",
-        ["blue_intense"] = "#8caaee",
-        ["magenta_intense"] = "#ca9ee6",
-        ["cyan_intense"] = "#81c8be",
-        ["bg_red_intense"] = "#f2d5cf",
-        ["bg_green_intense"] = "#a6d189",
-        ["bg_yellow_intense"] = "#e5c890",
-        ["bg_blue_intense"] = "#8caaee",
-        ["bg_magenta_intense"] = "#ca9ee6",
-        ["bg_cyan_intense"] = "#99d1db",
-        ["bg_red_subtle"] = "#eebebe",
-        ["bg_green_subtle"] = "#81c8be",
-        ["bg_yellow_subtle"] = "#ef9f76",
-        ["bg_blue_subtle"] = "#babbf1",
-        ["bg_magenta_subtle"] = "#f4b8e4",
-        ["bg_cyan_subtle"] = "#85c1dc",
-        ["bg_red_nuanced"] = "#eebebe",
-        ["bg_green_nuanced"] = "#81c8be",
-        ["bg_yellow_nuanced"] = "#ef9f76",
-        ["bg_blue_nuanced"] = "#babbf1",
-        ["bg_magenta_nuanced"] = "#f4b8e4",
-        ["bg_cyan_nuanced"] = "#85c1dc",
-        ["bg_active"] = "#414559",
-        ["fg_active"] = "#c6d0f5",
-        ["bg_inactive"] = "#51576d",
-        ["fg_inactive"] = "#b5bfe2",
-        ["bg_active_argument"] = "#414559",
-        ["bg_active_value"] = "#414559",
-        ["bg_completion"] = "#414559",
-        ["bg_hl_line"] = "#292c3c",
-        ["bg_paren_match"] = "#99d1db",
-        ["bg_paren_expression"] = "#ca9ee6",
-        ["bg_char_0"] = "#99d1db",
-        ["bg_char_1"] = "#f4b8e4",
-        ["bg_char_2"] = "#e5c890",
-        ["bg_region"] = "#ca9ee6",
-        ["bg_status_line_active"] = "#232634",
-        ["fg_status_line_active"] = "#c6d0f5",
-        ["bg_status_line_inactive"] = "#292c3c",
-        ["fg_status_line_inactive"] = "#b5bfe2",
-        ["bg_tab_bar"] = "#232634",
-        ["bg_tab_current"] = "#303446",
-        ["bg_tab_other"] = "#292c3c",
-        ["fg_tab_other"] = "#b5bfe2",
-        ["bg_tab_alternate"] = "#ca9ee6",
-        ["bg_added"] = "#414559",
-        ["bg_added_faint"] = "#303446",
-        ["bg_added_refine"] = "#a6d189",
-        ["bg_added_fringe"] = "#a6d189",
-        ["fg_added"] = "#a6d189",
-        ["fg_added_intense"] = "#a6d189",
-        ["bg_changed"] = "#414559",
-        ["bg_changed_faint"] = "#303446",
-        ["bg_changed_refine"] = "#e5c890",
-        ["bg_changed_fringe"] = "#e5c890",
-        ["fg_changed"] = "#e5c890",
-        ["fg_changed_intense"] = "#e5c890",
-        ["bg_removed"] = "#414559",
-        ["bg_removed_faint"] = "#303446",
-        ["bg_removed_refine"] = "#e78284",
-        ["bg_removed_fringe"] = "#e78284",
-        ["fg_removed"] = "#e78284",
-        ["fg_removed_intense"] = "#e78284",
-        ["bg_diff_context"] = "#303446",
-        ["tinted_bg_main"] = "#292c3c",
-        ["tinted_bg_dim"] = "#232634",
-        ["tinted_border"] = "#737994",
-        ["tinted_border_highlight"] = "#838ba7",
-        ["tinted_bg_active"] = "#51576d",
-        ["tinted_bg_inactive"] = "#414559",
-        ["tinted_red_faint"] = "#eebebe",
-        ["tinted_bg_red_nuanced"] = "#292c3c",
-        ["tinted_bg_green_nuanced"] = "#292c3c",
-        ["tinted_bg_yellow_nuanced"] = "#292c3c",
-        ["tinted_bg_blue_nuanced"] = "#292c3c",
-        ["tinted_bg_magenta_nuanced"] = "#292c3c",
-        ["tinted_bg_cyan_nuanced"] = "#292c3c",
-        ["tinted_bg_completion"] = "#51576d",
-        ["tinted_bg_hl_line"] = "#232634",
-        ["tinted_bg_paren_match"] = "#99d1db",
-        ["tinted_bg_status_line_active"] = "#232634",
-        ["tinted_bg_status_line_inactive"] = "#292c3c",
-        ["tinted_bg_tab_bar"] = "#232634",
-        ["tinted_bg_tab_current"] = "#292c3c",
-        ["tinted_bg_tab_other"] = "#51576d",
-        ["tinted_bg_tab_alternate"] = "#ca9ee6",
-        ["tinted_bg_added"] = "#414559",
-        ["tinted_bg_added_faint"] = "#292c3c",
-        ["tinted_bg_added_refine"] = "#a6d189",
-        ["tinted_bg_added_fringe"] = "#a6d189",
-        ["tinted_bg_changed_fringe"] = "#e5c890",
-        ["tinted_bg_removed"] = "#414559",
-        ["tinted_bg_removed_faint"] = "#292c3c",
-        ["tinted_bg_removed_refine"] = "#e78284",
-        ["tinted_bg_removed_fringe"] = "#e78284",
-        ["tinted_bg_diff_context"] = "#292c3c",
-        ["visual"] = "#ca9ee6",
-        ["link"] = "#8caaee",
-        ["link_visited"] = "#ca9ee6",
-        ["link_symbolic"] = "#81c8be",
-        ["string"] = "#a6d189",
-        ["comment"] = "#838ba7",
-        ["constant"] = "#ef9f76",
-        ["identifier"] = "#8caaee",
-        ["keyword"] = "#ca9ee6",
-        ["type"] = "#e5c890",
-        ["fnname"] = "#8caaee",
-        ["variable"] = "#e78284",
-        ["rainbow_0"] = "#e78284",
-        ["rainbow_1"] = "#a6d189",
-        ["rainbow_2"] = "#e5c890",
-        ["rainbow_3"] = "#8caaee",
-        ["rainbow_4"] = "#ca9ee6",
-        ["rainbow_5"] = "#81c8be",
-        ["rainbow_6"] = "#f4b8e4",
-        ["rainbow_7"] = "#ef9f76",
-        ["prose_todo"] = "#e78284",
-        ["prose_done"] = "#a6d189",
-        ["prose_tag"] = "#ca9ee6",
-        ["prose_table"] = "#8caaee",
-        ["err"] = "#e78284",
-        ["warning"] = "#e5c890",
-        ["info"] = "#8caaee",
-      },
-    },
-    ["catppuccin_latte_macchiato"] = {
-      ["family"] = "catppuccin_macchiato",
-      ["flavor"] = "light",
-      ["foreground"] = "#4c4f69",
-      ["background"] = "#eff1f5",
-      ["cursor"] = "#4c4f69",
-      ["selection_background"] = "#8839ef",
-      ["selection_foreground"] = "#eff1f5",
-      ["ansi"] = {
-        "#5c5f77",
-        "#d20f39",
-        "#40a02b",
-        "#df8e1d",
-        "#1e66f5",
-        "#ea76cb",
-        "#179299",
-        "#acb0be",
-        "#6c6f85",
-        "#de293e",
-        "#49af3d",
-        "#eea02d",
-        "#456eff",
-        "#fe85d8",
-        "#2d9fa8",
-        "#bcc0cc",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#eff1f5",
-        ["bg_dim"] = "#e6e9ef",
-        ["bg_alt"] = "#dce0e8",
-        ["fg_main"] = "#4c4f69",
-        ["fg_dim"] = "#5c5f77",
-        ["fg_alt"] = "#6c6f85",
-        ["border"] = "#9ca0b0",
-        ["border_highlight"] = "#8c8fa1",
-        ["red"] = "#d20f39",
-        ["red_warmer"] = "#fe640b",
-        ["red_cooler"] = "#e64553",
-        ["red_faint"] = "#ea76cb",
-        ["green"] = "#40a02b",
-        ["green_warmer"] = "#40a02b",
-        ["green_cooler"] = "#179299",
-        ["green_faint"] = "#179299",
-        ["yellow"] = "#df8e1d",
-        ["yellow_warmer"] = "#fe640b",
-        ["yellow_cooler"] = "#df8e1d",
-        ["yellow_faint"] = "#df8e1d",
-        ["blue"] = "#1e66f5",
-        ["blue_warmer"] = "#7287fd",
-        ["blue_cooler"] = "#209fb5",
-        ["blue_faint"] = "#04a5e5",
-        ["magenta"] = "#8839ef",
-        ["magenta_warmer"] = "#ea76cb",
-        ["magenta_cooler"] = "#8839ef",
-        ["magenta_faint"] = "#ea76cb",
-        ["cyan"] = "#179299",
-        ["cyan_warmer"] = "#04a5e5",
-        ["cyan_cooler"] = "#209fb5",
-        ["cyan_faint"] = "#04a5e5",
-        ["rust"] = "#fe640b",
-        ["gold"] = "#df8e1d",
-        ["olive"] = "#40a02b",
-        ["slate"] = "#1e66f5",
-        ["indigo"] = "#8839ef",
-        ["maroon"] = "#e64553",
-        ["pink"] = "#ea76cb",
-        ["red_intense"] = "#d20f39",
-        ["green_intense"] = "#40a02b",
-        ["yellow_intense"] = "#df8e1d",
-        ["blue_intense"] = "#1e66f5",
-        ["magenta_intense"] = "#8839ef",
-        ["cyan_intense"] = "#179299",
-        ["bg_red_intense"] = "#dc8a78",
-        ["bg_green_intense"] = "#40a02b",
-        ["bg_yellow_intense"] = "#df8e1d",
-        ["bg_blue_intense"] = "#1e66f5",
-        ["bg_magenta_intense"] = "#8839ef",
-        ["bg_cyan_intense"] = "#04a5e5",
-        ["bg_red_subtle"] = "#dd7878",
-        ["bg_green_subtle"] = "#179299",
-        ["bg_yellow_subtle"] = "#fe640b",
-        ["bg_blue_subtle"] = "#7287fd",
-        ["bg_magenta_subtle"] = "#ea76cb",
-        ["bg_cyan_subtle"] = "#209fb5",
-        ["bg_red_nuanced"] = "#dd7878",
-        ["bg_green_nuanced"] = "#179299",
-        ["bg_yellow_nuanced"] = "#fe640b",
-        ["bg_blue_nuanced"] = "#7287fd",
-        ["bg_magenta_nuanced"] = "#ea76cb",
-        ["bg_cyan_nuanced"] = "#209fb5",
-        ["bg_active"] = "#ccd0da",
-        ["fg_active"] = "#4c4f69",
-        ["bg_inactive"] = "#bcc0cc",
-        ["fg_inactive"] = "#5c5f77",
-        ["bg_active_argument"] = "#ccd0da",
-        ["bg_active_value"] = "#ccd0da",
-        ["bg_completion"] = "#ccd0da",
-        ["bg_hl_line"] = "#e6e9ef",
-        ["bg_paren_match"] = "#04a5e5",
-        ["bg_paren_expression"] = "#8839ef",
-        ["bg_char_0"] = "#04a5e5",
-        ["bg_char_1"] = "#ea76cb",
-        ["bg_char_2"] = "#df8e1d",
-        ["bg_region"] = "#8839ef",
-        ["bg_status_line_active"] = "#dce0e8",
-        ["fg_status_line_active"] = "#4c4f69",
-        ["bg_status_line_inactive"] = "#e6e9ef",
-        ["fg_status_line_inactive"] = "#5c5f77",
-        ["bg_tab_bar"] = "#dce0e8",
-        ["bg_tab_current"] = "#eff1f5",
-        ["bg_tab_other"] = "#e6e9ef",
-        ["fg_tab_other"] = "#5c5f77",
-        ["bg_tab_alternate"] = "#8839ef",
-        ["bg_added"] = "#ccd0da",
-        ["bg_added_faint"] = "#eff1f5",
-        ["bg_added_refine"] = "#40a02b",
-        ["bg_added_fringe"] = "#40a02b",
-        ["fg_added"] = "#40a02b",
-        ["fg_added_intense"] = "#40a02b",
-        ["bg_changed"] = "#ccd0da",
-        ["bg_changed_faint"] = "#eff1f5",
-        ["bg_changed_refine"] = "#df8e1d",
-        ["bg_changed_fringe"] = "#df8e1d",
-        ["fg_changed"] = "#df8e1d",
-        ["fg_changed_intense"] = "#df8e1d",
-        ["bg_removed"] = "#ccd0da",
-        ["bg_removed_faint"] = "#eff1f5",
-        ["bg_removed_refine"] = "#d20f39",
-        ["bg_removed_fringe"] = "#d20f39",
-        ["fg_removed"] = "#d20f39",
-        ["fg_removed_intense"] = "#d20f39",
-        ["bg_diff_context"] = "#eff1f5",
-        ["tinted_bg_main"] = "#e6e9ef",
-        ["tinted_bg_dim"] = "#dce0e8",
-        ["tinted_border"] = "#9ca0b0",
-        ["tinted_border_highlight"] = "#8c8fa1",
-        ["tinted_bg_active"] = "#bcc0cc",
-        ["tinted_bg_inactive"] = "#ccd0da",
-        ["tinted_red_faint"] = "#dd7878",
-        ["tinted_bg_red_nuanced"] = "#e6e9ef",
-        ["tinted_bg_green_nuanced"] = "#e6e9ef",
-        ["tinted_bg_yellow_nuanced"] = "#e6e9ef",
-        ["tinted_bg_blue_nuanced"] = "#e6e9ef",
-        ["tinted_bg_magenta_nuanced"] = "#e6e9ef",
-        ["tinted_bg_cyan_nuanced"] = "#e6e9ef",
-        ["tinted_bg_completion"] = "#bcc0cc",
-        ["tinted_bg_hl_line"] = "#dce0e8",
-        ["tinted_bg_paren_match"] = "#04a5e5",
-        ["tinted_bg_status_line_active"] = "#dce0e8",
-        ["tinted_bg_status_line_inactive"] = "#e6e9ef",
-        ["tinted_bg_tab_bar"] = "#dce0e8",
-        ["tinted_bg_tab_current"] = "#e6e9ef",
-        ["tinted_bg_tab_other"] = "#bcc0cc",
-        ["tinted_bg_tab_alternate"] = "#8839ef",
-        ["tinted_bg_added"] = "#ccd0da",
-        ["tinted_bg_added_faint"] = "#e6e9ef",
-        ["tinted_bg_added_refine"] = "#40a02b",
-        ["tinted_bg_added_fringe"] = "#40a02b",
-        ["tinted_bg_changed_fringe"] = "#df8e1d",
-        ["tinted_bg_removed"] = "#ccd0da",
-        ["tinted_bg_removed_faint"] = "#e6e9ef",
-        ["tinted_bg_removed_refine"] = "#d20f39",
-        ["tinted_bg_removed_fringe"] = "#d20f39",
-        ["tinted_bg_diff_context"] = "#e6e9ef",
-        ["visual"] = "#8839ef",
-        ["link"] = "#1e66f5",
-        ["link_visited"] = "#8839ef",
-        ["link_symbolic"] = "#179299",
-        ["string"] = "#40a02b",
-        ["comment"] = "#8c8fa1",
-        ["constant"] = "#fe640b",
-        ["identifier"] = "#1e66f5",
-        ["keyword"] = "#8839ef",
-        ["type"] = "#df8e1d",
-        ["fnname"] = "#1e66f5",
-        ["variable"] = "#d20f39",
-        ["rainbow_0"] = "#d20f39",
-        ["rainbow_1"] = "#40a02b",
-        ["rainbow_2"] = "#df8e1d",
-        ["rainbow_3"] = "#1e66f5",
-        ["rainbow_4"] = "#8839ef",
-        ["rainbow_5"] = "#179299",
-        ["rainbow_6"] = "#ea76cb",
-        ["rainbow_7"] = "#fe640b",
-        ["prose_todo"] = "#d20f39",
-        ["prose_done"] = "#40a02b",
-        ["prose_tag"] = "#8839ef",
-        ["prose_table"] = "#1e66f5",
-        ["err"] = "#d20f39",
-        ["warning"] = "#df8e1d",
-        ["info"] = "#1e66f5",
-      },
-    },
-    ["catppuccin_macchiato"] = {
-      ["family"] = "catppuccin_macchiato",
-      ["flavor"] = "dark",
-      ["foreground"] = "#cad3f5",
-      ["background"] = "#24273a",
-      ["cursor"] = "#cad3f5",
-      ["selection_background"] = "#c6a0f6",
-      ["selection_foreground"] = "#24273a",
-      ["ansi"] = {
-        "#494d64",
-        "#ed8796",
-        "#a6da95",
-        "#eed49f",
-        "#8aadf4",
-        "#f5bde6",
-        "#8bd5ca",
-        "#a5adcb",
-        "#5b6078",
-        "#ec7486",
-        "#8ccf7f",
-        "#e1c682",
-        "#78a1f6",
-        "#f2a9dd",
-        "#63cbc0",
-        "#b8c0e0",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#24273a",
-        ["bg_dim"] = "#1e2030",
-        ["bg_alt"] = "#181926",
-        ["fg_main"] = "#cad3f5",
-        ["fg_dim"] = "#b8c0e0",
-        ["fg_alt"] = "#a5adcb",
-        ["border"] = "#6e738d",
-        ["border_highlight"] = "#8087a2",
-        ["red"] = "#ed8796",
-        ["red_warmer"] = "#f5a97f",
-        ["red_cooler"] = "#ee99a0",
-        ["red_faint"] = "#f5bde6",
-        ["green"] = "#a6da95",
-        ["green_warmer"] = "#a6da95",
-        ["green_cooler"] = "#8bd5ca",
-        ["green_faint"] = "#8bd5ca",
-        ["yellow"] = "#eed49f",
-        ["yellow_warmer"] = "#f5a97f",
-        ["yellow_cooler"] = "#eed49f",
-        ["yellow_faint"] = "#eed49f",
-        ["blue"] = "#8aadf4",
-        ["blue_warmer"] = "#b7bdf8",
-        ["blue_cooler"] = "#7dc4e4",
-        ["blue_faint"] = "#91d7e3",
-        ["magenta"] = "#c6a0f6",
-        ["magenta_warmer"] = "#f5bde6",
-        ["magenta_cooler"] = "#c6a0f6",
-        ["magenta_faint"] = "#f5bde6",
-        ["cyan"] = "#8bd5ca",
-        ["cyan_warmer"] = "#91d7e3",
-        ["cyan_cooler"] = "#7dc4e4",
-        ["cyan_faint"] = "#91d7e3",
-        ["rust"] = "#f5a97f",
-        ["gold"] = "#eed49f",
-        ["olive"] = "#a6da95",
-        ["slate"] = "#8aadf4",
-        ["indigo"] = "#c6a0f6",
-        ["maroon"] = "#ee99a0",
-        ["pink"] = "#f5bde6",
-        ["red_intense"] = "#ed8796",
-        ["green_intense"] = "#a6da95",
-        ["yellow_intense"] = "#eed49f",
-        ["blue_intense"] = "#8aadf4",
-        ["magenta_intense"] = "#c6a0f6",
-        ["cyan_intense"] = "#8bd5ca",
-        ["bg_red_intense"] = "#f4dbd6",
-        ["bg_green_intense"] = "#a6da95",
-        ["bg_yellow_intense"] = "#eed49f",
-        ["bg_blue_intense"] = "#8aadf4",
-        ["bg_magenta_intense"] = "#c6a0f6",
-        ["bg_cyan_intense"] = "#91d7e3",
-        ["bg_red_subtle"] = "#f0c6c6",
-        ["bg_green_subtle"] = "#8bd5ca",
-        ["bg_yellow_subtle"] = "#f5a97f",
-        ["bg_blue_subtle"] = "#b7bdf8",
-        ["bg_magenta_subtle"] = "#f5bde6",
-        ["bg_cyan_subtle"] = "#7dc4e4",
-        ["bg_red_nuanced"] = "#f0c6c6",
-        ["bg_green_nuanced"] = "#8bd5ca",
-        ["bg_yellow_nuanced"] = "#f5a97f",
-        ["bg_blue_nuanced"] = "#b7bdf8",
-        ["bg_magenta_nuanced"] = "#f5bde6",
-        ["bg_cyan_nuanced"] = "#7dc4e4",
-        ["bg_active"] = "#363a4f",
-        ["fg_active"] = "#cad3f5",
-        ["bg_inactive"] = "#494d64",
-        ["fg_inactive"] = "#b8c0e0",
-        ["bg_active_argument"] = "#363a4f",
-        ["bg_active_value"] = "#363a4f",
-        ["bg_completion"] = "#363a4f",
-        ["bg_hl_line"] = "#1e2030",
-        ["bg_paren_match"] = "#91d7e3",
-        ["bg_paren_expression"] = "#c6a0f6",
-        ["bg_char_0"] = "#91d7e3",
-        ["bg_char_1"] = "#f5bde6",
-        ["bg_char_2"] = "#eed49f",
-        ["bg_region"] = "#c6a0f6",
-        ["bg_status_line_active"] = "#181926",
-        ["fg_status_line_active"] = "#cad3f5",
-        ["bg_status_line_inactive"] = "#1e2030",
-        ["fg_status_line_inactive"] = "#b8c0e0",
-        ["bg_tab_bar"] = "#181926",
-        ["bg_tab_current"] = "#24273a",
-        ["bg_tab_other"] = "#1e2030",
-        ["fg_tab_other"] = "#b8c0e0",
-        ["bg_tab_alternate"] = "#c6a0f6",
-        ["bg_added"] = "#363a4f",
-        ["bg_added_faint"] = "#24273a",
-        ["bg_added_refine"] = "#a6da95",
-        ["bg_added_fringe"] = "#a6da95",
-        ["fg_added"] = "#a6da95",
-        ["fg_added_intense"] = "#a6da95",
-        ["bg_changed"] = "#363a4f",
-        ["bg_changed_faint"] = "#24273a",
-        ["bg_changed_refine"] = "#eed49f",
-        ["bg_changed_fringe"] = "#eed49f",
-        ["fg_changed"] = "#eed49f",
-        ["fg_changed_intense"] = "#eed49f",
-        ["bg_removed"] = "#363a4f",
-        ["bg_removed_faint"] = "#24273a",
-        ["bg_removed_refine"] = "#ed8796",
-        ["bg_removed_fringe"] = "#ed8796",
-        ["fg_removed"] = "#ed8796",
-        ["fg_removed_intense"] = "#ed8796",
-        ["bg_diff_context"] = "#24273a",
-        ["tinted_bg_main"] = "#1e2030",
-        ["tinted_bg_dim"] = "#181926",
-        ["tinted_border"] = "#6e738d",
-        ["tinted_border_highlight"] = "#8087a2",
-        ["tinted_bg_active"] = "#494d64",
-        ["tinted_bg_inactive"] = "#363a4f",
-        ["tinted_red_faint"] = "#f0c6c6",
-        ["tinted_bg_red_nuanced"] = "#1e2030",
-        ["tinted_bg_green_nuanced"] = "#1e2030",
-        ["tinted_bg_yellow_nuanced"] = "#1e2030",
-        ["tinted_bg_blue_nuanced"] = "#1e2030",
-        ["tinted_bg_magenta_nuanced"] = "#1e2030",
-        ["tinted_bg_cyan_nuanced"] = "#1e2030",
-        ["tinted_bg_completion"] = "#494d64",
-        ["tinted_bg_hl_line"] = "#181926",
-        ["tinted_bg_paren_match"] = "#91d7e3",
-        ["tinted_bg_status_line_active"] = "#181926",
-        ["tinted_bg_status_line_inactive"] = "#1e2030",
-        ["tinted_bg_tab_bar"] = "#181926",
-        ["tinted_bg_tab_current"] = "#1e2030",
-        ["tinted_bg_tab_other"] = "#494d64",
-        ["tinted_bg_tab_alternate"] = "#c6a0f6",
-        ["tinted_bg_added"] = "#363a4f",
-        ["tinted_bg_added_faint"] = "#1e2030",
-        ["tinted_bg_added_refine"] = "#a6da95",
-        ["tinted_bg_added_fringe"] = "#a6da95",
-        ["tinted_bg_changed_fringe"] = "#eed49f",
-        ["tinted_bg_removed"] = "#363a4f",
-        ["tinted_bg_removed_faint"] = "#1e2030",
-        ["tinted_bg_removed_refine"] = "#ed8796",
-        ["tinted_bg_removed_fringe"] = "#ed8796",
-        ["tinted_bg_diff_context"] = "#1e2030",
-        ["visual"] = "#c6a0f6",
-        ["link"] = "#8aadf4",
-        ["link_visited"] = "#c6a0f6",
-        ["link_symbolic"] = "#8bd5ca",
-        ["string"] = "#a6da95",
-        ["comment"] = "#8087a2",
-        ["constant"] = "#f5a97f",
-        ["identifier"] = "#8aadf4",
-        ["keyword"] = "#c6a0f6",
-        ["type"] = "#eed49f",
-        ["fnname"] = "#8aadf4",
-        ["variable"] = "#ed8796",
-        ["rainbow_0"] = "#ed8796",
-        ["rainbow_1"] = "#a6da95",
-        ["rainbow_2"] = "#eed49f",
-        ["rainbow_3"] = "#8aadf4",
-        ["rainbow_4"] = "#c6a0f6",
-        ["rainbow_5"] = "#8bd5ca",
-        ["rainbow_6"] = "#f5bde6",
-        ["rainbow_7"] = "#f5a97f",
-        ["prose_todo"] = "#ed8796",
-        ["prose_done"] = "#a6da95",
-        ["prose_tag"] = "#c6a0f6",
-        ["prose_table"] = "#8aadf4",
-        ["err"] = "#ed8796",
-        ["warning"] = "#eed49f",
-        ["info"] = "#8aadf4",
-      },
-    },
-    ["catppuccin_latte_mocha"] = {
-      ["family"] = "catppuccin_mocha",
-      ["flavor"] = "light",
-      ["foreground"] = "#4c4f69",
-      ["background"] = "#eff1f5",
-      ["cursor"] = "#4c4f69",
-      ["selection_background"] = "#8839ef",
-      ["selection_foreground"] = "#eff1f5",
-      ["ansi"] = {
-        "#5c5f77",
-        "#d20f39",
-        "#40a02b",
-        "#df8e1d",
-        "#1e66f5",
-        "#ea76cb",
-        "#179299",
-        "#acb0be",
-        "#6c6f85",
-        "#de293e",
-        "#49af3d",
-        "#eea02d",
-        "#456eff",
-        "#fe85d8",
-        "#2d9fa8",
-        "#bcc0cc",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#eff1f5",
-        ["bg_dim"] = "#e6e9ef",
-        ["bg_alt"] = "#dce0e8",
-        ["fg_main"] = "#4c4f69",
-        ["fg_dim"] = "#5c5f77",
-        ["fg_alt"] = "#6c6f85",
-        ["border"] = "#9ca0b0",
-        ["border_highlight"] = "#8c8fa1",
-        ["red"] = "#d20f39",
-        ["red_warmer"] = "#fe640b",
-        ["red_cooler"] = "#e64553",
-        ["red_faint"] = "#ea76cb",
-        ["green"] = "#40a02b",
-        ["green_warmer"] = "#40a02b",
-        ["green_cooler"] = "#179299",
-        ["green_faint"] = "#179299",
-        ["yellow"] = "#df8e1d",
-        ["yellow_warmer"] = "#fe640b",
-        ["yellow_cooler"] = "#df8e1d",
-        ["yellow_faint"] = "#df8e1d",
-        ["blue"] = "#1e66f5",
-        ["blue_warmer"] = "#7287fd",
-        ["blue_cooler"] = "#209fb5",
-        ["blue_faint"] = "#04a5e5",
-        ["magenta"] = "#8839ef",
-        ["magenta_warmer"] = "#ea76cb",
-        ["magenta_cooler"] = "#8839ef",
-        ["magenta_faint"] = "#ea76cb",
-        ["cyan"] = "#179299",
-        ["cyan_warmer"] = "#04a5e5",
-        ["cyan_cooler"] = "#209fb5",
-        ["cyan_faint"] = "#04a5e5",
-        ["rust"] = "#fe640b",
-        ["gold"] = "#df8e1d",
-        ["olive"] = "#40a02b",
-        ["slate"] = "#1e66f5",
-        ["indigo"] = "#8839ef",
-        ["maroon"] = "#e64553",
-        ["pink"] = "#ea76cb",
-        ["red_intense"] = "#d20f39",
-        ["green_intense"] = "#40a02b",
-        ["yellow_intense"] = "#df8e1d",
-        ["blue_intense"] = "#1e66f5",
-        ["magenta_intense"] = "#8839ef",
-        ["cyan_intense"] = "#179299",
-        ["bg_red_intense"] = "#dc8a78",
-        ["bg_green_intense"] = "#40a02b",
-        ["bg_yellow_intense"] = "#df8e1d",
-        ["bg_blue_intense"] = "#1e66f5",
-        ["bg_magenta_intense"] = "#8839ef",
-        ["bg_cyan_intense"] = "#04a5e5",
-        ["bg_red_subtle"] = "#dd7878",
-        ["bg_green_subtle"] = "#179299",
-        ["bg_yellow_subtle"] = "#fe640b",
-        ["bg_blue_subtle"] = "#7287fd",
-        ["bg_magenta_subtle"] = "#ea76cb",
-        ["bg_cyan_subtle"] = "#209fb5",
-        ["bg_red_nuanced"] = "#dd7878",
-        ["bg_green_nuanced"] = "#179299",
-        ["bg_yellow_nuanced"] = "#fe640b",
-        ["bg_blue_nuanced"] = "#7287fd",
-        ["bg_magenta_nuanced"] = "#ea76cb",
-        ["bg_cyan_nuanced"] = "#209fb5",
-        ["bg_active"] = "#ccd0da",
-        ["fg_active"] = "#4c4f69",
-        ["bg_inactive"] = "#bcc0cc",
-        ["fg_inactive"] = "#5c5f77",
-        ["bg_active_argument"] = "#ccd0da",
-        ["bg_active_value"] = "#ccd0da",
-        ["bg_completion"] = "#ccd0da",
-        ["bg_hl_line"] = "#e6e9ef",
-        ["bg_paren_match"] = "#04a5e5",
-        ["bg_paren_expression"] = "#8839ef",
-        ["bg_char_0"] = "#04a5e5",
-        ["bg_char_1"] = "#ea76cb",
-        ["bg_char_2"] = "#df8e1d",
-        ["bg_region"] = "#8839ef",
-        ["bg_status_line_active"] = "#dce0e8",
-        ["fg_status_line_active"] = "#4c4f69",
-        ["bg_status_line_inactive"] = "#e6e9ef",
-        ["fg_status_line_inactive"] = "#5c5f77",
-        ["bg_tab_bar"] = "#dce0e8",
-        ["bg_tab_current"] = "#eff1f5",
-        ["bg_tab_other"] = "#e6e9ef",
-        ["fg_tab_other"] = "#5c5f77",
-        ["bg_tab_alternate"] = "#8839ef",
-        ["bg_added"] = "#ccd0da",
-        ["bg_added_faint"] = "#eff1f5",
-        ["bg_added_refine"] = "#40a02b",
-        ["bg_added_fringe"] = "#40a02b",
-        ["fg_added"] = "#40a02b",
-        ["fg_added_intense"] = "#40a02b",
-        ["bg_changed"] = "#ccd0da",
-        ["bg_changed_faint"] = "#eff1f5",
-        ["bg_changed_refine"] = "#df8e1d",
-        ["bg_changed_fringe"] = "#df8e1d",
-        ["fg_changed"] = "#df8e1d",
-        ["fg_changed_intense"] = "#df8e1d",
-        ["bg_removed"] = "#ccd0da",
-        ["bg_removed_faint"] = "#eff1f5",
-        ["bg_removed_refine"] = "#d20f39",
-        ["bg_removed_fringe"] = "#d20f39",
-        ["fg_removed"] = "#d20f39",
-        ["fg_removed_intense"] = "#d20f39",
-        ["bg_diff_context"] = "#eff1f5",
-        ["tinted_bg_main"] = "#e6e9ef",
-        ["tinted_bg_dim"] = "#dce0e8",
-        ["tinted_border"] = "#9ca0b0",
-        ["tinted_border_highlight"] = "#8c8fa1",
-        ["tinted_bg_active"] = "#bcc0cc",
-        ["tinted_bg_inactive"] = "#ccd0da",
-        ["tinted_red_faint"] = "#dd7878",
-        ["tinted_bg_red_nuanced"] = "#e6e9ef",
-        ["tinted_bg_green_nuanced"] = "#e6e9ef",
-        ["tinted_bg_yellow_nuanced"] = "#e6e9ef",
-        ["tinted_bg_blue_nuanced"] = "#e6e9ef",
-        ["tinted_bg_magenta_nuanced"] = "#e6e9ef",
-        ["tinted_bg_cyan_nuanced"] = "#e6e9ef",
-        ["tinted_bg_completion"] = "#bcc0cc",
-        ["tinted_bg_hl_line"] = "#dce0e8",
-        ["tinted_bg_paren_match"] = "#04a5e5",
-        ["tinted_bg_status_line_active"] = "#dce0e8",
-        ["tinted_bg_status_line_inactive"] = "#e6e9ef",
-        ["tinted_bg_tab_bar"] = "#dce0e8",
-        ["tinted_bg_tab_current"] = "#e6e9ef",
-        ["tinted_bg_tab_other"] = "#bcc0cc",
-        ["tinted_bg_tab_alternate"] = "#8839ef",
-        ["tinted_bg_added"] = "#ccd0da",
-        ["tinted_bg_added_faint"] = "#e6e9ef",
-        ["tinted_bg_added_refine"] = "#40a02b",
-        ["tinted_bg_added_fringe"] = "#40a02b",
-        ["tinted_bg_changed_fringe"] = "#df8e1d",
-        ["tinted_bg_removed"] = "#ccd0da",
-        ["tinted_bg_removed_faint"] = "#e6e9ef",
-        ["tinted_bg_removed_refine"] = "#d20f39",
-        ["tinted_bg_removed_fringe"] = "#d20f39",
-        ["tinted_bg_diff_context"] = "#e6e9ef",
-        ["visual"] = "#8839ef",
-        ["link"] = "#1e66f5",
-        ["link_visited"] = "#8839ef",
-        ["link_symbolic"] = "#179299",
-        ["string"] = "#40a02b",
-        ["comment"] = "#8c8fa1",
-        ["constant"] = "#fe640b",
-        ["identifier"] = "#1e66f5",
-        ["keyword"] = "#8839ef",
-        ["type"] = "#df8e1d",
-        ["fnname"] = "#1e66f5",
-        ["variable"] = "#d20f39",
-        ["rainbow_0"] = "#d20f39",
-        ["rainbow_1"] = "#40a02b",
-        ["rainbow_2"] = "#df8e1d",
-        ["rainbow_3"] = "#1e66f5",
-        ["rainbow_4"] = "#8839ef",
-        ["rainbow_5"] = "#179299",
-        ["rainbow_6"] = "#ea76cb",
-        ["rainbow_7"] = "#fe640b",
-        ["prose_todo"] = "#d20f39",
-        ["prose_done"] = "#40a02b",
-        ["prose_tag"] = "#8839ef",
-        ["prose_table"] = "#1e66f5",
-        ["err"] = "#d20f39",
-        ["warning"] = "#df8e1d",
-        ["info"] = "#1e66f5",
-      },
-    },
-    ["catppuccin_mocha"] = {
-      ["family"] = "catppuccin_mocha",
-      ["flavor"] = "dark",
-      ["foreground"] = "#cdd6f4",
-      ["background"] = "#1e1e2e",
-      ["cursor"] = "#cdd6f4",
-      ["selection_background"] = "#cba6f7",
-      ["selection_foreground"] = "#1e1e2e",
-      ["ansi"] = {
-        "#45475a",
-        "#f38ba8",
-        "#a6e3a1",
-        "#f9e2af",
-        "#89b4fa",
-        "#f5c2e7",
-        "#94e2d5",
-        "#a6adc8",
-        "#585b70",
-        "#f37799",
-        "#89d88b",
-        "#ebd391",
-        "#74a8fc",
-        "#f2aede",
-        "#6bd7ca",
-        "#bac2de",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#1e1e2e",
-        ["bg_dim"] = "#181825",
-        ["bg_alt"] = "#11111b",
-        ["fg_main"] = "#cdd6f4",
-        ["fg_dim"] = "#bac2de",
-        ["fg_alt"] = "#a6adc8",
-        ["border"] = "#6c7086",
-        ["border_highlight"] = "#7f849c",
-        ["red"] = "#f38ba8",
-        ["red_warmer"] = "#fab387",
-        ["red_cooler"] = "#eba0ac",
-        ["red_faint"] = "#f5c2e7",
-        ["green"] = "#a6e3a1",
-        ["green_warmer"] = "#a6e3a1",
-        ["green_cooler"] = "#94e2d5",
-        ["green_faint"] = "#94e2d5",
-        ["yellow"] = "#f9e2af",
-        ["yellow_warmer"] = "#fab387",
-        ["yellow_cooler"] = "#f9e2af",
-        ["yellow_faint"] = "#f9e2af",
-        ["blue"] = "#89b4fa",
-        ["blue_warmer"] = "#b4befe",
-        ["blue_cooler"] = "#74c7ec",
-        ["blue_faint"] = "#89dceb",
-        ["magenta"] = "#cba6f7",
-        ["magenta_warmer"] = "#f5c2e7",
-        ["magenta_cooler"] = "#cba6f7",
-        ["magenta_faint"] = "#f5c2e7",
-        ["cyan"] = "#94e2d5",
-        ["cyan_warmer"] = "#89dceb",
-        ["cyan_cooler"] = "#74c7ec",
-        ["cyan_faint"] = "#89dceb",
-        ["rust"] = "#fab387",
-        ["gold"] = "#f9e2af",
-        ["olive"] = "#a6e3a1",
-        ["slate"] = "#89b4fa",
-        ["indigo"] = "#cba6f7",
-        ["maroon"] = "#eba0ac",
-        ["pink"] = "#f5c2e7",
-        ["red_intense"] = "#f38ba8",
-        ["green_intense"] = "#a6e3a1",
-        ["yellow_intense"] = "#f9e2af",
-        ["blue_intense"] = "#89b4fa",
-        ["magenta_intense"] = "#cba6f7",
-        ["cyan_intense"] = "#94e2d5",
-        ["bg_red_intense"] = "#f5e0dc",
-        ["bg_green_intense"] = "#a6e3a1",
-        ["bg_yellow_intense"] = "#f9e2af",
-        ["bg_blue_intense"] = "#89b4fa",
-        ["bg_magenta_intense"] = "#cba6f7",
-        ["bg_cyan_intense"] = "#89dceb",
-        ["bg_red_subtle"] = "#f2cdcd",
-        ["bg_green_subtle"] = "#94e2d5",
-        ["bg_yellow_subtle"] = "#fab387",
-        ["bg_blue_subtle"] = "#b4befe",
-        ["bg_magenta_subtle"] = "#f5c2e7",
-        ["bg_cyan_subtle"] = "#74c7ec",
-        ["bg_red_nuanced"] = "#f2cdcd",
-        ["bg_green_nuanced"] = "#94e2d5",
-        ["bg_yellow_nuanced"] = "#fab387",
-        ["bg_blue_nuanced"] = "#b4befe",
-        ["bg_magenta_nuanced"] = "#f5c2e7",
-        ["bg_cyan_nuanced"] = "#74c7ec",
-        ["bg_active"] = "#313244",
-        ["fg_active"] = "#cdd6f4",
-        ["bg_inactive"] = "#45475a",
-        ["fg_inactive"] = "#bac2de",
-        ["bg_active_argument"] = "#313244",
-        ["bg_active_value"] = "#313244",
-        ["bg_completion"] = "#313244",
-        ["bg_hl_line"] = "#181825",
-        ["bg_paren_match"] = "#89dceb",
-        ["bg_paren_expression"] = "#cba6f7",
-        ["bg_char_0"] = "#89dceb",
-        ["bg_char_1"] = "#f5c2e7",
-        ["bg_char_2"] = "#f9e2af",
-        ["bg_region"] = "#cba6f7",
-        ["bg_status_line_active"] = "#11111b",
-        ["fg_status_line_active"] = "#cdd6f4",
-        ["bg_status_line_inactive"] = "#181825",
-        ["fg_status_line_inactive"] = "#bac2de",
-        ["bg_tab_bar"] = "#11111b",
-        ["bg_tab_current"] = "#1e1e2e",
-        ["bg_tab_other"] = "#181825",
-        ["fg_tab_other"] = "#bac2de",
-        ["bg_tab_alternate"] = "#cba6f7",
-        ["bg_added"] = "#313244",
-        ["bg_added_faint"] = "#1e1e2e",
-        ["bg_added_refine"] = "#a6e3a1",
-        ["bg_added_fringe"] = "#a6e3a1",
-        ["fg_added"] = "#a6e3a1",
-        ["fg_added_intense"] = "#a6e3a1",
-        ["bg_changed"] = "#313244",
-        ["bg_changed_faint"] = "#1e1e2e",
-        ["bg_changed_refine"] = "#f9e2af",
-        ["bg_changed_fringe"] = "#f9e2af",
-        ["fg_changed"] = "#f9e2af",
-        ["fg_changed_intense"] = "#f9e2af",
-        ["bg_removed"] = "#313244",
-        ["bg_removed_faint"] = "#1e1e2e",
-        ["bg_removed_refine"] = "#f38ba8",
-        ["bg_removed_fringe"] = "#f38ba8",
-        ["fg_removed"] = "#f38ba8",
-        ["fg_removed_intense"] = "#f38ba8",
-        ["bg_diff_context"] = "#1e1e2e",
-        ["tinted_bg_main"] = "#181825",
-        ["tinted_bg_dim"] = "#11111b",
-        ["tinted_border"] = "#6c7086",
-        ["tinted_border_highlight"] = "#7f849c",
-        ["tinted_bg_active"] = "#45475a",
-        ["tinted_bg_inactive"] = "#313244",
-        ["tinted_red_faint"] = "#f2cdcd",
-        ["tinted_bg_red_nuanced"] = "#181825",
-        ["tinted_bg_green_nuanced"] = "#181825",
-        ["tinted_bg_yellow_nuanced"] = "#181825",
-        ["tinted_bg_blue_nuanced"] = "#181825",
-        ["tinted_bg_magenta_nuanced"] = "#181825",
-        ["tinted_bg_cyan_nuanced"] = "#181825",
-        ["tinted_bg_completion"] = "#45475a",
-        ["tinted_bg_hl_line"] = "#11111b",
-        ["tinted_bg_paren_match"] = "#89dceb",
-        ["tinted_bg_status_line_active"] = "#11111b",
-        ["tinted_bg_status_line_inactive"] = "#181825",
-        ["tinted_bg_tab_bar"] = "#11111b",
-        ["tinted_bg_tab_current"] = "#181825",
-        ["tinted_bg_tab_other"] = "#45475a",
-        ["tinted_bg_tab_alternate"] = "#cba6f7",
-        ["tinted_bg_added"] = "#313244",
-        ["tinted_bg_added_faint"] = "#181825",
-        ["tinted_bg_added_refine"] = "#a6e3a1",
-        ["tinted_bg_added_fringe"] = "#a6e3a1",
-        ["tinted_bg_changed_fringe"] = "#f9e2af",
-        ["tinted_bg_removed"] = "#313244",
-        ["tinted_bg_removed_faint"] = "#181825",
-        ["tinted_bg_removed_refine"] = "#f38ba8",
-        ["tinted_bg_removed_fringe"] = "#f38ba8",
-        ["tinted_bg_diff_context"] = "#181825",
-        ["visual"] = "#cba6f7",
-        ["link"] = "#89b4fa",
-        ["link_visited"] = "#cba6f7",
-        ["link_symbolic"] = "#94e2d5",
-        ["string"] = "#a6e3a1",
-        ["comment"] = "#7f849c",
-        ["constant"] = "#fab387",
-        ["identifier"] = "#89b4fa",
-        ["keyword"] = "#cba6f7",
-        ["type"] = "#f9e2af",
-        ["fnname"] = "#89b4fa",
-        ["variable"] = "#f38ba8",
-        ["rainbow_0"] = "#f38ba8",
-        ["rainbow_1"] = "#a6e3a1",
-        ["rainbow_2"] = "#f9e2af",
-        ["rainbow_3"] = "#89b4fa",
-        ["rainbow_4"] = "#cba6f7",
-        ["rainbow_5"] = "#94e2d5",
-        ["rainbow_6"] = "#f5c2e7",
-        ["rainbow_7"] = "#fab387",
-        ["prose_todo"] = "#f38ba8",
-        ["prose_done"] = "#a6e3a1",
-        ["prose_tag"] = "#cba6f7",
-        ["prose_table"] = "#89b4fa",
-        ["err"] = "#f38ba8",
-        ["warning"] = "#f9e2af",
-        ["info"] = "#89b4fa",
-      },
-    },
-    ["ef_day"] = {
-      ["family"] = "ef_daynight",
-      ["flavor"] = "light",
-      ["foreground"] = "#584141",
-      ["background"] = "#fff5ea",
-      ["cursor"] = "#cf1f00",
-      ["selection_background"] = "#f0d2df",
-      ["selection_foreground"] = "#584141",
-      ["ansi"] = {
-        "#fff5ea",
-        "#ba2d2f",
-        "#007a0a",
-        "#a45a22",
-        "#375cc6",
-        "#ca3e54",
-        "#3f60af",
-        "#584141",
-        "#f2e9db",
-        "#ce3f00",
-        "#5f7200",
-        "#b75515",
-        "#5f5fdf",
-        "#cb2f80",
-        "#3f6faf",
-        "#63728f",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#fff5ea",
-        ["bg_dim"] = "#f2e9db",
-        ["bg_alt"] = "#e9e0d8",
-        ["fg_main"] = "#584141",
-        ["fg_dim"] = "#63728f",
-        ["fg_alt"] = "#8f5f4a",
-        ["border"] = "#c8bdb6",
-        ["border_highlight"] = "#8f5f4a",
-        ["red"] = "#ba2d2f",
-        ["red_warmer"] = "#ce3f00",
-        ["red_cooler"] = "#cf2f4f",
-        ["red_faint"] = "#b05350",
-        ["green"] = "#007a0a",
-        ["green_warmer"] = "#5f7200",
-        ["green_cooler"] = "#0f7f5f",
-        ["green_faint"] = "#527545",
-        ["yellow"] = "#a45a22",
-        ["yellow_warmer"] = "#b75515",
-        ["yellow_cooler"] = "#aa4f30",
-        ["yellow_faint"] = "#9a625a",
-        ["blue"] = "#375cc6",
-        ["blue_warmer"] = "#5f5fdf",
-        ["blue_cooler"] = "#265fbf",
-        ["blue_faint"] = "#4a659f",
-        ["magenta"] = "#ca3e54",
-        ["magenta_warmer"] = "#cb2f80",
-        ["magenta_cooler"] = "#8448aa",
-        ["magenta_faint"] = "#a04450",
-        ["cyan"] = "#3f60af",
-        ["cyan_warmer"] = "#3f6faf",
-        ["cyan_cooler"] = "#0f7b8f",
-        ["cyan_faint"] = "#4f6f8f",
-        ["rust"] = "#ce3f00",
-        ["gold"] = "#a45a22",
-        ["olive"] = "#5f7200",
-        ["slate"] = "#4a659f",
-        ["indigo"] = "#8448aa",
-        ["maroon"] = "#cf2f4f",
-        ["pink"] = "#cb2f80",
-        ["red_intense"] = "#ba2d2f",
-        ["green_intense"] = "#007a0a",
-        ["yellow_intense"] = "#a45a22",
-        ["blue_intense"] = "#375cc6",
-        ["magenta_intense"] = "#ca3e54",
-        ["cyan_intense"] = "#3f60af",
-        ["bg_red_intense"] = "#ff8f88",
-        ["bg_green_intense"] = "#96df80",
-        ["bg_yellow_intense"] = "#efbf00",
-        ["bg_blue_intense"] = "#cfceff",
-        ["bg_magenta_intense"] = "#df9fff",
-        ["bg_cyan_intense"] = "#88cfd0",
-        ["bg_red_subtle"] = "#ffc6bf",
-        ["bg_green_subtle"] = "#c4f2af",
-        ["bg_yellow_subtle"] = "#f0f07f",
-        ["bg_blue_subtle"] = "#ccdfff",
-        ["bg_magenta_subtle"] = "#fad3ff",
-        ["bg_cyan_subtle"] = "#bfefff",
-        ["bg_red_nuanced"] = "#ffc6bf",
-        ["bg_green_nuanced"] = "#c4f2af",
-        ["bg_yellow_nuanced"] = "#f0f07f",
-        ["bg_blue_nuanced"] = "#ccdfff",
-        ["bg_magenta_nuanced"] = "#fad3ff",
-        ["bg_cyan_nuanced"] = "#bfefff",
-        ["bg_completion"] = "#ffd5d3",
-        ["bg_hl_line"] = "#f9e2b2",
-        ["bg_paren_match"] = "#8fcfdf",
-        ["bg_paren_expression"] = "#b0e0df",
-        ["bg_char_0"] = "#ccdfff",
-        ["bg_char_1"] = "#fad3ff",
-        ["bg_char_2"] = "#f0f07f",
-        ["bg_active"] = "#c9c0b8",
-        ["fg_active"] = "#584141",
-        ["bg_inactive"] = "#f7efe6",
-        ["fg_inactive"] = "#63728f",
-        ["bg_status_line_active"] = "#ffaf72",
-        ["fg_status_line_active"] = "#542f38",
-        ["bg_status_line_inactive"] = "#f2e9db",
-        ["fg_status_line_inactive"] = "#63728f",
-        ["bg_tab_bar"] = "#e9e0d8",
-        ["bg_tab_current"] = "#fff5ea",
-        ["bg_tab_other"] = "#c9c0b8",
-        ["fg_tab_other"] = "#63728f",
-        ["bg_tab_alternate"] = "#febccf",
-        ["bg_added"] = "#ccefcf",
-        ["bg_added_faint"] = "#e0f3e0",
-        ["bg_added_refine"] = "#bae0c0",
-        ["bg_added_fringe"] = "#bae0c0",
-        ["fg_added"] = "#005000",
-        ["fg_added_intense"] = "#005000",
-        ["bg_changed"] = "#ffe5b9",
-        ["bg_changed_faint"] = "#ffefc5",
-        ["bg_changed_refine"] = "#ffd09f",
-        ["bg_changed_fringe"] = "#ffd09f",
-        ["fg_changed"] = "#553d00",
-        ["fg_changed_intense"] = "#553d00",
-        ["bg_removed"] = "#ffd4d8",
-        ["bg_removed_faint"] = "#ffe3e3",
-        ["bg_removed_refine"] = "#ffc0ca",
-        ["bg_removed_fringe"] = "#ffc0ca",
-        ["fg_removed"] = "#8f1313",
-        ["fg_removed_intense"] = "#8f1313",
-        ["bg_diff_context"] = "#f2e9db",
-        ["visual"] = "#f0d2df",
-        ["link"] = "#3f6faf",
-        ["link_visited"] = "#5f7200",
-        ["link_symbolic"] = "#3f60af",
-        ["string"] = "#5f7200",
-        ["comment"] = "#527545",
-        ["constant"] = "#ce3f00",
-        ["identifier"] = "#a04450",
-        ["keyword"] = "#a45a22",
-        ["type"] = "#0f7f5f",
-        ["fnname"] = "#ca3e54",
-        ["variable"] = "#8448aa",
-        ["rainbow_0"] = "#a45a22",
-        ["rainbow_1"] = "#ba2d2f",
-        ["rainbow_2"] = "#5f7200",
-        ["rainbow_3"] = "#cb2f80",
-        ["rainbow_4"] = "#3f60af",
-        ["rainbow_5"] = "#aa4f30",
-        ["rainbow_6"] = "#8448aa",
-        ["rainbow_7"] = "#cf2f4f",
-        ["prose_todo"] = "#ce3f00",
-        ["prose_done"] = "#007a0a",
-        ["prose_tag"] = "#9a625a",
-        ["prose_table"] = "#8f5f4a",
-        ["err"] = "#ce3f00",
-        ["warning"] = "#a45a22",
-        ["info"] = "#007a0a",
-        ["hint"] = "#4f6f8f",
-        ["ok"] = "#0f7f5f",
-      },
-    },
-    ["ef_night"] = {
-      ["family"] = "ef_daynight",
-      ["flavor"] = "dark",
-      ["foreground"] = "#afbcbf",
-      ["background"] = "#000e17",
-      ["cursor"] = "#00ccff",
-      ["selection_background"] = "#253146",
-      ["selection_foreground"] = "#afbcbf",
-      ["ansi"] = {
-        "#000e17",
-        "#ef656a",
-        "#1fa526",
-        "#c48502",
-        "#379cf6",
-        "#d570af",
-        "#4fb0cf",
-        "#afbcbf",
-        "#1a202b",
-        "#f47360",
-        "#50a22f",
-        "#e6832f",
-        "#6a88ff",
-        "#e580ea",
-        "#6fafff",
-        "#70819f",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#000e17",
-        ["bg_dim"] = "#1a202b",
-        ["bg_alt"] = "#242e39",
-        ["fg_main"] = "#afbcbf",
-        ["fg_dim"] = "#70819f",
-        ["fg_alt"] = "#b0a0a0",
-        ["border"] = "#3a4a66",
-        ["border_highlight"] = "#b0a0a0",
-        ["red"] = "#ef656a",
-        ["red_warmer"] = "#f47360",
-        ["red_cooler"] = "#ef798f",
-        ["red_faint"] = "#d56f72",
-        ["green"] = "#1fa526",
-        ["green_warmer"] = "#50a22f",
-        ["green_cooler"] = "#00a972",
-        ["green_faint"] = "#61a06c",
-        ["yellow"] = "#c48502",
-        ["yellow_warmer"] = "#e6832f",
-        ["yellow_cooler"] = "#df8f6f",
-        ["yellow_faint"] = "#cf9f7f",
-        ["blue"] = "#379cf6",
-        ["blue_warmer"] = "#6a88ff",
-        ["blue_cooler"] = "#029fff",
-        ["blue_faint"] = "#7a94df",
-        ["magenta"] = "#d570af",
-        ["magenta_warmer"] = "#e580ea",
-        ["magenta_cooler"] = "#af8aff",
-        ["magenta_faint"] = "#c59fcf",
-        ["cyan"] = "#4fb0cf",
-        ["cyan_warmer"] = "#6fafff",
-        ["cyan_cooler"] = "#3dc0b0",
-        ["cyan_faint"] = "#92b4df",
-        ["rust"] = "#f47360",
-        ["gold"] = "#c48502",
-        ["olive"] = "#50a22f",
-        ["slate"] = "#7a94df",
-        ["indigo"] = "#af8aff",
-        ["maroon"] = "#ef798f",
-        ["pink"] = "#e580ea",
-        ["red_intense"] = "#ef656a",
-        ["green_intense"] = "#1fa526",
-        ["yellow_intense"] = "#c48502",
-        ["blue_intense"] = "#379cf6",
-        ["magenta_intense"] = "#d570af",
-        ["cyan_intense"] = "#4fb0cf",
-        ["bg_red_intense"] = "#bd1f30",
-        ["bg_green_intense"] = "#107440",
-        ["bg_yellow_intense"] = "#847020",
-        ["bg_blue_intense"] = "#2f5f9f",
-        ["bg_magenta_intense"] = "#804fd5",
-        ["bg_cyan_intense"] = "#0280b9",
-        ["bg_red_subtle"] = "#6a1b2f",
-        ["bg_green_subtle"] = "#0a432f",
-        ["bg_yellow_subtle"] = "#533420",
-        ["bg_blue_subtle"] = "#1f3665",
-        ["bg_magenta_subtle"] = "#502555",
-        ["bg_cyan_subtle"] = "#113b5e",
-        ["bg_red_nuanced"] = "#6a1b2f",
-        ["bg_green_nuanced"] = "#0a432f",
-        ["bg_yellow_nuanced"] = "#533420",
-        ["bg_blue_nuanced"] = "#1f3665",
-        ["bg_magenta_nuanced"] = "#502555",
-        ["bg_cyan_nuanced"] = "#113b5e",
-        ["bg_completion"] = "#00314f",
-        ["bg_hl_line"] = "#002255",
-        ["bg_paren_match"] = "#664950",
-        ["bg_paren_expression"] = "#6f345a",
-        ["bg_char_0"] = "#1f3665",
-        ["bg_char_1"] = "#502555",
-        ["bg_char_2"] = "#533420",
-        ["bg_active"] = "#444e59",
-        ["fg_active"] = "#afbcbf",
-        ["bg_inactive"] = "#11141f",
-        ["fg_inactive"] = "#70819f",
-        ["bg_status_line_active"] = "#003a7f",
-        ["fg_status_line_active"] = "#ceeeff",
-        ["bg_status_line_inactive"] = "#1a202b",
-        ["fg_status_line_inactive"] = "#70819f",
-        ["bg_tab_bar"] = "#242e39",
-        ["bg_tab_current"] = "#000e17",
-        ["bg_tab_other"] = "#444e59",
-        ["fg_tab_other"] = "#70819f",
-        ["bg_tab_alternate"] = "#493737",
-        ["bg_added"] = "#00371f",
-        ["bg_added_faint"] = "#002918",
-        ["bg_added_refine"] = "#004c2f",
-        ["bg_added_fringe"] = "#004c2f",
-        ["fg_added"] = "#a0e0a0",
-        ["fg_added_intense"] = "#a0e0a0",
-        ["bg_changed"] = "#363300",
-        ["bg_changed_faint"] = "#2a1f00",
-        ["bg_changed_refine"] = "#4a4a00",
-        ["bg_changed_fringe"] = "#4a4a00",
-        ["fg_changed"] = "#efef80",
-        ["fg_changed_intense"] = "#efef80",
-        ["bg_removed"] = "#450f1f",
-        ["bg_removed_faint"] = "#2f060f",
-        ["bg_removed_refine"] = "#641426",
-        ["bg_removed_fringe"] = "#641426",
-        ["fg_removed"] = "#ffbfbf",
-        ["fg_removed_intense"] = "#ffbfbf",
-        ["bg_diff_context"] = "#1a202b",
-        ["visual"] = "#253146",
-        ["link"] = "#379cf6",
-        ["link_visited"] = "#af8aff",
-        ["link_symbolic"] = "#4fb0cf",
-        ["string"] = "#029fff",
-        ["comment"] = "#cf9f7f",
-        ["constant"] = "#af8aff",
-        ["identifier"] = "#c59fcf",
-        ["keyword"] = "#6a88ff",
-        ["type"] = "#c59fcf",
-        ["fnname"] = "#3dc0b0",
-        ["variable"] = "#6fafff",
-        ["rainbow_0"] = "#6fafff",
-        ["rainbow_1"] = "#af8aff",
-        ["rainbow_2"] = "#df8f6f",
-        ["rainbow_3"] = "#6a88ff",
-        ["rainbow_4"] = "#d570af",
-        ["rainbow_5"] = "#1fa526",
-        ["rainbow_6"] = "#c48502",
-        ["rainbow_7"] = "#4fb0cf",
-        ["prose_todo"] = "#ef656a",
-        ["prose_done"] = "#00a972",
-        ["prose_tag"] = "#b0a0a0",
-        ["prose_table"] = "#b0a0a0",
-        ["err"] = "#ef656a",
-        ["warning"] = "#e6832f",
-        ["info"] = "#00a972",
-        ["hint"] = "#92b4df",
-        ["ok"] = "#00a972",
-      },
-    },
-    ["ef_deuteranopia_light"] = {
-      ["family"] = "ef_deuteranopia",
-      ["flavor"] = "light",
-      ["foreground"] = "#1a1a2f",
-      ["background"] = "#f5f5ff",
-      ["cursor"] = "#0000bb",
-      ["selection_background"] = "#dadadf",
-      ["selection_foreground"] = "#1a1a2f",
-      ["ansi"] = {
-        "#f5f5ff",
-        "#d3303a",
-        "#217a3c",
-        "#805d00",
-        "#375cd8",
-        "#ba35af",
-        "#1f6fbf",
-        "#1a1a2f",
-        "#e8e8ea",
-        "#e00033",
-        "#4a7d00",
-        "#965000",
-        "#4250ef",
-        "#cf25aa",
-        "#3f6faf",
-        "#70627f",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#f5f5ff",
-        ["bg_dim"] = "#e8e8ea",
-        ["bg_alt"] = "#d3d3e0",
-        ["fg_main"] = "#1a1a2f",
-        ["fg_dim"] = "#70627f",
-        ["fg_alt"] = "#196f70",
-        ["border"] = "#bcbcd0",
-        ["border_highlight"] = "#196f70",
-        ["red"] = "#d3303a",
-        ["red_warmer"] = "#e00033",
-        ["red_cooler"] = "#d50f7f",
-        ["red_faint"] = "#a04852",
-        ["green"] = "#217a3c",
-        ["green_warmer"] = "#4a7d00",
-        ["green_cooler"] = "#008058",
-        ["green_faint"] = "#61756c",
-        ["yellow"] = "#805d00",
-        ["yellow_warmer"] = "#965000",
-        ["yellow_cooler"] = "#765040",
-        ["yellow_faint"] = "#77604a",
-        ["blue"] = "#375cd8",
-        ["blue_warmer"] = "#4250ef",
-        ["blue_cooler"] = "#065fff",
-        ["blue_faint"] = "#6060d0",
-        ["magenta"] = "#ba35af",
-        ["magenta_warmer"] = "#cf25aa",
-        ["magenta_cooler"] = "#6052cf",
-        ["magenta_faint"] = "#9f5080",
-        ["cyan"] = "#1f6fbf",
-        ["cyan_warmer"] = "#3f6faf",
-        ["cyan_cooler"] = "#1477b2",
-        ["cyan_faint"] = "#506fa0",
-        ["rust"] = "#e00033",
-        ["gold"] = "#805d00",
-        ["olive"] = "#4a7d00",
-        ["slate"] = "#6060d0",
-        ["indigo"] = "#6052cf",
-        ["maroon"] = "#d50f7f",
-        ["pink"] = "#cf25aa",
-        ["red_intense"] = "#d3303a",
-        ["green_intense"] = "#217a3c",
-        ["yellow_intense"] = "#805d00",
-        ["blue_intense"] = "#375cd8",
-        ["magenta_intense"] = "#ba35af",
-        ["cyan_intense"] = "#1f6fbf",
-        ["bg_red_intense"] = "#cac200",
-        ["bg_green_intense"] = "#9aaf80",
-        ["bg_yellow_intense"] = "#fac200",
-        ["bg_blue_intense"] = "#cbcfff",
-        ["bg_magenta_intense"] = "#3fbfff",
-        ["bg_cyan_intense"] = "#98e8ff",
-        ["bg_red_subtle"] = "#ead270",
-        ["bg_green_subtle"] = "#bae0a0",
-        ["bg_yellow_subtle"] = "#e6f270",
-        ["bg_blue_subtle"] = "#c0dfff",
-        ["bg_magenta_subtle"] = "#ccc8ff",
-        ["bg_cyan_subtle"] = "#afecf0",
-        ["bg_red_nuanced"] = "#ead270",
-        ["bg_green_nuanced"] = "#bae0a0",
-        ["bg_yellow_nuanced"] = "#e6f270",
-        ["bg_blue_nuanced"] = "#c0dfff",
-        ["bg_magenta_nuanced"] = "#ccc8ff",
-        ["bg_cyan_nuanced"] = "#afecf0",
-        ["bg_completion"] = "#f0dacf",
-        ["bg_hl_line"] = "#f3e0d5",
-        ["bg_paren_match"] = "#8fc0cf",
-        ["bg_paren_expression"] = "#eebb20",
-        ["bg_char_0"] = "#c0dfff",
-        ["bg_char_1"] = "#ccc8ff",
-        ["bg_char_2"] = "#e6f270",
-        ["bg_active"] = "#b3b3c0",
-        ["fg_active"] = "#1a1a2f",
-        ["bg_inactive"] = "#efeff5",
-        ["fg_inactive"] = "#70627f",
-        ["bg_status_line_active"] = "#99c7ff",
-        ["fg_status_line_active"] = "#0a0a1f",
-        ["bg_status_line_inactive"] = "#e8e8ea",
-        ["fg_status_line_inactive"] = "#70627f",
-        ["bg_tab_bar"] = "#d3d3e0",
-        ["bg_tab_current"] = "#f5f5ff",
-        ["bg_tab_other"] = "#b3b3c0",
-        ["fg_tab_other"] = "#70627f",
-        ["bg_tab_alternate"] = "#afafef",
-        ["bg_added"] = "#dbdbff",
-        ["bg_added_faint"] = "#e4e4ff",
-        ["bg_added_refine"] = "#c0c0ef",
-        ["bg_added_fringe"] = "#c0c0ef",
-        ["fg_added"] = "#333399",
-        ["fg_added_intense"] = "#333399",
-        ["bg_changed"] = "#eecfdf",
-        ["bg_changed_faint"] = "#f0dde5",
-        ["bg_changed_refine"] = "#e0b0d0",
-        ["bg_changed_fringe"] = "#e0b0d0",
-        ["fg_changed"] = "#6f1343",
-        ["fg_changed_intense"] = "#6f1343",
-        ["bg_removed"] = "#fff0af",
-        ["bg_removed_faint"] = "#efefcb",
-        ["bg_removed_refine"] = "#f0da88",
-        ["bg_removed_fringe"] = "#f0da88",
-        ["fg_removed"] = "#553d00",
-        ["fg_removed_intense"] = "#553d00",
-        ["bg_diff_context"] = "#e8e8ea",
-        ["visual"] = "#dadadf",
-        ["link"] = "#375cd8",
-        ["link_visited"] = "#765040",
-        ["link_symbolic"] = "#1f6fbf",
-        ["string"] = "#965000",
-        ["comment"] = "#77604a",
-        ["constant"] = "#765040",
-        ["identifier"] = "#506fa0",
-        ["keyword"] = "#4250ef",
-        ["type"] = "#805d00",
-        ["fnname"] = "#065fff",
-        ["variable"] = "#1477b2",
-        ["rainbow_0"] = "#375cd8",
-        ["rainbow_1"] = "#805d00",
-        ["rainbow_2"] = "#4250ef",
-        ["rainbow_3"] = "#765040",
-        ["rainbow_4"] = "#065fff",
-        ["rainbow_5"] = "#965000",
-        ["rainbow_6"] = "#6060d0",
-        ["rainbow_7"] = "#77604a",
-        ["prose_todo"] = "#965000",
-        ["prose_done"] = "#065fff",
-        ["prose_tag"] = "#61756c",
-        ["prose_table"] = "#196f70",
-        ["err"] = "#965000",
-        ["warning"] = "#765040",
-        ["info"] = "#065fff",
-        ["hint"] = "#506fa0",
-        ["ok"] = "#008058",
-      },
-    },
-    ["ef_deuteranopia_dark"] = {
-      ["family"] = "ef_deuteranopia",
-      ["flavor"] = "dark",
-      ["foreground"] = "#ddddee",
-      ["background"] = "#000a1f",
-      ["cursor"] = "#ffff00",
-      ["selection_background"] = "#223848",
-      ["selection_foreground"] = "#ddddee",
-      ["ansi"] = {
-        "#000a1f",
-        "#cf8560",
-        "#3faa26",
-        "#aa9f32",
-        "#3f90f0",
-        "#b379bf",
-        "#5faaef",
-        "#ddddee",
-        "#121f34",
-        "#e47360",
-        "#7aad0f",
-        "#cfaf00",
-        "#6a9fff",
-        "#af80ea",
-        "#7fafff",
-        "#7f8797",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#000a1f",
-        ["bg_dim"] = "#121f34",
-        ["bg_alt"] = "#243145",
-        ["fg_main"] = "#ddddee",
-        ["fg_dim"] = "#7f8797",
-        ["fg_alt"] = "#90afef",
-        ["border"] = "#555a64",
-        ["border_highlight"] = "#90afef",
-        ["red"] = "#cf8560",
-        ["red_warmer"] = "#e47360",
-        ["red_cooler"] = "#cf7a7a",
-        ["red_faint"] = "#b57f82",
-        ["green"] = "#3faa26",
-        ["green_warmer"] = "#7aad0f",
-        ["green_cooler"] = "#3fa672",
-        ["green_faint"] = "#61a06c",
-        ["yellow"] = "#aa9f32",
-        ["yellow_warmer"] = "#cfaf00",
-        ["yellow_cooler"] = "#bfaf7a",
-        ["yellow_faint"] = "#af9a6a",
-        ["blue"] = "#3f90f0",
-        ["blue_warmer"] = "#6a9fff",
-        ["blue_cooler"] = "#009fff",
-        ["blue_faint"] = "#7a94df",
-        ["magenta"] = "#b379bf",
-        ["magenta_warmer"] = "#af80ea",
-        ["magenta_cooler"] = "#9f95ff",
-        ["magenta_faint"] = "#c59fcf",
-        ["cyan"] = "#5faaef",
-        ["cyan_warmer"] = "#7fafff",
-        ["cyan_cooler"] = "#0db0ff",
-        ["cyan_faint"] = "#8aa0df",
-        ["rust"] = "#e47360",
-        ["gold"] = "#aa9f32",
-        ["olive"] = "#7aad0f",
-        ["slate"] = "#7a94df",
-        ["indigo"] = "#9f95ff",
-        ["maroon"] = "#cf7a7a",
-        ["pink"] = "#af80ea",
-        ["red_intense"] = "#cf8560",
-        ["green_intense"] = "#3faa26",
-        ["yellow_intense"] = "#aa9f32",
-        ["blue_intense"] = "#3f90f0",
-        ["magenta_intense"] = "#b379bf",
-        ["cyan_intense"] = "#5faaef",
-        ["bg_red_intense"] = "#8d7f00",
-        ["bg_green_intense"] = "#afcf20",
-        ["bg_yellow_intense"] = "#5f5f00",
-        ["bg_blue_intense"] = "#266fd0",
-        ["bg_magenta_intense"] = "#6f60c0",
-        ["bg_cyan_intense"] = "#007fae",
-        ["bg_red_subtle"] = "#5d3f00",
-        ["bg_green_subtle"] = "#345f20",
-        ["bg_yellow_subtle"] = "#575700",
-        ["bg_blue_subtle"] = "#264f70",
-        ["bg_magenta_subtle"] = "#4a4670",
-        ["bg_cyan_subtle"] = "#265560",
-        ["bg_red_nuanced"] = "#5d3f00",
-        ["bg_green_nuanced"] = "#345f20",
-        ["bg_yellow_nuanced"] = "#575700",
-        ["bg_blue_nuanced"] = "#264f70",
-        ["bg_magenta_nuanced"] = "#4a4670",
-        ["bg_cyan_nuanced"] = "#265560",
-        ["bg_completion"] = "#343420",
-        ["bg_hl_line"] = "#2e2e1b",
-        ["bg_paren_match"] = "#0f4f9a",
-        ["bg_paren_expression"] = "#4f4f00",
-        ["bg_char_0"] = "#264f70",
-        ["bg_char_1"] = "#4a4670",
-        ["bg_char_2"] = "#575700",
-        ["bg_active"] = "#445165",
-        ["fg_active"] = "#ddddee",
-        ["bg_inactive"] = "#0d1429",
-        ["fg_inactive"] = "#7f8797",
-        ["bg_status_line_active"] = "#003f8f",
-        ["fg_status_line_active"] = "#ffffff",
-        ["bg_status_line_inactive"] = "#121f34",
-        ["fg_status_line_inactive"] = "#7f8797",
-        ["bg_tab_bar"] = "#243145",
-        ["bg_tab_current"] = "#000a1f",
-        ["bg_tab_other"] = "#445165",
-        ["fg_tab_other"] = "#7f8797",
-        ["bg_tab_alternate"] = "#00405f",
-        ["bg_added"] = "#00234f",
-        ["bg_added_faint"] = "#00143f",
-        ["bg_added_refine"] = "#03395f",
-        ["bg_added_fringe"] = "#03395f",
-        ["fg_added"] = "#c4d5ff",
-        ["fg_added_intense"] = "#c4d5ff",
-        ["bg_changed"] = "#2f123f",
-        ["bg_changed_faint"] = "#1f022f",
-        ["bg_changed_refine"] = "#3f224f",
-        ["bg_changed_fringe"] = "#3f224f",
-        ["fg_changed"] = "#e3cfff",
-        ["fg_changed_intense"] = "#e3cfff",
-        ["bg_removed"] = "#323200",
-        ["bg_removed_faint"] = "#281a00",
-        ["bg_removed_refine"] = "#484800",
-        ["bg_removed_fringe"] = "#484800",
-        ["fg_removed"] = "#d4d48f",
-        ["fg_removed_intense"] = "#d4d48f",
-        ["bg_diff_context"] = "#121f34",
-        ["visual"] = "#223848",
-        ["link"] = "#3f90f0",
-        ["link_visited"] = "#bfaf7a",
-        ["link_symbolic"] = "#5faaef",
-        ["string"] = "#3f90f0",
-        ["comment"] = "#af9a6a",
-        ["constant"] = "#009fff",
-        ["identifier"] = "#8aa0df",
-        ["keyword"] = "#cfaf00",
-        ["type"] = "#9f95ff",
-        ["fnname"] = "#bfaf7a",
-        ["variable"] = "#0db0ff",
-        ["rainbow_0"] = "#cfaf00",
-        ["rainbow_1"] = "#3f90f0",
-        ["rainbow_2"] = "#bfaf7a",
-        ["rainbow_3"] = "#6a9fff",
-        ["rainbow_4"] = "#aa9f32",
-        ["rainbow_5"] = "#7fafff",
-        ["rainbow_6"] = "#af9a6a",
-        ["rainbow_7"] = "#7a94df",
-        ["prose_todo"] = "#cfaf00",
-        ["prose_done"] = "#009fff",
-        ["prose_tag"] = "#90afef",
-        ["prose_table"] = "#90afef",
-        ["err"] = "#cfaf00",
-        ["warning"] = "#bfaf7a",
-        ["info"] = "#009fff",
-        ["hint"] = "#8aa0df",
-        ["ok"] = "#3fa672",
-      },
-    },
-    ["ef_duo_light"] = {
-      ["family"] = "ef_duo",
-      ["flavor"] = "light",
-      ["foreground"] = "#222222",
-      ["background"] = "#fff8f0",
-      ["cursor"] = "#1144ff",
-      ["selection_background"] = "#caeafa",
-      ["selection_foreground"] = "#222222",
-      ["ansi"] = {
-        "#fff8f0",
-        "#cc3333",
-        "#217a3c",
-        "#8a5d00",
-        "#375cd8",
-        "#ba35af",
-        "#1f6fbf",
-        "#222222",
-        "#f6ece8",
-        "#dd1100",
-        "#4a7d00",
-        "#9f4a00",
-        "#4250ef",
-        "#cf25aa",
-        "#3f70a0",
-        "#63728f",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#fff8f0",
-        ["bg_dim"] = "#f6ece8",
-        ["bg_alt"] = "#e7e0da",
-        ["fg_main"] = "#222222",
-        ["fg_dim"] = "#63728f",
-        ["fg_alt"] = "#856f4a",
-        ["border"] = "#baafba",
-        ["border_highlight"] = "#856f4a",
-        ["red"] = "#cc3333",
-        ["red_warmer"] = "#dd1100",
-        ["red_cooler"] = "#c04440",
-        ["red_faint"] = "#a2403f",
-        ["green"] = "#217a3c",
-        ["green_warmer"] = "#4a7d00",
-        ["green_cooler"] = "#008058",
-        ["green_faint"] = "#61756c",
-        ["yellow"] = "#8a5d00",
-        ["yellow_warmer"] = "#9f4a00",
-        ["yellow_cooler"] = "#8f5a3a",
-        ["yellow_faint"] = "#765640",
-        ["blue"] = "#375cd8",
-        ["blue_warmer"] = "#4250ef",
-        ["blue_cooler"] = "#065fff",
-        ["blue_faint"] = "#6060d0",
-        ["magenta"] = "#ba35af",
-        ["magenta_warmer"] = "#cf25aa",
-        ["magenta_cooler"] = "#6052cf",
-        ["magenta_faint"] = "#af569f",
-        ["cyan"] = "#1f6fbf",
-        ["cyan_warmer"] = "#3f70a0",
-        ["cyan_cooler"] = "#1f77bb",
-        ["cyan_faint"] = "#406f90",
-        ["rust"] = "#dd1100",
-        ["gold"] = "#8a5d00",
-        ["olive"] = "#4a7d00",
-        ["slate"] = "#6060d0",
-        ["indigo"] = "#6052cf",
-        ["maroon"] = "#c04440",
-        ["pink"] = "#cf25aa",
-        ["red_intense"] = "#cc3333",
-        ["green_intense"] = "#217a3c",
-        ["yellow_intense"] = "#8a5d00",
-        ["blue_intense"] = "#375cd8",
-        ["magenta_intense"] = "#ba35af",
-        ["cyan_intense"] = "#1f6fbf",
-        ["bg_red_intense"] = "#ff8f88",
-        ["bg_green_intense"] = "#8adf80",
-        ["bg_yellow_intense"] = "#fac200",
-        ["bg_blue_intense"] = "#cbcfff",
-        ["bg_magenta_intense"] = "#df8fff",
-        ["bg_cyan_intense"] = "#88c8ff",
-        ["bg_red_subtle"] = "#ffcfbf",
-        ["bg_green_subtle"] = "#aff7c5",
-        ["bg_yellow_subtle"] = "#f9f376",
-        ["bg_blue_subtle"] = "#cfdff9",
-        ["bg_magenta_subtle"] = "#f9ddf0",
-        ["bg_cyan_subtle"] = "#bfeaf0",
-        ["bg_red_nuanced"] = "#ffcfbf",
-        ["bg_green_nuanced"] = "#aff7c5",
-        ["bg_yellow_nuanced"] = "#f9f376",
-        ["bg_blue_nuanced"] = "#cfdff9",
-        ["bg_magenta_nuanced"] = "#f9ddf0",
-        ["bg_cyan_nuanced"] = "#bfeaf0",
-        ["bg_completion"] = "#fadacf",
-        ["bg_hl_line"] = "#f9e8c0",
-        ["bg_paren_match"] = "#afbfef",
-        ["bg_paren_expression"] = "#b4cfff",
-        ["bg_char_0"] = "#cfdff9",
-        ["bg_char_1"] = "#f9ddf0",
-        ["bg_char_2"] = "#f9f376",
-        ["bg_active"] = "#c7c0ba",
-        ["fg_active"] = "#222222",
-        ["bg_inactive"] = "#f9f2ef",
-        ["fg_inactive"] = "#63728f",
-        ["bg_status_line_active"] = "#f8cf8f",
-        ["fg_status_line_active"] = "#111133",
-        ["bg_status_line_inactive"] = "#f6ece8",
-        ["fg_status_line_inactive"] = "#63728f",
-        ["bg_tab_bar"] = "#e7e0da",
-        ["bg_tab_current"] = "#fff8f0",
-        ["bg_tab_other"] = "#c7c0ba",
-        ["fg_tab_other"] = "#63728f",
-        ["bg_tab_alternate"] = "#aaeccf",
-        ["bg_added"] = "#ccefcf",
-        ["bg_added_faint"] = "#e0f3e0",
-        ["bg_added_refine"] = "#bae0c0",
-        ["bg_added_fringe"] = "#bae0c0",
-        ["fg_added"] = "#005000",
-        ["fg_added_intense"] = "#005000",
-        ["bg_changed"] = "#ffe5b9",
-        ["bg_changed_faint"] = "#ffefc5",
-        ["bg_changed_refine"] = "#ffd09f",
-        ["bg_changed_fringe"] = "#ffd09f",
-        ["fg_changed"] = "#553d00",
-        ["fg_changed_intense"] = "#553d00",
-        ["bg_removed"] = "#ffd4d8",
-        ["bg_removed_faint"] = "#ffe3e3",
-        ["bg_removed_refine"] = "#ffc0ca",
-        ["bg_removed_fringe"] = "#ffc0ca",
-        ["fg_removed"] = "#8f1313",
-        ["fg_removed_intense"] = "#8f1313",
-        ["bg_diff_context"] = "#f6ece8",
-        ["visual"] = "#caeafa",
-        ["link"] = "#1f6fbf",
-        ["link_visited"] = "#008058",
-        ["link_symbolic"] = "#1f6fbf",
-        ["string"] = "#9f4a00",
-        ["comment"] = "#a2403f",
-        ["constant"] = "#375cd8",
-        ["identifier"] = "#a2403f",
-        ["keyword"] = "#4250ef",
-        ["type"] = "#065fff",
-        ["fnname"] = "#1f6fbf",
-        ["variable"] = "#6052cf",
-        ["rainbow_0"] = "#375cd8",
-        ["rainbow_1"] = "#9f4a00",
-        ["rainbow_2"] = "#4250ef",
-        ["rainbow_3"] = "#8f5a3a",
-        ["rainbow_4"] = "#6052cf",
-        ["rainbow_5"] = "#4a7d00",
-        ["rainbow_6"] = "#3f70a0",
-        ["rainbow_7"] = "#8a5d00",
-        ["prose_todo"] = "#cc3333",
-        ["prose_done"] = "#217a3c",
-        ["prose_tag"] = "#765640",
-        ["prose_table"] = "#856f4a",
-        ["err"] = "#cc3333",
-        ["warning"] = "#8a5d00",
-        ["info"] = "#217a3c",
-        ["hint"] = "#406f90",
-        ["ok"] = "#008058",
-      },
-    },
-    ["ef_duo_dark"] = {
-      ["family"] = "ef_duo",
-      ["flavor"] = "dark",
-      ["foreground"] = "#d0d0d0",
-      ["background"] = "#070019",
-      ["cursor"] = "#ef6f11",
-      ["selection_background"] = "#042a50",
-      ["selection_foreground"] = "#d0d0d0",
-      ["ansi"] = {
-        "#070019",
-        "#ef656a",
-        "#1fa526",
-        "#c48702",
-        "#379cf6",
-        "#d369af",
-        "#5faaef",
-        "#d0d0d0",
-        "#1d1a26",
-        "#f47360",
-        "#50a22f",
-        "#d0730f",
-        "#6f80ff",
-        "#e580ea",
-        "#7fafff",
-        "#857f8f",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#070019",
-        ["bg_dim"] = "#1d1a26",
-        ["bg_alt"] = "#2a2739",
-        ["fg_main"] = "#d0d0d0",
-        ["fg_dim"] = "#857f8f",
-        ["fg_alt"] = "#89afef",
-        ["border"] = "#545f6f",
-        ["border_highlight"] = "#89afef",
-        ["red"] = "#ef656a",
-        ["red_warmer"] = "#f47360",
-        ["red_cooler"] = "#ef798f",
-        ["red_faint"] = "#d08f72",
-        ["green"] = "#1fa526",
-        ["green_warmer"] = "#50a22f",
-        ["green_cooler"] = "#00b982",
-        ["green_faint"] = "#61a06c",
-        ["yellow"] = "#c48702",
-        ["yellow_warmer"] = "#d0730f",
-        ["yellow_cooler"] = "#df805f",
-        ["yellow_faint"] = "#9f8f6a",
-        ["blue"] = "#379cf6",
-        ["blue_warmer"] = "#6f80ff",
-        ["blue_cooler"] = "#029fff",
-        ["blue_faint"] = "#8a9fdf",
-        ["magenta"] = "#d369af",
-        ["magenta_warmer"] = "#e580ea",
-        ["magenta_cooler"] = "#af85ff",
-        ["magenta_faint"] = "#c57faf",
-        ["cyan"] = "#5faaef",
-        ["cyan_warmer"] = "#7fafff",
-        ["cyan_cooler"] = "#0dafdf",
-        ["cyan_faint"] = "#8aa0df",
-        ["rust"] = "#f47360",
-        ["gold"] = "#c48702",
-        ["olive"] = "#50a22f",
-        ["slate"] = "#8a9fdf",
-        ["indigo"] = "#af85ff",
-        ["maroon"] = "#ef798f",
-        ["pink"] = "#e580ea",
-        ["red_intense"] = "#ef656a",
-        ["green_intense"] = "#1fa526",
-        ["yellow_intense"] = "#c48702",
-        ["blue_intense"] = "#379cf6",
-        ["magenta_intense"] = "#d369af",
-        ["cyan_intense"] = "#5faaef",
-        ["bg_red_intense"] = "#cd2f30",
-        ["bg_green_intense"] = "#407720",
-        ["bg_yellow_intense"] = "#8f5040",
-        ["bg_blue_intense"] = "#4648d0",
-        ["bg_magenta_intense"] = "#b04fcf",
-        ["bg_cyan_intense"] = "#2270be",
-        ["bg_red_subtle"] = "#72002a",
-        ["bg_green_subtle"] = "#00422a",
-        ["bg_yellow_subtle"] = "#603000",
-        ["bg_blue_subtle"] = "#242679",
-        ["bg_magenta_subtle"] = "#501f72",
-        ["bg_cyan_subtle"] = "#004065",
-        ["bg_red_nuanced"] = "#72002a",
-        ["bg_green_nuanced"] = "#00422a",
-        ["bg_yellow_nuanced"] = "#603000",
-        ["bg_blue_nuanced"] = "#242679",
-        ["bg_magenta_nuanced"] = "#501f72",
-        ["bg_cyan_nuanced"] = "#004065",
-        ["bg_completion"] = "#2f1a5f",
-        ["bg_hl_line"] = "#301a4f",
-        ["bg_paren_match"] = "#2f608e",
-        ["bg_paren_expression"] = "#664f4a",
-        ["bg_char_0"] = "#242679",
-        ["bg_char_1"] = "#501f72",
-        ["bg_char_2"] = "#603000",
-        ["bg_active"] = "#4a4759",
-        ["fg_active"] = "#d0d0d0",
-        ["bg_inactive"] = "#13101f",
-        ["fg_inactive"] = "#857f8f",
-        ["bg_status_line_active"] = "#352487",
-        ["fg_status_line_active"] = "#dedeff",
-        ["bg_status_line_inactive"] = "#1d1a26",
-        ["fg_status_line_inactive"] = "#857f8f",
-        ["bg_tab_bar"] = "#2a2739",
-        ["bg_tab_current"] = "#070019",
-        ["bg_tab_other"] = "#4a4759",
-        ["fg_tab_other"] = "#857f8f",
-        ["bg_tab_alternate"] = "#264f4a",
-        ["bg_added"] = "#002d1f",
-        ["bg_added_faint"] = "#001f18",
-        ["bg_added_refine"] = "#003b2f",
-        ["bg_added_fringe"] = "#003b2f",
-        ["fg_added"] = "#a0e0a0",
-        ["fg_added_intense"] = "#a0e0a0",
-        ["bg_changed"] = "#323200",
-        ["bg_changed_faint"] = "#2a2000",
-        ["bg_changed_refine"] = "#444000",
-        ["bg_changed_fringe"] = "#444000",
-        ["fg_changed"] = "#efef80",
-        ["fg_changed_intense"] = "#efef80",
-        ["bg_removed"] = "#3d091f",
-        ["bg_removed_faint"] = "#27040f",
-        ["bg_removed_refine"] = "#5b0f26",
-        ["bg_removed_fringe"] = "#5b0f26",
-        ["fg_removed"] = "#ffbfbf",
-        ["fg_removed_intense"] = "#ffbfbf",
-        ["bg_diff_context"] = "#1d1a26",
-        ["visual"] = "#042a50",
-        ["link"] = "#7fafff",
-        ["link_visited"] = "#00b982",
-        ["link_symbolic"] = "#5faaef",
-        ["string"] = "#df805f",
-        ["comment"] = "#d08f72",
-        ["constant"] = "#379cf6",
-        ["identifier"] = "#d08f72",
-        ["keyword"] = "#6f80ff",
-        ["type"] = "#029fff",
-        ["fnname"] = "#0dafdf",
-        ["variable"] = "#af85ff",
-        ["rainbow_0"] = "#379cf6",
-        ["rainbow_1"] = "#d0730f",
-        ["rainbow_2"] = "#6f80ff",
-        ["rainbow_3"] = "#df805f",
-        ["rainbow_4"] = "#0dafdf",
-        ["rainbow_5"] = "#c48702",
-        ["rainbow_6"] = "#029fff",
-        ["rainbow_7"] = "#ef798f",
-        ["prose_todo"] = "#ef656a",
-        ["prose_done"] = "#1fa526",
-        ["prose_tag"] = "#9f8f6a",
-        ["prose_table"] = "#89afef",
-        ["err"] = "#ef656a",
-        ["warning"] = "#c48702",
-        ["info"] = "#1fa526",
-        ["hint"] = "#8aa0df",
-        ["ok"] = "#00b982",
-      },
-    },
-    ["ef_elea_light"] = {
-      ["family"] = "ef_elea",
-      ["flavor"] = "light",
-      ["foreground"] = "#221321",
-      ["background"] = "#edf5e2",
-      ["cursor"] = "#770080",
-      ["selection_background"] = "#d9d2ef",
-      ["selection_foreground"] = "#221321",
-      ["ansi"] = {
-        "#edf5e2",
-        "#c3303a",
-        "#00601f",
-        "#9a501f",
-        "#375cc6",
-        "#80308f",
-        "#1f70af",
-        "#221321",
-        "#e3e9d6",
-        "#d00000",
-        "#355500",
-        "#b04300",
-        "#444fcf",
-        "#9f356a",
-        "#3f6faf",
-        "#676470",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#edf5e2",
-        ["bg_dim"] = "#e3e9d6",
-        ["bg_alt"] = "#d0d7ca",
-        ["fg_main"] = "#221321",
-        ["fg_dim"] = "#676470",
-        ["fg_alt"] = "#5f5f1f",
-        ["border"] = "#a5aaaf",
-        ["border_highlight"] = "#5f5f1f",
-        ["red"] = "#c3303a",
-        ["red_warmer"] = "#d00000",
-        ["red_cooler"] = "#b02440",
-        ["red_faint"] = "#894852",
-        ["green"] = "#00601f",
-        ["green_warmer"] = "#355500",
-        ["green_cooler"] = "#007047",
-        ["green_faint"] = "#306630",
-        ["yellow"] = "#9a501f",
-        ["yellow_warmer"] = "#b04300",
-        ["yellow_cooler"] = "#88541f",
-        ["yellow_faint"] = "#7f4f4a",
-        ["blue"] = "#375cc6",
-        ["blue_warmer"] = "#444fcf",
-        ["blue_cooler"] = "#162f8f",
-        ["blue_faint"] = "#3a5099",
-        ["magenta"] = "#80308f",
-        ["magenta_warmer"] = "#9f356a",
-        ["magenta_cooler"] = "#5032aa",
-        ["magenta_faint"] = "#6a4a9f",
-        ["cyan"] = "#1f70af",
-        ["cyan_warmer"] = "#3f6faf",
-        ["cyan_cooler"] = "#00677f",
-        ["cyan_faint"] = "#4f677f",
-        ["rust"] = "#d00000",
-        ["gold"] = "#9a501f",
-        ["olive"] = "#355500",
-        ["slate"] = "#3a5099",
-        ["indigo"] = "#5032aa",
-        ["maroon"] = "#b02440",
-        ["pink"] = "#9f356a",
-        ["red_intense"] = "#c3303a",
-        ["green_intense"] = "#00601f",
-        ["yellow_intense"] = "#9a501f",
-        ["blue_intense"] = "#375cc6",
-        ["magenta_intense"] = "#80308f",
-        ["cyan_intense"] = "#1f70af",
-        ["bg_red_intense"] = "#ff8f88",
-        ["bg_green_intense"] = "#a6df80",
-        ["bg_yellow_intense"] = "#efbf00",
-        ["bg_blue_intense"] = "#cfceff",
-        ["bg_magenta_intense"] = "#df9fff",
-        ["bg_cyan_intense"] = "#88cbdc",
-        ["bg_red_subtle"] = "#f0c6bf",
-        ["bg_green_subtle"] = "#c0e8a7",
-        ["bg_yellow_subtle"] = "#e4e48f",
-        ["bg_blue_subtle"] = "#c9d8f3",
-        ["bg_magenta_subtle"] = "#edd2f0",
-        ["bg_cyan_subtle"] = "#b7e4f0",
-        ["bg_red_nuanced"] = "#f0c6bf",
-        ["bg_green_nuanced"] = "#c0e8a7",
-        ["bg_yellow_nuanced"] = "#e4e48f",
-        ["bg_blue_nuanced"] = "#c9d8f3",
-        ["bg_magenta_nuanced"] = "#edd2f0",
-        ["bg_cyan_nuanced"] = "#b7e4f0",
-        ["bg_completion"] = "#c2eaba",
-        ["bg_hl_line"] = "#d0e7c4",
-        ["bg_paren_match"] = "#8ad3a2",
-        ["bg_paren_expression"] = "#dfbac0",
-        ["bg_char_0"] = "#c9d8f3",
-        ["bg_char_1"] = "#edd2f0",
-        ["bg_char_2"] = "#e4e48f",
-        ["bg_active"] = "#b0b7aa",
-        ["fg_active"] = "#221321",
-        ["bg_inactive"] = "#e8eddc",
-        ["fg_inactive"] = "#676470",
-        ["bg_status_line_active"] = "#a5c67f",
-        ["fg_status_line_active"] = "#142810",
-        ["bg_status_line_inactive"] = "#e3e9d6",
-        ["fg_status_line_inactive"] = "#676470",
-        ["bg_tab_bar"] = "#d0d7ca",
-        ["bg_tab_current"] = "#edf5e2",
-        ["bg_tab_other"] = "#b0b7aa",
-        ["fg_tab_other"] = "#676470",
-        ["bg_tab_alternate"] = "#b5dfbf",
-        ["bg_added"] = "#c7e8ba",
-        ["bg_added_faint"] = "#def0cb",
-        ["bg_added_refine"] = "#bed9b0",
-        ["bg_added_fringe"] = "#bed9b0",
-        ["fg_added"] = "#005000",
-        ["fg_added_intense"] = "#005000",
-        ["bg_changed"] = "#f5e8b0",
-        ["bg_changed_faint"] = "#f5f2bf",
-        ["bg_changed_refine"] = "#f0db9a",
-        ["bg_changed_fringe"] = "#f0db9a",
-        ["fg_changed"] = "#553d00",
-        ["fg_changed_intense"] = "#553d00",
-        ["bg_removed"] = "#f2d0c6",
-        ["bg_removed_faint"] = "#f0e0c0",
-        ["bg_removed_refine"] = "#efbfbd",
-        ["bg_removed_fringe"] = "#efbfbd",
-        ["fg_removed"] = "#8f1313",
-        ["fg_removed_intense"] = "#8f1313",
-        ["bg_diff_context"] = "#e3e9d6",
-        ["visual"] = "#d9d2ef",
-        ["link"] = "#00601f",
-        ["link_visited"] = "#80308f",
-        ["link_symbolic"] = "#1f70af",
-        ["string"] = "#007047",
-        ["comment"] = "#7f4f4a",
-        ["constant"] = "#5032aa",
-        ["identifier"] = "#6a4a9f",
-        ["keyword"] = "#894852",
-        ["type"] = "#162f8f",
-        ["fnname"] = "#355500",
-        ["variable"] = "#80308f",
-        ["rainbow_0"] = "#355500",
-        ["rainbow_1"] = "#894852",
-        ["rainbow_2"] = "#306630",
-        ["rainbow_3"] = "#00677f",
-        ["rainbow_4"] = "#5032aa",
-        ["rainbow_5"] = "#9f356a",
-        ["rainbow_6"] = "#00601f",
-        ["rainbow_7"] = "#9a501f",
-        ["prose_todo"] = "#c3303a",
-        ["prose_done"] = "#007047",
-        ["prose_tag"] = "#4f677f",
-        ["prose_table"] = "#5f5f1f",
-        ["err"] = "#d00000",
-        ["warning"] = "#b04300",
-        ["info"] = "#007047",
-        ["hint"] = "#4f677f",
-        ["ok"] = "#007047",
-      },
-    },
-    ["ef_elea_dark"] = {
-      ["family"] = "ef_elea",
-      ["flavor"] = "dark",
-      ["foreground"] = "#eaf2ef",
-      ["background"] = "#222524",
-      ["cursor"] = "#ef7fa8",
-      ["selection_background"] = "#543040",
-      ["selection_foreground"] = "#eaf2ef",
-      ["ansi"] = {
-        "#222524",
-        "#ff656a",
-        "#7fc87f",
-        "#cac85f",
-        "#57aff6",
-        "#f59acf",
-        "#6fcfd2",
-        "#eaf2ef",
-        "#303332",
-        "#ff7a5f",
-        "#7fca5a",
-        "#e0b02f",
-        "#78afff",
-        "#fa90ea",
-        "#7fcfdf",
-        "#969faf",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#222524",
-        ["bg_dim"] = "#303332",
-        ["bg_alt"] = "#3e4140",
-        ["fg_main"] = "#eaf2ef",
-        ["fg_dim"] = "#969faf",
-        ["fg_alt"] = "#8fcfbb",
-        ["border"] = "#5d5f63",
-        ["border_highlight"] = "#8fcfbb",
-        ["red"] = "#ff656a",
-        ["red_warmer"] = "#ff7a5f",
-        ["red_cooler"] = "#fa7f88",
-        ["red_faint"] = "#eba8a8",
-        ["green"] = "#7fc87f",
-        ["green_warmer"] = "#7fca5a",
-        ["green_cooler"] = "#50cf89",
-        ["green_faint"] = "#a9c99f",
-        ["yellow"] = "#cac85f",
-        ["yellow_warmer"] = "#e0b02f",
-        ["yellow_cooler"] = "#cfb27f",
-        ["yellow_faint"] = "#cac89f",
-        ["blue"] = "#57aff6",
-        ["blue_warmer"] = "#78afff",
-        ["blue_cooler"] = "#62cfef",
-        ["blue_faint"] = "#6ab4ef",
-        ["magenta"] = "#f59acf",
-        ["magenta_warmer"] = "#fa90ea",
-        ["magenta_cooler"] = "#cfaaff",
-        ["magenta_faint"] = "#d0b9f0",
-        ["cyan"] = "#6fcfd2",
-        ["cyan_warmer"] = "#7fcfdf",
-        ["cyan_cooler"] = "#60d5c2",
-        ["cyan_faint"] = "#99bfcf",
-        ["rust"] = "#ff7a5f",
-        ["gold"] = "#cac85f",
-        ["olive"] = "#7fca5a",
-        ["slate"] = "#6ab4ef",
-        ["indigo"] = "#cfaaff",
-        ["maroon"] = "#fa7f88",
-        ["pink"] = "#fa90ea",
-        ["red_intense"] = "#ff656a",
-        ["green_intense"] = "#7fc87f",
-        ["yellow_intense"] = "#cac85f",
-        ["blue_intense"] = "#57aff6",
-        ["magenta_intense"] = "#f59acf",
-        ["cyan_intense"] = "#6fcfd2",
-        ["bg_red_intense"] = "#bd1f30",
-        ["bg_green_intense"] = "#408420",
-        ["bg_yellow_intense"] = "#847020",
-        ["bg_blue_intense"] = "#2f5f9f",
-        ["bg_magenta_intense"] = "#b05fcf",
-        ["bg_cyan_intense"] = "#028099",
-        ["bg_red_subtle"] = "#6c2a2a",
-        ["bg_green_subtle"] = "#2f532a",
-        ["bg_yellow_subtle"] = "#62432a",
-        ["bg_blue_subtle"] = "#26486c",
-        ["bg_magenta_subtle"] = "#59335b",
-        ["bg_cyan_subtle"] = "#204c60",
-        ["bg_red_nuanced"] = "#6c2a2a",
-        ["bg_green_nuanced"] = "#2f532a",
-        ["bg_yellow_nuanced"] = "#62432a",
-        ["bg_blue_nuanced"] = "#26486c",
-        ["bg_magenta_nuanced"] = "#59335b",
-        ["bg_cyan_nuanced"] = "#204c60",
-        ["bg_completion"] = "#37493f",
-        ["bg_hl_line"] = "#2f413f",
-        ["bg_paren_match"] = "#3f6f5f",
-        ["bg_paren_expression"] = "#894f7a",
-        ["bg_char_0"] = "#26486c",
-        ["bg_char_1"] = "#59335b",
-        ["bg_char_2"] = "#62432a",
-        ["bg_active"] = "#5e6160",
-        ["fg_active"] = "#eaf2ef",
-        ["bg_inactive"] = "#2b2e2d",
-        ["fg_inactive"] = "#969faf",
-        ["bg_status_line_active"] = "#35605d",
-        ["fg_status_line_active"] = "#ecf0ff",
-        ["bg_status_line_inactive"] = "#303332",
-        ["fg_status_line_inactive"] = "#969faf",
-        ["bg_tab_bar"] = "#3e4140",
-        ["bg_tab_current"] = "#222524",
-        ["bg_tab_other"] = "#5e6160",
-        ["fg_tab_other"] = "#969faf",
-        ["bg_tab_alternate"] = "#425d4a",
-        ["bg_added"] = "#20493f",
-        ["bg_added_faint"] = "#203a2f",
-        ["bg_added_refine"] = "#136244",
-        ["bg_added_fringe"] = "#136244",
-        ["fg_added"] = "#a0e0a0",
-        ["fg_added_intense"] = "#a0e0a0",
-        ["bg_changed"] = "#51512f",
-        ["bg_changed_faint"] = "#40332f",
-        ["bg_changed_refine"] = "#61621f",
-        ["bg_changed_fringe"] = "#61621f",
-        ["fg_changed"] = "#dada90",
-        ["fg_changed_intense"] = "#dada90",
-        ["bg_removed"] = "#5e242f",
-        ["bg_removed_faint"] = "#4a242a",
-        ["bg_removed_refine"] = "#772a35",
-        ["bg_removed_fringe"] = "#772a35",
-        ["fg_removed"] = "#ffbfbf",
-        ["fg_removed_intense"] = "#ffbfbf",
-        ["bg_diff_context"] = "#303332",
-        ["visual"] = "#543040",
-        ["link"] = "#7fca5a",
-        ["link_visited"] = "#f59acf",
-        ["link_symbolic"] = "#6fcfd2",
-        ["string"] = "#50cf89",
-        ["comment"] = "#cac89f",
-        ["constant"] = "#cfaaff",
-        ["identifier"] = "#d0b9f0",
-        ["keyword"] = "#eba8a8",
-        ["type"] = "#6fcfd2",
-        ["fnname"] = "#7fca5a",
-        ["variable"] = "#f59acf",
-        ["rainbow_0"] = "#7fca5a",
-        ["rainbow_1"] = "#eba8a8",
-        ["rainbow_2"] = "#a9c99f",
-        ["rainbow_3"] = "#60d5c2",
-        ["rainbow_4"] = "#cfaaff",
-        ["rainbow_5"] = "#f59acf",
-        ["rainbow_6"] = "#7fc87f",
-        ["rainbow_7"] = "#cfb27f",
-        ["prose_todo"] = "#ff7a5f",
-        ["prose_done"] = "#7fca5a",
-        ["prose_tag"] = "#99bfcf",
-        ["prose_table"] = "#8fcfbb",
-        ["err"] = "#ff7a5f",
-        ["warning"] = "#e0b02f",
-        ["info"] = "#50cf89",
-        ["hint"] = "#99bfcf",
-        ["ok"] = "#50cf89",
-      },
-    },
-    ["ef_light"] = {
-      ["family"] = "ef_lightdark",
-      ["flavor"] = "light",
-      ["foreground"] = "#202020",
-      ["background"] = "#ffffff",
-      ["cursor"] = "#0033cc",
-      ["selection_background"] = "#bfefff",
-      ["selection_foreground"] = "#202020",
-      ["ansi"] = {
-        "#ffffff",
-        "#d3303a",
-        "#217a3c",
-        "#a45f22",
-        "#3740cf",
-        "#ba35af",
-        "#1f6fbf",
-        "#202020",
-        "#efefef",
-        "#e00033",
-        "#4a7d00",
-        "#b6532f",
-        "#4250ef",
-        "#cf25aa",
-        "#3f6faf",
-        "#68759f",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#ffffff",
-        ["bg_dim"] = "#efefef",
-        ["bg_alt"] = "#dbdbdb",
-        ["fg_main"] = "#202020",
-        ["fg_dim"] = "#68759f",
-        ["fg_alt"] = "#397a70",
-        ["border"] = "#bfc4da",
-        ["border_highlight"] = "#397a70",
-        ["red"] = "#d3303a",
-        ["red_warmer"] = "#e00033",
-        ["red_cooler"] = "#d51272",
-        ["red_faint"] = "#c24552",
-        ["green"] = "#217a3c",
-        ["green_warmer"] = "#4a7d00",
-        ["green_cooler"] = "#008858",
-        ["green_faint"] = "#61756c",
-        ["yellow"] = "#a45f22",
-        ["yellow_warmer"] = "#b6532f",
-        ["yellow_cooler"] = "#b65050",
-        ["yellow_faint"] = "#a65f6a",
-        ["blue"] = "#3740cf",
-        ["blue_warmer"] = "#4250ef",
-        ["blue_cooler"] = "#065fff",
-        ["blue_faint"] = "#4f54aa",
-        ["magenta"] = "#ba35af",
-        ["magenta_warmer"] = "#cf25aa",
-        ["magenta_cooler"] = "#6052cf",
-        ["magenta_faint"] = "#af5a80",
-        ["cyan"] = "#1f6fbf",
-        ["cyan_warmer"] = "#3f6faf",
-        ["cyan_cooler"] = "#1f77bb",
-        ["cyan_faint"] = "#506fa0",
-        ["rust"] = "#e00033",
-        ["gold"] = "#a45f22",
-        ["olive"] = "#4a7d00",
-        ["slate"] = "#4f54aa",
-        ["indigo"] = "#6052cf",
-        ["maroon"] = "#d51272",
-        ["pink"] = "#cf25aa",
-        ["red_intense"] = "#d3303a",
-        ["green_intense"] = "#217a3c",
-        ["yellow_intense"] = "#a45f22",
-        ["blue_intense"] = "#3740cf",
-        ["magenta_intense"] = "#ba35af",
-        ["cyan_intense"] = "#1f6fbf",
-        ["bg_red_intense"] = "#ff8f88",
-        ["bg_green_intense"] = "#9adf90",
-        ["bg_yellow_intense"] = "#fac200",
-        ["bg_blue_intense"] = "#cbcfff",
-        ["bg_magenta_intense"] = "#df8fff",
-        ["bg_cyan_intense"] = "#88c8ff",
-        ["bg_red_subtle"] = "#ffcfbf",
-        ["bg_green_subtle"] = "#b3fabf",
-        ["bg_yellow_subtle"] = "#fff576",
-        ["bg_blue_subtle"] = "#ccdfff",
-        ["bg_magenta_subtle"] = "#ffddff",
-        ["bg_cyan_subtle"] = "#bfefff",
-        ["bg_red_nuanced"] = "#ffcfbf",
-        ["bg_green_nuanced"] = "#b3fabf",
-        ["bg_yellow_nuanced"] = "#fff576",
-        ["bg_blue_nuanced"] = "#ccdfff",
-        ["bg_magenta_nuanced"] = "#ffddff",
-        ["bg_cyan_nuanced"] = "#bfefff",
-        ["bg_completion"] = "#bfe8ff",
-        ["bg_hl_line"] = "#e4efd8",
-        ["bg_paren_match"] = "#dfa0f3",
-        ["bg_paren_expression"] = "#aaeccf",
-        ["bg_char_0"] = "#ccdfff",
-        ["bg_char_1"] = "#ffddff",
-        ["bg_char_2"] = "#fff576",
-        ["bg_active"] = "#b3b3b3",
-        ["fg_active"] = "#202020",
-        ["bg_inactive"] = "#f9f9f9",
-        ["fg_inactive"] = "#68759f",
-        ["bg_status_line_active"] = "#b7c7ff",
-        ["fg_status_line_active"] = "#151515",
-        ["bg_status_line_inactive"] = "#efefef",
-        ["fg_status_line_inactive"] = "#68759f",
-        ["bg_tab_bar"] = "#dbdbdb",
-        ["bg_tab_current"] = "#ffffff",
-        ["bg_tab_other"] = "#b3b3b3",
-        ["fg_tab_other"] = "#68759f",
-        ["bg_tab_alternate"] = "#ccbfff",
-        ["bg_added"] = "#d0f0d0",
-        ["bg_added_faint"] = "#e5ffe5",
-        ["bg_added_refine"] = "#b2e8be",
-        ["bg_added_fringe"] = "#b2e8be",
-        ["fg_added"] = "#005000",
-        ["fg_added_intense"] = "#005000",
-        ["bg_changed"] = "#f4e8bd",
-        ["bg_changed_faint"] = "#f9efcb",
-        ["bg_changed_refine"] = "#efd299",
-        ["bg_changed_fringe"] = "#efd299",
-        ["fg_changed"] = "#553d00",
-        ["fg_changed_intense"] = "#553d00",
-        ["bg_removed"] = "#ffd8d5",
-        ["bg_removed_faint"] = "#ffe9e9",
-        ["bg_removed_refine"] = "#f3b5af",
-        ["bg_removed_fringe"] = "#f3b5af",
-        ["fg_removed"] = "#8f1313",
-        ["fg_removed_intense"] = "#8f1313",
-        ["bg_diff_context"] = "#efefef",
-        ["visual"] = "#bfefff",
-        ["link"] = "#4250ef",
-        ["link_visited"] = "#ba35af",
-        ["link_symbolic"] = "#1f6fbf",
-        ["string"] = "#4250ef",
-        ["comment"] = "#a65f6a",
-        ["constant"] = "#065fff",
-        ["identifier"] = "#af5a80",
-        ["keyword"] = "#6052cf",
-        ["type"] = "#008858",
-        ["fnname"] = "#cf25aa",
-        ["variable"] = "#1f77bb",
-        ["rainbow_0"] = "#008858",
-        ["rainbow_1"] = "#4f54aa",
-        ["rainbow_2"] = "#ba35af",
-        ["rainbow_3"] = "#1f77bb",
-        ["rainbow_4"] = "#b65050",
-        ["rainbow_5"] = "#6052cf",
-        ["rainbow_6"] = "#d51272",
-        ["rainbow_7"] = "#008858",
-        ["prose_todo"] = "#e00033",
-        ["prose_done"] = "#217a3c",
-        ["prose_tag"] = "#61756c",
-        ["prose_table"] = "#397a70",
-        ["err"] = "#e00033",
-        ["warning"] = "#b6532f",
-        ["info"] = "#217a3c",
-        ["hint"] = "#506fa0",
-        ["ok"] = "#008858",
-      },
-    },
-    ["ef_dark"] = {
-      ["family"] = "ef_lightdark",
-      ["flavor"] = "dark",
-      ["foreground"] = "#d0d0d0",
-      ["background"] = "#000000",
-      ["cursor"] = "#ff76ff",
-      ["selection_background"] = "#2a234a",
-      ["selection_foreground"] = "#d0d0d0",
-      ["ansi"] = {
-        "#000000",
-        "#ef6560",
-        "#0faa26",
-        "#bf9032",
-        "#3f95f6",
-        "#d369af",
-        "#4fbaef",
-        "#d0d0d0",
-        "#1a1a1a",
-        "#f47360",
-        "#6aad0f",
-        "#d1843f",
-        "#6a9fff",
-        "#e580ea",
-        "#6fafff",
-        "#857f8f",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#000000",
-        ["bg_dim"] = "#1a1a1a",
-        ["bg_alt"] = "#2b2b2b",
-        ["fg_main"] = "#d0d0d0",
-        ["fg_dim"] = "#857f8f",
-        ["fg_alt"] = "#89afef",
-        ["border"] = "#4f4f5f",
-        ["border_highlight"] = "#89afef",
-        ["red"] = "#ef6560",
-        ["red_warmer"] = "#f47360",
-        ["red_cooler"] = "#ff5a7a",
-        ["red_faint"] = "#d56f72",
-        ["green"] = "#0faa26",
-        ["green_warmer"] = "#6aad0f",
-        ["green_cooler"] = "#00a692",
-        ["green_faint"] = "#61a06c",
-        ["yellow"] = "#bf9032",
-        ["yellow_warmer"] = "#d1843f",
-        ["yellow_cooler"] = "#df8a5a",
-        ["yellow_faint"] = "#cf9f8f",
-        ["blue"] = "#3f95f6",
-        ["blue_warmer"] = "#6a9fff",
-        ["blue_cooler"] = "#029fff",
-        ["blue_faint"] = "#7a94df",
-        ["magenta"] = "#d369af",
-        ["magenta_warmer"] = "#e580ea",
-        ["magenta_cooler"] = "#af85ff",
-        ["magenta_faint"] = "#c58faf",
-        ["cyan"] = "#4fbaef",
-        ["cyan_warmer"] = "#6fafff",
-        ["cyan_cooler"] = "#1dbfcf",
-        ["cyan_faint"] = "#8aa0df",
-        ["rust"] = "#f47360",
-        ["gold"] = "#bf9032",
-        ["olive"] = "#6aad0f",
-        ["slate"] = "#7a94df",
-        ["indigo"] = "#af85ff",
-        ["maroon"] = "#ff5a7a",
-        ["pink"] = "#e580ea",
-        ["red_intense"] = "#ef6560",
-        ["green_intense"] = "#0faa26",
-        ["yellow_intense"] = "#bf9032",
-        ["blue_intense"] = "#3f95f6",
-        ["magenta_intense"] = "#d369af",
-        ["cyan_intense"] = "#4fbaef",
-        ["bg_red_intense"] = "#b02930",
-        ["bg_green_intense"] = "#337133",
-        ["bg_yellow_intense"] = "#8f5040",
-        ["bg_blue_intense"] = "#4648d0",
-        ["bg_magenta_intense"] = "#804fdd",
-        ["bg_cyan_intense"] = "#2270cf",
-        ["bg_red_subtle"] = "#72002a",
-        ["bg_green_subtle"] = "#00422a",
-        ["bg_yellow_subtle"] = "#603000",
-        ["bg_blue_subtle"] = "#2f2f74",
-        ["bg_magenta_subtle"] = "#572060",
-        ["bg_cyan_subtle"] = "#004065",
-        ["bg_red_nuanced"] = "#72002a",
-        ["bg_green_nuanced"] = "#00422a",
-        ["bg_yellow_nuanced"] = "#603000",
-        ["bg_blue_nuanced"] = "#2f2f74",
-        ["bg_magenta_nuanced"] = "#572060",
-        ["bg_cyan_nuanced"] = "#004065",
-        ["bg_completion"] = "#0f2d4a",
-        ["bg_hl_line"] = "#002435",
-        ["bg_paren_match"] = "#20577a",
-        ["bg_paren_expression"] = "#004a5f",
-        ["bg_char_0"] = "#2f2f74",
-        ["bg_char_1"] = "#572060",
-        ["bg_char_2"] = "#603000",
-        ["bg_active"] = "#4b4b4b",
-        ["fg_active"] = "#d0d0d0",
-        ["bg_inactive"] = "#121212",
-        ["fg_inactive"] = "#857f8f",
-        ["bg_status_line_active"] = "#2a2a75",
-        ["fg_status_line_active"] = "#e0e0ff",
-        ["bg_status_line_inactive"] = "#1a1a1a",
-        ["fg_status_line_inactive"] = "#857f8f",
-        ["bg_tab_bar"] = "#2b2b2b",
-        ["bg_tab_current"] = "#000000",
-        ["bg_tab_other"] = "#4b4b4b",
-        ["fg_tab_other"] = "#857f8f",
-        ["bg_tab_alternate"] = "#551f5a",
-        ["bg_added"] = "#00381f",
-        ["bg_added_faint"] = "#002910",
-        ["bg_added_refine"] = "#034f2f",
-        ["bg_added_fringe"] = "#034f2f",
-        ["fg_added"] = "#a0e0a0",
-        ["fg_added_intense"] = "#a0e0a0",
-        ["bg_changed"] = "#363300",
-        ["bg_changed_faint"] = "#2a1f00",
-        ["bg_changed_refine"] = "#4a4a00",
-        ["bg_changed_fringe"] = "#4a4a00",
-        ["fg_changed"] = "#efef80",
-        ["fg_changed_intense"] = "#efef80",
-        ["bg_removed"] = "#4f1119",
-        ["bg_removed_faint"] = "#380a0f",
-        ["bg_removed_refine"] = "#781a1f",
-        ["bg_removed_fringe"] = "#781a1f",
-        ["fg_removed"] = "#ffbfbf",
-        ["fg_removed_intense"] = "#ffbfbf",
-        ["bg_diff_context"] = "#1a1a1a",
-        ["visual"] = "#2a234a",
-        ["link"] = "#4fbaef",
-        ["link_visited"] = "#d369af",
-        ["link_symbolic"] = "#4fbaef",
-        ["string"] = "#6a9fff",
-        ["comment"] = "#cf9f8f",
-        ["constant"] = "#029fff",
-        ["identifier"] = "#c58faf",
-        ["keyword"] = "#af85ff",
-        ["type"] = "#00a692",
-        ["fnname"] = "#e580ea",
-        ["variable"] = "#1dbfcf",
-        ["rainbow_0"] = "#00a692",
-        ["rainbow_1"] = "#3f95f6",
-        ["rainbow_2"] = "#e580ea",
-        ["rainbow_3"] = "#1dbfcf",
-        ["rainbow_4"] = "#df8a5a",
-        ["rainbow_5"] = "#af85ff",
-        ["rainbow_6"] = "#ff5a7a",
-        ["rainbow_7"] = "#6aad0f",
-        ["prose_todo"] = "#f47360",
-        ["prose_done"] = "#0faa26",
-        ["prose_tag"] = "#cf9f8f",
-        ["prose_table"] = "#89afef",
-        ["err"] = "#f47360",
-        ["warning"] = "#bf9032",
-        ["info"] = "#0faa26",
-        ["hint"] = "#8aa0df",
-        ["ok"] = "#00a692",
-      },
-    },
-    ["ef_maris_light"] = {
-      ["family"] = "ef_maris",
-      ["flavor"] = "light",
-      ["foreground"] = "#151a27",
-      ["background"] = "#edf4f8",
-      ["cursor"] = "#036f99",
-      ["selection_background"] = "#c8dcff",
-      ["selection_foreground"] = "#151a27",
-      ["ansi"] = {
-        "#edf4f8",
-        "#c3303a",
-        "#007010",
-        "#805a1f",
-        "#375cc6",
-        "#80308f",
-        "#1f66af",
-        "#151a27",
-        "#e0e7ef",
-        "#d00000",
-        "#3a6f00",
-        "#8b4400",
-        "#444fcf",
-        "#9a3a6a",
-        "#305675",
-        "#676470",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#edf4f8",
-        ["bg_dim"] = "#e0e7ef",
-        ["bg_alt"] = "#cfd8e3",
-        ["fg_main"] = "#151a27",
-        ["fg_dim"] = "#676470",
-        ["fg_alt"] = "#3f4f99",
-        ["border"] = "#a2a6af",
-        ["border_highlight"] = "#3f4f99",
-        ["red"] = "#c3303a",
-        ["red_warmer"] = "#d00000",
-        ["red_cooler"] = "#b02440",
-        ["red_faint"] = "#8b4052",
-        ["green"] = "#007010",
-        ["green_warmer"] = "#3a6f00",
-        ["green_cooler"] = "#007047",
-        ["green_faint"] = "#4a763f",
-        ["yellow"] = "#805a1f",
-        ["yellow_warmer"] = "#8b4400",
-        ["yellow_cooler"] = "#78542f",
-        ["yellow_faint"] = "#7f4f4a",
-        ["blue"] = "#375cc6",
-        ["blue_warmer"] = "#444fcf",
-        ["blue_cooler"] = "#003faf",
-        ["blue_faint"] = "#3a5099",
-        ["magenta"] = "#80308f",
-        ["magenta_warmer"] = "#9a3a6a",
-        ["magenta_cooler"] = "#5f2fba",
-        ["magenta_faint"] = "#6a4a9f",
-        ["cyan"] = "#1f66af",
-        ["cyan_warmer"] = "#305675",
-        ["cyan_cooler"] = "#006f70",
-        ["cyan_faint"] = "#3f627f",
-        ["rust"] = "#d00000",
-        ["gold"] = "#805a1f",
-        ["olive"] = "#3a6f00",
-        ["slate"] = "#3a5099",
-        ["indigo"] = "#5f2fba",
-        ["maroon"] = "#b02440",
-        ["pink"] = "#9a3a6a",
-        ["red_intense"] = "#c3303a",
-        ["green_intense"] = "#007010",
-        ["yellow_intense"] = "#805a1f",
-        ["blue_intense"] = "#375cc6",
-        ["magenta_intense"] = "#80308f",
-        ["cyan_intense"] = "#1f66af",
-        ["bg_red_intense"] = "#ff8f88",
-        ["bg_green_intense"] = "#96df80",
-        ["bg_yellow_intense"] = "#efbf00",
-        ["bg_blue_intense"] = "#cfceff",
-        ["bg_magenta_intense"] = "#df9fff",
-        ["bg_cyan_intense"] = "#88cfd0",
-        ["bg_red_subtle"] = "#f0c6cf",
-        ["bg_green_subtle"] = "#b0ebca",
-        ["bg_yellow_subtle"] = "#e4e498",
-        ["bg_blue_subtle"] = "#ccd5f7",
-        ["bg_magenta_subtle"] = "#edd3f2",
-        ["bg_cyan_subtle"] = "#b2e6f0",
-        ["bg_red_nuanced"] = "#f0c6cf",
-        ["bg_green_nuanced"] = "#b0ebca",
-        ["bg_yellow_nuanced"] = "#e4e498",
-        ["bg_blue_nuanced"] = "#ccd5f7",
-        ["bg_magenta_nuanced"] = "#edd3f2",
-        ["bg_cyan_nuanced"] = "#b2e6f0",
-        ["bg_completion"] = "#cddbfa",
-        ["bg_hl_line"] = "#dae5f0",
-        ["bg_paren_match"] = "#cab3b2",
-        ["bg_paren_expression"] = "#d2b4cf",
-        ["bg_char_0"] = "#ccd5f7",
-        ["bg_char_1"] = "#edd3f2",
-        ["bg_char_2"] = "#e4e498",
-        ["bg_active"] = "#afb8c3",
-        ["fg_active"] = "#151a27",
-        ["bg_inactive"] = "#e6ecf2",
-        ["fg_inactive"] = "#676470",
-        ["bg_status_line_active"] = "#a0c2ef",
-        ["fg_status_line_active"] = "#142810",
-        ["bg_status_line_inactive"] = "#e0e7ef",
-        ["fg_status_line_inactive"] = "#676470",
-        ["bg_tab_bar"] = "#cfd8e3",
-        ["bg_tab_current"] = "#edf4f8",
-        ["bg_tab_other"] = "#afb8c3",
-        ["fg_tab_other"] = "#676470",
-        ["bg_tab_alternate"] = "#b7bbea",
-        ["bg_added"] = "#b0e8ca",
-        ["bg_added_faint"] = "#c5f0e0",
-        ["bg_added_refine"] = "#a0d4b9",
-        ["bg_added_fringe"] = "#a0d4b9",
-        ["fg_added"] = "#005000",
-        ["fg_added_intense"] = "#005000",
-        ["bg_changed"] = "#f5e8b0",
-        ["bg_changed_faint"] = "#f5f2bf",
-        ["bg_changed_refine"] = "#f0db9a",
-        ["bg_changed_fringe"] = "#f0db9a",
-        ["fg_changed"] = "#553d00",
-        ["fg_changed_intense"] = "#553d00",
-        ["bg_removed"] = "#f5c7d6",
-        ["bg_removed_faint"] = "#f0d6d6",
-        ["bg_removed_refine"] = "#efb1cd",
-        ["bg_removed_fringe"] = "#efb1cd",
-        ["fg_removed"] = "#8f1313",
-        ["fg_removed_intense"] = "#8f1313",
-        ["bg_diff_context"] = "#e0e7ef",
-        ["visual"] = "#c8dcff",
-        ["link"] = "#375cc6",
-        ["link_visited"] = "#5f2fba",
-        ["link_symbolic"] = "#1f66af",
-        ["string"] = "#006f70",
-        ["comment"] = "#8b4052",
-        ["constant"] = "#003faf",
-        ["identifier"] = "#6a4a9f",
-        ["keyword"] = "#444fcf",
-        ["type"] = "#007010",
-        ["fnname"] = "#3a6f00",
-        ["variable"] = "#1f66af",
-        ["rainbow_0"] = "#007047",
-        ["rainbow_1"] = "#444fcf",
-        ["rainbow_2"] = "#3a6f00",
-        ["rainbow_3"] = "#1f66af",
-        ["rainbow_4"] = "#5f2fba",
-        ["rainbow_5"] = "#003faf",
-        ["rainbow_6"] = "#80308f",
-        ["rainbow_7"] = "#006f70",
-        ["prose_todo"] = "#b02440",
-        ["prose_done"] = "#007047",
-        ["prose_tag"] = "#3f627f",
-        ["prose_table"] = "#3f4f99",
-        ["err"] = "#d00000",
-        ["warning"] = "#8b4400",
-        ["info"] = "#007047",
-        ["hint"] = "#3f627f",
-        ["ok"] = "#007047",
-      },
-    },
-    ["ef_maris_dark"] = {
-      ["family"] = "ef_maris",
-      ["flavor"] = "dark",
-      ["foreground"] = "#eaedef",
-      ["background"] = "#131c2b",
-      ["cursor"] = "#8fdfff",
-      ["selection_background"] = "#183c65",
-      ["selection_foreground"] = "#eaedef",
-      ["ansi"] = {
-        "#131c2b",
-        "#ff6f6f",
-        "#41bf4f",
-        "#d0d24f",
-        "#57b0ff",
-        "#f59acf",
-        "#2fd0db",
-        "#eaedef",
-        "#1d2c39",
-        "#ff7a5f",
-        "#7fce5f",
-        "#f0c060",
-        "#70a0ff",
-        "#fa90ea",
-        "#7fcfdf",
-        "#969faf",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#131c2b",
-        ["bg_dim"] = "#1d2c39",
-        ["bg_alt"] = "#2a3644",
-        ["fg_main"] = "#eaedef",
-        ["fg_dim"] = "#969faf",
-        ["fg_alt"] = "#90a0dc",
-        ["border"] = "#595a63",
-        ["border_highlight"] = "#90a0dc",
-        ["red"] = "#ff6f6f",
-        ["red_warmer"] = "#ff7a5f",
-        ["red_cooler"] = "#ff7788",
-        ["red_faint"] = "#eaa4a4",
-        ["green"] = "#41bf4f",
-        ["green_warmer"] = "#7fce5f",
-        ["green_cooler"] = "#30c489",
-        ["green_faint"] = "#a9c99f",
-        ["yellow"] = "#d0d24f",
-        ["yellow_warmer"] = "#f0c060",
-        ["yellow_cooler"] = "#cab27f",
-        ["yellow_faint"] = "#cac89f",
-        ["blue"] = "#57b0ff",
-        ["blue_warmer"] = "#70a0ff",
-        ["blue_cooler"] = "#12b4ff",
-        ["blue_faint"] = "#9acfff",
-        ["magenta"] = "#f59acf",
-        ["magenta_warmer"] = "#fa90ea",
-        ["magenta_cooler"] = "#cf90ff",
-        ["magenta_faint"] = "#d4aaf0",
-        ["cyan"] = "#2fd0db",
-        ["cyan_warmer"] = "#7fcfdf",
-        ["cyan_cooler"] = "#65d5a8",
-        ["cyan_faint"] = "#99bfcf",
-        ["rust"] = "#ff7a5f",
-        ["gold"] = "#d0d24f",
-        ["olive"] = "#7fce5f",
-        ["slate"] = "#9acfff",
-        ["indigo"] = "#cf90ff",
-        ["maroon"] = "#ff7788",
-        ["pink"] = "#fa90ea",
-        ["red_intense"] = "#ff6f6f",
-        ["green_intense"] = "#41bf4f",
-        ["yellow_intense"] = "#d0d24f",
-        ["blue_intense"] = "#57b0ff",
-        ["magenta_intense"] = "#f59acf",
-        ["cyan_intense"] = "#2fd0db",
-        ["bg_red_intense"] = "#bd1f30",
-        ["bg_green_intense"] = "#107840",
-        ["bg_yellow_intense"] = "#847020",
-        ["bg_blue_intense"] = "#2f5f9f",
-        ["bg_magenta_intense"] = "#b05fcf",
-        ["bg_cyan_intense"] = "#0280b9",
-        ["bg_red_subtle"] = "#6f293a",
-        ["bg_green_subtle"] = "#1f523a",
-        ["bg_yellow_subtle"] = "#604233",
-        ["bg_blue_subtle"] = "#284477",
-        ["bg_magenta_subtle"] = "#52336b",
-        ["bg_cyan_subtle"] = "#204c68",
-        ["bg_red_nuanced"] = "#6f293a",
-        ["bg_green_nuanced"] = "#1f523a",
-        ["bg_yellow_nuanced"] = "#604233",
-        ["bg_blue_nuanced"] = "#284477",
-        ["bg_magenta_nuanced"] = "#52336b",
-        ["bg_cyan_nuanced"] = "#204c68",
-        ["bg_completion"] = "#204358",
-        ["bg_hl_line"] = "#243242",
-        ["bg_paren_match"] = "#6c5d54",
-        ["bg_paren_expression"] = "#684d54",
-        ["bg_char_0"] = "#284477",
-        ["bg_char_1"] = "#52336b",
-        ["bg_char_2"] = "#604233",
-        ["bg_active"] = "#4a5664",
-        ["fg_active"] = "#eaedef",
-        ["bg_inactive"] = "#1a2331",
-        ["fg_inactive"] = "#969faf",
-        ["bg_status_line_active"] = "#2f527b",
-        ["fg_status_line_active"] = "#ecf0ff",
-        ["bg_status_line_inactive"] = "#1d2c39",
-        ["fg_status_line_inactive"] = "#969faf",
-        ["bg_tab_bar"] = "#2a3644",
-        ["bg_tab_current"] = "#131c2b",
-        ["bg_tab_other"] = "#4a5664",
-        ["fg_tab_other"] = "#969faf",
-        ["bg_tab_alternate"] = "#49516a",
-        ["bg_added"] = "#20493f",
-        ["bg_added_faint"] = "#163530",
-        ["bg_added_refine"] = "#136244",
-        ["bg_added_fringe"] = "#136244",
-        ["fg_added"] = "#a0e0a0",
-        ["fg_added_intense"] = "#a0e0a0",
-        ["bg_changed"] = "#51512f",
-        ["bg_changed_faint"] = "#40332f",
-        ["bg_changed_refine"] = "#61621f",
-        ["bg_changed_fringe"] = "#61621f",
-        ["fg_changed"] = "#dada90",
-        ["fg_changed_intense"] = "#dada90",
-        ["bg_removed"] = "#5e242f",
-        ["bg_removed_faint"] = "#4a202d",
-        ["bg_removed_refine"] = "#772a35",
-        ["bg_removed_fringe"] = "#772a35",
-        ["fg_removed"] = "#ffbfbf",
-        ["fg_removed_intense"] = "#ffbfbf",
-        ["bg_diff_context"] = "#1d2c39",
-        ["visual"] = "#183c65",
-        ["link"] = "#57b0ff",
-        ["link_visited"] = "#cf90ff",
-        ["link_symbolic"] = "#2fd0db",
-        ["string"] = "#65d5a8",
-        ["comment"] = "#eaa4a4",
-        ["constant"] = "#12b4ff",
-        ["identifier"] = "#d4aaf0",
-        ["keyword"] = "#70a0ff",
-        ["type"] = "#41bf4f",
-        ["fnname"] = "#7fce5f",
-        ["variable"] = "#2fd0db",
-        ["rainbow_0"] = "#30c489",
-        ["rainbow_1"] = "#70a0ff",
-        ["rainbow_2"] = "#7fce5f",
-        ["rainbow_3"] = "#2fd0db",
-        ["rainbow_4"] = "#cf90ff",
-        ["rainbow_5"] = "#12b4ff",
-        ["rainbow_6"] = "#f59acf",
-        ["rainbow_7"] = "#65d5a8",
-        ["prose_todo"] = "#ff7788",
-        ["prose_done"] = "#30c489",
-        ["prose_tag"] = "#99bfcf",
-        ["prose_table"] = "#90a0dc",
-        ["err"] = "#ff7a5f",
-        ["warning"] = "#f0c060",
-        ["info"] = "#30c489",
-        ["hint"] = "#99bfcf",
-        ["ok"] = "#30c489",
-      },
-    },
-    ["ef_melissa_light"] = {
-      ["family"] = "ef_melissa",
-      ["flavor"] = "light",
-      ["foreground"] = "#484431",
-      ["background"] = "#fff6d8",
-      ["cursor"] = "#a07f00",
-      ["selection_background"] = "#f0d4d8",
-      ["selection_foreground"] = "#484431",
-      ["ansi"] = {
-        "#fff6d8",
-        "#ba2d2f",
-        "#007a0a",
-        "#a26310",
-        "#375cc6",
-        "#aa3e74",
-        "#3f60af",
-        "#484431",
-        "#f5e9cb",
-        "#c74400",
-        "#5a7400",
-        "#ba5205",
-        "#5f5fdf",
-        "#b02f80",
-        "#4060a0",
-        "#68708a",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#fff6d8",
-        ["bg_dim"] = "#f5e9cb",
-        ["bg_alt"] = "#e7d7c6",
-        ["fg_main"] = "#484431",
-        ["fg_dim"] = "#68708a",
-        ["fg_alt"] = "#80431a",
-        ["border"] = "#c5baa6",
-        ["border_highlight"] = "#80431a",
-        ["red"] = "#ba2d2f",
-        ["red_warmer"] = "#c74400",
-        ["red_cooler"] = "#c02945",
-        ["red_faint"] = "#b05350",
-        ["green"] = "#007a0a",
-        ["green_warmer"] = "#5a7400",
-        ["green_cooler"] = "#008250",
-        ["green_faint"] = "#61756c",
-        ["yellow"] = "#a26310",
-        ["yellow_warmer"] = "#ba5205",
-        ["yellow_cooler"] = "#946830",
-        ["yellow_faint"] = "#7f6f1a",
-        ["blue"] = "#375cc6",
-        ["blue_warmer"] = "#5f5fdf",
-        ["blue_cooler"] = "#265fbf",
-        ["blue_faint"] = "#4a659f",
-        ["magenta"] = "#aa3e74",
-        ["magenta_warmer"] = "#b02f80",
-        ["magenta_cooler"] = "#6448ca",
-        ["magenta_faint"] = "#905ea0",
-        ["cyan"] = "#3f60af",
-        ["cyan_warmer"] = "#4060a0",
-        ["cyan_cooler"] = "#0f708a",
-        ["cyan_faint"] = "#4f6f8f",
-        ["rust"] = "#c74400",
-        ["gold"] = "#a26310",
-        ["olive"] = "#5a7400",
-        ["slate"] = "#4a659f",
-        ["indigo"] = "#6448ca",
-        ["maroon"] = "#c02945",
-        ["pink"] = "#b02f80",
-        ["red_intense"] = "#ba2d2f",
-        ["green_intense"] = "#007a0a",
-        ["yellow_intense"] = "#a26310",
-        ["blue_intense"] = "#375cc6",
-        ["magenta_intense"] = "#aa3e74",
-        ["cyan_intense"] = "#3f60af",
-        ["bg_red_intense"] = "#ff8f88",
-        ["bg_green_intense"] = "#96df80",
-        ["bg_yellow_intense"] = "#efbf00",
-        ["bg_blue_intense"] = "#cfceff",
-        ["bg_magenta_intense"] = "#df9fff",
-        ["bg_cyan_intense"] = "#88cfd0",
-        ["bg_red_subtle"] = "#ffceb0",
-        ["bg_green_subtle"] = "#cbf09f",
-        ["bg_yellow_subtle"] = "#f4ed7e",
-        ["bg_blue_subtle"] = "#cce4f2",
-        ["bg_magenta_subtle"] = "#fad6ef",
-        ["bg_cyan_subtle"] = "#bfefef",
-        ["bg_red_nuanced"] = "#ffceb0",
-        ["bg_green_nuanced"] = "#cbf09f",
-        ["bg_yellow_nuanced"] = "#f4ed7e",
-        ["bg_blue_nuanced"] = "#cce4f2",
-        ["bg_magenta_nuanced"] = "#fad6ef",
-        ["bg_cyan_nuanced"] = "#bfefef",
-        ["bg_completion"] = "#ffe2a8",
-        ["bg_hl_line"] = "#fae7b0",
-        ["bg_paren_match"] = "#afcf8f",
-        ["bg_paren_expression"] = "#deb4f0",
-        ["bg_char_0"] = "#cce4f2",
-        ["bg_char_1"] = "#fad6ef",
-        ["bg_char_2"] = "#f4ed7e",
-        ["bg_active"] = "#c7b7a6",
-        ["fg_active"] = "#484431",
-        ["bg_inactive"] = "#f9efd4",
-        ["fg_inactive"] = "#68708a",
-        ["bg_status_line_active"] = "#f3cf72",
-        ["fg_status_line_active"] = "#403328",
-        ["bg_status_line_inactive"] = "#f5e9cb",
-        ["fg_status_line_inactive"] = "#68708a",
-        ["bg_tab_bar"] = "#e7d7c6",
-        ["bg_tab_current"] = "#fff6d8",
-        ["bg_tab_other"] = "#f5e9cb",
-        ["fg_tab_other"] = "#68708a",
-        ["bg_tab_alternate"] = "#c4d47a",
-        ["bg_added"] = "#d7ecb0",
-        ["bg_added_faint"] = "#eef3c2",
-        ["bg_added_refine"] = "#c9dda0",
-        ["bg_added_fringe"] = "#c9dda0",
-        ["fg_added"] = "#005000",
-        ["fg_added_intense"] = "#005000",
-        ["bg_changed"] = "#f5e690",
-        ["bg_changed_faint"] = "#f5edaf",
-        ["bg_changed_refine"] = "#edd482",
-        ["bg_changed_fringe"] = "#edd482",
-        ["fg_changed"] = "#553d00",
-        ["fg_changed_intense"] = "#553d00",
-        ["bg_removed"] = "#f8d0b6",
-        ["bg_removed_faint"] = "#f5deb0",
-        ["bg_removed_refine"] = "#f0bba9",
-        ["bg_removed_fringe"] = "#f0bba9",
-        ["fg_removed"] = "#8f1313",
-        ["fg_removed_intense"] = "#8f1313",
-        ["bg_diff_context"] = "#f5e9cb",
-        ["visual"] = "#f0d4d8",
-        ["link"] = "#a26310",
-        ["link_visited"] = "#6448ca",
-        ["link_symbolic"] = "#3f60af",
-        ["string"] = "#c74400",
-        ["comment"] = "#7f6f1a",
-        ["constant"] = "#3f60af",
-        ["identifier"] = "#b05350",
-        ["keyword"] = "#a26310",
-        ["type"] = "#008250",
-        ["fnname"] = "#5a7400",
-        ["variable"] = "#0f708a",
-        ["rainbow_0"] = "#ba5205",
-        ["rainbow_1"] = "#a26310",
-        ["rainbow_2"] = "#5a7400",
-        ["rainbow_3"] = "#c02945",
-        ["rainbow_4"] = "#4060a0",
-        ["rainbow_5"] = "#aa3e74",
-        ["rainbow_6"] = "#008250",
-        ["rainbow_7"] = "#b02f80",
-        ["prose_todo"] = "#c74400",
-        ["prose_done"] = "#007a0a",
-        ["prose_tag"] = "#7f6f1a",
-        ["prose_table"] = "#80431a",
-        ["err"] = "#c74400",
-        ["warning"] = "#ba5205",
-        ["info"] = "#007a0a",
-        ["hint"] = "#4f6f8f",
-        ["ok"] = "#008250",
-      },
-    },
-    ["ef_melissa_dark"] = {
-      ["family"] = "ef_melissa",
-      ["flavor"] = "dark",
-      ["foreground"] = "#e8e4b1",
-      ["background"] = "#352718",
-      ["cursor"] = "#f9cf7a",
-      ["selection_background"] = "#443a4f",
-      ["selection_foreground"] = "#e8e4b1",
-      ["ansi"] = {
-        "#352718",
-        "#ff7f7f",
-        "#6fd560",
-        "#e4b53f",
-        "#57aff6",
-        "#f0aac5",
-        "#6fcad0",
-        "#e8e4b1",
-        "#483426",
-        "#ff7f4f",
-        "#a0d13a",
-        "#ffa21f",
-        "#98bfff",
-        "#fa90aa",
-        "#7fc5df",
-        "#90918a",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#352718",
-        ["bg_dim"] = "#483426",
-        ["bg_alt"] = "#59463f",
-        ["fg_main"] = "#e8e4b1",
-        ["fg_dim"] = "#90918a",
-        ["fg_alt"] = "#ccaa70",
-        ["border"] = "#6f5f58",
-        ["border_highlight"] = "#ccaa70",
-        ["red"] = "#ff7f7f",
-        ["red_warmer"] = "#ff7f4f",
-        ["red_cooler"] = "#ff8f98",
-        ["red_faint"] = "#e89a88",
-        ["green"] = "#6fd560",
-        ["green_warmer"] = "#a0d13a",
-        ["green_cooler"] = "#65d590",
-        ["green_faint"] = "#a0d26f",
-        ["yellow"] = "#e4b53f",
-        ["yellow_warmer"] = "#ffa21f",
-        ["yellow_cooler"] = "#e7a06f",
-        ["yellow_faint"] = "#eab780",
-        ["blue"] = "#57aff6",
-        ["blue_warmer"] = "#98bfff",
-        ["blue_cooler"] = "#62cfef",
-        ["blue_faint"] = "#6ab4ef",
-        ["magenta"] = "#f0aac5",
-        ["magenta_warmer"] = "#fa90aa",
-        ["magenta_cooler"] = "#c6a2fe",
-        ["magenta_faint"] = "#dfcfe0",
-        ["cyan"] = "#6fcad0",
-        ["cyan_warmer"] = "#7fc5df",
-        ["cyan_cooler"] = "#70e0cf",
-        ["cyan_faint"] = "#99bfcf",
-        ["rust"] = "#ff7f4f",
-        ["gold"] = "#e4b53f",
-        ["olive"] = "#a0d13a",
-        ["slate"] = "#6ab4ef",
-        ["indigo"] = "#c6a2fe",
-        ["maroon"] = "#ff8f98",
-        ["pink"] = "#fa90aa",
-        ["red_intense"] = "#ff7f7f",
-        ["green_intense"] = "#6fd560",
-        ["yellow_intense"] = "#e4b53f",
-        ["blue_intense"] = "#57aff6",
-        ["magenta_intense"] = "#f0aac5",
-        ["cyan_intense"] = "#6fcad0",
-        ["bg_red_intense"] = "#b02930",
-        ["bg_green_intense"] = "#4a7100",
-        ["bg_yellow_intense"] = "#8f5040",
-        ["bg_blue_intense"] = "#4648d0",
-        ["bg_magenta_intense"] = "#a04fc5",
-        ["bg_cyan_intense"] = "#2270cf",
-        ["bg_red_subtle"] = "#72292a",
-        ["bg_green_subtle"] = "#3f521a",
-        ["bg_yellow_subtle"] = "#604b13",
-        ["bg_blue_subtle"] = "#384862",
-        ["bg_magenta_subtle"] = "#613a50",
-        ["bg_cyan_subtle"] = "#2f4f4f",
-        ["bg_red_nuanced"] = "#72292a",
-        ["bg_green_nuanced"] = "#3f521a",
-        ["bg_yellow_nuanced"] = "#604b13",
-        ["bg_blue_nuanced"] = "#384862",
-        ["bg_magenta_nuanced"] = "#613a50",
-        ["bg_cyan_nuanced"] = "#2f4f4f",
-        ["bg_completion"] = "#66421f",
-        ["bg_hl_line"] = "#4f311f",
-        ["bg_paren_match"] = "#5f6f1f",
-        ["bg_paren_expression"] = "#60518f",
-        ["bg_char_0"] = "#384862",
-        ["bg_char_1"] = "#613a50",
-        ["bg_char_2"] = "#604b13",
-        ["bg_active"] = "#79665f",
-        ["fg_active"] = "#e8e4b1",
-        ["bg_inactive"] = "#3d2e1f",
-        ["fg_inactive"] = "#90918a",
-        ["bg_status_line_active"] = "#704f00",
-        ["fg_status_line_active"] = "#f8efd8",
-        ["bg_status_line_inactive"] = "#483426",
-        ["fg_status_line_inactive"] = "#90918a",
-        ["bg_tab_bar"] = "#59463f",
-        ["bg_tab_current"] = "#352718",
-        ["bg_tab_other"] = "#483426",
-        ["fg_tab_other"] = "#90918a",
-        ["bg_tab_alternate"] = "#5a661f",
-        ["bg_added"] = "#2f491f",
-        ["bg_added_faint"] = "#2f3b0f",
-        ["bg_added_refine"] = "#3f6234",
-        ["bg_added_fringe"] = "#3f6234",
-        ["fg_added"] = "#a0e0a0",
-        ["fg_added_intense"] = "#a0e0a0",
-        ["bg_changed"] = "#544a0f",
-        ["bg_changed_faint"] = "#43350f",
-        ["bg_changed_refine"] = "#615f1f",
-        ["bg_changed_fringe"] = "#615f1f",
-        ["fg_changed"] = "#dada90",
-        ["fg_changed_intense"] = "#dada90",
-        ["bg_removed"] = "#622a1f",
-        ["bg_removed_faint"] = "#4b240a",
-        ["bg_removed_refine"] = "#7f3325",
-        ["bg_removed_fringe"] = "#7f3325",
-        ["fg_removed"] = "#ffbfbf",
-        ["fg_removed_intense"] = "#ffbfbf",
-        ["bg_diff_context"] = "#483426",
-        ["visual"] = "#443a4f",
-        ["link"] = "#e4b53f",
-        ["link_visited"] = "#c6a2fe",
-        ["link_symbolic"] = "#6fcad0",
-        ["string"] = "#ffa21f",
-        ["comment"] = "#eab780",
-        ["constant"] = "#98bfff",
-        ["identifier"] = "#e89a88",
-        ["keyword"] = "#e4b53f",
-        ["type"] = "#65d590",
-        ["fnname"] = "#6fd560",
-        ["variable"] = "#6fcad0",
-        ["rainbow_0"] = "#ffa21f",
-        ["rainbow_1"] = "#e4b53f",
-        ["rainbow_2"] = "#a0d13a",
-        ["rainbow_3"] = "#ff8f98",
-        ["rainbow_4"] = "#7fc5df",
-        ["rainbow_5"] = "#f0aac5",
-        ["rainbow_6"] = "#65d590",
-        ["rainbow_7"] = "#fa90aa",
-        ["prose_todo"] = "#ff7f4f",
-        ["prose_done"] = "#6fd560",
-        ["prose_tag"] = "#eab780",
-        ["prose_table"] = "#ccaa70",
-        ["err"] = "#ff7f4f",
-        ["warning"] = "#ffa21f",
-        ["info"] = "#6fd560",
-        ["hint"] = "#99bfcf",
-        ["ok"] = "#65d590",
-      },
-    },
-    ["ef_trio_light"] = {
-      ["family"] = "ef_trio",
-      ["flavor"] = "light",
-      ["foreground"] = "#4f3363",
-      ["background"] = "#f8f5ff",
-      ["cursor"] = "#4f45ff",
-      ["selection_background"] = "#eed0ff",
-      ["selection_foreground"] = "#4f3363",
-      ["ansi"] = {
-        "#f8f5ff",
-        "#c3303a",
-        "#057800",
-        "#a45f22",
-        "#375cd6",
-        "#ad45ba",
-        "#1f6fbf",
-        "#4f3363",
-        "#ebe7f1",
-        "#d03033",
-        "#4f7d0f",
-        "#b8532f",
-        "#5165e4",
-        "#c035aa",
-        "#3f6faf",
-        "#786e74",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#f8f5ff",
-        ["bg_dim"] = "#ebe7f1",
-        ["bg_alt"] = "#e3e0e9",
-        ["fg_main"] = "#4f3363",
-        ["fg_dim"] = "#786e74",
-        ["fg_alt"] = "#3f7668",
-        ["border"] = "#c6bac5",
-        ["border_highlight"] = "#3f7668",
-        ["red"] = "#c3303a",
-        ["red_warmer"] = "#d03033",
-        ["red_cooler"] = "#c01f5f",
-        ["red_faint"] = "#a24568",
-        ["green"] = "#057800",
-        ["green_warmer"] = "#4f7d0f",
-        ["green_cooler"] = "#007f6f",
-        ["green_faint"] = "#41754c",
-        ["yellow"] = "#a45f22",
-        ["yellow_warmer"] = "#b8532f",
-        ["yellow_cooler"] = "#b65050",
-        ["yellow_faint"] = "#a05b5f",
-        ["blue"] = "#375cd6",
-        ["blue_warmer"] = "#5165e4",
-        ["blue_cooler"] = "#065fbf",
-        ["blue_faint"] = "#6060d0",
-        ["magenta"] = "#ad45ba",
-        ["magenta_warmer"] = "#c035aa",
-        ["magenta_cooler"] = "#705ae3",
-        ["magenta_faint"] = "#804fb0",
-        ["cyan"] = "#1f6fbf",
-        ["cyan_warmer"] = "#3f6faf",
-        ["cyan_cooler"] = "#0f7a9d",
-        ["cyan_faint"] = "#5f60bf",
-        ["rust"] = "#d03033",
-        ["gold"] = "#a45f22",
-        ["olive"] = "#4f7d0f",
-        ["slate"] = "#6060d0",
-        ["indigo"] = "#705ae3",
-        ["maroon"] = "#c01f5f",
-        ["pink"] = "#c035aa",
-        ["red_intense"] = "#c3303a",
-        ["green_intense"] = "#057800",
-        ["yellow_intense"] = "#a45f22",
-        ["blue_intense"] = "#375cd6",
-        ["magenta_intense"] = "#ad45ba",
-        ["cyan_intense"] = "#1f6fbf",
-        ["bg_red_intense"] = "#ff7f88",
-        ["bg_green_intense"] = "#7fdda0",
-        ["bg_yellow_intense"] = "#ffc200",
-        ["bg_blue_intense"] = "#cbcfff",
-        ["bg_magenta_intense"] = "#df8fff",
-        ["bg_cyan_intense"] = "#88ccff",
-        ["bg_red_subtle"] = "#ffc3c7",
-        ["bg_green_subtle"] = "#beecc2",
-        ["bg_yellow_subtle"] = "#f3ea8f",
-        ["bg_blue_subtle"] = "#ceddff",
-        ["bg_magenta_subtle"] = "#f5cff8",
-        ["bg_cyan_subtle"] = "#c0eaf0",
-        ["bg_red_nuanced"] = "#ffc3c7",
-        ["bg_green_nuanced"] = "#beecc2",
-        ["bg_yellow_nuanced"] = "#f3ea8f",
-        ["bg_blue_nuanced"] = "#ceddff",
-        ["bg_magenta_nuanced"] = "#f5cff8",
-        ["bg_cyan_nuanced"] = "#c0eaf0",
-        ["bg_completion"] = "#f4cfff",
-        ["bg_hl_line"] = "#cfe6ff",
-        ["bg_paren_match"] = "#dfadaf",
-        ["bg_paren_expression"] = "#aaeccf",
-        ["bg_char_0"] = "#ceddff",
-        ["bg_char_1"] = "#f5cff8",
-        ["bg_char_2"] = "#f3ea8f",
-        ["bg_active"] = "#c3c0c9",
-        ["fg_active"] = "#4f3363",
-        ["bg_inactive"] = "#efeef7",
-        ["fg_inactive"] = "#786e74",
-        ["bg_status_line_active"] = "#ddb4ff",
-        ["fg_status_line_active"] = "#241f48",
-        ["bg_status_line_inactive"] = "#ebe7f1",
-        ["fg_status_line_inactive"] = "#786e74",
-        ["bg_tab_bar"] = "#e3e0e9",
-        ["bg_tab_current"] = "#f8f5ff",
-        ["bg_tab_other"] = "#c3c0c9",
-        ["fg_tab_other"] = "#786e74",
-        ["bg_tab_alternate"] = "#b4cfff",
-        ["bg_added"] = "#caf4da",
-        ["bg_added_faint"] = "#dff6ea",
-        ["bg_added_refine"] = "#bae9cf",
-        ["bg_added_fringe"] = "#bae9cf",
-        ["fg_added"] = "#005000",
-        ["fg_added_intense"] = "#005000",
-        ["bg_changed"] = "#ffdfb9",
-        ["bg_changed_faint"] = "#ffefcb",
-        ["bg_changed_refine"] = "#ffcfa0",
-        ["bg_changed_fringe"] = "#ffcfa0",
-        ["fg_changed"] = "#553d00",
-        ["fg_changed_intense"] = "#553d00",
-        ["bg_removed"] = "#ffcee0",
-        ["bg_removed_faint"] = "#ffdfe6",
-        ["bg_removed_refine"] = "#f5b6c8",
-        ["bg_removed_fringe"] = "#f5b6c8",
-        ["fg_removed"] = "#8f1313",
-        ["fg_removed_intense"] = "#8f1313",
-        ["bg_diff_context"] = "#ebe7f1",
-        ["visual"] = "#eed0ff",
-        ["link"] = "#375cd6",
-        ["link_visited"] = "#705ae3",
-        ["link_symbolic"] = "#1f6fbf",
-        ["string"] = "#007f6f",
-        ["comment"] = "#a05b5f",
-        ["constant"] = "#c035aa",
-        ["identifier"] = "#a24568",
-        ["keyword"] = "#ad45ba",
-        ["type"] = "#0f7a9d",
-        ["fnname"] = "#5165e4",
-        ["variable"] = "#3f6faf",
-        ["rainbow_0"] = "#c035aa",
-        ["rainbow_1"] = "#5165e4",
-        ["rainbow_2"] = "#007f6f",
-        ["rainbow_3"] = "#ad45ba",
-        ["rainbow_4"] = "#1f6fbf",
-        ["rainbow_5"] = "#4f7d0f",
-        ["rainbow_6"] = "#705ae3",
-        ["rainbow_7"] = "#3f6faf",
-        ["prose_todo"] = "#d03033",
-        ["prose_done"] = "#057800",
-        ["prose_tag"] = "#804fb0",
-        ["prose_table"] = "#3f7668",
-        ["err"] = "#d03033",
-        ["warning"] = "#b8532f",
-        ["info"] = "#057800",
-        ["hint"] = "#5f60bf",
-        ["ok"] = "#007f6f",
-      },
-    },
-    ["ef_trio_dark"] = {
-      ["family"] = "ef_trio",
-      ["flavor"] = "dark",
-      ["foreground"] = "#d8cfd5",
-      ["background"] = "#160f0f",
-      ["cursor"] = "#ff99ff",
-      ["selection_background"] = "#16304f",
-      ["selection_foreground"] = "#d8cfd5",
-      ["ansi"] = {
-        "#160f0f",
-        "#f48359",
-        "#60b444",
-        "#d4a052",
-        "#7fa5f6",
-        "#d37faf",
-        "#8fbaff",
-        "#d8cfd5",
-        "#2a2228",
-        "#ff7560",
-        "#a0c27f",
-        "#ef926f",
-        "#8895ff",
-        "#e772df",
-        "#9ac2ff",
-        "#908890",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#160f0f",
-        ["bg_dim"] = "#2a2228",
-        ["bg_alt"] = "#362f35",
-        ["fg_main"] = "#d8cfd5",
-        ["fg_dim"] = "#908890",
-        ["fg_alt"] = "#afdacf",
-        ["border"] = "#605760",
-        ["border_highlight"] = "#afdacf",
-        ["red"] = "#f48359",
-        ["red_warmer"] = "#ff7560",
-        ["red_cooler"] = "#ff85aa",
-        ["red_faint"] = "#e07a9a",
-        ["green"] = "#60b444",
-        ["green_warmer"] = "#a0c27f",
-        ["green_cooler"] = "#60bf88",
-        ["green_faint"] = "#61a06c",
-        ["yellow"] = "#d4a052",
-        ["yellow_warmer"] = "#ef926f",
-        ["yellow_cooler"] = "#ef9680",
-        ["yellow_faint"] = "#c7a07f",
-        ["blue"] = "#7fa5f6",
-        ["blue_warmer"] = "#8895ff",
-        ["blue_cooler"] = "#72afff",
-        ["blue_faint"] = "#7a94df",
-        ["magenta"] = "#d37faf",
-        ["magenta_warmer"] = "#e772df",
-        ["magenta_cooler"] = "#a698ef",
-        ["magenta_faint"] = "#c9addf",
-        ["cyan"] = "#8fbaff",
-        ["cyan_warmer"] = "#9ac2ff",
-        ["cyan_cooler"] = "#8fcfdf",
-        ["cyan_faint"] = "#8ac0ef",
-        ["rust"] = "#ff7560",
-        ["gold"] = "#d4a052",
-        ["olive"] = "#a0c27f",
-        ["slate"] = "#7a94df",
-        ["indigo"] = "#a698ef",
-        ["maroon"] = "#ff85aa",
-        ["pink"] = "#e772df",
-        ["red_intense"] = "#f48359",
-        ["green_intense"] = "#60b444",
-        ["yellow_intense"] = "#d4a052",
-        ["blue_intense"] = "#7fa5f6",
-        ["magenta_intense"] = "#d37faf",
-        ["cyan_intense"] = "#8fbaff",
-        ["bg_red_intense"] = "#b02930",
-        ["bg_green_intense"] = "#2a7140",
-        ["bg_yellow_intense"] = "#8f5040",
-        ["bg_blue_intense"] = "#4648d0",
-        ["bg_magenta_intense"] = "#804fd5",
-        ["bg_cyan_intense"] = "#2270cf",
-        ["bg_red_subtle"] = "#651f1a",
-        ["bg_green_subtle"] = "#1a421f",
-        ["bg_yellow_subtle"] = "#553320",
-        ["bg_blue_subtle"] = "#283565",
-        ["bg_magenta_subtle"] = "#562654",
-        ["bg_cyan_subtle"] = "#133d58",
-        ["bg_red_nuanced"] = "#651f1a",
-        ["bg_green_nuanced"] = "#1a421f",
-        ["bg_yellow_nuanced"] = "#553320",
-        ["bg_blue_nuanced"] = "#283565",
-        ["bg_magenta_nuanced"] = "#562654",
-        ["bg_cyan_nuanced"] = "#133d58",
-        ["bg_completion"] = "#2f335a",
-        ["bg_hl_line"] = "#34223f",
-        ["bg_paren_match"] = "#2f605e",
-        ["bg_paren_expression"] = "#004f3f",
-        ["bg_char_0"] = "#283565",
-        ["bg_char_1"] = "#562654",
-        ["bg_char_2"] = "#553320",
-        ["bg_active"] = "#564f55",
-        ["fg_active"] = "#d8cfd5",
-        ["bg_inactive"] = "#1c1719",
-        ["fg_inactive"] = "#908890",
-        ["bg_status_line_active"] = "#6a294f",
-        ["fg_status_line_active"] = "#ffdfdf",
-        ["bg_status_line_inactive"] = "#2a2228",
-        ["fg_status_line_inactive"] = "#908890",
-        ["bg_tab_bar"] = "#362f35",
-        ["bg_tab_current"] = "#160f0f",
-        ["bg_tab_other"] = "#564f55",
-        ["fg_tab_other"] = "#908890",
-        ["bg_tab_alternate"] = "#452f5f",
-        ["bg_added"] = "#00371f",
-        ["bg_added_faint"] = "#002918",
-        ["bg_added_refine"] = "#004c2f",
-        ["bg_added_fringe"] = "#004c2f",
-        ["fg_added"] = "#a0e0a0",
-        ["fg_added_intense"] = "#a0e0a0",
-        ["bg_changed"] = "#363300",
-        ["bg_changed_faint"] = "#2a1f00",
-        ["bg_changed_refine"] = "#4a4a00",
-        ["bg_changed_fringe"] = "#4a4a00",
-        ["fg_changed"] = "#efef80",
-        ["fg_changed_intense"] = "#efef80",
-        ["bg_removed"] = "#450f1f",
-        ["bg_removed_faint"] = "#2f060f",
-        ["bg_removed_refine"] = "#641426",
-        ["bg_removed_fringe"] = "#641426",
-        ["fg_removed"] = "#ffbfbf",
-        ["fg_removed_intense"] = "#ffbfbf",
-        ["bg_diff_context"] = "#2a2228",
-        ["visual"] = "#16304f",
-        ["link"] = "#7fa5f6",
-        ["link_visited"] = "#a698ef",
-        ["link_symbolic"] = "#8fbaff",
-        ["string"] = "#60bf88",
-        ["comment"] = "#c7a07f",
-        ["constant"] = "#e772df",
-        ["identifier"] = "#e07a9a",
-        ["keyword"] = "#d37faf",
-        ["type"] = "#8fcfdf",
-        ["fnname"] = "#8895ff",
-        ["variable"] = "#9ac2ff",
-        ["rainbow_0"] = "#e772df",
-        ["rainbow_1"] = "#8895ff",
-        ["rainbow_2"] = "#60bf88",
-        ["rainbow_3"] = "#d37faf",
-        ["rainbow_4"] = "#8fbaff",
-        ["rainbow_5"] = "#a0c27f",
-        ["rainbow_6"] = "#a698ef",
-        ["rainbow_7"] = "#9ac2ff",
-        ["prose_todo"] = "#ff7560",
-        ["prose_done"] = "#60b444",
-        ["prose_tag"] = "#c9addf",
-        ["prose_table"] = "#afdacf",
-        ["err"] = "#ff7560",
-        ["warning"] = "#d4a052",
-        ["info"] = "#60b444",
-        ["hint"] = "#8ac0ef",
-        ["ok"] = "#60bf88",
-      },
-    },
-    ["ef_tritanopia_light"] = {
-      ["family"] = "ef_tritanopia",
-      ["flavor"] = "light",
-      ["foreground"] = "#1a1a1a",
-      ["background"] = "#fff9f9",
-      ["cursor"] = "#bb0000",
-      ["selection_background"] = "#dadadf",
-      ["selection_foreground"] = "#1a1a1a",
-      ["ansi"] = {
-        "#fff9f9",
-        "#aa0010",
-        "#217a3c",
-        "#805d00",
-        "#375cd8",
-        "#aa357f",
-        "#2070af",
-        "#1a1a1a",
-        "#efecec",
-        "#dd0000",
-        "#4a7d00",
-        "#965000",
-        "#4250ef",
-        "#bf256a",
-        "#2f5faf",
-        "#756275",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#fff9f9",
-        ["bg_dim"] = "#efecec",
-        ["bg_alt"] = "#ddd9d9",
-        ["fg_main"] = "#1a1a1a",
-        ["fg_dim"] = "#756275",
-        ["fg_alt"] = "#194f90",
-        ["border"] = "#adadad",
-        ["border_highlight"] = "#194f90",
-        ["red"] = "#aa0010",
-        ["red_warmer"] = "#dd0000",
-        ["red_cooler"] = "#c50f4f",
-        ["red_faint"] = "#92454f",
-        ["green"] = "#217a3c",
-        ["green_warmer"] = "#4a7d00",
-        ["green_cooler"] = "#008058",
-        ["green_faint"] = "#61756c",
-        ["yellow"] = "#805d00",
-        ["yellow_warmer"] = "#965000",
-        ["yellow_cooler"] = "#765040",
-        ["yellow_faint"] = "#776d6a",
-        ["blue"] = "#375cd8",
-        ["blue_warmer"] = "#4250ef",
-        ["blue_cooler"] = "#065fff",
-        ["blue_faint"] = "#6060d0",
-        ["magenta"] = "#aa357f",
-        ["magenta_warmer"] = "#bf256a",
-        ["magenta_cooler"] = "#af40af",
-        ["magenta_faint"] = "#7f4580",
-        ["cyan"] = "#2070af",
-        ["cyan_warmer"] = "#2f5faf",
-        ["cyan_cooler"] = "#007faa",
-        ["cyan_faint"] = "#5f6a90",
-        ["rust"] = "#dd0000",
-        ["gold"] = "#805d00",
-        ["olive"] = "#4a7d00",
-        ["slate"] = "#6060d0",
-        ["indigo"] = "#af40af",
-        ["maroon"] = "#c50f4f",
-        ["pink"] = "#bf256a",
-        ["red_intense"] = "#aa0010",
-        ["green_intense"] = "#217a3c",
-        ["yellow_intense"] = "#805d00",
-        ["blue_intense"] = "#375cd8",
-        ["magenta_intense"] = "#aa357f",
-        ["cyan_intense"] = "#2070af",
-        ["bg_red_intense"] = "#ffa2a0",
-        ["bg_green_intense"] = "#8aefef",
-        ["bg_yellow_intense"] = "#ff7f78",
-        ["bg_blue_intense"] = "#a8c8ef",
-        ["bg_magenta_intense"] = "#e09fc0",
-        ["bg_cyan_intense"] = "#7bcfcf",
-        ["bg_red_subtle"] = "#ffc4bf",
-        ["bg_green_subtle"] = "#baeecf",
-        ["bg_yellow_subtle"] = "#f5d8a8",
-        ["bg_blue_subtle"] = "#c8e6f7",
-        ["bg_magenta_subtle"] = "#ffcfe0",
-        ["bg_cyan_subtle"] = "#bbeff2",
-        ["bg_red_nuanced"] = "#ffc4bf",
-        ["bg_green_nuanced"] = "#baeecf",
-        ["bg_yellow_nuanced"] = "#f5d8a8",
-        ["bg_blue_nuanced"] = "#c8e6f7",
-        ["bg_magenta_nuanced"] = "#ffcfe0",
-        ["bg_cyan_nuanced"] = "#bbeff2",
-        ["bg_completion"] = "#ffcada",
-        ["bg_hl_line"] = "#ffdadf",
-        ["bg_paren_match"] = "#8fc0cf",
-        ["bg_paren_expression"] = "#8fcfff",
-        ["bg_char_0"] = "#c8e6f7",
-        ["bg_char_1"] = "#ffcfe0",
-        ["bg_char_2"] = "#f5d8a8",
-        ["bg_active"] = "#bdb9b9",
-        ["fg_active"] = "#1a1a1a",
-        ["bg_inactive"] = "#f7f2f2",
-        ["fg_inactive"] = "#756275",
-        ["bg_status_line_active"] = "#ff99aa",
-        ["fg_status_line_active"] = "#1a0a0f",
-        ["bg_status_line_inactive"] = "#efecec",
-        ["fg_status_line_inactive"] = "#756275",
-        ["bg_tab_bar"] = "#ddd9d9",
-        ["bg_tab_current"] = "#fff9f9",
-        ["bg_tab_other"] = "#bdb9b9",
-        ["fg_tab_other"] = "#756275",
-        ["bg_tab_alternate"] = "#eda9dc",
-        ["bg_added"] = "#c9efea",
-        ["bg_added_faint"] = "#d7eff5",
-        ["bg_added_refine"] = "#b3dfdf",
-        ["bg_added_fringe"] = "#b3dfdf",
-        ["fg_added"] = "#004840",
-        ["fg_added_intense"] = "#004840",
-        ["bg_changed"] = "#dbdbff",
-        ["bg_changed_faint"] = "#e4e4ff",
-        ["bg_changed_refine"] = "#c0c0ef",
-        ["bg_changed_fringe"] = "#c0c0ef",
-        ["fg_changed"] = "#333399",
-        ["fg_changed_intense"] = "#333399",
-        ["bg_removed"] = "#ffd6e0",
-        ["bg_removed_faint"] = "#ffe9e6",
-        ["bg_removed_refine"] = "#f5bfc8",
-        ["bg_removed_fringe"] = "#f5bfc8",
-        ["fg_removed"] = "#8f1313",
-        ["fg_removed_intense"] = "#8f1313",
-        ["bg_diff_context"] = "#efecec",
-        ["visual"] = "#dadadf",
-        ["link"] = "#375cd8",
-        ["link_visited"] = "#af40af",
-        ["link_symbolic"] = "#2070af",
-        ["string"] = "#2070af",
-        ["comment"] = "#92454f",
-        ["constant"] = "#c50f4f",
-        ["identifier"] = "#7f4580",
-        ["keyword"] = "#aa0010",
-        ["type"] = "#2f5faf",
-        ["fnname"] = "#af40af",
-        ["variable"] = "#007faa",
-        ["rainbow_0"] = "#2070af",
-        ["rainbow_1"] = "#aa0010",
-        ["rainbow_2"] = "#2f5faf",
-        ["rainbow_3"] = "#c50f4f",
-        ["rainbow_4"] = "#007faa",
-        ["rainbow_5"] = "#aa357f",
-        ["rainbow_6"] = "#5f6a90",
-        ["rainbow_7"] = "#7f4580",
-        ["prose_todo"] = "#dd0000",
-        ["prose_done"] = "#2070af",
-        ["prose_tag"] = "#194f90",
-        ["prose_table"] = "#194f90",
-        ["err"] = "#dd0000",
-        ["warning"] = "#aa357f",
-        ["info"] = "#2070af",
-        ["hint"] = "#5f6a90",
-        ["ok"] = "#008058",
-      },
-    },
-    ["ef_tritanopia_dark"] = {
-      ["family"] = "ef_tritanopia",
-      ["flavor"] = "dark",
-      ["foreground"] = "#dfd0d5",
-      ["background"] = "#15050f",
-      ["cursor"] = "#fd3333",
-      ["selection_background"] = "#293140",
-      ["selection_foreground"] = "#dfd0d5",
-      ["ansi"] = {
-        "#15050f",
-        "#cf4f5f",
-        "#2fa526",
-        "#c48702",
-        "#379cf6",
-        "#b0648f",
-        "#3fafcf",
-        "#dfd0d5",
-        "#282026",
-        "#df4f4f",
-        "#64aa0f",
-        "#d0730f",
-        "#6a88ff",
-        "#c560aa",
-        "#3f9aaf",
-        "#908890",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#15050f",
-        ["bg_dim"] = "#282026",
-        ["bg_alt"] = "#352f2f",
-        ["fg_main"] = "#dfd0d5",
-        ["fg_dim"] = "#908890",
-        ["fg_alt"] = "#afdaef",
-        ["border"] = "#555564",
-        ["border_highlight"] = "#afdaef",
-        ["red"] = "#cf4f5f",
-        ["red_warmer"] = "#df4f4f",
-        ["red_cooler"] = "#d24f7f",
-        ["red_faint"] = "#b07f7f",
-        ["green"] = "#2fa526",
-        ["green_warmer"] = "#64aa0f",
-        ["green_cooler"] = "#00b066",
-        ["green_faint"] = "#5f9f6f",
-        ["yellow"] = "#c48702",
-        ["yellow_warmer"] = "#d0730f",
-        ["yellow_cooler"] = "#df8f6f",
-        ["yellow_faint"] = "#cf9f7f",
-        ["blue"] = "#379cf6",
-        ["blue_warmer"] = "#6a88ff",
-        ["blue_cooler"] = "#029fff",
-        ["blue_faint"] = "#6a84af",
-        ["magenta"] = "#b0648f",
-        ["magenta_warmer"] = "#c560aa",
-        ["magenta_cooler"] = "#a6699f",
-        ["magenta_faint"] = "#c590af",
-        ["cyan"] = "#3fafcf",
-        ["cyan_warmer"] = "#3f9aaf",
-        ["cyan_cooler"] = "#4fafaf",
-        ["cyan_faint"] = "#82a0af",
-        ["rust"] = "#df4f4f",
-        ["gold"] = "#c48702",
-        ["olive"] = "#64aa0f",
-        ["slate"] = "#6a84af",
-        ["indigo"] = "#a6699f",
-        ["maroon"] = "#d24f7f",
-        ["pink"] = "#c560aa",
-        ["red_intense"] = "#cf4f5f",
-        ["green_intense"] = "#2fa526",
-        ["yellow_intense"] = "#c48702",
-        ["blue_intense"] = "#379cf6",
-        ["magenta_intense"] = "#b0648f",
-        ["cyan_intense"] = "#3fafcf",
-        ["bg_red_intense"] = "#aa0010",
-        ["bg_green_intense"] = "#5f806f",
-        ["bg_yellow_intense"] = "#950f4f",
-        ["bg_blue_intense"] = "#165f70",
-        ["bg_magenta_intense"] = "#a04f9f",
-        ["bg_cyan_intense"] = "#007faa",
-        ["bg_red_subtle"] = "#6e1b20",
-        ["bg_green_subtle"] = "#054c38",
-        ["bg_yellow_subtle"] = "#65302f",
-        ["bg_blue_subtle"] = "#224360",
-        ["bg_magenta_subtle"] = "#603256",
-        ["bg_cyan_subtle"] = "#004a57",
-        ["bg_red_nuanced"] = "#6e1b20",
-        ["bg_green_nuanced"] = "#054c38",
-        ["bg_yellow_nuanced"] = "#65302f",
-        ["bg_blue_nuanced"] = "#224360",
-        ["bg_magenta_nuanced"] = "#603256",
-        ["bg_cyan_nuanced"] = "#004a57",
-        ["bg_completion"] = "#441824",
-        ["bg_hl_line"] = "#3f1515",
-        ["bg_paren_match"] = "#2f5f7a",
-        ["bg_paren_expression"] = "#00405f",
-        ["bg_char_0"] = "#224360",
-        ["bg_char_1"] = "#603256",
-        ["bg_char_2"] = "#65302f",
-        ["bg_active"] = "#554f4f",
-        ["fg_active"] = "#dfd0d5",
-        ["bg_inactive"] = "#1a1517",
-        ["fg_inactive"] = "#908890",
-        ["bg_status_line_active"] = "#671822",
-        ["fg_status_line_active"] = "#ffffff",
-        ["bg_status_line_inactive"] = "#282026",
-        ["fg_status_line_inactive"] = "#908890",
-        ["bg_tab_bar"] = "#352f2f",
-        ["bg_tab_current"] = "#15050f",
-        ["bg_tab_other"] = "#554f4f",
-        ["fg_tab_other"] = "#908890",
-        ["bg_tab_alternate"] = "#5e3e5b",
-        ["bg_added"] = "#002d3f",
-        ["bg_added_faint"] = "#001f38",
-        ["bg_added_refine"] = "#003b4f",
-        ["bg_added_fringe"] = "#003b4f",
-        ["fg_added"] = "#cbdfff",
-        ["fg_added_intense"] = "#cbdfff",
-        ["bg_changed"] = "#352354",
-        ["bg_changed_faint"] = "#351444",
-        ["bg_changed_refine"] = "#383964",
-        ["bg_changed_fringe"] = "#383964",
-        ["fg_changed"] = "#e3cfff",
-        ["fg_changed_intense"] = "#e3cfff",
-        ["bg_removed"] = "#4d091f",
-        ["bg_removed_faint"] = "#37040f",
-        ["bg_removed_refine"] = "#6b0f26",
-        ["bg_removed_fringe"] = "#6b0f26",
-        ["fg_removed"] = "#ffbfbf",
-        ["fg_removed_intense"] = "#ffbfbf",
-        ["bg_diff_context"] = "#282026",
-        ["visual"] = "#293140",
-        ["link"] = "#379cf6",
-        ["link_visited"] = "#a6699f",
-        ["link_symbolic"] = "#3fafcf",
-        ["string"] = "#3fafcf",
-        ["comment"] = "#b07f7f",
-        ["constant"] = "#d24f7f",
-        ["identifier"] = "#c590af",
-        ["keyword"] = "#cf4f5f",
-        ["type"] = "#3f9aaf",
-        ["fnname"] = "#a6699f",
-        ["variable"] = "#4fafaf",
-        ["rainbow_0"] = "#3fafcf",
-        ["rainbow_1"] = "#cf4f5f",
-        ["rainbow_2"] = "#3f9aaf",
-        ["rainbow_3"] = "#d24f7f",
-        ["rainbow_4"] = "#4fafaf",
-        ["rainbow_5"] = "#b0648f",
-        ["rainbow_6"] = "#82a0af",
-        ["rainbow_7"] = "#c590af",
-        ["prose_todo"] = "#df4f4f",
-        ["prose_done"] = "#3fafcf",
-        ["prose_tag"] = "#afdaef",
-        ["prose_table"] = "#afdaef",
-        ["err"] = "#df4f4f",
-        ["warning"] = "#c560aa",
-        ["info"] = "#3fafcf",
-        ["hint"] = "#82a0af",
-        ["ok"] = "#00b066",
-      },
-    },
-    ["modus_operandi"] = {
-      ["family"] = "modus",
-      ["flavor"] = "light",
-      ["foreground"] = "#000000",
-      ["background"] = "#ffffff",
-      ["cursor"] = "#000000",
-      ["selection_background"] = "#dfa0f0",
-      ["selection_foreground"] = "#000000",
-      ["ansi"] = {
-        "#ffffff",
-        "#a60000",
-        "#006800",
-        "#6f5500",
-        "#0031a9",
-        "#721045",
-        "#005e8b",
-        "#000000",
-        "#e0e0e0",
-        "#d00000",
-        "#008900",
-        "#808000",
-        "#0000ff",
-        "#dd22dd",
-        "#008899",
-        "#595959",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#ffffff",
-        ["bg_dim"] = "#f2f2f2",
-        ["bg_alt"] = "#f0f0f0",
-        ["fg_main"] = "#000000",
-        ["fg_dim"] = "#595959",
-        ["fg_alt"] = "#193668",
-        ["border"] = "#9f9f9f",
-        ["border_highlight"] = "#3b3b3b",
-        ["red"] = "#a60000",
-        ["red_warmer"] = "#972500",
-        ["red_cooler"] = "#a0132f",
-        ["red_faint"] = "#7f0000",
-        ["green"] = "#006800",
-        ["green_warmer"] = "#316500",
-        ["green_cooler"] = "#00663f",
-        ["green_faint"] = "#2a5045",
-        ["yellow"] = "#6f5500",
-        ["yellow_warmer"] = "#884900",
-        ["yellow_cooler"] = "#7a4f2f",
-        ["yellow_faint"] = "#624416",
-        ["blue"] = "#0031a9",
-        ["blue_warmer"] = "#3548cf",
-        ["blue_cooler"] = "#0000b0",
-        ["blue_faint"] = "#003497",
-        ["magenta"] = "#721045",
-        ["magenta_warmer"] = "#8f0075",
-        ["magenta_cooler"] = "#531ab6",
-        ["magenta_faint"] = "#7c318f",
-        ["cyan"] = "#005e8b",
-        ["cyan_warmer"] = "#3f578f",
-        ["cyan_cooler"] = "#005f5f",
-        ["cyan_faint"] = "#005077",
-        ["rust"] = "#8a290f",
-        ["gold"] = "#80601f",
-        ["olive"] = "#56692d",
-        ["slate"] = "#2f3f83",
-        ["indigo"] = "#4a3a8a",
-        ["maroon"] = "#731c52",
-        ["pink"] = "#7b435c",
-        ["red_intense"] = "#d00000",
-        ["green_intense"] = "#008900",
-        ["yellow_intense"] = "#808000",
-        ["blue_intense"] = "#0000ff",
-        ["magenta_intense"] = "#dd22dd",
-        ["cyan_intense"] = "#008899",
-        ["bg_red_intense"] = "#ff8f88",
-        ["bg_green_intense"] = "#8adf80",
-        ["bg_yellow_intense"] = "#f3d000",
-        ["bg_blue_intense"] = "#bfc9ff",
-        ["bg_magenta_intense"] = "#dfa0f0",
-        ["bg_cyan_intense"] = "#a4d5f9",
-        ["bg_red_subtle"] = "#ffcfbf",
-        ["bg_green_subtle"] = "#b3fabf",
-        ["bg_yellow_subtle"] = "#fff576",
-        ["bg_blue_subtle"] = "#ccdfff",
-        ["bg_magenta_subtle"] = "#ffddff",
-        ["bg_cyan_subtle"] = "#bfefff",
-        ["bg_red_nuanced"] = "#fff1f0",
-        ["bg_green_nuanced"] = "#ecf7ed",
-        ["bg_yellow_nuanced"] = "#fff3da",
-        ["bg_blue_nuanced"] = "#f3f3ff",
-        ["bg_magenta_nuanced"] = "#fdf0ff",
-        ["bg_cyan_nuanced"] = "#ebf6fa",
-        ["bg_completion"] = "#c0deff",
-        ["bg_hl_line"] = "#dae5ec",
-        ["bg_paren_match"] = "#5fcfff",
-        ["bg_paren_expression"] = "#efd3f5",
-        ["bg_char_0"] = "#7feaff",
-        ["bg_char_1"] = "#ffaaff",
-        ["bg_char_2"] = "#dff000",
-        ["bg_active"] = "#e0e0e0",
-        ["fg_active"] = "#0a0a0a",
-        ["bg_inactive"] = "#e9e9e9",
-        ["fg_inactive"] = "#404148",
-        ["bg_status_line_active"] = "#c8c8c8",
-        ["fg_status_line_active"] = "#0a0a0a",
-        ["bg_status_line_inactive"] = "#e6e6e6",
-        ["fg_status_line_inactive"] = "#585858",
-        ["bg_tab_bar"] = "#dfdfdf",
-        ["bg_tab_current"] = "#ffffff",
-        ["bg_tab_other"] = "#c2c2c2",
-        ["fg_tab_other"] = "#333333",
-        ["bg_tab_alternate"] = "#c2c2e8",
-        ["bg_added"] = "#c1f2d1",
-        ["bg_added_faint"] = "#d8f8e1",
-        ["bg_added_refine"] = "#aee5be",
-        ["bg_added_fringe"] = "#6cc06c",
-        ["fg_added"] = "#005000",
-        ["fg_added_intense"] = "#006700",
-        ["bg_changed"] = "#ffdfa9",
-        ["bg_changed_faint"] = "#ffefbf",
-        ["bg_changed_refine"] = "#fac090",
-        ["bg_changed_fringe"] = "#d7c20a",
-        ["fg_changed"] = "#553d00",
-        ["fg_changed_intense"] = "#655000",
-        ["bg_removed"] = "#ffd8d5",
-        ["bg_removed_faint"] = "#ffe9e9",
-        ["bg_removed_refine"] = "#f3b5af",
-        ["bg_removed_fringe"] = "#d84a4f",
-        ["fg_removed"] = "#8f1313",
-        ["fg_removed_intense"] = "#aa2222",
-        ["bg_diff_context"] = "#f3f3f3",
-        ["tinted_bg_main"] = "#fbf7f0",
-        ["tinted_bg_dim"] = "#efe9dd",
-        ["tinted_border"] = "#9f9690",
-        ["tinted_border_highlight"] = "#5c3f3d",
-        ["tinted_bg_active"] = "#c9b9b0",
-        ["tinted_bg_inactive"] = "#dfd5cf",
-        ["tinted_red_faint"] = "#7f0000",
-        ["tinted_bg_red_nuanced"] = "#ffe8f0",
-        ["tinted_bg_green_nuanced"] = "#e0f5e0",
-        ["tinted_bg_yellow_nuanced"] = "#f9ead0",
-        ["tinted_bg_blue_nuanced"] = "#ebebff",
-        ["tinted_bg_magenta_nuanced"] = "#f6e7ff",
-        ["tinted_bg_cyan_nuanced"] = "#e1f3fc",
-        ["tinted_bg_completion"] = "#f0c1cf",
-        ["tinted_bg_hl_line"] = "#f1d5d0",
-        ["tinted_bg_paren_match"] = "#7fdfcf",
-        ["tinted_bg_status_line_active"] = "#cab9b2",
-        ["tinted_bg_status_line_inactive"] = "#dfd9cf",
-        ["tinted_bg_tab_bar"] = "#e0d4ce",
-        ["tinted_bg_tab_current"] = "#fbf7f0",
-        ["tinted_bg_tab_other"] = "#c8b8b2",
-        ["tinted_bg_tab_alternate"] = "#c8b8ca",
-        ["tinted_bg_added"] = "#c3ebc1",
-        ["tinted_bg_added_faint"] = "#dcf8d1",
-        ["tinted_bg_added_refine"] = "#acd6a5",
-        ["tinted_bg_added_fringe"] = "#6cc06c",
-        ["tinted_bg_changed_fringe"] = "#c0b200",
-        ["tinted_bg_removed"] = "#f4d0cf",
-        ["tinted_bg_removed_faint"] = "#ffe9e5",
-        ["tinted_bg_removed_refine"] = "#f3b5a7",
-        ["tinted_bg_removed_fringe"] = "#d84a4f",
-        ["tinted_bg_diff_context"] = "#efe9df",
-      },
-    },
-    ["modus_vivendi"] = {
-      ["family"] = "modus",
-      ["flavor"] = "dark",
-      ["foreground"] = "#ffffff",
-      ["background"] = "#000000",
-      ["cursor"] = "#ffffff",
-      ["selection_background"] = "#7030af",
-      ["selection_foreground"] = "#ffffff",
-      ["ansi"] = {
-        "#000000",
-        "#ff5f59",
-        "#44bc44",
-        "#d0bc00",
-        "#2fafff",
-        "#feacd0",
-        "#00d3d0",
-        "#ffffff",
-        "#303030",
-        "#ff5f5f",
-        "#44df44",
-        "#efef00",
-        "#338fff",
-        "#ff66ff",
-        "#00eff0",
-        "#989898",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#000000",
-        ["bg_dim"] = "#1e1e1e",
-        ["bg_alt"] = "#0f0f0f",
-        ["fg_main"] = "#ffffff",
-        ["fg_dim"] = "#989898",
-        ["fg_alt"] = "#c6daff",
-        ["border"] = "#646464",
-        ["border_highlight"] = "#C4C4C4",
-        ["red"] = "#ff5f59",
-        ["red_warmer"] = "#ff6b55",
-        ["red_cooler"] = "#ff7f9f",
-        ["red_faint"] = "#ff9580",
-        ["green"] = "#44bc44",
-        ["green_warmer"] = "#70b900",
-        ["green_cooler"] = "#00c06f",
-        ["green_faint"] = "#88ca9f",
-        ["yellow"] = "#d0bc00",
-        ["yellow_warmer"] = "#fec43f",
-        ["yellow_cooler"] = "#dfaf7a",
-        ["yellow_faint"] = "#d2b580",
-        ["blue"] = "#2fafff",
-        ["blue_warmer"] = "#79a8ff",
-        ["blue_cooler"] = "#00bcff",
-        ["blue_faint"] = "#82b0ec",
-        ["magenta"] = "#feacd0",
-        ["magenta_warmer"] = "#f78fe7",
-        ["magenta_cooler"] = "#b6a0ff",
-        ["magenta_faint"] = "#caa6df",
-        ["cyan"] = "#00d3d0",
-        ["cyan_warmer"] = "#4ae2f0",
-        ["cyan_cooler"] = "#6ae4b9",
-        ["cyan_faint"] = "#9ac8e0",
-        ["rust"] = "#db7b5f",
-        ["gold"] = "#c0965b",
-        ["olive"] = "#9cbd6f",
-        ["slate"] = "#76afbf",
-        ["indigo"] = "#9099d9",
-        ["maroon"] = "#cf7fa7",
-        ["pink"] = "#d09dc0",
-        ["red_intense"] = "#ff5f5f",
-        ["green_intense"] = "#44df44",
-        ["yellow_intense"] = "#efef00",
-        ["blue_intense"] = "#338fff",
-        ["magenta_intense"] = "#ff66ff",
-        ["cyan_intense"] = "#00eff0",
-        ["bg_red_intense"] = "#9d1f1f",
-        ["bg_green_intense"] = "#2f822f",
-        ["bg_yellow_intense"] = "#7a6100",
-        ["bg_blue_intense"] = "#1640b0",
-        ["bg_magenta_intense"] = "#7030af",
-        ["bg_cyan_intense"] = "#2266ae",
-        ["bg_red_subtle"] = "#620f2a",
-        ["bg_green_subtle"] = "#00422a",
-        ["bg_yellow_subtle"] = "#4a4000",
-        ["bg_blue_subtle"] = "#242679",
-        ["bg_magenta_subtle"] = "#552f5f",
-        ["bg_cyan_subtle"] = "#004065",
-        ["bg_red_nuanced"] = "#2c0614",
-        ["bg_green_nuanced"] = "#001904",
-        ["bg_yellow_nuanced"] = "#222000",
-        ["bg_blue_nuanced"] = "#0f0e39",
-        ["bg_magenta_nuanced"] = "#230631",
-        ["bg_cyan_nuanced"] = "#041529",
-        ["bg_completion"] = "#2f447f",
-        ["bg_hl_line"] = "#2f3849",
-        ["bg_paren_match"] = "#2f7f9f",
-        ["bg_paren_expression"] = "#453040",
-        ["bg_char_0"] = "#0050af",
-        ["bg_char_1"] = "#7f1f7f",
-        ["bg_char_2"] = "#625a00",
-        ["bg_active"] = "#303030",
-        ["fg_active"] = "#f4f4f4",
-        ["bg_inactive"] = "#282828",
-        ["fg_inactive"] = "#bfc0c4",
-        ["bg_status_line_active"] = "#404040",
-        ["fg_status_line_active"] = "#f0f0f0",
-        ["bg_status_line_inactive"] = "#2d2d2d",
-        ["fg_status_line_inactive"] = "#969696",
-        ["bg_tab_bar"] = "#313131",
-        ["bg_tab_current"] = "#000000",
-        ["bg_tab_other"] = "#545454",
-        ["fg_tab_other"] = "#f7f7f7",
-        ["bg_tab_alternate"] = "#545490",
-        ["bg_added"] = "#00381f",
-        ["bg_added_faint"] = "#002910",
-        ["bg_added_refine"] = "#034f2f",
-        ["bg_added_fringe"] = "#237f3f",
-        ["fg_added"] = "#a0e0a0",
-        ["fg_added_intense"] = "#80e080",
-        ["bg_changed"] = "#363300",
-        ["bg_changed_faint"] = "#2a1f00",
-        ["bg_changed_refine"] = "#4a4a00",
-        ["bg_changed_fringe"] = "#8a7a00",
-        ["fg_changed"] = "#efef80",
-        ["fg_changed_intense"] = "#c0b05f",
-        ["bg_removed"] = "#4f1119",
-        ["bg_removed_faint"] = "#380a0f",
-        ["bg_removed_refine"] = "#781a1f",
-        ["bg_removed_fringe"] = "#b81a1f",
-        ["fg_removed"] = "#ffbfbf",
-        ["fg_removed_intense"] = "#ff9095",
-        ["bg_diff_context"] = "#1a1a1a",
-        ["tinted_bg_main"] = "#0d0e1c",
-        ["tinted_bg_dim"] = "#1d2235",
-        ["tinted_border"] = "#61647a",
-        ["tinted_border_highlight"] = "#b290b0",
-        ["tinted_bg_active"] = "#4a4f69",
-        ["tinted_bg_inactive"] = "#2b3045",
-        ["tinted_red_faint"] = "#ff9f80",
-        ["tinted_bg_red_nuanced"] = "#350f14",
-        ["tinted_bg_green_nuanced"] = "#002718",
-        ["tinted_bg_yellow_nuanced"] = "#2c1f00",
-        ["tinted_bg_blue_nuanced"] = "#131c4d",
-        ["tinted_bg_magenta_nuanced"] = "#2f133f",
-        ["tinted_bg_cyan_nuanced"] = "#04253f",
-        ["tinted_bg_completion"] = "#483d8a",
-        ["tinted_bg_hl_line"] = "#303a6f",
-        ["tinted_bg_paren_match"] = "#2f7f9f",
-        ["tinted_bg_status_line_active"] = "#393F51",
-        ["tinted_bg_status_line_inactive"] = "#292d48",
-        ["tinted_bg_tab_bar"] = "#2c3045",
-        ["tinted_bg_tab_current"] = "#0d0e1c",
-        ["tinted_bg_tab_other"] = "#4a4f6a",
-        ["tinted_bg_tab_alternate"] = "#4a4f94",
-        ["tinted_bg_added"] = "#003a2f",
-        ["tinted_bg_added_faint"] = "#002922",
-        ["tinted_bg_added_refine"] = "#035542",
-        ["tinted_bg_added_fringe"] = "#23884f",
-        ["tinted_bg_changed_fringe"] = "#8f7a30",
-        ["tinted_bg_removed"] = "#4f1127",
-        ["tinted_bg_removed_faint"] = "#380a19",
-        ["tinted_bg_removed_refine"] = "#781a3a",
-        ["tinted_bg_removed_fringe"] = "#b81a26",
-        ["tinted_bg_diff_context"] = "#1a1f30",
-      },
-    },
-    ["modus_operandi_tinted"] = {
-      ["family"] = "modus",
-      ["flavor"] = "light",
-      ["foreground"] = "#000000",
-      ["background"] = "#fbf7f0",
-      ["cursor"] = "#000000",
-      ["selection_background"] = "#dfa0f0",
-      ["selection_foreground"] = "#000000",
-      ["ansi"] = {
-        "#fbf7f0",
-        "#a60000",
-        "#006300",
-        "#6d5000",
-        "#0031a9",
-        "#721045",
-        "#00598b",
-        "#000000",
-        "#dfd5cf",
-        "#d00000",
-        "#008900",
-        "#808000",
-        "#0000ff",
-        "#dd22dd",
-        "#008899",
-        "#595959",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#fbf7f0",
-        ["bg_dim"] = "#efe9dd",
-        ["fg_main"] = "#000000",
-        ["fg_dim"] = "#595959",
-        ["fg_alt"] = "#193668",
-        ["bg_active"] = "#c9b9b0",
-        ["bg_inactive"] = "#dfd5cf",
-        ["border"] = "#9f9690",
-        ["red"] = "#a60000",
-        ["red_warmer"] = "#972500",
-        ["red_cooler"] = "#a0132f",
-        ["red_faint"] = "#7f0000",
-        ["red_intense"] = "#d00000",
-        ["green"] = "#006300",
-        ["green_warmer"] = "#306010",
-        ["green_cooler"] = "#00603f",
-        ["green_faint"] = "#2a5045",
-        ["green_intense"] = "#008900",
-        ["yellow"] = "#6d5000",
-        ["yellow_warmer"] = "#894000",
-        ["yellow_cooler"] = "#602938",
-        ["yellow_faint"] = "#574316",
-        ["yellow_intense"] = "#808000",
-        ["blue"] = "#0031a9",
-        ["blue_warmer"] = "#3546c2",
-        ["blue_cooler"] = "#0000b0",
-        ["blue_faint"] = "#003497",
-        ["blue_intense"] = "#0000ff",
-        ["magenta"] = "#721045",
-        ["magenta_warmer"] = "#8f0075",
-        ["magenta_cooler"] = "#531ab6",
-        ["magenta_faint"] = "#7c318f",
-        ["magenta_intense"] = "#dd22dd",
-        ["cyan"] = "#00598b",
-        ["cyan_warmer"] = "#32548f",
-        ["cyan_cooler"] = "#005f5f",
-        ["cyan_faint"] = "#304463",
-        ["cyan_intense"] = "#008899",
-        ["rust"] = "#8a290f",
-        ["gold"] = "#6c501c",
-        ["olive"] = "#425d00",
-        ["slate"] = "#2f3f83",
-        ["indigo"] = "#4a3a8a",
-        ["maroon"] = "#731c52",
-        ["pink"] = "#7b435c",
-        ["bg_red_intense"] = "#ff8f88",
-        ["bg_green_intense"] = "#8adf80",
-        ["bg_yellow_intense"] = "#f3d000",
-        ["bg_blue_intense"] = "#bfc9ff",
-        ["bg_magenta_intense"] = "#dfa0f0",
-        ["bg_cyan_intense"] = "#a4d5f9",
-        ["bg_red_subtle"] = "#ffcfbf",
-        ["bg_green_subtle"] = "#b3fabf",
-        ["bg_yellow_subtle"] = "#fff576",
-        ["bg_blue_subtle"] = "#ccdfff",
-        ["bg_magenta_subtle"] = "#ffddff",
-        ["bg_cyan_subtle"] = "#bfefff",
-        ["bg_red_nuanced"] = "#ffe8e8",
-        ["bg_green_nuanced"] = "#e0f6e0",
-        ["bg_yellow_nuanced"] = "#f8f0d0",
-        ["bg_blue_nuanced"] = "#ecedff",
-        ["bg_magenta_nuanced"] = "#f8e6f5",
-        ["bg_cyan_nuanced"] = "#e0f2fa",
-        ["bg_clay"] = "#f1c8b5",
-        ["fg_clay"] = "#63192a",
-        ["bg_ochre"] = "#f0e3c0",
-        ["fg_ochre"] = "#573a30",
-        ["bg_lavender"] = "#dfcdfa",
-        ["fg_lavender"] = "#443379",
-        ["bg_sage"] = "#c0e7d4",
-        ["fg_sage"] = "#124b41",
-        ["bg_graph_red_0"] = "#ef7969",
-        ["bg_graph_red_1"] = "#ffaab4",
-        ["bg_graph_green_0"] = "#45c050",
-        ["bg_graph_green_1"] = "#75ef30",
-        ["bg_graph_yellow_0"] = "#ffcf00",
-        ["bg_graph_yellow_1"] = "#f9ff00",
-        ["bg_graph_blue_0"] = "#7f90ff",
-        ["bg_graph_blue_1"] = "#a6c0ff",
-        ["bg_graph_magenta_0"] = "#e07fff",
-        ["bg_graph_magenta_1"] = "#fad0ff",
-        ["bg_graph_cyan_0"] = "#70d3f0",
-        ["bg_graph_cyan_1"] = "#afefff",
-        ["bg_completion"] = "#f0c1cf",
-        ["bg_hover"] = "#b2e4dc",
-        ["bg_hover_secondary"] = "#dfe09f",
-        ["bg_hl_line"] = "#f1d5d0",
-        ["bg_region"] = "#c2bcb5",
-        ["fg_region"] = "#000000",
-        ["bg_mode_line_active"] = "#cab9b2",
-        ["fg_mode_line_active"] = "#000000",
-        ["border_mode_line_active"] = "#545454",
-        ["bg_mode_line_inactive"] = "#dfd9cf",
-        ["fg_mode_line_inactive"] = "#585858",
-        ["border_mode_line_inactive"] = "#a59a94",
-        ["modeline_err"] = "#7f0000",
-        ["modeline_warning"] = "#5f0070",
-        ["modeline_info"] = "#002580",
-        ["bg_tab_bar"] = "#e0d4ce",
-        ["bg_tab_current"] = "#fbf7f0",
-        ["bg_tab_other"] = "#c8b8b2",
-        ["bg_added"] = "#c3ebc1",
-        ["bg_added_faint"] = "#dcf8d1",
-        ["bg_added_refine"] = "#acd6a5",
-        ["bg_added_fringe"] = "#6cc06c",
-        ["fg_added"] = "#005000",
-        ["fg_added_intense"] = "#006700",
-        ["bg_changed"] = "#ffdfa9",
-        ["bg_changed_faint"] = "#ffefbf",
-        ["bg_changed_refine"] = "#fac090",
-        ["bg_changed_fringe"] = "#c0b200",
-        ["fg_changed"] = "#553d00",
-        ["fg_changed_intense"] = "#655000",
-        ["bg_removed"] = "#f4d0cf",
-        ["bg_removed_faint"] = "#ffe9e5",
-        ["bg_removed_refine"] = "#f3b5a7",
-        ["bg_removed_fringe"] = "#d84a4f",
-        ["fg_removed"] = "#8f1313",
-        ["fg_removed_intense"] = "#aa2222",
-        ["bg_diff_context"] = "#efe9df",
-        ["bg_paren_match"] = "#7fdfcf",
-        ["bg_paren_expression"] = "#efd3f5",
-        ["cursor"] = "#d00000",
-        ["keybind"] = "#a60000",
-        ["name"] = "#721045",
-        ["identifier"] = "#574316",
-        ["err"] = "#a60000",
-        ["warning"] = "#6d5000",
-        ["info"] = "#006300",
-        ["underline_err"] = "#d00000",
-        ["underline_warning"] = "#808000",
-        ["underline_note"] = "#008899",
-        ["bg_prominent_err"] = "#ff8f88",
-        ["fg_prominent_err"] = "#000000",
-        ["bg_prominent_warning"] = "#f3d000",
-        ["fg_prominent_warning"] = "#000000",
-        ["bg_prominent_note"] = "#a4d5f9",
-        ["fg_prominent_note"] = "#000000",
-        ["bg_active_argument"] = "#f8f0d0",
-        ["fg_active_argument"] = "#894000",
-        ["bg_active_value"] = "#e0f2fa",
-        ["fg_active_value"] = "#32548f",
-        ["builtin"] = "#721045",
-        ["comment"] = "#7f0000",
-        ["constant"] = "#531ab6",
-        ["docstring"] = "#304463",
-        ["fnname"] = "#602938",
-        ["fnname_call"] = "#7b435c",
-        ["keyword"] = "#0031a9",
-        ["preprocessor"] = "#894000",
-        ["property"] = "#00603f",
-        ["rx_backslash"] = "#8f0075",
-        ["rx_construct"] = "#531ab6",
-        ["string"] = "#00598b",
-        ["type"] = "#306010",
-        ["variable"] = "#00603f",
-        ["variable_use"] = "#2a5045",
-        ["accent_0"] = "#a0132f",
-        ["accent_1"] = "#00598b",
-        ["accent_2"] = "#531ab6",
-        ["accent_3"] = "#894000",
-        ["fg_completion_match_0"] = "#0031a9",
-        ["fg_completion_match_1"] = "#8f0075",
-        ["fg_completion_match_2"] = "#00598b",
-        ["fg_completion_match_3"] = "#a60000",
-        ["date_common"] = "#00598b",
-        ["date_deadline"] = "#a0132f",
-        ["date_deadline_subtle"] = "#7f0000",
-        ["date_event"] = "#193668",
-        ["date_holiday"] = "#a60000",
-        ["date_holiday_other"] = "#0031a9",
-        ["date_range"] = "#193668",
-        ["date_scheduled"] = "#6d5000",
-        ["date_scheduled_subtle"] = "#574316",
-        ["date_weekday"] = "#00598b",
-        ["date_weekend"] = "#721045",
-        ["fg_link"] = "#3546c2",
-        ["underline_link"] = "#3546c2",
-        ["fg_link_symbolic"] = "#00598b",
-        ["underline_link_symbolic"] = "#00598b",
-        ["fg_link_visited"] = "#721045",
-        ["underline_link_visited"] = "#721045",
-        ["mail_cite_0"] = "#00598b",
-        ["mail_cite_1"] = "#6d5000",
-        ["mail_cite_2"] = "#306010",
-        ["mail_cite_3"] = "#a0132f",
-        ["mail_part"] = "#00603f",
-        ["mail_recipient"] = "#3546c2",
-        ["mail_subject"] = "#8f0075",
-        ["mail_other"] = "#721045",
-        ["bg_mark_delete"] = "#ffcfbf",
-        ["fg_mark_delete"] = "#a60000",
-        ["bg_mark_select"] = "#bfefff",
-        ["fg_mark_select"] = "#00598b",
-        ["bg_mark_other"] = "#fff576",
-        ["fg_mark_other"] = "#6d5000",
-        ["fg_prompt"] = "#00603f",
-        ["fg_prose_code"] = "#00603f",
-        ["fg_prose_macro"] = "#0000b0",
-        ["fg_prose_verbatim"] = "#894000",
-        ["prose_done"] = "#006300",
-        ["prose_todo"] = "#a60000",
-        ["prose_metadata"] = "#595959",
-        ["prose_metadata_value"] = "#193668",
-        ["prose_table"] = "#193668",
-        ["prose_table_formula"] = "#8f0075",
-        ["prose_tag"] = "#7c318f",
-        ["rainbow_0"] = "#000000",
-        ["rainbow_1"] = "#dd22dd",
-        ["rainbow_2"] = "#008899",
-        ["rainbow_3"] = "#972500",
-        ["rainbow_4"] = "#808000",
-        ["rainbow_5"] = "#531ab6",
-        ["rainbow_6"] = "#008900",
-        ["rainbow_7"] = "#3546c2",
-        ["rainbow_8"] = "#8f0075",
-        ["bg_search_current"] = "#f3d000",
-        ["bg_search_lazy"] = "#a4d5f9",
-        ["bg_search_static"] = "#ffddff",
-        ["bg_search_replace"] = "#ff8f88",
-        ["bg_search_rx_group_0"] = "#bfc9ff",
-        ["bg_search_rx_group_1"] = "#8adf80",
-        ["bg_search_rx_group_2"] = "#ffcfbf",
-        ["bg_search_rx_group_3"] = "#ffddff",
-        ["fg_heading_0"] = "#00603f",
-        ["fg_heading_1"] = "#000000",
-        ["fg_heading_2"] = "#574316",
-        ["fg_heading_3"] = "#193668",
-        ["fg_heading_4"] = "#721045",
-        ["fg_heading_5"] = "#2a5045",
-        ["fg_heading_6"] = "#7f0000",
-        ["fg_heading_7"] = "#32548f",
-        ["fg_heading_8"] = "#595959",
-        ["bg_alt"] = "#efe9dd",
-        ["border_highlight"] = "#9f9690",
-        ["bg_tab_alternate"] = "#c8b8b2",
-      },
-    },
-    ["modus_operandi_deuteranopia"] = {
-      ["family"] = "modus",
-      ["flavor"] = "light",
-      ["foreground"] = "#000000",
-      ["background"] = "#ffffff",
-      ["cursor"] = "#000000",
-      ["selection_background"] = "#dfa0f0",
-      ["selection_foreground"] = "#000000",
-      ["ansi"] = {
-        "#ffffff",
-        "#a60000",
-        "#006800",
-        "#695500",
-        "#0031a9",
-        "#721045",
-        "#005e8b",
-        "#000000",
-        "#e0e0e0",
-        "#d00000",
-        "#008900",
-        "#808000",
-        "#0000ff",
-        "#dd22dd",
-        "#008899",
-        "#595959",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#ffffff",
-        ["bg_dim"] = "#f2f2f2",
-        ["fg_main"] = "#000000",
-        ["fg_dim"] = "#595959",
-        ["fg_alt"] = "#193668",
-        ["bg_active"] = "#c4c4c4",
-        ["bg_inactive"] = "#e0e0e0",
-        ["border"] = "#9f9f9f",
-        ["red"] = "#a60000",
-        ["red_warmer"] = "#972500",
-        ["red_cooler"] = "#a0132f",
-        ["red_faint"] = "#7f0000",
-        ["red_intense"] = "#d00000",
-        ["green"] = "#006800",
-        ["green_warmer"] = "#316500",
-        ["green_cooler"] = "#00663f",
-        ["green_faint"] = "#2a5045",
-        ["green_intense"] = "#008900",
-        ["yellow"] = "#695500",
-        ["yellow_warmer"] = "#973300",
-        ["yellow_cooler"] = "#77492f",
-        ["yellow_faint"] = "#624416",
-        ["yellow_intense"] = "#808000",
-        ["blue"] = "#0031a9",
-        ["blue_warmer"] = "#3548cf",
-        ["blue_cooler"] = "#0000b0",
-        ["blue_faint"] = "#003497",
-        ["blue_intense"] = "#0000ff",
-        ["magenta"] = "#721045",
-        ["magenta_warmer"] = "#8f0075",
-        ["magenta_cooler"] = "#531ab6",
-        ["magenta_faint"] = "#7c318f",
-        ["magenta_intense"] = "#dd22dd",
-        ["cyan"] = "#005e8b",
-        ["cyan_warmer"] = "#3f578f",
-        ["cyan_cooler"] = "#005f5f",
-        ["cyan_faint"] = "#005077",
-        ["cyan_intense"] = "#008899",
-        ["rust"] = "#8a290f",
-        ["gold"] = "#70550f",
-        ["olive"] = "#4c6000",
-        ["slate"] = "#2f3f83",
-        ["indigo"] = "#4a3a8a",
-        ["maroon"] = "#731c52",
-        ["pink"] = "#7b435c",
-        ["bg_red_intense"] = "#ff8f88",
-        ["bg_green_intense"] = "#8adf80",
-        ["bg_yellow_intense"] = "#f3d000",
-        ["bg_blue_intense"] = "#bfc9ff",
-        ["bg_magenta_intense"] = "#dfa0f0",
-        ["bg_cyan_intense"] = "#a4d5f9",
-        ["bg_red_subtle"] = "#ffcfbf",
-        ["bg_green_subtle"] = "#b3fabf",
-        ["bg_yellow_subtle"] = "#fff576",
-        ["bg_blue_subtle"] = "#ccdfff",
-        ["bg_magenta_subtle"] = "#ffddff",
-        ["bg_cyan_subtle"] = "#bfefff",
-        ["bg_red_nuanced"] = "#ffe8e8",
-        ["bg_green_nuanced"] = "#e0f6e0",
-        ["bg_yellow_nuanced"] = "#f8f0d0",
-        ["bg_blue_nuanced"] = "#ecedff",
-        ["bg_magenta_nuanced"] = "#f8e6f5",
-        ["bg_cyan_nuanced"] = "#e0f2fa",
-        ["bg_clay"] = "#f1c8b5",
-        ["fg_clay"] = "#63192a",
-        ["bg_ochre"] = "#f0e3c0",
-        ["fg_ochre"] = "#573a30",
-        ["bg_lavender"] = "#dfcdfa",
-        ["fg_lavender"] = "#443379",
-        ["bg_sage"] = "#c0e7d4",
-        ["fg_sage"] = "#124b41",
-        ["bg_graph_red_0"] = "#d0b029",
-        ["bg_graph_red_1"] = "#e0cab4",
-        ["bg_graph_green_0"] = "#8ac050",
-        ["bg_graph_green_1"] = "#afdfa5",
-        ["bg_graph_yellow_0"] = "#ffcf00",
-        ["bg_graph_yellow_1"] = "#f9ff00",
-        ["bg_graph_blue_0"] = "#7f9fff",
-        ["bg_graph_blue_1"] = "#afd0ff",
-        ["bg_graph_magenta_0"] = "#b0b0d0",
-        ["bg_graph_magenta_1"] = "#d0dfdf",
-        ["bg_graph_cyan_0"] = "#6faad9",
-        ["bg_graph_cyan_1"] = "#bfe0ff",
-        ["bg_completion"] = "#c0deff",
-        ["bg_hover"] = "#b2e4dc",
-        ["bg_hover_secondary"] = "#e5d7a0",
-        ["bg_hl_line"] = "#dae5ec",
-        ["bg_region"] = "#bdbdbd",
-        ["fg_region"] = "#000000",
-        ["bg_mode_line_active"] = "#d0d6ff",
-        ["fg_mode_line_active"] = "#0f0f0f",
-        ["border_mode_line_active"] = "#4f4f74",
-        ["bg_mode_line_inactive"] = "#e6e6e6",
-        ["fg_mode_line_inactive"] = "#585858",
-        ["border_mode_line_inactive"] = "#a3a3a3",
-        ["modeline_err"] = "#603a00",
-        ["modeline_warning"] = "#454500",
-        ["modeline_info"] = "#023d92",
-        ["bg_tab_bar"] = "#dfdfdf",
-        ["bg_tab_current"] = "#ffffff",
-        ["bg_tab_other"] = "#c2c2c2",
-        ["bg_added"] = "#d5d7ff",
-        ["bg_added_faint"] = "#e6e6ff",
-        ["bg_added_refine"] = "#babcef",
-        ["bg_added_fringe"] = "#275acc",
-        ["fg_added"] = "#303099",
-        ["fg_added_intense"] = "#0303cc",
-        ["bg_changed"] = "#eecfdf",
-        ["bg_changed_faint"] = "#f0dde5",
-        ["bg_changed_refine"] = "#e0b0d0",
-        ["bg_changed_fringe"] = "#9f6ab0",
-        ["fg_changed"] = "#6f1343",
-        ["fg_changed_intense"] = "#7f0f9f",
-        ["bg_removed"] = "#f4f099",
-        ["bg_removed_faint"] = "#f6f6b7",
-        ["bg_removed_refine"] = "#ede06f",
-        ["bg_removed_fringe"] = "#c0b200",
-        ["fg_removed"] = "#553d00",
-        ["fg_removed_intense"] = "#7f6f00",
-        ["bg_diff_context"] = "#f3f3f3",
-        ["bg_paren_match"] = "#5fcfff",
-        ["bg_paren_expression"] = "#efd3f5",
-        ["cursor"] = "#0000ff",
-        ["keybind"] = "#0000b0",
-        ["name"] = "#0000b0",
-        ["identifier"] = "#624416",
-        ["err"] = "#973300",
-        ["warning"] = "#695500",
-        ["info"] = "#0031a9",
-        ["underline_err"] = "#808000",
-        ["underline_warning"] = "#7c318f",
-        ["underline_note"] = "#005e8b",
-        ["bg_prominent_err"] = "#f3d000",
-        ["fg_prominent_err"] = "#000000",
-        ["bg_prominent_warning"] = "#dfa0f0",
-        ["fg_prominent_warning"] = "#000000",
-        ["bg_prominent_note"] = "#a4d5f9",
-        ["fg_prominent_note"] = "#000000",
-        ["bg_active_argument"] = "#f8f0d0",
-        ["fg_active_argument"] = "#973300",
-        ["bg_active_value"] = "#ecedff",
-        ["fg_active_value"] = "#3548cf",
-        ["builtin"] = "#695500",
-        ["comment"] = "#77492f",
-        ["constant"] = "#003497",
-        ["docstring"] = "#2a5045",
-        ["fnname"] = "#973300",
-        ["fnname_call"] = "#70550f",
-        ["keyword"] = "#0000b0",
-        ["preprocessor"] = "#531ab6",
-        ["property"] = "#005e8b",
-        ["rx_backslash"] = "#0000b0",
-        ["rx_construct"] = "#77492f",
-        ["string"] = "#3548cf",
-        ["type"] = "#005f5f",
-        ["variable"] = "#005e8b",
-        ["variable_use"] = "#4a3a8a",
-        ["accent_0"] = "#3548cf",
-        ["accent_1"] = "#973300",
-        ["accent_2"] = "#005e8b",
-        ["accent_3"] = "#77492f",
-        ["fg_completion_match_0"] = "#3548cf",
-        ["fg_completion_match_1"] = "#973300",
-        ["fg_completion_match_2"] = "#005e8b",
-        ["fg_completion_match_3"] = "#77492f",
-        ["date_common"] = "#005e8b",
-        ["date_deadline"] = "#973300",
-        ["date_deadline_subtle"] = "#7f0000",
-        ["date_event"] = "#193668",
-        ["date_holiday"] = "#973300",
-        ["date_holiday_other"] = "#0031a9",
-        ["date_range"] = "#193668",
-        ["date_scheduled"] = "#77492f",
-        ["date_scheduled_subtle"] = "#624416",
-        ["date_weekday"] = "#005e8b",
-        ["date_weekend"] = "#0000b0",
-        ["fg_link"] = "#3548cf",
-        ["underline_link"] = "#3548cf",
-        ["fg_link_symbolic"] = "#005e8b",
-        ["underline_link_symbolic"] = "#005e8b",
-        ["fg_link_visited"] = "#624416",
-        ["underline_link_visited"] = "#624416",
-        ["mail_cite_0"] = "#3548cf",
-        ["mail_cite_1"] = "#695500",
-        ["mail_cite_2"] = "#005077",
-        ["mail_cite_3"] = "#624416",
-        ["mail_part"] = "#0031a9",
-        ["mail_recipient"] = "#0031a9",
-        ["mail_subject"] = "#77492f",
-        ["mail_other"] = "#005077",
-        ["bg_mark_delete"] = "#fff576",
-        ["fg_mark_delete"] = "#695500",
-        ["bg_mark_select"] = "#bfefff",
-        ["fg_mark_select"] = "#005e8b",
-        ["bg_mark_other"] = "#ffddff",
-        ["fg_mark_other"] = "#721045",
-        ["fg_prompt"] = "#0031a9",
-        ["fg_prose_code"] = "#005f5f",
-        ["fg_prose_macro"] = "#531ab6",
-        ["fg_prose_verbatim"] = "#695500",
-        ["prose_done"] = "#0031a9",
-        ["prose_todo"] = "#973300",
-        ["prose_metadata"] = "#595959",
-        ["prose_metadata_value"] = "#193668",
-        ["prose_table"] = "#193668",
-        ["prose_table_formula"] = "#973300",
-        ["prose_tag"] = "#193668",
-        ["rainbow_0"] = "#0031a9",
-        ["rainbow_1"] = "#695500",
-        ["rainbow_2"] = "#3548cf",
-        ["rainbow_3"] = "#77492f",
-        ["rainbow_4"] = "#0000b0",
-        ["rainbow_5"] = "#973300",
-        ["rainbow_6"] = "#003497",
-        ["rainbow_7"] = "#624416",
-        ["rainbow_8"] = "#005e8b",
-        ["bg_search_current"] = "#f3d000",
-        ["bg_search_lazy"] = "#bfc9ff",
-        ["bg_search_static"] = "#bfefff",
-        ["bg_search_replace"] = "#f3d000",
-        ["bg_search_rx_group_0"] = "#a4d5f9",
-        ["bg_search_rx_group_1"] = "#dfa0f0",
-        ["bg_search_rx_group_2"] = "#ccdfff",
-        ["bg_search_rx_group_3"] = "#fff576",
-        ["fg_heading_0"] = "#005f5f",
-        ["fg_heading_1"] = "#000000",
-        ["fg_heading_2"] = "#624416",
-        ["fg_heading_3"] = "#003497",
-        ["fg_heading_4"] = "#2a5045",
-        ["fg_heading_5"] = "#531ab6",
-        ["fg_heading_6"] = "#77492f",
-        ["fg_heading_7"] = "#005e8b",
-        ["fg_heading_8"] = "#595959",
-        ["bg_alt"] = "#f2f2f2",
-        ["border_highlight"] = "#9f9f9f",
-        ["bg_tab_alternate"] = "#c2c2c2",
-      },
-    },
-    ["modus_operandi_tritanopia"] = {
-      ["family"] = "modus",
-      ["flavor"] = "light",
-      ["foreground"] = "#000000",
-      ["background"] = "#ffffff",
-      ["cursor"] = "#000000",
-      ["selection_background"] = "#dfa0f0",
-      ["selection_foreground"] = "#000000",
-      ["ansi"] = {
-        "#ffffff",
-        "#a60000",
-        "#006800",
-        "#695500",
-        "#0031a9",
-        "#721045",
-        "#005e8b",
-        "#000000",
-        "#e0e0e0",
-        "#d00000",
-        "#008900",
-        "#808000",
-        "#0000ff",
-        "#cd22bd",
-        "#008899",
-        "#595959",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#ffffff",
-        ["bg_dim"] = "#f2f2f2",
-        ["fg_main"] = "#000000",
-        ["fg_dim"] = "#595959",
-        ["fg_alt"] = "#224960",
-        ["bg_active"] = "#c4c4c4",
-        ["bg_inactive"] = "#e0e0e0",
-        ["border"] = "#9f9f9f",
-        ["red"] = "#a60000",
-        ["red_warmer"] = "#b21100",
-        ["red_cooler"] = "#a0132f",
-        ["red_faint"] = "#702000",
-        ["red_intense"] = "#d00000",
-        ["green"] = "#006800",
-        ["green_warmer"] = "#316500",
-        ["green_cooler"] = "#00663f",
-        ["green_faint"] = "#2a5045",
-        ["green_intense"] = "#008900",
-        ["yellow"] = "#695500",
-        ["yellow_warmer"] = "#973300",
-        ["yellow_cooler"] = "#77492f",
-        ["yellow_faint"] = "#624416",
-        ["yellow_intense"] = "#808000",
-        ["blue"] = "#0031a9",
-        ["blue_warmer"] = "#3548cf",
-        ["blue_cooler"] = "#0000b0",
-        ["blue_faint"] = "#003497",
-        ["blue_intense"] = "#0000ff",
-        ["magenta"] = "#721045",
-        ["magenta_warmer"] = "#8f0075",
-        ["magenta_cooler"] = "#531ab6",
-        ["magenta_faint"] = "#7c318f",
-        ["magenta_intense"] = "#cd22bd",
-        ["cyan"] = "#005e8b",
-        ["cyan_warmer"] = "#3f578f",
-        ["cyan_cooler"] = "#005f5f",
-        ["cyan_faint"] = "#004f5f",
-        ["cyan_intense"] = "#008899",
-        ["rust"] = "#8a290f",
-        ["gold"] = "#70550f",
-        ["olive"] = "#4c6000",
-        ["slate"] = "#104860",
-        ["indigo"] = "#4a3a8a",
-        ["maroon"] = "#731c52",
-        ["pink"] = "#7b435c",
-        ["bg_red_intense"] = "#ff8f88",
-        ["bg_green_intense"] = "#8adf80",
-        ["bg_yellow_intense"] = "#f3d000",
-        ["bg_blue_intense"] = "#bfc9ff",
-        ["bg_magenta_intense"] = "#dfa0f0",
-        ["bg_cyan_intense"] = "#a4d5f9",
-        ["bg_red_subtle"] = "#ffcfbf",
-        ["bg_green_subtle"] = "#b3fabf",
-        ["bg_yellow_subtle"] = "#fff576",
-        ["bg_blue_subtle"] = "#ccdfff",
-        ["bg_magenta_subtle"] = "#ffddff",
-        ["bg_cyan_subtle"] = "#bfefff",
-        ["bg_red_nuanced"] = "#ffe8e8",
-        ["bg_green_nuanced"] = "#e0f6e0",
-        ["bg_yellow_nuanced"] = "#f8f0d0",
-        ["bg_blue_nuanced"] = "#ecedff",
-        ["bg_magenta_nuanced"] = "#f8e6f5",
-        ["bg_cyan_nuanced"] = "#e0f2fa",
-        ["bg_clay"] = "#f1c8b5",
-        ["fg_clay"] = "#63192a",
-        ["bg_ochre"] = "#f0e3c0",
-        ["fg_ochre"] = "#573a30",
-        ["bg_lavender"] = "#dfcdfa",
-        ["fg_lavender"] = "#443379",
-        ["bg_sage"] = "#c0e7d4",
-        ["fg_sage"] = "#124b41",
-        ["bg_graph_red_0"] = "#ef7969",
-        ["bg_graph_red_1"] = "#ffaab4",
-        ["bg_graph_green_0"] = "#68c0a0",
-        ["bg_graph_green_1"] = "#a5dfd0",
-        ["bg_graph_yellow_0"] = "#d99f9f",
-        ["bg_graph_yellow_1"] = "#ffb58f",
-        ["bg_graph_blue_0"] = "#80a0df",
-        ["bg_graph_blue_1"] = "#a8cfff",
-        ["bg_graph_magenta_0"] = "#efafcf",
-        ["bg_graph_magenta_1"] = "#ffdaef",
-        ["bg_graph_cyan_0"] = "#7fd3ed",
-        ["bg_graph_cyan_1"] = "#afefff",
-        ["bg_completion"] = "#afdfef",
-        ["bg_hover"] = "#ffafbc",
-        ["bg_hover_secondary"] = "#abdfdd",
-        ["bg_hl_line"] = "#dfeaec",
-        ["bg_region"] = "#bdbdbd",
-        ["fg_region"] = "#000000",
-        ["bg_mode_line_active"] = "#afe0f2",
-        ["fg_mode_line_active"] = "#0f0f0f",
-        ["border_mode_line_active"] = "#2f4f44",
-        ["bg_mode_line_inactive"] = "#e6e6e6",
-        ["fg_mode_line_inactive"] = "#585858",
-        ["border_mode_line_inactive"] = "#a3a3a3",
-        ["modeline_err"] = "#8f0000",
-        ["modeline_warning"] = "#6f306f",
-        ["modeline_info"] = "#00445f",
-        ["bg_tab_bar"] = "#dfdfdf",
-        ["bg_tab_current"] = "#ffffff",
-        ["bg_tab_other"] = "#c2c2c2",
-        ["bg_added"] = "#b5e7ff",
-        ["bg_added_faint"] = "#c6f6ff",
-        ["bg_added_refine"] = "#9adcef",
-        ["bg_added_fringe"] = "#1782cc",
-        ["fg_added"] = "#005079",
-        ["fg_added_intense"] = "#0043aa",
-        ["bg_changed"] = "#eecfdf",
-        ["bg_changed_faint"] = "#f0dde5",
-        ["bg_changed_refine"] = "#e0b0d0",
-        ["bg_changed_fringe"] = "#9f6ab0",
-        ["fg_changed"] = "#6f1343",
-        ["fg_changed_intense"] = "#7f0f9f",
-        ["bg_removed"] = "#ffd8d5",
-        ["bg_removed_faint"] = "#ffe9e9",
-        ["bg_removed_refine"] = "#f3b5af",
-        ["bg_removed_fringe"] = "#d84a4f",
-        ["fg_removed"] = "#8f1313",
-        ["fg_removed_intense"] = "#aa2222",
-        ["bg_diff_context"] = "#f3f3f3",
-        ["bg_paren_match"] = "#5fcfff",
-        ["bg_paren_expression"] = "#efd3f5",
-        ["cursor"] = "#d00000",
-        ["keybind"] = "#a60000",
-        ["name"] = "#a0132f",
-        ["identifier"] = "#702000",
-        ["err"] = "#b21100",
-        ["warning"] = "#721045",
-        ["info"] = "#005e8b",
-        ["underline_err"] = "#d00000",
-        ["underline_warning"] = "#cd22bd",
-        ["underline_note"] = "#008899",
-        ["bg_prominent_err"] = "#ff8f88",
-        ["fg_prominent_err"] = "#000000",
-        ["bg_prominent_warning"] = "#dfa0f0",
-        ["fg_prominent_warning"] = "#000000",
-        ["bg_prominent_note"] = "#a4d5f9",
-        ["fg_prominent_note"] = "#000000",
-        ["bg_active_argument"] = "#ffe8e8",
-        ["fg_active_argument"] = "#b21100",
-        ["bg_active_value"] = "#e0f2fa",
-        ["fg_active_value"] = "#005e8b",
-        ["builtin"] = "#721045",
-        ["comment"] = "#702000",
-        ["constant"] = "#00663f",
-        ["docstring"] = "#224960",
-        ["fnname"] = "#3f578f",
-        ["fnname_call"] = "#4a3a8a",
-        ["keyword"] = "#a0132f",
-        ["preprocessor"] = "#b21100",
-        ["property"] = "#005f5f",
-        ["rx_backslash"] = "#721045",
-        ["rx_construct"] = "#a60000",
-        ["string"] = "#005e8b",
-        ["type"] = "#3548cf",
-        ["variable"] = "#005f5f",
-        ["variable_use"] = "#104860",
-        ["accent_0"] = "#005e8b",
-        ["accent_1"] = "#b21100",
-        ["accent_2"] = "#005f5f",
-        ["accent_3"] = "#721045",
-        ["fg_completion_match_0"] = "#005e8b",
-        ["fg_completion_match_1"] = "#b21100",
-        ["fg_completion_match_2"] = "#721045",
-        ["fg_completion_match_3"] = "#005f5f",
-        ["date_common"] = "#005f5f",
-        ["date_deadline"] = "#a60000",
-        ["date_deadline_subtle"] = "#702000",
-        ["date_event"] = "#224960",
-        ["date_holiday"] = "#a60000",
-        ["date_holiday_other"] = "#005e8b",
-        ["date_range"] = "#224960",
-        ["date_scheduled"] = "#721045",
-        ["date_scheduled_subtle"] = "#7c318f",
-        ["date_weekday"] = "#005e8b",
-        ["date_weekend"] = "#8f0075",
-        ["fg_link"] = "#005e8b",
-        ["underline_link"] = "#005e8b",
-        ["fg_link_symbolic"] = "#005f5f",
-        ["underline_link_symbolic"] = "#005f5f",
-        ["fg_link_visited"] = "#721045",
-        ["underline_link_visited"] = "#721045",
-        ["mail_cite_0"] = "#004f5f",
-        ["mail_cite_1"] = "#702000",
-        ["mail_cite_2"] = "#8f0075",
-        ["mail_cite_3"] = "#3f578f",
-        ["mail_part"] = "#005f5f",
-        ["mail_recipient"] = "#005e8b",
-        ["mail_subject"] = "#a0132f",
-        ["mail_other"] = "#005e8b",
-        ["bg_mark_delete"] = "#ffcfbf",
-        ["fg_mark_delete"] = "#a60000",
-        ["bg_mark_select"] = "#bfefff",
-        ["fg_mark_select"] = "#005e8b",
-        ["bg_mark_other"] = "#ffddff",
-        ["fg_mark_other"] = "#721045",
-        ["fg_prompt"] = "#005f5f",
-        ["fg_prose_code"] = "#005e8b",
-        ["fg_prose_macro"] = "#b21100",
-        ["fg_prose_verbatim"] = "#8f0075",
-        ["prose_done"] = "#005e8b",
-        ["prose_todo"] = "#a60000",
-        ["prose_metadata"] = "#595959",
-        ["prose_metadata_value"] = "#224960",
-        ["prose_table"] = "#224960",
-        ["prose_table_formula"] = "#a0132f",
-        ["prose_tag"] = "#224960",
-        ["rainbow_0"] = "#005e8b",
-        ["rainbow_1"] = "#a60000",
-        ["rainbow_2"] = "#3f578f",
-        ["rainbow_3"] = "#a0132f",
-        ["rainbow_4"] = "#005f5f",
-        ["rainbow_5"] = "#721045",
-        ["rainbow_6"] = "#004f5f",
-        ["rainbow_7"] = "#7c318f",
-        ["rainbow_8"] = "#702000",
-        ["bg_search_current"] = "#ff8f88",
-        ["bg_search_lazy"] = "#a4d5f9",
-        ["bg_search_static"] = "#ffddff",
-        ["bg_search_replace"] = "#dfa0f0",
-        ["bg_search_rx_group_0"] = "#bfc9ff",
-        ["bg_search_rx_group_1"] = "#dfa0f0",
-        ["bg_search_rx_group_2"] = "#bfefff",
-        ["bg_search_rx_group_3"] = "#ffcfbf",
-        ["fg_heading_0"] = "#005f5f",
-        ["fg_heading_1"] = "#000000",
-        ["fg_heading_2"] = "#702000",
-        ["fg_heading_3"] = "#004f5f",
-        ["fg_heading_4"] = "#721045",
-        ["fg_heading_5"] = "#2a5045",
-        ["fg_heading_6"] = "#7c318f",
-        ["fg_heading_7"] = "#3f578f",
-        ["fg_heading_8"] = "#595959",
-        ["bg_alt"] = "#f2f2f2",
-        ["border_highlight"] = "#9f9f9f",
-        ["bg_tab_alternate"] = "#c2c2c2",
-      },
-    },
-    ["modus_vivendi_tinted"] = {
-      ["family"] = "modus",
-      ["flavor"] = "dark",
-      ["foreground"] = "#ffffff",
-      ["background"] = "#0d0e1c",
-      ["cursor"] = "#ffffff",
-      ["selection_background"] = "#7030af",
-      ["selection_foreground"] = "#ffffff",
-      ["ansi"] = {
-        "#0d0e1c",
-        "#ff5f59",
-        "#44bc44",
-        "#d0bc00",
-        "#2fafff",
-        "#feacd0",
-        "#00d3d0",
-        "#ffffff",
-        "#4a4f69",
-        "#ff5f5f",
-        "#44df44",
-        "#efef00",
-        "#338fff",
-        "#ff66ff",
-        "#00eff0",
-        "#989898",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#0d0e1c",
-        ["bg_dim"] = "#1d2235",
-        ["fg_main"] = "#ffffff",
-        ["fg_dim"] = "#989898",
-        ["fg_alt"] = "#c6daff",
-        ["bg_active"] = "#4a4f69",
-        ["bg_inactive"] = "#2b3045",
-        ["border"] = "#61647a",
-        ["red"] = "#ff5f59",
-        ["red_warmer"] = "#ff6b55",
-        ["red_cooler"] = "#ff7f86",
-        ["red_faint"] = "#ef8386",
-        ["red_intense"] = "#ff5f5f",
-        ["green"] = "#44bc44",
-        ["green_warmer"] = "#75c13e",
-        ["green_cooler"] = "#11c777",
-        ["green_faint"] = "#88ca9f",
-        ["green_intense"] = "#44df44",
-        ["yellow"] = "#d0bc00",
-        ["yellow_warmer"] = "#fec43f",
-        ["yellow_cooler"] = "#dfaf7a",
-        ["yellow_faint"] = "#d2b580",
-        ["yellow_intense"] = "#efef00",
-        ["blue"] = "#2fafff",
-        ["blue_warmer"] = "#79a8ff",
-        ["blue_cooler"] = "#00bcff",
-        ["blue_faint"] = "#82b0ec",
-        ["blue_intense"] = "#338fff",
-        ["magenta"] = "#feacd0",
-        ["magenta_warmer"] = "#f78fe7",
-        ["magenta_cooler"] = "#b6a0ff",
-        ["magenta_faint"] = "#caa6df",
-        ["magenta_intense"] = "#ff66ff",
-        ["cyan"] = "#00d3d0",
-        ["cyan_warmer"] = "#4ae2f0",
-        ["cyan_cooler"] = "#6ae4b9",
-        ["cyan_faint"] = "#9ac8e0",
-        ["cyan_intense"] = "#00eff0",
-        ["rust"] = "#db8b3f",
-        ["gold"] = "#c0965b",
-        ["olive"] = "#9cbd6f",
-        ["slate"] = "#76afbf",
-        ["indigo"] = "#9099d9",
-        ["maroon"] = "#cf7fa7",
-        ["pink"] = "#d09dc0",
-        ["bg_red_intense"] = "#9d1f1f",
-        ["bg_green_intense"] = "#2f822f",
-        ["bg_yellow_intense"] = "#7a6100",
-        ["bg_blue_intense"] = "#1640b0",
-        ["bg_magenta_intense"] = "#7030af",
-        ["bg_cyan_intense"] = "#2266ae",
-        ["bg_red_subtle"] = "#620f2a",
-        ["bg_green_subtle"] = "#00422a",
-        ["bg_yellow_subtle"] = "#4a4000",
-        ["bg_blue_subtle"] = "#242679",
-        ["bg_magenta_subtle"] = "#552f5f",
-        ["bg_cyan_subtle"] = "#004065",
-        ["bg_red_nuanced"] = "#3a0c14",
-        ["bg_green_nuanced"] = "#092f1f",
-        ["bg_yellow_nuanced"] = "#381d0f",
-        ["bg_blue_nuanced"] = "#12154a",
-        ["bg_magenta_nuanced"] = "#2f0c3f",
-        ["bg_cyan_nuanced"] = "#042837",
-        ["bg_clay"] = "#49191a",
-        ["fg_clay"] = "#f1b090",
-        ["bg_ochre"] = "#462f20",
-        ["fg_ochre"] = "#e0d09c",
-        ["bg_lavender"] = "#38325c",
-        ["fg_lavender"] = "#dfc0f0",
-        ["bg_sage"] = "#143e32",
-        ["fg_sage"] = "#83d7ac",
-        ["bg_graph_red_0"] = "#b52c2c",
-        ["bg_graph_red_1"] = "#702020",
-        ["bg_graph_green_0"] = "#0fed00",
-        ["bg_graph_green_1"] = "#007800",
-        ["bg_graph_yellow_0"] = "#f1e00a",
-        ["bg_graph_yellow_1"] = "#b08940",
-        ["bg_graph_blue_0"] = "#2fafef",
-        ["bg_graph_blue_1"] = "#1f2f8f",
-        ["bg_graph_magenta_0"] = "#bf94fe",
-        ["bg_graph_magenta_1"] = "#5f509f",
-        ["bg_graph_cyan_0"] = "#47dfea",
-        ["bg_graph_cyan_1"] = "#00808f",
-        ["bg_completion"] = "#483d8a",
-        ["bg_hover"] = "#45605e",
-        ["bg_hover_secondary"] = "#64404f",
-        ["bg_hl_line"] = "#303a6f",
-        ["bg_region"] = "#555a66",
-        ["fg_region"] = "#ffffff",
-        ["bg_mode_line_active"] = "#484d67",
-        ["fg_mode_line_active"] = "#ffffff",
-        ["border_mode_line_active"] = "#979797",
-        ["bg_mode_line_inactive"] = "#292d48",
-        ["fg_mode_line_inactive"] = "#969696",
-        ["border_mode_line_inactive"] = "#606270",
-        ["modeline_err"] = "#ffa9bf",
-        ["modeline_warning"] = "#dfcf43",
-        ["modeline_info"] = "#9fefff",
-        ["bg_tab_bar"] = "#2c3045",
-        ["bg_tab_current"] = "#0d0e1c",
-        ["bg_tab_other"] = "#4a4f6a",
-        ["bg_added"] = "#003a2f",
-        ["bg_added_faint"] = "#002922",
-        ["bg_added_refine"] = "#035542",
-        ["bg_added_fringe"] = "#23884f",
-        ["fg_added"] = "#a0e0a0",
-        ["fg_added_intense"] = "#80e080",
-        ["bg_changed"] = "#363300",
-        ["bg_changed_faint"] = "#2a1f00",
-        ["bg_changed_refine"] = "#4a4a00",
-        ["bg_changed_fringe"] = "#8f7a30",
-        ["fg_changed"] = "#efef80",
-        ["fg_changed_intense"] = "#c0b05f",
-        ["bg_removed"] = "#4f1127",
-        ["bg_removed_faint"] = "#380a19",
-        ["bg_removed_refine"] = "#781a3a",
-        ["bg_removed_fringe"] = "#b81a26",
-        ["fg_removed"] = "#ffbfbf",
-        ["fg_removed_intense"] = "#ff9095",
-        ["bg_diff_context"] = "#1a1f30",
-        ["bg_paren_match"] = "#4f7f9f",
-        ["bg_paren_expression"] = "#453040",
-        ["cursor"] = "#ff66ff",
-        ["keybind"] = "#b6a0ff",
-        ["name"] = "#feacd0",
-        ["identifier"] = "#d2b580",
-        ["err"] = "#ff5f59",
-        ["warning"] = "#d0bc00",
-        ["info"] = "#11c777",
-        ["underline_err"] = "#ff5f5f",
-        ["underline_warning"] = "#d0bc00",
-        ["underline_note"] = "#00d3d0",
-        ["bg_prominent_err"] = "#9d1f1f",
-        ["fg_prominent_err"] = "#ffffff",
-        ["bg_prominent_warning"] = "#7a6100",
-        ["fg_prominent_warning"] = "#ffffff",
-        ["bg_prominent_note"] = "#2266ae",
-        ["fg_prominent_note"] = "#ffffff",
-        ["bg_active_argument"] = "#381d0f",
-        ["fg_active_argument"] = "#dfaf7a",
-        ["bg_active_value"] = "#042837",
-        ["fg_active_value"] = "#6ae4b9",
-        ["builtin"] = "#feacd0",
-        ["comment"] = "#ef8386",
-        ["constant"] = "#b6a0ff",
-        ["docstring"] = "#9ac8e0",
-        ["fnname"] = "#f78fe7",
-        ["fnname_call"] = "#d09dc0",
-        ["keyword"] = "#79a8ff",
-        ["preprocessor"] = "#ff7f86",
-        ["property"] = "#4ae2f0",
-        ["rx_backslash"] = "#f78fe7",
-        ["rx_construct"] = "#b6a0ff",
-        ["string"] = "#2fafff",
-        ["type"] = "#11c777",
-        ["variable"] = "#4ae2f0",
-        ["variable_use"] = "#76afbf",
-        ["accent_0"] = "#b6a0ff",
-        ["accent_1"] = "#00d3d0",
-        ["accent_2"] = "#f78fe7",
-        ["accent_3"] = "#fec43f",
-        ["fg_completion_match_0"] = "#00bcff",
-        ["fg_completion_match_1"] = "#f78fe7",
-        ["fg_completion_match_2"] = "#6ae4b9",
-        ["fg_completion_match_3"] = "#d0bc00",
-        ["date_common"] = "#00d3d0",
-        ["date_deadline"] = "#ff7f86",
-        ["date_deadline_subtle"] = "#ef8386",
-        ["date_event"] = "#c6daff",
-        ["date_holiday"] = "#f78fe7",
-        ["date_holiday_other"] = "#2fafff",
-        ["date_range"] = "#c6daff",
-        ["date_scheduled"] = "#dfaf7a",
-        ["date_scheduled_subtle"] = "#d2b580",
-        ["date_weekday"] = "#00d3d0",
-        ["date_weekend"] = "#feacd0",
-        ["fg_link"] = "#79a8ff",
-        ["underline_link"] = "#79a8ff",
-        ["fg_link_symbolic"] = "#00d3d0",
-        ["underline_link_symbolic"] = "#00d3d0",
-        ["fg_link_visited"] = "#feacd0",
-        ["underline_link_visited"] = "#feacd0",
-        ["mail_cite_0"] = "#82b0ec",
-        ["mail_cite_1"] = "#dfaf7a",
-        ["mail_cite_2"] = "#6ae4b9",
-        ["mail_cite_3"] = "#ff7f86",
-        ["mail_part"] = "#2fafff",
-        ["mail_recipient"] = "#79a8ff",
-        ["mail_subject"] = "#f78fe7",
-        ["mail_other"] = "#feacd0",
-        ["bg_mark_delete"] = "#620f2a",
-        ["fg_mark_delete"] = "#ff7f86",
-        ["bg_mark_select"] = "#004065",
-        ["fg_mark_select"] = "#00d3d0",
-        ["bg_mark_other"] = "#4a4000",
-        ["fg_mark_other"] = "#d0bc00",
-        ["fg_prompt"] = "#4ae2f0",
-        ["fg_prose_code"] = "#6ae4b9",
-        ["fg_prose_macro"] = "#b6a0ff",
-        ["fg_prose_verbatim"] = "#f78fe7",
-        ["prose_done"] = "#44bc44",
-        ["prose_todo"] = "#ff5f59",
-        ["prose_metadata"] = "#989898",
-        ["prose_metadata_value"] = "#c6daff",
-        ["prose_table"] = "#c6daff",
-        ["prose_table_formula"] = "#f78fe7",
-        ["prose_tag"] = "#caa6df",
-        ["rainbow_0"] = "#ffffff",
-        ["rainbow_1"] = "#ff66ff",
-        ["rainbow_2"] = "#00eff0",
-        ["rainbow_3"] = "#ff6b55",
-        ["rainbow_4"] = "#efef00",
-        ["rainbow_5"] = "#b6a0ff",
-        ["rainbow_6"] = "#44df44",
-        ["rainbow_7"] = "#79a8ff",
-        ["rainbow_8"] = "#f78fe7",
-        ["bg_search_current"] = "#7a6100",
-        ["bg_search_lazy"] = "#2266ae",
-        ["bg_search_static"] = "#552f5f",
-        ["bg_search_replace"] = "#9d1f1f",
-        ["bg_search_rx_group_0"] = "#1640b0",
-        ["bg_search_rx_group_1"] = "#2f822f",
-        ["bg_search_rx_group_2"] = "#620f2a",
-        ["bg_search_rx_group_3"] = "#552f5f",
-        ["fg_heading_0"] = "#6ae4b9",
-        ["fg_heading_1"] = "#ffffff",
-        ["fg_heading_2"] = "#d2b580",
-        ["fg_heading_3"] = "#82b0ec",
-        ["fg_heading_4"] = "#feacd0",
-        ["fg_heading_5"] = "#88ca9f",
-        ["fg_heading_6"] = "#ef8386",
-        ["fg_heading_7"] = "#9ac8e0",
-        ["fg_heading_8"] = "#989898",
-        ["bg_alt"] = "#1d2235",
-        ["border_highlight"] = "#61647a",
-        ["bg_tab_alternate"] = "#4a4f6a",
-      },
-    },
-    ["modus_vivendi_deuteranopia"] = {
-      ["family"] = "modus",
-      ["flavor"] = "dark",
-      ["foreground"] = "#ffffff",
-      ["background"] = "#000000",
-      ["cursor"] = "#ffffff",
-      ["selection_background"] = "#7030af",
-      ["selection_foreground"] = "#ffffff",
-      ["ansi"] = {
-        "#000000",
-        "#ff5f59",
-        "#44bc44",
-        "#cabf00",
-        "#2fafff",
-        "#feacd0",
-        "#00d3d0",
-        "#ffffff",
-        "#535353",
-        "#ff5f5f",
-        "#44df44",
-        "#efef00",
-        "#338fff",
-        "#ff66ff",
-        "#00eff0",
-        "#989898",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#000000",
-        ["bg_dim"] = "#1e1e1e",
-        ["fg_main"] = "#ffffff",
-        ["fg_dim"] = "#989898",
-        ["fg_alt"] = "#c6daff",
-        ["bg_active"] = "#535353",
-        ["bg_inactive"] = "#303030",
-        ["border"] = "#646464",
-        ["red"] = "#ff5f59",
-        ["red_warmer"] = "#ff6b55",
-        ["red_cooler"] = "#ff7f86",
-        ["red_faint"] = "#ff9580",
-        ["red_intense"] = "#ff5f5f",
-        ["green"] = "#44bc44",
-        ["green_warmer"] = "#70b900",
-        ["green_cooler"] = "#00c06f",
-        ["green_faint"] = "#88ca9f",
-        ["green_intense"] = "#44df44",
-        ["yellow"] = "#cabf00",
-        ["yellow_warmer"] = "#ffa00f",
-        ["yellow_cooler"] = "#d8af7a",
-        ["yellow_faint"] = "#d2b580",
-        ["yellow_intense"] = "#efef00",
-        ["blue"] = "#2fafff",
-        ["blue_warmer"] = "#79a8ff",
-        ["blue_cooler"] = "#00bcff",
-        ["blue_faint"] = "#82b0ec",
-        ["blue_intense"] = "#338fff",
-        ["magenta"] = "#feacd0",
-        ["magenta_warmer"] = "#f78fe7",
-        ["magenta_cooler"] = "#b6a0ff",
-        ["magenta_faint"] = "#caa6df",
-        ["magenta_intense"] = "#ff66ff",
-        ["cyan"] = "#00d3d0",
-        ["cyan_warmer"] = "#4ae2f0",
-        ["cyan_cooler"] = "#6ae4b9",
-        ["cyan_faint"] = "#9ac8e0",
-        ["cyan_intense"] = "#00eff0",
-        ["rust"] = "#db7b5f",
-        ["gold"] = "#c0965b",
-        ["olive"] = "#9cbd6f",
-        ["slate"] = "#76afbf",
-        ["indigo"] = "#9099d9",
-        ["maroon"] = "#cf7fa7",
-        ["pink"] = "#d09dc0",
-        ["bg_red_intense"] = "#9d1f1f",
-        ["bg_green_intense"] = "#2f822f",
-        ["bg_yellow_intense"] = "#7a6100",
-        ["bg_blue_intense"] = "#1640b0",
-        ["bg_magenta_intense"] = "#7030af",
-        ["bg_cyan_intense"] = "#2266ae",
-        ["bg_red_subtle"] = "#620f2a",
-        ["bg_green_subtle"] = "#00422a",
-        ["bg_yellow_subtle"] = "#4a4000",
-        ["bg_blue_subtle"] = "#242679",
-        ["bg_magenta_subtle"] = "#552f5f",
-        ["bg_cyan_subtle"] = "#004065",
-        ["bg_red_nuanced"] = "#3a0c14",
-        ["bg_green_nuanced"] = "#092f1f",
-        ["bg_yellow_nuanced"] = "#381d0f",
-        ["bg_blue_nuanced"] = "#12154a",
-        ["bg_magenta_nuanced"] = "#2f0c3f",
-        ["bg_cyan_nuanced"] = "#042837",
-        ["bg_clay"] = "#49191a",
-        ["fg_clay"] = "#f1b090",
-        ["bg_ochre"] = "#462f20",
-        ["fg_ochre"] = "#e0d09c",
-        ["bg_lavender"] = "#38325c",
-        ["fg_lavender"] = "#dfc0f0",
-        ["bg_sage"] = "#143e32",
-        ["fg_sage"] = "#c3e7d4",
-        ["bg_graph_red_0"] = "#bf6000",
-        ["bg_graph_red_1"] = "#733500",
-        ["bg_graph_green_0"] = "#6fbf8f",
-        ["bg_graph_green_1"] = "#2f5f4f",
-        ["bg_graph_yellow_0"] = "#c1c00a",
-        ["bg_graph_yellow_1"] = "#7f6640",
-        ["bg_graph_blue_0"] = "#0f90ef",
-        ["bg_graph_blue_1"] = "#1f2f8f",
-        ["bg_graph_magenta_0"] = "#7f7f8e",
-        ["bg_graph_magenta_1"] = "#4f4f5f",
-        ["bg_graph_cyan_0"] = "#376f9a",
-        ["bg_graph_cyan_1"] = "#00404f",
-        ["bg_completion"] = "#2f447f",
-        ["bg_hover"] = "#45605e",
-        ["bg_hover_secondary"] = "#604c30",
-        ["bg_hl_line"] = "#2f3849",
-        ["bg_region"] = "#5a5a5a",
-        ["fg_region"] = "#ffffff",
-        ["bg_mode_line_active"] = "#2a2a6a",
-        ["fg_mode_line_active"] = "#f0f0f0",
-        ["border_mode_line_active"] = "#8080a7",
-        ["bg_mode_line_inactive"] = "#2d2d2d",
-        ["fg_mode_line_inactive"] = "#969696",
-        ["border_mode_line_inactive"] = "#606060",
-        ["modeline_err"] = "#e5bf00",
-        ["modeline_warning"] = "#c0cf35",
-        ["modeline_info"] = "#abeadf",
-        ["bg_tab_bar"] = "#313131",
-        ["bg_tab_current"] = "#000000",
-        ["bg_tab_other"] = "#545454",
-        ["bg_added"] = "#003066",
-        ["bg_added_faint"] = "#001a4f",
-        ["bg_added_refine"] = "#0f4a77",
-        ["bg_added_fringe"] = "#006fff",
-        ["fg_added"] = "#c4d5ff",
-        ["fg_added_intense"] = "#8080ff",
-        ["bg_changed"] = "#2f123f",
-        ["bg_changed_faint"] = "#1f022f",
-        ["bg_changed_refine"] = "#3f325f",
-        ["bg_changed_fringe"] = "#7f55a0",
-        ["fg_changed"] = "#e3cfff",
-        ["fg_changed_intense"] = "#cf9fe2",
-        ["bg_removed"] = "#3d3d00",
-        ["bg_removed_faint"] = "#281f00",
-        ["bg_removed_refine"] = "#555500",
-        ["bg_removed_fringe"] = "#d0c03f",
-        ["fg_removed"] = "#d4d48f",
-        ["fg_removed_intense"] = "#d0b05f",
-        ["bg_diff_context"] = "#1a1a1a",
-        ["bg_paren_match"] = "#2f7f9f",
-        ["bg_paren_expression"] = "#453040",
-        ["cursor"] = "#efef00",
-        ["keybind"] = "#00bcff",
-        ["name"] = "#00bcff",
-        ["identifier"] = "#d2b580",
-        ["err"] = "#ffa00f",
-        ["warning"] = "#cabf00",
-        ["info"] = "#2fafff",
-        ["underline_err"] = "#efef00",
-        ["underline_warning"] = "#caa6df",
-        ["underline_note"] = "#00d3d0",
-        ["bg_prominent_err"] = "#7a6100",
-        ["fg_prominent_err"] = "#ffffff",
-        ["bg_prominent_warning"] = "#7030af",
-        ["fg_prominent_warning"] = "#ffffff",
-        ["bg_prominent_note"] = "#2266ae",
-        ["fg_prominent_note"] = "#ffffff",
-        ["bg_active_argument"] = "#381d0f",
-        ["fg_active_argument"] = "#ffa00f",
-        ["bg_active_value"] = "#12154a",
-        ["fg_active_value"] = "#79a8ff",
-        ["builtin"] = "#cabf00",
-        ["comment"] = "#d8af7a",
-        ["constant"] = "#82b0ec",
-        ["docstring"] = "#9ac8e0",
-        ["fnname"] = "#ffa00f",
-        ["fnname_call"] = "#c0965b",
-        ["keyword"] = "#00bcff",
-        ["preprocessor"] = "#b6a0ff",
-        ["property"] = "#00d3d0",
-        ["rx_backslash"] = "#00bcff",
-        ["rx_construct"] = "#d8af7a",
-        ["string"] = "#79a8ff",
-        ["type"] = "#6ae4b9",
-        ["variable"] = "#00d3d0",
-        ["variable_use"] = "#76afbf",
-        ["accent_0"] = "#79a8ff",
-        ["accent_1"] = "#cabf00",
-        ["accent_2"] = "#6ae4b9",
-        ["accent_3"] = "#d8af7a",
-        ["fg_completion_match_0"] = "#00bcff",
-        ["fg_completion_match_1"] = "#cabf00",
-        ["fg_completion_match_2"] = "#6ae4b9",
-        ["fg_completion_match_3"] = "#d8af7a",
-        ["date_common"] = "#00d3d0",
-        ["date_deadline"] = "#ffa00f",
-        ["date_deadline_subtle"] = "#ff9580",
-        ["date_event"] = "#c6daff",
-        ["date_holiday"] = "#ffa00f",
-        ["date_holiday_other"] = "#2fafff",
-        ["date_range"] = "#c6daff",
-        ["date_scheduled"] = "#d8af7a",
-        ["date_scheduled_subtle"] = "#d2b580",
-        ["date_weekday"] = "#00d3d0",
-        ["date_weekend"] = "#b6a0ff",
-        ["fg_link"] = "#79a8ff",
-        ["underline_link"] = "#79a8ff",
-        ["fg_link_symbolic"] = "#00d3d0",
-        ["underline_link_symbolic"] = "#00d3d0",
-        ["fg_link_visited"] = "#d2b580",
-        ["underline_link_visited"] = "#d2b580",
-        ["mail_cite_0"] = "#79a8ff",
-        ["mail_cite_1"] = "#d8af7a",
-        ["mail_cite_2"] = "#9ac8e0",
-        ["mail_cite_3"] = "#cabf00",
-        ["mail_part"] = "#2fafff",
-        ["mail_recipient"] = "#2fafff",
-        ["mail_subject"] = "#ffa00f",
-        ["mail_other"] = "#9ac8e0",
-        ["bg_mark_delete"] = "#4a4000",
-        ["fg_mark_delete"] = "#cabf00",
-        ["bg_mark_select"] = "#004065",
-        ["fg_mark_select"] = "#00d3d0",
-        ["bg_mark_other"] = "#552f5f",
-        ["fg_mark_other"] = "#f78fe7",
-        ["fg_prompt"] = "#2fafff",
-        ["fg_prose_code"] = "#6ae4b9",
-        ["fg_prose_macro"] = "#b6a0ff",
-        ["fg_prose_verbatim"] = "#cabf00",
-        ["prose_done"] = "#2fafff",
-        ["prose_todo"] = "#ffa00f",
-        ["prose_metadata"] = "#989898",
-        ["prose_metadata_value"] = "#c6daff",
-        ["prose_table"] = "#c6daff",
-        ["prose_table_formula"] = "#ffa00f",
-        ["prose_tag"] = "#c6daff",
-        ["rainbow_0"] = "#ffa00f",
-        ["rainbow_1"] = "#2fafff",
-        ["rainbow_2"] = "#d8af7a",
-        ["rainbow_3"] = "#79a8ff",
-        ["rainbow_4"] = "#cabf00",
-        ["rainbow_5"] = "#4ae2f0",
-        ["rainbow_6"] = "#d2b580",
-        ["rainbow_7"] = "#82b0ec",
-        ["rainbow_8"] = "#caa6df",
-        ["bg_search_current"] = "#7a6100",
-        ["bg_search_lazy"] = "#1640b0",
-        ["bg_search_static"] = "#004065",
-        ["bg_search_replace"] = "#7a6100",
-        ["bg_search_rx_group_0"] = "#2266ae",
-        ["bg_search_rx_group_1"] = "#7030af",
-        ["bg_search_rx_group_2"] = "#242679",
-        ["bg_search_rx_group_3"] = "#4a4000",
-        ["fg_heading_0"] = "#6ae4b9",
-        ["fg_heading_1"] = "#ffffff",
-        ["fg_heading_2"] = "#d2b580",
-        ["fg_heading_3"] = "#82b0ec",
-        ["fg_heading_4"] = "#88ca9f",
-        ["fg_heading_5"] = "#b6a0ff",
-        ["fg_heading_6"] = "#d8af7a",
-        ["fg_heading_7"] = "#00d3d0",
-        ["fg_heading_8"] = "#989898",
-        ["bg_alt"] = "#1e1e1e",
-        ["border_highlight"] = "#646464",
-        ["bg_tab_alternate"] = "#545454",
-      },
-    },
-    ["modus_vivendi_tritanopia"] = {
-      ["family"] = "modus",
-      ["flavor"] = "dark",
-      ["foreground"] = "#ffffff",
-      ["background"] = "#000000",
-      ["cursor"] = "#ffffff",
-      ["selection_background"] = "#7030af",
-      ["selection_foreground"] = "#ffffff",
-      ["ansi"] = {
-        "#000000",
-        "#ff5f59",
-        "#44bc44",
-        "#cabf00",
-        "#2fafff",
-        "#feacd0",
-        "#00d3d0",
-        "#ffffff",
-        "#535353",
-        "#ff5f5f",
-        "#44df44",
-        "#efef00",
-        "#338fff",
-        "#ef7fff",
-        "#00eff0",
-        "#989898",
-      },
-      ["extended"] = {
-        ["none"] = "NONE",
-        ["bg_main"] = "#000000",
-        ["bg_dim"] = "#1e1e1e",
-        ["fg_main"] = "#ffffff",
-        ["fg_dim"] = "#989898",
-        ["fg_alt"] = "#a0d7f2",
-        ["bg_active"] = "#535353",
-        ["bg_inactive"] = "#303030",
-        ["border"] = "#646464",
-        ["red"] = "#ff5f59",
-        ["red_warmer"] = "#ff6740",
-        ["red_cooler"] = "#ff7f86",
-        ["red_faint"] = "#ff9070",
-        ["red_intense"] = "#ff5f5f",
-        ["green"] = "#44bc44",
-        ["green_warmer"] = "#70b900",
-        ["green_cooler"] = "#00c06f",
-        ["green_faint"] = "#88ca9f",
-        ["green_intense"] = "#44df44",
-        ["yellow"] = "#cabf00",
-        ["yellow_warmer"] = "#ffa00f",
-        ["yellow_cooler"] = "#d8af7a",
-        ["yellow_faint"] = "#d2b580",
-        ["yellow_intense"] = "#efef00",
-        ["blue"] = "#2fafff",
-        ["blue_warmer"] = "#79a8ff",
-        ["blue_cooler"] = "#00bcff",
-        ["blue_faint"] = "#82b0ec",
-        ["blue_intense"] = "#338fff",
-        ["magenta"] = "#feacd0",
-        ["magenta_warmer"] = "#f78fe7",
-        ["magenta_cooler"] = "#b6a0ff",
-        ["magenta_faint"] = "#caa6df",
-        ["magenta_intense"] = "#ef7fff",
-        ["cyan"] = "#00d3d0",
-        ["cyan_warmer"] = "#4ae2ff",
-        ["cyan_cooler"] = "#6ae4b9",
-        ["cyan_faint"] = "#7fdbdf",
-        ["cyan_intense"] = "#00eff0",
-        ["rust"] = "#db7b5f",
-        ["gold"] = "#c0965b",
-        ["olive"] = "#9cbd6f",
-        ["slate"] = "#76afbf",
-        ["indigo"] = "#9099d9",
-        ["maroon"] = "#cf7fa7",
-        ["pink"] = "#d09dc0",
-        ["bg_red_intense"] = "#9d1f1f",
-        ["bg_green_intense"] = "#2f822f",
-        ["bg_yellow_intense"] = "#7a6100",
-        ["bg_blue_intense"] = "#1640b0",
-        ["bg_magenta_intense"] = "#7030af",
-        ["bg_cyan_intense"] = "#2266ae",
-        ["bg_red_subtle"] = "#620f2a",
-        ["bg_green_subtle"] = "#00422a",
-        ["bg_yellow_subtle"] = "#4a4000",
-        ["bg_blue_subtle"] = "#242679",
-        ["bg_magenta_subtle"] = "#552f5f",
-        ["bg_cyan_subtle"] = "#004065",
-        ["bg_red_nuanced"] = "#3a0c14",
-        ["bg_green_nuanced"] = "#092f1f",
-        ["bg_yellow_nuanced"] = "#381d0f",
-        ["bg_blue_nuanced"] = "#12154a",
-        ["bg_magenta_nuanced"] = "#2f0c3f",
-        ["bg_cyan_nuanced"] = "#042837",
-        ["bg_clay"] = "#49191a",
-        ["fg_clay"] = "#f1b090",
-        ["bg_ochre"] = "#462f20",
-        ["fg_ochre"] = "#e0d09c",
-        ["bg_lavender"] = "#38325c",
-        ["fg_lavender"] = "#dfc0f0",
-        ["bg_sage"] = "#143e32",
-        ["fg_sage"] = "#c3e7d4",
-        ["bg_graph_red_0"] = "#b52c2c",
-        ["bg_graph_red_1"] = "#702020",
-        ["bg_graph_green_0"] = "#afd1c0",
-        ["bg_graph_green_1"] = "#607a8f",
-        ["bg_graph_yellow_0"] = "#facfd6",
-        ["bg_graph_yellow_1"] = "#b57b85",
-        ["bg_graph_blue_0"] = "#4f9fdf",
-        ["bg_graph_blue_1"] = "#004559",
-        ["bg_graph_magenta_0"] = "#b6427f",
-        ["bg_graph_magenta_1"] = "#7f506f",
-        ["bg_graph_cyan_0"] = "#57dfea",
-        ["bg_graph_cyan_1"] = "#00808f",
-        ["bg_completion"] = "#004065",
-        ["bg_hover"] = "#7a6100",
-        ["bg_hover_secondary"] = "#7030af",
-        ["bg_hl_line"] = "#004065",
-        ["bg_region"] = "#2266ae",
-        ["fg_region"] = "#ffffff",
-        ["bg_mode_line_active"] = "#242679",
-        ["fg_mode_line_active"] = "#ffffff",
-        ["border_mode_line_active"] = "#338fff",
-        ["bg_mode_line_inactive"] = "#1e1e1e",
-        ["fg_mode_line_inactive"] = "#969696",
-        ["border_mode_line_inactive"] = "#535353",
-        ["modeline_err"] = "#ff7fbf",
-        ["modeline_warning"] = "#df9f93",
-        ["modeline_info"] = "#4fcfef",
-        ["bg_tab_bar"] = "#303030",
-        ["bg_tab_current"] = "#000000",
-        ["bg_tab_other"] = "#535353",
-        ["bg_added"] = "#004254",
-        ["bg_added_faint"] = "#003042",
-        ["bg_added_refine"] = "#004f7f",
-        ["bg_added_fringe"] = "#008fcf",
-        ["fg_added"] = "#9fdfdf",
-        ["fg_added_intense"] = "#50c0ef",
-        ["bg_changed"] = "#2f123f",
-        ["bg_changed_faint"] = "#1f022f",
-        ["bg_changed_refine"] = "#3f325f",
-        ["bg_changed_fringe"] = "#7f55a0",
-        ["fg_changed"] = "#e3cfff",
-        ["fg_changed_intense"] = "#cf9fe2",
-        ["bg_removed"] = "#4f1119",
-        ["bg_removed_faint"] = "#380a0f",
-        ["bg_removed_refine"] = "#781a1f",
-        ["bg_removed_fringe"] = "#b81a1f",
-        ["fg_removed"] = "#ffbfbf",
-        ["fg_removed_intense"] = "#ff9095",
-        ["bg_diff_context"] = "#1a1a1a",
-        ["bg_paren_match"] = "#004065",
-        ["bg_paren_expression"] = "#453040",
-        ["cursor"] = "#ff5f5f",
-        ["keybind"] = "#f78fe7",
-        ["name"] = "#79a8ff",
-        ["identifier"] = "#feacd0",
-        ["err"] = "#ff6740",
-        ["warning"] = "#feacd0",
-        ["info"] = "#00d3d0",
-        ["underline_err"] = "#ff9070",
-        ["underline_warning"] = "#d2b580",
-        ["underline_note"] = "#7fdbdf",
-        ["bg_prominent_err"] = "#9d1f1f",
-        ["fg_prominent_err"] = "#ffffff",
-        ["bg_prominent_warning"] = "#7030af",
-        ["fg_prominent_warning"] = "#ffffff",
-        ["bg_prominent_note"] = "#2266ae",
-        ["fg_prominent_note"] = "#ffffff",
-        ["bg_active_argument"] = "#3a0c14",
-        ["fg_active_argument"] = "#ff6740",
-        ["bg_active_value"] = "#042837",
-        ["fg_active_value"] = "#00d3d0",
-        ["builtin"] = "#feacd0",
-        ["comment"] = "#ff9070",
-        ["constant"] = "#79a8ff",
-        ["docstring"] = "#a0d7f2",
-        ["fnname"] = "#b6a0ff",
-        ["fnname_call"] = "#9099d9",
-        ["keyword"] = "#f78fe7",
-        ["preprocessor"] = "#ff7f86",
-        ["property"] = "#6ae4b9",
-        ["rx_backslash"] = "#ff6740",
-        ["rx_construct"] = "#00bcff",
-        ["string"] = "#70b900",
-        ["type"] = "#6ae4b9",
-        ["variable"] = "#00d3d0",
-        ["variable_use"] = "#76afbf",
-        ["accent_0"] = "#f78fe7",
-        ["accent_1"] = "#00d3d0",
-        ["accent_2"] = "#79a8ff",
-        ["accent_3"] = "#ff7f86",
-        ["fg_completion_match_0"] = "#00d3d0",
-        ["fg_completion_match_1"] = "#ff6740",
-        ["fg_completion_match_2"] = "#feacd0",
-        ["fg_completion_match_3"] = "#6ae4b9",
-        ["date_common"] = "#6ae4b9",
-        ["date_deadline"] = "#b6a0ff",
-        ["date_deadline_subtle"] = "#ff9070",
-        ["date_event"] = "#2fafff",
-        ["date_holiday"] = "#f78fe7",
-        ["date_holiday_other"] = "#4ae2ff",
-        ["date_range"] = "#2fafff",
-        ["date_scheduled"] = "#d8af7a",
-        ["date_scheduled_subtle"] = "#caa6df",
-        ["date_weekday"] = "#82b0ec",
-        ["date_weekend"] = "#ff9070",
-        ["fg_link"] = "#82b0ec",
-        ["underline_link"] = "#535353",
-        ["fg_link_symbolic"] = "#7fdbdf",
-        ["underline_link_symbolic"] = "#535353",
-        ["fg_link_visited"] = "#caa6df",
-        ["underline_link_visited"] = "#535353",
-        ["mail_cite_0"] = "#caa6df",
-        ["mail_cite_1"] = "#6ae4b9",
-        ["mail_cite_2"] = "#70b900",
-        ["mail_cite_3"] = "#ff9070",
-        ["mail_part"] = "#00d3d0",
-        ["mail_recipient"] = "#feacd0",
-        ["mail_subject"] = "#79a8ff",
-        ["mail_other"] = "#f78fe7",
-        ["bg_mark_delete"] = "#620f2a",
-        ["fg_mark_delete"] = "#ff5f59",
-        ["bg_mark_select"] = "#004065",
-        ["fg_mark_select"] = "#00d3d0",
-        ["bg_mark_other"] = "#552f5f",
-        ["fg_mark_other"] = "#f78fe7",
-        ["fg_prompt"] = "#f78fe7",
-        ["fg_prose_code"] = "#9cbd6f",
-        ["fg_prose_macro"] = "#ff7f86",
-        ["fg_prose_verbatim"] = "#00bcff",
-        ["prose_done"] = "#44df44",
-        ["prose_todo"] = "#ff5f5f",
-        ["prose_metadata"] = "#caa6df",
-        ["prose_metadata_value"] = "#00bcff",
-        ["prose_table"] = "#2fafff",
-        ["prose_table_formula"] = "#ff7f86",
-        ["prose_tag"] = "#989898",
-        ["rainbow_0"] = "#ffffff",
-        ["rainbow_1"] = "#feacd0",
-        ["rainbow_2"] = "#00d3d0",
-        ["rainbow_3"] = "#ff9070",
-        ["rainbow_4"] = "#d2b580",
-        ["rainbow_5"] = "#b6a0ff",
-        ["rainbow_6"] = "#44bc44",
-        ["rainbow_7"] = "#79a8ff",
-        ["rainbow_8"] = "#caa6df",
-        ["bg_search_current"] = "#9d1f1f",
-        ["bg_search_lazy"] = "#2266ae",
-        ["bg_search_static"] = "#552f5f",
-        ["bg_search_replace"] = "#7030af",
-        ["bg_search_rx_group_0"] = "#1640b0",
-        ["bg_search_rx_group_1"] = "#7030af",
-        ["bg_search_rx_group_2"] = "#004065",
-        ["bg_search_rx_group_3"] = "#620f2a",
-        ["fg_heading_0"] = "#00bcff",
-        ["fg_heading_1"] = "#b6a0ff",
-        ["fg_heading_2"] = "#f78fe7",
-        ["fg_heading_3"] = "#2fafff",
-        ["fg_heading_4"] = "#00d3d0",
-        ["fg_heading_5"] = "#70b900",
-        ["fg_heading_6"] = "#cabf00",
-        ["fg_heading_7"] = "#ff5f59",
-        ["fg_heading_8"] = "#feacd0",
-        ["docmarkup"] = "#caa6df",
-        ["bg_button_active"] = "#000000",
-        ["fg_button_active"] = "#ffffff",
-        ["bg_button_inactive"] = "#303030",
-        ["fg_line_number_active"] = "#ffffff",
-        ["fringe"] = "#303030",
-        ["date_now"] = "#82b0ec",
-        ["bg_prose_block_delimiter"] = "#1e1e1e",
-        ["fg_prose_block_delimiter"] = "#ff9070",
-        ["bg_heading_1"] = "#2f0c3f",
-        ["bg_heading_2"] = "#3a0c14",
-        ["bg_heading_3"] = "#12154a",
-        ["bg_heading_4"] = "#042837",
-        ["bg_heading_5"] = "#092f1f",
-        ["bg_heading_6"] = "#381d0f",
-        ["bg_heading_7"] = "#3a0c14",
-        ["bg_heading_8"] = "#2f0c3f",
-        ["overline_heading_1"] = "#b6a0ff",
-        ["overline_heading_2"] = "#f78fe7",
-        ["overline_heading_3"] = "#2fafff",
-        ["overline_heading_4"] = "#00d3d0",
-        ["overline_heading_5"] = "#44bc44",
-        ["overline_heading_6"] = "#d8af7a",
-        ["overline_heading_7"] = "#ff7f86",
-        ["overline_heading_8"] = "#feacd0",
-        ["kill_new"] = "#70b900",
-        ["bg_alt"] = "#1e1e1e",
-        ["border_highlight"] = "#646464",
-        ["bg_tab_alternate"] = "#535353",
-      },
-    },
-    ["phajas_dark"] = {
-      ["family"] = "phajas",
-      ["flavor"] = "dark",
-      ["foreground"] = "#d3d0c8",
-      ["background"] = "#2d2d2d",
-      ["cursor"] = "#d3d0c8",
-      ["selection_background"] = "#747369",
-      ["selection_foreground"] = "#f2f0ec",
-      ["ansi"] = {
-        "#2d2d2d",
-        "#f2777a",
-        "#99cc99",
-        "#ffcc66",
-        "#6699cc",
-        "#cc99cc",
-        "#66cccc",
-        "#d3d0c8",
-        "#747369",
-        "#f2777a",
-        "#99cc99",
-        "#ffcc66",
-        "#6699cc",
-        "#cc99cc",
-        "#66cccc",
-        "#f2f0ec",
-      },
-    },
-    ["phajas_light"] = {
-      ["family"] = "phajas",
-      ["flavor"] = "light",
-      ["foreground"] = "#2d2d2d",
-      ["background"] = "#f2f0ec",
-      ["cursor"] = "#2d2d2d",
-      ["selection_background"] = "#d3d0c8",
-      ["selection_foreground"] = "#2d2d2d",
-      ["ansi"] = {
-        "#f2f0ec",
-        "#f2777a",
-        "#99cc99",
-        "#ffcc66",
-        "#6699cc",
-        "#cc99cc",
-        "#66cccc",
-        "#2d2d2d",
-        "#d3d0c8",
-        "#f2777a",
-        "#99cc99",
-        "#ffcc66",
-        "#6699cc",
-        "#cc99cc",
-        "#66cccc",
-        "#747369",
-      },
-    },
-  },
-  ["families"] = {
-    ["catppuccin"] = {
-      ["name"] = "Catppuccin",
-      ["license"] = "MIT",
-      ["light_variant"] = "catppuccin_latte",
-      ["dark_variant"] = "catppuccin_frappe",
-    },
-    ["catppuccin_macchiato"] = {
-      ["name"] = "Catppuccin Macchiato",
-      ["license"] = "MIT",
-      ["light_variant"] = "catppuccin_latte_macchiato",
-      ["dark_variant"] = "catppuccin_macchiato",
-    },
-    ["catppuccin_mocha"] = {
-      ["name"] = "Catppuccin Mocha",
-      ["license"] = "MIT",
-      ["light_variant"] = "catppuccin_latte_mocha",
-      ["dark_variant"] = "catppuccin_mocha",
-    },
-    ["ef_daynight"] = {
-      ["name"] = "Ef Day/Night",
-      ["license"] = "GPL v3",
-      ["light_variant"] = "ef_day",
-      ["dark_variant"] = "ef_night",
-    },
-    ["ef_deuteranopia"] = {
-      ["name"] = "Ef Deuteranopia",
-      ["license"] = "GPL v3",
-      ["light_variant"] = "ef_deuteranopia_light",
-      ["dark_variant"] = "ef_deuteranopia_dark",
-    },
-    ["ef_duo"] = {
-      ["name"] = "Ef Duo",
-      ["license"] = "GPL v3",
-      ["light_variant"] = "ef_duo_light",
-      ["dark_variant"] = "ef_duo_dark",
-    },
-    ["ef_elea"] = {
-      ["name"] = "Ef Elea",
-      ["license"] = "GPL v3",
-      ["light_variant"] = "ef_elea_light",
-      ["dark_variant"] = "ef_elea_dark",
-    },
-    ["ef_lightdark"] = {
-      ["name"] = "Ef Light/Dark",
-      ["license"] = "GPL v3",
-      ["light_variant"] = "ef_light",
-      ["dark_variant"] = "ef_dark",
-    },
-    ["ef_maris"] = {
-      ["name"] = "Ef Maris",
-      ["license"] = "GPL v3",
-      ["light_variant"] = "ef_maris_light",
-      ["dark_variant"] = "ef_maris_dark",
-    },
-    ["ef_melissa"] = {
-      ["name"] = "Ef Melissa",
-      ["license"] = "GPL v3",
-      ["light_variant"] = "ef_melissa_light",
-      ["dark_variant"] = "ef_melissa_dark",
-    },
-    ["ef_trio"] = {
-      ["name"] = "Ef Trio",
-      ["license"] = "GPL v3",
-      ["light_variant"] = "ef_trio_light",
-      ["dark_variant"] = "ef_trio_dark",
-    },
-    ["ef_tritanopia"] = {
-      ["name"] = "Ef Tritanopia",
-      ["license"] = "GPL v3",
-      ["light_variant"] = "ef_tritanopia_light",
-      ["dark_variant"] = "ef_tritanopia_dark",
-    },
-    ["modus"] = {
-      ["name"] = "Modus Themes",
-      ["license"] = "GPL v3",
-      ["light_variant"] = "modus_operandi",
-      ["dark_variant"] = "modus_vivendi",
-    },
-    ["phajas"] = {
-      ["name"] = "Phajas",
-      ["license"] = "Custom",
-      ["light_variant"] = "phajas_light",
-      ["dark_variant"] = "phajas_dark",
-    },
-  },
-  ["hosts"] = {
-  },
-}
+-- Only the palette index and the selected variant module are loaded.
+local colors_dir = vim.fn.stdpath("config") .. "/lua/phajas/colors"
 
-local function merge_palette(target, extra)
-  if type(extra) ~= "table" then
-    return
-  end
-  if extra.families then
-    target.families = target.families or {}
-    for name, payload in pairs(extra.families) do
-      target.families[name] = payload
-    end
-  end
-  if extra.variants then
-    target.variants = target.variants or {}
-    for name, payload in pairs(extra.variants) do
-      target.variants[name] = payload
-    end
+local function load_module(path)
+  local ok, data = pcall(dofile, path)
+  if ok and type(data) == "table" then
+    return data
   end
 end
 
-local function merge_wallpaper_palette(palette)
-  if type(vim) ~= "table" or not vim.fn or not vim.fn.stdpath then
+local palette = load_module(colors_dir .. "/index.lua") or { families = {}, variants = {} }
+
+local function load_variant(name)
+  if not name or not (palette.variants and palette.variants[name]) then
     return
   end
-  local path = vim.fn.stdpath("config") .. "/lua/phajas/colors/palette_wallpaper.lua"
-  local ok, extra = pcall(dofile, path)
-  if ok then
-    merge_palette(palette, extra)
-  end
+  return load_module(colors_dir .. "/variants/" .. name .. ".lua")
 end
 
-merge_wallpaper_palette(palette)
-
-
 local function select_variant(flavor)
   -- Check if a specific variant was requested via global variable
   if vim.g.phajas_palette_variant then
     local requested = vim.g.phajas_palette_variant
-    if palette.variants and palette.variants[requested] then
-      return requested, palette.variants[requested]
+    local variant = load_variant(requested)
+    if variant then
+      return requested, variant
     end
   end
   
   -- Fall back to flavor-based selection
-  for name, variant in pairs(palette.variants or {}) do
-    if variant.flavor == flavor then
-      return name, variant
+  for name, info in pairs(palette.variants or {}) do
+    if info.flavor == flavor then
+      return name, load_variant(name)
     end
   end
-  if palette.default_variant and palette.variants and palette.variants[palette.default_variant] then
-    return palette.default_variant, palette.variants[palette.default_variant]
+  local default = load_variant(palette.default_variant)
+  if default then
+    return palette.default_variant, default
   end
   if palette.variants then
-    return next(palette.variants)
+    local name = next(palette.variants)
+    return name, load_variant(name)
   end
 end
 
@@ -6236,425 +65,9 @@ local function set_hl(group, opts)
   vim.api.nvim_set_hl(0, group, opts)
 end
 
-local function hex_to_rgb(hex)
-  if type(hex) ~= "string" then return end
-  hex = hex:gsub("#", "")
-  if #hex ~= 6 then return end
-  local r = tonumber(hex:sub(1, 2), 16)
-  local g = tonumber(hex:sub(3, 4), 16)
-  local b = tonumber(hex:sub(5, 6), 16)
-  if not r or not g or not b then return end
-  return r, g, b
-end
-
-local function blend(fg, bg, alpha)
-  local fr, fg2, fb = hex_to_rgb(fg)
-  local br, bg2, bb = hex_to_rgb(bg)
-  if not fr or not br then
-    return fg or bg
-  end
-  local function mix(a, b)
-    return math.floor((alpha * a) + ((1 - alpha) * b) + 0.5)
-  end
-  return string.format("#%02x%02x%02x", mix(fr, br), mix(fg2, bg2), mix(fb, bb))
-end
-
-local function colors_for(variant)
-  local a = variant.ansi or {}
-  local base = {
-    bg_main = variant.background,
-    fg_main = variant.foreground,
-    fg_dim = a[9] or a[8],
-    fg_alt = a[5] or variant.foreground,
-    border = a[8],
-    border_highlight = a[9] or a[8],
-    red = a[2], green = a[3], yellow = a[4], blue = a[5], magenta = a[6], cyan = a[7],
-    bg_dim = a[8],
-    bg_alt = variant.background,
-    bg_hl_line = a[8],
-    bg_paren_match = a[12] or a[5],
-    fg_inactive = a[9] or a[8],
-    fg_active = a[15] or a[7],
-    bg_active = a[8],
-    bg_inactive = a[8],
-    fg_tab_other = a[9] or a[8],
-    bg_tab_other = a[8],
-    fg_status_line_active = a[15] or a[7],
-    bg_status_line_active = a[1] or variant.background,
-    fg_status_line_inactive = a[9] or a[8],
-    bg_status_line_inactive = a[1] or variant.background,
-    visual = variant.selection_background,
-    fg_added = a[3], fg_changed = a[4], fg_removed = a[2],
-    bg_added = variant.background, bg_changed = variant.background, bg_removed = variant.background,
-    fg_added_intense = a[11] or a[3],
-    fg_changed_intense = a[12] or a[4],
-    fg_removed_intense = a[10] or a[2],
-    bg_added_refine = variant.background,
-    bg_changed_refine = variant.background,
-    bg_removed_refine = variant.background,
-    bg_completion = a[13] or a[5],
-    error = a[10] or a[2],
-    warning = a[12] or a[4],
-    info = a[13] or a[5],
-    hint = a[15] or a[7],
-    ok = a[11] or a[3],
-  }
-  local c = {}
-  if variant.extended then
-    c = vim.deepcopy(variant.extended)
-  end
-  for key, value in pairs(base) do
-    if c[key] == nil then
-      c[key] = value
-    end
-  end
-  c.blue = c.blue or base.blue
-  c.magenta = c.magenta or base.magenta
-  c.red = c.red or base.red
-  c.yellow = c.yellow or base.yellow
-  c.green = c.green or base.green
-  c.cyan = c.cyan or base.cyan
-  c.red_intense = c.red_intense or a[10] or c.red
-  c.green_intense = c.green_intense or a[11] or c.green
-  c.yellow_intense = c.yellow_intense or a[12] or c.yellow
-  c.blue_intense = c.blue_intense or a[13] or c.blue
-  c.magenta_intense = c.magenta_intense or a[14] or c.magenta
-  c.cyan_intense = c.cyan_intense or a[15] or c.cyan
-  c.blue_warmer = c.blue_warmer or c.blue
-  c.blue_cooler = c.blue_cooler or c.blue
-  c.blue_faint = c.blue_faint or c.blue
-  c.magenta_cooler = c.magenta_cooler or c.magenta
-  c.red_cooler = c.red_cooler or c.red
-  c.yellow_cooler = c.yellow_cooler or c.yellow
-  c.cyan_cooler = c.cyan_cooler or c.cyan
-  c.cyan_warmer = c.cyan_warmer or c.cyan
-  c.cyan_faint = c.cyan_faint or c.cyan
-  c.green_cooler = c.green_cooler or c.green
-  c.green_faint = c.green_faint or c.green
-  c.bg_magenta_intense = c.bg_magenta_intense or c.magenta
-  c.bg_green_intense = c.bg_green_intense or c.green
-  c.bg_yellow_intense = c.bg_yellow_intense or c.yellow
-  c.bg_red_intense = c.bg_red_intense or c.red
-  -- Derived fields to complete the extended palette
-  c.bg_sidebar = c.bg_sidebar or c.bg_dim
-  c.fg_sidebar = c.fg_sidebar or c.fg_main
-  c.cursor = c.cursor or c.fg_main
-  c.comment = c.comment or c.fg_dim
-  c.error = c.error or c.red_cooler or c.red or base.error
-  c.warning = c.warning or c.yellow_cooler or c.yellow or base.warning
-  c.info = c.info or c.blue_cooler or c.blue or base.info
-  c.hint = c.hint or c.cyan_faint or c.cyan or base.hint
-  c.ok = c.ok or c.green_cooler or c.green or base.ok
-  c.success = c.success or c.fg_added
-  c.visual = c.visual or c.bg_magenta_intense or c.magenta
-  c.accent_light = c.accent_light or c.blue_faint or c.blue
-  c.accent = c.accent or c.blue_warmer or c.blue
-  c.accent_darker = c.accent_darker or c.blue or c.accent
-  c.accent_dark = c.accent_dark or c.blue_intense or c.blue
-  -- Default (non-tinted/non-accessibility variants) only for now
-  return c
-end
-
-local function apply_highlights(variant)
-  local c = colors_for(variant)
-  local diag_base_error = c.red_intense or c.error or c.red or c.fg_main
-  local diag_base_warn = c.yellow_intense or c.warning or c.yellow or c.fg_main
-  local diag_base_info = c.blue_intense or c.info or c.blue or c.fg_main
-  local diag_base_hint = c.cyan_intense or c.hint or c.cyan or c.fg_main
-  local diag_base_ok = c.green_intense or c.ok or c.green or c.fg_main
-  local diag_error = blend(diag_base_error, c.fg_main, 0.7)
-  local diag_warn = blend(diag_base_warn, c.fg_main, 0.7)
-  local diag_info = blend(diag_base_info, c.fg_main, 0.7)
-  local diag_hint = blend(diag_base_hint, c.fg_main, 0.7)
-  local diag_ok = blend(diag_base_ok, c.fg_main, 0.7)
-  local diag_bg_error = blend(diag_base_error, c.bg_main, 0.28)
-  local diag_bg_warn = blend(diag_base_warn, c.bg_main, 0.28)
-  local diag_bg_info = blend(diag_base_info, c.bg_main, 0.28)
-  local diag_bg_hint = blend(diag_base_hint, c.bg_main, 0.28)
-  local diag_bg_ok = blend(diag_base_ok, c.bg_main, 0.28)
-  local diag_line_error = blend(diag_base_error, c.bg_main, 0.14)
-  local diag_line_warn = blend(diag_base_warn, c.bg_main, 0.14)
-  local diag_line_info = blend(diag_base_info, c.bg_main, 0.14)
-  local diag_line_hint = blend(diag_base_hint, c.bg_main, 0.14)
-  local diag_line_ok = blend(diag_base_ok, c.bg_main, 0.14)
-  local hls = {
-    -- UI
-    Normal = { fg = c.fg_main, bg = c.bg_main },
-    NormalFloat = { fg = c.fg_active or c.fg_main, bg = c.bg_active or c.bg_main },
-    FloatBorder = { fg = c.border_highlight or c.border, bg = c.bg_main },
-    FloatTitle = { fg = c.border_highlight or c.border, bg = c.bg_main },
-    Folded = { fg = c.green_faint or c.green or c.fg_dim, bg = c.bg_dim or c.bg_main },
-    LineNr = { fg = c.fg_main, bg = c.bg_dim or c.bg_main },
-    LineNrAbove = { fg = c.fg_dim, bg = c.bg_dim or c.bg_main },
-    LineNrBelow = { fg = c.fg_dim, bg = c.bg_dim or c.bg_main },
-    CursorLineNr = { fg = c.fg_active or c.fg_main, bg = c.bg_active or c.bg_dim, bold = true },
-    SignColumn = { fg = c.fg_dim, bg = c.bg_dim or c.bg_main },
-    CursorLine = { bg = c.bg_hl_line or c.bg_dim },
-    CursorColumn = { bg = c.bg_hl_line or c.bg_dim },
-    NonText = { fg = c.fg_dim },
-    ColorColumn = { bg = c.bg_dim or c.bg_main },
-    FoldColumn = { fg = c.fg_inactive or c.fg_dim, bg = c.bg_inactive or c.bg_dim or c.bg_main },
-    Search = { fg = c.fg_main, bg = c.bg_green_intense or c.bg_completion or c.green },
-    IncSearch = { fg = c.fg_main, bg = c.bg_yellow_intense or c.yellow },
-    CurSearch = { link = "IncSearch" },
-    Substitute = { fg = c.fg_main, bg = c.bg_red_intense or c.red },
-    QuickFixLine = { fg = c.fg_main, bg = c.visual or c.bg_hl_line },
-    Pmenu = { fg = c.fg_active or c.fg_main, bg = c.bg_active or c.bg_main },
-    PmenuSel = { fg = c.bg_active or c.bg_main, bg = c.fg_active or c.fg_main },
-    PmenuSbar = { fg = c.fg_active or c.fg_main, bg = c.bg_dim or c.bg_main },
-    PmenuThumb = { fg = c.bg_main, bg = c.cursor or c.fg_main },
-    Directory = { fg = c.blue },
-    Title = { fg = c.fg_alt or c.blue, bold = true },
-    Visual = { fg = c.fg_main, bg = c.visual or c.bg_hl_line },
-    VisualNOS = { link = "Visual" },
-    WildMenu = { fg = c.fg_main, bg = c.visual or c.bg_hl_line },
-    Whitespace = { fg = c.fg_dim },
-    StatusLine = { fg = c.fg_status_line_active or c.fg_main, bg = c.bg_status_line_active or c.bg_main },
-    StatusLineNC = { fg = c.fg_status_line_inactive or c.fg_dim, bg = c.bg_status_line_inactive or c.bg_main },
-    TabLine = { fg = c.fg_tab_other or c.fg_dim, bg = c.bg_tab_other or c.bg_dim },
-    TabLineSel = { fg = c.fg_main, bg = c.bg_tab_current or c.bg_main, bold = true },
-    TabLineFill = { fg = c.fg_dim, bg = c.bg_tab_bar or c.bg_dim },
-    WinBar = { link = "TabLineSel" },
-    WinBarNC = { link = "TabLine" },
-    EndOfBuffer = { fg = c.fg_inactive or c.fg_dim },
-    MatchParen = { fg = c.fg_main, bg = c.bg_paren_match or c.bg_completion },
-    ModeMsg = { fg = c.fg_dim, bold = true },
-    MsgArea = { fg = c.fg_main },
-    MoreMsg = { fg = c.blue },
-    VertSplit = { fg = c.border },
-    WinSeparator = { fg = c.border, bold = true },
-    DiffAdd = { fg = c.fg_added, bg = c.bg_added },
-    DiffDelete = { fg = c.fg_removed, bg = c.bg_removed },
-    DiffChange = { fg = c.fg_changed, bg = c.bg_changed },
-    DiffText = { fg = c.fg_changed, bg = c.bg_changed },
-    SpecialKey = { fg = c.fg_dim },
-    SpellBad = { sp = c.error, undercurl = true },
-    SpellCap = { sp = c.warning, undercurl = true },
-    SpellLocal = { sp = c.info, undercurl = true },
-    SpellRare = { sp = c.hint, undercurl = true },
-    WarningMsg = { fg = c.warning },
-    Question = { fg = c.blue },
-
-    -- Syntax
-    Comment = { fg = c.comment or c.fg_dim, italic = true },
-    String = { fg = c.blue_warmer or c.green },
-    Character = { fg = c.blue_warmer or c.green },
-    Boolean = { fg = c.blue or c.magenta, bold = true },
-    Statement = { fg = c.magenta_cooler or c.magenta },
-    Conditional = { fg = c.magenta_cooler or c.magenta },
-    Repeat = { fg = c.magenta_cooler or c.magenta },
-    Label = { fg = c.cyan },
-    Keyword = { fg = c.magenta_cooler or c.magenta },
-    Exception = { fg = c.magenta_cooler or c.magenta },
-    StorageClass = { fg = c.magenta_cooler or c.magenta },
-    Structure = { fg = c.magenta_cooler or c.magenta },
-    Constant = { fg = c.fg_main },
-    Function = { fg = c.magenta },
-    Identifier = { fg = c.cyan },
-    PreProc = { fg = c.red_cooler or c.red },
-    Include = { fg = c.red_cooler or c.red },
-    Define = { fg = c.red_cooler or c.red },
-    Macro = { fg = c.red_cooler or c.red },
-    PreCondit = { fg = c.red_cooler or c.red },
-    Todo = { fg = c.magenta, bold = true },
-    Type = { fg = c.cyan_cooler or c.cyan },
-    TypeDef = { fg = c.cyan_warmer or c.cyan },
-    Number = { fg = c.blue_faint or c.magenta },
-    Float = { link = "Number" },
-    Operator = { fg = c.fg_main },
-    Tag = { fg = c.magenta },
-    Delimiter = { fg = c.fg_main },
-    Special = { link = "Type" },
-    SpecialChar = { fg = c.cyan_faint or c.cyan },
-    Underlined = { fg = c.fg_alt or c.blue, underline = true },
-    Error = { fg = c.fg_main, bg = c.bg_red_intense or c.red },
-
-    -- Diagnostics
-    DiagnosticError = { fg = diag_error, bold = true },
-    DiagnosticWarn = { fg = diag_warn, bold = true },
-    DiagnosticInfo = { fg = diag_info, bold = true },
-    DiagnosticHint = { fg = diag_hint, bold = true },
-    DiagnosticOk = { fg = diag_ok, bold = true },
-    DiagnosticUnnecessary = { fg = c.fg_dim },
-    DiagnosticVirtualTextError = { fg = diag_error, bg = diag_bg_error, bold = true },
-    DiagnosticVirtualTextWarn = { fg = diag_warn, bg = diag_bg_warn, bold = true },
-    DiagnosticVirtualTextInfo = { fg = diag_info, bg = diag_bg_info, bold = true },
-    DiagnosticVirtualTextHint = { fg = diag_hint, bg = diag_bg_hint, bold = true },
-    DiagnosticVirtualTextOk = { fg = diag_ok, bg = diag_bg_ok, bold = true },
-    DiagnosticUnderlineError = { undercurl = true, sp = diag_error },
-    DiagnosticUnderlineWarn = { undercurl = true, sp = diag_warn },
-    DiagnosticUnderlineInfo = { undercurl = true, sp = diag_info },
-    DiagnosticUnderlineHint = { undercurl = true, sp = diag_hint },
-    DiagnosticUnderlineOk = { undercurl = true, sp = diag_ok },
-    DiagnosticSignError = { fg = diag_error, bg = c.bg_dim or c.bg_main },
-    DiagnosticSignWarn = { fg = diag_warn, bg = c.bg_dim or c.bg_main },
-    DiagnosticSignInfo = { fg = diag_info, bg = c.bg_dim or c.bg_main },
-    DiagnosticSignHint = { fg = diag_hint, bg = c.bg_dim or c.bg_main },
-    DiagnosticSignOk = { fg = diag_ok, bg = c.bg_dim or c.bg_main },
-    DiagnosticFloatingError = { fg = diag_error, bg = diag_bg_error },
-    DiagnosticFloatingWarn = { fg = diag_warn, bg = diag_bg_warn },
-    DiagnosticFloatingInfo = { fg = diag_info, bg = diag_bg_info },
-    DiagnosticFloatingHint = { fg = diag_hint, bg = diag_bg_hint },
-    DiagnosticFloatingOk = { fg = diag_ok, bg = diag_bg_ok },
-    DiagnosticLineError = { bg = diag_line_error },
-    DiagnosticLineWarn = { bg = diag_line_warn },
-    DiagnosticLineInfo = { bg = diag_line_info },
-    DiagnosticLineHint = { bg = diag_line_hint },
-    DiagnosticLineOk = { bg = diag_line_ok },
-
-    -- Diff/Git
-    GitSignsAdd = { fg = c.fg_added_intense or c.fg_added, bg = c.bg_added or c.bg_main },
-    GitSignsChange = { fg = c.fg_changed_intense or c.fg_changed, bg = c.bg_changed or c.bg_main },
-    GitSignsDelete = { fg = c.fg_removed_intense or c.fg_removed, bg = c.bg_removed or c.bg_main },
-
-    -- LSP
-    LspReferenceText = { bg = c.bg_blue_intense or c.bg_hl_line, fg = c.fg_main },
-    LspReferenceRead = { bg = c.bg_blue_intense or c.bg_hl_line, fg = c.fg_main },
-    LspReferenceWrite = { bg = c.bg_blue_intense or c.bg_hl_line, fg = c.fg_main },
-
-    -- Telescope (basic alignment with palette intent)
-    TelescopeNormal = { link = 'Normal' },
-    TelescopeBorder = { fg = c.border or c.fg_dim, bg = c.bg_main },
-    TelescopeTitle = { fg = c.fg_dim, bg = c.bg_main },
-    TelescopeSelection = { fg = c.selection_foreground or c.fg_main, bg = c.selection_background or c.visual or c.bg_hl_line, bold = true },
-    TelescopeSelectionCaret = { fg = c.selection_foreground or c.fg_main, bg = c.selection_background or c.visual or c.bg_hl_line, bold = true },
-    TelescopeMultiSelection = { fg = c.accent or c.blue, bg = c.bg_dim or c.bg_main },
-    TelescopeMultiIcon = { fg = c.accent or c.blue, bg = c.bg_dim or c.bg_main },
-    TelescopePromptBorder = { fg = c.border_highlight or c.border, bg = c.bg_main },
-    TelescopePromptTitle = { fg = c.border_highlight or c.border, bg = c.bg_main },
-    TelescopeResultsComment = { fg = c.fg_dim },
-    TelescopePromptNormal = { link = 'Normal' },
-    TelescopePromptPrefix = { fg = c.accent_darker or c.blue, bg = c.bg_main },
-    TelescopeMatching = { fg = c.accent_dark or c.blue_intense, bold = true },
-
-    -- Treesitter (core captures)
-    ['@comment'] = { link = 'Comment' },
-    ['@error'] = { link = 'Error' },
-    ['@punctuation'] = { fg = c.fg_dim },
-    ['@punctuation.delimiter'] = { link = 'Delimiter' },
-    ['@punctuation.bracket'] = { fg = c.fg_main },
-    ['@punctuation.special'] = { fg = c.fg_main },
-    ['@string'] = { link = 'String' },
-    ['@character'] = { link = 'Character' },
-    ['@number'] = { link = 'Number' },
-    ['@boolean'] = { link = 'Boolean' },
-    ['@float'] = { link = 'Float' },
-    ['@constant'] = { link = 'Constant' },
-    ['@constant.builtin'] = { fg = c.magenta },
-    ['@constant.macro'] = { fg = c.red_cooler or c.red },
-    ['@namespace'] = { fg = c.fg_alt or c.blue },
-    ['@symbol'] = { fg = c.magenta },
-    ['@variable'] = { fg = c.fg_main },
-    ['@variable.builtin'] = { fg = c.magenta_cooler or c.magenta },
-    ['@variable.parameter'] = { fg = c.fg_main },
-    ['@variable.member'] = { fg = c.cyan },
-    ['@property'] = { link = '@field' },
-    ['@field'] = { fg = c.fg_main },
-    ['@function'] = { link = 'Function' },
-    ['@function.builtin'] = { fg = c.blue_warmer or c.blue },
-    ['@function.macro'] = { fg = c.red_cooler or c.red },
-    ['@method'] = { link = 'Function' },
-    ['@constructor'] = { fg = c.blue },
-    ['@parameter'] = { fg = c.fg_main },
-    ['@keyword'] = { link = 'Keyword' },
-    ['@keyword.function'] = { link = 'Keyword' },
-    ['@keyword.operator'] = { link = 'Operator' },
-    ['@keyword.return'] = { link = 'Keyword' },
-    ['@conditional'] = { link = 'Conditional' },
-    ['@repeat'] = { link = 'Repeat' },
-    ['@debug'] = { fg = c.red_cooler or c.red },
-    ['@label'] = { link = 'Label' },
-    ['@include'] = { link = 'Include' },
-    ['@exception'] = { link = 'Exception' },
-    ['@type'] = { link = 'Type' },
-    ['@type.builtin'] = { fg = c.cyan_cooler or c.cyan },
-    ['@type.definition'] = { link = 'Typedef' },
-    ['@storageclass'] = { link = 'StorageClass' },
-    ['@attribute'] = { fg = c.blue_warmer or c.blue },
-    ['@field.yaml'] = { fg = c.cyan },
-    ['@string.regex'] = { fg = c.blue_warmer or c.blue },
-    ['@string.escape'] = { fg = c.magenta },
-    ['@string.special'] = { fg = c.blue },
-    ['@text.title'] = { fg = c.blue, bold = true },
-    ['@text.emphasis'] = { italic = true },
-    ['@text.strong'] = { bold = true },
-    ['@text.uri'] = { fg = c.blue, underline = true },
-    ['@text.reference'] = { fg = c.magenta },
-    ['@text.literal'] = { fg = c.green },
-    ['@text.note'] = { fg = c.blue, bold = true },
-    ['@text.warning'] = { fg = c.warning or c.yellow },
-    ['@text.danger'] = { fg = c.error or c.red },
-
-    -- Treesitter context
-    TreesitterContext = { bg = c.bg_dim or c.bg_main },
-    TreesitterContextLineNumber = { fg = c.fg_dim, bg = c.bg_dim or c.bg_main },
-
-    -- NvimTree
-    NvimTreeNormal = { fg = c.fg_main, bg = c.bg_alt or c.bg_main },
-    NvimTreeNormalNC = { fg = c.fg_main, bg = c.bg_alt or c.bg_main },
-    NvimTreeFolderName = { fg = c.blue },
-    NvimTreeFolderIcon = { fg = c.blue },
-    NvimTreeRootFolder = { fg = c.magenta, bold = true },
-    NvimTreeSymlink = { fg = c.cyan },
-    NvimTreeExecFile = { fg = c.green },
-    NvimTreeSpecialFile = { fg = c.magenta_warmer or c.magenta, bold = true },
-    NvimTreeIndentMarker = { fg = c.fg_dim },
-    NvimTreeGitNew = { fg = c.fg_added_intense or c.fg_added },
-    NvimTreeGitDirty = { fg = c.fg_changed_intense or c.fg_changed },
-    NvimTreeGitDeleted = { fg = c.fg_removed_intense or c.fg_removed },
-    NvimTreeWinSeparator = { fg = c.border, bg = c.bg_alt or c.bg_main },
-
-    -- DAP / DAP UI
-    DapBreakpoint = { fg = c.red },
-    DapBreakpointCondition = { fg = c.yellow },
-    DapBreakpointRejected = { fg = c.red_intense or c.red },
-    DapStopped = { fg = c.green },
-    DapLogPoint = { fg = c.cyan },
-    DapUIScope = { fg = c.cyan },
-    DapUIType = { fg = c.magenta },
-    DapUIValue = { fg = c.fg_main },
-    DapUIThread = { fg = c.green },
-    DapUIStoppedThread = { fg = c.red },
-    DapUISource = { fg = c.blue },
-    DapUILineNumber = { fg = c.accent or c.blue },
-    DapUIFloatBorder = { fg = c.border_highlight or c.border, bg = c.bg_main },
-    DapUIWatchesValue = { fg = c.green },
-    DapUIWatchesError = { fg = c.red },
-    NvimDapVirtualText = { fg = c.fg_dim, italic = true },
-
-    -- Completion (cmp-style groups used by blink.cmp too)
-    CmpItemAbbr = { fg = c.fg_main },
-    CmpItemAbbrDeprecated = { fg = c.fg_dim, strikethrough = true },
-    CmpItemAbbrMatch = { fg = c.accent or c.blue, bold = true },
-    CmpItemAbbrMatchFuzzy = { fg = c.accent_dark or c.blue_intense, bold = true },
-    CmpItemMenu = { fg = c.fg_dim },
-    CmpItemKindText = { fg = c.fg_main },
-    CmpItemKindMethod = { fg = c.blue },
-    CmpItemKindFunction = { fg = c.blue },
-    CmpItemKindConstructor = { fg = c.magenta },
-    CmpItemKindField = { fg = c.cyan },
-    CmpItemKindVariable = { fg = c.fg_main },
-    CmpItemKindClass = { fg = c.cyan },
-    CmpItemKindInterface = { fg = c.cyan },
-    CmpItemKindModule = { fg = c.fg_alt or c.blue },
-    CmpItemKindProperty = { fg = c.cyan },
-    CmpItemKindUnit = { fg = c.yellow },
-    CmpItemKindValue = { fg = c.fg_main },
-    CmpItemKindEnum = { fg = c.yellow },
-    CmpItemKindKeyword = { fg = c.magenta },
-    CmpItemKindSnippet = { fg = c.green },
-    CmpItemKindColor = { fg = c.magenta },
-    CmpItemKindFile = { fg = c.fg_main },
-    CmpItemKindReference = { fg = c.magenta },
-    CmpItemKindFolder = { fg = c.blue },
-    CmpItemKindEnumMember = { fg = c.yellow },
-    CmpItemKindConstant = { fg = c.fg_main },
-    CmpItemKindStruct = { fg = c.cyan },
-    CmpItemKindEvent = { fg = c.magenta },
-    CmpItemKindOperator = { fg = c.fg_main },
-    CmpItemKindTypeParameter = { fg = c.cyan },
-  }
-
+local function apply_highlights(name)
+  -- Highlight groups are resolved at build time; see nvim_highlight_tables in build.py
+  local hls = load_module(colors_dir .. "/highlights/" .. name .. ".lua") or {}
   for group, opts in pairs(hls) do
     set_hl(group, opts)
   end
@@ -6667,7 +80,7 @@ local function apply()
     return
   end
   apply_terminal(variant)
-  apply_highlights(variant)
+  apply_highlights(name)
   vim.g.colors_name = "phajas_palette"
   return name, variant
 end
@@ -6677,5 +90,6 @@ apply()
 return {
   palette = palette,
   apply = apply,
+  load_variant = load_variant,
   select_variant = select_variant,
 }
@@ -0,0 +1,876 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: catppuccin_frappe (Catppuccin family)
+-- License: MIT (see colors/LICENSE-catppuccin)
+-- Catppuccin © 2021-present Catppuccin Org
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#c6d0f5",
+    ["bg"] = "#303446",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#c6d0f5",
+    ["bg"] = "#414559",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#838ba7",
+    ["bg"] = "#303446",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#838ba7",
+    ["bg"] = "#303446",
+  },
+  ["Folded"] = {
+    ["fg"] = "#81c8be",
+    ["bg"] = "#292c3c",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#c6d0f5",
+    ["bg"] = "#292c3c",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#b5bfe2",
+    ["bg"] = "#292c3c",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#b5bfe2",
+    ["bg"] = "#292c3c",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#c6d0f5",
+    ["bg"] = "#414559",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#b5bfe2",
+    ["bg"] = "#292c3c",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#292c3c",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#292c3c",
+  },
+  ["NonText"] = {
+    ["fg"] = "#b5bfe2",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#292c3c",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#b5bfe2",
+    ["bg"] = "#51576d",
+  },
+  ["Search"] = {
+    ["fg"] = "#c6d0f5",
+    ["bg"] = "#a6d189",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#c6d0f5",
+    ["bg"] = "#e5c890",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#c6d0f5",
+    ["bg"] = "#f2d5cf",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#c6d0f5",
+    ["bg"] = "#ca9ee6",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#c6d0f5",
+    ["bg"] = "#414559",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#414559",
+    ["bg"] = "#c6d0f5",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#c6d0f5",
+    ["bg"] = "#292c3c",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#303446",
+    ["bg"] = "#c6d0f5",
+  },
+  ["Directory"] = {
+    ["fg"] = "#8caaee",
+  },
+  ["Title"] = {
+    ["fg"] = "#a5adce",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#c6d0f5",
+    ["bg"] = "#ca9ee6",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#c6d0f5",
+    ["bg"] = "#ca9ee6",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#b5bfe2",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#c6d0f5",
+    ["bg"] = "#232634",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#b5bfe2",
+    ["bg"] = "#292c3c",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#b5bfe2",
+    ["bg"] = "#292c3c",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#c6d0f5",
+    ["bg"] = "#303446",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#b5bfe2",
+    ["bg"] = "#232634",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#b5bfe2",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#c6d0f5",
+    ["bg"] = "#99d1db",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#b5bfe2",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#c6d0f5",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#8caaee",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#737994",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#737994",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#a6d189",
+    ["bg"] = "#414559",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#e78284",
+    ["bg"] = "#414559",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#e5c890",
+    ["bg"] = "#414559",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#e5c890",
+    ["bg"] = "#414559",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#b5bfe2",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#e67172",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#e5c890",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#8caaee",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#5abfb5",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#e5c890",
+  },
+  ["Question"] = {
+    ["fg"] = "#8caaee",
+  },
+  ["Comment"] = {
+    ["fg"] = "#838ba7",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#babbf1",
+  },
+  ["Character"] = {
+    ["fg"] = "#babbf1",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#8caaee",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#ca9ee6",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#ca9ee6",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#ca9ee6",
+  },
+  ["Label"] = {
+    ["fg"] = "#81c8be",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#ca9ee6",
+  },
+  ["Exception"] = {
+    ["fg"] = "#ca9ee6",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#ca9ee6",
+  },
+  ["Structure"] = {
+    ["fg"] = "#ca9ee6",
+  },
+  ["Constant"] = {
+    ["fg"] = "#c6d0f5",
+  },
+  ["Function"] = {
+    ["fg"] = "#ca9ee6",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#81c8be",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#ea999c",
+  },
+  ["Include"] = {
+    ["fg"] = "#ea999c",
+  },
+  ["Define"] = {
+    ["fg"] = "#ea999c",
+  },
+  ["Macro"] = {
+    ["fg"] = "#ea999c",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#ea999c",
+  },
+  ["Todo"] = {
+    ["fg"] = "#ca9ee6",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#85c1dc",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#99d1db",
+  },
+  ["Number"] = {
+    ["fg"] = "#99d1db",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#c6d0f5",
+  },
+  ["Tag"] = {
+    ["fg"] = "#ca9ee6",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#c6d0f5",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#99d1db",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#a5adce",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#c6d0f5",
+    ["bg"] = "#f2d5cf",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#dd99a6",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#dccaae",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#9db5f0",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#96cacf",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#b0d1a9",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#b5bfe2",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#dd99a6",
+    ["bg"] = "#634a57",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#dccaae",
+    ["bg"] = "#635d5b",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#9db5f0",
+    ["bg"] = "#4a5575",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#96cacf",
+    ["bg"] = "#475d68",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#b0d1a9",
+    ["bg"] = "#516059",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#dd99a6",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#dccaae",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#9db5f0",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#96cacf",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#b0d1a9",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#dd99a6",
+    ["bg"] = "#292c3c",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#dccaae",
+    ["bg"] = "#292c3c",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#9db5f0",
+    ["bg"] = "#292c3c",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#96cacf",
+    ["bg"] = "#292c3c",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#b0d1a9",
+    ["bg"] = "#292c3c",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#dd99a6",
+    ["bg"] = "#634a57",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#dccaae",
+    ["bg"] = "#635d5b",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#9db5f0",
+    ["bg"] = "#4a5575",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#96cacf",
+    ["bg"] = "#475d68",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#b0d1a9",
+    ["bg"] = "#516059",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#4a3f4f",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#494950",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#3d455e",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#3b4957",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#414a4f",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#a6d189",
+    ["bg"] = "#414559",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#e5c890",
+    ["bg"] = "#414559",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#e78284",
+    ["bg"] = "#414559",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#8caaee",
+    ["fg"] = "#c6d0f5",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#8caaee",
+    ["fg"] = "#c6d0f5",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#8caaee",
+    ["fg"] = "#c6d0f5",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#737994",
+    ["bg"] = "#303446",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#b5bfe2",
+    ["bg"] = "#303446",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#c6d0f5",
+    ["bg"] = "#ca9ee6",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#c6d0f5",
+    ["bg"] = "#ca9ee6",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#babbf1",
+    ["bg"] = "#292c3c",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#babbf1",
+    ["bg"] = "#292c3c",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#838ba7",
+    ["bg"] = "#303446",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#838ba7",
+    ["bg"] = "#303446",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#b5bfe2",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#8caaee",
+    ["bg"] = "#303446",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#8caaee",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#b5bfe2",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#c6d0f5",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#c6d0f5",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#ca9ee6",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#ea999c",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#a5adce",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#ca9ee6",
+  },
+  ["@variable"] = {
+    ["fg"] = "#c6d0f5",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#ca9ee6",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#c6d0f5",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#81c8be",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#c6d0f5",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#babbf1",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#ea999c",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#8caaee",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#c6d0f5",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#ea999c",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#85c1dc",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#babbf1",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#81c8be",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#babbf1",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#ca9ee6",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#8caaee",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#8caaee",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#8caaee",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#ca9ee6",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#a6d189",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#8caaee",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#e5c890",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#e67172",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#292c3c",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#b5bfe2",
+    ["bg"] = "#292c3c",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#c6d0f5",
+    ["bg"] = "#232634",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#c6d0f5",
+    ["bg"] = "#232634",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#8caaee",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#8caaee",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#ca9ee6",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#81c8be",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#a6d189",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#f4b8e4",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#b5bfe2",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#a6d189",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#e5c890",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#e78284",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#737994",
+    ["bg"] = "#232634",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#e78284",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#e5c890",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#e78284",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#a6d189",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#81c8be",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#81c8be",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#ca9ee6",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#c6d0f5",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#a6d189",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#e78284",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#8caaee",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#babbf1",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#838ba7",
+    ["bg"] = "#303446",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#a6d189",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#e78284",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#b5bfe2",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#c6d0f5",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#b5bfe2",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#babbf1",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#8caaee",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#b5bfe2",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#c6d0f5",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#8caaee",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#8caaee",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#ca9ee6",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#81c8be",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#c6d0f5",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#81c8be",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#81c8be",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#a5adce",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#81c8be",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#e5c890",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#c6d0f5",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#e5c890",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#ca9ee6",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#a6d189",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#ca9ee6",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#c6d0f5",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#ca9ee6",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#8caaee",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#e5c890",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#c6d0f5",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#81c8be",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#ca9ee6",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#c6d0f5",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#81c8be",
+  },
+}
@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: catppuccin_latte_mocha (Catppuccin Mocha family)
+-- License: GPL v3 (see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#4c4f69",
+    ["bg"] = "#eff1f5",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#4c4f69",
+    ["bg"] = "#ccd0da",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#8c8fa1",
+    ["bg"] = "#eff1f5",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#8c8fa1",
+    ["bg"] = "#eff1f5",
+  },
+  ["Folded"] = {
+    ["fg"] = "#179299",
+    ["bg"] = "#e6e9ef",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#4c4f69",
+    ["bg"] = "#e6e9ef",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#5c5f77",
+    ["bg"] = "#e6e9ef",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#5c5f77",
+    ["bg"] = "#e6e9ef",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#4c4f69",
+    ["bg"] = "#ccd0da",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#5c5f77",
+    ["bg"] = "#e6e9ef",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#e6e9ef",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#e6e9ef",
+  },
+  ["NonText"] = {
+    ["fg"] = "#5c5f77",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#e6e9ef",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#5c5f77",
+    ["bg"] = "#bcc0cc",
+  },
+  ["Search"] = {
+    ["fg"] = "#4c4f69",
+    ["bg"] = "#40a02b",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#4c4f69",
+    ["bg"] = "#df8e1d",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#4c4f69",
+    ["bg"] = "#dc8a78",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#4c4f69",
+    ["bg"] = "#8839ef",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#4c4f69",
+    ["bg"] = "#ccd0da",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#ccd0da",
+    ["bg"] = "#4c4f69",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#4c4f69",
+    ["bg"] = "#e6e9ef",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#eff1f5",
+    ["bg"] = "#4c4f69",
+  },
+  ["Directory"] = {
+    ["fg"] = "#1e66f5",
+  },
+  ["Title"] = {
+    ["fg"] = "#6c6f85",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#4c4f69",
+    ["bg"] = "#8839ef",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#4c4f69",
+    ["bg"] = "#8839ef",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#5c5f77",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#4c4f69",
+    ["bg"] = "#dce0e8",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#5c5f77",
+    ["bg"] = "#e6e9ef",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#5c5f77",
+    ["bg"] = "#e6e9ef",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#4c4f69",
+    ["bg"] = "#eff1f5",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#5c5f77",
+    ["bg"] = "#dce0e8",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#5c5f77",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#4c4f69",
+    ["bg"] = "#04a5e5",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#5c5f77",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#4c4f69",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#1e66f5",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#9ca0b0",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#9ca0b0",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#40a02b",
+    ["bg"] = "#ccd0da",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#d20f39",
+    ["bg"] = "#ccd0da",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#df8e1d",
+    ["bg"] = "#ccd0da",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#df8e1d",
+    ["bg"] = "#ccd0da",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#5c5f77",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#de293e",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#df8e1d",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#1e66f5",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#2d9fa8",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#df8e1d",
+  },
+  ["Question"] = {
+    ["fg"] = "#1e66f5",
+  },
+  ["Comment"] = {
+    ["fg"] = "#8c8fa1",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#7287fd",
+  },
+  ["Character"] = {
+    ["fg"] = "#7287fd",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#1e66f5",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#8839ef",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#8839ef",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#8839ef",
+  },
+  ["Label"] = {
+    ["fg"] = "#179299",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#8839ef",
+  },
+  ["Exception"] = {
+    ["fg"] = "#8839ef",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#8839ef",
+  },
+  ["Structure"] = {
+    ["fg"] = "#8839ef",
+  },
+  ["Constant"] = {
+    ["fg"] = "#4c4f69",
+  },
+  ["Function"] = {
+    ["fg"] = "#8839ef",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#179299",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#e64553",
+  },
+  ["Include"] = {
+    ["fg"] = "#e64553",
+  },
+  ["Define"] = {
+    ["fg"] = "#e64553",
+  },
+  ["Macro"] = {
+    ["fg"] = "#e64553",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#e64553",
+  },
+  ["Todo"] = {
+    ["fg"] = "#8839ef",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#209fb5",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#04a5e5",
+  },
+  ["Number"] = {
+    ["fg"] = "#04a5e5",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#4c4f69",
+  },
+  ["Tag"] = {
+    ["fg"] = "#8839ef",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#4c4f69",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#04a5e5",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#6c6f85",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#4c4f69",
+    ["bg"] = "#dc8a78",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#aa2247",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#b37b34",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#2c5fcb",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#277e8b",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#44883e",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#5c5f77",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#aa2247",
+    ["bg"] = "#e7b2c0",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#b37b34",
+    ["bg"] = "#ebd5b9",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#2c5fcb",
+    ["bg"] = "#b4caf5",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#277e8b",
+    ["bg"] = "#b3d6db",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#44883e",
+    ["bg"] = "#bedabc",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#aa2247",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#b37b34",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#2c5fcb",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#277e8b",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#44883e",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#aa2247",
+    ["bg"] = "#e6e9ef",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#b37b34",
+    ["bg"] = "#e6e9ef",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#2c5fcb",
+    ["bg"] = "#e6e9ef",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#277e8b",
+    ["bg"] = "#e6e9ef",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#44883e",
+    ["bg"] = "#e6e9ef",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#aa2247",
+    ["bg"] = "#e7b2c0",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#b37b34",
+    ["bg"] = "#ebd5b9",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#2c5fcb",
+    ["bg"] = "#b4caf5",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#277e8b",
+    ["bg"] = "#b3d6db",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#44883e",
+    ["bg"] = "#bedabc",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#ebd1db",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#ede3d7",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#d2def5",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#d1e4e8",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#d7e6d9",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#40a02b",
+    ["bg"] = "#ccd0da",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#df8e1d",
+    ["bg"] = "#ccd0da",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#d20f39",
+    ["bg"] = "#ccd0da",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#1e66f5",
+    ["fg"] = "#4c4f69",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#1e66f5",
+    ["fg"] = "#4c4f69",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#1e66f5",
+    ["fg"] = "#4c4f69",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#9ca0b0",
+    ["bg"] = "#eff1f5",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#5c5f77",
+    ["bg"] = "#eff1f5",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#4c4f69",
+    ["bg"] = "#8839ef",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#4c4f69",
+    ["bg"] = "#8839ef",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#7287fd",
+    ["bg"] = "#e6e9ef",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#7287fd",
+    ["bg"] = "#e6e9ef",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#8c8fa1",
+    ["bg"] = "#eff1f5",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#8c8fa1",
+    ["bg"] = "#eff1f5",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#5c5f77",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#1e66f5",
+    ["bg"] = "#eff1f5",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#1e66f5",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#5c5f77",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#4c4f69",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#4c4f69",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#8839ef",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#e64553",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#6c6f85",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#8839ef",
+  },
+  ["@variable"] = {
+    ["fg"] = "#4c4f69",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#8839ef",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#4c4f69",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#179299",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#4c4f69",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#7287fd",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#e64553",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#1e66f5",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#4c4f69",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#e64553",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#209fb5",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#7287fd",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#179299",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#7287fd",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#8839ef",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#1e66f5",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#1e66f5",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#1e66f5",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#8839ef",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#40a02b",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#1e66f5",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#df8e1d",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#de293e",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#e6e9ef",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#5c5f77",
+    ["bg"] = "#e6e9ef",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#4c4f69",
+    ["bg"] = "#dce0e8",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#4c4f69",
+    ["bg"] = "#dce0e8",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#1e66f5",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#1e66f5",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#8839ef",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#179299",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#40a02b",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#ea76cb",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#5c5f77",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#40a02b",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#df8e1d",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#d20f39",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#9ca0b0",
+    ["bg"] = "#dce0e8",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#d20f39",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#df8e1d",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#d20f39",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#40a02b",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#179299",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#179299",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#8839ef",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#4c4f69",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#40a02b",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#d20f39",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#1e66f5",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#7287fd",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#8c8fa1",
+    ["bg"] = "#eff1f5",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#40a02b",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#d20f39",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#5c5f77",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#4c4f69",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#5c5f77",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#7287fd",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#1e66f5",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#5c5f77",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#4c4f69",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#1e66f5",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#1e66f5",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#8839ef",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#179299",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#4c4f69",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#179299",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#179299",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#6c6f85",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#179299",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#df8e1d",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#4c4f69",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#df8e1d",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#8839ef",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#40a02b",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#8839ef",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#4c4f69",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#8839ef",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#1e66f5",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#df8e1d",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#4c4f69",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#179299",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#8839ef",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#4c4f69",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#179299",
+  },
+}
@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: catppuccin_macchiato (Catppuccin Macchiato family)
+-- License: GPL v3 (see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#cad3f5",
+    ["bg"] = "#24273a",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#cad3f5",
+    ["bg"] = "#363a4f",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#8087a2",
+    ["bg"] = "#24273a",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#8087a2",
+    ["bg"] = "#24273a",
+  },
+  ["Folded"] = {
+    ["fg"] = "#8bd5ca",
+    ["bg"] = "#1e2030",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#cad3f5",
+    ["bg"] = "#1e2030",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#b8c0e0",
+    ["bg"] = "#1e2030",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#b8c0e0",
+    ["bg"] = "#1e2030",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#cad3f5",
+    ["bg"] = "#363a4f",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#b8c0e0",
+    ["bg"] = "#1e2030",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#1e2030",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#1e2030",
+  },
+  ["NonText"] = {
+    ["fg"] = "#b8c0e0",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#1e2030",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#b8c0e0",
+    ["bg"] = "#494d64",
+  },
+  ["Search"] = {
+    ["fg"] = "#cad3f5",
+    ["bg"] = "#a6da95",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#cad3f5",
+    ["bg"] = "#eed49f",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#cad3f5",
+    ["bg"] = "#f4dbd6",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#cad3f5",
+    ["bg"] = "#c6a0f6",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#cad3f5",
+    ["bg"] = "#363a4f",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#363a4f",
+    ["bg"] = "#cad3f5",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#cad3f5",
+    ["bg"] = "#1e2030",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#24273a",
+    ["bg"] = "#cad3f5",
+  },
+  ["Directory"] = {
+    ["fg"] = "#8aadf4",
+  },
+  ["Title"] = {
+    ["fg"] = "#a5adcb",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#cad3f5",
+    ["bg"] = "#c6a0f6",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#cad3f5",
+    ["bg"] = "#c6a0f6",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#b8c0e0",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#cad3f5",
+    ["bg"] = "#181926",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#b8c0e0",
+    ["bg"] = "#1e2030",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#b8c0e0",
+    ["bg"] = "#1e2030",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#cad3f5",
+    ["bg"] = "#24273a",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#b8c0e0",
+    ["bg"] = "#181926",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#b8c0e0",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#cad3f5",
+    ["bg"] = "#91d7e3",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#b8c0e0",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#cad3f5",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#8aadf4",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#6e738d",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#6e738d",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#a6da95",
+    ["bg"] = "#363a4f",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#ed8796",
+    ["bg"] = "#363a4f",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#eed49f",
+    ["bg"] = "#363a4f",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#eed49f",
+    ["bg"] = "#363a4f",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#b8c0e0",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#ec7486",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#eed49f",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#8aadf4",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#63cbc0",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#eed49f",
+  },
+  ["Question"] = {
+    ["fg"] = "#8aadf4",
+  },
+  ["Comment"] = {
+    ["fg"] = "#8087a2",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#b7bdf8",
+  },
+  ["Character"] = {
+    ["fg"] = "#b7bdf8",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#8aadf4",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#c6a0f6",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#c6a0f6",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#c6a0f6",
+  },
+  ["Label"] = {
+    ["fg"] = "#8bd5ca",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#c6a0f6",
+  },
+  ["Exception"] = {
+    ["fg"] = "#c6a0f6",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#c6a0f6",
+  },
+  ["Structure"] = {
+    ["fg"] = "#c6a0f6",
+  },
+  ["Constant"] = {
+    ["fg"] = "#cad3f5",
+  },
+  ["Function"] = {
+    ["fg"] = "#c6a0f6",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#8bd5ca",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#ee99a0",
+  },
+  ["Include"] = {
+    ["fg"] = "#ee99a0",
+  },
+  ["Define"] = {
+    ["fg"] = "#ee99a0",
+  },
+  ["Macro"] = {
+    ["fg"] = "#ee99a0",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#ee99a0",
+  },
+  ["Todo"] = {
+    ["fg"] = "#c6a0f6",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#7dc4e4",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#91d7e3",
+  },
+  ["Number"] = {
+    ["fg"] = "#91d7e3",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#cad3f5",
+  },
+  ["Tag"] = {
+    ["fg"] = "#c6a0f6",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#cad3f5",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#91d7e3",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#a5adcb",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#cad3f5",
+    ["bg"] = "#f4dbd6",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#e39eb3",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#e3d4b9",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#9db8f4",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#9ed4d7",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#b1d8b2",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#b8c0e0",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#e39eb3",
+    ["bg"] = "#5c4254",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#e3d4b9",
+    ["bg"] = "#5d5756",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#9db8f4",
+    ["bg"] = "#414d6e",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#9ed4d7",
+    ["bg"] = "#415862",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#b1d8b2",
+    ["bg"] = "#485953",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#e39eb3",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#e3d4b9",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#9db8f4",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#9ed4d7",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#b1d8b2",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#e39eb3",
+    ["bg"] = "#1e2030",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#e3d4b9",
+    ["bg"] = "#1e2030",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#9db8f4",
+    ["bg"] = "#1e2030",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#9ed4d7",
+    ["bg"] = "#1e2030",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#b1d8b2",
+    ["bg"] = "#1e2030",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#e39eb3",
+    ["bg"] = "#5c4254",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#e3d4b9",
+    ["bg"] = "#5d5756",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#9db8f4",
+    ["bg"] = "#414d6e",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#9ed4d7",
+    ["bg"] = "#415862",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#b1d8b2",
+    ["bg"] = "#485953",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#403447",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#403f48",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#323a54",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#323f4e",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#364047",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#a6da95",
+    ["bg"] = "#363a4f",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#eed49f",
+    ["bg"] = "#363a4f",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#ed8796",
+    ["bg"] = "#363a4f",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#8aadf4",
+    ["fg"] = "#cad3f5",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#8aadf4",
+    ["fg"] = "#cad3f5",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#8aadf4",
+    ["fg"] = "#cad3f5",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#6e738d",
+    ["bg"] = "#24273a",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#b8c0e0",
+    ["bg"] = "#24273a",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#cad3f5",
+    ["bg"] = "#c6a0f6",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#cad3f5",
+    ["bg"] = "#c6a0f6",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#b7bdf8",
+    ["bg"] = "#1e2030",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#b7bdf8",
+    ["bg"] = "#1e2030",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#8087a2",
+    ["bg"] = "#24273a",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#8087a2",
+    ["bg"] = "#24273a",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#b8c0e0",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#8aadf4",
+    ["bg"] = "#24273a",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#8aadf4",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#b8c0e0",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#cad3f5",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#cad3f5",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#c6a0f6",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#ee99a0",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#a5adcb",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#c6a0f6",
+  },
+  ["@variable"] = {
+    ["fg"] = "#cad3f5",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#c6a0f6",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#cad3f5",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#8bd5ca",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#cad3f5",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#b7bdf8",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#ee99a0",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#8aadf4",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#cad3f5",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#ee99a0",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#7dc4e4",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#b7bdf8",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#8bd5ca",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#b7bdf8",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#c6a0f6",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#8aadf4",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#8aadf4",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#8aadf4",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#c6a0f6",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#a6da95",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#8aadf4",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#eed49f",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#ec7486",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#1e2030",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#b8c0e0",
+    ["bg"] = "#1e2030",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#cad3f5",
+    ["bg"] = "#181926",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#cad3f5",
+    ["bg"] = "#181926",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#8aadf4",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#8aadf4",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#c6a0f6",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#8bd5ca",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#a6da95",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#f5bde6",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#b8c0e0",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#a6da95",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#eed49f",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#ed8796",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#6e738d",
+    ["bg"] = "#181926",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#ed8796",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#eed49f",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#ed8796",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#a6da95",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#8bd5ca",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#8bd5ca",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#c6a0f6",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#cad3f5",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#a6da95",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#ed8796",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#8aadf4",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#b7bdf8",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#8087a2",
+    ["bg"] = "#24273a",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#a6da95",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#ed8796",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#b8c0e0",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#cad3f5",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#b8c0e0",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#b7bdf8",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#8aadf4",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#b8c0e0",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#cad3f5",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#8aadf4",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#8aadf4",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#c6a0f6",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#8bd5ca",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#cad3f5",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#8bd5ca",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#8bd5ca",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#a5adcb",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#8bd5ca",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#eed49f",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#cad3f5",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#eed49f",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#c6a0f6",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#a6da95",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#c6a0f6",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#cad3f5",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#c6a0f6",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#8aadf4",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#eed49f",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#cad3f5",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#8bd5ca",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#c6a0f6",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#cad3f5",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#8bd5ca",
+  },
+}
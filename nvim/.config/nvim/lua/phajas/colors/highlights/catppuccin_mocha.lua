@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: catppuccin_mocha (Catppuccin Mocha family)
+-- License: GPL v3 (see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#cdd6f4",
+    ["bg"] = "#1e1e2e",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#cdd6f4",
+    ["bg"] = "#313244",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#7f849c",
+    ["bg"] = "#1e1e2e",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#7f849c",
+    ["bg"] = "#1e1e2e",
+  },
+  ["Folded"] = {
+    ["fg"] = "#94e2d5",
+    ["bg"] = "#181825",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#cdd6f4",
+    ["bg"] = "#181825",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#bac2de",
+    ["bg"] = "#181825",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#bac2de",
+    ["bg"] = "#181825",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#cdd6f4",
+    ["bg"] = "#313244",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#bac2de",
+    ["bg"] = "#181825",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#181825",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#181825",
+  },
+  ["NonText"] = {
+    ["fg"] = "#bac2de",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#181825",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#bac2de",
+    ["bg"] = "#45475a",
+  },
+  ["Search"] = {
+    ["fg"] = "#cdd6f4",
+    ["bg"] = "#a6e3a1",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#cdd6f4",
+    ["bg"] = "#f9e2af",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#cdd6f4",
+    ["bg"] = "#f5e0dc",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#cdd6f4",
+    ["bg"] = "#cba6f7",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#cdd6f4",
+    ["bg"] = "#313244",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#313244",
+    ["bg"] = "#cdd6f4",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#cdd6f4",
+    ["bg"] = "#181825",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#1e1e2e",
+    ["bg"] = "#cdd6f4",
+  },
+  ["Directory"] = {
+    ["fg"] = "#89b4fa",
+  },
+  ["Title"] = {
+    ["fg"] = "#a6adc8",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#cdd6f4",
+    ["bg"] = "#cba6f7",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#cdd6f4",
+    ["bg"] = "#cba6f7",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#bac2de",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#cdd6f4",
+    ["bg"] = "#11111b",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#bac2de",
+    ["bg"] = "#181825",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#bac2de",
+    ["bg"] = "#181825",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#cdd6f4",
+    ["bg"] = "#1e1e2e",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#bac2de",
+    ["bg"] = "#11111b",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#bac2de",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#cdd6f4",
+    ["bg"] = "#89dceb",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#bac2de",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#cdd6f4",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#89b4fa",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#6c7086",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#6c7086",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#a6e3a1",
+    ["bg"] = "#313244",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#f38ba8",
+    ["bg"] = "#313244",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#f9e2af",
+    ["bg"] = "#313244",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#f9e2af",
+    ["bg"] = "#313244",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#bac2de",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#f37799",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#f9e2af",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#89b4fa",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#6bd7ca",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#f9e2af",
+  },
+  ["Question"] = {
+    ["fg"] = "#89b4fa",
+  },
+  ["Comment"] = {
+    ["fg"] = "#7f849c",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#b4befe",
+  },
+  ["Character"] = {
+    ["fg"] = "#b4befe",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#89b4fa",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#cba6f7",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#cba6f7",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#cba6f7",
+  },
+  ["Label"] = {
+    ["fg"] = "#94e2d5",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#cba6f7",
+  },
+  ["Exception"] = {
+    ["fg"] = "#cba6f7",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#cba6f7",
+  },
+  ["Structure"] = {
+    ["fg"] = "#cba6f7",
+  },
+  ["Constant"] = {
+    ["fg"] = "#cdd6f4",
+  },
+  ["Function"] = {
+    ["fg"] = "#cba6f7",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#94e2d5",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#eba0ac",
+  },
+  ["Include"] = {
+    ["fg"] = "#eba0ac",
+  },
+  ["Define"] = {
+    ["fg"] = "#eba0ac",
+  },
+  ["Macro"] = {
+    ["fg"] = "#eba0ac",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#eba0ac",
+  },
+  ["Todo"] = {
+    ["fg"] = "#cba6f7",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#74c7ec",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#89dceb",
+  },
+  ["Number"] = {
+    ["fg"] = "#89dceb",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#cdd6f4",
+  },
+  ["Tag"] = {
+    ["fg"] = "#cba6f7",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#cdd6f4",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#89dceb",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#a6adc8",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#cdd6f4",
+    ["bg"] = "#f5e0dc",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#e8a2bf",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#ecdec4",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#9dbef8",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#a5dede",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#b2dfba",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#bac2de",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#e8a2bf",
+    ["bg"] = "#5a3d50",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#ecdec4",
+    ["bg"] = "#5b5552",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#9dbef8",
+    ["bg"] = "#3c4867",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#a5dede",
+    ["bg"] = "#3f555d",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#b2dfba",
+    ["bg"] = "#44554e",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#e8a2bf",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#ecdec4",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#9dbef8",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#a5dede",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#b2dfba",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#e8a2bf",
+    ["bg"] = "#181825",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#ecdec4",
+    ["bg"] = "#181825",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#9dbef8",
+    ["bg"] = "#181825",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#a5dede",
+    ["bg"] = "#181825",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#b2dfba",
+    ["bg"] = "#181825",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#e8a2bf",
+    ["bg"] = "#5a3d50",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#ecdec4",
+    ["bg"] = "#5b5552",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#9dbef8",
+    ["bg"] = "#3c4867",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#a5dede",
+    ["bg"] = "#3f555d",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#b2dfba",
+    ["bg"] = "#44554e",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#3c2d3f",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#3d3940",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#2d334b",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#2f3945",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#313a3e",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#a6e3a1",
+    ["bg"] = "#313244",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#f9e2af",
+    ["bg"] = "#313244",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#f38ba8",
+    ["bg"] = "#313244",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#89b4fa",
+    ["fg"] = "#cdd6f4",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#89b4fa",
+    ["fg"] = "#cdd6f4",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#89b4fa",
+    ["fg"] = "#cdd6f4",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#6c7086",
+    ["bg"] = "#1e1e2e",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#bac2de",
+    ["bg"] = "#1e1e2e",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#cdd6f4",
+    ["bg"] = "#cba6f7",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#cdd6f4",
+    ["bg"] = "#cba6f7",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#b4befe",
+    ["bg"] = "#181825",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#b4befe",
+    ["bg"] = "#181825",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#7f849c",
+    ["bg"] = "#1e1e2e",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#7f849c",
+    ["bg"] = "#1e1e2e",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#bac2de",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#89b4fa",
+    ["bg"] = "#1e1e2e",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#89b4fa",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#bac2de",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#cdd6f4",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#cdd6f4",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#cba6f7",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#eba0ac",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#a6adc8",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#cba6f7",
+  },
+  ["@variable"] = {
+    ["fg"] = "#cdd6f4",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#cba6f7",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#cdd6f4",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#94e2d5",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#cdd6f4",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#b4befe",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#eba0ac",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#89b4fa",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#cdd6f4",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#eba0ac",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#74c7ec",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#b4befe",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#94e2d5",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#b4befe",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#cba6f7",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#89b4fa",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#89b4fa",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#89b4fa",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#cba6f7",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#a6e3a1",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#89b4fa",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#f9e2af",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#f37799",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#181825",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#bac2de",
+    ["bg"] = "#181825",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#cdd6f4",
+    ["bg"] = "#11111b",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#cdd6f4",
+    ["bg"] = "#11111b",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#89b4fa",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#89b4fa",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#cba6f7",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#94e2d5",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#a6e3a1",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#f5c2e7",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#bac2de",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#a6e3a1",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#f9e2af",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#f38ba8",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#6c7086",
+    ["bg"] = "#11111b",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#f38ba8",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#f9e2af",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#f38ba8",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#a6e3a1",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#94e2d5",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#94e2d5",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#cba6f7",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#cdd6f4",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#a6e3a1",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#f38ba8",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#89b4fa",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#b4befe",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#7f849c",
+    ["bg"] = "#1e1e2e",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#a6e3a1",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#f38ba8",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#bac2de",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#cdd6f4",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#bac2de",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#b4befe",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#89b4fa",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#bac2de",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#cdd6f4",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#89b4fa",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#89b4fa",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#cba6f7",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#94e2d5",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#cdd6f4",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#94e2d5",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#94e2d5",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#a6adc8",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#94e2d5",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#f9e2af",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#cdd6f4",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#f9e2af",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#cba6f7",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#a6e3a1",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#cba6f7",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#cdd6f4",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#cba6f7",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#89b4fa",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#f9e2af",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#cdd6f4",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#94e2d5",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#cba6f7",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#cdd6f4",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#94e2d5",
+  },
+}
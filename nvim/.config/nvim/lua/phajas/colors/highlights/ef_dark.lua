@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_dark (Ef Light/Dark family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#000000",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#4b4b4b",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#89afef",
+    ["bg"] = "#000000",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#89afef",
+    ["bg"] = "#000000",
+  },
+  ["Folded"] = {
+    ["fg"] = "#61a06c",
+    ["bg"] = "#1a1a1a",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#1a1a1a",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#857f8f",
+    ["bg"] = "#1a1a1a",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#857f8f",
+    ["bg"] = "#1a1a1a",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#4b4b4b",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#857f8f",
+    ["bg"] = "#1a1a1a",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#002435",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#002435",
+  },
+  ["NonText"] = {
+    ["fg"] = "#857f8f",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#1a1a1a",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#857f8f",
+    ["bg"] = "#121212",
+  },
+  ["Search"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#337133",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#8f5040",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#b02930",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#2a234a",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#4b4b4b",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#4b4b4b",
+    ["bg"] = "#d0d0d0",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#1a1a1a",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#d0d0d0",
+  },
+  ["Directory"] = {
+    ["fg"] = "#3f95f6",
+  },
+  ["Title"] = {
+    ["fg"] = "#89afef",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#2a234a",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#2a234a",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#857f8f",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#e0e0ff",
+    ["bg"] = "#2a2a75",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#857f8f",
+    ["bg"] = "#1a1a1a",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#857f8f",
+    ["bg"] = "#4b4b4b",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#000000",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#857f8f",
+    ["bg"] = "#2b2b2b",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#857f8f",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#20577a",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#857f8f",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#3f95f6",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#4f4f5f",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#4f4f5f",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#a0e0a0",
+    ["bg"] = "#00381f",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#ffbfbf",
+    ["bg"] = "#4f1119",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#efef80",
+    ["bg"] = "#363300",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#efef80",
+    ["bg"] = "#363300",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#857f8f",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#f47360",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#bf9032",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#0faa26",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#8aa0df",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#bf9032",
+  },
+  ["Question"] = {
+    ["fg"] = "#3f95f6",
+  },
+  ["Comment"] = {
+    ["fg"] = "#cf9f8f",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#6a9fff",
+  },
+  ["Character"] = {
+    ["fg"] = "#6a9fff",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#3f95f6",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#af85ff",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#af85ff",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#af85ff",
+  },
+  ["Label"] = {
+    ["fg"] = "#4fbaef",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#af85ff",
+  },
+  ["Exception"] = {
+    ["fg"] = "#af85ff",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#af85ff",
+  },
+  ["Structure"] = {
+    ["fg"] = "#af85ff",
+  },
+  ["Constant"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["Function"] = {
+    ["fg"] = "#d369af",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#4fbaef",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#ff5a7a",
+  },
+  ["Include"] = {
+    ["fg"] = "#ff5a7a",
+  },
+  ["Define"] = {
+    ["fg"] = "#ff5a7a",
+  },
+  ["Macro"] = {
+    ["fg"] = "#ff5a7a",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#ff5a7a",
+  },
+  ["Todo"] = {
+    ["fg"] = "#d369af",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#1dbfcf",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#6fafff",
+  },
+  ["Number"] = {
+    ["fg"] = "#7a94df",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["Tag"] = {
+    ["fg"] = "#d369af",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#8aa0df",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#89afef",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#b02930",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#e68582",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#c4a361",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#6ba7eb",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#76c1e6",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#49b559",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#857f8f",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#e68582",
+    ["bg"] = "#431c1b",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#c4a361",
+    ["bg"] = "#35280e",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#6ba7eb",
+    ["bg"] = "#122a45",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#76c1e6",
+    ["bg"] = "#163443",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#49b559",
+    ["bg"] = "#04300b",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#e68582",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#c4a361",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#6ba7eb",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#76c1e6",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#49b559",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#e68582",
+    ["bg"] = "#1a1a1a",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#c4a361",
+    ["bg"] = "#1a1a1a",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#6ba7eb",
+    ["bg"] = "#1a1a1a",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#76c1e6",
+    ["bg"] = "#1a1a1a",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#49b559",
+    ["bg"] = "#1a1a1a",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#e68582",
+    ["bg"] = "#431c1b",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#c4a361",
+    ["bg"] = "#35280e",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#6ba7eb",
+    ["bg"] = "#122a45",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#76c1e6",
+    ["bg"] = "#163443",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#49b559",
+    ["bg"] = "#04300b",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#210e0d",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#1b1407",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#091522",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#0b1a21",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#021805",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#a0e0a0",
+    ["bg"] = "#00381f",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#efef80",
+    ["bg"] = "#363300",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#ffbfbf",
+    ["bg"] = "#4f1119",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#4648d0",
+    ["fg"] = "#d0d0d0",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#4648d0",
+    ["fg"] = "#d0d0d0",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#4648d0",
+    ["fg"] = "#d0d0d0",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#4f4f5f",
+    ["bg"] = "#000000",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#857f8f",
+    ["bg"] = "#000000",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#2a234a",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#2a234a",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#6a9fff",
+    ["bg"] = "#1a1a1a",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#6a9fff",
+    ["bg"] = "#1a1a1a",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#89afef",
+    ["bg"] = "#000000",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#89afef",
+    ["bg"] = "#000000",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#857f8f",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#3f95f6",
+    ["bg"] = "#000000",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#3f95f6",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#857f8f",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#d369af",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#ff5a7a",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#89afef",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#d369af",
+  },
+  ["@variable"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#af85ff",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#4fbaef",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#6a9fff",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#ff5a7a",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#3f95f6",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#ff5a7a",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#1dbfcf",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#6a9fff",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#4fbaef",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#6a9fff",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#d369af",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#3f95f6",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#3f95f6",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#3f95f6",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#d369af",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#0faa26",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#3f95f6",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#bf9032",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#f47360",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#1a1a1a",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#857f8f",
+    ["bg"] = "#1a1a1a",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#2b2b2b",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#2b2b2b",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#3f95f6",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#3f95f6",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#d369af",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#4fbaef",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#0faa26",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#e580ea",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#857f8f",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#a0e0a0",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#efef80",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#ffbfbf",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#4f4f5f",
+    ["bg"] = "#2b2b2b",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#ef6560",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#bf9032",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#ef6560",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#0faa26",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#4fbaef",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#4fbaef",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#d369af",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#0faa26",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#ef6560",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#3f95f6",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#6a9fff",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#89afef",
+    ["bg"] = "#000000",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#0faa26",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#ef6560",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#857f8f",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#857f8f",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#6a9fff",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#3f95f6",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#857f8f",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#3f95f6",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#3f95f6",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#d369af",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#4fbaef",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#4fbaef",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#4fbaef",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#89afef",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#4fbaef",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#bf9032",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#bf9032",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#d369af",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#0faa26",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#d369af",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#d369af",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#3f95f6",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#bf9032",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#4fbaef",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#d369af",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#4fbaef",
+  },
+}
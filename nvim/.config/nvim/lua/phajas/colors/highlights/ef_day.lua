@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_day (Ef Day/Night family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#584141",
+    ["bg"] = "#fff5ea",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#584141",
+    ["bg"] = "#c9c0b8",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#8f5f4a",
+    ["bg"] = "#fff5ea",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#8f5f4a",
+    ["bg"] = "#fff5ea",
+  },
+  ["Folded"] = {
+    ["fg"] = "#527545",
+    ["bg"] = "#f2e9db",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#584141",
+    ["bg"] = "#f2e9db",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#63728f",
+    ["bg"] = "#f2e9db",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#63728f",
+    ["bg"] = "#f2e9db",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#584141",
+    ["bg"] = "#c9c0b8",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#63728f",
+    ["bg"] = "#f2e9db",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#f9e2b2",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#f9e2b2",
+  },
+  ["NonText"] = {
+    ["fg"] = "#63728f",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#f2e9db",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#63728f",
+    ["bg"] = "#f7efe6",
+  },
+  ["Search"] = {
+    ["fg"] = "#584141",
+    ["bg"] = "#96df80",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#584141",
+    ["bg"] = "#efbf00",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#584141",
+    ["bg"] = "#ff8f88",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#584141",
+    ["bg"] = "#f0d2df",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#584141",
+    ["bg"] = "#c9c0b8",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#c9c0b8",
+    ["bg"] = "#584141",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#584141",
+    ["bg"] = "#f2e9db",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#fff5ea",
+    ["bg"] = "#584141",
+  },
+  ["Directory"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["Title"] = {
+    ["fg"] = "#8f5f4a",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#584141",
+    ["bg"] = "#f0d2df",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#584141",
+    ["bg"] = "#f0d2df",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#63728f",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#542f38",
+    ["bg"] = "#ffaf72",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#63728f",
+    ["bg"] = "#f2e9db",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#63728f",
+    ["bg"] = "#c9c0b8",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#584141",
+    ["bg"] = "#fff5ea",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#63728f",
+    ["bg"] = "#e9e0d8",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#63728f",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#584141",
+    ["bg"] = "#8fcfdf",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#63728f",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#584141",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#c8bdb6",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#c8bdb6",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#005000",
+    ["bg"] = "#ccefcf",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#8f1313",
+    ["bg"] = "#ffd4d8",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#ffe5b9",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#ffe5b9",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#63728f",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#ce3f00",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#a45a22",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#007a0a",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#4f6f8f",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#a45a22",
+  },
+  ["Question"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["Comment"] = {
+    ["fg"] = "#527545",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#5f5fdf",
+  },
+  ["Character"] = {
+    ["fg"] = "#5f5fdf",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#375cc6",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#8448aa",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#8448aa",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#8448aa",
+  },
+  ["Label"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#8448aa",
+  },
+  ["Exception"] = {
+    ["fg"] = "#8448aa",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#8448aa",
+  },
+  ["Structure"] = {
+    ["fg"] = "#8448aa",
+  },
+  ["Constant"] = {
+    ["fg"] = "#584141",
+  },
+  ["Function"] = {
+    ["fg"] = "#ca3e54",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#cf2f4f",
+  },
+  ["Include"] = {
+    ["fg"] = "#cf2f4f",
+  },
+  ["Define"] = {
+    ["fg"] = "#cf2f4f",
+  },
+  ["Macro"] = {
+    ["fg"] = "#cf2f4f",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#cf2f4f",
+  },
+  ["Todo"] = {
+    ["fg"] = "#ca3e54",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#0f7b8f",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#3f6faf",
+  },
+  ["Number"] = {
+    ["fg"] = "#4a659f",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#584141",
+  },
+  ["Tag"] = {
+    ["fg"] = "#ca3e54",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#584141",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#4f6f8f",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#8f5f4a",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#584141",
+    ["bg"] = "#ff8f88",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#9d3334",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#8d532b",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#41549e",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#47578e",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#1a691b",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#63728f",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#9d3334",
+    ["bg"] = "#ecbdb6",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#8d532b",
+    ["bg"] = "#e6cab2",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#41549e",
+    ["bg"] = "#c7cae0",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#47578e",
+    ["bg"] = "#c9cbd9",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#1a691b",
+    ["bg"] = "#b8d3ab",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#9d3334",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#8d532b",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#41549e",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#47578e",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#1a691b",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#9d3334",
+    ["bg"] = "#f2e9db",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#8d532b",
+    ["bg"] = "#f2e9db",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#41549e",
+    ["bg"] = "#f2e9db",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#47578e",
+    ["bg"] = "#f2e9db",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#1a691b",
+    ["bg"] = "#f2e9db",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#9d3334",
+    ["bg"] = "#ecbdb6",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#8d532b",
+    ["bg"] = "#e6cab2",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#41549e",
+    ["bg"] = "#c7cae0",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#47578e",
+    ["bg"] = "#c9cbd9",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#1a691b",
+    ["bg"] = "#b8d3ab",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#f5d9d0",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#f2dfce",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#e3e0e5",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#e4e0e2",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#dbe4cb",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#005000",
+    ["bg"] = "#ccefcf",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#ffe5b9",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#8f1313",
+    ["bg"] = "#ffd4d8",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#cfceff",
+    ["fg"] = "#584141",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#cfceff",
+    ["fg"] = "#584141",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#cfceff",
+    ["fg"] = "#584141",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#c8bdb6",
+    ["bg"] = "#fff5ea",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#63728f",
+    ["bg"] = "#fff5ea",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#584141",
+    ["bg"] = "#f0d2df",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#584141",
+    ["bg"] = "#f0d2df",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#5f5fdf",
+    ["bg"] = "#f2e9db",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#5f5fdf",
+    ["bg"] = "#f2e9db",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#8f5f4a",
+    ["bg"] = "#fff5ea",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#8f5f4a",
+    ["bg"] = "#fff5ea",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#63728f",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#375cc6",
+    ["bg"] = "#fff5ea",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#375cc6",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#63728f",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#584141",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#584141",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#ca3e54",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#cf2f4f",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#8f5f4a",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#ca3e54",
+  },
+  ["@variable"] = {
+    ["fg"] = "#584141",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#8448aa",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#584141",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#584141",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#5f5fdf",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#cf2f4f",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#584141",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#cf2f4f",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#0f7b8f",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#5f5fdf",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#5f5fdf",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#ca3e54",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#375cc6",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#375cc6",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#ca3e54",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#007a0a",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#375cc6",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#a45a22",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#ce3f00",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#f2e9db",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#63728f",
+    ["bg"] = "#f2e9db",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#584141",
+    ["bg"] = "#e9e0d8",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#584141",
+    ["bg"] = "#e9e0d8",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#ca3e54",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#007a0a",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#cb2f80",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#63728f",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#005000",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#553d00",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#8f1313",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#c8bdb6",
+    ["bg"] = "#e9e0d8",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#ba2d2f",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#a45a22",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#ba2d2f",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#007a0a",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#ca3e54",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#584141",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#007a0a",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#ba2d2f",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#5f5fdf",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#8f5f4a",
+    ["bg"] = "#fff5ea",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#007a0a",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#ba2d2f",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#63728f",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#584141",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#63728f",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#5f5fdf",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#375cc6",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#63728f",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#584141",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#ca3e54",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#584141",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#8f5f4a",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#a45a22",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#584141",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#a45a22",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#ca3e54",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#007a0a",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#ca3e54",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#584141",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#ca3e54",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#a45a22",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#584141",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#ca3e54",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#584141",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#3f60af",
+  },
+}
@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_deuteranopia_dark (Ef Deuteranopia family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#ddddee",
+    ["bg"] = "#000a1f",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#ddddee",
+    ["bg"] = "#445165",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#90afef",
+    ["bg"] = "#000a1f",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#90afef",
+    ["bg"] = "#000a1f",
+  },
+  ["Folded"] = {
+    ["fg"] = "#61a06c",
+    ["bg"] = "#121f34",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#ddddee",
+    ["bg"] = "#121f34",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#7f8797",
+    ["bg"] = "#121f34",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#7f8797",
+    ["bg"] = "#121f34",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#ddddee",
+    ["bg"] = "#445165",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#7f8797",
+    ["bg"] = "#121f34",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#2e2e1b",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#2e2e1b",
+  },
+  ["NonText"] = {
+    ["fg"] = "#7f8797",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#121f34",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#7f8797",
+    ["bg"] = "#0d1429",
+  },
+  ["Search"] = {
+    ["fg"] = "#ddddee",
+    ["bg"] = "#afcf20",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#ddddee",
+    ["bg"] = "#5f5f00",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#ddddee",
+    ["bg"] = "#8d7f00",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#ddddee",
+    ["bg"] = "#223848",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#ddddee",
+    ["bg"] = "#445165",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#445165",
+    ["bg"] = "#ddddee",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#ddddee",
+    ["bg"] = "#121f34",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#000a1f",
+    ["bg"] = "#ddddee",
+  },
+  ["Directory"] = {
+    ["fg"] = "#3f90f0",
+  },
+  ["Title"] = {
+    ["fg"] = "#90afef",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#ddddee",
+    ["bg"] = "#223848",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#ddddee",
+    ["bg"] = "#223848",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#7f8797",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#ffffff",
+    ["bg"] = "#003f8f",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#7f8797",
+    ["bg"] = "#121f34",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#7f8797",
+    ["bg"] = "#445165",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#ddddee",
+    ["bg"] = "#000a1f",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#7f8797",
+    ["bg"] = "#243145",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#7f8797",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#ddddee",
+    ["bg"] = "#0f4f9a",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#7f8797",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#ddddee",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#3f90f0",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#555a64",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#555a64",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#c4d5ff",
+    ["bg"] = "#00234f",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#d4d48f",
+    ["bg"] = "#323200",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#e3cfff",
+    ["bg"] = "#2f123f",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#e3cfff",
+    ["bg"] = "#2f123f",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#7f8797",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#e47360",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#bfaf7a",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#009fff",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#8aa0df",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#bfaf7a",
+  },
+  ["Question"] = {
+    ["fg"] = "#3f90f0",
+  },
+  ["Comment"] = {
+    ["fg"] = "#af9a6a",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#6a9fff",
+  },
+  ["Character"] = {
+    ["fg"] = "#6a9fff",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#3f90f0",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#9f95ff",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#9f95ff",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#9f95ff",
+  },
+  ["Label"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#9f95ff",
+  },
+  ["Exception"] = {
+    ["fg"] = "#9f95ff",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#9f95ff",
+  },
+  ["Structure"] = {
+    ["fg"] = "#9f95ff",
+  },
+  ["Constant"] = {
+    ["fg"] = "#ddddee",
+  },
+  ["Function"] = {
+    ["fg"] = "#b379bf",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#cf7a7a",
+  },
+  ["Include"] = {
+    ["fg"] = "#cf7a7a",
+  },
+  ["Define"] = {
+    ["fg"] = "#cf7a7a",
+  },
+  ["Macro"] = {
+    ["fg"] = "#cf7a7a",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#cf7a7a",
+  },
+  ["Todo"] = {
+    ["fg"] = "#b379bf",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#0db0ff",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#7fafff",
+  },
+  ["Number"] = {
+    ["fg"] = "#7a94df",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#ddddee",
+  },
+  ["Tag"] = {
+    ["fg"] = "#b379bf",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#ddddee",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#8aa0df",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#90afef",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#ddddee",
+    ["bg"] = "#8d7f00",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#d39f8b",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#b9b26a",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#6ea7ef",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#85b9ef",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#6eb962",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#7f8797",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#d39f8b",
+    ["bg"] = "#3a2c31",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#b9b26a",
+    ["bg"] = "#303424",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#6ea7ef",
+    ["bg"] = "#12305a",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#85b9ef",
+    ["bg"] = "#1b3759",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#6eb962",
+    ["bg"] = "#123721",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#d39f8b",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#b9b26a",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#6ea7ef",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#85b9ef",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#6eb962",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#d39f8b",
+    ["bg"] = "#121f34",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#b9b26a",
+    ["bg"] = "#121f34",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#6ea7ef",
+    ["bg"] = "#121f34",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#85b9ef",
+    ["bg"] = "#121f34",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#6eb962",
+    ["bg"] = "#121f34",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#d39f8b",
+    ["bg"] = "#3a2c31",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#b9b26a",
+    ["bg"] = "#303424",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#6ea7ef",
+    ["bg"] = "#12305a",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#85b9ef",
+    ["bg"] = "#1b3759",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#6eb962",
+    ["bg"] = "#123721",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#1d1b28",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#181f22",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#091d3c",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#0d203c",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#092020",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#c4d5ff",
+    ["bg"] = "#00234f",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#e3cfff",
+    ["bg"] = "#2f123f",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#d4d48f",
+    ["bg"] = "#323200",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#266fd0",
+    ["fg"] = "#ddddee",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#266fd0",
+    ["fg"] = "#ddddee",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#266fd0",
+    ["fg"] = "#ddddee",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#555a64",
+    ["bg"] = "#000a1f",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#7f8797",
+    ["bg"] = "#000a1f",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#ddddee",
+    ["bg"] = "#223848",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#ddddee",
+    ["bg"] = "#223848",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#6a9fff",
+    ["bg"] = "#121f34",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#6a9fff",
+    ["bg"] = "#121f34",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#90afef",
+    ["bg"] = "#000a1f",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#90afef",
+    ["bg"] = "#000a1f",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#7f8797",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#3f90f0",
+    ["bg"] = "#000a1f",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#3f90f0",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#7f8797",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#ddddee",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#ddddee",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#b379bf",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#cf7a7a",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#90afef",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#b379bf",
+  },
+  ["@variable"] = {
+    ["fg"] = "#ddddee",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#9f95ff",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#ddddee",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#ddddee",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#6a9fff",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#cf7a7a",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#3f90f0",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#ddddee",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#cf7a7a",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#0db0ff",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#6a9fff",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#6a9fff",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#b379bf",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#3f90f0",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#3f90f0",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#3f90f0",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#b379bf",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#3faa26",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#3f90f0",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#bfaf7a",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#e47360",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#121f34",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#7f8797",
+    ["bg"] = "#121f34",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#ddddee",
+    ["bg"] = "#243145",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#ddddee",
+    ["bg"] = "#243145",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#3f90f0",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#3f90f0",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#b379bf",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#3faa26",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#af80ea",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#7f8797",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#c4d5ff",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#e3cfff",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#d4d48f",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#555a64",
+    ["bg"] = "#243145",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#cf8560",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#aa9f32",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#cf8560",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#3faa26",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#b379bf",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#ddddee",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#3faa26",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#cf8560",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#3f90f0",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#6a9fff",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#90afef",
+    ["bg"] = "#000a1f",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#3faa26",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#cf8560",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#7f8797",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#ddddee",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#7f8797",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#6a9fff",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#3f90f0",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#7f8797",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#ddddee",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#3f90f0",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#3f90f0",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#b379bf",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#ddddee",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#90afef",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#aa9f32",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#ddddee",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#aa9f32",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#b379bf",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#3faa26",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#b379bf",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#ddddee",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#b379bf",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#3f90f0",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#aa9f32",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#ddddee",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#b379bf",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#ddddee",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#5faaef",
+  },
+}
@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_deuteranopia_light (Ef Deuteranopia family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#1a1a2f",
+    ["bg"] = "#f5f5ff",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#1a1a2f",
+    ["bg"] = "#b3b3c0",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#196f70",
+    ["bg"] = "#f5f5ff",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#196f70",
+    ["bg"] = "#f5f5ff",
+  },
+  ["Folded"] = {
+    ["fg"] = "#61756c",
+    ["bg"] = "#e8e8ea",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#1a1a2f",
+    ["bg"] = "#e8e8ea",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#70627f",
+    ["bg"] = "#e8e8ea",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#70627f",
+    ["bg"] = "#e8e8ea",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#1a1a2f",
+    ["bg"] = "#b3b3c0",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#70627f",
+    ["bg"] = "#e8e8ea",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#f3e0d5",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#f3e0d5",
+  },
+  ["NonText"] = {
+    ["fg"] = "#70627f",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#e8e8ea",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#70627f",
+    ["bg"] = "#efeff5",
+  },
+  ["Search"] = {
+    ["fg"] = "#1a1a2f",
+    ["bg"] = "#9aaf80",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#1a1a2f",
+    ["bg"] = "#fac200",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#1a1a2f",
+    ["bg"] = "#cac200",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#1a1a2f",
+    ["bg"] = "#dadadf",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#1a1a2f",
+    ["bg"] = "#b3b3c0",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#b3b3c0",
+    ["bg"] = "#1a1a2f",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#1a1a2f",
+    ["bg"] = "#e8e8ea",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#f5f5ff",
+    ["bg"] = "#1a1a2f",
+  },
+  ["Directory"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["Title"] = {
+    ["fg"] = "#196f70",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#1a1a2f",
+    ["bg"] = "#dadadf",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#1a1a2f",
+    ["bg"] = "#dadadf",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#70627f",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#0a0a1f",
+    ["bg"] = "#99c7ff",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#70627f",
+    ["bg"] = "#e8e8ea",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#70627f",
+    ["bg"] = "#b3b3c0",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#1a1a2f",
+    ["bg"] = "#f5f5ff",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#70627f",
+    ["bg"] = "#d3d3e0",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#70627f",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#1a1a2f",
+    ["bg"] = "#8fc0cf",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#70627f",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#1a1a2f",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#bcbcd0",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#bcbcd0",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#333399",
+    ["bg"] = "#dbdbff",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#fff0af",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#6f1343",
+    ["bg"] = "#eecfdf",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#6f1343",
+    ["bg"] = "#eecfdf",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#70627f",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#e00033",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#765040",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#065fff",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#506fa0",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#765040",
+  },
+  ["Question"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["Comment"] = {
+    ["fg"] = "#77604a",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["Character"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#375cd8",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["Label"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["Exception"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["Structure"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["Constant"] = {
+    ["fg"] = "#1a1a2f",
+  },
+  ["Function"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#d50f7f",
+  },
+  ["Include"] = {
+    ["fg"] = "#d50f7f",
+  },
+  ["Define"] = {
+    ["fg"] = "#d50f7f",
+  },
+  ["Macro"] = {
+    ["fg"] = "#d50f7f",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#d50f7f",
+  },
+  ["Todo"] = {
+    ["fg"] = "#ba35af",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#1477b2",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#3f6faf",
+  },
+  ["Number"] = {
+    ["fg"] = "#6060d0",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#1a1a2f",
+  },
+  ["Tag"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#1a1a2f",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#506fa0",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#196f70",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#1a1a2f",
+    ["bg"] = "#cac200",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#9c2937",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#61490e",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#2e48a5",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#1e5594",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#1f5d38",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#70627f",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#9c2937",
+    ["bg"] = "#ebbec8",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#61490e",
+    ["bg"] = "#d4cab8",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#2e48a5",
+    ["bg"] = "#c0caf4",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#1e5594",
+    ["bg"] = "#b9cfed",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#1f5d38",
+    ["bg"] = "#bad3c8",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#9c2937",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#61490e",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#2e48a5",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#1e5594",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#1f5d38",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#9c2937",
+    ["bg"] = "#e8e8ea",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#61490e",
+    ["bg"] = "#e8e8ea",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#2e48a5",
+    ["bg"] = "#e8e8ea",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#1e5594",
+    ["bg"] = "#e8e8ea",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#1f5d38",
+    ["bg"] = "#e8e8ea",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#9c2937",
+    ["bg"] = "#ebbec8",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#61490e",
+    ["bg"] = "#d4cab8",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#2e48a5",
+    ["bg"] = "#c0caf4",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#1e5594",
+    ["bg"] = "#b9cfed",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#1f5d38",
+    ["bg"] = "#bad3c8",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#f0d9e3",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#e5e0db",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#dae0fa",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#d7e2f6",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#d7e4e4",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#333399",
+    ["bg"] = "#dbdbff",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#6f1343",
+    ["bg"] = "#eecfdf",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#fff0af",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#cbcfff",
+    ["fg"] = "#1a1a2f",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#cbcfff",
+    ["fg"] = "#1a1a2f",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#cbcfff",
+    ["fg"] = "#1a1a2f",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#bcbcd0",
+    ["bg"] = "#f5f5ff",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#70627f",
+    ["bg"] = "#f5f5ff",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#1a1a2f",
+    ["bg"] = "#dadadf",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#1a1a2f",
+    ["bg"] = "#dadadf",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#4250ef",
+    ["bg"] = "#e8e8ea",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#4250ef",
+    ["bg"] = "#e8e8ea",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#196f70",
+    ["bg"] = "#f5f5ff",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#196f70",
+    ["bg"] = "#f5f5ff",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#70627f",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#375cd8",
+    ["bg"] = "#f5f5ff",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#375cd8",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#70627f",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#1a1a2f",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#1a1a2f",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#d50f7f",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#196f70",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["@variable"] = {
+    ["fg"] = "#1a1a2f",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#1a1a2f",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#1a1a2f",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#d50f7f",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#1a1a2f",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#d50f7f",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#1477b2",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#375cd8",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#375cd8",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#375cd8",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#765040",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#e00033",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#e8e8ea",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#70627f",
+    ["bg"] = "#e8e8ea",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#1a1a2f",
+    ["bg"] = "#d3d3e0",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#1a1a2f",
+    ["bg"] = "#d3d3e0",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#ba35af",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#cf25aa",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#70627f",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#333399",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#6f1343",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#553d00",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#bcbcd0",
+    ["bg"] = "#d3d3e0",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#d3303a",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#805d00",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#d3303a",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#1a1a2f",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#d3303a",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#196f70",
+    ["bg"] = "#f5f5ff",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#d3303a",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#70627f",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#1a1a2f",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#70627f",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#4250ef",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#375cd8",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#70627f",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#1a1a2f",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#1a1a2f",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#196f70",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#805d00",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#1a1a2f",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#805d00",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#1a1a2f",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#805d00",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#1a1a2f",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#1a1a2f",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#1f6fbf",
+  },
+}
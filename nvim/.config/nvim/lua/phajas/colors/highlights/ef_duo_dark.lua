@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_duo_dark (Ef Duo family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#070019",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#4a4759",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#89afef",
+    ["bg"] = "#070019",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#89afef",
+    ["bg"] = "#070019",
+  },
+  ["Folded"] = {
+    ["fg"] = "#61a06c",
+    ["bg"] = "#1d1a26",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#1d1a26",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#857f8f",
+    ["bg"] = "#1d1a26",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#857f8f",
+    ["bg"] = "#1d1a26",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#4a4759",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#857f8f",
+    ["bg"] = "#1d1a26",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#301a4f",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#301a4f",
+  },
+  ["NonText"] = {
+    ["fg"] = "#857f8f",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#1d1a26",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#857f8f",
+    ["bg"] = "#13101f",
+  },
+  ["Search"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#407720",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#8f5040",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#cd2f30",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#042a50",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#4a4759",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#4a4759",
+    ["bg"] = "#d0d0d0",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#1d1a26",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#070019",
+    ["bg"] = "#d0d0d0",
+  },
+  ["Directory"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["Title"] = {
+    ["fg"] = "#89afef",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#042a50",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#042a50",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#857f8f",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#dedeff",
+    ["bg"] = "#352487",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#857f8f",
+    ["bg"] = "#1d1a26",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#857f8f",
+    ["bg"] = "#4a4759",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#070019",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#857f8f",
+    ["bg"] = "#2a2739",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#857f8f",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#2f608e",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#857f8f",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#545f6f",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#545f6f",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#a0e0a0",
+    ["bg"] = "#002d1f",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#ffbfbf",
+    ["bg"] = "#3d091f",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#efef80",
+    ["bg"] = "#323200",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#efef80",
+    ["bg"] = "#323200",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#857f8f",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#f47360",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#c48702",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#1fa526",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#8aa0df",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#c48702",
+  },
+  ["Question"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["Comment"] = {
+    ["fg"] = "#d08f72",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#6f80ff",
+  },
+  ["Character"] = {
+    ["fg"] = "#6f80ff",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#379cf6",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#af85ff",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#af85ff",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#af85ff",
+  },
+  ["Label"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#af85ff",
+  },
+  ["Exception"] = {
+    ["fg"] = "#af85ff",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#af85ff",
+  },
+  ["Structure"] = {
+    ["fg"] = "#af85ff",
+  },
+  ["Constant"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["Function"] = {
+    ["fg"] = "#d369af",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#ef798f",
+  },
+  ["Include"] = {
+    ["fg"] = "#ef798f",
+  },
+  ["Define"] = {
+    ["fg"] = "#ef798f",
+  },
+  ["Macro"] = {
+    ["fg"] = "#ef798f",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#ef798f",
+  },
+  ["Todo"] = {
+    ["fg"] = "#d369af",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#0dafdf",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#7fafff",
+  },
+  ["Number"] = {
+    ["fg"] = "#8a9fdf",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["Tag"] = {
+    ["fg"] = "#d369af",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#8aa0df",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#89afef",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#cd2f30",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#e68589",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#c89d40",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#65aceb",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#81b5e6",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#54b259",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#857f8f",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#e68589",
+    ["bg"] = "#481c30",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#c89d40",
+    ["bg"] = "#3c2613",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#65aceb",
+    ["bg"] = "#142c57",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#81b5e6",
+    ["bg"] = "#203055",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#54b259",
+    ["bg"] = "#0e2e1d",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#e68589",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#c89d40",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#65aceb",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#81b5e6",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#54b259",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#e68589",
+    ["bg"] = "#1d1a26",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#c89d40",
+    ["bg"] = "#1d1a26",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#65aceb",
+    ["bg"] = "#1d1a26",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#81b5e6",
+    ["bg"] = "#1d1a26",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#54b259",
+    ["bg"] = "#1d1a26",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#e68589",
+    ["bg"] = "#481c30",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#c89d40",
+    ["bg"] = "#3c2613",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#65aceb",
+    ["bg"] = "#142c57",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#81b5e6",
+    ["bg"] = "#203055",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#54b259",
+    ["bg"] = "#0e2e1d",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#270e24",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#211316",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#0e1638",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#131837",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#0a171b",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#a0e0a0",
+    ["bg"] = "#002d1f",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#efef80",
+    ["bg"] = "#323200",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#ffbfbf",
+    ["bg"] = "#3d091f",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#4648d0",
+    ["fg"] = "#d0d0d0",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#4648d0",
+    ["fg"] = "#d0d0d0",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#4648d0",
+    ["fg"] = "#d0d0d0",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#545f6f",
+    ["bg"] = "#070019",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#857f8f",
+    ["bg"] = "#070019",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#042a50",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#042a50",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#6f80ff",
+    ["bg"] = "#1d1a26",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#6f80ff",
+    ["bg"] = "#1d1a26",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#89afef",
+    ["bg"] = "#070019",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#89afef",
+    ["bg"] = "#070019",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#857f8f",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#379cf6",
+    ["bg"] = "#070019",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#379cf6",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#857f8f",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#d369af",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#ef798f",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#89afef",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#d369af",
+  },
+  ["@variable"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#af85ff",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#6f80ff",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#ef798f",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#ef798f",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#0dafdf",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#6f80ff",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#6f80ff",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#d369af",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#379cf6",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#379cf6",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#d369af",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#1fa526",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#379cf6",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#c48702",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#f47360",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#1d1a26",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#857f8f",
+    ["bg"] = "#1d1a26",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#2a2739",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#d0d0d0",
+    ["bg"] = "#2a2739",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#d369af",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#1fa526",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#e580ea",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#857f8f",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#a0e0a0",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#efef80",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#ffbfbf",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#545f6f",
+    ["bg"] = "#2a2739",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#ef656a",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#c48702",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#ef656a",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#1fa526",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#d369af",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#1fa526",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#ef656a",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#6f80ff",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#89afef",
+    ["bg"] = "#070019",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#1fa526",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#ef656a",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#857f8f",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#857f8f",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#6f80ff",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#379cf6",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#857f8f",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#d369af",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#89afef",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#c48702",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#c48702",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#d369af",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#1fa526",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#d369af",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#d369af",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#c48702",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#5faaef",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#d369af",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#d0d0d0",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#5faaef",
+  },
+}
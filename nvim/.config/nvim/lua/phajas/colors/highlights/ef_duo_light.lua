@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_duo_light (Ef Duo family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#222222",
+    ["bg"] = "#fff8f0",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#222222",
+    ["bg"] = "#c7c0ba",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#856f4a",
+    ["bg"] = "#fff8f0",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#856f4a",
+    ["bg"] = "#fff8f0",
+  },
+  ["Folded"] = {
+    ["fg"] = "#61756c",
+    ["bg"] = "#f6ece8",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#222222",
+    ["bg"] = "#f6ece8",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#63728f",
+    ["bg"] = "#f6ece8",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#63728f",
+    ["bg"] = "#f6ece8",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#222222",
+    ["bg"] = "#c7c0ba",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#63728f",
+    ["bg"] = "#f6ece8",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#f9e8c0",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#f9e8c0",
+  },
+  ["NonText"] = {
+    ["fg"] = "#63728f",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#f6ece8",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#63728f",
+    ["bg"] = "#f9f2ef",
+  },
+  ["Search"] = {
+    ["fg"] = "#222222",
+    ["bg"] = "#8adf80",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#222222",
+    ["bg"] = "#fac200",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#222222",
+    ["bg"] = "#ff8f88",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#222222",
+    ["bg"] = "#caeafa",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#222222",
+    ["bg"] = "#c7c0ba",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#c7c0ba",
+    ["bg"] = "#222222",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#222222",
+    ["bg"] = "#f6ece8",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#fff8f0",
+    ["bg"] = "#222222",
+  },
+  ["Directory"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["Title"] = {
+    ["fg"] = "#856f4a",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#222222",
+    ["bg"] = "#caeafa",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#222222",
+    ["bg"] = "#caeafa",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#63728f",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#111133",
+    ["bg"] = "#f8cf8f",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#63728f",
+    ["bg"] = "#f6ece8",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#63728f",
+    ["bg"] = "#c7c0ba",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#222222",
+    ["bg"] = "#fff8f0",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#63728f",
+    ["bg"] = "#e7e0da",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#63728f",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#222222",
+    ["bg"] = "#afbfef",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#63728f",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#222222",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#baafba",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#baafba",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#005000",
+    ["bg"] = "#ccefcf",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#8f1313",
+    ["bg"] = "#ffd4d8",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#ffe5b9",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#ffe5b9",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#63728f",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#dd1100",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#8a5d00",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#217a3c",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#406f90",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#8a5d00",
+  },
+  ["Question"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["Comment"] = {
+    ["fg"] = "#a2403f",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["Character"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#375cd8",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["Label"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["Exception"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["Structure"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["Constant"] = {
+    ["fg"] = "#222222",
+  },
+  ["Function"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#c04440",
+  },
+  ["Include"] = {
+    ["fg"] = "#c04440",
+  },
+  ["Define"] = {
+    ["fg"] = "#c04440",
+  },
+  ["Macro"] = {
+    ["fg"] = "#c04440",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#c04440",
+  },
+  ["Todo"] = {
+    ["fg"] = "#ba35af",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#1f77bb",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#3f70a0",
+  },
+  ["Number"] = {
+    ["fg"] = "#6060d0",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#222222",
+  },
+  ["Tag"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#222222",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#406f90",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#856f4a",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#222222",
+    ["bg"] = "#ff8f88",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#992e2e",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#6b4b0a",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#314ba1",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#205890",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#216034",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#63728f",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#992e2e",
+    ["bg"] = "#f1c1bb",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#6b4b0a",
+    ["bg"] = "#decdad",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#314ba1",
+    ["bg"] = "#c7cce9",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#205890",
+    ["bg"] = "#c0d2e2",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#216034",
+    ["bg"] = "#c1d5be",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#992e2e",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#6b4b0a",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#314ba1",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#205890",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#216034",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#992e2e",
+    ["bg"] = "#f6ece8",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#6b4b0a",
+    ["bg"] = "#f6ece8",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#314ba1",
+    ["bg"] = "#f6ece8",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#205890",
+    ["bg"] = "#f6ece8",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#216034",
+    ["bg"] = "#f6ece8",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#992e2e",
+    ["bg"] = "#f1c1bb",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#6b4b0a",
+    ["bg"] = "#decdad",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#314ba1",
+    ["bg"] = "#c7cce9",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#205890",
+    ["bg"] = "#c0d2e2",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#216034",
+    ["bg"] = "#c1d5be",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#f8dcd6",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#efe2ce",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#e3e2ed",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#e0e5e9",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#e0e6d7",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#005000",
+    ["bg"] = "#ccefcf",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#ffe5b9",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#8f1313",
+    ["bg"] = "#ffd4d8",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#cbcfff",
+    ["fg"] = "#222222",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#cbcfff",
+    ["fg"] = "#222222",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#cbcfff",
+    ["fg"] = "#222222",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#baafba",
+    ["bg"] = "#fff8f0",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#63728f",
+    ["bg"] = "#fff8f0",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#222222",
+    ["bg"] = "#caeafa",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#222222",
+    ["bg"] = "#caeafa",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#4250ef",
+    ["bg"] = "#f6ece8",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#4250ef",
+    ["bg"] = "#f6ece8",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#856f4a",
+    ["bg"] = "#fff8f0",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#856f4a",
+    ["bg"] = "#fff8f0",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#63728f",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#375cd8",
+    ["bg"] = "#fff8f0",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#375cd8",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#63728f",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#222222",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#222222",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#c04440",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#856f4a",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["@variable"] = {
+    ["fg"] = "#222222",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#222222",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#222222",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#c04440",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#222222",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#c04440",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#1f77bb",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#375cd8",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#375cd8",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#375cd8",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#8a5d00",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#dd1100",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#f6ece8",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#63728f",
+    ["bg"] = "#f6ece8",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#222222",
+    ["bg"] = "#e7e0da",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#222222",
+    ["bg"] = "#e7e0da",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#ba35af",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#cf25aa",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#63728f",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#005000",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#553d00",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#8f1313",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#baafba",
+    ["bg"] = "#e7e0da",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#cc3333",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#8a5d00",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#cc3333",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#222222",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#cc3333",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#856f4a",
+    ["bg"] = "#fff8f0",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#cc3333",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#63728f",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#222222",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#63728f",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#4250ef",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#375cd8",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#63728f",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#222222",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#222222",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#856f4a",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#8a5d00",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#222222",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#8a5d00",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#222222",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#8a5d00",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#222222",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#222222",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#1f6fbf",
+  },
+}
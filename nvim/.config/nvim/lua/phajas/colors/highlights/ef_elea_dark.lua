@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_elea_dark (Ef Elea family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#eaf2ef",
+    ["bg"] = "#222524",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#eaf2ef",
+    ["bg"] = "#5e6160",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#8fcfbb",
+    ["bg"] = "#222524",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#8fcfbb",
+    ["bg"] = "#222524",
+  },
+  ["Folded"] = {
+    ["fg"] = "#a9c99f",
+    ["bg"] = "#303332",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#eaf2ef",
+    ["bg"] = "#303332",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#969faf",
+    ["bg"] = "#303332",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#969faf",
+    ["bg"] = "#303332",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#eaf2ef",
+    ["bg"] = "#5e6160",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#969faf",
+    ["bg"] = "#303332",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#2f413f",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#2f413f",
+  },
+  ["NonText"] = {
+    ["fg"] = "#969faf",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#303332",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#969faf",
+    ["bg"] = "#2b2e2d",
+  },
+  ["Search"] = {
+    ["fg"] = "#eaf2ef",
+    ["bg"] = "#408420",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#eaf2ef",
+    ["bg"] = "#847020",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#eaf2ef",
+    ["bg"] = "#bd1f30",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#eaf2ef",
+    ["bg"] = "#543040",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#eaf2ef",
+    ["bg"] = "#5e6160",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#5e6160",
+    ["bg"] = "#eaf2ef",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#eaf2ef",
+    ["bg"] = "#303332",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#222524",
+    ["bg"] = "#eaf2ef",
+  },
+  ["Directory"] = {
+    ["fg"] = "#57aff6",
+  },
+  ["Title"] = {
+    ["fg"] = "#8fcfbb",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#eaf2ef",
+    ["bg"] = "#543040",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#eaf2ef",
+    ["bg"] = "#543040",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#969faf",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#ecf0ff",
+    ["bg"] = "#35605d",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#969faf",
+    ["bg"] = "#303332",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#969faf",
+    ["bg"] = "#5e6160",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#eaf2ef",
+    ["bg"] = "#222524",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#969faf",
+    ["bg"] = "#3e4140",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#969faf",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#eaf2ef",
+    ["bg"] = "#3f6f5f",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#969faf",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#eaf2ef",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#57aff6",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#5d5f63",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#5d5f63",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#a0e0a0",
+    ["bg"] = "#20493f",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#ffbfbf",
+    ["bg"] = "#5e242f",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#dada90",
+    ["bg"] = "#51512f",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#dada90",
+    ["bg"] = "#51512f",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#969faf",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#ff7a5f",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#e0b02f",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#50cf89",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#99bfcf",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#e0b02f",
+  },
+  ["Question"] = {
+    ["fg"] = "#57aff6",
+  },
+  ["Comment"] = {
+    ["fg"] = "#cac89f",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#78afff",
+  },
+  ["Character"] = {
+    ["fg"] = "#78afff",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#57aff6",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#cfaaff",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#cfaaff",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#cfaaff",
+  },
+  ["Label"] = {
+    ["fg"] = "#6fcfd2",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#cfaaff",
+  },
+  ["Exception"] = {
+    ["fg"] = "#cfaaff",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#cfaaff",
+  },
+  ["Structure"] = {
+    ["fg"] = "#cfaaff",
+  },
+  ["Constant"] = {
+    ["fg"] = "#eaf2ef",
+  },
+  ["Function"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#6fcfd2",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#fa7f88",
+  },
+  ["Include"] = {
+    ["fg"] = "#fa7f88",
+  },
+  ["Define"] = {
+    ["fg"] = "#fa7f88",
+  },
+  ["Macro"] = {
+    ["fg"] = "#fa7f88",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#fa7f88",
+  },
+  ["Todo"] = {
+    ["fg"] = "#f59acf",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#60d5c2",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#7fcfdf",
+  },
+  ["Number"] = {
+    ["fg"] = "#6ab4ef",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#eaf2ef",
+  },
+  ["Tag"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#eaf2ef",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#99bfcf",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#8fcfbb",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#eaf2ef",
+    ["bg"] = "#bd1f30",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#f98f92",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#d4d58a",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#83c3f4",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#94dadb",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#9fd5a1",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#969faf",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#f98f92",
+    ["bg"] = "#603738",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#d4d58a",
+    ["bg"] = "#515335",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#83c3f4",
+    ["bg"] = "#314c5f",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#94dadb",
+    ["bg"] = "#385555",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#9fd5a1",
+    ["bg"] = "#3c533d",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#f98f92",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#d4d58a",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#83c3f4",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#94dadb",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#9fd5a1",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#f98f92",
+    ["bg"] = "#303332",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#d4d58a",
+    ["bg"] = "#303332",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#83c3f4",
+    ["bg"] = "#303332",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#94dadb",
+    ["bg"] = "#303332",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#9fd5a1",
+    ["bg"] = "#303332",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#f98f92",
+    ["bg"] = "#603738",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#d4d58a",
+    ["bg"] = "#515335",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#83c3f4",
+    ["bg"] = "#314c5f",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#94dadb",
+    ["bg"] = "#385555",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#9fd5a1",
+    ["bg"] = "#3c533d",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#412e2e",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#3a3c2c",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#293841",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#2d3d3c",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#2f3c31",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#a0e0a0",
+    ["bg"] = "#20493f",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#dada90",
+    ["bg"] = "#51512f",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#ffbfbf",
+    ["bg"] = "#5e242f",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#2f5f9f",
+    ["fg"] = "#eaf2ef",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#2f5f9f",
+    ["fg"] = "#eaf2ef",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#2f5f9f",
+    ["fg"] = "#eaf2ef",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#5d5f63",
+    ["bg"] = "#222524",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#969faf",
+    ["bg"] = "#222524",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#eaf2ef",
+    ["bg"] = "#543040",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#eaf2ef",
+    ["bg"] = "#543040",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#78afff",
+    ["bg"] = "#303332",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#78afff",
+    ["bg"] = "#303332",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#8fcfbb",
+    ["bg"] = "#222524",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#8fcfbb",
+    ["bg"] = "#222524",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#969faf",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#57aff6",
+    ["bg"] = "#222524",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#57aff6",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#969faf",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#eaf2ef",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#eaf2ef",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#fa7f88",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#8fcfbb",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["@variable"] = {
+    ["fg"] = "#eaf2ef",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#cfaaff",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#eaf2ef",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#6fcfd2",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#eaf2ef",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#78afff",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#fa7f88",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#57aff6",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#eaf2ef",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#fa7f88",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#60d5c2",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#78afff",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#6fcfd2",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#78afff",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#57aff6",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#57aff6",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#57aff6",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#7fc87f",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#57aff6",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#e0b02f",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#ff7a5f",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#303332",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#969faf",
+    ["bg"] = "#303332",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#eaf2ef",
+    ["bg"] = "#3e4140",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#eaf2ef",
+    ["bg"] = "#3e4140",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#57aff6",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#57aff6",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#f59acf",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#6fcfd2",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#7fc87f",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#fa90ea",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#969faf",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#a0e0a0",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#dada90",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#ffbfbf",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#5d5f63",
+    ["bg"] = "#3e4140",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#ff656a",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#cac85f",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#ff656a",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#7fc87f",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#6fcfd2",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#6fcfd2",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#eaf2ef",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#7fc87f",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#ff656a",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#57aff6",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#78afff",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#8fcfbb",
+    ["bg"] = "#222524",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#7fc87f",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#ff656a",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#969faf",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#eaf2ef",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#969faf",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#78afff",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#57aff6",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#969faf",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#eaf2ef",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#57aff6",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#57aff6",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#6fcfd2",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#eaf2ef",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#6fcfd2",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#6fcfd2",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#8fcfbb",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#6fcfd2",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#cac85f",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#eaf2ef",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#cac85f",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#7fc87f",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#eaf2ef",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#57aff6",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#cac85f",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#eaf2ef",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#6fcfd2",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#eaf2ef",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#6fcfd2",
+  },
+}
@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_elea_light (Ef Elea family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#221321",
+    ["bg"] = "#edf5e2",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#221321",
+    ["bg"] = "#b0b7aa",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#5f5f1f",
+    ["bg"] = "#edf5e2",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#5f5f1f",
+    ["bg"] = "#edf5e2",
+  },
+  ["Folded"] = {
+    ["fg"] = "#306630",
+    ["bg"] = "#e3e9d6",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#221321",
+    ["bg"] = "#e3e9d6",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#676470",
+    ["bg"] = "#e3e9d6",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#676470",
+    ["bg"] = "#e3e9d6",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#221321",
+    ["bg"] = "#b0b7aa",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#676470",
+    ["bg"] = "#e3e9d6",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#d0e7c4",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#d0e7c4",
+  },
+  ["NonText"] = {
+    ["fg"] = "#676470",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#e3e9d6",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#676470",
+    ["bg"] = "#e8eddc",
+  },
+  ["Search"] = {
+    ["fg"] = "#221321",
+    ["bg"] = "#a6df80",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#221321",
+    ["bg"] = "#efbf00",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#221321",
+    ["bg"] = "#ff8f88",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#221321",
+    ["bg"] = "#d9d2ef",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#221321",
+    ["bg"] = "#b0b7aa",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#b0b7aa",
+    ["bg"] = "#221321",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#221321",
+    ["bg"] = "#e3e9d6",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#edf5e2",
+    ["bg"] = "#221321",
+  },
+  ["Directory"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["Title"] = {
+    ["fg"] = "#5f5f1f",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#221321",
+    ["bg"] = "#d9d2ef",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#221321",
+    ["bg"] = "#d9d2ef",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#676470",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#142810",
+    ["bg"] = "#a5c67f",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#676470",
+    ["bg"] = "#e3e9d6",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#676470",
+    ["bg"] = "#b0b7aa",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#221321",
+    ["bg"] = "#edf5e2",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#676470",
+    ["bg"] = "#d0d7ca",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#676470",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#221321",
+    ["bg"] = "#8ad3a2",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#676470",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#221321",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#a5aaaf",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#a5aaaf",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#005000",
+    ["bg"] = "#c7e8ba",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#8f1313",
+    ["bg"] = "#f2d0c6",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#f5e8b0",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#f5e8b0",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#676470",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#d00000",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#b04300",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#007047",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#4f677f",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#b04300",
+  },
+  ["Question"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["Comment"] = {
+    ["fg"] = "#7f4f4a",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#444fcf",
+  },
+  ["Character"] = {
+    ["fg"] = "#444fcf",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#375cc6",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#5032aa",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#5032aa",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#5032aa",
+  },
+  ["Label"] = {
+    ["fg"] = "#1f70af",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#5032aa",
+  },
+  ["Exception"] = {
+    ["fg"] = "#5032aa",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#5032aa",
+  },
+  ["Structure"] = {
+    ["fg"] = "#5032aa",
+  },
+  ["Constant"] = {
+    ["fg"] = "#221321",
+  },
+  ["Function"] = {
+    ["fg"] = "#80308f",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#1f70af",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#b02440",
+  },
+  ["Include"] = {
+    ["fg"] = "#b02440",
+  },
+  ["Define"] = {
+    ["fg"] = "#b02440",
+  },
+  ["Macro"] = {
+    ["fg"] = "#b02440",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#b02440",
+  },
+  ["Todo"] = {
+    ["fg"] = "#80308f",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#00677f",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#3f6faf",
+  },
+  ["Number"] = {
+    ["fg"] = "#3a5099",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#221321",
+  },
+  ["Tag"] = {
+    ["fg"] = "#80308f",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#221321",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#4f677f",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#5f5f1f",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#221321",
+    ["bg"] = "#ff8f88",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#932733",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#763e20",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#314695",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#205484",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#0a4920",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#676470",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#932733",
+    ["bg"] = "#e1beb3",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#763e20",
+    ["bg"] = "#d6c7ab",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#314695",
+    ["bg"] = "#bacada",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#205484",
+    ["bg"] = "#b3d0d4",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#0a4920",
+    ["bg"] = "#abcbab",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#932733",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#763e20",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#314695",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#205484",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#0a4920",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#932733",
+    ["bg"] = "#e3e9d6",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#763e20",
+    ["bg"] = "#e3e9d6",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#314695",
+    ["bg"] = "#e3e9d6",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#205484",
+    ["bg"] = "#e3e9d6",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#0a4920",
+    ["bg"] = "#e3e9d6",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#932733",
+    ["bg"] = "#e1beb3",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#763e20",
+    ["bg"] = "#d6c7ab",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#314695",
+    ["bg"] = "#bacada",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#205484",
+    ["bg"] = "#b3d0d4",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#0a4920",
+    ["bg"] = "#abcbab",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#e7d9ca",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#e1dec7",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#d4e0de",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#d0e2db",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#cce0c7",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#005000",
+    ["bg"] = "#c7e8ba",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#f5e8b0",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#8f1313",
+    ["bg"] = "#f2d0c6",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#cfceff",
+    ["fg"] = "#221321",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#cfceff",
+    ["fg"] = "#221321",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#cfceff",
+    ["fg"] = "#221321",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#a5aaaf",
+    ["bg"] = "#edf5e2",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#676470",
+    ["bg"] = "#edf5e2",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#221321",
+    ["bg"] = "#d9d2ef",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#221321",
+    ["bg"] = "#d9d2ef",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#444fcf",
+    ["bg"] = "#e3e9d6",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#444fcf",
+    ["bg"] = "#e3e9d6",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#5f5f1f",
+    ["bg"] = "#edf5e2",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#5f5f1f",
+    ["bg"] = "#edf5e2",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#676470",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#375cc6",
+    ["bg"] = "#edf5e2",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#375cc6",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#676470",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#221321",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#221321",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#80308f",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#b02440",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#5f5f1f",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#80308f",
+  },
+  ["@variable"] = {
+    ["fg"] = "#221321",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#5032aa",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#221321",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#1f70af",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#221321",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#444fcf",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#b02440",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#221321",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#b02440",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#00677f",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#444fcf",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#1f70af",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#444fcf",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#80308f",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#375cc6",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#375cc6",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#80308f",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#00601f",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#375cc6",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#b04300",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#d00000",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#e3e9d6",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#676470",
+    ["bg"] = "#e3e9d6",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#221321",
+    ["bg"] = "#d0d7ca",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#221321",
+    ["bg"] = "#d0d7ca",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#80308f",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#1f70af",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#00601f",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#9f356a",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#676470",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#005000",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#553d00",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#8f1313",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#a5aaaf",
+    ["bg"] = "#d0d7ca",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#c3303a",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#9a501f",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#c3303a",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#00601f",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#1f70af",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#1f70af",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#80308f",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#221321",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#00601f",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#c3303a",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#444fcf",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#5f5f1f",
+    ["bg"] = "#edf5e2",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#00601f",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#c3303a",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#676470",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#221321",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#676470",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#444fcf",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#375cc6",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#676470",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#221321",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#80308f",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#1f70af",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#221321",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#1f70af",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#1f70af",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#5f5f1f",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#1f70af",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#9a501f",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#221321",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#9a501f",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#80308f",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#00601f",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#80308f",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#221321",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#80308f",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#9a501f",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#221321",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#1f70af",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#80308f",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#221321",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#1f70af",
+  },
+}
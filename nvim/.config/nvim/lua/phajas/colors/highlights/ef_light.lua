@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_light (Ef Light/Dark family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#202020",
+    ["bg"] = "#ffffff",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#202020",
+    ["bg"] = "#b3b3b3",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#397a70",
+    ["bg"] = "#ffffff",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#397a70",
+    ["bg"] = "#ffffff",
+  },
+  ["Folded"] = {
+    ["fg"] = "#61756c",
+    ["bg"] = "#efefef",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#202020",
+    ["bg"] = "#efefef",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#68759f",
+    ["bg"] = "#efefef",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#68759f",
+    ["bg"] = "#efefef",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#202020",
+    ["bg"] = "#b3b3b3",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#68759f",
+    ["bg"] = "#efefef",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#e4efd8",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#e4efd8",
+  },
+  ["NonText"] = {
+    ["fg"] = "#68759f",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#efefef",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#68759f",
+    ["bg"] = "#f9f9f9",
+  },
+  ["Search"] = {
+    ["fg"] = "#202020",
+    ["bg"] = "#9adf90",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#202020",
+    ["bg"] = "#fac200",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#202020",
+    ["bg"] = "#ff8f88",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#202020",
+    ["bg"] = "#bfefff",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#202020",
+    ["bg"] = "#b3b3b3",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#b3b3b3",
+    ["bg"] = "#202020",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#202020",
+    ["bg"] = "#efefef",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#ffffff",
+    ["bg"] = "#202020",
+  },
+  ["Directory"] = {
+    ["fg"] = "#3740cf",
+  },
+  ["Title"] = {
+    ["fg"] = "#397a70",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#202020",
+    ["bg"] = "#bfefff",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#202020",
+    ["bg"] = "#bfefff",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#68759f",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#151515",
+    ["bg"] = "#b7c7ff",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#68759f",
+    ["bg"] = "#efefef",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#68759f",
+    ["bg"] = "#b3b3b3",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#202020",
+    ["bg"] = "#ffffff",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#68759f",
+    ["bg"] = "#dbdbdb",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#68759f",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#202020",
+    ["bg"] = "#dfa0f3",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#68759f",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#202020",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#3740cf",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#bfc4da",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#bfc4da",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#005000",
+    ["bg"] = "#d0f0d0",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#8f1313",
+    ["bg"] = "#ffd8d5",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#f4e8bd",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#f4e8bd",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#68759f",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#e00033",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#b6532f",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#217a3c",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#506fa0",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#b6532f",
+  },
+  ["Question"] = {
+    ["fg"] = "#3740cf",
+  },
+  ["Comment"] = {
+    ["fg"] = "#a65f6a",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["Character"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#3740cf",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["Label"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["Exception"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["Structure"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["Constant"] = {
+    ["fg"] = "#202020",
+  },
+  ["Function"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#d51272",
+  },
+  ["Include"] = {
+    ["fg"] = "#d51272",
+  },
+  ["Define"] = {
+    ["fg"] = "#d51272",
+  },
+  ["Macro"] = {
+    ["fg"] = "#d51272",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#d51272",
+  },
+  ["Todo"] = {
+    ["fg"] = "#ba35af",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#1f77bb",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#3f6faf",
+  },
+  ["Number"] = {
+    ["fg"] = "#4f54aa",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#202020",
+  },
+  ["Tag"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#202020",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#506fa0",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#397a70",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#202020",
+    ["bg"] = "#ff8f88",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#9d2b32",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#7c4c21",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#30369a",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#1f578f",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#215f34",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#68759f",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#9d2b32",
+    ["bg"] = "#f3c5c8",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#7c4c21",
+    ["bg"] = "#e6d2c1",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#30369a",
+    ["bg"] = "#c7caf2",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#1f578f",
+    ["bg"] = "#c0d7ed",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#215f34",
+    ["bg"] = "#c1dac8",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#9d2b32",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#7c4c21",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#30369a",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#1f578f",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#215f34",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#9d2b32",
+    ["bg"] = "#efefef",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#7c4c21",
+    ["bg"] = "#efefef",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#30369a",
+    ["bg"] = "#efefef",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#1f578f",
+    ["bg"] = "#efefef",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#215f34",
+    ["bg"] = "#efefef",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#9d2b32",
+    ["bg"] = "#f3c5c8",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#7c4c21",
+    ["bg"] = "#e6d2c1",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#30369a",
+    ["bg"] = "#c7caf2",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#1f578f",
+    ["bg"] = "#c0d7ed",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#215f34",
+    ["bg"] = "#c1dac8",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#f9e2e3",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#f2e9e0",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#e3e4f8",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#e0ebf6",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#e0ece4",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#005000",
+    ["bg"] = "#d0f0d0",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#f4e8bd",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#8f1313",
+    ["bg"] = "#ffd8d5",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#cbcfff",
+    ["fg"] = "#202020",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#cbcfff",
+    ["fg"] = "#202020",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#cbcfff",
+    ["fg"] = "#202020",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#bfc4da",
+    ["bg"] = "#ffffff",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#68759f",
+    ["bg"] = "#ffffff",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#202020",
+    ["bg"] = "#bfefff",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#202020",
+    ["bg"] = "#bfefff",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#4250ef",
+    ["bg"] = "#efefef",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#4250ef",
+    ["bg"] = "#efefef",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#397a70",
+    ["bg"] = "#ffffff",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#397a70",
+    ["bg"] = "#ffffff",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#68759f",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#3740cf",
+    ["bg"] = "#ffffff",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#3740cf",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#68759f",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#202020",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#202020",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#d51272",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#397a70",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["@variable"] = {
+    ["fg"] = "#202020",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#6052cf",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#202020",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#202020",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#d51272",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#3740cf",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#202020",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#d51272",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#1f77bb",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#3740cf",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#3740cf",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#3740cf",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#3740cf",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#b6532f",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#e00033",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#efefef",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#68759f",
+    ["bg"] = "#efefef",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#202020",
+    ["bg"] = "#dbdbdb",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#202020",
+    ["bg"] = "#dbdbdb",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#3740cf",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#3740cf",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#ba35af",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#cf25aa",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#68759f",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#005000",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#553d00",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#8f1313",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#bfc4da",
+    ["bg"] = "#dbdbdb",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#d3303a",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#a45f22",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#d3303a",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#202020",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#d3303a",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#3740cf",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#397a70",
+    ["bg"] = "#ffffff",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#d3303a",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#68759f",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#202020",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#68759f",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#4250ef",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#3740cf",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#68759f",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#202020",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#3740cf",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#3740cf",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#202020",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#397a70",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#a45f22",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#202020",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#a45f22",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#202020",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#3740cf",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#a45f22",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#202020",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#ba35af",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#202020",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#1f6fbf",
+  },
+}
@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_maris_dark (Ef Maris family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#eaedef",
+    ["bg"] = "#131c2b",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#eaedef",
+    ["bg"] = "#4a5664",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#90a0dc",
+    ["bg"] = "#131c2b",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#90a0dc",
+    ["bg"] = "#131c2b",
+  },
+  ["Folded"] = {
+    ["fg"] = "#a9c99f",
+    ["bg"] = "#1d2c39",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#eaedef",
+    ["bg"] = "#1d2c39",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#969faf",
+    ["bg"] = "#1d2c39",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#969faf",
+    ["bg"] = "#1d2c39",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#eaedef",
+    ["bg"] = "#4a5664",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#969faf",
+    ["bg"] = "#1d2c39",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#243242",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#243242",
+  },
+  ["NonText"] = {
+    ["fg"] = "#969faf",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#1d2c39",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#969faf",
+    ["bg"] = "#1a2331",
+  },
+  ["Search"] = {
+    ["fg"] = "#eaedef",
+    ["bg"] = "#107840",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#eaedef",
+    ["bg"] = "#847020",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#eaedef",
+    ["bg"] = "#bd1f30",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#eaedef",
+    ["bg"] = "#183c65",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#eaedef",
+    ["bg"] = "#4a5664",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#4a5664",
+    ["bg"] = "#eaedef",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#eaedef",
+    ["bg"] = "#1d2c39",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#131c2b",
+    ["bg"] = "#eaedef",
+  },
+  ["Directory"] = {
+    ["fg"] = "#57b0ff",
+  },
+  ["Title"] = {
+    ["fg"] = "#90a0dc",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#eaedef",
+    ["bg"] = "#183c65",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#eaedef",
+    ["bg"] = "#183c65",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#969faf",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#ecf0ff",
+    ["bg"] = "#2f527b",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#969faf",
+    ["bg"] = "#1d2c39",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#969faf",
+    ["bg"] = "#4a5664",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#eaedef",
+    ["bg"] = "#131c2b",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#969faf",
+    ["bg"] = "#2a3644",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#969faf",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#eaedef",
+    ["bg"] = "#6c5d54",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#969faf",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#eaedef",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#57b0ff",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#595a63",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#595a63",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#a0e0a0",
+    ["bg"] = "#20493f",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#ffbfbf",
+    ["bg"] = "#5e242f",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#dada90",
+    ["bg"] = "#51512f",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#dada90",
+    ["bg"] = "#51512f",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#969faf",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#ff7a5f",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#f0c060",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#30c489",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#99bfcf",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#f0c060",
+  },
+  ["Question"] = {
+    ["fg"] = "#57b0ff",
+  },
+  ["Comment"] = {
+    ["fg"] = "#eaa4a4",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#70a0ff",
+  },
+  ["Character"] = {
+    ["fg"] = "#70a0ff",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#57b0ff",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#cf90ff",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#cf90ff",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#cf90ff",
+  },
+  ["Label"] = {
+    ["fg"] = "#2fd0db",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#cf90ff",
+  },
+  ["Exception"] = {
+    ["fg"] = "#cf90ff",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#cf90ff",
+  },
+  ["Structure"] = {
+    ["fg"] = "#cf90ff",
+  },
+  ["Constant"] = {
+    ["fg"] = "#eaedef",
+  },
+  ["Function"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#2fd0db",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#ff7788",
+  },
+  ["Include"] = {
+    ["fg"] = "#ff7788",
+  },
+  ["Define"] = {
+    ["fg"] = "#ff7788",
+  },
+  ["Macro"] = {
+    ["fg"] = "#ff7788",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#ff7788",
+  },
+  ["Todo"] = {
+    ["fg"] = "#f59acf",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#65d5a8",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#7fcfdf",
+  },
+  ["Number"] = {
+    ["fg"] = "#9acfff",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#eaedef",
+  },
+  ["Tag"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#eaedef",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#99bfcf",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#90a0dc",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#eaedef",
+    ["bg"] = "#bd1f30",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#f99595",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#d8da7f",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#83c2fa",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#67d9e1",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#74cd7f",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#969faf",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#f99595",
+    ["bg"] = "#55333e",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#d8da7f",
+    ["bg"] = "#484f35",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#83c2fa",
+    ["bg"] = "#264566",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#67d9e1",
+    ["bg"] = "#1b4e5c",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#74cd7f",
+    ["bg"] = "#204a35",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#f99595",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#d8da7f",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#83c2fa",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#67d9e1",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#74cd7f",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#f99595",
+    ["bg"] = "#1d2c39",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#d8da7f",
+    ["bg"] = "#1d2c39",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#83c2fa",
+    ["bg"] = "#1d2c39",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#67d9e1",
+    ["bg"] = "#1d2c39",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#74cd7f",
+    ["bg"] = "#1d2c39",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#f99595",
+    ["bg"] = "#55333e",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#d8da7f",
+    ["bg"] = "#484f35",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#83c2fa",
+    ["bg"] = "#264566",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#67d9e1",
+    ["bg"] = "#1b4e5c",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#74cd7f",
+    ["bg"] = "#204a35",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#342835",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#2d3530",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#1d3149",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#173544",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#193330",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#a0e0a0",
+    ["bg"] = "#20493f",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#dada90",
+    ["bg"] = "#51512f",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#ffbfbf",
+    ["bg"] = "#5e242f",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#2f5f9f",
+    ["fg"] = "#eaedef",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#2f5f9f",
+    ["fg"] = "#eaedef",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#2f5f9f",
+    ["fg"] = "#eaedef",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#595a63",
+    ["bg"] = "#131c2b",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#969faf",
+    ["bg"] = "#131c2b",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#eaedef",
+    ["bg"] = "#183c65",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#eaedef",
+    ["bg"] = "#183c65",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#70a0ff",
+    ["bg"] = "#1d2c39",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#70a0ff",
+    ["bg"] = "#1d2c39",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#90a0dc",
+    ["bg"] = "#131c2b",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#90a0dc",
+    ["bg"] = "#131c2b",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#969faf",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#57b0ff",
+    ["bg"] = "#131c2b",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#57b0ff",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#969faf",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#eaedef",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#eaedef",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#ff7788",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#90a0dc",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["@variable"] = {
+    ["fg"] = "#eaedef",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#cf90ff",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#eaedef",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#2fd0db",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#eaedef",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#70a0ff",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#ff7788",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#57b0ff",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#eaedef",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#ff7788",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#65d5a8",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#70a0ff",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#2fd0db",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#70a0ff",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#57b0ff",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#57b0ff",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#57b0ff",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#41bf4f",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#57b0ff",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#f0c060",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#ff7a5f",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#1d2c39",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#969faf",
+    ["bg"] = "#1d2c39",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#eaedef",
+    ["bg"] = "#2a3644",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#eaedef",
+    ["bg"] = "#2a3644",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#57b0ff",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#57b0ff",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#f59acf",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#2fd0db",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#41bf4f",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#fa90ea",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#969faf",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#a0e0a0",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#dada90",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#ffbfbf",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#595a63",
+    ["bg"] = "#2a3644",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#ff6f6f",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#d0d24f",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#ff6f6f",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#41bf4f",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#2fd0db",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#2fd0db",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#eaedef",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#41bf4f",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#ff6f6f",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#57b0ff",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#70a0ff",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#90a0dc",
+    ["bg"] = "#131c2b",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#41bf4f",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#ff6f6f",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#969faf",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#eaedef",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#969faf",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#70a0ff",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#57b0ff",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#969faf",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#eaedef",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#57b0ff",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#57b0ff",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#2fd0db",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#eaedef",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#2fd0db",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#2fd0db",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#90a0dc",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#2fd0db",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#d0d24f",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#eaedef",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#d0d24f",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#41bf4f",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#eaedef",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#57b0ff",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#d0d24f",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#eaedef",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#2fd0db",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#f59acf",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#eaedef",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#2fd0db",
+  },
+}
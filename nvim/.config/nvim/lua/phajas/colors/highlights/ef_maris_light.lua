@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_maris_light (Ef Maris family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#151a27",
+    ["bg"] = "#edf4f8",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#151a27",
+    ["bg"] = "#afb8c3",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#3f4f99",
+    ["bg"] = "#edf4f8",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#3f4f99",
+    ["bg"] = "#edf4f8",
+  },
+  ["Folded"] = {
+    ["fg"] = "#4a763f",
+    ["bg"] = "#e0e7ef",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#151a27",
+    ["bg"] = "#e0e7ef",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#676470",
+    ["bg"] = "#e0e7ef",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#676470",
+    ["bg"] = "#e0e7ef",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#151a27",
+    ["bg"] = "#afb8c3",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#676470",
+    ["bg"] = "#e0e7ef",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#dae5f0",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#dae5f0",
+  },
+  ["NonText"] = {
+    ["fg"] = "#676470",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#e0e7ef",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#676470",
+    ["bg"] = "#e6ecf2",
+  },
+  ["Search"] = {
+    ["fg"] = "#151a27",
+    ["bg"] = "#96df80",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#151a27",
+    ["bg"] = "#efbf00",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#151a27",
+    ["bg"] = "#ff8f88",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#151a27",
+    ["bg"] = "#c8dcff",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#151a27",
+    ["bg"] = "#afb8c3",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#afb8c3",
+    ["bg"] = "#151a27",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#151a27",
+    ["bg"] = "#e0e7ef",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#edf4f8",
+    ["bg"] = "#151a27",
+  },
+  ["Directory"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["Title"] = {
+    ["fg"] = "#3f4f99",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#151a27",
+    ["bg"] = "#c8dcff",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#151a27",
+    ["bg"] = "#c8dcff",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#676470",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#142810",
+    ["bg"] = "#a0c2ef",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#676470",
+    ["bg"] = "#e0e7ef",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#676470",
+    ["bg"] = "#afb8c3",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#151a27",
+    ["bg"] = "#edf4f8",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#676470",
+    ["bg"] = "#cfd8e3",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#676470",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#151a27",
+    ["bg"] = "#cab3b2",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#676470",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#151a27",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#a2a6af",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#a2a6af",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#005000",
+    ["bg"] = "#b0e8ca",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#8f1313",
+    ["bg"] = "#f5c7d6",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#f5e8b0",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#f5e8b0",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#676470",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#d00000",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#8b4400",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#007047",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#3f627f",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#8b4400",
+  },
+  ["Question"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["Comment"] = {
+    ["fg"] = "#8b4052",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#444fcf",
+  },
+  ["Character"] = {
+    ["fg"] = "#444fcf",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#375cc6",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#5f2fba",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#5f2fba",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#5f2fba",
+  },
+  ["Label"] = {
+    ["fg"] = "#1f66af",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#5f2fba",
+  },
+  ["Exception"] = {
+    ["fg"] = "#5f2fba",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#5f2fba",
+  },
+  ["Structure"] = {
+    ["fg"] = "#5f2fba",
+  },
+  ["Constant"] = {
+    ["fg"] = "#151a27",
+  },
+  ["Function"] = {
+    ["fg"] = "#80308f",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#1f66af",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#b02440",
+  },
+  ["Include"] = {
+    ["fg"] = "#b02440",
+  },
+  ["Define"] = {
+    ["fg"] = "#b02440",
+  },
+  ["Macro"] = {
+    ["fg"] = "#b02440",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#b02440",
+  },
+  ["Todo"] = {
+    ["fg"] = "#80308f",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#006f70",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#305675",
+  },
+  ["Number"] = {
+    ["fg"] = "#3a5099",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#151a27",
+  },
+  ["Tag"] = {
+    ["fg"] = "#80308f",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#151a27",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#3f627f",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#3f4f99",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#151a27",
+    ["bg"] = "#ff8f88",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#8f2934",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#604721",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#2d4896",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#1c4f86",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#065617",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#676470",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#8f2934",
+    ["bg"] = "#e1bdc3",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#604721",
+    ["bg"] = "#cec9bb",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#2d4896",
+    ["bg"] = "#bac9ea",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#1c4f86",
+    ["bg"] = "#b3cce4",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#065617",
+    ["bg"] = "#abcfb7",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#8f2934",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#604721",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#2d4896",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#1c4f86",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#065617",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#8f2934",
+    ["bg"] = "#e0e7ef",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#604721",
+    ["bg"] = "#e0e7ef",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#2d4896",
+    ["bg"] = "#e0e7ef",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#1c4f86",
+    ["bg"] = "#e0e7ef",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#065617",
+    ["bg"] = "#e0e7ef",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#8f2934",
+    ["bg"] = "#e1bdc3",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#604721",
+    ["bg"] = "#cec9bb",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#2d4896",
+    ["bg"] = "#bac9ea",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#1c4f86",
+    ["bg"] = "#b3cce4",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#065617",
+    ["bg"] = "#abcfb7",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#e7d9dd",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#dededa",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#d4dff1",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#d0e0ee",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#cce2d8",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#005000",
+    ["bg"] = "#b0e8ca",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#f5e8b0",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#8f1313",
+    ["bg"] = "#f5c7d6",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#cfceff",
+    ["fg"] = "#151a27",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#cfceff",
+    ["fg"] = "#151a27",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#cfceff",
+    ["fg"] = "#151a27",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#a2a6af",
+    ["bg"] = "#edf4f8",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#676470",
+    ["bg"] = "#edf4f8",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#151a27",
+    ["bg"] = "#c8dcff",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#151a27",
+    ["bg"] = "#c8dcff",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#444fcf",
+    ["bg"] = "#e0e7ef",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#444fcf",
+    ["bg"] = "#e0e7ef",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#3f4f99",
+    ["bg"] = "#edf4f8",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#3f4f99",
+    ["bg"] = "#edf4f8",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#676470",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#375cc6",
+    ["bg"] = "#edf4f8",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#375cc6",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#676470",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#151a27",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#151a27",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#80308f",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#b02440",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#3f4f99",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#80308f",
+  },
+  ["@variable"] = {
+    ["fg"] = "#151a27",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#5f2fba",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#151a27",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#1f66af",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#151a27",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#444fcf",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#b02440",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#151a27",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#b02440",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#006f70",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#444fcf",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#1f66af",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#444fcf",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#80308f",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#375cc6",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#375cc6",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#80308f",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#007010",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#375cc6",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#8b4400",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#d00000",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#e0e7ef",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#676470",
+    ["bg"] = "#e0e7ef",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#151a27",
+    ["bg"] = "#cfd8e3",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#151a27",
+    ["bg"] = "#cfd8e3",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#80308f",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#1f66af",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#007010",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#9a3a6a",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#676470",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#005000",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#553d00",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#8f1313",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#a2a6af",
+    ["bg"] = "#cfd8e3",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#c3303a",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#805a1f",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#c3303a",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#007010",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#1f66af",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#1f66af",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#80308f",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#151a27",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#007010",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#c3303a",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#444fcf",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#3f4f99",
+    ["bg"] = "#edf4f8",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#007010",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#c3303a",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#676470",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#151a27",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#676470",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#444fcf",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#375cc6",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#676470",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#151a27",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#80308f",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#1f66af",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#151a27",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#1f66af",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#1f66af",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#3f4f99",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#1f66af",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#805a1f",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#151a27",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#805a1f",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#80308f",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#007010",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#80308f",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#151a27",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#80308f",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#805a1f",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#151a27",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#1f66af",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#80308f",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#151a27",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#1f66af",
+  },
+}
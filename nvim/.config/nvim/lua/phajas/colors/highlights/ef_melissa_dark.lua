@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_melissa_dark (Ef Melissa family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#e8e4b1",
+    ["bg"] = "#352718",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#e8e4b1",
+    ["bg"] = "#79665f",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#ccaa70",
+    ["bg"] = "#352718",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#ccaa70",
+    ["bg"] = "#352718",
+  },
+  ["Folded"] = {
+    ["fg"] = "#a0d26f",
+    ["bg"] = "#483426",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#e8e4b1",
+    ["bg"] = "#483426",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#90918a",
+    ["bg"] = "#483426",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#90918a",
+    ["bg"] = "#483426",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#e8e4b1",
+    ["bg"] = "#79665f",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#90918a",
+    ["bg"] = "#483426",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#4f311f",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#4f311f",
+  },
+  ["NonText"] = {
+    ["fg"] = "#90918a",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#483426",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#90918a",
+    ["bg"] = "#3d2e1f",
+  },
+  ["Search"] = {
+    ["fg"] = "#e8e4b1",
+    ["bg"] = "#4a7100",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#e8e4b1",
+    ["bg"] = "#8f5040",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#e8e4b1",
+    ["bg"] = "#b02930",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#e8e4b1",
+    ["bg"] = "#443a4f",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#e8e4b1",
+    ["bg"] = "#79665f",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#79665f",
+    ["bg"] = "#e8e4b1",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#e8e4b1",
+    ["bg"] = "#483426",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#352718",
+    ["bg"] = "#e8e4b1",
+  },
+  ["Directory"] = {
+    ["fg"] = "#57aff6",
+  },
+  ["Title"] = {
+    ["fg"] = "#ccaa70",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#e8e4b1",
+    ["bg"] = "#443a4f",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#e8e4b1",
+    ["bg"] = "#443a4f",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#90918a",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#f8efd8",
+    ["bg"] = "#704f00",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#90918a",
+    ["bg"] = "#483426",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#90918a",
+    ["bg"] = "#483426",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#e8e4b1",
+    ["bg"] = "#352718",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#90918a",
+    ["bg"] = "#59463f",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#90918a",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#e8e4b1",
+    ["bg"] = "#5f6f1f",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#90918a",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#e8e4b1",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#57aff6",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#6f5f58",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#6f5f58",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#a0e0a0",
+    ["bg"] = "#2f491f",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#ffbfbf",
+    ["bg"] = "#622a1f",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#dada90",
+    ["bg"] = "#544a0f",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#dada90",
+    ["bg"] = "#544a0f",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#90918a",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#ff7f4f",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#ffa21f",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#6fd560",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#99bfcf",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#ffa21f",
+  },
+  ["Question"] = {
+    ["fg"] = "#57aff6",
+  },
+  ["Comment"] = {
+    ["fg"] = "#eab780",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#98bfff",
+  },
+  ["Character"] = {
+    ["fg"] = "#98bfff",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#57aff6",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#c6a2fe",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#c6a2fe",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#c6a2fe",
+  },
+  ["Label"] = {
+    ["fg"] = "#6fcad0",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#c6a2fe",
+  },
+  ["Exception"] = {
+    ["fg"] = "#c6a2fe",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#c6a2fe",
+  },
+  ["Structure"] = {
+    ["fg"] = "#c6a2fe",
+  },
+  ["Constant"] = {
+    ["fg"] = "#e8e4b1",
+  },
+  ["Function"] = {
+    ["fg"] = "#f0aac5",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#6fcad0",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#ff8f98",
+  },
+  ["Include"] = {
+    ["fg"] = "#ff8f98",
+  },
+  ["Define"] = {
+    ["fg"] = "#ff8f98",
+  },
+  ["Macro"] = {
+    ["fg"] = "#ff8f98",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#ff8f98",
+  },
+  ["Todo"] = {
+    ["fg"] = "#f0aac5",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#70e0cf",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#7fc5df",
+  },
+  ["Number"] = {
+    ["fg"] = "#6ab4ef",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#e8e4b1",
+  },
+  ["Tag"] = {
+    ["fg"] = "#f0aac5",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#e8e4b1",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#99bfcf",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#ccaa70",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#e8e4b1",
+    ["bg"] = "#b02930",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#f89d8e",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#e5c361",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#83bfe1",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#93d2c7",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#93da78",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#90918a",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#f89d8e",
+    ["bg"] = "#6e4035",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#e5c361",
+    ["bg"] = "#664f23",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#83bfe1",
+    ["bg"] = "#3f4d56",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#93d2c7",
+    ["bg"] = "#45554c",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#93da78",
+    ["bg"] = "#45582c",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#f89d8e",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#e5c361",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#83bfe1",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#93d2c7",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#93da78",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#f89d8e",
+    ["bg"] = "#483426",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#e5c361",
+    ["bg"] = "#483426",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#83bfe1",
+    ["bg"] = "#483426",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#93d2c7",
+    ["bg"] = "#483426",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#93da78",
+    ["bg"] = "#483426",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#f89d8e",
+    ["bg"] = "#6e4035",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#e5c361",
+    ["bg"] = "#664f23",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#83bfe1",
+    ["bg"] = "#3f4d56",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#93d2c7",
+    ["bg"] = "#45554c",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#93da78",
+    ["bg"] = "#45582c",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#513326",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#4e3b1d",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#3a3a37",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#3d3e32",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#3d3f22",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#a0e0a0",
+    ["bg"] = "#2f491f",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#dada90",
+    ["bg"] = "#544a0f",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#ffbfbf",
+    ["bg"] = "#622a1f",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#4648d0",
+    ["fg"] = "#e8e4b1",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#4648d0",
+    ["fg"] = "#e8e4b1",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#4648d0",
+    ["fg"] = "#e8e4b1",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#6f5f58",
+    ["bg"] = "#352718",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#90918a",
+    ["bg"] = "#352718",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#e8e4b1",
+    ["bg"] = "#443a4f",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#e8e4b1",
+    ["bg"] = "#443a4f",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#98bfff",
+    ["bg"] = "#483426",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#98bfff",
+    ["bg"] = "#483426",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#ccaa70",
+    ["bg"] = "#352718",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#ccaa70",
+    ["bg"] = "#352718",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#90918a",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#57aff6",
+    ["bg"] = "#352718",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#57aff6",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#90918a",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#e8e4b1",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#e8e4b1",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#f0aac5",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#ff8f98",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#ccaa70",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#f0aac5",
+  },
+  ["@variable"] = {
+    ["fg"] = "#e8e4b1",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#c6a2fe",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#e8e4b1",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#6fcad0",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#e8e4b1",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#98bfff",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#ff8f98",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#57aff6",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#e8e4b1",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#ff8f98",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#70e0cf",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#98bfff",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#6fcad0",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#98bfff",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#f0aac5",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#57aff6",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#57aff6",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#57aff6",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#f0aac5",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#6fd560",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#57aff6",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#ffa21f",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#ff7f4f",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#483426",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#90918a",
+    ["bg"] = "#483426",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#e8e4b1",
+    ["bg"] = "#59463f",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#e8e4b1",
+    ["bg"] = "#59463f",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#57aff6",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#57aff6",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#f0aac5",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#6fcad0",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#6fd560",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#fa90aa",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#90918a",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#a0e0a0",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#dada90",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#ffbfbf",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#6f5f58",
+    ["bg"] = "#59463f",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#ff7f7f",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#e4b53f",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#ff7f7f",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#6fd560",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#6fcad0",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#6fcad0",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#f0aac5",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#e8e4b1",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#6fd560",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#ff7f7f",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#57aff6",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#98bfff",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#ccaa70",
+    ["bg"] = "#352718",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#6fd560",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#ff7f7f",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#90918a",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#e8e4b1",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#90918a",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#98bfff",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#57aff6",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#90918a",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#e8e4b1",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#57aff6",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#57aff6",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#f0aac5",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#6fcad0",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#e8e4b1",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#6fcad0",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#6fcad0",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#ccaa70",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#6fcad0",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#e4b53f",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#e8e4b1",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#e4b53f",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#f0aac5",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#6fd560",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#f0aac5",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#e8e4b1",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#f0aac5",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#57aff6",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#e4b53f",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#e8e4b1",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#6fcad0",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#f0aac5",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#e8e4b1",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#6fcad0",
+  },
+}
@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_melissa_light (Ef Melissa family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#484431",
+    ["bg"] = "#fff6d8",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#484431",
+    ["bg"] = "#c7b7a6",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#80431a",
+    ["bg"] = "#fff6d8",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#80431a",
+    ["bg"] = "#fff6d8",
+  },
+  ["Folded"] = {
+    ["fg"] = "#61756c",
+    ["bg"] = "#f5e9cb",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#484431",
+    ["bg"] = "#f5e9cb",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#68708a",
+    ["bg"] = "#f5e9cb",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#68708a",
+    ["bg"] = "#f5e9cb",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#484431",
+    ["bg"] = "#c7b7a6",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#68708a",
+    ["bg"] = "#f5e9cb",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#fae7b0",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#fae7b0",
+  },
+  ["NonText"] = {
+    ["fg"] = "#68708a",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#f5e9cb",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#68708a",
+    ["bg"] = "#f9efd4",
+  },
+  ["Search"] = {
+    ["fg"] = "#484431",
+    ["bg"] = "#96df80",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#484431",
+    ["bg"] = "#efbf00",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#484431",
+    ["bg"] = "#ff8f88",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#484431",
+    ["bg"] = "#f0d4d8",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#484431",
+    ["bg"] = "#c7b7a6",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#c7b7a6",
+    ["bg"] = "#484431",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#484431",
+    ["bg"] = "#f5e9cb",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#fff6d8",
+    ["bg"] = "#484431",
+  },
+  ["Directory"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["Title"] = {
+    ["fg"] = "#80431a",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#484431",
+    ["bg"] = "#f0d4d8",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#484431",
+    ["bg"] = "#f0d4d8",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#68708a",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#403328",
+    ["bg"] = "#f3cf72",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#68708a",
+    ["bg"] = "#f5e9cb",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#68708a",
+    ["bg"] = "#f5e9cb",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#484431",
+    ["bg"] = "#fff6d8",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#68708a",
+    ["bg"] = "#e7d7c6",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#68708a",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#484431",
+    ["bg"] = "#afcf8f",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#68708a",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#484431",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#c5baa6",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#c5baa6",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#005000",
+    ["bg"] = "#d7ecb0",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#8f1313",
+    ["bg"] = "#f8d0b6",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#f5e690",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#f5e690",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#68708a",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#c74400",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#ba5205",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#007a0a",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#4f6f8f",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#ba5205",
+  },
+  ["Question"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["Comment"] = {
+    ["fg"] = "#7f6f1a",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#5f5fdf",
+  },
+  ["Character"] = {
+    ["fg"] = "#5f5fdf",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#375cc6",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#6448ca",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#6448ca",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#6448ca",
+  },
+  ["Label"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#6448ca",
+  },
+  ["Exception"] = {
+    ["fg"] = "#6448ca",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#6448ca",
+  },
+  ["Structure"] = {
+    ["fg"] = "#6448ca",
+  },
+  ["Constant"] = {
+    ["fg"] = "#484431",
+  },
+  ["Function"] = {
+    ["fg"] = "#aa3e74",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#c02945",
+  },
+  ["Include"] = {
+    ["fg"] = "#c02945",
+  },
+  ["Define"] = {
+    ["fg"] = "#c02945",
+  },
+  ["Macro"] = {
+    ["fg"] = "#c02945",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#c02945",
+  },
+  ["Todo"] = {
+    ["fg"] = "#aa3e74",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#0f708a",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#4060a0",
+  },
+  ["Number"] = {
+    ["fg"] = "#4a659f",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#484431",
+  },
+  ["Tag"] = {
+    ["fg"] = "#aa3e74",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#484431",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#4f6f8f",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#80431a",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#484431",
+    ["bg"] = "#ff8f88",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#983430",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#875a1a",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#3c5599",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#425889",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#166a16",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#68708a",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#983430",
+    ["bg"] = "#ecbea9",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#875a1a",
+    ["bg"] = "#e5cda0",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#3c5599",
+    ["bg"] = "#c7cbd3",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#425889",
+    ["bg"] = "#c9cccd",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#166a16",
+    ["bg"] = "#b8d39e",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#983430",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#875a1a",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#3c5599",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#425889",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#166a16",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#983430",
+    ["bg"] = "#f5e9cb",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#875a1a",
+    ["bg"] = "#f5e9cb",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#3c5599",
+    ["bg"] = "#f5e9cb",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#425889",
+    ["bg"] = "#f5e9cb",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#166a16",
+    ["bg"] = "#f5e9cb",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#983430",
+    ["bg"] = "#ecbea9",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#875a1a",
+    ["bg"] = "#e5cda0",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#3c5599",
+    ["bg"] = "#c7cbd3",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#425889",
+    ["bg"] = "#c9cccd",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#166a16",
+    ["bg"] = "#b8d39e",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#f5dac0",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#f2e1bc",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#e3e0d5",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#e4e1d2",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#dbe5bb",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#005000",
+    ["bg"] = "#d7ecb0",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#f5e690",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#8f1313",
+    ["bg"] = "#f8d0b6",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#cfceff",
+    ["fg"] = "#484431",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#cfceff",
+    ["fg"] = "#484431",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#cfceff",
+    ["fg"] = "#484431",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#c5baa6",
+    ["bg"] = "#fff6d8",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#68708a",
+    ["bg"] = "#fff6d8",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#484431",
+    ["bg"] = "#f0d4d8",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#484431",
+    ["bg"] = "#f0d4d8",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#5f5fdf",
+    ["bg"] = "#f5e9cb",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#5f5fdf",
+    ["bg"] = "#f5e9cb",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#80431a",
+    ["bg"] = "#fff6d8",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#80431a",
+    ["bg"] = "#fff6d8",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#68708a",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#375cc6",
+    ["bg"] = "#fff6d8",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#375cc6",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#68708a",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#484431",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#484431",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#aa3e74",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#c02945",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#80431a",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#aa3e74",
+  },
+  ["@variable"] = {
+    ["fg"] = "#484431",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#6448ca",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#484431",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#484431",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#5f5fdf",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#c02945",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#484431",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#c02945",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#0f708a",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#5f5fdf",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#5f5fdf",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#aa3e74",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#375cc6",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#375cc6",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#aa3e74",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#007a0a",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#375cc6",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#ba5205",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#c74400",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#f5e9cb",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#68708a",
+    ["bg"] = "#f5e9cb",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#484431",
+    ["bg"] = "#e7d7c6",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#484431",
+    ["bg"] = "#e7d7c6",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#aa3e74",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#007a0a",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#b02f80",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#68708a",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#005000",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#553d00",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#8f1313",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#c5baa6",
+    ["bg"] = "#e7d7c6",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#ba2d2f",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#a26310",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#ba2d2f",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#007a0a",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#aa3e74",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#484431",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#007a0a",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#ba2d2f",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#5f5fdf",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#80431a",
+    ["bg"] = "#fff6d8",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#007a0a",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#ba2d2f",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#68708a",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#484431",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#68708a",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#5f5fdf",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#375cc6",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#68708a",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#484431",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#aa3e74",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#484431",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#80431a",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#a26310",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#484431",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#a26310",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#aa3e74",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#007a0a",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#aa3e74",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#484431",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#aa3e74",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#375cc6",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#a26310",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#484431",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#3f60af",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#aa3e74",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#484431",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#3f60af",
+  },
+}
@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_night (Ef Day/Night family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#afbcbf",
+    ["bg"] = "#000e17",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#afbcbf",
+    ["bg"] = "#444e59",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#b0a0a0",
+    ["bg"] = "#000e17",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#b0a0a0",
+    ["bg"] = "#000e17",
+  },
+  ["Folded"] = {
+    ["fg"] = "#61a06c",
+    ["bg"] = "#1a202b",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#afbcbf",
+    ["bg"] = "#1a202b",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#70819f",
+    ["bg"] = "#1a202b",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#70819f",
+    ["bg"] = "#1a202b",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#afbcbf",
+    ["bg"] = "#444e59",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#70819f",
+    ["bg"] = "#1a202b",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#002255",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#002255",
+  },
+  ["NonText"] = {
+    ["fg"] = "#70819f",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#1a202b",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#70819f",
+    ["bg"] = "#11141f",
+  },
+  ["Search"] = {
+    ["fg"] = "#afbcbf",
+    ["bg"] = "#107440",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#afbcbf",
+    ["bg"] = "#847020",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#afbcbf",
+    ["bg"] = "#bd1f30",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#afbcbf",
+    ["bg"] = "#253146",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#afbcbf",
+    ["bg"] = "#444e59",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#444e59",
+    ["bg"] = "#afbcbf",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#afbcbf",
+    ["bg"] = "#1a202b",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#000e17",
+    ["bg"] = "#afbcbf",
+  },
+  ["Directory"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["Title"] = {
+    ["fg"] = "#b0a0a0",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#afbcbf",
+    ["bg"] = "#253146",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#afbcbf",
+    ["bg"] = "#253146",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#70819f",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#ceeeff",
+    ["bg"] = "#003a7f",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#70819f",
+    ["bg"] = "#1a202b",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#70819f",
+    ["bg"] = "#444e59",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#afbcbf",
+    ["bg"] = "#000e17",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#70819f",
+    ["bg"] = "#242e39",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#70819f",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#afbcbf",
+    ["bg"] = "#664950",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#70819f",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#afbcbf",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#3a4a66",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#3a4a66",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#a0e0a0",
+    ["bg"] = "#00371f",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#ffbfbf",
+    ["bg"] = "#450f1f",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#efef80",
+    ["bg"] = "#363300",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#efef80",
+    ["bg"] = "#363300",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#70819f",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#f47360",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#e6832f",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#00a972",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#92b4df",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#e6832f",
+  },
+  ["Question"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["Comment"] = {
+    ["fg"] = "#cf9f7f",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#6a88ff",
+  },
+  ["Character"] = {
+    ["fg"] = "#6a88ff",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#379cf6",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#af8aff",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#af8aff",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#af8aff",
+  },
+  ["Label"] = {
+    ["fg"] = "#4fb0cf",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#af8aff",
+  },
+  ["Exception"] = {
+    ["fg"] = "#af8aff",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#af8aff",
+  },
+  ["Structure"] = {
+    ["fg"] = "#af8aff",
+  },
+  ["Constant"] = {
+    ["fg"] = "#afbcbf",
+  },
+  ["Function"] = {
+    ["fg"] = "#d570af",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#4fb0cf",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#ef798f",
+  },
+  ["Include"] = {
+    ["fg"] = "#ef798f",
+  },
+  ["Define"] = {
+    ["fg"] = "#ef798f",
+  },
+  ["Macro"] = {
+    ["fg"] = "#ef798f",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#ef798f",
+  },
+  ["Todo"] = {
+    ["fg"] = "#d570af",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#3dc0b0",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#6fafff",
+  },
+  ["Number"] = {
+    ["fg"] = "#7a94df",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#afbcbf",
+  },
+  ["Tag"] = {
+    ["fg"] = "#d570af",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#afbcbf",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#92b4df",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#b0a0a0",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#afbcbf",
+    ["bg"] = "#bd1f30",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#dc7f84",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#be963b",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#5ba6e6",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#6cb4ca",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#4aac54",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#70819f",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#dc7f84",
+    ["bg"] = "#43262e",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#be963b",
+    ["bg"] = "#372f11",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#5ba6e6",
+    ["bg"] = "#0f3655",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#6cb4ca",
+    ["bg"] = "#163b4b",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#4aac54",
+    ["bg"] = "#09381b",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#dc7f84",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#be963b",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#5ba6e6",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#6cb4ca",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#4aac54",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#dc7f84",
+    ["bg"] = "#1a202b",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#be963b",
+    ["bg"] = "#1a202b",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#5ba6e6",
+    ["bg"] = "#1a202b",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#6cb4ca",
+    ["bg"] = "#1a202b",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#4aac54",
+    ["bg"] = "#1a202b",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#dc7f84",
+    ["bg"] = "#43262e",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#be963b",
+    ["bg"] = "#372f11",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#5ba6e6",
+    ["bg"] = "#0f3655",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#6cb4ca",
+    ["bg"] = "#163b4b",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#4aac54",
+    ["bg"] = "#09381b",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#211a23",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#1b1f14",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#082236",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#0b2531",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#042319",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#a0e0a0",
+    ["bg"] = "#00371f",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#efef80",
+    ["bg"] = "#363300",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#ffbfbf",
+    ["bg"] = "#450f1f",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#2f5f9f",
+    ["fg"] = "#afbcbf",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#2f5f9f",
+    ["fg"] = "#afbcbf",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#2f5f9f",
+    ["fg"] = "#afbcbf",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#3a4a66",
+    ["bg"] = "#000e17",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#70819f",
+    ["bg"] = "#000e17",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#afbcbf",
+    ["bg"] = "#253146",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#afbcbf",
+    ["bg"] = "#253146",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#6a88ff",
+    ["bg"] = "#1a202b",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#6a88ff",
+    ["bg"] = "#1a202b",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#b0a0a0",
+    ["bg"] = "#000e17",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#b0a0a0",
+    ["bg"] = "#000e17",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#70819f",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#379cf6",
+    ["bg"] = "#000e17",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#379cf6",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#70819f",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#afbcbf",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#afbcbf",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#d570af",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#ef798f",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#b0a0a0",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#d570af",
+  },
+  ["@variable"] = {
+    ["fg"] = "#afbcbf",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#af8aff",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#afbcbf",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#4fb0cf",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#afbcbf",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#6a88ff",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#ef798f",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#afbcbf",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#ef798f",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#3dc0b0",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#6a88ff",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#4fb0cf",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#6a88ff",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#d570af",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#379cf6",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#379cf6",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#d570af",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#1fa526",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#379cf6",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#e6832f",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#f47360",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#1a202b",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#70819f",
+    ["bg"] = "#1a202b",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#afbcbf",
+    ["bg"] = "#242e39",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#afbcbf",
+    ["bg"] = "#242e39",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#d570af",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#4fb0cf",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#1fa526",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#e580ea",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#70819f",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#a0e0a0",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#efef80",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#ffbfbf",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#3a4a66",
+    ["bg"] = "#242e39",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#ef656a",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#c48502",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#ef656a",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#1fa526",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#4fb0cf",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#4fb0cf",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#d570af",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#afbcbf",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#1fa526",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#ef656a",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#6a88ff",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#b0a0a0",
+    ["bg"] = "#000e17",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#1fa526",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#ef656a",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#70819f",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#afbcbf",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#70819f",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#6a88ff",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#379cf6",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#70819f",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#afbcbf",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#d570af",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#4fb0cf",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#afbcbf",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#4fb0cf",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#4fb0cf",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#b0a0a0",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#4fb0cf",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#c48502",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#afbcbf",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#c48502",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#d570af",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#1fa526",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#d570af",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#afbcbf",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#d570af",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#c48502",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#afbcbf",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#4fb0cf",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#d570af",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#afbcbf",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#4fb0cf",
+  },
+}
@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_trio_dark (Ef Trio family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#d8cfd5",
+    ["bg"] = "#160f0f",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#d8cfd5",
+    ["bg"] = "#564f55",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#afdacf",
+    ["bg"] = "#160f0f",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#afdacf",
+    ["bg"] = "#160f0f",
+  },
+  ["Folded"] = {
+    ["fg"] = "#61a06c",
+    ["bg"] = "#2a2228",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#d8cfd5",
+    ["bg"] = "#2a2228",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#908890",
+    ["bg"] = "#2a2228",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#908890",
+    ["bg"] = "#2a2228",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#d8cfd5",
+    ["bg"] = "#564f55",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#908890",
+    ["bg"] = "#2a2228",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#34223f",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#34223f",
+  },
+  ["NonText"] = {
+    ["fg"] = "#908890",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#2a2228",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#908890",
+    ["bg"] = "#1c1719",
+  },
+  ["Search"] = {
+    ["fg"] = "#d8cfd5",
+    ["bg"] = "#2a7140",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#d8cfd5",
+    ["bg"] = "#8f5040",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#d8cfd5",
+    ["bg"] = "#b02930",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#d8cfd5",
+    ["bg"] = "#16304f",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#d8cfd5",
+    ["bg"] = "#564f55",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#564f55",
+    ["bg"] = "#d8cfd5",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#d8cfd5",
+    ["bg"] = "#2a2228",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#160f0f",
+    ["bg"] = "#d8cfd5",
+  },
+  ["Directory"] = {
+    ["fg"] = "#7fa5f6",
+  },
+  ["Title"] = {
+    ["fg"] = "#afdacf",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#d8cfd5",
+    ["bg"] = "#16304f",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#d8cfd5",
+    ["bg"] = "#16304f",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#908890",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#ffdfdf",
+    ["bg"] = "#6a294f",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#908890",
+    ["bg"] = "#2a2228",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#908890",
+    ["bg"] = "#564f55",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#d8cfd5",
+    ["bg"] = "#160f0f",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#908890",
+    ["bg"] = "#362f35",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#908890",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#d8cfd5",
+    ["bg"] = "#2f605e",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#908890",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#d8cfd5",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#7fa5f6",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#605760",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#605760",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#a0e0a0",
+    ["bg"] = "#00371f",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#ffbfbf",
+    ["bg"] = "#450f1f",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#efef80",
+    ["bg"] = "#363300",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#efef80",
+    ["bg"] = "#363300",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#908890",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#ff7560",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#d4a052",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#60b444",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#8ac0ef",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#d4a052",
+  },
+  ["Question"] = {
+    ["fg"] = "#7fa5f6",
+  },
+  ["Comment"] = {
+    ["fg"] = "#c7a07f",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#8895ff",
+  },
+  ["Character"] = {
+    ["fg"] = "#8895ff",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#7fa5f6",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#a698ef",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#a698ef",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#a698ef",
+  },
+  ["Label"] = {
+    ["fg"] = "#8fbaff",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#a698ef",
+  },
+  ["Exception"] = {
+    ["fg"] = "#a698ef",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#a698ef",
+  },
+  ["Structure"] = {
+    ["fg"] = "#a698ef",
+  },
+  ["Constant"] = {
+    ["fg"] = "#d8cfd5",
+  },
+  ["Function"] = {
+    ["fg"] = "#d37faf",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#8fbaff",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#ff85aa",
+  },
+  ["Include"] = {
+    ["fg"] = "#ff85aa",
+  },
+  ["Define"] = {
+    ["fg"] = "#ff85aa",
+  },
+  ["Macro"] = {
+    ["fg"] = "#ff85aa",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#ff85aa",
+  },
+  ["Todo"] = {
+    ["fg"] = "#d37faf",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#8fcfdf",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#9ac2ff",
+  },
+  ["Number"] = {
+    ["fg"] = "#7a94df",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#d8cfd5",
+  },
+  ["Tag"] = {
+    ["fg"] = "#d37faf",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#d8cfd5",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#8ac0ef",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#afdacf",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#d8cfd5",
+    ["bg"] = "#b02930",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#ec9a7e",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#d5ae79",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#9ab2ec",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#a5c0f2",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#84bc70",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#908890",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#ec9a7e",
+    ["bg"] = "#542f24",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#d5ae79",
+    ["bg"] = "#4b3822",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#9ab2ec",
+    ["bg"] = "#333950",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#a5c0f2",
+    ["bg"] = "#383f52",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#84bc70",
+    ["bg"] = "#2b3d1e",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#ec9a7e",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#d5ae79",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#9ab2ec",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#a5c0f2",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#84bc70",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#ec9a7e",
+    ["bg"] = "#2a2228",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#d5ae79",
+    ["bg"] = "#2a2228",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#9ab2ec",
+    ["bg"] = "#2a2228",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#a5c0f2",
+    ["bg"] = "#2a2228",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#84bc70",
+    ["bg"] = "#2a2228",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#ec9a7e",
+    ["bg"] = "#542f24",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#d5ae79",
+    ["bg"] = "#4b3822",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#9ab2ec",
+    ["bg"] = "#333950",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#a5c0f2",
+    ["bg"] = "#383f52",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#84bc70",
+    ["bg"] = "#2b3d1e",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#351f19",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#312318",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#25242f",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#272731",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#202616",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#a0e0a0",
+    ["bg"] = "#00371f",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#efef80",
+    ["bg"] = "#363300",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#ffbfbf",
+    ["bg"] = "#450f1f",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#4648d0",
+    ["fg"] = "#d8cfd5",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#4648d0",
+    ["fg"] = "#d8cfd5",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#4648d0",
+    ["fg"] = "#d8cfd5",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#605760",
+    ["bg"] = "#160f0f",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#908890",
+    ["bg"] = "#160f0f",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#d8cfd5",
+    ["bg"] = "#16304f",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#d8cfd5",
+    ["bg"] = "#16304f",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#8895ff",
+    ["bg"] = "#2a2228",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#8895ff",
+    ["bg"] = "#2a2228",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#afdacf",
+    ["bg"] = "#160f0f",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#afdacf",
+    ["bg"] = "#160f0f",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#908890",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#7fa5f6",
+    ["bg"] = "#160f0f",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#7fa5f6",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#908890",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#d8cfd5",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#d8cfd5",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#d37faf",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#ff85aa",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#afdacf",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#d37faf",
+  },
+  ["@variable"] = {
+    ["fg"] = "#d8cfd5",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#a698ef",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#d8cfd5",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#8fbaff",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#d8cfd5",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#8895ff",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#ff85aa",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#7fa5f6",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#d8cfd5",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#ff85aa",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#8fcfdf",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#8895ff",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#8fbaff",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#8895ff",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#d37faf",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#7fa5f6",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#7fa5f6",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#7fa5f6",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#d37faf",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#60b444",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#7fa5f6",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#d4a052",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#ff7560",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#2a2228",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#908890",
+    ["bg"] = "#2a2228",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#d8cfd5",
+    ["bg"] = "#362f35",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#d8cfd5",
+    ["bg"] = "#362f35",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#7fa5f6",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#7fa5f6",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#d37faf",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#8fbaff",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#60b444",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#e772df",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#908890",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#a0e0a0",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#efef80",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#ffbfbf",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#605760",
+    ["bg"] = "#362f35",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#f48359",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#d4a052",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#f48359",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#60b444",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#8fbaff",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#8fbaff",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#d37faf",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#d8cfd5",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#60b444",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#f48359",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#7fa5f6",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#8895ff",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#afdacf",
+    ["bg"] = "#160f0f",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#60b444",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#f48359",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#908890",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#d8cfd5",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#908890",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#8895ff",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#7fa5f6",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#908890",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#d8cfd5",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#7fa5f6",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#7fa5f6",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#d37faf",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#8fbaff",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#d8cfd5",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#8fbaff",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#8fbaff",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#afdacf",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#8fbaff",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#d4a052",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#d8cfd5",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#d4a052",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#d37faf",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#60b444",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#d37faf",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#d8cfd5",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#d37faf",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#7fa5f6",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#d4a052",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#d8cfd5",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#8fbaff",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#d37faf",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#d8cfd5",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#8fbaff",
+  },
+}
@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_trio_light (Ef Trio family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#4f3363",
+    ["bg"] = "#f8f5ff",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#4f3363",
+    ["bg"] = "#c3c0c9",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#3f7668",
+    ["bg"] = "#f8f5ff",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#3f7668",
+    ["bg"] = "#f8f5ff",
+  },
+  ["Folded"] = {
+    ["fg"] = "#41754c",
+    ["bg"] = "#ebe7f1",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#4f3363",
+    ["bg"] = "#ebe7f1",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#786e74",
+    ["bg"] = "#ebe7f1",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#786e74",
+    ["bg"] = "#ebe7f1",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#4f3363",
+    ["bg"] = "#c3c0c9",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#786e74",
+    ["bg"] = "#ebe7f1",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#cfe6ff",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#cfe6ff",
+  },
+  ["NonText"] = {
+    ["fg"] = "#786e74",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#ebe7f1",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#786e74",
+    ["bg"] = "#efeef7",
+  },
+  ["Search"] = {
+    ["fg"] = "#4f3363",
+    ["bg"] = "#7fdda0",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#4f3363",
+    ["bg"] = "#ffc200",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#4f3363",
+    ["bg"] = "#ff7f88",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#4f3363",
+    ["bg"] = "#eed0ff",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#4f3363",
+    ["bg"] = "#c3c0c9",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#c3c0c9",
+    ["bg"] = "#4f3363",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#4f3363",
+    ["bg"] = "#ebe7f1",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#f8f5ff",
+    ["bg"] = "#4f3363",
+  },
+  ["Directory"] = {
+    ["fg"] = "#375cd6",
+  },
+  ["Title"] = {
+    ["fg"] = "#3f7668",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#4f3363",
+    ["bg"] = "#eed0ff",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#4f3363",
+    ["bg"] = "#eed0ff",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#786e74",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#241f48",
+    ["bg"] = "#ddb4ff",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#786e74",
+    ["bg"] = "#ebe7f1",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#786e74",
+    ["bg"] = "#c3c0c9",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#4f3363",
+    ["bg"] = "#f8f5ff",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#786e74",
+    ["bg"] = "#e3e0e9",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#786e74",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#4f3363",
+    ["bg"] = "#dfadaf",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#786e74",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#4f3363",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#375cd6",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#c6bac5",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#c6bac5",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#005000",
+    ["bg"] = "#caf4da",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#8f1313",
+    ["bg"] = "#ffcee0",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#ffdfb9",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#ffdfb9",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#786e74",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#d03033",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#b8532f",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#057800",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#5f60bf",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#b8532f",
+  },
+  ["Question"] = {
+    ["fg"] = "#375cd6",
+  },
+  ["Comment"] = {
+    ["fg"] = "#a05b5f",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#5165e4",
+  },
+  ["Character"] = {
+    ["fg"] = "#5165e4",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#375cd6",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#705ae3",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#705ae3",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#705ae3",
+  },
+  ["Label"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#705ae3",
+  },
+  ["Exception"] = {
+    ["fg"] = "#705ae3",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#705ae3",
+  },
+  ["Structure"] = {
+    ["fg"] = "#705ae3",
+  },
+  ["Constant"] = {
+    ["fg"] = "#4f3363",
+  },
+  ["Function"] = {
+    ["fg"] = "#ad45ba",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#c01f5f",
+  },
+  ["Include"] = {
+    ["fg"] = "#c01f5f",
+  },
+  ["Define"] = {
+    ["fg"] = "#c01f5f",
+  },
+  ["Macro"] = {
+    ["fg"] = "#c01f5f",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#c01f5f",
+  },
+  ["Todo"] = {
+    ["fg"] = "#ad45ba",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#0f7a9d",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#3f6faf",
+  },
+  ["Number"] = {
+    ["fg"] = "#6060d0",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#4f3363",
+  },
+  ["Tag"] = {
+    ["fg"] = "#ad45ba",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#4f3363",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#5f60bf",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#3f7668",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#4f3363",
+    ["bg"] = "#ff7f88",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#a03146",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#8b5236",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#3e50b4",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#2d5da3",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#1b631e",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#786e74",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#a03146",
+    ["bg"] = "#e9bec8",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#8b5236",
+    ["bg"] = "#e0cbc1",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#3e50b4",
+    ["bg"] = "#c2caf4",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#2d5da3",
+    ["bg"] = "#bbcfed",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#1b631e",
+    ["bg"] = "#b4d2b8",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#a03146",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#8b5236",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#3e50b4",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#2d5da3",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#1b631e",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#a03146",
+    ["bg"] = "#ebe7f1",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#8b5236",
+    ["bg"] = "#ebe7f1",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#3e50b4",
+    ["bg"] = "#ebe7f1",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#2d5da3",
+    ["bg"] = "#ebe7f1",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#1b631e",
+    ["bg"] = "#ebe7f1",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#a03146",
+    ["bg"] = "#e9bec8",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#8b5236",
+    ["bg"] = "#e0cbc1",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#3e50b4",
+    ["bg"] = "#c2caf4",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#2d5da3",
+    ["bg"] = "#bbcfed",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#1b631e",
+    ["bg"] = "#b4d2b8",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#f1d9e3",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#ece0e0",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#dde0f9",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#dae2f6",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#d6e4db",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#005000",
+    ["bg"] = "#caf4da",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#ffdfb9",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#8f1313",
+    ["bg"] = "#ffcee0",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#cbcfff",
+    ["fg"] = "#4f3363",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#cbcfff",
+    ["fg"] = "#4f3363",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#cbcfff",
+    ["fg"] = "#4f3363",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#c6bac5",
+    ["bg"] = "#f8f5ff",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#786e74",
+    ["bg"] = "#f8f5ff",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#4f3363",
+    ["bg"] = "#eed0ff",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#4f3363",
+    ["bg"] = "#eed0ff",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#5165e4",
+    ["bg"] = "#ebe7f1",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#5165e4",
+    ["bg"] = "#ebe7f1",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#3f7668",
+    ["bg"] = "#f8f5ff",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#3f7668",
+    ["bg"] = "#f8f5ff",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#786e74",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#375cd6",
+    ["bg"] = "#f8f5ff",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#375cd6",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#786e74",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#4f3363",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#4f3363",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#ad45ba",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#c01f5f",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#3f7668",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#ad45ba",
+  },
+  ["@variable"] = {
+    ["fg"] = "#4f3363",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#705ae3",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#4f3363",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#4f3363",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#5165e4",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#c01f5f",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#375cd6",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#4f3363",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#c01f5f",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#0f7a9d",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#5165e4",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#5165e4",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#ad45ba",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#375cd6",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#375cd6",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#375cd6",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#ad45ba",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#057800",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#375cd6",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#b8532f",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#d03033",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#ebe7f1",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#786e74",
+    ["bg"] = "#ebe7f1",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#4f3363",
+    ["bg"] = "#e3e0e9",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#4f3363",
+    ["bg"] = "#e3e0e9",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#375cd6",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#375cd6",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#ad45ba",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#057800",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#c035aa",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#786e74",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#005000",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#553d00",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#8f1313",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#c6bac5",
+    ["bg"] = "#e3e0e9",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#c3303a",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#a45f22",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#c3303a",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#057800",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#ad45ba",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#4f3363",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#057800",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#c3303a",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#375cd6",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#5165e4",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#3f7668",
+    ["bg"] = "#f8f5ff",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#057800",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#c3303a",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#786e74",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#4f3363",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#786e74",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#5165e4",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#375cd6",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#786e74",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#4f3363",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#375cd6",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#375cd6",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#ad45ba",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#4f3363",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#3f7668",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#a45f22",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#4f3363",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#a45f22",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#ad45ba",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#057800",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#ad45ba",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#4f3363",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#ad45ba",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#375cd6",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#a45f22",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#4f3363",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#1f6fbf",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#ad45ba",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#4f3363",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#1f6fbf",
+  },
+}
@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_tritanopia_dark (Ef Tritanopia family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#dfd0d5",
+    ["bg"] = "#15050f",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#dfd0d5",
+    ["bg"] = "#554f4f",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#afdaef",
+    ["bg"] = "#15050f",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#afdaef",
+    ["bg"] = "#15050f",
+  },
+  ["Folded"] = {
+    ["fg"] = "#5f9f6f",
+    ["bg"] = "#282026",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#dfd0d5",
+    ["bg"] = "#282026",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#908890",
+    ["bg"] = "#282026",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#908890",
+    ["bg"] = "#282026",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#dfd0d5",
+    ["bg"] = "#554f4f",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#908890",
+    ["bg"] = "#282026",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#3f1515",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#3f1515",
+  },
+  ["NonText"] = {
+    ["fg"] = "#908890",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#282026",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#908890",
+    ["bg"] = "#1a1517",
+  },
+  ["Search"] = {
+    ["fg"] = "#dfd0d5",
+    ["bg"] = "#5f806f",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#dfd0d5",
+    ["bg"] = "#950f4f",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#dfd0d5",
+    ["bg"] = "#aa0010",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#dfd0d5",
+    ["bg"] = "#293140",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#dfd0d5",
+    ["bg"] = "#554f4f",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#554f4f",
+    ["bg"] = "#dfd0d5",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#dfd0d5",
+    ["bg"] = "#282026",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#15050f",
+    ["bg"] = "#dfd0d5",
+  },
+  ["Directory"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["Title"] = {
+    ["fg"] = "#afdaef",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#dfd0d5",
+    ["bg"] = "#293140",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#dfd0d5",
+    ["bg"] = "#293140",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#908890",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#ffffff",
+    ["bg"] = "#671822",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#908890",
+    ["bg"] = "#282026",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#908890",
+    ["bg"] = "#554f4f",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#dfd0d5",
+    ["bg"] = "#15050f",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#908890",
+    ["bg"] = "#352f2f",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#908890",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#dfd0d5",
+    ["bg"] = "#2f5f7a",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#908890",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#dfd0d5",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#555564",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#555564",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#cbdfff",
+    ["bg"] = "#002d3f",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#ffbfbf",
+    ["bg"] = "#4d091f",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#e3cfff",
+    ["bg"] = "#352354",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#e3cfff",
+    ["bg"] = "#352354",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#908890",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#df4f4f",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#c560aa",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#3fafcf",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#82a0af",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#c560aa",
+  },
+  ["Question"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["Comment"] = {
+    ["fg"] = "#b07f7f",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#6a88ff",
+  },
+  ["Character"] = {
+    ["fg"] = "#6a88ff",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#379cf6",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#a6699f",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#a6699f",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#a6699f",
+  },
+  ["Label"] = {
+    ["fg"] = "#3fafcf",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#a6699f",
+  },
+  ["Exception"] = {
+    ["fg"] = "#a6699f",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#a6699f",
+  },
+  ["Structure"] = {
+    ["fg"] = "#a6699f",
+  },
+  ["Constant"] = {
+    ["fg"] = "#dfd0d5",
+  },
+  ["Function"] = {
+    ["fg"] = "#b0648f",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#3fafcf",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#d24f7f",
+  },
+  ["Include"] = {
+    ["fg"] = "#d24f7f",
+  },
+  ["Define"] = {
+    ["fg"] = "#d24f7f",
+  },
+  ["Macro"] = {
+    ["fg"] = "#d24f7f",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#d24f7f",
+  },
+  ["Todo"] = {
+    ["fg"] = "#b0648f",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#4fafaf",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#3f9aaf",
+  },
+  ["Number"] = {
+    ["fg"] = "#6a84af",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#dfd0d5",
+  },
+  ["Tag"] = {
+    ["fg"] = "#b0648f",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#dfd0d5",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#82a0af",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#afdaef",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#dfd0d5",
+    ["bg"] = "#aa0010",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#d47682",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#cc9d41",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#69acec",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#6fb9d1",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#64b25b",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#908890",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#d47682",
+    ["bg"] = "#491a25",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#cc9d41",
+    ["bg"] = "#46290b",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#69acec",
+    ["bg"] = "#1f2f50",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#6fb9d1",
+    ["bg"] = "#213545",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#64b25b",
+    ["bg"] = "#1c3215",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#d47682",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#cc9d41",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#69acec",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#6fb9d1",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#64b25b",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#d47682",
+    ["bg"] = "#282026",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#cc9d41",
+    ["bg"] = "#282026",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#69acec",
+    ["bg"] = "#282026",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#6fb9d1",
+    ["bg"] = "#282026",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#64b25b",
+    ["bg"] = "#282026",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#d47682",
+    ["bg"] = "#491a25",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#cc9d41",
+    ["bg"] = "#46290b",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#69acec",
+    ["bg"] = "#1f2f50",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#6fb9d1",
+    ["bg"] = "#213545",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#64b25b",
+    ["bg"] = "#1c3215",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#2f0f1a",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#2e170d",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#1a1a2f",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#1b1d2a",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#191b12",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#cbdfff",
+    ["bg"] = "#002d3f",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#e3cfff",
+    ["bg"] = "#352354",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#ffbfbf",
+    ["bg"] = "#4d091f",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#165f70",
+    ["fg"] = "#dfd0d5",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#165f70",
+    ["fg"] = "#dfd0d5",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#165f70",
+    ["fg"] = "#dfd0d5",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#555564",
+    ["bg"] = "#15050f",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#908890",
+    ["bg"] = "#15050f",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#dfd0d5",
+    ["bg"] = "#293140",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#dfd0d5",
+    ["bg"] = "#293140",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#6a88ff",
+    ["bg"] = "#282026",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#6a88ff",
+    ["bg"] = "#282026",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#afdaef",
+    ["bg"] = "#15050f",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#afdaef",
+    ["bg"] = "#15050f",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#908890",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#379cf6",
+    ["bg"] = "#15050f",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#379cf6",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#908890",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#dfd0d5",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#dfd0d5",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#b0648f",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#d24f7f",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#afdaef",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#b0648f",
+  },
+  ["@variable"] = {
+    ["fg"] = "#dfd0d5",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#a6699f",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#dfd0d5",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#3fafcf",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#dfd0d5",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#6a88ff",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#d24f7f",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#dfd0d5",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#d24f7f",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#4fafaf",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#6a88ff",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#3fafcf",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#6a88ff",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#b0648f",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#379cf6",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#379cf6",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#b0648f",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#2fa526",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#379cf6",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#c560aa",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#df4f4f",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#282026",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#908890",
+    ["bg"] = "#282026",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#dfd0d5",
+    ["bg"] = "#352f2f",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#dfd0d5",
+    ["bg"] = "#352f2f",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#b0648f",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#3fafcf",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#2fa526",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#c560aa",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#908890",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#cbdfff",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#e3cfff",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#ffbfbf",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#555564",
+    ["bg"] = "#352f2f",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#cf4f5f",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#c48702",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#cf4f5f",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#2fa526",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#3fafcf",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#3fafcf",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#b0648f",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#dfd0d5",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#2fa526",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#cf4f5f",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#6a88ff",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#afdaef",
+    ["bg"] = "#15050f",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#2fa526",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#cf4f5f",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#908890",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#dfd0d5",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#908890",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#6a88ff",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#379cf6",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#908890",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#dfd0d5",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#b0648f",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#3fafcf",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#dfd0d5",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#3fafcf",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#3fafcf",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#afdaef",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#3fafcf",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#c48702",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#dfd0d5",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#c48702",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#b0648f",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#2fa526",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#b0648f",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#dfd0d5",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#b0648f",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#379cf6",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#c48702",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#dfd0d5",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#3fafcf",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#b0648f",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#dfd0d5",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#3fafcf",
+  },
+}
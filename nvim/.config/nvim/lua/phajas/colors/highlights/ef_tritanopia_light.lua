@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_tritanopia_light (Ef Tritanopia family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#1a1a1a",
+    ["bg"] = "#fff9f9",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#1a1a1a",
+    ["bg"] = "#bdb9b9",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#194f90",
+    ["bg"] = "#fff9f9",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#194f90",
+    ["bg"] = "#fff9f9",
+  },
+  ["Folded"] = {
+    ["fg"] = "#61756c",
+    ["bg"] = "#efecec",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#1a1a1a",
+    ["bg"] = "#efecec",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#756275",
+    ["bg"] = "#efecec",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#756275",
+    ["bg"] = "#efecec",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#1a1a1a",
+    ["bg"] = "#bdb9b9",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#756275",
+    ["bg"] = "#efecec",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#ffdadf",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#ffdadf",
+  },
+  ["NonText"] = {
+    ["fg"] = "#756275",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#efecec",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#756275",
+    ["bg"] = "#f7f2f2",
+  },
+  ["Search"] = {
+    ["fg"] = "#1a1a1a",
+    ["bg"] = "#8aefef",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#1a1a1a",
+    ["bg"] = "#ff7f78",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#1a1a1a",
+    ["bg"] = "#ffa2a0",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#1a1a1a",
+    ["bg"] = "#dadadf",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#1a1a1a",
+    ["bg"] = "#bdb9b9",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#bdb9b9",
+    ["bg"] = "#1a1a1a",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#1a1a1a",
+    ["bg"] = "#efecec",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#fff9f9",
+    ["bg"] = "#1a1a1a",
+  },
+  ["Directory"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["Title"] = {
+    ["fg"] = "#194f90",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#1a1a1a",
+    ["bg"] = "#dadadf",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#1a1a1a",
+    ["bg"] = "#dadadf",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#756275",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#1a0a0f",
+    ["bg"] = "#ff99aa",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#756275",
+    ["bg"] = "#efecec",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#756275",
+    ["bg"] = "#bdb9b9",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#1a1a1a",
+    ["bg"] = "#fff9f9",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#756275",
+    ["bg"] = "#ddd9d9",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#756275",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#1a1a1a",
+    ["bg"] = "#8fc0cf",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#756275",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#1a1a1a",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#adadad",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#adadad",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#004840",
+    ["bg"] = "#c9efea",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#8f1313",
+    ["bg"] = "#ffd6e0",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#333399",
+    ["bg"] = "#dbdbff",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#333399",
+    ["bg"] = "#dbdbff",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#756275",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#dd0000",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#aa357f",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#2070af",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#5f6a90",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#aa357f",
+  },
+  ["Question"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["Comment"] = {
+    ["fg"] = "#92454f",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["Character"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#375cd8",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#af40af",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#af40af",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#af40af",
+  },
+  ["Label"] = {
+    ["fg"] = "#2070af",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#af40af",
+  },
+  ["Exception"] = {
+    ["fg"] = "#af40af",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#af40af",
+  },
+  ["Structure"] = {
+    ["fg"] = "#af40af",
+  },
+  ["Constant"] = {
+    ["fg"] = "#1a1a1a",
+  },
+  ["Function"] = {
+    ["fg"] = "#aa357f",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#2070af",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#c50f4f",
+  },
+  ["Include"] = {
+    ["fg"] = "#c50f4f",
+  },
+  ["Define"] = {
+    ["fg"] = "#c50f4f",
+  },
+  ["Macro"] = {
+    ["fg"] = "#c50f4f",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#c50f4f",
+  },
+  ["Todo"] = {
+    ["fg"] = "#aa357f",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#007faa",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#2f5faf",
+  },
+  ["Number"] = {
+    ["fg"] = "#6060d0",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#1a1a1a",
+  },
+  ["Tag"] = {
+    ["fg"] = "#aa357f",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#1a1a1a",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#5f6a90",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#194f90",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#1a1a1a",
+    ["bg"] = "#ffa2a0",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#7f0813",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#614908",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#2e489f",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#1e5682",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#1f5d32",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#756275",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#7f0813",
+    ["bg"] = "#e7b3b8",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#614908",
+    ["bg"] = "#dbcdb3",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#2e489f",
+    ["bg"] = "#c7cdf0",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#1e5682",
+    ["bg"] = "#c1d3e4",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#1f5d32",
+    ["bg"] = "#c1d5c4",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#7f0813",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#614908",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#2e489f",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#1e5682",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#1f5d32",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#7f0813",
+    ["bg"] = "#efecec",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#614908",
+    ["bg"] = "#efecec",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#2e489f",
+    ["bg"] = "#efecec",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#1e5682",
+    ["bg"] = "#efecec",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#1f5d32",
+    ["bg"] = "#efecec",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#7f0813",
+    ["bg"] = "#e7b3b8",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#614908",
+    ["bg"] = "#dbcdb3",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#2e489f",
+    ["bg"] = "#c7cdf0",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#1e5682",
+    ["bg"] = "#c1d3e4",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#1f5d32",
+    ["bg"] = "#c1d5c4",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#f3d6d8",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#ede3d6",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#e3e3f4",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#e0e6ef",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#e0e7df",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#004840",
+    ["bg"] = "#c9efea",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#333399",
+    ["bg"] = "#dbdbff",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#8f1313",
+    ["bg"] = "#ffd6e0",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#a8c8ef",
+    ["fg"] = "#1a1a1a",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#a8c8ef",
+    ["fg"] = "#1a1a1a",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#a8c8ef",
+    ["fg"] = "#1a1a1a",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#adadad",
+    ["bg"] = "#fff9f9",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#756275",
+    ["bg"] = "#fff9f9",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#1a1a1a",
+    ["bg"] = "#dadadf",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#1a1a1a",
+    ["bg"] = "#dadadf",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#4250ef",
+    ["bg"] = "#efecec",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#4250ef",
+    ["bg"] = "#efecec",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#194f90",
+    ["bg"] = "#fff9f9",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#194f90",
+    ["bg"] = "#fff9f9",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#756275",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#375cd8",
+    ["bg"] = "#fff9f9",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#375cd8",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#756275",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#1a1a1a",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#1a1a1a",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#aa357f",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#c50f4f",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#194f90",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#aa357f",
+  },
+  ["@variable"] = {
+    ["fg"] = "#1a1a1a",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#af40af",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#1a1a1a",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#2070af",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#1a1a1a",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#c50f4f",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#1a1a1a",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#c50f4f",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#007faa",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#2070af",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#aa357f",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#375cd8",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#375cd8",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#aa357f",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#375cd8",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#aa357f",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#dd0000",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#efecec",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#756275",
+    ["bg"] = "#efecec",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#1a1a1a",
+    ["bg"] = "#ddd9d9",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#1a1a1a",
+    ["bg"] = "#ddd9d9",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#aa357f",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#2070af",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#bf256a",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#756275",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#004840",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#333399",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#8f1313",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#adadad",
+    ["bg"] = "#ddd9d9",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#aa0010",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#805d00",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#aa0010",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#2070af",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#2070af",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#aa357f",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#1a1a1a",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#aa0010",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#4250ef",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#194f90",
+    ["bg"] = "#fff9f9",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#aa0010",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#756275",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#1a1a1a",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#756275",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#4250ef",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#375cd8",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#756275",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#1a1a1a",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#aa357f",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#2070af",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#1a1a1a",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#2070af",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#2070af",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#194f90",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#2070af",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#805d00",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#1a1a1a",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#805d00",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#aa357f",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#217a3c",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#aa357f",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#1a1a1a",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#aa357f",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#375cd8",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#805d00",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#1a1a1a",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#2070af",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#aa357f",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#1a1a1a",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#2070af",
+  },
+}
@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: modus_operandi_tinted (Modus Themes family)
+-- License: GPL v3 (palette derives from Modus; see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#fbf7f0",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#008899",
+    ["bg"] = "#c9b9b0",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#9f9690",
+    ["bg"] = "#fbf7f0",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#9f9690",
+    ["bg"] = "#fbf7f0",
+  },
+  ["Folded"] = {
+    ["fg"] = "#2a5045",
+    ["bg"] = "#efe9dd",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#efe9dd",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#595959",
+    ["bg"] = "#efe9dd",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#595959",
+    ["bg"] = "#efe9dd",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#008899",
+    ["bg"] = "#c9b9b0",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#595959",
+    ["bg"] = "#efe9dd",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#f1d5d0",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#f1d5d0",
+  },
+  ["NonText"] = {
+    ["fg"] = "#595959",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#efe9dd",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#dfd5cf",
+    ["bg"] = "#dfd5cf",
+  },
+  ["Search"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#8adf80",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#f3d000",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#ff8f88",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#dfa0f0",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#008899",
+    ["bg"] = "#c9b9b0",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#c9b9b0",
+    ["bg"] = "#008899",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#008899",
+    ["bg"] = "#efe9dd",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#fbf7f0",
+    ["bg"] = "#d00000",
+  },
+  ["Directory"] = {
+    ["fg"] = "#0031a9",
+  },
+  ["Title"] = {
+    ["fg"] = "#193668",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#dfa0f0",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#dfa0f0",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#595959",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#008899",
+    ["bg"] = "#fbf7f0",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#dfd5cf",
+    ["bg"] = "#fbf7f0",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#dfd5cf",
+    ["bg"] = "#c8b8b2",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#fbf7f0",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#595959",
+    ["bg"] = "#e0d4ce",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#dfd5cf",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#7fdfcf",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#595959",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#000000",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#0031a9",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#9f9690",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#9f9690",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#005000",
+    ["bg"] = "#c3ebc1",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#8f1313",
+    ["bg"] = "#f4d0cf",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#ffdfa9",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#553d00",
+    ["bg"] = "#ffdfa9",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#595959",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#d00000",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#6d5000",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#006300",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#008899",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#6d5000",
+  },
+  ["Question"] = {
+    ["fg"] = "#0031a9",
+  },
+  ["Comment"] = {
+    ["fg"] = "#7f0000",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#3546c2",
+  },
+  ["Character"] = {
+    ["fg"] = "#3546c2",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#0031a9",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#531ab6",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#531ab6",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#531ab6",
+  },
+  ["Label"] = {
+    ["fg"] = "#00598b",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#531ab6",
+  },
+  ["Exception"] = {
+    ["fg"] = "#531ab6",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#531ab6",
+  },
+  ["Structure"] = {
+    ["fg"] = "#531ab6",
+  },
+  ["Constant"] = {
+    ["fg"] = "#000000",
+  },
+  ["Function"] = {
+    ["fg"] = "#721045",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#00598b",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#a0132f",
+  },
+  ["Include"] = {
+    ["fg"] = "#a0132f",
+  },
+  ["Define"] = {
+    ["fg"] = "#a0132f",
+  },
+  ["Macro"] = {
+    ["fg"] = "#a0132f",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#a0132f",
+  },
+  ["Todo"] = {
+    ["fg"] = "#721045",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#005f5f",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#32548f",
+  },
+  ["Number"] = {
+    ["fg"] = "#003497",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#000000",
+  },
+  ["Tag"] = {
+    ["fg"] = "#721045",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#000000",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#304463",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#193668",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#ff8f88",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#920000",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#5a5a00",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#0000b3",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#005f6b",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#006000",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#595959",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#920000",
+    ["bg"] = "#efb2ad",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#5a5a00",
+    ["bg"] = "#d9d6ad",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#0000b3",
+    ["bg"] = "#b5b2f4",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#005f6b",
+    ["bg"] = "#b5d8d8",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#006000",
+    ["bg"] = "#b5d8ad",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#920000",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#5a5a00",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#0000b3",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#005f6b",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#006000",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#920000",
+    ["bg"] = "#efe9dd",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#5a5a00",
+    ["bg"] = "#efe9dd",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#0000b3",
+    ["bg"] = "#efe9dd",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#005f6b",
+    ["bg"] = "#efe9dd",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#006000",
+    ["bg"] = "#efe9dd",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#920000",
+    ["bg"] = "#efb2ad",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#5a5a00",
+    ["bg"] = "#d9d6ad",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#0000b3",
+    ["bg"] = "#b5b2f4",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#005f6b",
+    ["bg"] = "#b5d8d8",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#006000",
+    ["bg"] = "#b5d8ad",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#f5d4ce",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#eae6ce",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#d8d4f2",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#d8e7e4",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#d8e8ce",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#006700",
+    ["bg"] = "#c3ebc1",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#655000",
+    ["bg"] = "#ffdfa9",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#aa2222",
+    ["bg"] = "#f4d0cf",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#bfc9ff",
+    ["fg"] = "#000000",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#bfc9ff",
+    ["fg"] = "#000000",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#bfc9ff",
+    ["fg"] = "#000000",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#9f9690",
+    ["bg"] = "#fbf7f0",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#595959",
+    ["bg"] = "#fbf7f0",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#dfa0f0",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#dfa0f0",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#3546c2",
+    ["bg"] = "#efe9dd",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#3546c2",
+    ["bg"] = "#efe9dd",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#9f9690",
+    ["bg"] = "#fbf7f0",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#9f9690",
+    ["bg"] = "#fbf7f0",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#595959",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#0031a9",
+    ["bg"] = "#fbf7f0",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#0000ff",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#595959",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#000000",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#000000",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#721045",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#a0132f",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#193668",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#721045",
+  },
+  ["@variable"] = {
+    ["fg"] = "#000000",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#531ab6",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#000000",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#00598b",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#000000",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#3546c2",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#a0132f",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#0031a9",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#000000",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#a0132f",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#005f5f",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#3546c2",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#00598b",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#3546c2",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#721045",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#0031a9",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#0031a9",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#0031a9",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#721045",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#006300",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#0031a9",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#6d5000",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#d00000",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#efe9dd",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#595959",
+    ["bg"] = "#efe9dd",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#efe9dd",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#efe9dd",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#0031a9",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#0031a9",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#721045",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#00598b",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#006300",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#8f0075",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#595959",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#006700",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#655000",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#aa2222",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#9f9690",
+    ["bg"] = "#efe9dd",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#a60000",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#6d5000",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#d00000",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#006300",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#00598b",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#00598b",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#721045",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#000000",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#006300",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#a60000",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#0031a9",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#3546c2",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#9f9690",
+    ["bg"] = "#fbf7f0",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#006300",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#a60000",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#595959",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#000000",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#595959",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#3546c2",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#0000ff",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#595959",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#000000",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#0031a9",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#0031a9",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#721045",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#00598b",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#000000",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#00598b",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#00598b",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#193668",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#00598b",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#6d5000",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#000000",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#6d5000",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#721045",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#006300",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#721045",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#000000",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#721045",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#0031a9",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#6d5000",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#000000",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#00598b",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#721045",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#000000",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#00598b",
+  },
+}
@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: modus_operandi_tritanopia (Modus Themes family)
+-- License: GPL v3 (palette derives from Modus; see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#ffffff",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#008899",
+    ["bg"] = "#c4c4c4",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#9f9f9f",
+    ["bg"] = "#ffffff",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#9f9f9f",
+    ["bg"] = "#ffffff",
+  },
+  ["Folded"] = {
+    ["fg"] = "#2a5045",
+    ["bg"] = "#f2f2f2",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#f2f2f2",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#595959",
+    ["bg"] = "#f2f2f2",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#595959",
+    ["bg"] = "#f2f2f2",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#008899",
+    ["bg"] = "#c4c4c4",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#595959",
+    ["bg"] = "#f2f2f2",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#dfeaec",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#dfeaec",
+  },
+  ["NonText"] = {
+    ["fg"] = "#595959",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#f2f2f2",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#e0e0e0",
+    ["bg"] = "#e0e0e0",
+  },
+  ["Search"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#8adf80",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#f3d000",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#ff8f88",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#dfa0f0",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#008899",
+    ["bg"] = "#c4c4c4",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#c4c4c4",
+    ["bg"] = "#008899",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#008899",
+    ["bg"] = "#f2f2f2",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#ffffff",
+    ["bg"] = "#d00000",
+  },
+  ["Directory"] = {
+    ["fg"] = "#0031a9",
+  },
+  ["Title"] = {
+    ["fg"] = "#224960",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#dfa0f0",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#dfa0f0",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#595959",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#008899",
+    ["bg"] = "#ffffff",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#e0e0e0",
+    ["bg"] = "#ffffff",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#e0e0e0",
+    ["bg"] = "#c2c2c2",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#ffffff",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#595959",
+    ["bg"] = "#dfdfdf",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#e0e0e0",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#5fcfff",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#595959",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#000000",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#0031a9",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#9f9f9f",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#9f9f9f",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#005079",
+    ["bg"] = "#b5e7ff",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#8f1313",
+    ["bg"] = "#ffd8d5",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#6f1343",
+    ["bg"] = "#eecfdf",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#6f1343",
+    ["bg"] = "#eecfdf",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#595959",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#d00000",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#721045",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#005e8b",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#008899",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#721045",
+  },
+  ["Question"] = {
+    ["fg"] = "#0031a9",
+  },
+  ["Comment"] = {
+    ["fg"] = "#702000",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#3548cf",
+  },
+  ["Character"] = {
+    ["fg"] = "#3548cf",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#0031a9",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#531ab6",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#531ab6",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#531ab6",
+  },
+  ["Label"] = {
+    ["fg"] = "#005e8b",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#531ab6",
+  },
+  ["Exception"] = {
+    ["fg"] = "#531ab6",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#531ab6",
+  },
+  ["Structure"] = {
+    ["fg"] = "#531ab6",
+  },
+  ["Constant"] = {
+    ["fg"] = "#000000",
+  },
+  ["Function"] = {
+    ["fg"] = "#721045",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#005e8b",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#a0132f",
+  },
+  ["Include"] = {
+    ["fg"] = "#a0132f",
+  },
+  ["Define"] = {
+    ["fg"] = "#a0132f",
+  },
+  ["Macro"] = {
+    ["fg"] = "#a0132f",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#a0132f",
+  },
+  ["Todo"] = {
+    ["fg"] = "#721045",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#005f5f",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#3f578f",
+  },
+  ["Number"] = {
+    ["fg"] = "#003497",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#000000",
+  },
+  ["Tag"] = {
+    ["fg"] = "#721045",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#000000",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#004f5f",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#224960",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#ff8f88",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#920000",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#5a5a00",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#0000b3",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#005f6b",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#006000",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#595959",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#920000",
+    ["bg"] = "#f2b8b8",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#5a5a00",
+    ["bg"] = "#dbdbb8",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#0000b3",
+    ["bg"] = "#b8b8ff",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#005f6b",
+    ["bg"] = "#b8dee2",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#006000",
+    ["bg"] = "#b8deb8",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#920000",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#5a5a00",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#0000b3",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#005f6b",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#006000",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#920000",
+    ["bg"] = "#f2f2f2",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#5a5a00",
+    ["bg"] = "#f2f2f2",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#0000b3",
+    ["bg"] = "#f2f2f2",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#005f6b",
+    ["bg"] = "#f2f2f2",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#006000",
+    ["bg"] = "#f2f2f2",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#920000",
+    ["bg"] = "#f2b8b8",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#5a5a00",
+    ["bg"] = "#dbdbb8",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#0000b3",
+    ["bg"] = "#b8b8ff",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#005f6b",
+    ["bg"] = "#b8dee2",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#006000",
+    ["bg"] = "#b8deb8",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#f8dbdb",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#ededdb",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#dbdbff",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#dbeef1",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#dbeedb",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#0043aa",
+    ["bg"] = "#b5e7ff",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#7f0f9f",
+    ["bg"] = "#eecfdf",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#aa2222",
+    ["bg"] = "#ffd8d5",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#bfc9ff",
+    ["fg"] = "#000000",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#bfc9ff",
+    ["fg"] = "#000000",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#bfc9ff",
+    ["fg"] = "#000000",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#9f9f9f",
+    ["bg"] = "#ffffff",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#595959",
+    ["bg"] = "#ffffff",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#dfa0f0",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#dfa0f0",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#3548cf",
+    ["bg"] = "#f2f2f2",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#3548cf",
+    ["bg"] = "#f2f2f2",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#9f9f9f",
+    ["bg"] = "#ffffff",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#9f9f9f",
+    ["bg"] = "#ffffff",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#595959",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#0031a9",
+    ["bg"] = "#ffffff",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#0000ff",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#595959",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#000000",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#000000",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#721045",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#a0132f",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#224960",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#721045",
+  },
+  ["@variable"] = {
+    ["fg"] = "#000000",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#531ab6",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#000000",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#005e8b",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#000000",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#3548cf",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#a0132f",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#0031a9",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#000000",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#a0132f",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#005f5f",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#3548cf",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#005e8b",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#3548cf",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#721045",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#0031a9",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#0031a9",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#0031a9",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#721045",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#006800",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#0031a9",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#721045",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#d00000",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#f2f2f2",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#595959",
+    ["bg"] = "#f2f2f2",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#f2f2f2",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#f2f2f2",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#0031a9",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#0031a9",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#721045",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#005e8b",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#006800",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#8f0075",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#595959",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#0043aa",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#7f0f9f",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#aa2222",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#9f9f9f",
+    ["bg"] = "#f2f2f2",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#a60000",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#695500",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#d00000",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#006800",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#005e8b",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#005e8b",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#721045",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#000000",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#006800",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#a60000",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#0031a9",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#3548cf",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#9f9f9f",
+    ["bg"] = "#ffffff",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#006800",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#a60000",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#595959",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#000000",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#595959",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#3548cf",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#0000ff",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#595959",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#000000",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#0031a9",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#0031a9",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#721045",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#005e8b",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#000000",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#005e8b",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#005e8b",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#224960",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#005e8b",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#695500",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#000000",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#695500",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#721045",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#006800",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#721045",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#000000",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#721045",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#0031a9",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#695500",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#000000",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#005e8b",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#721045",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#000000",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#005e8b",
+  },
+}
@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: modus_vivendi (Modus Themes family)
+-- License: GPL v3 (palette derives from Modus; see colors/LICENSE)
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#ffffff",
+    ["bg"] = "#000000",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#f4f4f4",
+    ["bg"] = "#303030",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#C4C4C4",
+    ["bg"] = "#000000",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#C4C4C4",
+    ["bg"] = "#000000",
+  },
+  ["Folded"] = {
+    ["fg"] = "#88ca9f",
+    ["bg"] = "#1e1e1e",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#ffffff",
+    ["bg"] = "#1e1e1e",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#989898",
+    ["bg"] = "#1e1e1e",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#989898",
+    ["bg"] = "#1e1e1e",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#f4f4f4",
+    ["bg"] = "#303030",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#989898",
+    ["bg"] = "#1e1e1e",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#2f3849",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#2f3849",
+  },
+  ["NonText"] = {
+    ["fg"] = "#989898",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#1e1e1e",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#bfc0c4",
+    ["bg"] = "#282828",
+  },
+  ["Search"] = {
+    ["fg"] = "#ffffff",
+    ["bg"] = "#2f822f",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#ffffff",
+    ["bg"] = "#7a6100",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#ffffff",
+    ["bg"] = "#9d1f1f",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#ffffff",
+    ["bg"] = "#7030af",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#f4f4f4",
+    ["bg"] = "#303030",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#303030",
+    ["bg"] = "#f4f4f4",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#f4f4f4",
+    ["bg"] = "#1e1e1e",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#000000",
+    ["bg"] = "#ffffff",
+  },
+  ["Directory"] = {
+    ["fg"] = "#2fafff",
+  },
+  ["Title"] = {
+    ["fg"] = "#c6daff",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#ffffff",
+    ["bg"] = "#7030af",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#ffffff",
+    ["bg"] = "#7030af",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#989898",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#f0f0f0",
+    ["bg"] = "#404040",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#969696",
+    ["bg"] = "#2d2d2d",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#f7f7f7",
+    ["bg"] = "#545454",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#ffffff",
+    ["bg"] = "#000000",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#989898",
+    ["bg"] = "#313131",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#bfc0c4",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#ffffff",
+    ["bg"] = "#2f7f9f",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#989898",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#ffffff",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#2fafff",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#646464",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#646464",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#a0e0a0",
+    ["bg"] = "#00381f",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#ffbfbf",
+    ["bg"] = "#4f1119",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#efef80",
+    ["bg"] = "#363300",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#efef80",
+    ["bg"] = "#363300",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#989898",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#ff5f5f",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#efef00",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#338fff",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#00eff0",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#efef00",
+  },
+  ["Question"] = {
+    ["fg"] = "#2fafff",
+  },
+  ["Comment"] = {
+    ["fg"] = "#989898",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#79a8ff",
+  },
+  ["Character"] = {
+    ["fg"] = "#79a8ff",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#2fafff",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#b6a0ff",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#b6a0ff",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#b6a0ff",
+  },
+  ["Label"] = {
+    ["fg"] = "#00d3d0",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#b6a0ff",
+  },
+  ["Exception"] = {
+    ["fg"] = "#b6a0ff",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#b6a0ff",
+  },
+  ["Structure"] = {
+    ["fg"] = "#b6a0ff",
+  },
+  ["Constant"] = {
+    ["fg"] = "#ffffff",
+  },
+  ["Function"] = {
+    ["fg"] = "#feacd0",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#00d3d0",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#ff7f9f",
+  },
+  ["Include"] = {
+    ["fg"] = "#ff7f9f",
+  },
+  ["Define"] = {
+    ["fg"] = "#ff7f9f",
+  },
+  ["Macro"] = {
+    ["fg"] = "#ff7f9f",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#ff7f9f",
+  },
+  ["Todo"] = {
+    ["fg"] = "#feacd0",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#6ae4b9",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#4ae2f0",
+  },
+  ["Number"] = {
+    ["fg"] = "#82b0ec",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#ffffff",
+  },
+  ["Tag"] = {
+    ["fg"] = "#feacd0",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#ffffff",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#9ac8e0",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#c6daff",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#ffffff",
+    ["bg"] = "#9d1f1f",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#ff8f8f",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#f4f44d",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#70b1ff",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#4df4f5",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#7ce97c",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#989898",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#ff8f8f",
+    ["bg"] = "#471b1b",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#f4f44d",
+    ["bg"] = "#434300",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#70b1ff",
+    ["bg"] = "#0e2847",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#4df4f5",
+    ["bg"] = "#004343",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#7ce97c",
+    ["bg"] = "#133e13",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#ff8f8f",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#f4f44d",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#70b1ff",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#4df4f5",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#7ce97c",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#ff8f8f",
+    ["bg"] = "#1e1e1e",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#f4f44d",
+    ["bg"] = "#1e1e1e",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#70b1ff",
+    ["bg"] = "#1e1e1e",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#4df4f5",
+    ["bg"] = "#1e1e1e",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#7ce97c",
+    ["bg"] = "#1e1e1e",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#ff8f8f",
+    ["bg"] = "#471b1b",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#f4f44d",
+    ["bg"] = "#434300",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#70b1ff",
+    ["bg"] = "#0e2847",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#4df4f5",
+    ["bg"] = "#004343",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#7ce97c",
+    ["bg"] = "#133e13",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#240d0d",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#212100",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#071424",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#002122",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#0a1f0a",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#80e080",
+    ["bg"] = "#00381f",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#c0b05f",
+    ["bg"] = "#363300",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#ff9095",
+    ["bg"] = "#4f1119",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#1640b0",
+    ["fg"] = "#ffffff",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#1640b0",
+    ["fg"] = "#ffffff",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#1640b0",
+    ["fg"] = "#ffffff",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#646464",
+    ["bg"] = "#000000",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#989898",
+    ["bg"] = "#000000",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#ffffff",
+    ["bg"] = "#7030af",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#ffffff",
+    ["bg"] = "#7030af",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#79a8ff",
+    ["bg"] = "#1e1e1e",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#79a8ff",
+    ["bg"] = "#1e1e1e",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#C4C4C4",
+    ["bg"] = "#000000",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#C4C4C4",
+    ["bg"] = "#000000",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#989898",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#2fafff",
+    ["bg"] = "#000000",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#338fff",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#989898",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#ffffff",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#ffffff",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#feacd0",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#ff7f9f",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#c6daff",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#feacd0",
+  },
+  ["@variable"] = {
+    ["fg"] = "#ffffff",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#b6a0ff",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#ffffff",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#00d3d0",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#ffffff",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#79a8ff",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#ff7f9f",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#2fafff",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#ffffff",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#ff7f9f",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#6ae4b9",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#79a8ff",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#00d3d0",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#79a8ff",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#feacd0",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#2fafff",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#2fafff",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#2fafff",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#feacd0",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#44bc44",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#2fafff",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#efef00",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#ff5f5f",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#1e1e1e",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#989898",
+    ["bg"] = "#1e1e1e",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#ffffff",
+    ["bg"] = "#0f0f0f",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#ffffff",
+    ["bg"] = "#0f0f0f",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#2fafff",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#2fafff",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#feacd0",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#00d3d0",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#44bc44",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#f78fe7",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#989898",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#80e080",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#c0b05f",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#ff9095",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#646464",
+    ["bg"] = "#0f0f0f",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#ff5f59",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#d0bc00",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#ff5f5f",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#44bc44",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#00d3d0",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#00d3d0",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#feacd0",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#ffffff",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#44bc44",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#ff5f59",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#2fafff",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#79a8ff",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#C4C4C4",
+    ["bg"] = "#000000",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#44bc44",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#ff5f59",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#989898",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#ffffff",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#989898",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#79a8ff",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#338fff",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#989898",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#ffffff",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#2fafff",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#2fafff",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#feacd0",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#00d3d0",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#ffffff",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#00d3d0",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#00d3d0",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#c6daff",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#00d3d0",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#d0bc00",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#ffffff",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#d0bc00",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#feacd0",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#44bc44",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#feacd0",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#ffffff",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#feacd0",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#2fafff",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#d0bc00",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#ffffff",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#00d3d0",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#feacd0",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#ffffff",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#00d3d0",
+  },
+}
@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: phajas_dark (Phajas family)
+-- License: Custom
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#2d2d2d",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#66cccc",
+    ["bg"] = "#d3d0c8",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#747369",
+    ["bg"] = "#2d2d2d",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#747369",
+    ["bg"] = "#2d2d2d",
+  },
+  ["Folded"] = {
+    ["fg"] = "#99cc99",
+    ["bg"] = "#d3d0c8",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#d3d0c8",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#747369",
+    ["bg"] = "#d3d0c8",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#747369",
+    ["bg"] = "#d3d0c8",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#66cccc",
+    ["bg"] = "#d3d0c8",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#747369",
+    ["bg"] = "#d3d0c8",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#d3d0c8",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#d3d0c8",
+  },
+  ["NonText"] = {
+    ["fg"] = "#747369",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#d3d0c8",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#747369",
+    ["bg"] = "#d3d0c8",
+  },
+  ["Search"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#99cc99",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#ffcc66",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#f2777a",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#747369",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#66cccc",
+    ["bg"] = "#d3d0c8",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#66cccc",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#66cccc",
+    ["bg"] = "#d3d0c8",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#2d2d2d",
+    ["bg"] = "#d3d0c8",
+  },
+  ["Directory"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["Title"] = {
+    ["fg"] = "#6699cc",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#747369",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#747369",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#747369",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#66cccc",
+    ["bg"] = "#2d2d2d",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#747369",
+    ["bg"] = "#2d2d2d",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#747369",
+    ["bg"] = "#d3d0c8",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#2d2d2d",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#747369",
+    ["bg"] = "#d3d0c8",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#747369",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#ffcc66",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#747369",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#d3d0c8",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#99cc99",
+    ["bg"] = "#2d2d2d",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#f2777a",
+    ["bg"] = "#2d2d2d",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#ffcc66",
+    ["bg"] = "#2d2d2d",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#ffcc66",
+    ["bg"] = "#2d2d2d",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#747369",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#f2777a",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#ffcc66",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#6699cc",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#66cccc",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#ffcc66",
+  },
+  ["Question"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["Comment"] = {
+    ["fg"] = "#747369",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["Character"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#6699cc",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["Label"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["Exception"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["Structure"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["Constant"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["Function"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["Include"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["Define"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["Macro"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["Todo"] = {
+    ["fg"] = "#cc99cc",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["Number"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["Tag"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#6699cc",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#f2777a",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#e99291",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#f2cd83",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#87aacb",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#87cdcb",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#aacda7",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#747369",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#e99291",
+    ["bg"] = "#644243",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#f2cd83",
+    ["bg"] = "#685a3d",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#87aacb",
+    ["bg"] = "#3d4b5a",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#87cdcb",
+    ["bg"] = "#3d5a5a",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#aacda7",
+    ["bg"] = "#4b5a4b",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#e99291",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#f2cd83",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#87aacb",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#87cdcb",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#aacda7",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#e99291",
+    ["bg"] = "#d3d0c8",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#f2cd83",
+    ["bg"] = "#d3d0c8",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#87aacb",
+    ["bg"] = "#d3d0c8",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#87cdcb",
+    ["bg"] = "#d3d0c8",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#aacda7",
+    ["bg"] = "#d3d0c8",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#e99291",
+    ["bg"] = "#644243",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#f2cd83",
+    ["bg"] = "#685a3d",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#87aacb",
+    ["bg"] = "#3d4b5a",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#87cdcb",
+    ["bg"] = "#3d5a5a",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#aacda7",
+    ["bg"] = "#4b5a4b",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#493738",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#4a4335",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#353c43",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#354343",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#3c433c",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#99cc99",
+    ["bg"] = "#2d2d2d",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#ffcc66",
+    ["bg"] = "#2d2d2d",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#f2777a",
+    ["bg"] = "#2d2d2d",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#d3d0c8",
+    ["fg"] = "#d3d0c8",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#d3d0c8",
+    ["fg"] = "#d3d0c8",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#d3d0c8",
+    ["fg"] = "#d3d0c8",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#2d2d2d",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#747369",
+    ["bg"] = "#2d2d2d",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#747369",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#747369",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#6699cc",
+    ["bg"] = "#d3d0c8",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#6699cc",
+    ["bg"] = "#d3d0c8",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#747369",
+    ["bg"] = "#2d2d2d",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#747369",
+    ["bg"] = "#2d2d2d",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#747369",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#6699cc",
+    ["bg"] = "#2d2d2d",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#6699cc",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#747369",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["@variable"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#6699cc",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#6699cc",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#99cc99",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#6699cc",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#ffcc66",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#d3d0c8",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#747369",
+    ["bg"] = "#d3d0c8",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#2d2d2d",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#2d2d2d",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#cc99cc",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#99cc99",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#cc99cc",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#747369",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#99cc99",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#ffcc66",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#2d2d2d",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#ffcc66",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#99cc99",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#99cc99",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#747369",
+    ["bg"] = "#2d2d2d",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#99cc99",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#747369",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#747369",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#6699cc",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#6699cc",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#747369",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#ffcc66",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#ffcc66",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#99cc99",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#ffcc66",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#66cccc",
+  },
+}
@@ -0,0 +1,875 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: phajas_light (Phajas family)
+-- License: Custom
+-- Resolved highlight groups for phajas_palette (generated)
+return {
+  ["Normal"] = {
+    ["fg"] = "#2d2d2d",
+    ["bg"] = "#f2f0ec",
+  },
+  ["NormalFloat"] = {
+    ["fg"] = "#66cccc",
+    ["bg"] = "#2d2d2d",
+  },
+  ["FloatBorder"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#f2f0ec",
+  },
+  ["FloatTitle"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#f2f0ec",
+  },
+  ["Folded"] = {
+    ["fg"] = "#99cc99",
+    ["bg"] = "#2d2d2d",
+  },
+  ["LineNr"] = {
+    ["fg"] = "#2d2d2d",
+    ["bg"] = "#2d2d2d",
+  },
+  ["LineNrAbove"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#2d2d2d",
+  },
+  ["LineNrBelow"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#2d2d2d",
+  },
+  ["CursorLineNr"] = {
+    ["fg"] = "#66cccc",
+    ["bg"] = "#2d2d2d",
+    ["bold"] = true,
+  },
+  ["SignColumn"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#2d2d2d",
+  },
+  ["CursorLine"] = {
+    ["bg"] = "#2d2d2d",
+  },
+  ["CursorColumn"] = {
+    ["bg"] = "#2d2d2d",
+  },
+  ["NonText"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["ColorColumn"] = {
+    ["bg"] = "#2d2d2d",
+  },
+  ["FoldColumn"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#2d2d2d",
+  },
+  ["Search"] = {
+    ["fg"] = "#2d2d2d",
+    ["bg"] = "#99cc99",
+  },
+  ["IncSearch"] = {
+    ["fg"] = "#2d2d2d",
+    ["bg"] = "#ffcc66",
+  },
+  ["CurSearch"] = {
+    ["link"] = "IncSearch",
+  },
+  ["Substitute"] = {
+    ["fg"] = "#2d2d2d",
+    ["bg"] = "#f2777a",
+  },
+  ["QuickFixLine"] = {
+    ["fg"] = "#2d2d2d",
+    ["bg"] = "#d3d0c8",
+  },
+  ["Pmenu"] = {
+    ["fg"] = "#66cccc",
+    ["bg"] = "#2d2d2d",
+  },
+  ["PmenuSel"] = {
+    ["fg"] = "#2d2d2d",
+    ["bg"] = "#66cccc",
+  },
+  ["PmenuSbar"] = {
+    ["fg"] = "#66cccc",
+    ["bg"] = "#2d2d2d",
+  },
+  ["PmenuThumb"] = {
+    ["fg"] = "#f2f0ec",
+    ["bg"] = "#2d2d2d",
+  },
+  ["Directory"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["Title"] = {
+    ["fg"] = "#6699cc",
+    ["bold"] = true,
+  },
+  ["Visual"] = {
+    ["fg"] = "#2d2d2d",
+    ["bg"] = "#d3d0c8",
+  },
+  ["VisualNOS"] = {
+    ["link"] = "Visual",
+  },
+  ["WildMenu"] = {
+    ["fg"] = "#2d2d2d",
+    ["bg"] = "#d3d0c8",
+  },
+  ["Whitespace"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["StatusLine"] = {
+    ["fg"] = "#66cccc",
+    ["bg"] = "#f2f0ec",
+  },
+  ["StatusLineNC"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#f2f0ec",
+  },
+  ["TabLine"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#2d2d2d",
+  },
+  ["TabLineSel"] = {
+    ["fg"] = "#2d2d2d",
+    ["bg"] = "#f2f0ec",
+    ["bold"] = true,
+  },
+  ["TabLineFill"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#2d2d2d",
+  },
+  ["WinBar"] = {
+    ["link"] = "TabLineSel",
+  },
+  ["WinBarNC"] = {
+    ["link"] = "TabLine",
+  },
+  ["EndOfBuffer"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["MatchParen"] = {
+    ["fg"] = "#2d2d2d",
+    ["bg"] = "#ffcc66",
+  },
+  ["ModeMsg"] = {
+    ["fg"] = "#d3d0c8",
+    ["bold"] = true,
+  },
+  ["MsgArea"] = {
+    ["fg"] = "#2d2d2d",
+  },
+  ["MoreMsg"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["VertSplit"] = {
+    ["fg"] = "#2d2d2d",
+  },
+  ["WinSeparator"] = {
+    ["fg"] = "#2d2d2d",
+    ["bold"] = true,
+  },
+  ["DiffAdd"] = {
+    ["fg"] = "#99cc99",
+    ["bg"] = "#f2f0ec",
+  },
+  ["DiffDelete"] = {
+    ["fg"] = "#f2777a",
+    ["bg"] = "#f2f0ec",
+  },
+  ["DiffChange"] = {
+    ["fg"] = "#ffcc66",
+    ["bg"] = "#f2f0ec",
+  },
+  ["DiffText"] = {
+    ["fg"] = "#ffcc66",
+    ["bg"] = "#f2f0ec",
+  },
+  ["SpecialKey"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["SpellBad"] = {
+    ["sp"] = "#f2777a",
+    ["undercurl"] = true,
+  },
+  ["SpellCap"] = {
+    ["sp"] = "#ffcc66",
+    ["undercurl"] = true,
+  },
+  ["SpellLocal"] = {
+    ["sp"] = "#6699cc",
+    ["undercurl"] = true,
+  },
+  ["SpellRare"] = {
+    ["sp"] = "#66cccc",
+    ["undercurl"] = true,
+  },
+  ["WarningMsg"] = {
+    ["fg"] = "#ffcc66",
+  },
+  ["Question"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["Comment"] = {
+    ["fg"] = "#d3d0c8",
+    ["italic"] = true,
+  },
+  ["String"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["Character"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["Boolean"] = {
+    ["fg"] = "#6699cc",
+    ["bold"] = true,
+  },
+  ["Statement"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["Conditional"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["Repeat"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["Label"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["Keyword"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["Exception"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["StorageClass"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["Structure"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["Constant"] = {
+    ["fg"] = "#2d2d2d",
+  },
+  ["Function"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["Identifier"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["PreProc"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["Include"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["Define"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["Macro"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["PreCondit"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["Todo"] = {
+    ["fg"] = "#cc99cc",
+    ["bold"] = true,
+  },
+  ["Type"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["TypeDef"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["Number"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["Float"] = {
+    ["link"] = "Number",
+  },
+  ["Operator"] = {
+    ["fg"] = "#2d2d2d",
+  },
+  ["Tag"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["Delimiter"] = {
+    ["fg"] = "#2d2d2d",
+  },
+  ["Special"] = {
+    ["link"] = "Type",
+  },
+  ["SpecialChar"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["Underlined"] = {
+    ["fg"] = "#6699cc",
+    ["underline"] = true,
+  },
+  ["Error"] = {
+    ["fg"] = "#2d2d2d",
+    ["bg"] = "#f2777a",
+  },
+  ["DiagnosticError"] = {
+    ["fg"] = "#b76163",
+    ["bold"] = true,
+  },
+  ["DiagnosticWarn"] = {
+    ["fg"] = "#c09c55",
+    ["bold"] = true,
+  },
+  ["DiagnosticInfo"] = {
+    ["fg"] = "#55799c",
+    ["bold"] = true,
+  },
+  ["DiagnosticHint"] = {
+    ["fg"] = "#559c9c",
+    ["bold"] = true,
+  },
+  ["DiagnosticOk"] = {
+    ["fg"] = "#799c79",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnnecessary"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["DiagnosticVirtualTextError"] = {
+    ["fg"] = "#b76163",
+    ["bg"] = "#f2cecc",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextWarn"] = {
+    ["fg"] = "#c09c55",
+    ["bg"] = "#f6e6c6",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextInfo"] = {
+    ["fg"] = "#55799c",
+    ["bg"] = "#cbd8e3",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextHint"] = {
+    ["fg"] = "#559c9c",
+    ["bg"] = "#cbe6e3",
+    ["bold"] = true,
+  },
+  ["DiagnosticVirtualTextOk"] = {
+    ["fg"] = "#799c79",
+    ["bg"] = "#d9e6d5",
+    ["bold"] = true,
+  },
+  ["DiagnosticUnderlineError"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#b76163",
+  },
+  ["DiagnosticUnderlineWarn"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#c09c55",
+  },
+  ["DiagnosticUnderlineInfo"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#55799c",
+  },
+  ["DiagnosticUnderlineHint"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#559c9c",
+  },
+  ["DiagnosticUnderlineOk"] = {
+    ["undercurl"] = true,
+    ["sp"] = "#799c79",
+  },
+  ["DiagnosticSignError"] = {
+    ["fg"] = "#b76163",
+    ["bg"] = "#2d2d2d",
+  },
+  ["DiagnosticSignWarn"] = {
+    ["fg"] = "#c09c55",
+    ["bg"] = "#2d2d2d",
+  },
+  ["DiagnosticSignInfo"] = {
+    ["fg"] = "#55799c",
+    ["bg"] = "#2d2d2d",
+  },
+  ["DiagnosticSignHint"] = {
+    ["fg"] = "#559c9c",
+    ["bg"] = "#2d2d2d",
+  },
+  ["DiagnosticSignOk"] = {
+    ["fg"] = "#799c79",
+    ["bg"] = "#2d2d2d",
+  },
+  ["DiagnosticFloatingError"] = {
+    ["fg"] = "#b76163",
+    ["bg"] = "#f2cecc",
+  },
+  ["DiagnosticFloatingWarn"] = {
+    ["fg"] = "#c09c55",
+    ["bg"] = "#f6e6c6",
+  },
+  ["DiagnosticFloatingInfo"] = {
+    ["fg"] = "#55799c",
+    ["bg"] = "#cbd8e3",
+  },
+  ["DiagnosticFloatingHint"] = {
+    ["fg"] = "#559c9c",
+    ["bg"] = "#cbe6e3",
+  },
+  ["DiagnosticFloatingOk"] = {
+    ["fg"] = "#799c79",
+    ["bg"] = "#d9e6d5",
+  },
+  ["DiagnosticLineError"] = {
+    ["bg"] = "#f2dfdc",
+  },
+  ["DiagnosticLineWarn"] = {
+    ["bg"] = "#f4ebd9",
+  },
+  ["DiagnosticLineInfo"] = {
+    ["bg"] = "#dee4e8",
+  },
+  ["DiagnosticLineHint"] = {
+    ["bg"] = "#deebe8",
+  },
+  ["DiagnosticLineOk"] = {
+    ["bg"] = "#e6ebe0",
+  },
+  ["GitSignsAdd"] = {
+    ["fg"] = "#99cc99",
+    ["bg"] = "#f2f0ec",
+  },
+  ["GitSignsChange"] = {
+    ["fg"] = "#ffcc66",
+    ["bg"] = "#f2f0ec",
+  },
+  ["GitSignsDelete"] = {
+    ["fg"] = "#f2777a",
+    ["bg"] = "#f2f0ec",
+  },
+  ["LspReferenceText"] = {
+    ["bg"] = "#2d2d2d",
+    ["fg"] = "#2d2d2d",
+  },
+  ["LspReferenceRead"] = {
+    ["bg"] = "#2d2d2d",
+    ["fg"] = "#2d2d2d",
+  },
+  ["LspReferenceWrite"] = {
+    ["bg"] = "#2d2d2d",
+    ["fg"] = "#2d2d2d",
+  },
+  ["TelescopeNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopeBorder"] = {
+    ["fg"] = "#2d2d2d",
+    ["bg"] = "#f2f0ec",
+  },
+  ["TelescopeTitle"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#f2f0ec",
+  },
+  ["TelescopeSelection"] = {
+    ["fg"] = "#2d2d2d",
+    ["bg"] = "#d3d0c8",
+    ["bold"] = true,
+  },
+  ["TelescopeSelectionCaret"] = {
+    ["fg"] = "#2d2d2d",
+    ["bg"] = "#d3d0c8",
+    ["bold"] = true,
+  },
+  ["TelescopeMultiSelection"] = {
+    ["fg"] = "#6699cc",
+    ["bg"] = "#2d2d2d",
+  },
+  ["TelescopeMultiIcon"] = {
+    ["fg"] = "#6699cc",
+    ["bg"] = "#2d2d2d",
+  },
+  ["TelescopePromptBorder"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#f2f0ec",
+  },
+  ["TelescopePromptTitle"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#f2f0ec",
+  },
+  ["TelescopeResultsComment"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["TelescopePromptNormal"] = {
+    ["link"] = "Normal",
+  },
+  ["TelescopePromptPrefix"] = {
+    ["fg"] = "#6699cc",
+    ["bg"] = "#f2f0ec",
+  },
+  ["TelescopeMatching"] = {
+    ["fg"] = "#6699cc",
+    ["bold"] = true,
+  },
+  ["@comment"] = {
+    ["link"] = "Comment",
+  },
+  ["@error"] = {
+    ["link"] = "Error",
+  },
+  ["@punctuation"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["@punctuation.delimiter"] = {
+    ["link"] = "Delimiter",
+  },
+  ["@punctuation.bracket"] = {
+    ["fg"] = "#2d2d2d",
+  },
+  ["@punctuation.special"] = {
+    ["fg"] = "#2d2d2d",
+  },
+  ["@string"] = {
+    ["link"] = "String",
+  },
+  ["@character"] = {
+    ["link"] = "Character",
+  },
+  ["@number"] = {
+    ["link"] = "Number",
+  },
+  ["@boolean"] = {
+    ["link"] = "Boolean",
+  },
+  ["@float"] = {
+    ["link"] = "Float",
+  },
+  ["@constant"] = {
+    ["link"] = "Constant",
+  },
+  ["@constant.builtin"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["@constant.macro"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["@namespace"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["@symbol"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["@variable"] = {
+    ["fg"] = "#2d2d2d",
+  },
+  ["@variable.builtin"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["@variable.parameter"] = {
+    ["fg"] = "#2d2d2d",
+  },
+  ["@variable.member"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["@property"] = {
+    ["link"] = "@field",
+  },
+  ["@field"] = {
+    ["fg"] = "#2d2d2d",
+  },
+  ["@function"] = {
+    ["link"] = "Function",
+  },
+  ["@function.builtin"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["@function.macro"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["@method"] = {
+    ["link"] = "Function",
+  },
+  ["@constructor"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["@parameter"] = {
+    ["fg"] = "#2d2d2d",
+  },
+  ["@keyword"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.function"] = {
+    ["link"] = "Keyword",
+  },
+  ["@keyword.operator"] = {
+    ["link"] = "Operator",
+  },
+  ["@keyword.return"] = {
+    ["link"] = "Keyword",
+  },
+  ["@conditional"] = {
+    ["link"] = "Conditional",
+  },
+  ["@repeat"] = {
+    ["link"] = "Repeat",
+  },
+  ["@debug"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["@label"] = {
+    ["link"] = "Label",
+  },
+  ["@include"] = {
+    ["link"] = "Include",
+  },
+  ["@exception"] = {
+    ["link"] = "Exception",
+  },
+  ["@type"] = {
+    ["link"] = "Type",
+  },
+  ["@type.builtin"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["@type.definition"] = {
+    ["link"] = "Typedef",
+  },
+  ["@storageclass"] = {
+    ["link"] = "StorageClass",
+  },
+  ["@attribute"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["@field.yaml"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["@string.regex"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["@string.escape"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["@string.special"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["@text.title"] = {
+    ["fg"] = "#6699cc",
+    ["bold"] = true,
+  },
+  ["@text.emphasis"] = {
+    ["italic"] = true,
+  },
+  ["@text.strong"] = {
+    ["bold"] = true,
+  },
+  ["@text.uri"] = {
+    ["fg"] = "#6699cc",
+    ["underline"] = true,
+  },
+  ["@text.reference"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["@text.literal"] = {
+    ["fg"] = "#99cc99",
+  },
+  ["@text.note"] = {
+    ["fg"] = "#6699cc",
+    ["bold"] = true,
+  },
+  ["@text.warning"] = {
+    ["fg"] = "#ffcc66",
+  },
+  ["@text.danger"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["TreesitterContext"] = {
+    ["bg"] = "#2d2d2d",
+  },
+  ["TreesitterContextLineNumber"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#2d2d2d",
+  },
+  ["NvimTreeNormal"] = {
+    ["fg"] = "#2d2d2d",
+    ["bg"] = "#f2f0ec",
+  },
+  ["NvimTreeNormalNC"] = {
+    ["fg"] = "#2d2d2d",
+    ["bg"] = "#f2f0ec",
+  },
+  ["NvimTreeFolderName"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["NvimTreeFolderIcon"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["NvimTreeRootFolder"] = {
+    ["fg"] = "#cc99cc",
+    ["bold"] = true,
+  },
+  ["NvimTreeSymlink"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["NvimTreeExecFile"] = {
+    ["fg"] = "#99cc99",
+  },
+  ["NvimTreeSpecialFile"] = {
+    ["fg"] = "#cc99cc",
+    ["bold"] = true,
+  },
+  ["NvimTreeIndentMarker"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["NvimTreeGitNew"] = {
+    ["fg"] = "#99cc99",
+  },
+  ["NvimTreeGitDirty"] = {
+    ["fg"] = "#ffcc66",
+  },
+  ["NvimTreeGitDeleted"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["NvimTreeWinSeparator"] = {
+    ["fg"] = "#2d2d2d",
+    ["bg"] = "#f2f0ec",
+  },
+  ["DapBreakpoint"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["DapBreakpointCondition"] = {
+    ["fg"] = "#ffcc66",
+  },
+  ["DapBreakpointRejected"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["DapStopped"] = {
+    ["fg"] = "#99cc99",
+  },
+  ["DapLogPoint"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["DapUIScope"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["DapUIType"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["DapUIValue"] = {
+    ["fg"] = "#2d2d2d",
+  },
+  ["DapUIThread"] = {
+    ["fg"] = "#99cc99",
+  },
+  ["DapUIStoppedThread"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["DapUISource"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["DapUILineNumber"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["DapUIFloatBorder"] = {
+    ["fg"] = "#d3d0c8",
+    ["bg"] = "#f2f0ec",
+  },
+  ["DapUIWatchesValue"] = {
+    ["fg"] = "#99cc99",
+  },
+  ["DapUIWatchesError"] = {
+    ["fg"] = "#f2777a",
+  },
+  ["NvimDapVirtualText"] = {
+    ["fg"] = "#d3d0c8",
+    ["italic"] = true,
+  },
+  ["CmpItemAbbr"] = {
+    ["fg"] = "#2d2d2d",
+  },
+  ["CmpItemAbbrDeprecated"] = {
+    ["fg"] = "#d3d0c8",
+    ["strikethrough"] = true,
+  },
+  ["CmpItemAbbrMatch"] = {
+    ["fg"] = "#6699cc",
+    ["bold"] = true,
+  },
+  ["CmpItemAbbrMatchFuzzy"] = {
+    ["fg"] = "#6699cc",
+    ["bold"] = true,
+  },
+  ["CmpItemMenu"] = {
+    ["fg"] = "#d3d0c8",
+  },
+  ["CmpItemKindText"] = {
+    ["fg"] = "#2d2d2d",
+  },
+  ["CmpItemKindMethod"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["CmpItemKindFunction"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["CmpItemKindConstructor"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["CmpItemKindField"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["CmpItemKindVariable"] = {
+    ["fg"] = "#2d2d2d",
+  },
+  ["CmpItemKindClass"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["CmpItemKindInterface"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["CmpItemKindModule"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["CmpItemKindProperty"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["CmpItemKindUnit"] = {
+    ["fg"] = "#ffcc66",
+  },
+  ["CmpItemKindValue"] = {
+    ["fg"] = "#2d2d2d",
+  },
+  ["CmpItemKindEnum"] = {
+    ["fg"] = "#ffcc66",
+  },
+  ["CmpItemKindKeyword"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["CmpItemKindSnippet"] = {
+    ["fg"] = "#99cc99",
+  },
+  ["CmpItemKindColor"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["CmpItemKindFile"] = {
+    ["fg"] = "#2d2d2d",
+  },
+  ["CmpItemKindReference"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["CmpItemKindFolder"] = {
+    ["fg"] = "#6699cc",
+  },
+  ["CmpItemKindEnumMember"] = {
+    ["fg"] = "#ffcc66",
+  },
+  ["CmpItemKindConstant"] = {
+    ["fg"] = "#2d2d2d",
+  },
+  ["CmpItemKindStruct"] = {
+    ["fg"] = "#66cccc",
+  },
+  ["CmpItemKindEvent"] = {
+    ["fg"] = "#cc99cc",
+  },
+  ["CmpItemKindOperator"] = {
+    ["fg"] = "#2d2d2d",
+  },
+  ["CmpItemKindTypeParameter"] = {
+    ["fg"] = "#66cccc",
+  },
+}
@@ -0,0 +1,263 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette index for Lua consumers (generated); variant data lives in variants/<name>.lua
+local palette = {
+  ["default_variant"] = "modus_operandi",
+  ["default_family"] = "modus",
+  ["families"] = {
+    ["catppuccin"] = {
+      ["name"] = "Catppuccin",
+      ["license"] = "MIT",
+      ["light_variant"] = "catppuccin_latte",
+      ["dark_variant"] = "catppuccin_frappe",
+    },
+    ["catppuccin_macchiato"] = {
+      ["name"] = "Catppuccin Macchiato",
+      ["license"] = "MIT",
+      ["light_variant"] = "catppuccin_latte_macchiato",
+      ["dark_variant"] = "catppuccin_macchiato",
+    },
+    ["catppuccin_mocha"] = {
+      ["name"] = "Catppuccin Mocha",
+      ["license"] = "MIT",
+      ["light_variant"] = "catppuccin_latte_mocha",
+      ["dark_variant"] = "catppuccin_mocha",
+    },
+    ["ef_daynight"] = {
+      ["name"] = "Ef Day/Night",
+      ["license"] = "GPL v3",
+      ["light_variant"] = "ef_day",
+      ["dark_variant"] = "ef_night",
+    },
+    ["ef_deuteranopia"] = {
+      ["name"] = "Ef Deuteranopia",
+      ["license"] = "GPL v3",
+      ["light_variant"] = "ef_deuteranopia_light",
+      ["dark_variant"] = "ef_deuteranopia_dark",
+    },
+    ["ef_duo"] = {
+      ["name"] = "Ef Duo",
+      ["license"] = "GPL v3",
+      ["light_variant"] = "ef_duo_light",
+      ["dark_variant"] = "ef_duo_dark",
+    },
+    ["ef_elea"] = {
+      ["name"] = "Ef Elea",
+      ["license"] = "GPL v3",
+      ["light_variant"] = "ef_elea_light",
+      ["dark_variant"] = "ef_elea_dark",
+    },
+    ["ef_lightdark"] = {
+      ["name"] = "Ef Light/Dark",
+      ["license"] = "GPL v3",
+      ["light_variant"] = "ef_light",
+      ["dark_variant"] = "ef_dark",
+    },
+    ["ef_maris"] = {
+      ["name"] = "Ef Maris",
+      ["license"] = "GPL v3",
+      ["light_variant"] = "ef_maris_light",
+      ["dark_variant"] = "ef_maris_dark",
+    },
+    ["ef_melissa"] = {
+      ["name"] = "Ef Melissa",
+      ["license"] = "GPL v3",
+      ["light_variant"] = "ef_melissa_light",
+      ["dark_variant"] = "ef_melissa_dark",
+    },
+    ["ef_trio"] = {
+      ["name"] = "Ef Trio",
+      ["license"] = "GPL v3",
+      ["light_variant"] = "ef_trio_light",
+      ["dark_variant"] = "ef_trio_dark",
+    },
+    ["ef_tritanopia"] = {
+      ["name"] = "Ef Tritanopia",
+      ["license"] = "GPL v3",
+      ["light_variant"] = "ef_tritanopia_light",
+      ["dark_variant"] = "ef_tritanopia_dark",
+    },
+    ["modus"] = {
+      ["name"] = "Modus Themes",
+      ["license"] = "GPL v3",
+      ["light_variant"] = "modus_operandi",
+      ["dark_variant"] = "modus_vivendi",
+    },
+    ["phajas"] = {
+      ["name"] = "Phajas",
+      ["license"] = "Custom",
+      ["light_variant"] = "phajas_light",
+      ["dark_variant"] = "phajas_dark",
+    },
+  },
+  ["variants"] = {
+    ["catppuccin_latte"] = {
+      ["family"] = "catppuccin",
+      ["flavor"] = "light",
+    },
+    ["catppuccin_frappe"] = {
+      ["family"] = "catppuccin",
+      ["flavor"] = "dark",
+    },
+    ["catppuccin_latte_macchiato"] = {
+      ["family"] = "catppuccin_macchiato",
+      ["flavor"] = "light",
+    },
+    ["catppuccin_macchiato"] = {
+      ["family"] = "catppuccin_macchiato",
+      ["flavor"] = "dark",
+    },
+    ["catppuccin_latte_mocha"] = {
+      ["family"] = "catppuccin_mocha",
+      ["flavor"] = "light",
+    },
+    ["catppuccin_mocha"] = {
+      ["family"] = "catppuccin_mocha",
+      ["flavor"] = "dark",
+    },
+    ["ef_day"] = {
+      ["family"] = "ef_daynight",
+      ["flavor"] = "light",
+    },
+    ["ef_night"] = {
+      ["family"] = "ef_daynight",
+      ["flavor"] = "dark",
+    },
+    ["ef_deuteranopia_light"] = {
+      ["family"] = "ef_deuteranopia",
+      ["flavor"] = "light",
+    },
+    ["ef_deuteranopia_dark"] = {
+      ["family"] = "ef_deuteranopia",
+      ["flavor"] = "dark",
+    },
+    ["ef_duo_light"] = {
+      ["family"] = "ef_duo",
+      ["flavor"] = "light",
+    },
+    ["ef_duo_dark"] = {
+      ["family"] = "ef_duo",
+      ["flavor"] = "dark",
+    },
+    ["ef_elea_light"] = {
+      ["family"] = "ef_elea",
+      ["flavor"] = "light",
+    },
+    ["ef_elea_dark"] = {
+      ["family"] = "ef_elea",
+      ["flavor"] = "dark",
+    },
+    ["ef_light"] = {
+      ["family"] = "ef_lightdark",
+      ["flavor"] = "light",
+    },
+    ["ef_dark"] = {
+      ["family"] = "ef_lightdark",
+      ["flavor"] = "dark",
+    },
+    ["ef_maris_light"] = {
+      ["family"] = "ef_maris",
+      ["flavor"] = "light",
+    },
+    ["ef_maris_dark"] = {
+      ["family"] = "ef_maris",
+      ["flavor"] = "dark",
+    },
+    ["ef_melissa_light"] = {
+      ["family"] = "ef_melissa",
+      ["flavor"] = "light",
+    },
+    ["ef_melissa_dark"] = {
+      ["family"] = "ef_melissa",
+      ["flavor"] = "dark",
+    },
+    ["ef_trio_light"] = {
+      ["family"] = "ef_trio",
+      ["flavor"] = "light",
+    },
+    ["ef_trio_dark"] = {
+      ["family"] = "ef_trio",
+      ["flavor"] = "dark",
+    },
+    ["ef_tritanopia_light"] = {
+      ["family"] = "ef_tritanopia",
+      ["flavor"] = "light",
+    },
+    ["ef_tritanopia_dark"] = {
+      ["family"] = "ef_tritanopia",
+      ["flavor"] = "dark",
+    },
+    ["modus_operandi"] = {
+      ["family"] = "modus",
+      ["flavor"] = "light",
+    },
+    ["modus_vivendi"] = {
+      ["family"] = "modus",
+      ["flavor"] = "dark",
+    },
+    ["modus_operandi_tinted"] = {
+      ["family"] = "modus",
+      ["flavor"] = "light",
+    },
+    ["modus_operandi_deuteranopia"] = {
+      ["family"] = "modus",
+      ["flavor"] = "light",
+    },
+    ["modus_operandi_tritanopia"] = {
+      ["family"] = "modus",
+      ["flavor"] = "light",
+    },
+    ["modus_vivendi_tinted"] = {
+      ["family"] = "modus",
+      ["flavor"] = "dark",
+    },
+    ["modus_vivendi_deuteranopia"] = {
+      ["family"] = "modus",
+      ["flavor"] = "dark",
+    },
+    ["modus_vivendi_tritanopia"] = {
+      ["family"] = "modus",
+      ["flavor"] = "dark",
+    },
+    ["phajas_dark"] = {
+      ["family"] = "phajas",
+      ["flavor"] = "dark",
+    },
+    ["phajas_light"] = {
+      ["family"] = "phajas",
+      ["flavor"] = "light",
+    },
+  },
+}
+
+local function merge_palette(target, extra)
+  if type(extra) ~= "table" then
+    return
+  end
+  if extra.families then
+    target.families = target.families or {}
+    for name, payload in pairs(extra.families) do
+      target.families[name] = payload
+    end
+  end
+  if extra.variants then
+    target.variants = target.variants or {}
+    for name, payload in pairs(extra.variants) do
+      target.variants[name] = payload
+    end
+  end
+end
+
+local function merge_wallpaper_palette(palette)
+  if type(vim) ~= "table" or not vim.fn or not vim.fn.stdpath then
+    return
+  end
+  local path = vim.fn.stdpath("config") .. "/lua/phajas/colors/index_wallpaper.lua"
+  local ok, extra = pcall(dofile, path)
+  if ok then
+    merge_palette(palette, extra)
+  end
+end
+
+merge_wallpaper_palette(palette)
+
+return palette
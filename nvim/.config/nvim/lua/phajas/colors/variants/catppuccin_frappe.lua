@@ -0,0 +1,199 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: catppuccin_frappe (Catppuccin family)
+-- License: MIT (see colors/LICENSE-catppuccin)
+-- Catppuccin © 2021-present Catppuccin Org
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "catppuccin",
+  ["flavor"] = "dark",
+  ["foreground"] = "#c6d0f5",
+  ["background"] = "#303446",
+  ["cursor"] = "#c6d0f5",
+  ["selection_background"] = "#ca9ee6",
+  ["selection_foreground"] = "#303446",
+  ["ansi"] = {
+    "#51576d",
+    "#e78284",
+    "#a6d189",
+    "#e5c890",
+    "#8caaee",
+    "#f4b8e4",
+    "#81c8be",
+    "#a5adce",
+    "#626880",
+    "#e67172",
+    "#8ec772",
+    "#d9ba73",
+    "#7b9ef0",
+    "#f2a4db",
+    "#5abfb5",
+    "#b5bfe2",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#303446",
+    ["bg_dim"] = "#292c3c",
+    ["bg_alt"] = "#232634",
+    ["fg_main"] = "#c6d0f5",
+    ["fg_dim"] = "#b5bfe2",
+    ["fg_alt"] = "#a5adce",
+    ["border"] = "#737994",
+    ["border_highlight"] = "#838ba7",
+    ["red"] = "#e78284",
+    ["red_warmer"] = "#ef9f76",
+    ["red_cooler"] = "#ea999c",
+    ["red_faint"] = "#f4b8e4",
+    ["green"] = "#a6d189",
+    ["green_warmer"] = "#a6d189",
+    ["green_cooler"] = "#81c8be",
+    ["green_faint"] = "#81c8be",
+    ["yellow"] = "#e5c890",
+    ["yellow_warmer"] = "#ef9f76",
+    ["yellow_cooler"] = "#e5c890",
+    ["yellow_faint"] = "#e5c890",
+    ["blue"] = "#8caaee",
+    ["blue_warmer"] = "#babbf1",
+    ["blue_cooler"] = "#85c1dc",
+    ["blue_faint"] = "#99d1db",
+    ["magenta"] = "#ca9ee6",
+    ["magenta_warmer"] = "#f4b8e4",
+    ["magenta_cooler"] = "#ca9ee6",
+    ["magenta_faint"] = "#f4b8e4",
+    ["cyan"] = "#81c8be",
+    ["cyan_warmer"] = "#99d1db",
+    ["cyan_cooler"] = "#85c1dc",
+    ["cyan_faint"] = "#99d1db",
+    ["rust"] = "#ef9f76",
+    ["gold"] = "#e5c890",
+    ["olive"] = "#a6d189",
+    ["slate"] = "#8caaee",
+    ["indigo"] = "#ca9ee6",
+    ["maroon"] = "#ea999c",
+    ["pink"] = "#f4b8e4",
+    ["red_intense"] = "#e78284",
+    ["green_intense"] = "#a6d189",
+    ["yellow_intense"] = "#e5c890",
+    ["blue_intense"] = "#8caaee",
+    ["magenta_intense"] = "#ca9ee6",
+    ["cyan_intense"] = "#81c8be",
+    ["bg_red_intense"] = "#f2d5cf",
+    ["bg_green_intense"] = "#a6d189",
+    ["bg_yellow_intense"] = "#e5c890",
+    ["bg_blue_intense"] = "#8caaee",
+    ["bg_magenta_intense"] = "#ca9ee6",
+    ["bg_cyan_intense"] = "#99d1db",
+    ["bg_red_subtle"] = "#eebebe",
+    ["bg_green_subtle"] = "#81c8be",
+    ["bg_yellow_subtle"] = "#ef9f76",
+    ["bg_blue_subtle"] = "#babbf1",
+    ["bg_magenta_subtle"] = "#f4b8e4",
+    ["bg_cyan_subtle"] = "#85c1dc",
+    ["bg_red_nuanced"] = "#eebebe",
+    ["bg_green_nuanced"] = "#81c8be",
+    ["bg_yellow_nuanced"] = "#ef9f76",
+    ["bg_blue_nuanced"] = "#babbf1",
+    ["bg_magenta_nuanced"] = "#f4b8e4",
+    ["bg_cyan_nuanced"] = "#85c1dc",
+    ["bg_active"] = "#414559",
+    ["fg_active"] = "#c6d0f5",
+    ["bg_inactive"] = "#51576d",
+    ["fg_inactive"] = "#b5bfe2",
+    ["bg_active_argument"] = "#414559",
+    ["bg_active_value"] = "#414559",
+    ["bg_completion"] = "#414559",
+    ["bg_hl_line"] = "#292c3c",
+    ["bg_paren_match"] = "#99d1db",
+    ["bg_paren_expression"] = "#ca9ee6",
+    ["bg_char_0"] = "#99d1db",
+    ["bg_char_1"] = "#f4b8e4",
+    ["bg_char_2"] = "#e5c890",
+    ["bg_region"] = "#ca9ee6",
+    ["bg_status_line_active"] = "#232634",
+    ["fg_status_line_active"] = "#c6d0f5",
+    ["bg_status_line_inactive"] = "#292c3c",
+    ["fg_status_line_inactive"] = "#b5bfe2",
+    ["bg_tab_bar"] = "#232634",
+    ["bg_tab_current"] = "#303446",
+    ["bg_tab_other"] = "#292c3c",
+    ["fg_tab_other"] = "#b5bfe2",
+    ["bg_tab_alternate"] = "#ca9ee6",
+    ["bg_added"] = "#414559",
+    ["bg_added_faint"] = "#303446",
+    ["bg_added_refine"] = "#a6d189",
+    ["bg_added_fringe"] = "#a6d189",
+    ["fg_added"] = "#a6d189",
+    ["fg_added_intense"] = "#a6d189",
+    ["bg_changed"] = "#414559",
+    ["bg_changed_faint"] = "#303446",
+    ["bg_changed_refine"] = "#e5c890",
+    ["bg_changed_fringe"] = "#e5c890",
+    ["fg_changed"] = "#e5c890",
+    ["fg_changed_intense"] = "#e5c890",
+    ["bg_removed"] = "#414559",
+    ["bg_removed_faint"] = "#303446",
+    ["bg_removed_refine"] = "#e78284",
+    ["bg_removed_fringe"] = "#e78284",
+    ["fg_removed"] = "#e78284",
+    ["fg_removed_intense"] = "#e78284",
+    ["bg_diff_context"] = "#303446",
+    ["tinted_bg_main"] = "#292c3c",
+    ["tinted_bg_dim"] = "#232634",
+    ["tinted_border"] = "#737994",
+    ["tinted_border_highlight"] = "#838ba7",
+    ["tinted_bg_active"] = "#51576d",
+    ["tinted_bg_inactive"] = "#414559",
+    ["tinted_red_faint"] = "#eebebe",
+    ["tinted_bg_red_nuanced"] = "#292c3c",
+    ["tinted_bg_green_nuanced"] = "#292c3c",
+    ["tinted_bg_yellow_nuanced"] = "#292c3c",
+    ["tinted_bg_blue_nuanced"] = "#292c3c",
+    ["tinted_bg_magenta_nuanced"] = "#292c3c",
+    ["tinted_bg_cyan_nuanced"] = "#292c3c",
+    ["tinted_bg_completion"] = "#51576d",
+    ["tinted_bg_hl_line"] = "#232634",
+    ["tinted_bg_paren_match"] = "#99d1db",
+    ["tinted_bg_status_line_active"] = "#232634",
+    ["tinted_bg_status_line_inactive"] = "#292c3c",
+    ["tinted_bg_tab_bar"] = "#232634",
+    ["tinted_bg_tab_current"] = "#292c3c",
+    ["tinted_bg_tab_other"] = "#51576d",
+    ["tinted_bg_tab_alternate"] = "#ca9ee6",
+    ["tinted_bg_added"] = "#414559",
+    ["tinted_bg_added_faint"] = "#292c3c",
+    ["tinted_bg_added_refine"] = "#a6d189",
+    ["tinted_bg_added_fringe"] = "#a6d189",
+    ["tinted_bg_changed_fringe"] = "#e5c890",
+    ["tinted_bg_removed"] = "#414559",
+    ["tinted_bg_removed_faint"] = "#292c3c",
+    ["tinted_bg_removed_refine"] = "#e78284",
+    ["tinted_bg_removed_fringe"] = "#e78284",
+    ["tinted_bg_diff_context"] = "#292c3c",
+    ["visual"] = "#ca9ee6",
+    ["link"] = "#8caaee",
+    ["link_visited"] = "#ca9ee6",
+    ["link_symbolic"] = "#81c8be",
+    ["string"] = "#a6d189",
+    ["comment"] = "#838ba7",
+    ["constant"] = "#ef9f76",
+    ["identifier"] = "#8caaee",
+    ["keyword"] = "#ca9ee6",
+    ["type"] = "#e5c890",
+    ["fnname"] = "#8caaee",
+    ["variable"] = "#e78284",
+    ["rainbow_0"] = "#e78284",
+    ["rainbow_1"] = "#a6d189",
+    ["rainbow_2"] = "#e5c890",
+    ["rainbow_3"] = "#8caaee",
+    ["rainbow_4"] = "#ca9ee6",
+    ["rainbow_5"] = "#81c8be",
+    ["rainbow_6"] = "#f4b8e4",
+    ["rainbow_7"] = "#ef9f76",
+    ["prose_todo"] = "#e78284",
+    ["prose_done"] = "#a6d189",
+    ["prose_tag"] = "#ca9ee6",
+    ["prose_table"] = "#8caaee",
+    ["err"] = "#e78284",
+    ["warning"] = "#e5c890",
+    ["info"] = "#8caaee",
+  },
+}
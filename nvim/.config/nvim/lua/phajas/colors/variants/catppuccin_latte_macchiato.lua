@@ -0,0 +1,198 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: catppuccin_latte_macchiato (Catppuccin Macchiato family)
+-- License: GPL v3 (see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "catppuccin_macchiato",
+  ["flavor"] = "light",
+  ["foreground"] = "#4c4f69",
+  ["background"] = "#eff1f5",
+  ["cursor"] = "#4c4f69",
+  ["selection_background"] = "#8839ef",
+  ["selection_foreground"] = "#eff1f5",
+  ["ansi"] = {
+    "#5c5f77",
+    "#d20f39",
+    "#40a02b",
+    "#df8e1d",
+    "#1e66f5",
+    "#ea76cb",
+    "#179299",
+    "#acb0be",
+    "#6c6f85",
+    "#de293e",
+    "#49af3d",
+    "#eea02d",
+    "#456eff",
+    "#fe85d8",
+    "#2d9fa8",
+    "#bcc0cc",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#eff1f5",
+    ["bg_dim"] = "#e6e9ef",
+    ["bg_alt"] = "#dce0e8",
+    ["fg_main"] = "#4c4f69",
+    ["fg_dim"] = "#5c5f77",
+    ["fg_alt"] = "#6c6f85",
+    ["border"] = "#9ca0b0",
+    ["border_highlight"] = "#8c8fa1",
+    ["red"] = "#d20f39",
+    ["red_warmer"] = "#fe640b",
+    ["red_cooler"] = "#e64553",
+    ["red_faint"] = "#ea76cb",
+    ["green"] = "#40a02b",
+    ["green_warmer"] = "#40a02b",
+    ["green_cooler"] = "#179299",
+    ["green_faint"] = "#179299",
+    ["yellow"] = "#df8e1d",
+    ["yellow_warmer"] = "#fe640b",
+    ["yellow_cooler"] = "#df8e1d",
+    ["yellow_faint"] = "#df8e1d",
+    ["blue"] = "#1e66f5",
+    ["blue_warmer"] = "#7287fd",
+    ["blue_cooler"] = "#209fb5",
+    ["blue_faint"] = "#04a5e5",
+    ["magenta"] = "#8839ef",
+    ["magenta_warmer"] = "#ea76cb",
+    ["magenta_cooler"] = "#8839ef",
+    ["magenta_faint"] = "#ea76cb",
+    ["cyan"] = "#179299",
+    ["cyan_warmer"] = "#04a5e5",
+    ["cyan_cooler"] = "#209fb5",
+    ["cyan_faint"] = "#04a5e5",
+    ["rust"] = "#fe640b",
+    ["gold"] = "#df8e1d",
+    ["olive"] = "#40a02b",
+    ["slate"] = "#1e66f5",
+    ["indigo"] = "#8839ef",
+    ["maroon"] = "#e64553",
+    ["pink"] = "#ea76cb",
+    ["red_intense"] = "#d20f39",
+    ["green_intense"] = "#40a02b",
+    ["yellow_intense"] = "#df8e1d",
+    ["blue_intense"] = "#1e66f5",
+    ["magenta_intense"] = "#8839ef",
+    ["cyan_intense"] = "#179299",
+    ["bg_red_intense"] = "#dc8a78",
+    ["bg_green_intense"] = "#40a02b",
+    ["bg_yellow_intense"] = "#df8e1d",
+    ["bg_blue_intense"] = "#1e66f5",
+    ["bg_magenta_intense"] = "#8839ef",
+    ["bg_cyan_intense"] = "#04a5e5",
+    ["bg_red_subtle"] = "#dd7878",
+    ["bg_green_subtle"] = "#179299",
+    ["bg_yellow_subtle"] = "#fe640b",
+    ["bg_blue_subtle"] = "#7287fd",
+    ["bg_magenta_subtle"] = "#ea76cb",
+    ["bg_cyan_subtle"] = "#209fb5",
+    ["bg_red_nuanced"] = "#dd7878",
+    ["bg_green_nuanced"] = "#179299",
+    ["bg_yellow_nuanced"] = "#fe640b",
+    ["bg_blue_nuanced"] = "#7287fd",
+    ["bg_magenta_nuanced"] = "#ea76cb",
+    ["bg_cyan_nuanced"] = "#209fb5",
+    ["bg_active"] = "#ccd0da",
+    ["fg_active"] = "#4c4f69",
+    ["bg_inactive"] = "#bcc0cc",
+    ["fg_inactive"] = "#5c5f77",
+    ["bg_active_argument"] = "#ccd0da",
+    ["bg_active_value"] = "#ccd0da",
+    ["bg_completion"] = "#ccd0da",
+    ["bg_hl_line"] = "#e6e9ef",
+    ["bg_paren_match"] = "#04a5e5",
+    ["bg_paren_expression"] = "#8839ef",
+    ["bg_char_0"] = "#04a5e5",
+    ["bg_char_1"] = "#ea76cb",
+    ["bg_char_2"] = "#df8e1d",
+    ["bg_region"] = "#8839ef",
+    ["bg_status_line_active"] = "#dce0e8",
+    ["fg_status_line_active"] = "#4c4f69",
+    ["bg_status_line_inactive"] = "#e6e9ef",
+    ["fg_status_line_inactive"] = "#5c5f77",
+    ["bg_tab_bar"] = "#dce0e8",
+    ["bg_tab_current"] = "#eff1f5",
+    ["bg_tab_other"] = "#e6e9ef",
+    ["fg_tab_other"] = "#5c5f77",
+    ["bg_tab_alternate"] = "#8839ef",
+    ["bg_added"] = "#ccd0da",
+    ["bg_added_faint"] = "#eff1f5",
+    ["bg_added_refine"] = "#40a02b",
+    ["bg_added_fringe"] = "#40a02b",
+    ["fg_added"] = "#40a02b",
+    ["fg_added_intense"] = "#40a02b",
+    ["bg_changed"] = "#ccd0da",
+    ["bg_changed_faint"] = "#eff1f5",
+    ["bg_changed_refine"] = "#df8e1d",
+    ["bg_changed_fringe"] = "#df8e1d",
+    ["fg_changed"] = "#df8e1d",
+    ["fg_changed_intense"] = "#df8e1d",
+    ["bg_removed"] = "#ccd0da",
+    ["bg_removed_faint"] = "#eff1f5",
+    ["bg_removed_refine"] = "#d20f39",
+    ["bg_removed_fringe"] = "#d20f39",
+    ["fg_removed"] = "#d20f39",
+    ["fg_removed_intense"] = "#d20f39",
+    ["bg_diff_context"] = "#eff1f5",
+    ["tinted_bg_main"] = "#e6e9ef",
+    ["tinted_bg_dim"] = "#dce0e8",
+    ["tinted_border"] = "#9ca0b0",
+    ["tinted_border_highlight"] = "#8c8fa1",
+    ["tinted_bg_active"] = "#bcc0cc",
+    ["tinted_bg_inactive"] = "#ccd0da",
+    ["tinted_red_faint"] = "#dd7878",
+    ["tinted_bg_red_nuanced"] = "#e6e9ef",
+    ["tinted_bg_green_nuanced"] = "#e6e9ef",
+    ["tinted_bg_yellow_nuanced"] = "#e6e9ef",
+    ["tinted_bg_blue_nuanced"] = "#e6e9ef",
+    ["tinted_bg_magenta_nuanced"] = "#e6e9ef",
+    ["tinted_bg_cyan_nuanced"] = "#e6e9ef",
+    ["tinted_bg_completion"] = "#bcc0cc",
+    ["tinted_bg_hl_line"] = "#dce0e8",
+    ["tinted_bg_paren_match"] = "#04a5e5",
+    ["tinted_bg_status_line_active"] = "#dce0e8",
+    ["tinted_bg_status_line_inactive"] = "#e6e9ef",
+    ["tinted_bg_tab_bar"] = "#dce0e8",
+    ["tinted_bg_tab_current"] = "#e6e9ef",
+    ["tinted_bg_tab_other"] = "#bcc0cc",
+    ["tinted_bg_tab_alternate"] = "#8839ef",
+    ["tinted_bg_added"] = "#ccd0da",
+    ["tinted_bg_added_faint"] = "#e6e9ef",
+    ["tinted_bg_added_refine"] = "#40a02b",
+    ["tinted_bg_added_fringe"] = "#40a02b",
+    ["tinted_bg_changed_fringe"] = "#df8e1d",
+    ["tinted_bg_removed"] = "#ccd0da",
+    ["tinted_bg_removed_faint"] = "#e6e9ef",
+    ["tinted_bg_removed_refine"] = "#d20f39",
+    ["tinted_bg_removed_fringe"] = "#d20f39",
+    ["tinted_bg_diff_context"] = "#e6e9ef",
+    ["visual"] = "#8839ef",
+    ["link"] = "#1e66f5",
+    ["link_visited"] = "#8839ef",
+    ["link_symbolic"] = "#179299",
+    ["string"] = "#40a02b",
+    ["comment"] = "#8c8fa1",
+    ["constant"] = "#fe640b",
+    ["identifier"] = "#1e66f5",
+    ["keyword"] = "#8839ef",
+    ["type"] = "#df8e1d",
+    ["fnname"] = "#1e66f5",
+    ["variable"] = "#d20f39",
+    ["rainbow_0"] = "#d20f39",
+    ["rainbow_1"] = "#40a02b",
+    ["rainbow_2"] = "#df8e1d",
+    ["rainbow_3"] = "#1e66f5",
+    ["rainbow_4"] = "#8839ef",
+    ["rainbow_5"] = "#179299",
+    ["rainbow_6"] = "#ea76cb",
+    ["rainbow_7"] = "#fe640b",
+    ["prose_todo"] = "#d20f39",
+    ["prose_done"] = "#40a02b",
+    ["prose_tag"] = "#8839ef",
+    ["prose_table"] = "#1e66f5",
+    ["err"] = "#d20f39",
+    ["warning"] = "#df8e1d",
+    ["info"] = "#1e66f5",
+  },
+}
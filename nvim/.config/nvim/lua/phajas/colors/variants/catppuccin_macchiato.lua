@@ -0,0 +1,198 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: catppuccin_macchiato (Catppuccin Macchiato family)
+-- License: GPL v3 (see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "catppuccin_macchiato",
+  ["flavor"] = "dark",
+  ["foreground"] = "#cad3f5",
+  ["background"] = "#24273a",
+  ["cursor"] = "#cad3f5",
+  ["selection_background"] = "#c6a0f6",
+  ["selection_foreground"] = "#24273a",
+  ["ansi"] = {
+    "#494d64",
+    "#ed8796",
+    "#a6da95",
+    "#eed49f",
+    "#8aadf4",
+    "#f5bde6",
+    "#8bd5ca",
+    "#a5adcb",
+    "#5b6078",
+    "#ec7486",
+    "#8ccf7f",
+    "#e1c682",
+    "#78a1f6",
+    "#f2a9dd",
+    "#63cbc0",
+    "#b8c0e0",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#24273a",
+    ["bg_dim"] = "#1e2030",
+    ["bg_alt"] = "#181926",
+    ["fg_main"] = "#cad3f5",
+    ["fg_dim"] = "#b8c0e0",
+    ["fg_alt"] = "#a5adcb",
+    ["border"] = "#6e738d",
+    ["border_highlight"] = "#8087a2",
+    ["red"] = "#ed8796",
+    ["red_warmer"] = "#f5a97f",
+    ["red_cooler"] = "#ee99a0",
+    ["red_faint"] = "#f5bde6",
+    ["green"] = "#a6da95",
+    ["green_warmer"] = "#a6da95",
+    ["green_cooler"] = "#8bd5ca",
+    ["green_faint"] = "#8bd5ca",
+    ["yellow"] = "#eed49f",
+    ["yellow_warmer"] = "#f5a97f",
+    ["yellow_cooler"] = "#eed49f",
+    ["yellow_faint"] = "#eed49f",
+    ["blue"] = "#8aadf4",
+    ["blue_warmer"] = "#b7bdf8",
+    ["blue_cooler"] = "#7dc4e4",
+    ["blue_faint"] = "#91d7e3",
+    ["magenta"] = "#c6a0f6",
+    ["magenta_warmer"] = "#f5bde6",
+    ["magenta_cooler"] = "#c6a0f6",
+    ["magenta_faint"] = "#f5bde6",
+    ["cyan"] = "#8bd5ca",
+    ["cyan_warmer"] = "#91d7e3",
+    ["cyan_cooler"] = "#7dc4e4",
+    ["cyan_faint"] = "#91d7e3",
+    ["rust"] = "#f5a97f",
+    ["gold"] = "#eed49f",
+    ["olive"] = "#a6da95",
+    ["slate"] = "#8aadf4",
+    ["indigo"] = "#c6a0f6",
+    ["maroon"] = "#ee99a0",
+    ["pink"] = "#f5bde6",
+    ["red_intense"] = "#ed8796",
+    ["green_intense"] = "#a6da95",
+    ["yellow_intense"] = "#eed49f",
+    ["blue_intense"] = "#8aadf4",
+    ["magenta_intense"] = "#c6a0f6",
+    ["cyan_intense"] = "#8bd5ca",
+    ["bg_red_intense"] = "#f4dbd6",
+    ["bg_green_intense"] = "#a6da95",
+    ["bg_yellow_intense"] = "#eed49f",
+    ["bg_blue_intense"] = "#8aadf4",
+    ["bg_magenta_intense"] = "#c6a0f6",
+    ["bg_cyan_intense"] = "#91d7e3",
+    ["bg_red_subtle"] = "#f0c6c6",
+    ["bg_green_subtle"] = "#8bd5ca",
+    ["bg_yellow_subtle"] = "#f5a97f",
+    ["bg_blue_subtle"] = "#b7bdf8",
+    ["bg_magenta_subtle"] = "#f5bde6",
+    ["bg_cyan_subtle"] = "#7dc4e4",
+    ["bg_red_nuanced"] = "#f0c6c6",
+    ["bg_green_nuanced"] = "#8bd5ca",
+    ["bg_yellow_nuanced"] = "#f5a97f",
+    ["bg_blue_nuanced"] = "#b7bdf8",
+    ["bg_magenta_nuanced"] = "#f5bde6",
+    ["bg_cyan_nuanced"] = "#7dc4e4",
+    ["bg_active"] = "#363a4f",
+    ["fg_active"] = "#cad3f5",
+    ["bg_inactive"] = "#494d64",
+    ["fg_inactive"] = "#b8c0e0",
+    ["bg_active_argument"] = "#363a4f",
+    ["bg_active_value"] = "#363a4f",
+    ["bg_completion"] = "#363a4f",
+    ["bg_hl_line"] = "#1e2030",
+    ["bg_paren_match"] = "#91d7e3",
+    ["bg_paren_expression"] = "#c6a0f6",
+    ["bg_char_0"] = "#91d7e3",
+    ["bg_char_1"] = "#f5bde6",
+    ["bg_char_2"] = "#eed49f",
+    ["bg_region"] = "#c6a0f6",
+    ["bg_status_line_active"] = "#181926",
+    ["fg_status_line_active"] = "#cad3f5",
+    ["bg_status_line_inactive"] = "#1e2030",
+    ["fg_status_line_inactive"] = "#b8c0e0",
+    ["bg_tab_bar"] = "#181926",
+    ["bg_tab_current"] = "#24273a",
+    ["bg_tab_other"] = "#1e2030",
+    ["fg_tab_other"] = "#b8c0e0",
+    ["bg_tab_alternate"] = "#c6a0f6",
+    ["bg_added"] = "#363a4f",
+    ["bg_added_faint"] = "#24273a",
+    ["bg_added_refine"] = "#a6da95",
+    ["bg_added_fringe"] = "#a6da95",
+    ["fg_added"] = "#a6da95",
+    ["fg_added_intense"] = "#a6da95",
+    ["bg_changed"] = "#363a4f",
+    ["bg_changed_faint"] = "#24273a",
+    ["bg_changed_refine"] = "#eed49f",
+    ["bg_changed_fringe"] = "#eed49f",
+    ["fg_changed"] = "#eed49f",
+    ["fg_changed_intense"] = "#eed49f",
+    ["bg_removed"] = "#363a4f",
+    ["bg_removed_faint"] = "#24273a",
+    ["bg_removed_refine"] = "#ed8796",
+    ["bg_removed_fringe"] = "#ed8796",
+    ["fg_removed"] = "#ed8796",
+    ["fg_removed_intense"] = "#ed8796",
+    ["bg_diff_context"] = "#24273a",
+    ["tinted_bg_main"] = "#1e2030",
+    ["tinted_bg_dim"] = "#181926",
+    ["tinted_border"] = "#6e738d",
+    ["tinted_border_highlight"] = "#8087a2",
+    ["tinted_bg_active"] = "#494d64",
+    ["tinted_bg_inactive"] = "#363a4f",
+    ["tinted_red_faint"] = "#f0c6c6",
+    ["tinted_bg_red_nuanced"] = "#1e2030",
+    ["tinted_bg_green_nuanced"] = "#1e2030",
+    ["tinted_bg_yellow_nuanced"] = "#1e2030",
+    ["tinted_bg_blue_nuanced"] = "#1e2030",
+    ["tinted_bg_magenta_nuanced"] = "#1e2030",
+    ["tinted_bg_cyan_nuanced"] = "#1e2030",
+    ["tinted_bg_completion"] = "#494d64",
+    ["tinted_bg_hl_line"] = "#181926",
+    ["tinted_bg_paren_match"] = "#91d7e3",
+    ["tinted_bg_status_line_active"] = "#181926",
+    ["tinted_bg_status_line_inactive"] = "#1e2030",
+    ["tinted_bg_tab_bar"] = "#181926",
+    ["tinted_bg_tab_current"] = "#1e2030",
+    ["tinted_bg_tab_other"] = "#494d64",
+    ["tinted_bg_tab_alternate"] = "#c6a0f6",
+    ["tinted_bg_added"] = "#363a4f",
+    ["tinted_bg_added_faint"] = "#1e2030",
+    ["tinted_bg_added_refine"] = "#a6da95",
+    ["tinted_bg_added_fringe"] = "#a6da95",
+    ["tinted_bg_changed_fringe"] = "#eed49f",
+    ["tinted_bg_removed"] = "#363a4f",
+    ["tinted_bg_removed_faint"] = "#1e2030",
+    ["tinted_bg_removed_refine"] = "#ed8796",
+    ["tinted_bg_removed_fringe"] = "#ed8796",
+    ["tinted_bg_diff_context"] = "#1e2030",
+    ["visual"] = "#c6a0f6",
+    ["link"] = "#8aadf4",
+    ["link_visited"] = "#c6a0f6",
+    ["link_symbolic"] = "#8bd5ca",
+    ["string"] = "#a6da95",
+    ["comment"] = "#8087a2",
+    ["constant"] = "#f5a97f",
+    ["identifier"] = "#8aadf4",
+    ["keyword"] = "#c6a0f6",
+    ["type"] = "#eed49f",
+    ["fnname"] = "#8aadf4",
+    ["variable"] = "#ed8796",
+    ["rainbow_0"] = "#ed8796",
+    ["rainbow_1"] = "#a6da95",
+    ["rainbow_2"] = "#eed49f",
+    ["rainbow_3"] = "#8aadf4",
+    ["rainbow_4"] = "#c6a0f6",
+    ["rainbow_5"] = "#8bd5ca",
+    ["rainbow_6"] = "#f5bde6",
+    ["rainbow_7"] = "#f5a97f",
+    ["prose_todo"] = "#ed8796",
+    ["prose_done"] = "#a6da95",
+    ["prose_tag"] = "#c6a0f6",
+    ["prose_table"] = "#8aadf4",
+    ["err"] = "#ed8796",
+    ["warning"] = "#eed49f",
+    ["info"] = "#8aadf4",
+  },
+}
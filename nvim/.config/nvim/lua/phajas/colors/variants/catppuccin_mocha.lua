@@ -0,0 +1,198 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: catppuccin_mocha (Catppuccin Mocha family)
+-- License: GPL v3 (see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "catppuccin_mocha",
+  ["flavor"] = "dark",
+  ["foreground"] = "#cdd6f4",
+  ["background"] = "#1e1e2e",
+  ["cursor"] = "#cdd6f4",
+  ["selection_background"] = "#cba6f7",
+  ["selection_foreground"] = "#1e1e2e",
+  ["ansi"] = {
+    "#45475a",
+    "#f38ba8",
+    "#a6e3a1",
+    "#f9e2af",
+    "#89b4fa",
+    "#f5c2e7",
+    "#94e2d5",
+    "#a6adc8",
+    "#585b70",
+    "#f37799",
+    "#89d88b",
+    "#ebd391",
+    "#74a8fc",
+    "#f2aede",
+    "#6bd7ca",
+    "#bac2de",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#1e1e2e",
+    ["bg_dim"] = "#181825",
+    ["bg_alt"] = "#11111b",
+    ["fg_main"] = "#cdd6f4",
+    ["fg_dim"] = "#bac2de",
+    ["fg_alt"] = "#a6adc8",
+    ["border"] = "#6c7086",
+    ["border_highlight"] = "#7f849c",
+    ["red"] = "#f38ba8",
+    ["red_warmer"] = "#fab387",
+    ["red_cooler"] = "#eba0ac",
+    ["red_faint"] = "#f5c2e7",
+    ["green"] = "#a6e3a1",
+    ["green_warmer"] = "#a6e3a1",
+    ["green_cooler"] = "#94e2d5",
+    ["green_faint"] = "#94e2d5",
+    ["yellow"] = "#f9e2af",
+    ["yellow_warmer"] = "#fab387",
+    ["yellow_cooler"] = "#f9e2af",
+    ["yellow_faint"] = "#f9e2af",
+    ["blue"] = "#89b4fa",
+    ["blue_warmer"] = "#b4befe",
+    ["blue_cooler"] = "#74c7ec",
+    ["blue_faint"] = "#89dceb",
+    ["magenta"] = "#cba6f7",
+    ["magenta_warmer"] = "#f5c2e7",
+    ["magenta_cooler"] = "#cba6f7",
+    ["magenta_faint"] = "#f5c2e7",
+    ["cyan"] = "#94e2d5",
+    ["cyan_warmer"] = "#89dceb",
+    ["cyan_cooler"] = "#74c7ec",
+    ["cyan_faint"] = "#89dceb",
+    ["rust"] = "#fab387",
+    ["gold"] = "#f9e2af",
+    ["olive"] = "#a6e3a1",
+    ["slate"] = "#89b4fa",
+    ["indigo"] = "#cba6f7",
+    ["maroon"] = "#eba0ac",
+    ["pink"] = "#f5c2e7",
+    ["red_intense"] = "#f38ba8",
+    ["green_intense"] = "#a6e3a1",
+    ["yellow_intense"] = "#f9e2af",
+    ["blue_intense"] = "#89b4fa",
+    ["magenta_intense"] = "#cba6f7",
+    ["cyan_intense"] = "#94e2d5",
+    ["bg_red_intense"] = "#f5e0dc",
+    ["bg_green_intense"] = "#a6e3a1",
+    ["bg_yellow_intense"] = "#f9e2af",
+    ["bg_blue_intense"] = "#89b4fa",
+    ["bg_magenta_intense"] = "#cba6f7",
+    ["bg_cyan_intense"] = "#89dceb",
+    ["bg_red_subtle"] = "#f2cdcd",
+    ["bg_green_subtle"] = "#94e2d5",
+    ["bg_yellow_subtle"] = "#fab387",
+    ["bg_blue_subtle"] = "#b4befe",
+    ["bg_magenta_subtle"] = "#f5c2e7",
+    ["bg_cyan_subtle"] = "#74c7ec",
+    ["bg_red_nuanced"] = "#f2cdcd",
+    ["bg_green_nuanced"] = "#94e2d5",
+    ["bg_yellow_nuanced"] = "#fab387",
+    ["bg_blue_nuanced"] = "#b4befe",
+    ["bg_magenta_nuanced"] = "#f5c2e7",
+    ["bg_cyan_nuanced"] = "#74c7ec",
+    ["bg_active"] = "#313244",
+    ["fg_active"] = "#cdd6f4",
+    ["bg_inactive"] = "#45475a",
+    ["fg_inactive"] = "#bac2de",
+    ["bg_active_argument"] = "#313244",
+    ["bg_active_value"] = "#313244",
+    ["bg_completion"] = "#313244",
+    ["bg_hl_line"] = "#181825",
+    ["bg_paren_match"] = "#89dceb",
+    ["bg_paren_expression"] = "#cba6f7",
+    ["bg_char_0"] = "#89dceb",
+    ["bg_char_1"] = "#f5c2e7",
+    ["bg_char_2"] = "#f9e2af",
+    ["bg_region"] = "#cba6f7",
+    ["bg_status_line_active"] = "#11111b",
+    ["fg_status_line_active"] = "#cdd6f4",
+    ["bg_status_line_inactive"] = "#181825",
+    ["fg_status_line_inactive"] = "#bac2de",
+    ["bg_tab_bar"] = "#11111b",
+    ["bg_tab_current"] = "#1e1e2e",
+    ["bg_tab_other"] = "#181825",
+    ["fg_tab_other"] = "#bac2de",
+    ["bg_tab_alternate"] = "#cba6f7",
+    ["bg_added"] = "#313244",
+    ["bg_added_faint"] = "#1e1e2e",
+    ["bg_added_refine"] = "#a6e3a1",
+    ["bg_added_fringe"] = "#a6e3a1",
+    ["fg_added"] = "#a6e3a1",
+    ["fg_added_intense"] = "#a6e3a1",
+    ["bg_changed"] = "#313244",
+    ["bg_changed_faint"] = "#1e1e2e",
+    ["bg_changed_refine"] = "#f9e2af",
+    ["bg_changed_fringe"] = "#f9e2af",
+    ["fg_changed"] = "#f9e2af",
+    ["fg_changed_intense"] = "#f9e2af",
+    ["bg_removed"] = "#313244",
+    ["bg_removed_faint"] = "#1e1e2e",
+    ["bg_removed_refine"] = "#f38ba8",
+    ["bg_removed_fringe"] = "#f38ba8",
+    ["fg_removed"] = "#f38ba8",
+    ["fg_removed_intense"] = "#f38ba8",
+    ["bg_diff_context"] = "#1e1e2e",
+    ["tinted_bg_main"] = "#181825",
+    ["tinted_bg_dim"] = "#11111b",
+    ["tinted_border"] = "#6c7086",
+    ["tinted_border_highlight"] = "#7f849c",
+    ["tinted_bg_active"] = "#45475a",
+    ["tinted_bg_inactive"] = "#313244",
+    ["tinted_red_faint"] = "#f2cdcd",
+    ["tinted_bg_red_nuanced"] = "#181825",
+    ["tinted_bg_green_nuanced"] = "#181825",
+    ["tinted_bg_yellow_nuanced"] = "#181825",
+    ["tinted_bg_blue_nuanced"] = "#181825",
+    ["tinted_bg_magenta_nuanced"] = "#181825",
+    ["tinted_bg_cyan_nuanced"] = "#181825",
+    ["tinted_bg_completion"] = "#45475a",
+    ["tinted_bg_hl_line"] = "#11111b",
+    ["tinted_bg_paren_match"] = "#89dceb",
+    ["tinted_bg_status_line_active"] = "#11111b",
+    ["tinted_bg_status_line_inactive"] = "#181825",
+    ["tinted_bg_tab_bar"] = "#11111b",
+    ["tinted_bg_tab_current"] = "#181825",
+    ["tinted_bg_tab_other"] = "#45475a",
+    ["tinted_bg_tab_alternate"] = "#cba6f7",
+    ["tinted_bg_added"] = "#313244",
+    ["tinted_bg_added_faint"] = "#181825",
+    ["tinted_bg_added_refine"] = "#a6e3a1",
+    ["tinted_bg_added_fringe"] = "#a6e3a1",
+    ["tinted_bg_changed_fringe"] = "#f9e2af",
+    ["tinted_bg_removed"] = "#313244",
+    ["tinted_bg_removed_faint"] = "#181825",
+    ["tinted_bg_removed_refine"] = "#f38ba8",
+    ["tinted_bg_removed_fringe"] = "#f38ba8",
+    ["tinted_bg_diff_context"] = "#181825",
+    ["visual"] = "#cba6f7",
+    ["link"] = "#89b4fa",
+    ["link_visited"] = "#cba6f7",
+    ["link_symbolic"] = "#94e2d5",
+    ["string"] = "#a6e3a1",
+    ["comment"] = "#7f849c",
+    ["constant"] = "#fab387",
+    ["identifier"] = "#89b4fa",
+    ["keyword"] = "#cba6f7",
+    ["type"] = "#f9e2af",
+    ["fnname"] = "#89b4fa",
+    ["variable"] = "#f38ba8",
+    ["rainbow_0"] = "#f38ba8",
+    ["rainbow_1"] = "#a6e3a1",
+    ["rainbow_2"] = "#f9e2af",
+    ["rainbow_3"] = "#89b4fa",
+    ["rainbow_4"] = "#cba6f7",
+    ["rainbow_5"] = "#94e2d5",
+    ["rainbow_6"] = "#f5c2e7",
+    ["rainbow_7"] = "#fab387",
+    ["prose_todo"] = "#f38ba8",
+    ["prose_done"] = "#a6e3a1",
+    ["prose_tag"] = "#cba6f7",
+    ["prose_table"] = "#89b4fa",
+    ["err"] = "#f38ba8",
+    ["warning"] = "#f9e2af",
+    ["info"] = "#89b4fa",
+  },
+}
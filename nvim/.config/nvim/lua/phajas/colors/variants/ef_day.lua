@@ -0,0 +1,165 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_day (Ef Day/Night family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "ef_daynight",
+  ["flavor"] = "light",
+  ["foreground"] = "#584141",
+  ["background"] = "#fff5ea",
+  ["cursor"] = "#cf1f00",
+  ["selection_background"] = "#f0d2df",
+  ["selection_foreground"] = "#584141",
+  ["ansi"] = {
+    "#fff5ea",
+    "#ba2d2f",
+    "#007a0a",
+    "#a45a22",
+    "#375cc6",
+    "#ca3e54",
+    "#3f60af",
+    "#584141",
+    "#f2e9db",
+    "#ce3f00",
+    "#5f7200",
+    "#b75515",
+    "#5f5fdf",
+    "#cb2f80",
+    "#3f6faf",
+    "#63728f",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#fff5ea",
+    ["bg_dim"] = "#f2e9db",
+    ["bg_alt"] = "#e9e0d8",
+    ["fg_main"] = "#584141",
+    ["fg_dim"] = "#63728f",
+    ["fg_alt"] = "#8f5f4a",
+    ["border"] = "#c8bdb6",
+    ["border_highlight"] = "#8f5f4a",
+    ["red"] = "#ba2d2f",
+    ["red_warmer"] = "#ce3f00",
+    ["red_cooler"] = "#cf2f4f",
+    ["red_faint"] = "#b05350",
+    ["green"] = "#007a0a",
+    ["green_warmer"] = "#5f7200",
+    ["green_cooler"] = "#0f7f5f",
+    ["green_faint"] = "#527545",
+    ["yellow"] = "#a45a22",
+    ["yellow_warmer"] = "#b75515",
+    ["yellow_cooler"] = "#aa4f30",
+    ["yellow_faint"] = "#9a625a",
+    ["blue"] = "#375cc6",
+    ["blue_warmer"] = "#5f5fdf",
+    ["blue_cooler"] = "#265fbf",
+    ["blue_faint"] = "#4a659f",
+    ["magenta"] = "#ca3e54",
+    ["magenta_warmer"] = "#cb2f80",
+    ["magenta_cooler"] = "#8448aa",
+    ["magenta_faint"] = "#a04450",
+    ["cyan"] = "#3f60af",
+    ["cyan_warmer"] = "#3f6faf",
+    ["cyan_cooler"] = "#0f7b8f",
+    ["cyan_faint"] = "#4f6f8f",
+    ["rust"] = "#ce3f00",
+    ["gold"] = "#a45a22",
+    ["olive"] = "#5f7200",
+    ["slate"] = "#4a659f",
+    ["indigo"] = "#8448aa",
+    ["maroon"] = "#cf2f4f",
+    ["pink"] = "#cb2f80",
+    ["red_intense"] = "#ba2d2f",
+    ["green_intense"] = "#007a0a",
+    ["yellow_intense"] = "#a45a22",
+    ["blue_intense"] = "#375cc6",
+    ["magenta_intense"] = "#ca3e54",
+    ["cyan_intense"] = "#3f60af",
+    ["bg_red_intense"] = "#ff8f88",
+    ["bg_green_intense"] = "#96df80",
+    ["bg_yellow_intense"] = "#efbf00",
+    ["bg_blue_intense"] = "#cfceff",
+    ["bg_magenta_intense"] = "#df9fff",
+    ["bg_cyan_intense"] = "#88cfd0",
+    ["bg_red_subtle"] = "#ffc6bf",
+    ["bg_green_subtle"] = "#c4f2af",
+    ["bg_yellow_subtle"] = "#f0f07f",
+    ["bg_blue_subtle"] = "#ccdfff",
+    ["bg_magenta_subtle"] = "#fad3ff",
+    ["bg_cyan_subtle"] = "#bfefff",
+    ["bg_red_nuanced"] = "#ffc6bf",
+    ["bg_green_nuanced"] = "#c4f2af",
+    ["bg_yellow_nuanced"] = "#f0f07f",
+    ["bg_blue_nuanced"] = "#ccdfff",
+    ["bg_magenta_nuanced"] = "#fad3ff",
+    ["bg_cyan_nuanced"] = "#bfefff",
+    ["bg_completion"] = "#ffd5d3",
+    ["bg_hl_line"] = "#f9e2b2",
+    ["bg_paren_match"] = "#8fcfdf",
+    ["bg_paren_expression"] = "#b0e0df",
+    ["bg_char_0"] = "#ccdfff",
+    ["bg_char_1"] = "#fad3ff",
+    ["bg_char_2"] = "#f0f07f",
+    ["bg_active"] = "#c9c0b8",
+    ["fg_active"] = "#584141",
+    ["bg_inactive"] = "#f7efe6",
+    ["fg_inactive"] = "#63728f",
+    ["bg_status_line_active"] = "#ffaf72",
+    ["fg_status_line_active"] = "#542f38",
+    ["bg_status_line_inactive"] = "#f2e9db",
+    ["fg_status_line_inactive"] = "#63728f",
+    ["bg_tab_bar"] = "#e9e0d8",
+    ["bg_tab_current"] = "#fff5ea",
+    ["bg_tab_other"] = "#c9c0b8",
+    ["fg_tab_other"] = "#63728f",
+    ["bg_tab_alternate"] = "#febccf",
+    ["bg_added"] = "#ccefcf",
+    ["bg_added_faint"] = "#e0f3e0",
+    ["bg_added_refine"] = "#bae0c0",
+    ["bg_added_fringe"] = "#bae0c0",
+    ["fg_added"] = "#005000",
+    ["fg_added_intense"] = "#005000",
+    ["bg_changed"] = "#ffe5b9",
+    ["bg_changed_faint"] = "#ffefc5",
+    ["bg_changed_refine"] = "#ffd09f",
+    ["bg_changed_fringe"] = "#ffd09f",
+    ["fg_changed"] = "#553d00",
+    ["fg_changed_intense"] = "#553d00",
+    ["bg_removed"] = "#ffd4d8",
+    ["bg_removed_faint"] = "#ffe3e3",
+    ["bg_removed_refine"] = "#ffc0ca",
+    ["bg_removed_fringe"] = "#ffc0ca",
+    ["fg_removed"] = "#8f1313",
+    ["fg_removed_intense"] = "#8f1313",
+    ["bg_diff_context"] = "#f2e9db",
+    ["visual"] = "#f0d2df",
+    ["link"] = "#3f6faf",
+    ["link_visited"] = "#5f7200",
+    ["link_symbolic"] = "#3f60af",
+    ["string"] = "#5f7200",
+    ["comment"] = "#527545",
+    ["constant"] = "#ce3f00",
+    ["identifier"] = "#a04450",
+    ["keyword"] = "#a45a22",
+    ["type"] = "#0f7f5f",
+    ["fnname"] = "#ca3e54",
+    ["variable"] = "#8448aa",
+    ["rainbow_0"] = "#a45a22",
+    ["rainbow_1"] = "#ba2d2f",
+    ["rainbow_2"] = "#5f7200",
+    ["rainbow_3"] = "#cb2f80",
+    ["rainbow_4"] = "#3f60af",
+    ["rainbow_5"] = "#aa4f30",
+    ["rainbow_6"] = "#8448aa",
+    ["rainbow_7"] = "#cf2f4f",
+    ["prose_todo"] = "#ce3f00",
+    ["prose_done"] = "#007a0a",
+    ["prose_tag"] = "#9a625a",
+    ["prose_table"] = "#8f5f4a",
+    ["err"] = "#ce3f00",
+    ["warning"] = "#a45a22",
+    ["info"] = "#007a0a",
+    ["hint"] = "#4f6f8f",
+    ["ok"] = "#0f7f5f",
+  },
+}
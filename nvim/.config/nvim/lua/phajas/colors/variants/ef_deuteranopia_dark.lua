@@ -0,0 +1,165 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_deuteranopia_dark (Ef Deuteranopia family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "ef_deuteranopia",
+  ["flavor"] = "dark",
+  ["foreground"] = "#ddddee",
+  ["background"] = "#000a1f",
+  ["cursor"] = "#ffff00",
+  ["selection_background"] = "#223848",
+  ["selection_foreground"] = "#ddddee",
+  ["ansi"] = {
+    "#000a1f",
+    "#cf8560",
+    "#3faa26",
+    "#aa9f32",
+    "#3f90f0",
+    "#b379bf",
+    "#5faaef",
+    "#ddddee",
+    "#121f34",
+    "#e47360",
+    "#7aad0f",
+    "#cfaf00",
+    "#6a9fff",
+    "#af80ea",
+    "#7fafff",
+    "#7f8797",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#000a1f",
+    ["bg_dim"] = "#121f34",
+    ["bg_alt"] = "#243145",
+    ["fg_main"] = "#ddddee",
+    ["fg_dim"] = "#7f8797",
+    ["fg_alt"] = "#90afef",
+    ["border"] = "#555a64",
+    ["border_highlight"] = "#90afef",
+    ["red"] = "#cf8560",
+    ["red_warmer"] = "#e47360",
+    ["red_cooler"] = "#cf7a7a",
+    ["red_faint"] = "#b57f82",
+    ["green"] = "#3faa26",
+    ["green_warmer"] = "#7aad0f",
+    ["green_cooler"] = "#3fa672",
+    ["green_faint"] = "#61a06c",
+    ["yellow"] = "#aa9f32",
+    ["yellow_warmer"] = "#cfaf00",
+    ["yellow_cooler"] = "#bfaf7a",
+    ["yellow_faint"] = "#af9a6a",
+    ["blue"] = "#3f90f0",
+    ["blue_warmer"] = "#6a9fff",
+    ["blue_cooler"] = "#009fff",
+    ["blue_faint"] = "#7a94df",
+    ["magenta"] = "#b379bf",
+    ["magenta_warmer"] = "#af80ea",
+    ["magenta_cooler"] = "#9f95ff",
+    ["magenta_faint"] = "#c59fcf",
+    ["cyan"] = "#5faaef",
+    ["cyan_warmer"] = "#7fafff",
+    ["cyan_cooler"] = "#0db0ff",
+    ["cyan_faint"] = "#8aa0df",
+    ["rust"] = "#e47360",
+    ["gold"] = "#aa9f32",
+    ["olive"] = "#7aad0f",
+    ["slate"] = "#7a94df",
+    ["indigo"] = "#9f95ff",
+    ["maroon"] = "#cf7a7a",
+    ["pink"] = "#af80ea",
+    ["red_intense"] = "#cf8560",
+    ["green_intense"] = "#3faa26",
+    ["yellow_intense"] = "#aa9f32",
+    ["blue_intense"] = "#3f90f0",
+    ["magenta_intense"] = "#b379bf",
+    ["cyan_intense"] = "#5faaef",
+    ["bg_red_intense"] = "#8d7f00",
+    ["bg_green_intense"] = "#afcf20",
+    ["bg_yellow_intense"] = "#5f5f00",
+    ["bg_blue_intense"] = "#266fd0",
+    ["bg_magenta_intense"] = "#6f60c0",
+    ["bg_cyan_intense"] = "#007fae",
+    ["bg_red_subtle"] = "#5d3f00",
+    ["bg_green_subtle"] = "#345f20",
+    ["bg_yellow_subtle"] = "#575700",
+    ["bg_blue_subtle"] = "#264f70",
+    ["bg_magenta_subtle"] = "#4a4670",
+    ["bg_cyan_subtle"] = "#265560",
+    ["bg_red_nuanced"] = "#5d3f00",
+    ["bg_green_nuanced"] = "#345f20",
+    ["bg_yellow_nuanced"] = "#575700",
+    ["bg_blue_nuanced"] = "#264f70",
+    ["bg_magenta_nuanced"] = "#4a4670",
+    ["bg_cyan_nuanced"] = "#265560",
+    ["bg_completion"] = "#343420",
+    ["bg_hl_line"] = "#2e2e1b",
+    ["bg_paren_match"] = "#0f4f9a",
+    ["bg_paren_expression"] = "#4f4f00",
+    ["bg_char_0"] = "#264f70",
+    ["bg_char_1"] = "#4a4670",
+    ["bg_char_2"] = "#575700",
+    ["bg_active"] = "#445165",
+    ["fg_active"] = "#ddddee",
+    ["bg_inactive"] = "#0d1429",
+    ["fg_inactive"] = "#7f8797",
+    ["bg_status_line_active"] = "#003f8f",
+    ["fg_status_line_active"] = "#ffffff",
+    ["bg_status_line_inactive"] = "#121f34",
+    ["fg_status_line_inactive"] = "#7f8797",
+    ["bg_tab_bar"] = "#243145",
+    ["bg_tab_current"] = "#000a1f",
+    ["bg_tab_other"] = "#445165",
+    ["fg_tab_other"] = "#7f8797",
+    ["bg_tab_alternate"] = "#00405f",
+    ["bg_added"] = "#00234f",
+    ["bg_added_faint"] = "#00143f",
+    ["bg_added_refine"] = "#03395f",
+    ["bg_added_fringe"] = "#03395f",
+    ["fg_added"] = "#c4d5ff",
+    ["fg_added_intense"] = "#c4d5ff",
+    ["bg_changed"] = "#2f123f",
+    ["bg_changed_faint"] = "#1f022f",
+    ["bg_changed_refine"] = "#3f224f",
+    ["bg_changed_fringe"] = "#3f224f",
+    ["fg_changed"] = "#e3cfff",
+    ["fg_changed_intense"] = "#e3cfff",
+    ["bg_removed"] = "#323200",
+    ["bg_removed_faint"] = "#281a00",
+    ["bg_removed_refine"] = "#484800",
+    ["bg_removed_fringe"] = "#484800",
+    ["fg_removed"] = "#d4d48f",
+    ["fg_removed_intense"] = "#d4d48f",
+    ["bg_diff_context"] = "#121f34",
+    ["visual"] = "#223848",
+    ["link"] = "#3f90f0",
+    ["link_visited"] = "#bfaf7a",
+    ["link_symbolic"] = "#5faaef",
+    ["string"] = "#3f90f0",
+    ["comment"] = "#af9a6a",
+    ["constant"] = "#009fff",
+    ["identifier"] = "#8aa0df",
+    ["keyword"] = "#cfaf00",
+    ["type"] = "#9f95ff",
+    ["fnname"] = "#bfaf7a",
+    ["variable"] = "#0db0ff",
+    ["rainbow_0"] = "#cfaf00",
+    ["rainbow_1"] = "#3f90f0",
+    ["rainbow_2"] = "#bfaf7a",
+    ["rainbow_3"] = "#6a9fff",
+    ["rainbow_4"] = "#aa9f32",
+    ["rainbow_5"] = "#7fafff",
+    ["rainbow_6"] = "#af9a6a",
+    ["rainbow_7"] = "#7a94df",
+    ["prose_todo"] = "#cfaf00",
+    ["prose_done"] = "#009fff",
+    ["prose_tag"] = "#90afef",
+    ["prose_table"] = "#90afef",
+    ["err"] = "#cfaf00",
+    ["warning"] = "#bfaf7a",
+    ["info"] = "#009fff",
+    ["hint"] = "#8aa0df",
+    ["ok"] = "#3fa672",
+  },
+}
@@ -0,0 +1,165 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_deuteranopia_light (Ef Deuteranopia family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "ef_deuteranopia",
+  ["flavor"] = "light",
+  ["foreground"] = "#1a1a2f",
+  ["background"] = "#f5f5ff",
+  ["cursor"] = "#0000bb",
+  ["selection_background"] = "#dadadf",
+  ["selection_foreground"] = "#1a1a2f",
+  ["ansi"] = {
+    "#f5f5ff",
+    "#d3303a",
+    "#217a3c",
+    "#805d00",
+    "#375cd8",
+    "#ba35af",
+    "#1f6fbf",
+    "#1a1a2f",
+    "#e8e8ea",
+    "#e00033",
+    "#4a7d00",
+    "#965000",
+    "#4250ef",
+    "#cf25aa",
+    "#3f6faf",
+    "#70627f",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#f5f5ff",
+    ["bg_dim"] = "#e8e8ea",
+    ["bg_alt"] = "#d3d3e0",
+    ["fg_main"] = "#1a1a2f",
+    ["fg_dim"] = "#70627f",
+    ["fg_alt"] = "#196f70",
+    ["border"] = "#bcbcd0",
+    ["border_highlight"] = "#196f70",
+    ["red"] = "#d3303a",
+    ["red_warmer"] = "#e00033",
+    ["red_cooler"] = "#d50f7f",
+    ["red_faint"] = "#a04852",
+    ["green"] = "#217a3c",
+    ["green_warmer"] = "#4a7d00",
+    ["green_cooler"] = "#008058",
+    ["green_faint"] = "#61756c",
+    ["yellow"] = "#805d00",
+    ["yellow_warmer"] = "#965000",
+    ["yellow_cooler"] = "#765040",
+    ["yellow_faint"] = "#77604a",
+    ["blue"] = "#375cd8",
+    ["blue_warmer"] = "#4250ef",
+    ["blue_cooler"] = "#065fff",
+    ["blue_faint"] = "#6060d0",
+    ["magenta"] = "#ba35af",
+    ["magenta_warmer"] = "#cf25aa",
+    ["magenta_cooler"] = "#6052cf",
+    ["magenta_faint"] = "#9f5080",
+    ["cyan"] = "#1f6fbf",
+    ["cyan_warmer"] = "#3f6faf",
+    ["cyan_cooler"] = "#1477b2",
+    ["cyan_faint"] = "#506fa0",
+    ["rust"] = "#e00033",
+    ["gold"] = "#805d00",
+    ["olive"] = "#4a7d00",
+    ["slate"] = "#6060d0",
+    ["indigo"] = "#6052cf",
+    ["maroon"] = "#d50f7f",
+    ["pink"] = "#cf25aa",
+    ["red_intense"] = "#d3303a",
+    ["green_intense"] = "#217a3c",
+    ["yellow_intense"] = "#805d00",
+    ["blue_intense"] = "#375cd8",
+    ["magenta_intense"] = "#ba35af",
+    ["cyan_intense"] = "#1f6fbf",
+    ["bg_red_intense"] = "#cac200",
+    ["bg_green_intense"] = "#9aaf80",
+    ["bg_yellow_intense"] = "#fac200",
+    ["bg_blue_intense"] = "#cbcfff",
+    ["bg_magenta_intense"] = "#3fbfff",
+    ["bg_cyan_intense"] = "#98e8ff",
+    ["bg_red_subtle"] = "#ead270",
+    ["bg_green_subtle"] = "#bae0a0",
+    ["bg_yellow_subtle"] = "#e6f270",
+    ["bg_blue_subtle"] = "#c0dfff",
+    ["bg_magenta_subtle"] = "#ccc8ff",
+    ["bg_cyan_subtle"] = "#afecf0",
+    ["bg_red_nuanced"] = "#ead270",
+    ["bg_green_nuanced"] = "#bae0a0",
+    ["bg_yellow_nuanced"] = "#e6f270",
+    ["bg_blue_nuanced"] = "#c0dfff",
+    ["bg_magenta_nuanced"] = "#ccc8ff",
+    ["bg_cyan_nuanced"] = "#afecf0",
+    ["bg_completion"] = "#f0dacf",
+    ["bg_hl_line"] = "#f3e0d5",
+    ["bg_paren_match"] = "#8fc0cf",
+    ["bg_paren_expression"] = "#eebb20",
+    ["bg_char_0"] = "#c0dfff",
+    ["bg_char_1"] = "#ccc8ff",
+    ["bg_char_2"] = "#e6f270",
+    ["bg_active"] = "#b3b3c0",
+    ["fg_active"] = "#1a1a2f",
+    ["bg_inactive"] = "#efeff5",
+    ["fg_inactive"] = "#70627f",
+    ["bg_status_line_active"] = "#99c7ff",
+    ["fg_status_line_active"] = "#0a0a1f",
+    ["bg_status_line_inactive"] = "#e8e8ea",
+    ["fg_status_line_inactive"] = "#70627f",
+    ["bg_tab_bar"] = "#d3d3e0",
+    ["bg_tab_current"] = "#f5f5ff",
+    ["bg_tab_other"] = "#b3b3c0",
+    ["fg_tab_other"] = "#70627f",
+    ["bg_tab_alternate"] = "#afafef",
+    ["bg_added"] = "#dbdbff",
+    ["bg_added_faint"] = "#e4e4ff",
+    ["bg_added_refine"] = "#c0c0ef",
+    ["bg_added_fringe"] = "#c0c0ef",
+    ["fg_added"] = "#333399",
+    ["fg_added_intense"] = "#333399",
+    ["bg_changed"] = "#eecfdf",
+    ["bg_changed_faint"] = "#f0dde5",
+    ["bg_changed_refine"] = "#e0b0d0",
+    ["bg_changed_fringe"] = "#e0b0d0",
+    ["fg_changed"] = "#6f1343",
+    ["fg_changed_intense"] = "#6f1343",
+    ["bg_removed"] = "#fff0af",
+    ["bg_removed_faint"] = "#efefcb",
+    ["bg_removed_refine"] = "#f0da88",
+    ["bg_removed_fringe"] = "#f0da88",
+    ["fg_removed"] = "#553d00",
+    ["fg_removed_intense"] = "#553d00",
+    ["bg_diff_context"] = "#e8e8ea",
+    ["visual"] = "#dadadf",
+    ["link"] = "#375cd8",
+    ["link_visited"] = "#765040",
+    ["link_symbolic"] = "#1f6fbf",
+    ["string"] = "#965000",
+    ["comment"] = "#77604a",
+    ["constant"] = "#765040",
+    ["identifier"] = "#506fa0",
+    ["keyword"] = "#4250ef",
+    ["type"] = "#805d00",
+    ["fnname"] = "#065fff",
+    ["variable"] = "#1477b2",
+    ["rainbow_0"] = "#375cd8",
+    ["rainbow_1"] = "#805d00",
+    ["rainbow_2"] = "#4250ef",
+    ["rainbow_3"] = "#765040",
+    ["rainbow_4"] = "#065fff",
+    ["rainbow_5"] = "#965000",
+    ["rainbow_6"] = "#6060d0",
+    ["rainbow_7"] = "#77604a",
+    ["prose_todo"] = "#965000",
+    ["prose_done"] = "#065fff",
+    ["prose_tag"] = "#61756c",
+    ["prose_table"] = "#196f70",
+    ["err"] = "#965000",
+    ["warning"] = "#765040",
+    ["info"] = "#065fff",
+    ["hint"] = "#506fa0",
+    ["ok"] = "#008058",
+  },
+}
@@ -0,0 +1,165 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_duo_dark (Ef Duo family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "ef_duo",
+  ["flavor"] = "dark",
+  ["foreground"] = "#d0d0d0",
+  ["background"] = "#070019",
+  ["cursor"] = "#ef6f11",
+  ["selection_background"] = "#042a50",
+  ["selection_foreground"] = "#d0d0d0",
+  ["ansi"] = {
+    "#070019",
+    "#ef656a",
+    "#1fa526",
+    "#c48702",
+    "#379cf6",
+    "#d369af",
+    "#5faaef",
+    "#d0d0d0",
+    "#1d1a26",
+    "#f47360",
+    "#50a22f",
+    "#d0730f",
+    "#6f80ff",
+    "#e580ea",
+    "#7fafff",
+    "#857f8f",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#070019",
+    ["bg_dim"] = "#1d1a26",
+    ["bg_alt"] = "#2a2739",
+    ["fg_main"] = "#d0d0d0",
+    ["fg_dim"] = "#857f8f",
+    ["fg_alt"] = "#89afef",
+    ["border"] = "#545f6f",
+    ["border_highlight"] = "#89afef",
+    ["red"] = "#ef656a",
+    ["red_warmer"] = "#f47360",
+    ["red_cooler"] = "#ef798f",
+    ["red_faint"] = "#d08f72",
+    ["green"] = "#1fa526",
+    ["green_warmer"] = "#50a22f",
+    ["green_cooler"] = "#00b982",
+    ["green_faint"] = "#61a06c",
+    ["yellow"] = "#c48702",
+    ["yellow_warmer"] = "#d0730f",
+    ["yellow_cooler"] = "#df805f",
+    ["yellow_faint"] = "#9f8f6a",
+    ["blue"] = "#379cf6",
+    ["blue_warmer"] = "#6f80ff",
+    ["blue_cooler"] = "#029fff",
+    ["blue_faint"] = "#8a9fdf",
+    ["magenta"] = "#d369af",
+    ["magenta_warmer"] = "#e580ea",
+    ["magenta_cooler"] = "#af85ff",
+    ["magenta_faint"] = "#c57faf",
+    ["cyan"] = "#5faaef",
+    ["cyan_warmer"] = "#7fafff",
+    ["cyan_cooler"] = "#0dafdf",
+    ["cyan_faint"] = "#8aa0df",
+    ["rust"] = "#f47360",
+    ["gold"] = "#c48702",
+    ["olive"] = "#50a22f",
+    ["slate"] = "#8a9fdf",
+    ["indigo"] = "#af85ff",
+    ["maroon"] = "#ef798f",
+    ["pink"] = "#e580ea",
+    ["red_intense"] = "#ef656a",
+    ["green_intense"] = "#1fa526",
+    ["yellow_intense"] = "#c48702",
+    ["blue_intense"] = "#379cf6",
+    ["magenta_intense"] = "#d369af",
+    ["cyan_intense"] = "#5faaef",
+    ["bg_red_intense"] = "#cd2f30",
+    ["bg_green_intense"] = "#407720",
+    ["bg_yellow_intense"] = "#8f5040",
+    ["bg_blue_intense"] = "#4648d0",
+    ["bg_magenta_intense"] = "#b04fcf",
+    ["bg_cyan_intense"] = "#2270be",
+    ["bg_red_subtle"] = "#72002a",
+    ["bg_green_subtle"] = "#00422a",
+    ["bg_yellow_subtle"] = "#603000",
+    ["bg_blue_subtle"] = "#242679",
+    ["bg_magenta_subtle"] = "#501f72",
+    ["bg_cyan_subtle"] = "#004065",
+    ["bg_red_nuanced"] = "#72002a",
+    ["bg_green_nuanced"] = "#00422a",
+    ["bg_yellow_nuanced"] = "#603000",
+    ["bg_blue_nuanced"] = "#242679",
+    ["bg_magenta_nuanced"] = "#501f72",
+    ["bg_cyan_nuanced"] = "#004065",
+    ["bg_completion"] = "#2f1a5f",
+    ["bg_hl_line"] = "#301a4f",
+    ["bg_paren_match"] = "#2f608e",
+    ["bg_paren_expression"] = "#664f4a",
+    ["bg_char_0"] = "#242679",
+    ["bg_char_1"] = "#501f72",
+    ["bg_char_2"] = "#603000",
+    ["bg_active"] = "#4a4759",
+    ["fg_active"] = "#d0d0d0",
+    ["bg_inactive"] = "#13101f",
+    ["fg_inactive"] = "#857f8f",
+    ["bg_status_line_active"] = "#352487",
+    ["fg_status_line_active"] = "#dedeff",
+    ["bg_status_line_inactive"] = "#1d1a26",
+    ["fg_status_line_inactive"] = "#857f8f",
+    ["bg_tab_bar"] = "#2a2739",
+    ["bg_tab_current"] = "#070019",
+    ["bg_tab_other"] = "#4a4759",
+    ["fg_tab_other"] = "#857f8f",
+    ["bg_tab_alternate"] = "#264f4a",
+    ["bg_added"] = "#002d1f",
+    ["bg_added_faint"] = "#001f18",
+    ["bg_added_refine"] = "#003b2f",
+    ["bg_added_fringe"] = "#003b2f",
+    ["fg_added"] = "#a0e0a0",
+    ["fg_added_intense"] = "#a0e0a0",
+    ["bg_changed"] = "#323200",
+    ["bg_changed_faint"] = "#2a2000",
+    ["bg_changed_refine"] = "#444000",
+    ["bg_changed_fringe"] = "#444000",
+    ["fg_changed"] = "#efef80",
+    ["fg_changed_intense"] = "#efef80",
+    ["bg_removed"] = "#3d091f",
+    ["bg_removed_faint"] = "#27040f",
+    ["bg_removed_refine"] = "#5b0f26",
+    ["bg_removed_fringe"] = "#5b0f26",
+    ["fg_removed"] = "#ffbfbf",
+    ["fg_removed_intense"] = "#ffbfbf",
+    ["bg_diff_context"] = "#1d1a26",
+    ["visual"] = "#042a50",
+    ["link"] = "#7fafff",
+    ["link_visited"] = "#00b982",
+    ["link_symbolic"] = "#5faaef",
+    ["string"] = "#df805f",
+    ["comment"] = "#d08f72",
+    ["constant"] = "#379cf6",
+    ["identifier"] = "#d08f72",
+    ["keyword"] = "#6f80ff",
+    ["type"] = "#029fff",
+    ["fnname"] = "#0dafdf",
+    ["variable"] = "#af85ff",
+    ["rainbow_0"] = "#379cf6",
+    ["rainbow_1"] = "#d0730f",
+    ["rainbow_2"] = "#6f80ff",
+    ["rainbow_3"] = "#df805f",
+    ["rainbow_4"] = "#0dafdf",
+    ["rainbow_5"] = "#c48702",
+    ["rainbow_6"] = "#029fff",
+    ["rainbow_7"] = "#ef798f",
+    ["prose_todo"] = "#ef656a",
+    ["prose_done"] = "#1fa526",
+    ["prose_tag"] = "#9f8f6a",
+    ["prose_table"] = "#89afef",
+    ["err"] = "#ef656a",
+    ["warning"] = "#c48702",
+    ["info"] = "#1fa526",
+    ["hint"] = "#8aa0df",
+    ["ok"] = "#00b982",
+  },
+}
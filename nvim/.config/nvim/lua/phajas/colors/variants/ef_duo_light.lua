@@ -0,0 +1,165 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_duo_light (Ef Duo family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "ef_duo",
+  ["flavor"] = "light",
+  ["foreground"] = "#222222",
+  ["background"] = "#fff8f0",
+  ["cursor"] = "#1144ff",
+  ["selection_background"] = "#caeafa",
+  ["selection_foreground"] = "#222222",
+  ["ansi"] = {
+    "#fff8f0",
+    "#cc3333",
+    "#217a3c",
+    "#8a5d00",
+    "#375cd8",
+    "#ba35af",
+    "#1f6fbf",
+    "#222222",
+    "#f6ece8",
+    "#dd1100",
+    "#4a7d00",
+    "#9f4a00",
+    "#4250ef",
+    "#cf25aa",
+    "#3f70a0",
+    "#63728f",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#fff8f0",
+    ["bg_dim"] = "#f6ece8",
+    ["bg_alt"] = "#e7e0da",
+    ["fg_main"] = "#222222",
+    ["fg_dim"] = "#63728f",
+    ["fg_alt"] = "#856f4a",
+    ["border"] = "#baafba",
+    ["border_highlight"] = "#856f4a",
+    ["red"] = "#cc3333",
+    ["red_warmer"] = "#dd1100",
+    ["red_cooler"] = "#c04440",
+    ["red_faint"] = "#a2403f",
+    ["green"] = "#217a3c",
+    ["green_warmer"] = "#4a7d00",
+    ["green_cooler"] = "#008058",
+    ["green_faint"] = "#61756c",
+    ["yellow"] = "#8a5d00",
+    ["yellow_warmer"] = "#9f4a00",
+    ["yellow_cooler"] = "#8f5a3a",
+    ["yellow_faint"] = "#765640",
+    ["blue"] = "#375cd8",
+    ["blue_warmer"] = "#4250ef",
+    ["blue_cooler"] = "#065fff",
+    ["blue_faint"] = "#6060d0",
+    ["magenta"] = "#ba35af",
+    ["magenta_warmer"] = "#cf25aa",
+    ["magenta_cooler"] = "#6052cf",
+    ["magenta_faint"] = "#af569f",
+    ["cyan"] = "#1f6fbf",
+    ["cyan_warmer"] = "#3f70a0",
+    ["cyan_cooler"] = "#1f77bb",
+    ["cyan_faint"] = "#406f90",
+    ["rust"] = "#dd1100",
+    ["gold"] = "#8a5d00",
+    ["olive"] = "#4a7d00",
+    ["slate"] = "#6060d0",
+    ["indigo"] = "#6052cf",
+    ["maroon"] = "#c04440",
+    ["pink"] = "#cf25aa",
+    ["red_intense"] = "#cc3333",
+    ["green_intense"] = "#217a3c",
+    ["yellow_intense"] = "#8a5d00",
+    ["blue_intense"] = "#375cd8",
+    ["magenta_intense"] = "#ba35af",
+    ["cyan_intense"] = "#1f6fbf",
+    ["bg_red_intense"] = "#ff8f88",
+    ["bg_green_intense"] = "#8adf80",
+    ["bg_yellow_intense"] = "#fac200",
+    ["bg_blue_intense"] = "#cbcfff",
+    ["bg_magenta_intense"] = "#df8fff",
+    ["bg_cyan_intense"] = "#88c8ff",
+    ["bg_red_subtle"] = "#ffcfbf",
+    ["bg_green_subtle"] = "#aff7c5",
+    ["bg_yellow_subtle"] = "#f9f376",
+    ["bg_blue_subtle"] = "#cfdff9",
+    ["bg_magenta_subtle"] = "#f9ddf0",
+    ["bg_cyan_subtle"] = "#bfeaf0",
+    ["bg_red_nuanced"] = "#ffcfbf",
+    ["bg_green_nuanced"] = "#aff7c5",
+    ["bg_yellow_nuanced"] = "#f9f376",
+    ["bg_blue_nuanced"] = "#cfdff9",
+    ["bg_magenta_nuanced"] = "#f9ddf0",
+    ["bg_cyan_nuanced"] = "#bfeaf0",
+    ["bg_completion"] = "#fadacf",
+    ["bg_hl_line"] = "#f9e8c0",
+    ["bg_paren_match"] = "#afbfef",
+    ["bg_paren_expression"] = "#b4cfff",
+    ["bg_char_0"] = "#cfdff9",
+    ["bg_char_1"] = "#f9ddf0",
+    ["bg_char_2"] = "#f9f376",
+    ["bg_active"] = "#c7c0ba",
+    ["fg_active"] = "#222222",
+    ["bg_inactive"] = "#f9f2ef",
+    ["fg_inactive"] = "#63728f",
+    ["bg_status_line_active"] = "#f8cf8f",
+    ["fg_status_line_active"] = "#111133",
+    ["bg_status_line_inactive"] = "#f6ece8",
+    ["fg_status_line_inactive"] = "#63728f",
+    ["bg_tab_bar"] = "#e7e0da",
+    ["bg_tab_current"] = "#fff8f0",
+    ["bg_tab_other"] = "#c7c0ba",
+    ["fg_tab_other"] = "#63728f",
+    ["bg_tab_alternate"] = "#aaeccf",
+    ["bg_added"] = "#ccefcf",
+    ["bg_added_faint"] = "#e0f3e0",
+    ["bg_added_refine"] = "#bae0c0",
+    ["bg_added_fringe"] = "#bae0c0",
+    ["fg_added"] = "#005000",
+    ["fg_added_intense"] = "#005000",
+    ["bg_changed"] = "#ffe5b9",
+    ["bg_changed_faint"] = "#ffefc5",
+    ["bg_changed_refine"] = "#ffd09f",
+    ["bg_changed_fringe"] = "#ffd09f",
+    ["fg_changed"] = "#553d00",
+    ["fg_changed_intense"] = "#553d00",
+    ["bg_removed"] = "#ffd4d8",
+    ["bg_removed_faint"] = "#ffe3e3",
+    ["bg_removed_refine"] = "#ffc0ca",
+    ["bg_removed_fringe"] = "#ffc0ca",
+    ["fg_removed"] = "#8f1313",
+    ["fg_removed_intense"] = "#8f1313",
+    ["bg_diff_context"] = "#f6ece8",
+    ["visual"] = "#caeafa",
+    ["link"] = "#1f6fbf",
+    ["link_visited"] = "#008058",
+    ["link_symbolic"] = "#1f6fbf",
+    ["string"] = "#9f4a00",
+    ["comment"] = "#a2403f",
+    ["constant"] = "#375cd8",
+    ["identifier"] = "#a2403f",
+    ["keyword"] = "#4250ef",
+    ["type"] = "#065fff",
+    ["fnname"] = "#1f6fbf",
+    ["variable"] = "#6052cf",
+    ["rainbow_0"] = "#375cd8",
+    ["rainbow_1"] = "#9f4a00",
+    ["rainbow_2"] = "#4250ef",
+    ["rainbow_3"] = "#8f5a3a",
+    ["rainbow_4"] = "#6052cf",
+    ["rainbow_5"] = "#4a7d00",
+    ["rainbow_6"] = "#3f70a0",
+    ["rainbow_7"] = "#8a5d00",
+    ["prose_todo"] = "#cc3333",
+    ["prose_done"] = "#217a3c",
+    ["prose_tag"] = "#765640",
+    ["prose_table"] = "#856f4a",
+    ["err"] = "#cc3333",
+    ["warning"] = "#8a5d00",
+    ["info"] = "#217a3c",
+    ["hint"] = "#406f90",
+    ["ok"] = "#008058",
+  },
+}
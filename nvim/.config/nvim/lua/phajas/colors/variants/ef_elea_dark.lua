@@ -0,0 +1,165 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_elea_dark (Ef Elea family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "ef_elea",
+  ["flavor"] = "dark",
+  ["foreground"] = "#eaf2ef",
+  ["background"] = "#222524",
+  ["cursor"] = "#ef7fa8",
+  ["selection_background"] = "#543040",
+  ["selection_foreground"] = "#eaf2ef",
+  ["ansi"] = {
+    "#222524",
+    "#ff656a",
+    "#7fc87f",
+    "#cac85f",
+    "#57aff6",
+    "#f59acf",
+    "#6fcfd2",
+    "#eaf2ef",
+    "#303332",
+    "#ff7a5f",
+    "#7fca5a",
+    "#e0b02f",
+    "#78afff",
+    "#fa90ea",
+    "#7fcfdf",
+    "#969faf",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#222524",
+    ["bg_dim"] = "#303332",
+    ["bg_alt"] = "#3e4140",
+    ["fg_main"] = "#eaf2ef",
+    ["fg_dim"] = "#969faf",
+    ["fg_alt"] = "#8fcfbb",
+    ["border"] = "#5d5f63",
+    ["border_highlight"] = "#8fcfbb",
+    ["red"] = "#ff656a",
+    ["red_warmer"] = "#ff7a5f",
+    ["red_cooler"] = "#fa7f88",
+    ["red_faint"] = "#eba8a8",
+    ["green"] = "#7fc87f",
+    ["green_warmer"] = "#7fca5a",
+    ["green_cooler"] = "#50cf89",
+    ["green_faint"] = "#a9c99f",
+    ["yellow"] = "#cac85f",
+    ["yellow_warmer"] = "#e0b02f",
+    ["yellow_cooler"] = "#cfb27f",
+    ["yellow_faint"] = "#cac89f",
+    ["blue"] = "#57aff6",
+    ["blue_warmer"] = "#78afff",
+    ["blue_cooler"] = "#62cfef",
+    ["blue_faint"] = "#6ab4ef",
+    ["magenta"] = "#f59acf",
+    ["magenta_warmer"] = "#fa90ea",
+    ["magenta_cooler"] = "#cfaaff",
+    ["magenta_faint"] = "#d0b9f0",
+    ["cyan"] = "#6fcfd2",
+    ["cyan_warmer"] = "#7fcfdf",
+    ["cyan_cooler"] = "#60d5c2",
+    ["cyan_faint"] = "#99bfcf",
+    ["rust"] = "#ff7a5f",
+    ["gold"] = "#cac85f",
+    ["olive"] = "#7fca5a",
+    ["slate"] = "#6ab4ef",
+    ["indigo"] = "#cfaaff",
+    ["maroon"] = "#fa7f88",
+    ["pink"] = "#fa90ea",
+    ["red_intense"] = "#ff656a",
+    ["green_intense"] = "#7fc87f",
+    ["yellow_intense"] = "#cac85f",
+    ["blue_intense"] = "#57aff6",
+    ["magenta_intense"] = "#f59acf",
+    ["cyan_intense"] = "#6fcfd2",
+    ["bg_red_intense"] = "#bd1f30",
+    ["bg_green_intense"] = "#408420",
+    ["bg_yellow_intense"] = "#847020",
+    ["bg_blue_intense"] = "#2f5f9f",
+    ["bg_magenta_intense"] = "#b05fcf",
+    ["bg_cyan_intense"] = "#028099",
+    ["bg_red_subtle"] = "#6c2a2a",
+    ["bg_green_subtle"] = "#2f532a",
+    ["bg_yellow_subtle"] = "#62432a",
+    ["bg_blue_subtle"] = "#26486c",
+    ["bg_magenta_subtle"] = "#59335b",
+    ["bg_cyan_subtle"] = "#204c60",
+    ["bg_red_nuanced"] = "#6c2a2a",
+    ["bg_green_nuanced"] = "#2f532a",
+    ["bg_yellow_nuanced"] = "#62432a",
+    ["bg_blue_nuanced"] = "#26486c",
+    ["bg_magenta_nuanced"] = "#59335b",
+    ["bg_cyan_nuanced"] = "#204c60",
+    ["bg_completion"] = "#37493f",
+    ["bg_hl_line"] = "#2f413f",
+    ["bg_paren_match"] = "#3f6f5f",
+    ["bg_paren_expression"] = "#894f7a",
+    ["bg_char_0"] = "#26486c",
+    ["bg_char_1"] = "#59335b",
+    ["bg_char_2"] = "#62432a",
+    ["bg_active"] = "#5e6160",
+    ["fg_active"] = "#eaf2ef",
+    ["bg_inactive"] = "#2b2e2d",
+    ["fg_inactive"] = "#969faf",
+    ["bg_status_line_active"] = "#35605d",
+    ["fg_status_line_active"] = "#ecf0ff",
+    ["bg_status_line_inactive"] = "#303332",
+    ["fg_status_line_inactive"] = "#969faf",
+    ["bg_tab_bar"] = "#3e4140",
+    ["bg_tab_current"] = "#222524",
+    ["bg_tab_other"] = "#5e6160",
+    ["fg_tab_other"] = "#969faf",
+    ["bg_tab_alternate"] = "#425d4a",
+    ["bg_added"] = "#20493f",
+    ["bg_added_faint"] = "#203a2f",
+    ["bg_added_refine"] = "#136244",
+    ["bg_added_fringe"] = "#136244",
+    ["fg_added"] = "#a0e0a0",
+    ["fg_added_intense"] = "#a0e0a0",
+    ["bg_changed"] = "#51512f",
+    ["bg_changed_faint"] = "#40332f",
+    ["bg_changed_refine"] = "#61621f",
+    ["bg_changed_fringe"] = "#61621f",
+    ["fg_changed"] = "#dada90",
+    ["fg_changed_intense"] = "#dada90",
+    ["bg_removed"] = "#5e242f",
+    ["bg_removed_faint"] = "#4a242a",
+    ["bg_removed_refine"] = "#772a35",
+    ["bg_removed_fringe"] = "#772a35",
+    ["fg_removed"] = "#ffbfbf",
+    ["fg_removed_intense"] = "#ffbfbf",
+    ["bg_diff_context"] = "#303332",
+    ["visual"] = "#543040",
+    ["link"] = "#7fca5a",
+    ["link_visited"] = "#f59acf",
+    ["link_symbolic"] = "#6fcfd2",
+    ["string"] = "#50cf89",
+    ["comment"] = "#cac89f",
+    ["constant"] = "#cfaaff",
+    ["identifier"] = "#d0b9f0",
+    ["keyword"] = "#eba8a8",
+    ["type"] = "#6fcfd2",
+    ["fnname"] = "#7fca5a",
+    ["variable"] = "#f59acf",
+    ["rainbow_0"] = "#7fca5a",
+    ["rainbow_1"] = "#eba8a8",
+    ["rainbow_2"] = "#a9c99f",
+    ["rainbow_3"] = "#60d5c2",
+    ["rainbow_4"] = "#cfaaff",
+    ["rainbow_5"] = "#f59acf",
+    ["rainbow_6"] = "#7fc87f",
+    ["rainbow_7"] = "#cfb27f",
+    ["prose_todo"] = "#ff7a5f",
+    ["prose_done"] = "#7fca5a",
+    ["prose_tag"] = "#99bfcf",
+    ["prose_table"] = "#8fcfbb",
+    ["err"] = "#ff7a5f",
+    ["warning"] = "#e0b02f",
+    ["info"] = "#50cf89",
+    ["hint"] = "#99bfcf",
+    ["ok"] = "#50cf89",
+  },
+}
@@ -0,0 +1,165 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_light (Ef Light/Dark family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "ef_lightdark",
+  ["flavor"] = "light",
+  ["foreground"] = "#202020",
+  ["background"] = "#ffffff",
+  ["cursor"] = "#0033cc",
+  ["selection_background"] = "#bfefff",
+  ["selection_foreground"] = "#202020",
+  ["ansi"] = {
+    "#ffffff",
+    "#d3303a",
+    "#217a3c",
+    "#a45f22",
+    "#3740cf",
+    "#ba35af",
+    "#1f6fbf",
+    "#202020",
+    "#efefef",
+    "#e00033",
+    "#4a7d00",
+    "#b6532f",
+    "#4250ef",
+    "#cf25aa",
+    "#3f6faf",
+    "#68759f",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#ffffff",
+    ["bg_dim"] = "#efefef",
+    ["bg_alt"] = "#dbdbdb",
+    ["fg_main"] = "#202020",
+    ["fg_dim"] = "#68759f",
+    ["fg_alt"] = "#397a70",
+    ["border"] = "#bfc4da",
+    ["border_highlight"] = "#397a70",
+    ["red"] = "#d3303a",
+    ["red_warmer"] = "#e00033",
+    ["red_cooler"] = "#d51272",
+    ["red_faint"] = "#c24552",
+    ["green"] = "#217a3c",
+    ["green_warmer"] = "#4a7d00",
+    ["green_cooler"] = "#008858",
+    ["green_faint"] = "#61756c",
+    ["yellow"] = "#a45f22",
+    ["yellow_warmer"] = "#b6532f",
+    ["yellow_cooler"] = "#b65050",
+    ["yellow_faint"] = "#a65f6a",
+    ["blue"] = "#3740cf",
+    ["blue_warmer"] = "#4250ef",
+    ["blue_cooler"] = "#065fff",
+    ["blue_faint"] = "#4f54aa",
+    ["magenta"] = "#ba35af",
+    ["magenta_warmer"] = "#cf25aa",
+    ["magenta_cooler"] = "#6052cf",
+    ["magenta_faint"] = "#af5a80",
+    ["cyan"] = "#1f6fbf",
+    ["cyan_warmer"] = "#3f6faf",
+    ["cyan_cooler"] = "#1f77bb",
+    ["cyan_faint"] = "#506fa0",
+    ["rust"] = "#e00033",
+    ["gold"] = "#a45f22",
+    ["olive"] = "#4a7d00",
+    ["slate"] = "#4f54aa",
+    ["indigo"] = "#6052cf",
+    ["maroon"] = "#d51272",
+    ["pink"] = "#cf25aa",
+    ["red_intense"] = "#d3303a",
+    ["green_intense"] = "#217a3c",
+    ["yellow_intense"] = "#a45f22",
+    ["blue_intense"] = "#3740cf",
+    ["magenta_intense"] = "#ba35af",
+    ["cyan_intense"] = "#1f6fbf",
+    ["bg_red_intense"] = "#ff8f88",
+    ["bg_green_intense"] = "#9adf90",
+    ["bg_yellow_intense"] = "#fac200",
+    ["bg_blue_intense"] = "#cbcfff",
+    ["bg_magenta_intense"] = "#df8fff",
+    ["bg_cyan_intense"] = "#88c8ff",
+    ["bg_red_subtle"] = "#ffcfbf",
+    ["bg_green_subtle"] = "#b3fabf",
+    ["bg_yellow_subtle"] = "#fff576",
+    ["bg_blue_subtle"] = "#ccdfff",
+    ["bg_magenta_subtle"] = "#ffddff",
+    ["bg_cyan_subtle"] = "#bfefff",
+    ["bg_red_nuanced"] = "#ffcfbf",
+    ["bg_green_nuanced"] = "#b3fabf",
+    ["bg_yellow_nuanced"] = "#fff576",
+    ["bg_blue_nuanced"] = "#ccdfff",
+    ["bg_magenta_nuanced"] = "#ffddff",
+    ["bg_cyan_nuanced"] = "#bfefff",
+    ["bg_completion"] = "#bfe8ff",
+    ["bg_hl_line"] = "#e4efd8",
+    ["bg_paren_match"] = "#dfa0f3",
+    ["bg_paren_expression"] = "#aaeccf",
+    ["bg_char_0"] = "#ccdfff",
+    ["bg_char_1"] = "#ffddff",
+    ["bg_char_2"] = "#fff576",
+    ["bg_active"] = "#b3b3b3",
+    ["fg_active"] = "#202020",
+    ["bg_inactive"] = "#f9f9f9",
+    ["fg_inactive"] = "#68759f",
+    ["bg_status_line_active"] = "#b7c7ff",
+    ["fg_status_line_active"] = "#151515",
+    ["bg_status_line_inactive"] = "#efefef",
+    ["fg_status_line_inactive"] = "#68759f",
+    ["bg_tab_bar"] = "#dbdbdb",
+    ["bg_tab_current"] = "#ffffff",
+    ["bg_tab_other"] = "#b3b3b3",
+    ["fg_tab_other"] = "#68759f",
+    ["bg_tab_alternate"] = "#ccbfff",
+    ["bg_added"] = "#d0f0d0",
+    ["bg_added_faint"] = "#e5ffe5",
+    ["bg_added_refine"] = "#b2e8be",
+    ["bg_added_fringe"] = "#b2e8be",
+    ["fg_added"] = "#005000",
+    ["fg_added_intense"] = "#005000",
+    ["bg_changed"] = "#f4e8bd",
+    ["bg_changed_faint"] = "#f9efcb",
+    ["bg_changed_refine"] = "#efd299",
+    ["bg_changed_fringe"] = "#efd299",
+    ["fg_changed"] = "#553d00",
+    ["fg_changed_intense"] = "#553d00",
+    ["bg_removed"] = "#ffd8d5",
+    ["bg_removed_faint"] = "#ffe9e9",
+    ["bg_removed_refine"] = "#f3b5af",
+    ["bg_removed_fringe"] = "#f3b5af",
+    ["fg_removed"] = "#8f1313",
+    ["fg_removed_intense"] = "#8f1313",
+    ["bg_diff_context"] = "#efefef",
+    ["visual"] = "#bfefff",
+    ["link"] = "#4250ef",
+    ["link_visited"] = "#ba35af",
+    ["link_symbolic"] = "#1f6fbf",
+    ["string"] = "#4250ef",
+    ["comment"] = "#a65f6a",
+    ["constant"] = "#065fff",
+    ["identifier"] = "#af5a80",
+    ["keyword"] = "#6052cf",
+    ["type"] = "#008858",
+    ["fnname"] = "#cf25aa",
+    ["variable"] = "#1f77bb",
+    ["rainbow_0"] = "#008858",
+    ["rainbow_1"] = "#4f54aa",
+    ["rainbow_2"] = "#ba35af",
+    ["rainbow_3"] = "#1f77bb",
+    ["rainbow_4"] = "#b65050",
+    ["rainbow_5"] = "#6052cf",
+    ["rainbow_6"] = "#d51272",
+    ["rainbow_7"] = "#008858",
+    ["prose_todo"] = "#e00033",
+    ["prose_done"] = "#217a3c",
+    ["prose_tag"] = "#61756c",
+    ["prose_table"] = "#397a70",
+    ["err"] = "#e00033",
+    ["warning"] = "#b6532f",
+    ["info"] = "#217a3c",
+    ["hint"] = "#506fa0",
+    ["ok"] = "#008858",
+  },
+}
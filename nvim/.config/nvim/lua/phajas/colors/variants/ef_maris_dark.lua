@@ -0,0 +1,165 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_maris_dark (Ef Maris family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "ef_maris",
+  ["flavor"] = "dark",
+  ["foreground"] = "#eaedef",
+  ["background"] = "#131c2b",
+  ["cursor"] = "#8fdfff",
+  ["selection_background"] = "#183c65",
+  ["selection_foreground"] = "#eaedef",
+  ["ansi"] = {
+    "#131c2b",
+    "#ff6f6f",
+    "#41bf4f",
+    "#d0d24f",
+    "#57b0ff",
+    "#f59acf",
+    "#2fd0db",
+    "#eaedef",
+    "#1d2c39",
+    "#ff7a5f",
+    "#7fce5f",
+    "#f0c060",
+    "#70a0ff",
+    "#fa90ea",
+    "#7fcfdf",
+    "#969faf",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#131c2b",
+    ["bg_dim"] = "#1d2c39",
+    ["bg_alt"] = "#2a3644",
+    ["fg_main"] = "#eaedef",
+    ["fg_dim"] = "#969faf",
+    ["fg_alt"] = "#90a0dc",
+    ["border"] = "#595a63",
+    ["border_highlight"] = "#90a0dc",
+    ["red"] = "#ff6f6f",
+    ["red_warmer"] = "#ff7a5f",
+    ["red_cooler"] = "#ff7788",
+    ["red_faint"] = "#eaa4a4",
+    ["green"] = "#41bf4f",
+    ["green_warmer"] = "#7fce5f",
+    ["green_cooler"] = "#30c489",
+    ["green_faint"] = "#a9c99f",
+    ["yellow"] = "#d0d24f",
+    ["yellow_warmer"] = "#f0c060",
+    ["yellow_cooler"] = "#cab27f",
+    ["yellow_faint"] = "#cac89f",
+    ["blue"] = "#57b0ff",
+    ["blue_warmer"] = "#70a0ff",
+    ["blue_cooler"] = "#12b4ff",
+    ["blue_faint"] = "#9acfff",
+    ["magenta"] = "#f59acf",
+    ["magenta_warmer"] = "#fa90ea",
+    ["magenta_cooler"] = "#cf90ff",
+    ["magenta_faint"] = "#d4aaf0",
+    ["cyan"] = "#2fd0db",
+    ["cyan_warmer"] = "#7fcfdf",
+    ["cyan_cooler"] = "#65d5a8",
+    ["cyan_faint"] = "#99bfcf",
+    ["rust"] = "#ff7a5f",
+    ["gold"] = "#d0d24f",
+    ["olive"] = "#7fce5f",
+    ["slate"] = "#9acfff",
+    ["indigo"] = "#cf90ff",
+    ["maroon"] = "#ff7788",
+    ["pink"] = "#fa90ea",
+    ["red_intense"] = "#ff6f6f",
+    ["green_intense"] = "#41bf4f",
+    ["yellow_intense"] = "#d0d24f",
+    ["blue_intense"] = "#57b0ff",
+    ["magenta_intense"] = "#f59acf",
+    ["cyan_intense"] = "#2fd0db",
+    ["bg_red_intense"] = "#bd1f30",
+    ["bg_green_intense"] = "#107840",
+    ["bg_yellow_intense"] = "#847020",
+    ["bg_blue_intense"] = "#2f5f9f",
+    ["bg_magenta_intense"] = "#b05fcf",
+    ["bg_cyan_intense"] = "#0280b9",
+    ["bg_red_subtle"] = "#6f293a",
+    ["bg_green_subtle"] = "#1f523a",
+    ["bg_yellow_subtle"] = "#604233",
+    ["bg_blue_subtle"] = "#284477",
+    ["bg_magenta_subtle"] = "#52336b",
+    ["bg_cyan_subtle"] = "#204c68",
+    ["bg_red_nuanced"] = "#6f293a",
+    ["bg_green_nuanced"] = "#1f523a",
+    ["bg_yellow_nuanced"] = "#604233",
+    ["bg_blue_nuanced"] = "#284477",
+    ["bg_magenta_nuanced"] = "#52336b",
+    ["bg_cyan_nuanced"] = "#204c68",
+    ["bg_completion"] = "#204358",
+    ["bg_hl_line"] = "#243242",
+    ["bg_paren_match"] = "#6c5d54",
+    ["bg_paren_expression"] = "#684d54",
+    ["bg_char_0"] = "#284477",
+    ["bg_char_1"] = "#52336b",
+    ["bg_char_2"] = "#604233",
+    ["bg_active"] = "#4a5664",
+    ["fg_active"] = "#eaedef",
+    ["bg_inactive"] = "#1a2331",
+    ["fg_inactive"] = "#969faf",
+    ["bg_status_line_active"] = "#2f527b",
+    ["fg_status_line_active"] = "#ecf0ff",
+    ["bg_status_line_inactive"] = "#1d2c39",
+    ["fg_status_line_inactive"] = "#969faf",
+    ["bg_tab_bar"] = "#2a3644",
+    ["bg_tab_current"] = "#131c2b",
+    ["bg_tab_other"] = "#4a5664",
+    ["fg_tab_other"] = "#969faf",
+    ["bg_tab_alternate"] = "#49516a",
+    ["bg_added"] = "#20493f",
+    ["bg_added_faint"] = "#163530",
+    ["bg_added_refine"] = "#136244",
+    ["bg_added_fringe"] = "#136244",
+    ["fg_added"] = "#a0e0a0",
+    ["fg_added_intense"] = "#a0e0a0",
+    ["bg_changed"] = "#51512f",
+    ["bg_changed_faint"] = "#40332f",
+    ["bg_changed_refine"] = "#61621f",
+    ["bg_changed_fringe"] = "#61621f",
+    ["fg_changed"] = "#dada90",
+    ["fg_changed_intense"] = "#dada90",
+    ["bg_removed"] = "#5e242f",
+    ["bg_removed_faint"] = "#4a202d",
+    ["bg_removed_refine"] = "#772a35",
+    ["bg_removed_fringe"] = "#772a35",
+    ["fg_removed"] = "#ffbfbf",
+    ["fg_removed_intense"] = "#ffbfbf",
+    ["bg_diff_context"] = "#1d2c39",
+    ["visual"] = "#183c65",
+    ["link"] = "#57b0ff",
+    ["link_visited"] = "#cf90ff",
+    ["link_symbolic"] = "#2fd0db",
+    ["string"] = "#65d5a8",
+    ["comment"] = "#eaa4a4",
+    ["constant"] = "#12b4ff",
+    ["identifier"] = "#d4aaf0",
+    ["keyword"] = "#70a0ff",
+    ["type"] = "#41bf4f",
+    ["fnname"] = "#7fce5f",
+    ["variable"] = "#2fd0db",
+    ["rainbow_0"] = "#30c489",
+    ["rainbow_1"] = "#70a0ff",
+    ["rainbow_2"] = "#7fce5f",
+    ["rainbow_3"] = "#2fd0db",
+    ["rainbow_4"] = "#cf90ff",
+    ["rainbow_5"] = "#12b4ff",
+    ["rainbow_6"] = "#f59acf",
+    ["rainbow_7"] = "#65d5a8",
+    ["prose_todo"] = "#ff7788",
+    ["prose_done"] = "#30c489",
+    ["prose_tag"] = "#99bfcf",
+    ["prose_table"] = "#90a0dc",
+    ["err"] = "#ff7a5f",
+    ["warning"] = "#f0c060",
+    ["info"] = "#30c489",
+    ["hint"] = "#99bfcf",
+    ["ok"] = "#30c489",
+  },
+}
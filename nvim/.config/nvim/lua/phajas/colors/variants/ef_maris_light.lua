@@ -0,0 +1,165 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_maris_light (Ef Maris family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "ef_maris",
+  ["flavor"] = "light",
+  ["foreground"] = "#151a27",
+  ["background"] = "#edf4f8",
+  ["cursor"] = "#036f99",
+  ["selection_background"] = "#c8dcff",
+  ["selection_foreground"] = "#151a27",
+  ["ansi"] = {
+    "#edf4f8",
+    "#c3303a",
+    "#007010",
+    "#805a1f",
+    "#375cc6",
+    "#80308f",
+    "#1f66af",
+    "#151a27",
+    "#e0e7ef",
+    "#d00000",
+    "#3a6f00",
+    "#8b4400",
+    "#444fcf",
+    "#9a3a6a",
+    "#305675",
+    "#676470",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#edf4f8",
+    ["bg_dim"] = "#e0e7ef",
+    ["bg_alt"] = "#cfd8e3",
+    ["fg_main"] = "#151a27",
+    ["fg_dim"] = "#676470",
+    ["fg_alt"] = "#3f4f99",
+    ["border"] = "#a2a6af",
+    ["border_highlight"] = "#3f4f99",
+    ["red"] = "#c3303a",
+    ["red_warmer"] = "#d00000",
+    ["red_cooler"] = "#b02440",
+    ["red_faint"] = "#8b4052",
+    ["green"] = "#007010",
+    ["green_warmer"] = "#3a6f00",
+    ["green_cooler"] = "#007047",
+    ["green_faint"] = "#4a763f",
+    ["yellow"] = "#805a1f",
+    ["yellow_warmer"] = "#8b4400",
+    ["yellow_cooler"] = "#78542f",
+    ["yellow_faint"] = "#7f4f4a",
+    ["blue"] = "#375cc6",
+    ["blue_warmer"] = "#444fcf",
+    ["blue_cooler"] = "#003faf",
+    ["blue_faint"] = "#3a5099",
+    ["magenta"] = "#80308f",
+    ["magenta_warmer"] = "#9a3a6a",
+    ["magenta_cooler"] = "#5f2fba",
+    ["magenta_faint"] = "#6a4a9f",
+    ["cyan"] = "#1f66af",
+    ["cyan_warmer"] = "#305675",
+    ["cyan_cooler"] = "#006f70",
+    ["cyan_faint"] = "#3f627f",
+    ["rust"] = "#d00000",
+    ["gold"] = "#805a1f",
+    ["olive"] = "#3a6f00",
+    ["slate"] = "#3a5099",
+    ["indigo"] = "#5f2fba",
+    ["maroon"] = "#b02440",
+    ["pink"] = "#9a3a6a",
+    ["red_intense"] = "#c3303a",
+    ["green_intense"] = "#007010",
+    ["yellow_intense"] = "#805a1f",
+    ["blue_intense"] = "#375cc6",
+    ["magenta_intense"] = "#80308f",
+    ["cyan_intense"] = "#1f66af",
+    ["bg_red_intense"] = "#ff8f88",
+    ["bg_green_intense"] = "#96df80",
+    ["bg_yellow_intense"] = "#efbf00",
+    ["bg_blue_intense"] = "#cfceff",
+    ["bg_magenta_intense"] = "#df9fff",
+    ["bg_cyan_intense"] = "#88cfd0",
+    ["bg_red_subtle"] = "#f0c6cf",
+    ["bg_green_subtle"] = "#b0ebca",
+    ["bg_yellow_subtle"] = "#e4e498",
+    ["bg_blue_subtle"] = "#ccd5f7",
+    ["bg_magenta_subtle"] = "#edd3f2",
+    ["bg_cyan_subtle"] = "#b2e6f0",
+    ["bg_red_nuanced"] = "#f0c6cf",
+    ["bg_green_nuanced"] = "#b0ebca",
+    ["bg_yellow_nuanced"] = "#e4e498",
+    ["bg_blue_nuanced"] = "#ccd5f7",
+    ["bg_magenta_nuanced"] = "#edd3f2",
+    ["bg_cyan_nuanced"] = "#b2e6f0",
+    ["bg_completion"] = "#cddbfa",
+    ["bg_hl_line"] = "#dae5f0",
+    ["bg_paren_match"] = "#cab3b2",
+    ["bg_paren_expression"] = "#d2b4cf",
+    ["bg_char_0"] = "#ccd5f7",
+    ["bg_char_1"] = "#edd3f2",
+    ["bg_char_2"] = "#e4e498",
+    ["bg_active"] = "#afb8c3",
+    ["fg_active"] = "#151a27",
+    ["bg_inactive"] = "#e6ecf2",
+    ["fg_inactive"] = "#676470",
+    ["bg_status_line_active"] = "#a0c2ef",
+    ["fg_status_line_active"] = "#142810",
+    ["bg_status_line_inactive"] = "#e0e7ef",
+    ["fg_status_line_inactive"] = "#676470",
+    ["bg_tab_bar"] = "#cfd8e3",
+    ["bg_tab_current"] = "#edf4f8",
+    ["bg_tab_other"] = "#afb8c3",
+    ["fg_tab_other"] = "#676470",
+    ["bg_tab_alternate"] = "#b7bbea",
+    ["bg_added"] = "#b0e8ca",
+    ["bg_added_faint"] = "#c5f0e0",
+    ["bg_added_refine"] = "#a0d4b9",
+    ["bg_added_fringe"] = "#a0d4b9",
+    ["fg_added"] = "#005000",
+    ["fg_added_intense"] = "#005000",
+    ["bg_changed"] = "#f5e8b0",
+    ["bg_changed_faint"] = "#f5f2bf",
+    ["bg_changed_refine"] = "#f0db9a",
+    ["bg_changed_fringe"] = "#f0db9a",
+    ["fg_changed"] = "#553d00",
+    ["fg_changed_intense"] = "#553d00",
+    ["bg_removed"] = "#f5c7d6",
+    ["bg_removed_faint"] = "#f0d6d6",
+    ["bg_removed_refine"] = "#efb1cd",
+    ["bg_removed_fringe"] = "#efb1cd",
+    ["fg_removed"] = "#8f1313",
+    ["fg_removed_intense"] = "#8f1313",
+    ["bg_diff_context"] = "#e0e7ef",
+    ["visual"] = "#c8dcff",
+    ["link"] = "#375cc6",
+    ["link_visited"] = "#5f2fba",
+    ["link_symbolic"] = "#1f66af",
+    ["string"] = "#006f70",
+    ["comment"] = "#8b4052",
+    ["constant"] = "#003faf",
+    ["identifier"] = "#6a4a9f",
+    ["keyword"] = "#444fcf",
+    ["type"] = "#007010",
+    ["fnname"] = "#3a6f00",
+    ["variable"] = "#1f66af",
+    ["rainbow_0"] = "#007047",
+    ["rainbow_1"] = "#444fcf",
+    ["rainbow_2"] = "#3a6f00",
+    ["rainbow_3"] = "#1f66af",
+    ["rainbow_4"] = "#5f2fba",
+    ["rainbow_5"] = "#003faf",
+    ["rainbow_6"] = "#80308f",
+    ["rainbow_7"] = "#006f70",
+    ["prose_todo"] = "#b02440",
+    ["prose_done"] = "#007047",
+    ["prose_tag"] = "#3f627f",
+    ["prose_table"] = "#3f4f99",
+    ["err"] = "#d00000",
+    ["warning"] = "#8b4400",
+    ["info"] = "#007047",
+    ["hint"] = "#3f627f",
+    ["ok"] = "#007047",
+  },
+}
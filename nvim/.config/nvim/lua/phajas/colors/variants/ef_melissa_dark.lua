@@ -0,0 +1,165 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_melissa_dark (Ef Melissa family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "ef_melissa",
+  ["flavor"] = "dark",
+  ["foreground"] = "#e8e4b1",
+  ["background"] = "#352718",
+  ["cursor"] = "#f9cf7a",
+  ["selection_background"] = "#443a4f",
+  ["selection_foreground"] = "#e8e4b1",
+  ["ansi"] = {
+    "#352718",
+    "#ff7f7f",
+    "#6fd560",
+    "#e4b53f",
+    "#57aff6",
+    "#f0aac5",
+    "#6fcad0",
+    "#e8e4b1",
+    "#483426",
+    "#ff7f4f",
+    "#a0d13a",
+    "#ffa21f",
+    "#98bfff",
+    "#fa90aa",
+    "#7fc5df",
+    "#90918a",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#352718",
+    ["bg_dim"] = "#483426",
+    ["bg_alt"] = "#59463f",
+    ["fg_main"] = "#e8e4b1",
+    ["fg_dim"] = "#90918a",
+    ["fg_alt"] = "#ccaa70",
+    ["border"] = "#6f5f58",
+    ["border_highlight"] = "#ccaa70",
+    ["red"] = "#ff7f7f",
+    ["red_warmer"] = "#ff7f4f",
+    ["red_cooler"] = "#ff8f98",
+    ["red_faint"] = "#e89a88",
+    ["green"] = "#6fd560",
+    ["green_warmer"] = "#a0d13a",
+    ["green_cooler"] = "#65d590",
+    ["green_faint"] = "#a0d26f",
+    ["yellow"] = "#e4b53f",
+    ["yellow_warmer"] = "#ffa21f",
+    ["yellow_cooler"] = "#e7a06f",
+    ["yellow_faint"] = "#eab780",
+    ["blue"] = "#57aff6",
+    ["blue_warmer"] = "#98bfff",
+    ["blue_cooler"] = "#62cfef",
+    ["blue_faint"] = "#6ab4ef",
+    ["magenta"] = "#f0aac5",
+    ["magenta_warmer"] = "#fa90aa",
+    ["magenta_cooler"] = "#c6a2fe",
+    ["magenta_faint"] = "#dfcfe0",
+    ["cyan"] = "#6fcad0",
+    ["cyan_warmer"] = "#7fc5df",
+    ["cyan_cooler"] = "#70e0cf",
+    ["cyan_faint"] = "#99bfcf",
+    ["rust"] = "#ff7f4f",
+    ["gold"] = "#e4b53f",
+    ["olive"] = "#a0d13a",
+    ["slate"] = "#6ab4ef",
+    ["indigo"] = "#c6a2fe",
+    ["maroon"] = "#ff8f98",
+    ["pink"] = "#fa90aa",
+    ["red_intense"] = "#ff7f7f",
+    ["green_intense"] = "#6fd560",
+    ["yellow_intense"] = "#e4b53f",
+    ["blue_intense"] = "#57aff6",
+    ["magenta_intense"] = "#f0aac5",
+    ["cyan_intense"] = "#6fcad0",
+    ["bg_red_intense"] = "#b02930",
+    ["bg_green_intense"] = "#4a7100",
+    ["bg_yellow_intense"] = "#8f5040",
+    ["bg_blue_intense"] = "#4648d0",
+    ["bg_magenta_intense"] = "#a04fc5",
+    ["bg_cyan_intense"] = "#2270cf",
+    ["bg_red_subtle"] = "#72292a",
+    ["bg_green_subtle"] = "#3f521a",
+    ["bg_yellow_subtle"] = "#604b13",
+    ["bg_blue_subtle"] = "#384862",
+    ["bg_magenta_subtle"] = "#613a50",
+    ["bg_cyan_subtle"] = "#2f4f4f",
+    ["bg_red_nuanced"] = "#72292a",
+    ["bg_green_nuanced"] = "#3f521a",
+    ["bg_yellow_nuanced"] = "#604b13",
+    ["bg_blue_nuanced"] = "#384862",
+    ["bg_magenta_nuanced"] = "#613a50",
+    ["bg_cyan_nuanced"] = "#2f4f4f",
+    ["bg_completion"] = "#66421f",
+    ["bg_hl_line"] = "#4f311f",
+    ["bg_paren_match"] = "#5f6f1f",
+    ["bg_paren_expression"] = "#60518f",
+    ["bg_char_0"] = "#384862",
+    ["bg_char_1"] = "#613a50",
+    ["bg_char_2"] = "#604b13",
+    ["bg_active"] = "#79665f",
+    ["fg_active"] = "#e8e4b1",
+    ["bg_inactive"] = "#3d2e1f",
+    ["fg_inactive"] = "#90918a",
+    ["bg_status_line_active"] = "#704f00",
+    ["fg_status_line_active"] = "#f8efd8",
+    ["bg_status_line_inactive"] = "#483426",
+    ["fg_status_line_inactive"] = "#90918a",
+    ["bg_tab_bar"] = "#59463f",
+    ["bg_tab_current"] = "#352718",
+    ["bg_tab_other"] = "#483426",
+    ["fg_tab_other"] = "#90918a",
+    ["bg_tab_alternate"] = "#5a661f",
+    ["bg_added"] = "#2f491f",
+    ["bg_added_faint"] = "#2f3b0f",
+    ["bg_added_refine"] = "#3f6234",
+    ["bg_added_fringe"] = "#3f6234",
+    ["fg_added"] = "#a0e0a0",
+    ["fg_added_intense"] = "#a0e0a0",
+    ["bg_changed"] = "#544a0f",
+    ["bg_changed_faint"] = "#43350f",
+    ["bg_changed_refine"] = "#615f1f",
+    ["bg_changed_fringe"] = "#615f1f",
+    ["fg_changed"] = "#dada90",
+    ["fg_changed_intense"] = "#dada90",
+    ["bg_removed"] = "#622a1f",
+    ["bg_removed_faint"] = "#4b240a",
+    ["bg_removed_refine"] = "#7f3325",
+    ["bg_removed_fringe"] = "#7f3325",
+    ["fg_removed"] = "#ffbfbf",
+    ["fg_removed_intense"] = "#ffbfbf",
+    ["bg_diff_context"] = "#483426",
+    ["visual"] = "#443a4f",
+    ["link"] = "#e4b53f",
+    ["link_visited"] = "#c6a2fe",
+    ["link_symbolic"] = "#6fcad0",
+    ["string"] = "#ffa21f",
+    ["comment"] = "#eab780",
+    ["constant"] = "#98bfff",
+    ["identifier"] = "#e89a88",
+    ["keyword"] = "#e4b53f",
+    ["type"] = "#65d590",
+    ["fnname"] = "#6fd560",
+    ["variable"] = "#6fcad0",
+    ["rainbow_0"] = "#ffa21f",
+    ["rainbow_1"] = "#e4b53f",
+    ["rainbow_2"] = "#a0d13a",
+    ["rainbow_3"] = "#ff8f98",
+    ["rainbow_4"] = "#7fc5df",
+    ["rainbow_5"] = "#f0aac5",
+    ["rainbow_6"] = "#65d590",
+    ["rainbow_7"] = "#fa90aa",
+    ["prose_todo"] = "#ff7f4f",
+    ["prose_done"] = "#6fd560",
+    ["prose_tag"] = "#eab780",
+    ["prose_table"] = "#ccaa70",
+    ["err"] = "#ff7f4f",
+    ["warning"] = "#ffa21f",
+    ["info"] = "#6fd560",
+    ["hint"] = "#99bfcf",
+    ["ok"] = "#65d590",
+  },
+}
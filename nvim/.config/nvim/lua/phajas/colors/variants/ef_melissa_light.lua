@@ -0,0 +1,165 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_melissa_light (Ef Melissa family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "ef_melissa",
+  ["flavor"] = "light",
+  ["foreground"] = "#484431",
+  ["background"] = "#fff6d8",
+  ["cursor"] = "#a07f00",
+  ["selection_background"] = "#f0d4d8",
+  ["selection_foreground"] = "#484431",
+  ["ansi"] = {
+    "#fff6d8",
+    "#ba2d2f",
+    "#007a0a",
+    "#a26310",
+    "#375cc6",
+    "#aa3e74",
+    "#3f60af",
+    "#484431",
+    "#f5e9cb",
+    "#c74400",
+    "#5a7400",
+    "#ba5205",
+    "#5f5fdf",
+    "#b02f80",
+    "#4060a0",
+    "#68708a",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#fff6d8",
+    ["bg_dim"] = "#f5e9cb",
+    ["bg_alt"] = "#e7d7c6",
+    ["fg_main"] = "#484431",
+    ["fg_dim"] = "#68708a",
+    ["fg_alt"] = "#80431a",
+    ["border"] = "#c5baa6",
+    ["border_highlight"] = "#80431a",
+    ["red"] = "#ba2d2f",
+    ["red_warmer"] = "#c74400",
+    ["red_cooler"] = "#c02945",
+    ["red_faint"] = "#b05350",
+    ["green"] = "#007a0a",
+    ["green_warmer"] = "#5a7400",
+    ["green_cooler"] = "#008250",
+    ["green_faint"] = "#61756c",
+    ["yellow"] = "#a26310",
+    ["yellow_warmer"] = "#ba5205",
+    ["yellow_cooler"] = "#946830",
+    ["yellow_faint"] = "#7f6f1a",
+    ["blue"] = "#375cc6",
+    ["blue_warmer"] = "#5f5fdf",
+    ["blue_cooler"] = "#265fbf",
+    ["blue_faint"] = "#4a659f",
+    ["magenta"] = "#aa3e74",
+    ["magenta_warmer"] = "#b02f80",
+    ["magenta_cooler"] = "#6448ca",
+    ["magenta_faint"] = "#905ea0",
+    ["cyan"] = "#3f60af",
+    ["cyan_warmer"] = "#4060a0",
+    ["cyan_cooler"] = "#0f708a",
+    ["cyan_faint"] = "#4f6f8f",
+    ["rust"] = "#c74400",
+    ["gold"] = "#a26310",
+    ["olive"] = "#5a7400",
+    ["slate"] = "#4a659f",
+    ["indigo"] = "#6448ca",
+    ["maroon"] = "#c02945",
+    ["pink"] = "#b02f80",
+    ["red_intense"] = "#ba2d2f",
+    ["green_intense"] = "#007a0a",
+    ["yellow_intense"] = "#a26310",
+    ["blue_intense"] = "#375cc6",
+    ["magenta_intense"] = "#aa3e74",
+    ["cyan_intense"] = "#3f60af",
+    ["bg_red_intense"] = "#ff8f88",
+    ["bg_green_intense"] = "#96df80",
+    ["bg_yellow_intense"] = "#efbf00",
+    ["bg_blue_intense"] = "#cfceff",
+    ["bg_magenta_intense"] = "#df9fff",
+    ["bg_cyan_intense"] = "#88cfd0",
+    ["bg_red_subtle"] = "#ffceb0",
+    ["bg_green_subtle"] = "#cbf09f",
+    ["bg_yellow_subtle"] = "#f4ed7e",
+    ["bg_blue_subtle"] = "#cce4f2",
+    ["bg_magenta_subtle"] = "#fad6ef",
+    ["bg_cyan_subtle"] = "#bfefef",
+    ["bg_red_nuanced"] = "#ffceb0",
+    ["bg_green_nuanced"] = "#cbf09f",
+    ["bg_yellow_nuanced"] = "#f4ed7e",
+    ["bg_blue_nuanced"] = "#cce4f2",
+    ["bg_magenta_nuanced"] = "#fad6ef",
+    ["bg_cyan_nuanced"] = "#bfefef",
+    ["bg_completion"] = "#ffe2a8",
+    ["bg_hl_line"] = "#fae7b0",
+    ["bg_paren_match"] = "#afcf8f",
+    ["bg_paren_expression"] = "#deb4f0",
+    ["bg_char_0"] = "#cce4f2",
+    ["bg_char_1"] = "#fad6ef",
+    ["bg_char_2"] = "#f4ed7e",
+    ["bg_active"] = "#c7b7a6",
+    ["fg_active"] = "#484431",
+    ["bg_inactive"] = "#f9efd4",
+    ["fg_inactive"] = "#68708a",
+    ["bg_status_line_active"] = "#f3cf72",
+    ["fg_status_line_active"] = "#403328",
+    ["bg_status_line_inactive"] = "#f5e9cb",
+    ["fg_status_line_inactive"] = "#68708a",
+    ["bg_tab_bar"] = "#e7d7c6",
+    ["bg_tab_current"] = "#fff6d8",
+    ["bg_tab_other"] = "#f5e9cb",
+    ["fg_tab_other"] = "#68708a",
+    ["bg_tab_alternate"] = "#c4d47a",
+    ["bg_added"] = "#d7ecb0",
+    ["bg_added_faint"] = "#eef3c2",
+    ["bg_added_refine"] = "#c9dda0",
+    ["bg_added_fringe"] = "#c9dda0",
+    ["fg_added"] = "#005000",
+    ["fg_added_intense"] = "#005000",
+    ["bg_changed"] = "#f5e690",
+    ["bg_changed_faint"] = "#f5edaf",
+    ["bg_changed_refine"] = "#edd482",
+    ["bg_changed_fringe"] = "#edd482",
+    ["fg_changed"] = "#553d00",
+    ["fg_changed_intense"] = "#553d00",
+    ["bg_removed"] = "#f8d0b6",
+    ["bg_removed_faint"] = "#f5deb0",
+    ["bg_removed_refine"] = "#f0bba9",
+    ["bg_removed_fringe"] = "#f0bba9",
+    ["fg_removed"] = "#8f1313",
+    ["fg_removed_intense"] = "#8f1313",
+    ["bg_diff_context"] = "#f5e9cb",
+    ["visual"] = "#f0d4d8",
+    ["link"] = "#a26310",
+    ["link_visited"] = "#6448ca",
+    ["link_symbolic"] = "#3f60af",
+    ["string"] = "#c74400",
+    ["comment"] = "#7f6f1a",
+    ["constant"] = "#3f60af",
+    ["identifier"] = "#b05350",
+    ["keyword"] = "#a26310",
+    ["type"] = "#008250",
+    ["fnname"] = "#5a7400",
+    ["variable"] = "#0f708a",
+    ["rainbow_0"] = "#ba5205",
+    ["rainbow_1"] = "#a26310",
+    ["rainbow_2"] = "#5a7400",
+    ["rainbow_3"] = "#c02945",
+    ["rainbow_4"] = "#4060a0",
+    ["rainbow_5"] = "#aa3e74",
+    ["rainbow_6"] = "#008250",
+    ["rainbow_7"] = "#b02f80",
+    ["prose_todo"] = "#c74400",
+    ["prose_done"] = "#007a0a",
+    ["prose_tag"] = "#7f6f1a",
+    ["prose_table"] = "#80431a",
+    ["err"] = "#c74400",
+    ["warning"] = "#ba5205",
+    ["info"] = "#007a0a",
+    ["hint"] = "#4f6f8f",
+    ["ok"] = "#008250",
+  },
+}
@@ -0,0 +1,165 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_night (Ef Day/Night family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "ef_daynight",
+  ["flavor"] = "dark",
+  ["foreground"] = "#afbcbf",
+  ["background"] = "#000e17",
+  ["cursor"] = "#00ccff",
+  ["selection_background"] = "#253146",
+  ["selection_foreground"] = "#afbcbf",
+  ["ansi"] = {
+    "#000e17",
+    "#ef656a",
+    "#1fa526",
+    "#c48502",
+    "#379cf6",
+    "#d570af",
+    "#4fb0cf",
+    "#afbcbf",
+    "#1a202b",
+    "#f47360",
+    "#50a22f",
+    "#e6832f",
+    "#6a88ff",
+    "#e580ea",
+    "#6fafff",
+    "#70819f",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#000e17",
+    ["bg_dim"] = "#1a202b",
+    ["bg_alt"] = "#242e39",
+    ["fg_main"] = "#afbcbf",
+    ["fg_dim"] = "#70819f",
+    ["fg_alt"] = "#b0a0a0",
+    ["border"] = "#3a4a66",
+    ["border_highlight"] = "#b0a0a0",
+    ["red"] = "#ef656a",
+    ["red_warmer"] = "#f47360",
+    ["red_cooler"] = "#ef798f",
+    ["red_faint"] = "#d56f72",
+    ["green"] = "#1fa526",
+    ["green_warmer"] = "#50a22f",
+    ["green_cooler"] = "#00a972",
+    ["green_faint"] = "#61a06c",
+    ["yellow"] = "#c48502",
+    ["yellow_warmer"] = "#e6832f",
+    ["yellow_cooler"] = "#df8f6f",
+    ["yellow_faint"] = "#cf9f7f",
+    ["blue"] = "#379cf6",
+    ["blue_warmer"] = "#6a88ff",
+    ["blue_cooler"] = "#029fff",
+    ["blue_faint"] = "#7a94df",
+    ["magenta"] = "#d570af",
+    ["magenta_warmer"] = "#e580ea",
+    ["magenta_cooler"] = "#af8aff",
+    ["magenta_faint"] = "#c59fcf",
+    ["cyan"] = "#4fb0cf",
+    ["cyan_warmer"] = "#6fafff",
+    ["cyan_cooler"] = "#3dc0b0",
+    ["cyan_faint"] = "#92b4df",
+    ["rust"] = "#f47360",
+    ["gold"] = "#c48502",
+    ["olive"] = "#50a22f",
+    ["slate"] = "#7a94df",
+    ["indigo"] = "#af8aff",
+    ["maroon"] = "#ef798f",
+    ["pink"] = "#e580ea",
+    ["red_intense"] = "#ef656a",
+    ["green_intense"] = "#1fa526",
+    ["yellow_intense"] = "#c48502",
+    ["blue_intense"] = "#379cf6",
+    ["magenta_intense"] = "#d570af",
+    ["cyan_intense"] = "#4fb0cf",
+    ["bg_red_intense"] = "#bd1f30",
+    ["bg_green_intense"] = "#107440",
+    ["bg_yellow_intense"] = "#847020",
+    ["bg_blue_intense"] = "#2f5f9f",
+    ["bg_magenta_intense"] = "#804fd5",
+    ["bg_cyan_intense"] = "#0280b9",
+    ["bg_red_subtle"] = "#6a1b2f",
+    ["bg_green_subtle"] = "#0a432f",
+    ["bg_yellow_subtle"] = "#533420",
+    ["bg_blue_subtle"] = "#1f3665",
+    ["bg_magenta_subtle"] = "#502555",
+    ["bg_cyan_subtle"] = "#113b5e",
+    ["bg_red_nuanced"] = "#6a1b2f",
+    ["bg_green_nuanced"] = "#0a432f",
+    ["bg_yellow_nuanced"] = "#533420",
+    ["bg_blue_nuanced"] = "#1f3665",
+    ["bg_magenta_nuanced"] = "#502555",
+    ["bg_cyan_nuanced"] = "#113b5e",
+    ["bg_completion"] = "#00314f",
+    ["bg_hl_line"] = "#002255",
+    ["bg_paren_match"] = "#664950",
+    ["bg_paren_expression"] = "#6f345a",
+    ["bg_char_0"] = "#1f3665",
+    ["bg_char_1"] = "#502555",
+    ["bg_char_2"] = "#533420",
+    ["bg_active"] = "#444e59",
+    ["fg_active"] = "#afbcbf",
+    ["bg_inactive"] = "#11141f",
+    ["fg_inactive"] = "#70819f",
+    ["bg_status_line_active"] = "#003a7f",
+    ["fg_status_line_active"] = "#ceeeff",
+    ["bg_status_line_inactive"] = "#1a202b",
+    ["fg_status_line_inactive"] = "#70819f",
+    ["bg_tab_bar"] = "#242e39",
+    ["bg_tab_current"] = "#000e17",
+    ["bg_tab_other"] = "#444e59",
+    ["fg_tab_other"] = "#70819f",
+    ["bg_tab_alternate"] = "#493737",
+    ["bg_added"] = "#00371f",
+    ["bg_added_faint"] = "#002918",
+    ["bg_added_refine"] = "#004c2f",
+    ["bg_added_fringe"] = "#004c2f",
+    ["fg_added"] = "#a0e0a0",
+    ["fg_added_intense"] = "#a0e0a0",
+    ["bg_changed"] = "#363300",
+    ["bg_changed_faint"] = "#2a1f00",
+    ["bg_changed_refine"] = "#4a4a00",
+    ["bg_changed_fringe"] = "#4a4a00",
+    ["fg_changed"] = "#efef80",
+    ["fg_changed_intense"] = "#efef80",
+    ["bg_removed"] = "#450f1f",
+    ["bg_removed_faint"] = "#2f060f",
+    ["bg_removed_refine"] = "#641426",
+    ["bg_removed_fringe"] = "#641426",
+    ["fg_removed"] = "#ffbfbf",
+    ["fg_removed_intense"] = "#ffbfbf",
+    ["bg_diff_context"] = "#1a202b",
+    ["visual"] = "#253146",
+    ["link"] = "#379cf6",
+    ["link_visited"] = "#af8aff",
+    ["link_symbolic"] = "#4fb0cf",
+    ["string"] = "#029fff",
+    ["comment"] = "#cf9f7f",
+    ["constant"] = "#af8aff",
+    ["identifier"] = "#c59fcf",
+    ["keyword"] = "#6a88ff",
+    ["type"] = "#c59fcf",
+    ["fnname"] = "#3dc0b0",
+    ["variable"] = "#6fafff",
+    ["rainbow_0"] = "#6fafff",
+    ["rainbow_1"] = "#af8aff",
+    ["rainbow_2"] = "#df8f6f",
+    ["rainbow_3"] = "#6a88ff",
+    ["rainbow_4"] = "#d570af",
+    ["rainbow_5"] = "#1fa526",
+    ["rainbow_6"] = "#c48502",
+    ["rainbow_7"] = "#4fb0cf",
+    ["prose_todo"] = "#ef656a",
+    ["prose_done"] = "#00a972",
+    ["prose_tag"] = "#b0a0a0",
+    ["prose_table"] = "#b0a0a0",
+    ["err"] = "#ef656a",
+    ["warning"] = "#e6832f",
+    ["info"] = "#00a972",
+    ["hint"] = "#92b4df",
+    ["ok"] = "#00a972",
+  },
+}
@@ -0,0 +1,165 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_trio_dark (Ef Trio family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "ef_trio",
+  ["flavor"] = "dark",
+  ["foreground"] = "#d8cfd5",
+  ["background"] = "#160f0f",
+  ["cursor"] = "#ff99ff",
+  ["selection_background"] = "#16304f",
+  ["selection_foreground"] = "#d8cfd5",
+  ["ansi"] = {
+    "#160f0f",
+    "#f48359",
+    "#60b444",
+    "#d4a052",
+    "#7fa5f6",
+    "#d37faf",
+    "#8fbaff",
+    "#d8cfd5",
+    "#2a2228",
+    "#ff7560",
+    "#a0c27f",
+    "#ef926f",
+    "#8895ff",
+    "#e772df",
+    "#9ac2ff",
+    "#908890",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#160f0f",
+    ["bg_dim"] = "#2a2228",
+    ["bg_alt"] = "#362f35",
+    ["fg_main"] = "#d8cfd5",
+    ["fg_dim"] = "#908890",
+    ["fg_alt"] = "#afdacf",
+    ["border"] = "#605760",
+    ["border_highlight"] = "#afdacf",
+    ["red"] = "#f48359",
+    ["red_warmer"] = "#ff7560",
+    ["red_cooler"] = "#ff85aa",
+    ["red_faint"] = "#e07a9a",
+    ["green"] = "#60b444",
+    ["green_warmer"] = "#a0c27f",
+    ["green_cooler"] = "#60bf88",
+    ["green_faint"] = "#61a06c",
+    ["yellow"] = "#d4a052",
+    ["yellow_warmer"] = "#ef926f",
+    ["yellow_cooler"] = "#ef9680",
+    ["yellow_faint"] = "#c7a07f",
+    ["blue"] = "#7fa5f6",
+    ["blue_warmer"] = "#8895ff",
+    ["blue_cooler"] = "#72afff",
+    ["blue_faint"] = "#7a94df",
+    ["magenta"] = "#d37faf",
+    ["magenta_warmer"] = "#e772df",
+    ["magenta_cooler"] = "#a698ef",
+    ["magenta_faint"] = "#c9addf",
+    ["cyan"] = "#8fbaff",
+    ["cyan_warmer"] = "#9ac2ff",
+    ["cyan_cooler"] = "#8fcfdf",
+    ["cyan_faint"] = "#8ac0ef",
+    ["rust"] = "#ff7560",
+    ["gold"] = "#d4a052",
+    ["olive"] = "#a0c27f",
+    ["slate"] = "#7a94df",
+    ["indigo"] = "#a698ef",
+    ["maroon"] = "#ff85aa",
+    ["pink"] = "#e772df",
+    ["red_intense"] = "#f48359",
+    ["green_intense"] = "#60b444",
+    ["yellow_intense"] = "#d4a052",
+    ["blue_intense"] = "#7fa5f6",
+    ["magenta_intense"] = "#d37faf",
+    ["cyan_intense"] = "#8fbaff",
+    ["bg_red_intense"] = "#b02930",
+    ["bg_green_intense"] = "#2a7140",
+    ["bg_yellow_intense"] = "#8f5040",
+    ["bg_blue_intense"] = "#4648d0",
+    ["bg_magenta_intense"] = "#804fd5",
+    ["bg_cyan_intense"] = "#2270cf",
+    ["bg_red_subtle"] = "#651f1a",
+    ["bg_green_subtle"] = "#1a421f",
+    ["bg_yellow_subtle"] = "#553320",
+    ["bg_blue_subtle"] = "#283565",
+    ["bg_magenta_subtle"] = "#562654",
+    ["bg_cyan_subtle"] = "#133d58",
+    ["bg_red_nuanced"] = "#651f1a",
+    ["bg_green_nuanced"] = "#1a421f",
+    ["bg_yellow_nuanced"] = "#553320",
+    ["bg_blue_nuanced"] = "#283565",
+    ["bg_magenta_nuanced"] = "#562654",
+    ["bg_cyan_nuanced"] = "#133d58",
+    ["bg_completion"] = "#2f335a",
+    ["bg_hl_line"] = "#34223f",
+    ["bg_paren_match"] = "#2f605e",
+    ["bg_paren_expression"] = "#004f3f",
+    ["bg_char_0"] = "#283565",
+    ["bg_char_1"] = "#562654",
+    ["bg_char_2"] = "#553320",
+    ["bg_active"] = "#564f55",
+    ["fg_active"] = "#d8cfd5",
+    ["bg_inactive"] = "#1c1719",
+    ["fg_inactive"] = "#908890",
+    ["bg_status_line_active"] = "#6a294f",
+    ["fg_status_line_active"] = "#ffdfdf",
+    ["bg_status_line_inactive"] = "#2a2228",
+    ["fg_status_line_inactive"] = "#908890",
+    ["bg_tab_bar"] = "#362f35",
+    ["bg_tab_current"] = "#160f0f",
+    ["bg_tab_other"] = "#564f55",
+    ["fg_tab_other"] = "#908890",
+    ["bg_tab_alternate"] = "#452f5f",
+    ["bg_added"] = "#00371f",
+    ["bg_added_faint"] = "#002918",
+    ["bg_added_refine"] = "#004c2f",
+    ["bg_added_fringe"] = "#004c2f",
+    ["fg_added"] = "#a0e0a0",
+    ["fg_added_intense"] = "#a0e0a0",
+    ["bg_changed"] = "#363300",
+    ["bg_changed_faint"] = "#2a1f00",
+    ["bg_changed_refine"] = "#4a4a00",
+    ["bg_changed_fringe"] = "#4a4a00",
+    ["fg_changed"] = "#efef80",
+    ["fg_changed_intense"] = "#efef80",
+    ["bg_removed"] = "#450f1f",
+    ["bg_removed_faint"] = "#2f060f",
+    ["bg_removed_refine"] = "#641426",
+    ["bg_removed_fringe"] = "#641426",
+    ["fg_removed"] = "#ffbfbf",
+    ["fg_removed_intense"] = "#ffbfbf",
+    ["bg_diff_context"] = "#2a2228",
+    ["visual"] = "#16304f",
+    ["link"] = "#7fa5f6",
+    ["link_visited"] = "#a698ef",
+    ["link_symbolic"] = "#8fbaff",
+    ["string"] = "#60bf88",
+    ["comment"] = "#c7a07f",
+    ["constant"] = "#e772df",
+    ["identifier"] = "#e07a9a",
+    ["keyword"] = "#d37faf",
+    ["type"] = "#8fcfdf",
+    ["fnname"] = "#8895ff",
+    ["variable"] = "#9ac2ff",
+    ["rainbow_0"] = "#e772df",
+    ["rainbow_1"] = "#8895ff",
+    ["rainbow_2"] = "#60bf88",
+    ["rainbow_3"] = "#d37faf",
+    ["rainbow_4"] = "#8fbaff",
+    ["rainbow_5"] = "#a0c27f",
+    ["rainbow_6"] = "#a698ef",
+    ["rainbow_7"] = "#9ac2ff",
+    ["prose_todo"] = "#ff7560",
+    ["prose_done"] = "#60b444",
+    ["prose_tag"] = "#c9addf",
+    ["prose_table"] = "#afdacf",
+    ["err"] = "#ff7560",
+    ["warning"] = "#d4a052",
+    ["info"] = "#60b444",
+    ["hint"] = "#8ac0ef",
+    ["ok"] = "#60bf88",
+  },
+}
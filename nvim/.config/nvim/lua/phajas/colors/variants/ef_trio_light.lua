@@ -0,0 +1,165 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_trio_light (Ef Trio family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "ef_trio",
+  ["flavor"] = "light",
+  ["foreground"] = "#4f3363",
+  ["background"] = "#f8f5ff",
+  ["cursor"] = "#4f45ff",
+  ["selection_background"] = "#eed0ff",
+  ["selection_foreground"] = "#4f3363",
+  ["ansi"] = {
+    "#f8f5ff",
+    "#c3303a",
+    "#057800",
+    "#a45f22",
+    "#375cd6",
+    "#ad45ba",
+    "#1f6fbf",
+    "#4f3363",
+    "#ebe7f1",
+    "#d03033",
+    "#4f7d0f",
+    "#b8532f",
+    "#5165e4",
+    "#c035aa",
+    "#3f6faf",
+    "#786e74",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#f8f5ff",
+    ["bg_dim"] = "#ebe7f1",
+    ["bg_alt"] = "#e3e0e9",
+    ["fg_main"] = "#4f3363",
+    ["fg_dim"] = "#786e74",
+    ["fg_alt"] = "#3f7668",
+    ["border"] = "#c6bac5",
+    ["border_highlight"] = "#3f7668",
+    ["red"] = "#c3303a",
+    ["red_warmer"] = "#d03033",
+    ["red_cooler"] = "#c01f5f",
+    ["red_faint"] = "#a24568",
+    ["green"] = "#057800",
+    ["green_warmer"] = "#4f7d0f",
+    ["green_cooler"] = "#007f6f",
+    ["green_faint"] = "#41754c",
+    ["yellow"] = "#a45f22",
+    ["yellow_warmer"] = "#b8532f",
+    ["yellow_cooler"] = "#b65050",
+    ["yellow_faint"] = "#a05b5f",
+    ["blue"] = "#375cd6",
+    ["blue_warmer"] = "#5165e4",
+    ["blue_cooler"] = "#065fbf",
+    ["blue_faint"] = "#6060d0",
+    ["magenta"] = "#ad45ba",
+    ["magenta_warmer"] = "#c035aa",
+    ["magenta_cooler"] = "#705ae3",
+    ["magenta_faint"] = "#804fb0",
+    ["cyan"] = "#1f6fbf",
+    ["cyan_warmer"] = "#3f6faf",
+    ["cyan_cooler"] = "#0f7a9d",
+    ["cyan_faint"] = "#5f60bf",
+    ["rust"] = "#d03033",
+    ["gold"] = "#a45f22",
+    ["olive"] = "#4f7d0f",
+    ["slate"] = "#6060d0",
+    ["indigo"] = "#705ae3",
+    ["maroon"] = "#c01f5f",
+    ["pink"] = "#c035aa",
+    ["red_intense"] = "#c3303a",
+    ["green_intense"] = "#057800",
+    ["yellow_intense"] = "#a45f22",
+    ["blue_intense"] = "#375cd6",
+    ["magenta_intense"] = "#ad45ba",
+    ["cyan_intense"] = "#1f6fbf",
+    ["bg_red_intense"] = "#ff7f88",
+    ["bg_green_intense"] = "#7fdda0",
+    ["bg_yellow_intense"] = "#ffc200",
+    ["bg_blue_intense"] = "#cbcfff",
+    ["bg_magenta_intense"] = "#df8fff",
+    ["bg_cyan_intense"] = "#88ccff",
+    ["bg_red_subtle"] = "#ffc3c7",
+    ["bg_green_subtle"] = "#beecc2",
+    ["bg_yellow_subtle"] = "#f3ea8f",
+    ["bg_blue_subtle"] = "#ceddff",
+    ["bg_magenta_subtle"] = "#f5cff8",
+    ["bg_cyan_subtle"] = "#c0eaf0",
+    ["bg_red_nuanced"] = "#ffc3c7",
+    ["bg_green_nuanced"] = "#beecc2",
+    ["bg_yellow_nuanced"] = "#f3ea8f",
+    ["bg_blue_nuanced"] = "#ceddff",
+    ["bg_magenta_nuanced"] = "#f5cff8",
+    ["bg_cyan_nuanced"] = "#c0eaf0",
+    ["bg_completion"] = "#f4cfff",
+    ["bg_hl_line"] = "#cfe6ff",
+    ["bg_paren_match"] = "#dfadaf",
+    ["bg_paren_expression"] = "#aaeccf",
+    ["bg_char_0"] = "#ceddff",
+    ["bg_char_1"] = "#f5cff8",
+    ["bg_char_2"] = "#f3ea8f",
+    ["bg_active"] = "#c3c0c9",
+    ["fg_active"] = "#4f3363",
+    ["bg_inactive"] = "#efeef7",
+    ["fg_inactive"] = "#786e74",
+    ["bg_status_line_active"] = "#ddb4ff",
+    ["fg_status_line_active"] = "#241f48",
+    ["bg_status_line_inactive"] = "#ebe7f1",
+    ["fg_status_line_inactive"] = "#786e74",
+    ["bg_tab_bar"] = "#e3e0e9",
+    ["bg_tab_current"] = "#f8f5ff",
+    ["bg_tab_other"] = "#c3c0c9",
+    ["fg_tab_other"] = "#786e74",
+    ["bg_tab_alternate"] = "#b4cfff",
+    ["bg_added"] = "#caf4da",
+    ["bg_added_faint"] = "#dff6ea",
+    ["bg_added_refine"] = "#bae9cf",
+    ["bg_added_fringe"] = "#bae9cf",
+    ["fg_added"] = "#005000",
+    ["fg_added_intense"] = "#005000",
+    ["bg_changed"] = "#ffdfb9",
+    ["bg_changed_faint"] = "#ffefcb",
+    ["bg_changed_refine"] = "#ffcfa0",
+    ["bg_changed_fringe"] = "#ffcfa0",
+    ["fg_changed"] = "#553d00",
+    ["fg_changed_intense"] = "#553d00",
+    ["bg_removed"] = "#ffcee0",
+    ["bg_removed_faint"] = "#ffdfe6",
+    ["bg_removed_refine"] = "#f5b6c8",
+    ["bg_removed_fringe"] = "#f5b6c8",
+    ["fg_removed"] = "#8f1313",
+    ["fg_removed_intense"] = "#8f1313",
+    ["bg_diff_context"] = "#ebe7f1",
+    ["visual"] = "#eed0ff",
+    ["link"] = "#375cd6",
+    ["link_visited"] = "#705ae3",
+    ["link_symbolic"] = "#1f6fbf",
+    ["string"] = "#007f6f",
+    ["comment"] = "#a05b5f",
+    ["constant"] = "#c035aa",
+    ["identifier"] = "#a24568",
+    ["keyword"] = "#ad45ba",
+    ["type"] = "#0f7a9d",
+    ["fnname"] = "#5165e4",
+    ["variable"] = "#3f6faf",
+    ["rainbow_0"] = "#c035aa",
+    ["rainbow_1"] = "#5165e4",
+    ["rainbow_2"] = "#007f6f",
+    ["rainbow_3"] = "#ad45ba",
+    ["rainbow_4"] = "#1f6fbf",
+    ["rainbow_5"] = "#4f7d0f",
+    ["rainbow_6"] = "#705ae3",
+    ["rainbow_7"] = "#3f6faf",
+    ["prose_todo"] = "#d03033",
+    ["prose_done"] = "#057800",
+    ["prose_tag"] = "#804fb0",
+    ["prose_table"] = "#3f7668",
+    ["err"] = "#d03033",
+    ["warning"] = "#b8532f",
+    ["info"] = "#057800",
+    ["hint"] = "#5f60bf",
+    ["ok"] = "#007f6f",
+  },
+}
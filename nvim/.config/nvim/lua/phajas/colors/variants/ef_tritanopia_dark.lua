@@ -0,0 +1,165 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_tritanopia_dark (Ef Tritanopia family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "ef_tritanopia",
+  ["flavor"] = "dark",
+  ["foreground"] = "#dfd0d5",
+  ["background"] = "#15050f",
+  ["cursor"] = "#fd3333",
+  ["selection_background"] = "#293140",
+  ["selection_foreground"] = "#dfd0d5",
+  ["ansi"] = {
+    "#15050f",
+    "#cf4f5f",
+    "#2fa526",
+    "#c48702",
+    "#379cf6",
+    "#b0648f",
+    "#3fafcf",
+    "#dfd0d5",
+    "#282026",
+    "#df4f4f",
+    "#64aa0f",
+    "#d0730f",
+    "#6a88ff",
+    "#c560aa",
+    "#3f9aaf",
+    "#908890",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#15050f",
+    ["bg_dim"] = "#282026",
+    ["bg_alt"] = "#352f2f",
+    ["fg_main"] = "#dfd0d5",
+    ["fg_dim"] = "#908890",
+    ["fg_alt"] = "#afdaef",
+    ["border"] = "#555564",
+    ["border_highlight"] = "#afdaef",
+    ["red"] = "#cf4f5f",
+    ["red_warmer"] = "#df4f4f",
+    ["red_cooler"] = "#d24f7f",
+    ["red_faint"] = "#b07f7f",
+    ["green"] = "#2fa526",
+    ["green_warmer"] = "#64aa0f",
+    ["green_cooler"] = "#00b066",
+    ["green_faint"] = "#5f9f6f",
+    ["yellow"] = "#c48702",
+    ["yellow_warmer"] = "#d0730f",
+    ["yellow_cooler"] = "#df8f6f",
+    ["yellow_faint"] = "#cf9f7f",
+    ["blue"] = "#379cf6",
+    ["blue_warmer"] = "#6a88ff",
+    ["blue_cooler"] = "#029fff",
+    ["blue_faint"] = "#6a84af",
+    ["magenta"] = "#b0648f",
+    ["magenta_warmer"] = "#c560aa",
+    ["magenta_cooler"] = "#a6699f",
+    ["magenta_faint"] = "#c590af",
+    ["cyan"] = "#3fafcf",
+    ["cyan_warmer"] = "#3f9aaf",
+    ["cyan_cooler"] = "#4fafaf",
+    ["cyan_faint"] = "#82a0af",
+    ["rust"] = "#df4f4f",
+    ["gold"] = "#c48702",
+    ["olive"] = "#64aa0f",
+    ["slate"] = "#6a84af",
+    ["indigo"] = "#a6699f",
+    ["maroon"] = "#d24f7f",
+    ["pink"] = "#c560aa",
+    ["red_intense"] = "#cf4f5f",
+    ["green_intense"] = "#2fa526",
+    ["yellow_intense"] = "#c48702",
+    ["blue_intense"] = "#379cf6",
+    ["magenta_intense"] = "#b0648f",
+    ["cyan_intense"] = "#3fafcf",
+    ["bg_red_intense"] = "#aa0010",
+    ["bg_green_intense"] = "#5f806f",
+    ["bg_yellow_intense"] = "#950f4f",
+    ["bg_blue_intense"] = "#165f70",
+    ["bg_magenta_intense"] = "#a04f9f",
+    ["bg_cyan_intense"] = "#007faa",
+    ["bg_red_subtle"] = "#6e1b20",
+    ["bg_green_subtle"] = "#054c38",
+    ["bg_yellow_subtle"] = "#65302f",
+    ["bg_blue_subtle"] = "#224360",
+    ["bg_magenta_subtle"] = "#603256",
+    ["bg_cyan_subtle"] = "#004a57",
+    ["bg_red_nuanced"] = "#6e1b20",
+    ["bg_green_nuanced"] = "#054c38",
+    ["bg_yellow_nuanced"] = "#65302f",
+    ["bg_blue_nuanced"] = "#224360",
+    ["bg_magenta_nuanced"] = "#603256",
+    ["bg_cyan_nuanced"] = "#004a57",
+    ["bg_completion"] = "#441824",
+    ["bg_hl_line"] = "#3f1515",
+    ["bg_paren_match"] = "#2f5f7a",
+    ["bg_paren_expression"] = "#00405f",
+    ["bg_char_0"] = "#224360",
+    ["bg_char_1"] = "#603256",
+    ["bg_char_2"] = "#65302f",
+    ["bg_active"] = "#554f4f",
+    ["fg_active"] = "#dfd0d5",
+    ["bg_inactive"] = "#1a1517",
+    ["fg_inactive"] = "#908890",
+    ["bg_status_line_active"] = "#671822",
+    ["fg_status_line_active"] = "#ffffff",
+    ["bg_status_line_inactive"] = "#282026",
+    ["fg_status_line_inactive"] = "#908890",
+    ["bg_tab_bar"] = "#352f2f",
+    ["bg_tab_current"] = "#15050f",
+    ["bg_tab_other"] = "#554f4f",
+    ["fg_tab_other"] = "#908890",
+    ["bg_tab_alternate"] = "#5e3e5b",
+    ["bg_added"] = "#002d3f",
+    ["bg_added_faint"] = "#001f38",
+    ["bg_added_refine"] = "#003b4f",
+    ["bg_added_fringe"] = "#003b4f",
+    ["fg_added"] = "#cbdfff",
+    ["fg_added_intense"] = "#cbdfff",
+    ["bg_changed"] = "#352354",
+    ["bg_changed_faint"] = "#351444",
+    ["bg_changed_refine"] = "#383964",
+    ["bg_changed_fringe"] = "#383964",
+    ["fg_changed"] = "#e3cfff",
+    ["fg_changed_intense"] = "#e3cfff",
+    ["bg_removed"] = "#4d091f",
+    ["bg_removed_faint"] = "#37040f",
+    ["bg_removed_refine"] = "#6b0f26",
+    ["bg_removed_fringe"] = "#6b0f26",
+    ["fg_removed"] = "#ffbfbf",
+    ["fg_removed_intense"] = "#ffbfbf",
+    ["bg_diff_context"] = "#282026",
+    ["visual"] = "#293140",
+    ["link"] = "#379cf6",
+    ["link_visited"] = "#a6699f",
+    ["link_symbolic"] = "#3fafcf",
+    ["string"] = "#3fafcf",
+    ["comment"] = "#b07f7f",
+    ["constant"] = "#d24f7f",
+    ["identifier"] = "#c590af",
+    ["keyword"] = "#cf4f5f",
+    ["type"] = "#3f9aaf",
+    ["fnname"] = "#a6699f",
+    ["variable"] = "#4fafaf",
+    ["rainbow_0"] = "#3fafcf",
+    ["rainbow_1"] = "#cf4f5f",
+    ["rainbow_2"] = "#3f9aaf",
+    ["rainbow_3"] = "#d24f7f",
+    ["rainbow_4"] = "#4fafaf",
+    ["rainbow_5"] = "#b0648f",
+    ["rainbow_6"] = "#82a0af",
+    ["rainbow_7"] = "#c590af",
+    ["prose_todo"] = "#df4f4f",
+    ["prose_done"] = "#3fafcf",
+    ["prose_tag"] = "#afdaef",
+    ["prose_table"] = "#afdaef",
+    ["err"] = "#df4f4f",
+    ["warning"] = "#c560aa",
+    ["info"] = "#3fafcf",
+    ["hint"] = "#82a0af",
+    ["ok"] = "#00b066",
+  },
+}
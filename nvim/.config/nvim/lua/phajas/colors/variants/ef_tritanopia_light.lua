@@ -0,0 +1,165 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: ef_tritanopia_light (Ef Tritanopia family)
+-- License: GPL v3 (palette derives from Ef themes; see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "ef_tritanopia",
+  ["flavor"] = "light",
+  ["foreground"] = "#1a1a1a",
+  ["background"] = "#fff9f9",
+  ["cursor"] = "#bb0000",
+  ["selection_background"] = "#dadadf",
+  ["selection_foreground"] = "#1a1a1a",
+  ["ansi"] = {
+    "#fff9f9",
+    "#aa0010",
+    "#217a3c",
+    "#805d00",
+    "#375cd8",
+    "#aa357f",
+    "#2070af",
+    "#1a1a1a",
+    "#efecec",
+    "#dd0000",
+    "#4a7d00",
+    "#965000",
+    "#4250ef",
+    "#bf256a",
+    "#2f5faf",
+    "#756275",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#fff9f9",
+    ["bg_dim"] = "#efecec",
+    ["bg_alt"] = "#ddd9d9",
+    ["fg_main"] = "#1a1a1a",
+    ["fg_dim"] = "#756275",
+    ["fg_alt"] = "#194f90",
+    ["border"] = "#adadad",
+    ["border_highlight"] = "#194f90",
+    ["red"] = "#aa0010",
+    ["red_warmer"] = "#dd0000",
+    ["red_cooler"] = "#c50f4f",
+    ["red_faint"] = "#92454f",
+    ["green"] = "#217a3c",
+    ["green_warmer"] = "#4a7d00",
+    ["green_cooler"] = "#008058",
+    ["green_faint"] = "#61756c",
+    ["yellow"] = "#805d00",
+    ["yellow_warmer"] = "#965000",
+    ["yellow_cooler"] = "#765040",
+    ["yellow_faint"] = "#776d6a",
+    ["blue"] = "#375cd8",
+    ["blue_warmer"] = "#4250ef",
+    ["blue_cooler"] = "#065fff",
+    ["blue_faint"] = "#6060d0",
+    ["magenta"] = "#aa357f",
+    ["magenta_warmer"] = "#bf256a",
+    ["magenta_cooler"] = "#af40af",
+    ["magenta_faint"] = "#7f4580",
+    ["cyan"] = "#2070af",
+    ["cyan_warmer"] = "#2f5faf",
+    ["cyan_cooler"] = "#007faa",
+    ["cyan_faint"] = "#5f6a90",
+    ["rust"] = "#dd0000",
+    ["gold"] = "#805d00",
+    ["olive"] = "#4a7d00",
+    ["slate"] = "#6060d0",
+    ["indigo"] = "#af40af",
+    ["maroon"] = "#c50f4f",
+    ["pink"] = "#bf256a",
+    ["red_intense"] = "#aa0010",
+    ["green_intense"] = "#217a3c",
+    ["yellow_intense"] = "#805d00",
+    ["blue_intense"] = "#375cd8",
+    ["magenta_intense"] = "#aa357f",
+    ["cyan_intense"] = "#2070af",
+    ["bg_red_intense"] = "#ffa2a0",
+    ["bg_green_intense"] = "#8aefef",
+    ["bg_yellow_intense"] = "#ff7f78",
+    ["bg_blue_intense"] = "#a8c8ef",
+    ["bg_magenta_intense"] = "#e09fc0",
+    ["bg_cyan_intense"] = "#7bcfcf",
+    ["bg_red_subtle"] = "#ffc4bf",
+    ["bg_green_subtle"] = "#baeecf",
+    ["bg_yellow_subtle"] = "#f5d8a8",
+    ["bg_blue_subtle"] = "#c8e6f7",
+    ["bg_magenta_subtle"] = "#ffcfe0",
+    ["bg_cyan_subtle"] = "#bbeff2",
+    ["bg_red_nuanced"] = "#ffc4bf",
+    ["bg_green_nuanced"] = "#baeecf",
+    ["bg_yellow_nuanced"] = "#f5d8a8",
+    ["bg_blue_nuanced"] = "#c8e6f7",
+    ["bg_magenta_nuanced"] = "#ffcfe0",
+    ["bg_cyan_nuanced"] = "#bbeff2",
+    ["bg_completion"] = "#ffcada",
+    ["bg_hl_line"] = "#ffdadf",
+    ["bg_paren_match"] = "#8fc0cf",
+    ["bg_paren_expression"] = "#8fcfff",
+    ["bg_char_0"] = "#c8e6f7",
+    ["bg_char_1"] = "#ffcfe0",
+    ["bg_char_2"] = "#f5d8a8",
+    ["bg_active"] = "#bdb9b9",
+    ["fg_active"] = "#1a1a1a",
+    ["bg_inactive"] = "#f7f2f2",
+    ["fg_inactive"] = "#756275",
+    ["bg_status_line_active"] = "#ff99aa",
+    ["fg_status_line_active"] = "#1a0a0f",
+    ["bg_status_line_inactive"] = "#efecec",
+    ["fg_status_line_inactive"] = "#756275",
+    ["bg_tab_bar"] = "#ddd9d9",
+    ["bg_tab_current"] = "#fff9f9",
+    ["bg_tab_other"] = "#bdb9b9",
+    ["fg_tab_other"] = "#756275",
+    ["bg_tab_alternate"] = "#eda9dc",
+    ["bg_added"] = "#c9efea",
+    ["bg_added_faint"] = "#d7eff5",
+    ["bg_added_refine"] = "#b3dfdf",
+    ["bg_added_fringe"] = "#b3dfdf",
+    ["fg_added"] = "#004840",
+    ["fg_added_intense"] = "#004840",
+    ["bg_changed"] = "#dbdbff",
+    ["bg_changed_faint"] = "#e4e4ff",
+    ["bg_changed_refine"] = "#c0c0ef",
+    ["bg_changed_fringe"] = "#c0c0ef",
+    ["fg_changed"] = "#333399",
+    ["fg_changed_intense"] = "#333399",
+    ["bg_removed"] = "#ffd6e0",
+    ["bg_removed_faint"] = "#ffe9e6",
+    ["bg_removed_refine"] = "#f5bfc8",
+    ["bg_removed_fringe"] = "#f5bfc8",
+    ["fg_removed"] = "#8f1313",
+    ["fg_removed_intense"] = "#8f1313",
+    ["bg_diff_context"] = "#efecec",
+    ["visual"] = "#dadadf",
+    ["link"] = "#375cd8",
+    ["link_visited"] = "#af40af",
+    ["link_symbolic"] = "#2070af",
+    ["string"] = "#2070af",
+    ["comment"] = "#92454f",
+    ["constant"] = "#c50f4f",
+    ["identifier"] = "#7f4580",
+    ["keyword"] = "#aa0010",
+    ["type"] = "#2f5faf",
+    ["fnname"] = "#af40af",
+    ["variable"] = "#007faa",
+    ["rainbow_0"] = "#2070af",
+    ["rainbow_1"] = "#aa0010",
+    ["rainbow_2"] = "#2f5faf",
+    ["rainbow_3"] = "#c50f4f",
+    ["rainbow_4"] = "#007faa",
+    ["rainbow_5"] = "#aa357f",
+    ["rainbow_6"] = "#5f6a90",
+    ["rainbow_7"] = "#7f4580",
+    ["prose_todo"] = "#dd0000",
+    ["prose_done"] = "#2070af",
+    ["prose_tag"] = "#194f90",
+    ["prose_table"] = "#194f90",
+    ["err"] = "#dd0000",
+    ["warning"] = "#aa357f",
+    ["info"] = "#2070af",
+    ["hint"] = "#5f6a90",
+    ["ok"] = "#008058",
+  },
+}
@@ -0,0 +1,168 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: modus_operandi (Modus Themes family)
+-- License: GPL v3 (palette derives from Modus; see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "modus",
+  ["flavor"] = "light",
+  ["foreground"] = "#000000",
+  ["background"] = "#ffffff",
+  ["cursor"] = "#000000",
+  ["selection_background"] = "#dfa0f0",
+  ["selection_foreground"] = "#000000",
+  ["ansi"] = {
+    "#ffffff",
+    "#a60000",
+    "#006800",
+    "#6f5500",
+    "#0031a9",
+    "#721045",
+    "#005e8b",
+    "#000000",
+    "#e0e0e0",
+    "#d00000",
+    "#008900",
+    "#808000",
+    "#0000ff",
+    "#dd22dd",
+    "#008899",
+    "#595959",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#ffffff",
+    ["bg_dim"] = "#f2f2f2",
+    ["bg_alt"] = "#f0f0f0",
+    ["fg_main"] = "#000000",
+    ["fg_dim"] = "#595959",
+    ["fg_alt"] = "#193668",
+    ["border"] = "#9f9f9f",
+    ["border_highlight"] = "#3b3b3b",
+    ["red"] = "#a60000",
+    ["red_warmer"] = "#972500",
+    ["red_cooler"] = "#a0132f",
+    ["red_faint"] = "#7f0000",
+    ["green"] = "#006800",
+    ["green_warmer"] = "#316500",
+    ["green_cooler"] = "#00663f",
+    ["green_faint"] = "#2a5045",
+    ["yellow"] = "#6f5500",
+    ["yellow_warmer"] = "#884900",
+    ["yellow_cooler"] = "#7a4f2f",
+    ["yellow_faint"] = "#624416",
+    ["blue"] = "#0031a9",
+    ["blue_warmer"] = "#3548cf",
+    ["blue_cooler"] = "#0000b0",
+    ["blue_faint"] = "#003497",
+    ["magenta"] = "#721045",
+    ["magenta_warmer"] = "#8f0075",
+    ["magenta_cooler"] = "#531ab6",
+    ["magenta_faint"] = "#7c318f",
+    ["cyan"] = "#005e8b",
+    ["cyan_warmer"] = "#3f578f",
+    ["cyan_cooler"] = "#005f5f",
+    ["cyan_faint"] = "#005077",
+    ["rust"] = "#8a290f",
+    ["gold"] = "#80601f",
+    ["olive"] = "#56692d",
+    ["slate"] = "#2f3f83",
+    ["indigo"] = "#4a3a8a",
+    ["maroon"] = "#731c52",
+    ["pink"] = "#7b435c",
+    ["red_intense"] = "#d00000",
+    ["green_intense"] = "#008900",
+    ["yellow_intense"] = "#808000",
+    ["blue_intense"] = "#0000ff",
+    ["magenta_intense"] = "#dd22dd",
+    ["cyan_intense"] = "#008899",
+    ["bg_red_intense"] = "#ff8f88",
+    ["bg_green_intense"] = "#8adf80",
+    ["bg_yellow_intense"] = "#f3d000",
+    ["bg_blue_intense"] = "#bfc9ff",
+    ["bg_magenta_intense"] = "#dfa0f0",
+    ["bg_cyan_intense"] = "#a4d5f9",
+    ["bg_red_subtle"] = "#ffcfbf",
+    ["bg_green_subtle"] = "#b3fabf",
+    ["bg_yellow_subtle"] = "#fff576",
+    ["bg_blue_subtle"] = "#ccdfff",
+    ["bg_magenta_subtle"] = "#ffddff",
+    ["bg_cyan_subtle"] = "#bfefff",
+    ["bg_red_nuanced"] = "#fff1f0",
+    ["bg_green_nuanced"] = "#ecf7ed",
+    ["bg_yellow_nuanced"] = "#fff3da",
+    ["bg_blue_nuanced"] = "#f3f3ff",
+    ["bg_magenta_nuanced"] = "#fdf0ff",
+    ["bg_cyan_nuanced"] = "#ebf6fa",
+    ["bg_completion"] = "#c0deff",
+    ["bg_hl_line"] = "#dae5ec",
+    ["bg_paren_match"] = "#5fcfff",
+    ["bg_paren_expression"] = "#efd3f5",
+    ["bg_char_0"] = "#7feaff",
+    ["bg_char_1"] = "#ffaaff",
+    ["bg_char_2"] = "#dff000",
+    ["bg_active"] = "#e0e0e0",
+    ["fg_active"] = "#0a0a0a",
+    ["bg_inactive"] = "#e9e9e9",
+    ["fg_inactive"] = "#404148",
+    ["bg_status_line_active"] = "#c8c8c8",
+    ["fg_status_line_active"] = "#0a0a0a",
+    ["bg_status_line_inactive"] = "#e6e6e6",
+    ["fg_status_line_inactive"] = "#585858",
+    ["bg_tab_bar"] = "#dfdfdf",
+    ["bg_tab_current"] = "#ffffff",
+    ["bg_tab_other"] = "#c2c2c2",
+    ["fg_tab_other"] = "#333333",
+    ["bg_tab_alternate"] = "#c2c2e8",
+    ["bg_added"] = "#c1f2d1",
+    ["bg_added_faint"] = "#d8f8e1",
+    ["bg_added_refine"] = "#aee5be",
+    ["bg_added_fringe"] = "#6cc06c",
+    ["fg_added"] = "#005000",
+    ["fg_added_intense"] = "#006700",
+    ["bg_changed"] = "#ffdfa9",
+    ["bg_changed_faint"] = "#ffefbf",
+    ["bg_changed_refine"] = "#fac090",
+    ["bg_changed_fringe"] = "#d7c20a",
+    ["fg_changed"] = "#553d00",
+    ["fg_changed_intense"] = "#655000",
+    ["bg_removed"] = "#ffd8d5",
+    ["bg_removed_faint"] = "#ffe9e9",
+    ["bg_removed_refine"] = "#f3b5af",
+    ["bg_removed_fringe"] = "#d84a4f",
+    ["fg_removed"] = "#8f1313",
+    ["fg_removed_intense"] = "#aa2222",
+    ["bg_diff_context"] = "#f3f3f3",
+    ["tinted_bg_main"] = "#fbf7f0",
+    ["tinted_bg_dim"] = "#efe9dd",
+    ["tinted_border"] = "#9f9690",
+    ["tinted_border_highlight"] = "#5c3f3d",
+    ["tinted_bg_active"] = "#c9b9b0",
+    ["tinted_bg_inactive"] = "#dfd5cf",
+    ["tinted_red_faint"] = "#7f0000",
+    ["tinted_bg_red_nuanced"] = "#ffe8f0",
+    ["tinted_bg_green_nuanced"] = "#e0f5e0",
+    ["tinted_bg_yellow_nuanced"] = "#f9ead0",
+    ["tinted_bg_blue_nuanced"] = "#ebebff",
+    ["tinted_bg_magenta_nuanced"] = "#f6e7ff",
+    ["tinted_bg_cyan_nuanced"] = "#e1f3fc",
+    ["tinted_bg_completion"] = "#f0c1cf",
+    ["tinted_bg_hl_line"] = "#f1d5d0",
+    ["tinted_bg_paren_match"] = "#7fdfcf",
+    ["tinted_bg_status_line_active"] = "#cab9b2",
+    ["tinted_bg_status_line_inactive"] = "#dfd9cf",
+    ["tinted_bg_tab_bar"] = "#e0d4ce",
+    ["tinted_bg_tab_current"] = "#fbf7f0",
+    ["tinted_bg_tab_other"] = "#c8b8b2",
+    ["tinted_bg_tab_alternate"] = "#c8b8ca",
+    ["tinted_bg_added"] = "#c3ebc1",
+    ["tinted_bg_added_faint"] = "#dcf8d1",
+    ["tinted_bg_added_refine"] = "#acd6a5",
+    ["tinted_bg_added_fringe"] = "#6cc06c",
+    ["tinted_bg_changed_fringe"] = "#c0b200",
+    ["tinted_bg_removed"] = "#f4d0cf",
+    ["tinted_bg_removed_faint"] = "#ffe9e5",
+    ["tinted_bg_removed_refine"] = "#f3b5a7",
+    ["tinted_bg_removed_fringe"] = "#d84a4f",
+    ["tinted_bg_diff_context"] = "#efe9df",
+  },
+}
@@ -0,0 +1,270 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: modus_operandi_deuteranopia (Modus Themes family)
+-- License: GPL v3 (palette derives from Modus; see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "modus",
+  ["flavor"] = "light",
+  ["foreground"] = "#000000",
+  ["background"] = "#ffffff",
+  ["cursor"] = "#000000",
+  ["selection_background"] = "#dfa0f0",
+  ["selection_foreground"] = "#000000",
+  ["ansi"] = {
+    "#ffffff",
+    "#a60000",
+    "#006800",
+    "#695500",
+    "#0031a9",
+    "#721045",
+    "#005e8b",
+    "#000000",
+    "#e0e0e0",
+    "#d00000",
+    "#008900",
+    "#808000",
+    "#0000ff",
+    "#dd22dd",
+    "#008899",
+    "#595959",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#ffffff",
+    ["bg_dim"] = "#f2f2f2",
+    ["fg_main"] = "#000000",
+    ["fg_dim"] = "#595959",
+    ["fg_alt"] = "#193668",
+    ["bg_active"] = "#c4c4c4",
+    ["bg_inactive"] = "#e0e0e0",
+    ["border"] = "#9f9f9f",
+    ["red"] = "#a60000",
+    ["red_warmer"] = "#972500",
+    ["red_cooler"] = "#a0132f",
+    ["red_faint"] = "#7f0000",
+    ["red_intense"] = "#d00000",
+    ["green"] = "#006800",
+    ["green_warmer"] = "#316500",
+    ["green_cooler"] = "#00663f",
+    ["green_faint"] = "#2a5045",
+    ["green_intense"] = "#008900",
+    ["yellow"] = "#695500",
+    ["yellow_warmer"] = "#973300",
+    ["yellow_cooler"] = "#77492f",
+    ["yellow_faint"] = "#624416",
+    ["yellow_intense"] = "#808000",
+    ["blue"] = "#0031a9",
+    ["blue_warmer"] = "#3548cf",
+    ["blue_cooler"] = "#0000b0",
+    ["blue_faint"] = "#003497",
+    ["blue_intense"] = "#0000ff",
+    ["magenta"] = "#721045",
+    ["magenta_warmer"] = "#8f0075",
+    ["magenta_cooler"] = "#531ab6",
+    ["magenta_faint"] = "#7c318f",
+    ["magenta_intense"] = "#dd22dd",
+    ["cyan"] = "#005e8b",
+    ["cyan_warmer"] = "#3f578f",
+    ["cyan_cooler"] = "#005f5f",
+    ["cyan_faint"] = "#005077",
+    ["cyan_intense"] = "#008899",
+    ["rust"] = "#8a290f",
+    ["gold"] = "#70550f",
+    ["olive"] = "#4c6000",
+    ["slate"] = "#2f3f83",
+    ["indigo"] = "#4a3a8a",
+    ["maroon"] = "#731c52",
+    ["pink"] = "#7b435c",
+    ["bg_red_intense"] = "#ff8f88",
+    ["bg_green_intense"] = "#8adf80",
+    ["bg_yellow_intense"] = "#f3d000",
+    ["bg_blue_intense"] = "#bfc9ff",
+    ["bg_magenta_intense"] = "#dfa0f0",
+    ["bg_cyan_intense"] = "#a4d5f9",
+    ["bg_red_subtle"] = "#ffcfbf",
+    ["bg_green_subtle"] = "#b3fabf",
+    ["bg_yellow_subtle"] = "#fff576",
+    ["bg_blue_subtle"] = "#ccdfff",
+    ["bg_magenta_subtle"] = "#ffddff",
+    ["bg_cyan_subtle"] = "#bfefff",
+    ["bg_red_nuanced"] = "#ffe8e8",
+    ["bg_green_nuanced"] = "#e0f6e0",
+    ["bg_yellow_nuanced"] = "#f8f0d0",
+    ["bg_blue_nuanced"] = "#ecedff",
+    ["bg_magenta_nuanced"] = "#f8e6f5",
+    ["bg_cyan_nuanced"] = "#e0f2fa",
+    ["bg_clay"] = "#f1c8b5",
+    ["fg_clay"] = "#63192a",
+    ["bg_ochre"] = "#f0e3c0",
+    ["fg_ochre"] = "#573a30",
+    ["bg_lavender"] = "#dfcdfa",
+    ["fg_lavender"] = "#443379",
+    ["bg_sage"] = "#c0e7d4",
+    ["fg_sage"] = "#124b41",
+    ["bg_graph_red_0"] = "#d0b029",
+    ["bg_graph_red_1"] = "#e0cab4",
+    ["bg_graph_green_0"] = "#8ac050",
+    ["bg_graph_green_1"] = "#afdfa5",
+    ["bg_graph_yellow_0"] = "#ffcf00",
+    ["bg_graph_yellow_1"] = "#f9ff00",
+    ["bg_graph_blue_0"] = "#7f9fff",
+    ["bg_graph_blue_1"] = "#afd0ff",
+    ["bg_graph_magenta_0"] = "#b0b0d0",
+    ["bg_graph_magenta_1"] = "#d0dfdf",
+    ["bg_graph_cyan_0"] = "#6faad9",
+    ["bg_graph_cyan_1"] = "#bfe0ff",
+    ["bg_completion"] = "#c0deff",
+    ["bg_hover"] = "#b2e4dc",
+    ["bg_hover_secondary"] = "#e5d7a0",
+    ["bg_hl_line"] = "#dae5ec",
+    ["bg_region"] = "#bdbdbd",
+    ["fg_region"] = "#000000",
+    ["bg_mode_line_active"] = "#d0d6ff",
+    ["fg_mode_line_active"] = "#0f0f0f",
+    ["border_mode_line_active"] = "#4f4f74",
+    ["bg_mode_line_inactive"] = "#e6e6e6",
+    ["fg_mode_line_inactive"] = "#585858",
+    ["border_mode_line_inactive"] = "#a3a3a3",
+    ["modeline_err"] = "#603a00",
+    ["modeline_warning"] = "#454500",
+    ["modeline_info"] = "#023d92",
+    ["bg_tab_bar"] = "#dfdfdf",
+    ["bg_tab_current"] = "#ffffff",
+    ["bg_tab_other"] = "#c2c2c2",
+    ["bg_added"] = "#d5d7ff",
+    ["bg_added_faint"] = "#e6e6ff",
+    ["bg_added_refine"] = "#babcef",
+    ["bg_added_fringe"] = "#275acc",
+    ["fg_added"] = "#303099",
+    ["fg_added_intense"] = "#0303cc",
+    ["bg_changed"] = "#eecfdf",
+    ["bg_changed_faint"] = "#f0dde5",
+    ["bg_changed_refine"] = "#e0b0d0",
+    ["bg_changed_fringe"] = "#9f6ab0",
+    ["fg_changed"] = "#6f1343",
+    ["fg_changed_intense"] = "#7f0f9f",
+    ["bg_removed"] = "#f4f099",
+    ["bg_removed_faint"] = "#f6f6b7",
+    ["bg_removed_refine"] = "#ede06f",
+    ["bg_removed_fringe"] = "#c0b200",
+    ["fg_removed"] = "#553d00",
+    ["fg_removed_intense"] = "#7f6f00",
+    ["bg_diff_context"] = "#f3f3f3",
+    ["bg_paren_match"] = "#5fcfff",
+    ["bg_paren_expression"] = "#efd3f5",
+    ["cursor"] = "#0000ff",
+    ["keybind"] = "#0000b0",
+    ["name"] = "#0000b0",
+    ["identifier"] = "#624416",
+    ["err"] = "#973300",
+    ["warning"] = "#695500",
+    ["info"] = "#0031a9",
+    ["underline_err"] = "#808000",
+    ["underline_warning"] = "#7c318f",
+    ["underline_note"] = "#005e8b",
+    ["bg_prominent_err"] = "#f3d000",
+    ["fg_prominent_err"] = "#000000",
+    ["bg_prominent_warning"] = "#dfa0f0",
+    ["fg_prominent_warning"] = "#000000",
+    ["bg_prominent_note"] = "#a4d5f9",
+    ["fg_prominent_note"] = "#000000",
+    ["bg_active_argument"] = "#f8f0d0",
+    ["fg_active_argument"] = "#973300",
+    ["bg_active_value"] = "#ecedff",
+    ["fg_active_value"] = "#3548cf",
+    ["builtin"] = "#695500",
+    ["comment"] = "#77492f",
+    ["constant"] = "#003497",
+    ["docstring"] = "#2a5045",
+    ["fnname"] = "#973300",
+    ["fnname_call"] = "#70550f",
+    ["keyword"] = "#0000b0",
+    ["preprocessor"] = "#531ab6",
+    ["property"] = "#005e8b",
+    ["rx_backslash"] = "#0000b0",
+    ["rx_construct"] = "#77492f",
+    ["string"] = "#3548cf",
+    ["type"] = "#005f5f",
+    ["variable"] = "#005e8b",
+    ["variable_use"] = "#4a3a8a",
+    ["accent_0"] = "#3548cf",
+    ["accent_1"] = "#973300",
+    ["accent_2"] = "#005e8b",
+    ["accent_3"] = "#77492f",
+    ["fg_completion_match_0"] = "#3548cf",
+    ["fg_completion_match_1"] = "#973300",
+    ["fg_completion_match_2"] = "#005e8b",
+    ["fg_completion_match_3"] = "#77492f",
+    ["date_common"] = "#005e8b",
+    ["date_deadline"] = "#973300",
+    ["date_deadline_subtle"] = "#7f0000",
+    ["date_event"] = "#193668",
+    ["date_holiday"] = "#973300",
+    ["date_holiday_other"] = "#0031a9",
+    ["date_range"] = "#193668",
+    ["date_scheduled"] = "#77492f",
+    ["date_scheduled_subtle"] = "#624416",
+    ["date_weekday"] = "#005e8b",
+    ["date_weekend"] = "#0000b0",
+    ["fg_link"] = "#3548cf",
+    ["underline_link"] = "#3548cf",
+    ["fg_link_symbolic"] = "#005e8b",
+    ["underline_link_symbolic"] = "#005e8b",
+    ["fg_link_visited"] = "#624416",
+    ["underline_link_visited"] = "#624416",
+    ["mail_cite_0"] = "#3548cf",
+    ["mail_cite_1"] = "#695500",
+    ["mail_cite_2"] = "#005077",
+    ["mail_cite_3"] = "#624416",
+    ["mail_part"] = "#0031a9",
+    ["mail_recipient"] = "#0031a9",
+    ["mail_subject"] = "#77492f",
+    ["mail_other"] = "#005077",
+    ["bg_mark_delete"] = "#fff576",
+    ["fg_mark_delete"] = "#695500",
+    ["bg_mark_select"] = "#bfefff",
+    ["fg_mark_select"] = "#005e8b",
+    ["bg_mark_other"] = "#ffddff",
+    ["fg_mark_other"] = "#721045",
+    ["fg_prompt"] = "#0031a9",
+    ["fg_prose_code"] = "#005f5f",
+    ["fg_prose_macro"] = "#531ab6",
+    ["fg_prose_verbatim"] = "#695500",
+    ["prose_done"] = "#0031a9",
+    ["prose_todo"] = "#973300",
+    ["prose_metadata"] = "#595959",
+    ["prose_metadata_value"] = "#193668",
+    ["prose_table"] = "#193668",
+    ["prose_table_formula"] = "#973300",
+    ["prose_tag"] = "#193668",
+    ["rainbow_0"] = "#0031a9",
+    ["rainbow_1"] = "#695500",
+    ["rainbow_2"] = "#3548cf",
+    ["rainbow_3"] = "#77492f",
+    ["rainbow_4"] = "#0000b0",
+    ["rainbow_5"] = "#973300",
+    ["rainbow_6"] = "#003497",
+    ["rainbow_7"] = "#624416",
+    ["rainbow_8"] = "#005e8b",
+    ["bg_search_current"] = "#f3d000",
+    ["bg_search_lazy"] = "#bfc9ff",
+    ["bg_search_static"] = "#bfefff",
+    ["bg_search_replace"] = "#f3d000",
+    ["bg_search_rx_group_0"] = "#a4d5f9",
+    ["bg_search_rx_group_1"] = "#dfa0f0",
+    ["bg_search_rx_group_2"] = "#ccdfff",
+    ["bg_search_rx_group_3"] = "#fff576",
+    ["fg_heading_0"] = "#005f5f",
+    ["fg_heading_1"] = "#000000",
+    ["fg_heading_2"] = "#624416",
+    ["fg_heading_3"] = "#003497",
+    ["fg_heading_4"] = "#2a5045",
+    ["fg_heading_5"] = "#531ab6",
+    ["fg_heading_6"] = "#77492f",
+    ["fg_heading_7"] = "#005e8b",
+    ["fg_heading_8"] = "#595959",
+    ["bg_alt"] = "#f2f2f2",
+    ["border_highlight"] = "#9f9f9f",
+    ["bg_tab_alternate"] = "#c2c2c2",
+  },
+}
@@ -0,0 +1,270 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: modus_operandi_tinted (Modus Themes family)
+-- License: GPL v3 (palette derives from Modus; see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "modus",
+  ["flavor"] = "light",
+  ["foreground"] = "#000000",
+  ["background"] = "#fbf7f0",
+  ["cursor"] = "#000000",
+  ["selection_background"] = "#dfa0f0",
+  ["selection_foreground"] = "#000000",
+  ["ansi"] = {
+    "#fbf7f0",
+    "#a60000",
+    "#006300",
+    "#6d5000",
+    "#0031a9",
+    "#721045",
+    "#00598b",
+    "#000000",
+    "#dfd5cf",
+    "#d00000",
+    "#008900",
+    "#808000",
+    "#0000ff",
+    "#dd22dd",
+    "#008899",
+    "#595959",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#fbf7f0",
+    ["bg_dim"] = "#efe9dd",
+    ["fg_main"] = "#000000",
+    ["fg_dim"] = "#595959",
+    ["fg_alt"] = "#193668",
+    ["bg_active"] = "#c9b9b0",
+    ["bg_inactive"] = "#dfd5cf",
+    ["border"] = "#9f9690",
+    ["red"] = "#a60000",
+    ["red_warmer"] = "#972500",
+    ["red_cooler"] = "#a0132f",
+    ["red_faint"] = "#7f0000",
+    ["red_intense"] = "#d00000",
+    ["green"] = "#006300",
+    ["green_warmer"] = "#306010",
+    ["green_cooler"] = "#00603f",
+    ["green_faint"] = "#2a5045",
+    ["green_intense"] = "#008900",
+    ["yellow"] = "#6d5000",
+    ["yellow_warmer"] = "#894000",
+    ["yellow_cooler"] = "#602938",
+    ["yellow_faint"] = "#574316",
+    ["yellow_intense"] = "#808000",
+    ["blue"] = "#0031a9",
+    ["blue_warmer"] = "#3546c2",
+    ["blue_cooler"] = "#0000b0",
+    ["blue_faint"] = "#003497",
+    ["blue_intense"] = "#0000ff",
+    ["magenta"] = "#721045",
+    ["magenta_warmer"] = "#8f0075",
+    ["magenta_cooler"] = "#531ab6",
+    ["magenta_faint"] = "#7c318f",
+    ["magenta_intense"] = "#dd22dd",
+    ["cyan"] = "#00598b",
+    ["cyan_warmer"] = "#32548f",
+    ["cyan_cooler"] = "#005f5f",
+    ["cyan_faint"] = "#304463",
+    ["cyan_intense"] = "#008899",
+    ["rust"] = "#8a290f",
+    ["gold"] = "#6c501c",
+    ["olive"] = "#425d00",
+    ["slate"] = "#2f3f83",
+    ["indigo"] = "#4a3a8a",
+    ["maroon"] = "#731c52",
+    ["pink"] = "#7b435c",
+    ["bg_red_intense"] = "#ff8f88",
+    ["bg_green_intense"] = "#8adf80",
+    ["bg_yellow_intense"] = "#f3d000",
+    ["bg_blue_intense"] = "#bfc9ff",
+    ["bg_magenta_intense"] = "#dfa0f0",
+    ["bg_cyan_intense"] = "#a4d5f9",
+    ["bg_red_subtle"] = "#ffcfbf",
+    ["bg_green_subtle"] = "#b3fabf",
+    ["bg_yellow_subtle"] = "#fff576",
+    ["bg_blue_subtle"] = "#ccdfff",
+    ["bg_magenta_subtle"] = "#ffddff",
+    ["bg_cyan_subtle"] = "#bfefff",
+    ["bg_red_nuanced"] = "#ffe8e8",
+    ["bg_green_nuanced"] = "#e0f6e0",
+    ["bg_yellow_nuanced"] = "#f8f0d0",
+    ["bg_blue_nuanced"] = "#ecedff",
+    ["bg_magenta_nuanced"] = "#f8e6f5",
+    ["bg_cyan_nuanced"] = "#e0f2fa",
+    ["bg_clay"] = "#f1c8b5",
+    ["fg_clay"] = "#63192a",
+    ["bg_ochre"] = "#f0e3c0",
+    ["fg_ochre"] = "#573a30",
+    ["bg_lavender"] = "#dfcdfa",
+    ["fg_lavender"] = "#443379",
+    ["bg_sage"] = "#c0e7d4",
+    ["fg_sage"] = "#124b41",
+    ["bg_graph_red_0"] = "#ef7969",
+    ["bg_graph_red_1"] = "#ffaab4",
+    ["bg_graph_green_0"] = "#45c050",
+    ["bg_graph_green_1"] = "#75ef30",
+    ["bg_graph_yellow_0"] = "#ffcf00",
+    ["bg_graph_yellow_1"] = "#f9ff00",
+    ["bg_graph_blue_0"] = "#7f90ff",
+    ["bg_graph_blue_1"] = "#a6c0ff",
+    ["bg_graph_magenta_0"] = "#e07fff",
+    ["bg_graph_magenta_1"] = "#fad0ff",
+    ["bg_graph_cyan_0"] = "#70d3f0",
+    ["bg_graph_cyan_1"] = "#afefff",
+    ["bg_completion"] = "#f0c1cf",
+    ["bg_hover"] = "#b2e4dc",
+    ["bg_hover_secondary"] = "#dfe09f",
+    ["bg_hl_line"] = "#f1d5d0",
+    ["bg_region"] = "#c2bcb5",
+    ["fg_region"] = "#000000",
+    ["bg_mode_line_active"] = "#cab9b2",
+    ["fg_mode_line_active"] = "#000000",
+    ["border_mode_line_active"] = "#545454",
+    ["bg_mode_line_inactive"] = "#dfd9cf",
+    ["fg_mode_line_inactive"] = "#585858",
+    ["border_mode_line_inactive"] = "#a59a94",
+    ["modeline_err"] = "#7f0000",
+    ["modeline_warning"] = "#5f0070",
+    ["modeline_info"] = "#002580",
+    ["bg_tab_bar"] = "#e0d4ce",
+    ["bg_tab_current"] = "#fbf7f0",
+    ["bg_tab_other"] = "#c8b8b2",
+    ["bg_added"] = "#c3ebc1",
+    ["bg_added_faint"] = "#dcf8d1",
+    ["bg_added_refine"] = "#acd6a5",
+    ["bg_added_fringe"] = "#6cc06c",
+    ["fg_added"] = "#005000",
+    ["fg_added_intense"] = "#006700",
+    ["bg_changed"] = "#ffdfa9",
+    ["bg_changed_faint"] = "#ffefbf",
+    ["bg_changed_refine"] = "#fac090",
+    ["bg_changed_fringe"] = "#c0b200",
+    ["fg_changed"] = "#553d00",
+    ["fg_changed_intense"] = "#655000",
+    ["bg_removed"] = "#f4d0cf",
+    ["bg_removed_faint"] = "#ffe9e5",
+    ["bg_removed_refine"] = "#f3b5a7",
+    ["bg_removed_fringe"] = "#d84a4f",
+    ["fg_removed"] = "#8f1313",
+    ["fg_removed_intense"] = "#aa2222",
+    ["bg_diff_context"] = "#efe9df",
+    ["bg_paren_match"] = "#7fdfcf",
+    ["bg_paren_expression"] = "#efd3f5",
+    ["cursor"] = "#d00000",
+    ["keybind"] = "#a60000",
+    ["name"] = "#721045",
+    ["identifier"] = "#574316",
+    ["err"] = "#a60000",
+    ["warning"] = "#6d5000",
+    ["info"] = "#006300",
+    ["underline_err"] = "#d00000",
+    ["underline_warning"] = "#808000",
+    ["underline_note"] = "#008899",
+    ["bg_prominent_err"] = "#ff8f88",
+    ["fg_prominent_err"] = "#000000",
+    ["bg_prominent_warning"] = "#f3d000",
+    ["fg_prominent_warning"] = "#000000",
+    ["bg_prominent_note"] = "#a4d5f9",
+    ["fg_prominent_note"] = "#000000",
+    ["bg_active_argument"] = "#f8f0d0",
+    ["fg_active_argument"] = "#894000",
+    ["bg_active_value"] = "#e0f2fa",
+    ["fg_active_value"] = "#32548f",
+    ["builtin"] = "#721045",
+    ["comment"] = "#7f0000",
+    ["constant"] = "#531ab6",
+    ["docstring"] = "#304463",
+    ["fnname"] = "#602938",
+    ["fnname_call"] = "#7b435c",
+    ["keyword"] = "#0031a9",
+    ["preprocessor"] = "#894000",
+    ["property"] = "#00603f",
+    ["rx_backslash"] = "#8f0075",
+    ["rx_construct"] = "#531ab6",
+    ["string"] = "#00598b",
+    ["type"] = "#306010",
+    ["variable"] = "#00603f",
+    ["variable_use"] = "#2a5045",
+    ["accent_0"] = "#a0132f",
+    ["accent_1"] = "#00598b",
+    ["accent_2"] = "#531ab6",
+    ["accent_3"] = "#894000",
+    ["fg_completion_match_0"] = "#0031a9",
+    ["fg_completion_match_1"] = "#8f0075",
+    ["fg_completion_match_2"] = "#00598b",
+    ["fg_completion_match_3"] = "#a60000",
+    ["date_common"] = "#00598b",
+    ["date_deadline"] = "#a0132f",
+    ["date_deadline_subtle"] = "#7f0000",
+    ["date_event"] = "#193668",
+    ["date_holiday"] = "#a60000",
+    ["date_holiday_other"] = "#0031a9",
+    ["date_range"] = "#193668",
+    ["date_scheduled"] = "#6d5000",
+    ["date_scheduled_subtle"] = "#574316",
+    ["date_weekday"] = "#00598b",
+    ["date_weekend"] = "#721045",
+    ["fg_link"] = "#3546c2",
+    ["underline_link"] = "#3546c2",
+    ["fg_link_symbolic"] = "#00598b",
+    ["underline_link_symbolic"] = "#00598b",
+    ["fg_link_visited"] = "#721045",
+    ["underline_link_visited"] = "#721045",
+    ["mail_cite_0"] = "#00598b",
+    ["mail_cite_1"] = "#6d5000",
+    ["mail_cite_2"] = "#306010",
+    ["mail_cite_3"] = "#a0132f",
+    ["mail_part"] = "#00603f",
+    ["mail_recipient"] = "#3546c2",
+    ["mail_subject"] = "#8f0075",
+    ["mail_other"] = "#721045",
+    ["bg_mark_delete"] = "#ffcfbf",
+    ["fg_mark_delete"] = "#a60000",
+    ["bg_mark_select"] = "#bfefff",
+    ["fg_mark_select"] = "#00598b",
+    ["bg_mark_other"] = "#fff576",
+    ["fg_mark_other"] = "#6d5000",
+    ["fg_prompt"] = "#00603f",
+    ["fg_prose_code"] = "#00603f",
+    ["fg_prose_macro"] = "#0000b0",
+    ["fg_prose_verbatim"] = "#894000",
+    ["prose_done"] = "#006300",
+    ["prose_todo"] = "#a60000",
+    ["prose_metadata"] = "#595959",
+    ["prose_metadata_value"] = "#193668",
+    ["prose_table"] = "#193668",
+    ["prose_table_formula"] = "#8f0075",
+    ["prose_tag"] = "#7c318f",
+    ["rainbow_0"] = "#000000",
+    ["rainbow_1"] = "#dd22dd",
+    ["rainbow_2"] = "#008899",
+    ["rainbow_3"] = "#972500",
+    ["rainbow_4"] = "#808000",
+    ["rainbow_5"] = "#531ab6",
+    ["rainbow_6"] = "#008900",
+    ["rainbow_7"] = "#3546c2",
+    ["rainbow_8"] = "#8f0075",
+    ["bg_search_current"] = "#f3d000",
+    ["bg_search_lazy"] = "#a4d5f9",
+    ["bg_search_static"] = "#ffddff",
+    ["bg_search_replace"] = "#ff8f88",
+    ["bg_search_rx_group_0"] = "#bfc9ff",
+    ["bg_search_rx_group_1"] = "#8adf80",
+    ["bg_search_rx_group_2"] = "#ffcfbf",
+    ["bg_search_rx_group_3"] = "#ffddff",
+    ["fg_heading_0"] = "#00603f",
+    ["fg_heading_1"] = "#000000",
+    ["fg_heading_2"] = "#574316",
+    ["fg_heading_3"] = "#193668",
+    ["fg_heading_4"] = "#721045",
+    ["fg_heading_5"] = "#2a5045",
+    ["fg_heading_6"] = "#7f0000",
+    ["fg_heading_7"] = "#32548f",
+    ["fg_heading_8"] = "#595959",
+    ["bg_alt"] = "#efe9dd",
+    ["border_highlight"] = "#9f9690",
+    ["bg_tab_alternate"] = "#c8b8b2",
+  },
+}
@@ -0,0 +1,270 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: modus_operandi_tritanopia (Modus Themes family)
+-- License: GPL v3 (palette derives from Modus; see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "modus",
+  ["flavor"] = "light",
+  ["foreground"] = "#000000",
+  ["background"] = "#ffffff",
+  ["cursor"] = "#000000",
+  ["selection_background"] = "#dfa0f0",
+  ["selection_foreground"] = "#000000",
+  ["ansi"] = {
+    "#ffffff",
+    "#a60000",
+    "#006800",
+    "#695500",
+    "#0031a9",
+    "#721045",
+    "#005e8b",
+    "#000000",
+    "#e0e0e0",
+    "#d00000",
+    "#008900",
+    "#808000",
+    "#0000ff",
+    "#cd22bd",
+    "#008899",
+    "#595959",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#ffffff",
+    ["bg_dim"] = "#f2f2f2",
+    ["fg_main"] = "#000000",
+    ["fg_dim"] = "#595959",
+    ["fg_alt"] = "#224960",
+    ["bg_active"] = "#c4c4c4",
+    ["bg_inactive"] = "#e0e0e0",
+    ["border"] = "#9f9f9f",
+    ["red"] = "#a60000",
+    ["red_warmer"] = "#b21100",
+    ["red_cooler"] = "#a0132f",
+    ["red_faint"] = "#702000",
+    ["red_intense"] = "#d00000",
+    ["green"] = "#006800",
+    ["green_warmer"] = "#316500",
+    ["green_cooler"] = "#00663f",
+    ["green_faint"] = "#2a5045",
+    ["green_intense"] = "#008900",
+    ["yellow"] = "#695500",
+    ["yellow_warmer"] = "#973300",
+    ["yellow_cooler"] = "#77492f",
+    ["yellow_faint"] = "#624416",
+    ["yellow_intense"] = "#808000",
+    ["blue"] = "#0031a9",
+    ["blue_warmer"] = "#3548cf",
+    ["blue_cooler"] = "#0000b0",
+    ["blue_faint"] = "#003497",
+    ["blue_intense"] = "#0000ff",
+    ["magenta"] = "#721045",
+    ["magenta_warmer"] = "#8f0075",
+    ["magenta_cooler"] = "#531ab6",
+    ["magenta_faint"] = "#7c318f",
+    ["magenta_intense"] = "#cd22bd",
+    ["cyan"] = "#005e8b",
+    ["cyan_warmer"] = "#3f578f",
+    ["cyan_cooler"] = "#005f5f",
+    ["cyan_faint"] = "#004f5f",
+    ["cyan_intense"] = "#008899",
+    ["rust"] = "#8a290f",
+    ["gold"] = "#70550f",
+    ["olive"] = "#4c6000",
+    ["slate"] = "#104860",
+    ["indigo"] = "#4a3a8a",
+    ["maroon"] = "#731c52",
+    ["pink"] = "#7b435c",
+    ["bg_red_intense"] = "#ff8f88",
+    ["bg_green_intense"] = "#8adf80",
+    ["bg_yellow_intense"] = "#f3d000",
+    ["bg_blue_intense"] = "#bfc9ff",
+    ["bg_magenta_intense"] = "#dfa0f0",
+    ["bg_cyan_intense"] = "#a4d5f9",
+    ["bg_red_subtle"] = "#ffcfbf",
+    ["bg_green_subtle"] = "#b3fabf",
+    ["bg_yellow_subtle"] = "#fff576",
+    ["bg_blue_subtle"] = "#ccdfff",
+    ["bg_magenta_subtle"] = "#ffddff",
+    ["bg_cyan_subtle"] = "#bfefff",
+    ["bg_red_nuanced"] = "#ffe8e8",
+    ["bg_green_nuanced"] = "#e0f6e0",
+    ["bg_yellow_nuanced"] = "#f8f0d0",
+    ["bg_blue_nuanced"] = "#ecedff",
+    ["bg_magenta_nuanced"] = "#f8e6f5",
+    ["bg_cyan_nuanced"] = "#e0f2fa",
+    ["bg_clay"] = "#f1c8b5",
+    ["fg_clay"] = "#63192a",
+    ["bg_ochre"] = "#f0e3c0",
+    ["fg_ochre"] = "#573a30",
+    ["bg_lavender"] = "#dfcdfa",
+    ["fg_lavender"] = "#443379",
+    ["bg_sage"] = "#c0e7d4",
+    ["fg_sage"] = "#124b41",
+    ["bg_graph_red_0"] = "#ef7969",
+    ["bg_graph_red_1"] = "#ffaab4",
+    ["bg_graph_green_0"] = "#68c0a0",
+    ["bg_graph_green_1"] = "#a5dfd0",
+    ["bg_graph_yellow_0"] = "#d99f9f",
+    ["bg_graph_yellow_1"] = "#ffb58f",
+    ["bg_graph_blue_0"] = "#80a0df",
+    ["bg_graph_blue_1"] = "#a8cfff",
+    ["bg_graph_magenta_0"] = "#efafcf",
+    ["bg_graph_magenta_1"] = "#ffdaef",
+    ["bg_graph_cyan_0"] = "#7fd3ed",
+    ["bg_graph_cyan_1"] = "#afefff",
+    ["bg_completion"] = "#afdfef",
+    ["bg_hover"] = "#ffafbc",
+    ["bg_hover_secondary"] = "#abdfdd",
+    ["bg_hl_line"] = "#dfeaec",
+    ["bg_region"] = "#bdbdbd",
+    ["fg_region"] = "#000000",
+    ["bg_mode_line_active"] = "#afe0f2",
+    ["fg_mode_line_active"] = "#0f0f0f",
+    ["border_mode_line_active"] = "#2f4f44",
+    ["bg_mode_line_inactive"] = "#e6e6e6",
+    ["fg_mode_line_inactive"] = "#585858",
+    ["border_mode_line_inactive"] = "#a3a3a3",
+    ["modeline_err"] = "#8f0000",
+    ["modeline_warning"] = "#6f306f",
+    ["modeline_info"] = "#00445f",
+    ["bg_tab_bar"] = "#dfdfdf",
+    ["bg_tab_current"] = "#ffffff",
+    ["bg_tab_other"] = "#c2c2c2",
+    ["bg_added"] = "#b5e7ff",
+    ["bg_added_faint"] = "#c6f6ff",
+    ["bg_added_refine"] = "#9adcef",
+    ["bg_added_fringe"] = "#1782cc",
+    ["fg_added"] = "#005079",
+    ["fg_added_intense"] = "#0043aa",
+    ["bg_changed"] = "#eecfdf",
+    ["bg_changed_faint"] = "#f0dde5",
+    ["bg_changed_refine"] = "#e0b0d0",
+    ["bg_changed_fringe"] = "#9f6ab0",
+    ["fg_changed"] = "#6f1343",
+    ["fg_changed_intense"] = "#7f0f9f",
+    ["bg_removed"] = "#ffd8d5",
+    ["bg_removed_faint"] = "#ffe9e9",
+    ["bg_removed_refine"] = "#f3b5af",
+    ["bg_removed_fringe"] = "#d84a4f",
+    ["fg_removed"] = "#8f1313",
+    ["fg_removed_intense"] = "#aa2222",
+    ["bg_diff_context"] = "#f3f3f3",
+    ["bg_paren_match"] = "#5fcfff",
+    ["bg_paren_expression"] = "#efd3f5",
+    ["cursor"] = "#d00000",
+    ["keybind"] = "#a60000",
+    ["name"] = "#a0132f",
+    ["identifier"] = "#702000",
+    ["err"] = "#b21100",
+    ["warning"] = "#721045",
+    ["info"] = "#005e8b",
+    ["underline_err"] = "#d00000",
+    ["underline_warning"] = "#cd22bd",
+    ["underline_note"] = "#008899",
+    ["bg_prominent_err"] = "#ff8f88",
+    ["fg_prominent_err"] = "#000000",
+    ["bg_prominent_warning"] = "#dfa0f0",
+    ["fg_prominent_warning"] = "#000000",
+    ["bg_prominent_note"] = "#a4d5f9",
+    ["fg_prominent_note"] = "#000000",
+    ["bg_active_argument"] = "#ffe8e8",
+    ["fg_active_argument"] = "#b21100",
+    ["bg_active_value"] = "#e0f2fa",
+    ["fg_active_value"] = "#005e8b",
+    ["builtin"] = "#721045",
+    ["comment"] = "#702000",
+    ["constant"] = "#00663f",
+    ["docstring"] = "#224960",
+    ["fnname"] = "#3f578f",
+    ["fnname_call"] = "#4a3a8a",
+    ["keyword"] = "#a0132f",
+    ["preprocessor"] = "#b21100",
+    ["property"] = "#005f5f",
+    ["rx_backslash"] = "#721045",
+    ["rx_construct"] = "#a60000",
+    ["string"] = "#005e8b",
+    ["type"] = "#3548cf",
+    ["variable"] = "#005f5f",
+    ["variable_use"] = "#104860",
+    ["accent_0"] = "#005e8b",
+    ["accent_1"] = "#b21100",
+    ["accent_2"] = "#005f5f",
+    ["accent_3"] = "#721045",
+    ["fg_completion_match_0"] = "#005e8b",
+    ["fg_completion_match_1"] = "#b21100",
+    ["fg_completion_match_2"] = "#721045",
+    ["fg_completion_match_3"] = "#005f5f",
+    ["date_common"] = "#005f5f",
+    ["date_deadline"] = "#a60000",
+    ["date_deadline_subtle"] = "#702000",
+    ["date_event"] = "#224960",
+    ["date_holiday"] = "#a60000",
+    ["date_holiday_other"] = "#005e8b",
+    ["date_range"] = "#224960",
+    ["date_scheduled"] = "#721045",
+    ["date_scheduled_subtle"] = "#7c318f",
+    ["date_weekday"] = "#005e8b",
+    ["date_weekend"] = "#8f0075",
+    ["fg_link"] = "#005e8b",
+    ["underline_link"] = "#005e8b",
+    ["fg_link_symbolic"] = "#005f5f",
+    ["underline_link_symbolic"] = "#005f5f",
+    ["fg_link_visited"] = "#721045",
+    ["underline_link_visited"] = "#721045",
+    ["mail_cite_0"] = "#004f5f",
+    ["mail_cite_1"] = "#702000",
+    ["mail_cite_2"] = "#8f0075",
+    ["mail_cite_3"] = "#3f578f",
+    ["mail_part"] = "#005f5f",
+    ["mail_recipient"] = "#005e8b",
+    ["mail_subject"] = "#a0132f",
+    ["mail_other"] = "#005e8b",
+    ["bg_mark_delete"] = "#ffcfbf",
+    ["fg_mark_delete"] = "#a60000",
+    ["bg_mark_select"] = "#bfefff",
+    ["fg_mark_select"] = "#005e8b",
+    ["bg_mark_other"] = "#ffddff",
+    ["fg_mark_other"] = "#721045",
+    ["fg_prompt"] = "#005f5f",
+    ["fg_prose_code"] = "#005e8b",
+    ["fg_prose_macro"] = "#b21100",
+    ["fg_prose_verbatim"] = "#8f0075",
+    ["prose_done"] = "#005e8b",
+    ["prose_todo"] = "#a60000",
+    ["prose_metadata"] = "#595959",
+    ["prose_metadata_value"] = "#224960",
+    ["prose_table"] = "#224960",
+    ["prose_table_formula"] = "#a0132f",
+    ["prose_tag"] = "#224960",
+    ["rainbow_0"] = "#005e8b",
+    ["rainbow_1"] = "#a60000",
+    ["rainbow_2"] = "#3f578f",
+    ["rainbow_3"] = "#a0132f",
+    ["rainbow_4"] = "#005f5f",
+    ["rainbow_5"] = "#721045",
+    ["rainbow_6"] = "#004f5f",
+    ["rainbow_7"] = "#7c318f",
+    ["rainbow_8"] = "#702000",
+    ["bg_search_current"] = "#ff8f88",
+    ["bg_search_lazy"] = "#a4d5f9",
+    ["bg_search_static"] = "#ffddff",
+    ["bg_search_replace"] = "#dfa0f0",
+    ["bg_search_rx_group_0"] = "#bfc9ff",
+    ["bg_search_rx_group_1"] = "#dfa0f0",
+    ["bg_search_rx_group_2"] = "#bfefff",
+    ["bg_search_rx_group_3"] = "#ffcfbf",
+    ["fg_heading_0"] = "#005f5f",
+    ["fg_heading_1"] = "#000000",
+    ["fg_heading_2"] = "#702000",
+    ["fg_heading_3"] = "#004f5f",
+    ["fg_heading_4"] = "#721045",
+    ["fg_heading_5"] = "#2a5045",
+    ["fg_heading_6"] = "#7c318f",
+    ["fg_heading_7"] = "#3f578f",
+    ["fg_heading_8"] = "#595959",
+    ["bg_alt"] = "#f2f2f2",
+    ["border_highlight"] = "#9f9f9f",
+    ["bg_tab_alternate"] = "#c2c2c2",
+  },
+}
@@ -0,0 +1,270 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: modus_vivendi_deuteranopia (Modus Themes family)
+-- License: GPL v3 (palette derives from Modus; see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "modus",
+  ["flavor"] = "dark",
+  ["foreground"] = "#ffffff",
+  ["background"] = "#000000",
+  ["cursor"] = "#ffffff",
+  ["selection_background"] = "#7030af",
+  ["selection_foreground"] = "#ffffff",
+  ["ansi"] = {
+    "#000000",
+    "#ff5f59",
+    "#44bc44",
+    "#cabf00",
+    "#2fafff",
+    "#feacd0",
+    "#00d3d0",
+    "#ffffff",
+    "#535353",
+    "#ff5f5f",
+    "#44df44",
+    "#efef00",
+    "#338fff",
+    "#ff66ff",
+    "#00eff0",
+    "#989898",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#000000",
+    ["bg_dim"] = "#1e1e1e",
+    ["fg_main"] = "#ffffff",
+    ["fg_dim"] = "#989898",
+    ["fg_alt"] = "#c6daff",
+    ["bg_active"] = "#535353",
+    ["bg_inactive"] = "#303030",
+    ["border"] = "#646464",
+    ["red"] = "#ff5f59",
+    ["red_warmer"] = "#ff6b55",
+    ["red_cooler"] = "#ff7f86",
+    ["red_faint"] = "#ff9580",
+    ["red_intense"] = "#ff5f5f",
+    ["green"] = "#44bc44",
+    ["green_warmer"] = "#70b900",
+    ["green_cooler"] = "#00c06f",
+    ["green_faint"] = "#88ca9f",
+    ["green_intense"] = "#44df44",
+    ["yellow"] = "#cabf00",
+    ["yellow_warmer"] = "#ffa00f",
+    ["yellow_cooler"] = "#d8af7a",
+    ["yellow_faint"] = "#d2b580",
+    ["yellow_intense"] = "#efef00",
+    ["blue"] = "#2fafff",
+    ["blue_warmer"] = "#79a8ff",
+    ["blue_cooler"] = "#00bcff",
+    ["blue_faint"] = "#82b0ec",
+    ["blue_intense"] = "#338fff",
+    ["magenta"] = "#feacd0",
+    ["magenta_warmer"] = "#f78fe7",
+    ["magenta_cooler"] = "#b6a0ff",
+    ["magenta_faint"] = "#caa6df",
+    ["magenta_intense"] = "#ff66ff",
+    ["cyan"] = "#00d3d0",
+    ["cyan_warmer"] = "#4ae2f0",
+    ["cyan_cooler"] = "#6ae4b9",
+    ["cyan_faint"] = "#9ac8e0",
+    ["cyan_intense"] = "#00eff0",
+    ["rust"] = "#db7b5f",
+    ["gold"] = "#c0965b",
+    ["olive"] = "#9cbd6f",
+    ["slate"] = "#76afbf",
+    ["indigo"] = "#9099d9",
+    ["maroon"] = "#cf7fa7",
+    ["pink"] = "#d09dc0",
+    ["bg_red_intense"] = "#9d1f1f",
+    ["bg_green_intense"] = "#2f822f",
+    ["bg_yellow_intense"] = "#7a6100",
+    ["bg_blue_intense"] = "#1640b0",
+    ["bg_magenta_intense"] = "#7030af",
+    ["bg_cyan_intense"] = "#2266ae",
+    ["bg_red_subtle"] = "#620f2a",
+    ["bg_green_subtle"] = "#00422a",
+    ["bg_yellow_subtle"] = "#4a4000",
+    ["bg_blue_subtle"] = "#242679",
+    ["bg_magenta_subtle"] = "#552f5f",
+    ["bg_cyan_subtle"] = "#004065",
+    ["bg_red_nuanced"] = "#3a0c14",
+    ["bg_green_nuanced"] = "#092f1f",
+    ["bg_yellow_nuanced"] = "#381d0f",
+    ["bg_blue_nuanced"] = "#12154a",
+    ["bg_magenta_nuanced"] = "#2f0c3f",
+    ["bg_cyan_nuanced"] = "#042837",
+    ["bg_clay"] = "#49191a",
+    ["fg_clay"] = "#f1b090",
+    ["bg_ochre"] = "#462f20",
+    ["fg_ochre"] = "#e0d09c",
+    ["bg_lavender"] = "#38325c",
+    ["fg_lavender"] = "#dfc0f0",
+    ["bg_sage"] = "#143e32",
+    ["fg_sage"] = "#c3e7d4",
+    ["bg_graph_red_0"] = "#bf6000",
+    ["bg_graph_red_1"] = "#733500",
+    ["bg_graph_green_0"] = "#6fbf8f",
+    ["bg_graph_green_1"] = "#2f5f4f",
+    ["bg_graph_yellow_0"] = "#c1c00a",
+    ["bg_graph_yellow_1"] = "#7f6640",
+    ["bg_graph_blue_0"] = "#0f90ef",
+    ["bg_graph_blue_1"] = "#1f2f8f",
+    ["bg_graph_magenta_0"] = "#7f7f8e",
+    ["bg_graph_magenta_1"] = "#4f4f5f",
+    ["bg_graph_cyan_0"] = "#376f9a",
+    ["bg_graph_cyan_1"] = "#00404f",
+    ["bg_completion"] = "#2f447f",
+    ["bg_hover"] = "#45605e",
+    ["bg_hover_secondary"] = "#604c30",
+    ["bg_hl_line"] = "#2f3849",
+    ["bg_region"] = "#5a5a5a",
+    ["fg_region"] = "#ffffff",
+    ["bg_mode_line_active"] = "#2a2a6a",
+    ["fg_mode_line_active"] = "#f0f0f0",
+    ["border_mode_line_active"] = "#8080a7",
+    ["bg_mode_line_inactive"] = "#2d2d2d",
+    ["fg_mode_line_inactive"] = "#969696",
+    ["border_mode_line_inactive"] = "#606060",
+    ["modeline_err"] = "#e5bf00",
+    ["modeline_warning"] = "#c0cf35",
+    ["modeline_info"] = "#abeadf",
+    ["bg_tab_bar"] = "#313131",
+    ["bg_tab_current"] = "#000000",
+    ["bg_tab_other"] = "#545454",
+    ["bg_added"] = "#003066",
+    ["bg_added_faint"] = "#001a4f",
+    ["bg_added_refine"] = "#0f4a77",
+    ["bg_added_fringe"] = "#006fff",
+    ["fg_added"] = "#c4d5ff",
+    ["fg_added_intense"] = "#8080ff",
+    ["bg_changed"] = "#2f123f",
+    ["bg_changed_faint"] = "#1f022f",
+    ["bg_changed_refine"] = "#3f325f",
+    ["bg_changed_fringe"] = "#7f55a0",
+    ["fg_changed"] = "#e3cfff",
+    ["fg_changed_intense"] = "#cf9fe2",
+    ["bg_removed"] = "#3d3d00",
+    ["bg_removed_faint"] = "#281f00",
+    ["bg_removed_refine"] = "#555500",
+    ["bg_removed_fringe"] = "#d0c03f",
+    ["fg_removed"] = "#d4d48f",
+    ["fg_removed_intense"] = "#d0b05f",
+    ["bg_diff_context"] = "#1a1a1a",
+    ["bg_paren_match"] = "#2f7f9f",
+    ["bg_paren_expression"] = "#453040",
+    ["cursor"] = "#efef00",
+    ["keybind"] = "#00bcff",
+    ["name"] = "#00bcff",
+    ["identifier"] = "#d2b580",
+    ["err"] = "#ffa00f",
+    ["warning"] = "#cabf00",
+    ["info"] = "#2fafff",
+    ["underline_err"] = "#efef00",
+    ["underline_warning"] = "#caa6df",
+    ["underline_note"] = "#00d3d0",
+    ["bg_prominent_err"] = "#7a6100",
+    ["fg_prominent_err"] = "#ffffff",
+    ["bg_prominent_warning"] = "#7030af",
+    ["fg_prominent_warning"] = "#ffffff",
+    ["bg_prominent_note"] = "#2266ae",
+    ["fg_prominent_note"] = "#ffffff",
+    ["bg_active_argument"] = "#381d0f",
+    ["fg_active_argument"] = "#ffa00f",
+    ["bg_active_value"] = "#12154a",
+    ["fg_active_value"] = "#79a8ff",
+    ["builtin"] = "#cabf00",
+    ["comment"] = "#d8af7a",
+    ["constant"] = "#82b0ec",
+    ["docstring"] = "#9ac8e0",
+    ["fnname"] = "#ffa00f",
+    ["fnname_call"] = "#c0965b",
+    ["keyword"] = "#00bcff",
+    ["preprocessor"] = "#b6a0ff",
+    ["property"] = "#00d3d0",
+    ["rx_backslash"] = "#00bcff",
+    ["rx_construct"] = "#d8af7a",
+    ["string"] = "#79a8ff",
+    ["type"] = "#6ae4b9",
+    ["variable"] = "#00d3d0",
+    ["variable_use"] = "#76afbf",
+    ["accent_0"] = "#79a8ff",
+    ["accent_1"] = "#cabf00",
+    ["accent_2"] = "#6ae4b9",
+    ["accent_3"] = "#d8af7a",
+    ["fg_completion_match_0"] = "#00bcff",
+    ["fg_completion_match_1"] = "#cabf00",
+    ["fg_completion_match_2"] = "#6ae4b9",
+    ["fg_completion_match_3"] = "#d8af7a",
+    ["date_common"] = "#00d3d0",
+    ["date_deadline"] = "#ffa00f",
+    ["date_deadline_subtle"] = "#ff9580",
+    ["date_event"] = "#c6daff",
+    ["date_holiday"] = "#ffa00f",
+    ["date_holiday_other"] = "#2fafff",
+    ["date_range"] = "#c6daff",
+    ["date_scheduled"] = "#d8af7a",
+    ["date_scheduled_subtle"] = "#d2b580",
+    ["date_weekday"] = "#00d3d0",
+    ["date_weekend"] = "#b6a0ff",
+    ["fg_link"] = "#79a8ff",
+    ["underline_link"] = "#79a8ff",
+    ["fg_link_symbolic"] = "#00d3d0",
+    ["underline_link_symbolic"] = "#00d3d0",
+    ["fg_link_visited"] = "#d2b580",
+    ["underline_link_visited"] = "#d2b580",
+    ["mail_cite_0"] = "#79a8ff",
+    ["mail_cite_1"] = "#d8af7a",
+    ["mail_cite_2"] = "#9ac8e0",
+    ["mail_cite_3"] = "#cabf00",
+    ["mail_part"] = "#2fafff",
+    ["mail_recipient"] = "#2fafff",
+    ["mail_subject"] = "#ffa00f",
+    ["mail_other"] = "#9ac8e0",
+    ["bg_mark_delete"] = "#4a4000",
+    ["fg_mark_delete"] = "#cabf00",
+    ["bg_mark_select"] = "#004065",
+    ["fg_mark_select"] = "#00d3d0",
+    ["bg_mark_other"] = "#552f5f",
+    ["fg_mark_other"] = "#f78fe7",
+    ["fg_prompt"] = "#2fafff",
+    ["fg_prose_code"] = "#6ae4b9",
+    ["fg_prose_macro"] = "#b6a0ff",
+    ["fg_prose_verbatim"] = "#cabf00",
+    ["prose_done"] = "#2fafff",
+    ["prose_todo"] = "#ffa00f",
+    ["prose_metadata"] = "#989898",
+    ["prose_metadata_value"] = "#c6daff",
+    ["prose_table"] = "#c6daff",
+    ["prose_table_formula"] = "#ffa00f",
+    ["prose_tag"] = "#c6daff",
+    ["rainbow_0"] = "#ffa00f",
+    ["rainbow_1"] = "#2fafff",
+    ["rainbow_2"] = "#d8af7a",
+    ["rainbow_3"] = "#79a8ff",
+    ["rainbow_4"] = "#cabf00",
+    ["rainbow_5"] = "#4ae2f0",
+    ["rainbow_6"] = "#d2b580",
+    ["rainbow_7"] = "#82b0ec",
+    ["rainbow_8"] = "#caa6df",
+    ["bg_search_current"] = "#7a6100",
+    ["bg_search_lazy"] = "#1640b0",
+    ["bg_search_static"] = "#004065",
+    ["bg_search_replace"] = "#7a6100",
+    ["bg_search_rx_group_0"] = "#2266ae",
+    ["bg_search_rx_group_1"] = "#7030af",
+    ["bg_search_rx_group_2"] = "#242679",
+    ["bg_search_rx_group_3"] = "#4a4000",
+    ["fg_heading_0"] = "#6ae4b9",
+    ["fg_heading_1"] = "#ffffff",
+    ["fg_heading_2"] = "#d2b580",
+    ["fg_heading_3"] = "#82b0ec",
+    ["fg_heading_4"] = "#88ca9f",
+    ["fg_heading_5"] = "#b6a0ff",
+    ["fg_heading_6"] = "#d8af7a",
+    ["fg_heading_7"] = "#00d3d0",
+    ["fg_heading_8"] = "#989898",
+    ["bg_alt"] = "#1e1e1e",
+    ["border_highlight"] = "#646464",
+    ["bg_tab_alternate"] = "#545454",
+  },
+}
@@ -0,0 +1,270 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: modus_vivendi_tinted (Modus Themes family)
+-- License: GPL v3 (palette derives from Modus; see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "modus",
+  ["flavor"] = "dark",
+  ["foreground"] = "#ffffff",
+  ["background"] = "#0d0e1c",
+  ["cursor"] = "#ffffff",
+  ["selection_background"] = "#7030af",
+  ["selection_foreground"] = "#ffffff",
+  ["ansi"] = {
+    "#0d0e1c",
+    "#ff5f59",
+    "#44bc44",
+    "#d0bc00",
+    "#2fafff",
+    "#feacd0",
+    "#00d3d0",
+    "#ffffff",
+    "#4a4f69",
+    "#ff5f5f",
+    "#44df44",
+    "#efef00",
+    "#338fff",
+    "#ff66ff",
+    "#00eff0",
+    "#989898",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#0d0e1c",
+    ["bg_dim"] = "#1d2235",
+    ["fg_main"] = "#ffffff",
+    ["fg_dim"] = "#989898",
+    ["fg_alt"] = "#c6daff",
+    ["bg_active"] = "#4a4f69",
+    ["bg_inactive"] = "#2b3045",
+    ["border"] = "#61647a",
+    ["red"] = "#ff5f59",
+    ["red_warmer"] = "#ff6b55",
+    ["red_cooler"] = "#ff7f86",
+    ["red_faint"] = "#ef8386",
+    ["red_intense"] = "#ff5f5f",
+    ["green"] = "#44bc44",
+    ["green_warmer"] = "#75c13e",
+    ["green_cooler"] = "#11c777",
+    ["green_faint"] = "#88ca9f",
+    ["green_intense"] = "#44df44",
+    ["yellow"] = "#d0bc00",
+    ["yellow_warmer"] = "#fec43f",
+    ["yellow_cooler"] = "#dfaf7a",
+    ["yellow_faint"] = "#d2b580",
+    ["yellow_intense"] = "#efef00",
+    ["blue"] = "#2fafff",
+    ["blue_warmer"] = "#79a8ff",
+    ["blue_cooler"] = "#00bcff",
+    ["blue_faint"] = "#82b0ec",
+    ["blue_intense"] = "#338fff",
+    ["magenta"] = "#feacd0",
+    ["magenta_warmer"] = "#f78fe7",
+    ["magenta_cooler"] = "#b6a0ff",
+    ["magenta_faint"] = "#caa6df",
+    ["magenta_intense"] = "#ff66ff",
+    ["cyan"] = "#00d3d0",
+    ["cyan_warmer"] = "#4ae2f0",
+    ["cyan_cooler"] = "#6ae4b9",
+    ["cyan_faint"] = "#9ac8e0",
+    ["cyan_intense"] = "#00eff0",
+    ["rust"] = "#db8b3f",
+    ["gold"] = "#c0965b",
+    ["olive"] = "#9cbd6f",
+    ["slate"] = "#76afbf",
+    ["indigo"] = "#9099d9",
+    ["maroon"] = "#cf7fa7",
+    ["pink"] = "#d09dc0",
+    ["bg_red_intense"] = "#9d1f1f",
+    ["bg_green_intense"] = "#2f822f",
+    ["bg_yellow_intense"] = "#7a6100",
+    ["bg_blue_intense"] = "#1640b0",
+    ["bg_magenta_intense"] = "#7030af",
+    ["bg_cyan_intense"] = "#2266ae",
+    ["bg_red_subtle"] = "#620f2a",
+    ["bg_green_subtle"] = "#00422a",
+    ["bg_yellow_subtle"] = "#4a4000",
+    ["bg_blue_subtle"] = "#242679",
+    ["bg_magenta_subtle"] = "#552f5f",
+    ["bg_cyan_subtle"] = "#004065",
+    ["bg_red_nuanced"] = "#3a0c14",
+    ["bg_green_nuanced"] = "#092f1f",
+    ["bg_yellow_nuanced"] = "#381d0f",
+    ["bg_blue_nuanced"] = "#12154a",
+    ["bg_magenta_nuanced"] = "#2f0c3f",
+    ["bg_cyan_nuanced"] = "#042837",
+    ["bg_clay"] = "#49191a",
+    ["fg_clay"] = "#f1b090",
+    ["bg_ochre"] = "#462f20",
+    ["fg_ochre"] = "#e0d09c",
+    ["bg_lavender"] = "#38325c",
+    ["fg_lavender"] = "#dfc0f0",
+    ["bg_sage"] = "#143e32",
+    ["fg_sage"] = "#83d7ac",
+    ["bg_graph_red_0"] = "#b52c2c",
+    ["bg_graph_red_1"] = "#702020",
+    ["bg_graph_green_0"] = "#0fed00",
+    ["bg_graph_green_1"] = "#007800",
+    ["bg_graph_yellow_0"] = "#f1e00a",
+    ["bg_graph_yellow_1"] = "#b08940",
+    ["bg_graph_blue_0"] = "#2fafef",
+    ["bg_graph_blue_1"] = "#1f2f8f",
+    ["bg_graph_magenta_0"] = "#bf94fe",
+    ["bg_graph_magenta_1"] = "#5f509f",
+    ["bg_graph_cyan_0"] = "#47dfea",
+    ["bg_graph_cyan_1"] = "#00808f",
+    ["bg_completion"] = "#483d8a",
+    ["bg_hover"] = "#45605e",
+    ["bg_hover_secondary"] = "#64404f",
+    ["bg_hl_line"] = "#303a6f",
+    ["bg_region"] = "#555a66",
+    ["fg_region"] = "#ffffff",
+    ["bg_mode_line_active"] = "#484d67",
+    ["fg_mode_line_active"] = "#ffffff",
+    ["border_mode_line_active"] = "#979797",
+    ["bg_mode_line_inactive"] = "#292d48",
+    ["fg_mode_line_inactive"] = "#969696",
+    ["border_mode_line_inactive"] = "#606270",
+    ["modeline_err"] = "#ffa9bf",
+    ["modeline_warning"] = "#dfcf43",
+    ["modeline_info"] = "#9fefff",
+    ["bg_tab_bar"] = "#2c3045",
+    ["bg_tab_current"] = "#0d0e1c",
+    ["bg_tab_other"] = "#4a4f6a",
+    ["bg_added"] = "#003a2f",
+    ["bg_added_faint"] = "#002922",
+    ["bg_added_refine"] = "#035542",
+    ["bg_added_fringe"] = "#23884f",
+    ["fg_added"] = "#a0e0a0",
+    ["fg_added_intense"] = "#80e080",
+    ["bg_changed"] = "#363300",
+    ["bg_changed_faint"] = "#2a1f00",
+    ["bg_changed_refine"] = "#4a4a00",
+    ["bg_changed_fringe"] = "#8f7a30",
+    ["fg_changed"] = "#efef80",
+    ["fg_changed_intense"] = "#c0b05f",
+    ["bg_removed"] = "#4f1127",
+    ["bg_removed_faint"] = "#380a19",
+    ["bg_removed_refine"] = "#781a3a",
+    ["bg_removed_fringe"] = "#b81a26",
+    ["fg_removed"] = "#ffbfbf",
+    ["fg_removed_intense"] = "#ff9095",
+    ["bg_diff_context"] = "#1a1f30",
+    ["bg_paren_match"] = "#4f7f9f",
+    ["bg_paren_expression"] = "#453040",
+    ["cursor"] = "#ff66ff",
+    ["keybind"] = "#b6a0ff",
+    ["name"] = "#feacd0",
+    ["identifier"] = "#d2b580",
+    ["err"] = "#ff5f59",
+    ["warning"] = "#d0bc00",
+    ["info"] = "#11c777",
+    ["underline_err"] = "#ff5f5f",
+    ["underline_warning"] = "#d0bc00",
+    ["underline_note"] = "#00d3d0",
+    ["bg_prominent_err"] = "#9d1f1f",
+    ["fg_prominent_err"] = "#ffffff",
+    ["bg_prominent_warning"] = "#7a6100",
+    ["fg_prominent_warning"] = "#ffffff",
+    ["bg_prominent_note"] = "#2266ae",
+    ["fg_prominent_note"] = "#ffffff",
+    ["bg_active_argument"] = "#381d0f",
+    ["fg_active_argument"] = "#dfaf7a",
+    ["bg_active_value"] = "#042837",
+    ["fg_active_value"] = "#6ae4b9",
+    ["builtin"] = "#feacd0",
+    ["comment"] = "#ef8386",
+    ["constant"] = "#b6a0ff",
+    ["docstring"] = "#9ac8e0",
+    ["fnname"] = "#f78fe7",
+    ["fnname_call"] = "#d09dc0",
+    ["keyword"] = "#79a8ff",
+    ["preprocessor"] = "#ff7f86",
+    ["property"] = "#4ae2f0",
+    ["rx_backslash"] = "#f78fe7",
+    ["rx_construct"] = "#b6a0ff",
+    ["string"] = "#2fafff",
+    ["type"] = "#11c777",
+    ["variable"] = "#4ae2f0",
+    ["variable_use"] = "#76afbf",
+    ["accent_0"] = "#b6a0ff",
+    ["accent_1"] = "#00d3d0",
+    ["accent_2"] = "#f78fe7",
+    ["accent_3"] = "#fec43f",
+    ["fg_completion_match_0"] = "#00bcff",
+    ["fg_completion_match_1"] = "#f78fe7",
+    ["fg_completion_match_2"] = "#6ae4b9",
+    ["fg_completion_match_3"] = "#d0bc00",
+    ["date_common"] = "#00d3d0",
+    ["date_deadline"] = "#ff7f86",
+    ["date_deadline_subtle"] = "#ef8386",
+    ["date_event"] = "#c6daff",
+    ["date_holiday"] = "#f78fe7",
+    ["date_holiday_other"] = "#2fafff",
+    ["date_range"] = "#c6daff",
+    ["date_scheduled"] = "#dfaf7a",
+    ["date_scheduled_subtle"] = "#d2b580",
+    ["date_weekday"] = "#00d3d0",
+    ["date_weekend"] = "#feacd0",
+    ["fg_link"] = "#79a8ff",
+    ["underline_link"] = "#79a8ff",
+    ["fg_link_symbolic"] = "#00d3d0",
+    ["underline_link_symbolic"] = "#00d3d0",
+    ["fg_link_visited"] = "#feacd0",
+    ["underline_link_visited"] = "#feacd0",
+    ["mail_cite_0"] = "#82b0ec",
+    ["mail_cite_1"] = "#dfaf7a",
+    ["mail_cite_2"] = "#6ae4b9",
+    ["mail_cite_3"] = "#ff7f86",
+    ["mail_part"] = "#2fafff",
+    ["mail_recipient"] = "#79a8ff",
+    ["mail_subject"] = "#f78fe7",
+    ["mail_other"] = "#feacd0",
+    ["bg_mark_delete"] = "#620f2a",
+    ["fg_mark_delete"] = "#ff7f86",
+    ["bg_mark_select"] = "#004065",
+    ["fg_mark_select"] = "#00d3d0",
+    ["bg_mark_other"] = "#4a4000",
+    ["fg_mark_other"] = "#d0bc00",
+    ["fg_prompt"] = "#4ae2f0",
+    ["fg_prose_code"] = "#6ae4b9",
+    ["fg_prose_macro"] = "#b6a0ff",
+    ["fg_prose_verbatim"] = "#f78fe7",
+    ["prose_done"] = "#44bc44",
+    ["prose_todo"] = "#ff5f59",
+    ["prose_metadata"] = "#989898",
+    ["prose_metadata_value"] = "#c6daff",
+    ["prose_table"] = "#c6daff",
+    ["prose_table_formula"] = "#f78fe7",
+    ["prose_tag"] = "#caa6df",
+    ["rainbow_0"] = "#ffffff",
+    ["rainbow_1"] = "#ff66ff",
+    ["rainbow_2"] = "#00eff0",
+    ["rainbow_3"] = "#ff6b55",
+    ["rainbow_4"] = "#efef00",
+    ["rainbow_5"] = "#b6a0ff",
+    ["rainbow_6"] = "#44df44",
+    ["rainbow_7"] = "#79a8ff",
+    ["rainbow_8"] = "#f78fe7",
+    ["bg_search_current"] = "#7a6100",
+    ["bg_search_lazy"] = "#2266ae",
+    ["bg_search_static"] = "#552f5f",
+    ["bg_search_replace"] = "#9d1f1f",
+    ["bg_search_rx_group_0"] = "#1640b0",
+    ["bg_search_rx_group_1"] = "#2f822f",
+    ["bg_search_rx_group_2"] = "#620f2a",
+    ["bg_search_rx_group_3"] = "#552f5f",
+    ["fg_heading_0"] = "#6ae4b9",
+    ["fg_heading_1"] = "#ffffff",
+    ["fg_heading_2"] = "#d2b580",
+    ["fg_heading_3"] = "#82b0ec",
+    ["fg_heading_4"] = "#feacd0",
+    ["fg_heading_5"] = "#88ca9f",
+    ["fg_heading_6"] = "#ef8386",
+    ["fg_heading_7"] = "#9ac8e0",
+    ["fg_heading_8"] = "#989898",
+    ["bg_alt"] = "#1d2235",
+    ["border_highlight"] = "#61647a",
+    ["bg_tab_alternate"] = "#4a4f6a",
+  },
+}
@@ -0,0 +1,296 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: modus_vivendi_tritanopia (Modus Themes family)
+-- License: GPL v3 (palette derives from Modus; see colors/LICENSE)
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "modus",
+  ["flavor"] = "dark",
+  ["foreground"] = "#ffffff",
+  ["background"] = "#000000",
+  ["cursor"] = "#ffffff",
+  ["selection_background"] = "#7030af",
+  ["selection_foreground"] = "#ffffff",
+  ["ansi"] = {
+    "#000000",
+    "#ff5f59",
+    "#44bc44",
+    "#cabf00",
+    "#2fafff",
+    "#feacd0",
+    "#00d3d0",
+    "#ffffff",
+    "#535353",
+    "#ff5f5f",
+    "#44df44",
+    "#efef00",
+    "#338fff",
+    "#ef7fff",
+    "#00eff0",
+    "#989898",
+  },
+  ["extended"] = {
+    ["none"] = "NONE",
+    ["bg_main"] = "#000000",
+    ["bg_dim"] = "#1e1e1e",
+    ["fg_main"] = "#ffffff",
+    ["fg_dim"] = "#989898",
+    ["fg_alt"] = "#a0d7f2",
+    ["bg_active"] = "#535353",
+    ["bg_inactive"] = "#303030",
+    ["border"] = "#646464",
+    ["red"] = "#ff5f59",
+    ["red_warmer"] = "#ff6740",
+    ["red_cooler"] = "#ff7f86",
+    ["red_faint"] = "#ff9070",
+    ["red_intense"] = "#ff5f5f",
+    ["green"] = "#44bc44",
+    ["green_warmer"] = "#70b900",
+    ["green_cooler"] = "#00c06f",
+    ["green_faint"] = "#88ca9f",
+    ["green_intense"] = "#44df44",
+    ["yellow"] = "#cabf00",
+    ["yellow_warmer"] = "#ffa00f",
+    ["yellow_cooler"] = "#d8af7a",
+    ["yellow_faint"] = "#d2b580",
+    ["yellow_intense"] = "#efef00",
+    ["blue"] = "#2fafff",
+    ["blue_warmer"] = "#79a8ff",
+    ["blue_cooler"] = "#00bcff",
+    ["blue_faint"] = "#82b0ec",
+    ["blue_intense"] = "#338fff",
+    ["magenta"] = "#feacd0",
+    ["magenta_warmer"] = "#f78fe7",
+    ["magenta_cooler"] = "#b6a0ff",
+    ["magenta_faint"] = "#caa6df",
+    ["magenta_intense"] = "#ef7fff",
+    ["cyan"] = "#00d3d0",
+    ["cyan_warmer"] = "#4ae2ff",
+    ["cyan_cooler"] = "#6ae4b9",
+    ["cyan_faint"] = "#7fdbdf",
+    ["cyan_intense"] = "#00eff0",
+    ["rust"] = "#db7b5f",
+    ["gold"] = "#c0965b",
+    ["olive"] = "#9cbd6f",
+    ["slate"] = "#76afbf",
+    ["indigo"] = "#9099d9",
+    ["maroon"] = "#cf7fa7",
+    ["pink"] = "#d09dc0",
+    ["bg_red_intense"] = "#9d1f1f",
+    ["bg_green_intense"] = "#2f822f",
+    ["bg_yellow_intense"] = "#7a6100",
+    ["bg_blue_intense"] = "#1640b0",
+    ["bg_magenta_intense"] = "#7030af",
+    ["bg_cyan_intense"] = "#2266ae",
+    ["bg_red_subtle"] = "#620f2a",
+    ["bg_green_subtle"] = "#00422a",
+    ["bg_yellow_subtle"] = "#4a4000",
+    ["bg_blue_subtle"] = "#242679",
+    ["bg_magenta_subtle"] = "#552f5f",
+    ["bg_cyan_subtle"] = "#004065",
+    ["bg_red_nuanced"] = "#3a0c14",
+    ["bg_green_nuanced"] = "#092f1f",
+    ["bg_yellow_nuanced"] = "#381d0f",
+    ["bg_blue_nuanced"] = "#12154a",
+    ["bg_magenta_nuanced"] = "#2f0c3f",
+    ["bg_cyan_nuanced"] = "#042837",
+    ["bg_clay"] = "#49191a",
+    ["fg_clay"] = "#f1b090",
+    ["bg_ochre"] = "#462f20",
+    ["fg_ochre"] = "#e0d09c",
+    ["bg_lavender"] = "#38325c",
+    ["fg_lavender"] = "#dfc0f0",
+    ["bg_sage"] = "#143e32",
+    ["fg_sage"] = "#c3e7d4",
+    ["bg_graph_red_0"] = "#b52c2c",
+    ["bg_graph_red_1"] = "#702020",
+    ["bg_graph_green_0"] = "#afd1c0",
+    ["bg_graph_green_1"] = "#607a8f",
+    ["bg_graph_yellow_0"] = "#facfd6",
+    ["bg_graph_yellow_1"] = "#b57b85",
+    ["bg_graph_blue_0"] = "#4f9fdf",
+    ["bg_graph_blue_1"] = "#004559",
+    ["bg_graph_magenta_0"] = "#b6427f",
+    ["bg_graph_magenta_1"] = "#7f506f",
+    ["bg_graph_cyan_0"] = "#57dfea",
+    ["bg_graph_cyan_1"] = "#00808f",
+    ["bg_completion"] = "#004065",
+    ["bg_hover"] = "#7a6100",
+    ["bg_hover_secondary"] = "#7030af",
+    ["bg_hl_line"] = "#004065",
+    ["bg_region"] = "#2266ae",
+    ["fg_region"] = "#ffffff",
+    ["bg_mode_line_active"] = "#242679",
+    ["fg_mode_line_active"] = "#ffffff",
+    ["border_mode_line_active"] = "#338fff",
+    ["bg_mode_line_inactive"] = "#1e1e1e",
+    ["fg_mode_line_inactive"] = "#969696",
+    ["border_mode_line_inactive"] = "#535353",
+    ["modeline_err"] = "#ff7fbf",
+    ["modeline_warning"] = "#df9f93",
+    ["modeline_info"] = "#4fcfef",
+    ["bg_tab_bar"] = "#303030",
+    ["bg_tab_current"] = "#000000",
+    ["bg_tab_other"] = "#535353",
+    ["bg_added"] = "#004254",
+    ["bg_added_faint"] = "#003042",
+    ["bg_added_refine"] = "#004f7f",
+    ["bg_added_fringe"] = "#008fcf",
+    ["fg_added"] = "#9fdfdf",
+    ["fg_added_intense"] = "#50c0ef",
+    ["bg_changed"] = "#2f123f",
+    ["bg_changed_faint"] = "#1f022f",
+    ["bg_changed_refine"] = "#3f325f",
+    ["bg_changed_fringe"] = "#7f55a0",
+    ["fg_changed"] = "#e3cfff",
+    ["fg_changed_intense"] = "#cf9fe2",
+    ["bg_removed"] = "#4f1119",
+    ["bg_removed_faint"] = "#380a0f",
+    ["bg_removed_refine"] = "#781a1f",
+    ["bg_removed_fringe"] = "#b81a1f",
+    ["fg_removed"] = "#ffbfbf",
+    ["fg_removed_intense"] = "#ff9095",
+    ["bg_diff_context"] = "#1a1a1a",
+    ["bg_paren_match"] = "#004065",
+    ["bg_paren_expression"] = "#453040",
+    ["cursor"] = "#ff5f5f",
+    ["keybind"] = "#f78fe7",
+    ["name"] = "#79a8ff",
+    ["identifier"] = "#feacd0",
+    ["err"] = "#ff6740",
+    ["warning"] = "#feacd0",
+    ["info"] = "#00d3d0",
+    ["underline_err"] = "#ff9070",
+    ["underline_warning"] = "#d2b580",
+    ["underline_note"] = "#7fdbdf",
+    ["bg_prominent_err"] = "#9d1f1f",
+    ["fg_prominent_err"] = "#ffffff",
+    ["bg_prominent_warning"] = "#7030af",
+    ["fg_prominent_warning"] = "#ffffff",
+    ["bg_prominent_note"] = "#2266ae",
+    ["fg_prominent_note"] = "#ffffff",
+    ["bg_active_argument"] = "#3a0c14",
+    ["fg_active_argument"] = "#ff6740",
+    ["bg_active_value"] = "#042837",
+    ["fg_active_value"] = "#00d3d0",
+    ["builtin"] = "#feacd0",
+    ["comment"] = "#ff9070",
+    ["constant"] = "#79a8ff",
+    ["docstring"] = "#a0d7f2",
+    ["fnname"] = "#b6a0ff",
+    ["fnname_call"] = "#9099d9",
+    ["keyword"] = "#f78fe7",
+    ["preprocessor"] = "#ff7f86",
+    ["property"] = "#6ae4b9",
+    ["rx_backslash"] = "#ff6740",
+    ["rx_construct"] = "#00bcff",
+    ["string"] = "#70b900",
+    ["type"] = "#6ae4b9",
+    ["variable"] = "#00d3d0",
+    ["variable_use"] = "#76afbf",
+    ["accent_0"] = "#f78fe7",
+    ["accent_1"] = "#00d3d0",
+    ["accent_2"] = "#79a8ff",
+    ["accent_3"] = "#ff7f86",
+    ["fg_completion_match_0"] = "#00d3d0",
+    ["fg_completion_match_1"] = "#ff6740",
+    ["fg_completion_match_2"] = "#feacd0",
+    ["fg_completion_match_3"] = "#6ae4b9",
+    ["date_common"] = "#6ae4b9",
+    ["date_deadline"] = "#b6a0ff",
+    ["date_deadline_subtle"] = "#ff9070",
+    ["date_event"] = "#2fafff",
+    ["date_holiday"] = "#f78fe7",
+    ["date_holiday_other"] = "#4ae2ff",
+    ["date_range"] = "#2fafff",
+    ["date_scheduled"] = "#d8af7a",
+    ["date_scheduled_subtle"] = "#caa6df",
+    ["date_weekday"] = "#82b0ec",
+    ["date_weekend"] = "#ff9070",
+    ["fg_link"] = "#82b0ec",
+    ["underline_link"] = "#535353",
+    ["fg_link_symbolic"] = "#7fdbdf",
+    ["underline_link_symbolic"] = "#535353",
+    ["fg_link_visited"] = "#caa6df",
+    ["underline_link_visited"] = "#535353",
+    ["mail_cite_0"] = "#caa6df",
+    ["mail_cite_1"] = "#6ae4b9",
+    ["mail_cite_2"] = "#70b900",
+    ["mail_cite_3"] = "#ff9070",
+    ["mail_part"] = "#00d3d0",
+    ["mail_recipient"] = "#feacd0",
+    ["mail_subject"] = "#79a8ff",
+    ["mail_other"] = "#f78fe7",
+    ["bg_mark_delete"] = "#620f2a",
+    ["fg_mark_delete"] = "#ff5f59",
+    ["bg_mark_select"] = "#004065",
+    ["fg_mark_select"] = "#00d3d0",
+    ["bg_mark_other"] = "#552f5f",
+    ["fg_mark_other"] = "#f78fe7",
+    ["fg_prompt"] = "#f78fe7",
+    ["fg_prose_code"] = "#9cbd6f",
+    ["fg_prose_macro"] = "#ff7f86",
+    ["fg_prose_verbatim"] = "#00bcff",
+    ["prose_done"] = "#44df44",
+    ["prose_todo"] = "#ff5f5f",
+    ["prose_metadata"] = "#caa6df",
+    ["prose_metadata_value"] = "#00bcff",
+    ["prose_table"] = "#2fafff",
+    ["prose_table_formula"] = "#ff7f86",
+    ["prose_tag"] = "#989898",
+    ["rainbow_0"] = "#ffffff",
+    ["rainbow_1"] = "#feacd0",
+    ["rainbow_2"] = "#00d3d0",
+    ["rainbow_3"] = "#ff9070",
+    ["rainbow_4"] = "#d2b580",
+    ["rainbow_5"] = "#b6a0ff",
+    ["rainbow_6"] = "#44bc44",
+    ["rainbow_7"] = "#79a8ff",
+    ["rainbow_8"] = "#caa6df",
+    ["bg_search_current"] = "#9d1f1f",
+    ["bg_search_lazy"] = "#2266ae",
+    ["bg_search_static"] = "#552f5f",
+    ["bg_search_replace"] = "#7030af",
+    ["bg_search_rx_group_0"] = "#1640b0",
+    ["bg_search_rx_group_1"] = "#7030af",
+    ["bg_search_rx_group_2"] = "#004065",
+    ["bg_search_rx_group_3"] = "#620f2a",
+    ["fg_heading_0"] = "#00bcff",
+    ["fg_heading_1"] = "#b6a0ff",
+    ["fg_heading_2"] = "#f78fe7",
+    ["fg_heading_3"] = "#2fafff",
+    ["fg_heading_4"] = "#00d3d0",
+    ["fg_heading_5"] = "#70b900",
+    ["fg_heading_6"] = "#cabf00",
+    ["fg_heading_7"] = "#ff5f59",
+    ["fg_heading_8"] = "#feacd0",
+    ["docmarkup"] = "#caa6df",
+    ["bg_button_active"] = "#000000",
+    ["fg_button_active"] = "#ffffff",
+    ["bg_button_inactive"] = "#303030",
+    ["fg_line_number_active"] = "#ffffff",
+    ["fringe"] = "#303030",
+    ["date_now"] = "#82b0ec",
+    ["bg_prose_block_delimiter"] = "#1e1e1e",
+    ["fg_prose_block_delimiter"] = "#ff9070",
+    ["bg_heading_1"] = "#2f0c3f",
+    ["bg_heading_2"] = "#3a0c14",
+    ["bg_heading_3"] = "#12154a",
+    ["bg_heading_4"] = "#042837",
+    ["bg_heading_5"] = "#092f1f",
+    ["bg_heading_6"] = "#381d0f",
+    ["bg_heading_7"] = "#3a0c14",
+    ["bg_heading_8"] = "#2f0c3f",
+    ["overline_heading_1"] = "#b6a0ff",
+    ["overline_heading_2"] = "#f78fe7",
+    ["overline_heading_3"] = "#2fafff",
+    ["overline_heading_4"] = "#00d3d0",
+    ["overline_heading_5"] = "#44bc44",
+    ["overline_heading_6"] = "#d8af7a",
+    ["overline_heading_7"] = "#ff7f86",
+    ["overline_heading_8"] = "#feacd0",
+    ["kill_new"] = "#70b900",
+    ["bg_alt"] = "#1e1e1e",
+    ["border_highlight"] = "#646464",
+    ["bg_tab_alternate"] = "#535353",
+  },
+}
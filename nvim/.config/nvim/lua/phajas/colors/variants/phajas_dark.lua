@@ -0,0 +1,31 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: phajas_dark (Phajas family)
+-- License: Custom
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "phajas",
+  ["flavor"] = "dark",
+  ["foreground"] = "#d3d0c8",
+  ["background"] = "#2d2d2d",
+  ["cursor"] = "#d3d0c8",
+  ["selection_background"] = "#747369",
+  ["selection_foreground"] = "#f2f0ec",
+  ["ansi"] = {
+    "#2d2d2d",
+    "#f2777a",
+    "#99cc99",
+    "#ffcc66",
+    "#6699cc",
+    "#cc99cc",
+    "#66cccc",
+    "#d3d0c8",
+    "#747369",
+    "#f2777a",
+    "#99cc99",
+    "#ffcc66",
+    "#6699cc",
+    "#cc99cc",
+    "#66cccc",
+    "#f2f0ec",
+  },
+}
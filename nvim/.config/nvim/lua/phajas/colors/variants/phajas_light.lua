@@ -0,0 +1,31 @@
+-- Generated by colors/build.py from colors/palette.toml
+-- Palette variant: phajas_light (Phajas family)
+-- License: Custom
+-- Palette variant module for Lua consumers (generated)
+return {
+  ["family"] = "phajas",
+  ["flavor"] = "light",
+  ["foreground"] = "#2d2d2d",
+  ["background"] = "#f2f0ec",
+  ["cursor"] = "#2d2d2d",
+  ["selection_background"] = "#d3d0c8",
+  ["selection_foreground"] = "#2d2d2d",
+  ["ansi"] = {
+    "#f2f0ec",
+    "#f2777a",
+    "#99cc99",
+    "#ffcc66",
+    "#6699cc",
+    "#cc99cc",
+    "#66cccc",
+    "#2d2d2d",
+    "#d3d0c8",
+    "#f2777a",
+    "#99cc99",
+    "#ffcc66",
+    "#6699cc",
+    "#cc99cc",
+    "#66cccc",
+    "#747369",
+  },
+}
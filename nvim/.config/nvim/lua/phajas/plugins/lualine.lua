@@ -1,7 +1,7 @@
-local palette_path = vim.fn.stdpath("config") .. "/lua/phajas/colors/palette.lua"
+local colors_dir = vim.fn.stdpath("config") .. "/lua/phajas/colors"
 
 local function loadPalette()
-    local ok, palette = pcall(dofile, palette_path)
+    local ok, palette = pcall(dofile, colors_dir .. "/index.lua")
     if not ok or type(palette) ~= "table" then
         return { variants = {}, default_variant = nil }
     end
@@ -11,19 +11,29 @@ local function loadPalette()
     }
 end
 
+local function loadVariant(palette, name)
+    if not name or not palette.variants[name] then
+        return nil
+    end
+    local ok, variant = pcall(dofile, colors_dir .. "/variants/" .. name .. ".lua")
+    if ok and type(variant) == "table" then
+        return variant
+    end
+end
+
 local function select_variant()
     local palette = loadPalette()
     local requested = vim.g.phajas_palette_variant
     if requested and palette.variants[requested] then
-        return palette.variants[requested]
+        return loadVariant(palette, requested)
     end
-    for _, variant in pairs(palette.variants or {}) do
-        if variant.flavor == vim.o.background then
-            return variant
+    for name, info in pairs(palette.variants or {}) do
+        if info.flavor == vim.o.background then
+            return loadVariant(palette, name)
         end
     end
     if palette.default_variant and palette.variants then
-        return palette.variants[palette.default_variant]
+        return loadVariant(palette, palette.default_variant)
     end
 end
 
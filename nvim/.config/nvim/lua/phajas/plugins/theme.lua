@@ -1,9 +1,13 @@
 -- Palette-driven colorscheme (generated).
 
-local state_file = vim.fn.expand("~/.config/colorscheme/current")
+local state_dir = vim.fn.expand("~/.config/colorscheme")
+local state_file = state_dir .. "/current"
+local generation_file = state_dir .. "/generation"
 local last_state_mtime = 0
+local last_generation = nil
 local last_variant_name = nil
-local palette_path = vim.fn.stdpath("config") .. "/lua/phajas/colors/palette.lua"
+-- Index of families and variant names; variant data is loaded by the colorscheme
+local palette_path = vim.fn.stdpath("config") .. "/lua/phajas/colors/index.lua"
 
 local function loadPalette()
     local ok, palette = pcall(dofile, palette_path)
@@ -80,6 +84,26 @@ local function hasColorschemeStateChanged()
     return false
 end
 
+local function readGeneration()
+    -- Bumped by the colorscheme CLI, build.py and Hammerspoon (on appearance changes)
+    local f = io.open(generation_file, "r")
+    if not f then
+        return nil
+    end
+    local content = f:read("*l")
+    f:close()
+    return content
+end
+
+local function hasGenerationChanged()
+    local generation = readGeneration()
+    if generation ~= last_generation then
+        last_generation = generation
+        return true
+    end
+    return false
+end
+
 local function setIndentScopeHighlight()
     vim.api.nvim_set_hl(0, 'MiniIndentscopeSymbol', { link = 'Comment' })
 end
@@ -120,21 +144,48 @@ end
 local bundleID = os.getenv("__CFBundleIdentifier")
 -- if bundleID == nil or
 --    bundleID ~= "com.apple.Terminal" then
+   hasColorschemeStateChanged()
+   hasGenerationChanged()
    applyTheme()
 
-   -- Set up a timer to check for appearance and colorscheme changes every 3 seconds
-   -- This allows the theme to update when macOS dark mode is toggled or colorscheme changes
-   local timer = vim.loop.new_timer()
-   timer:start(3000, 3000, vim.schedule_wrap(function()
+   local function checkForChanges()
        local current_bg = vim.opt.background:get()
        local new_appearance = detectMacOSAppearance()
        local state_changed = hasColorschemeStateChanged()
+       local generation_changed = hasGenerationChanged()
 
-        if current_bg ~= new_appearance or state_changed then
+       if current_bg ~= new_appearance or state_changed or generation_changed then
            applyTheme()
-        end
-
-   end))
+       end
+   end
+
+   -- Watch the state directory so switches apply immediately. Writers replace
+   -- files atomically, so a burst of events is coalesced into one check.
+   local pending = false
+   local watcher = vim.loop.new_fs_event()
+   if watcher then
+       local ok = watcher:start(state_dir, {}, vim.schedule_wrap(function(err, filename)
+           if err or pending then
+               return
+           end
+           if filename ~= "generation" and filename ~= "current" then
+               return
+           end
+           pending = true
+           vim.defer_fn(function()
+               pending = false
+               checkForChanges()
+           end, 100)
+       end))
+       if not ok then
+           watcher:close()
+       end
+   end
+
+   -- Slow fallback for appearance changes when nothing bumps the generation
+   -- file (e.g. Hammerspoon is not running)
+   local timer = vim.loop.new_timer()
+   timer:start(30000, 30000, vim.schedule_wrap(checkForChanges))
 
    -- Set up autocommand to reapply indent scope highlight after any colorscheme change
    vim.api.nvim_create_autocmd("ColorScheme", {
@@ -9,9 +9,11 @@ import json
 import math
 import os
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 from typing import Dict, Any, List
+from unittest.mock import patch
 
 # Add the script directory to path to import the module under test
 script_dir = Path(__file__).parent
@@ -2535,6 +2537,372 @@ class TestLockAndDebounce(unittest.TestCase):
             self.assertFalse(yut.has_newer_script_invocation("yabai_update_tiling", 100))
 
 
+class StateDirTestCase(unittest.TestCase):
+    """Points yut.STATE_DIR at a fresh temporary directory for each test."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._old_state_dir = yut.STATE_DIR
+        yut.STATE_DIR = self._tmp.name
+
+    def tearDown(self):
+        yut.STATE_DIR = self._old_state_dir
+        self._tmp.cleanup()
+
+
+class TestLayoutPlanCache(StateDirTestCase):
+    """Tests for the topology-keyed layout plan cache."""
+
+    THREE_DISPLAYS = [
+        {"index": 1, "uuid": "uuid-left", "frame": {"x": 0, "y": 0, "w": 1920, "h": 1080}},
+        {"index": 2, "uuid": "uuid-center", "frame": {"x": 1920, "y": 0, "w": 2560, "h": 1440}},
+        {"index": 3, "uuid": "uuid-right", "frame": {"x": 4480, "y": 0, "w": 1920, "h": 1080}},
+    ]
+
+    def test_plan_matches_direct_bucket_layout(self):
+        """Precomputed column tables should equal direct bucket_layout calls."""
+        plan = yut.compute_layout_plan(self.THREE_DISPLAYS)
+        self.assertTrue(plan["use_five_buckets"])
+        self.assertEqual(plan["widget_display"], 3)
+        self.assertEqual(plan["widget_side"], "left")
+        self.assertEqual(
+            plan["bucket_layouts"][2],
+            yut.bucket_layout(["left", "center", "right"], 2560, center_bucket=True),
+        )
+        self.assertEqual(
+            plan["bucket_layouts"][3],
+            yut.bucket_layout(
+                ["far_right"], 1920, center_bucket=True, left_cutout_px=yut.WIDGET_PADDING
+            ),
+        )
+
+    def test_ultrawide_plan_includes_cutout_layout(self):
+        """Ultrawide mode should precompute the 3-bucket table with the widget cutout."""
+        displays = [{"index": 1, "uuid": "uw", "frame": {"x": 0, "y": 0, "w": 3440, "h": 1440}}]
+        plan = yut.compute_layout_plan(displays)
+        self.assertFalse(plan["use_five_buckets"])
+        self.assertEqual(plan["ultra_index"], 1)
+        self.assertEqual(
+            plan["bucket_layouts"][1],
+            yut.bucket_layout(
+                ["left", "center", "right"], 3440, center_bucket=True,
+                right_cutout_px=yut.WIDGET_PADDING,
+            ),
+        )
+
+    def test_known_topology_reuses_cached_plan(self):
+        """A second lookup for the same topology should not recompute."""
+        first = yut.get_layout_plan(self.THREE_DISPLAYS)
+        with patch("yabai_update_tiling.compute_layout_plan") as mock_compute:
+            second = yut.get_layout_plan(self.THREE_DISPLAYS)
+            mock_compute.assert_not_called()
+        self.assertEqual(first, second)
+
+    def test_topology_change_invalidates_plan(self):
+        """Changing a display frame should produce a different fingerprint."""
+        moved = json.loads(json.dumps(self.THREE_DISPLAYS))
+        moved[2]["frame"]["w"] = 2560
+        self.assertNotEqual(
+            yut.topology_fingerprint(self.THREE_DISPLAYS),
+            yut.topology_fingerprint(moved),
+        )
+
+    def test_override_env_changes_fingerprint(self):
+        """Display override env vars are part of the fingerprint."""
+        before = yut.topology_fingerprint(self.THREE_DISPLAYS)
+        with patch.dict(os.environ, {"YABAI_WIDGET_DISPLAY": "uuid-center"}):
+            after = yut.topology_fingerprint(self.THREE_DISPLAYS)
+        self.assertNotEqual(before, after)
+
+    def test_cache_disabled_without_state_dir(self):
+        """With no state dir the plan is computed every time and nothing is written."""
+        yut.STATE_DIR = None
+        with patch("yabai_update_tiling.compute_layout_plan", wraps=yut.compute_layout_plan) as mock_compute:
+            yut.get_layout_plan(self.THREE_DISPLAYS)
+            yut.get_layout_plan(self.THREE_DISPLAYS)
+            self.assertEqual(mock_compute.call_count, 2)
+        self.assertEqual(os.listdir(self._tmp.name), [])
+
+
+class TestRuleApplySkip(StateDirTestCase):
+    """Tests for skipping `rule --apply` when rules and displays are unchanged."""
+
+    DISPLAYS = [{"index": 1, "uuid": "uuid-1", "frame": {"x": 0, "y": 0, "w": 1920, "h": 1080}}]
+    RULES = [{"index": 0, "app": "^Steam$", "manage": False}]
+
+    def apply(self, rules, displays, force=False, ok=True):
+        """Run apply_rules_if_changed with a stubbed run_cmd."""
+        executor = yut.YabaiCommandExecutor(dry_run=False)
+        with patch("yabai_update_tiling.run_cmd", return_value=ok):
+            issued = yut.apply_rules_if_changed(rules, displays, executor, force=force)
+        return issued, executor
+
+    def test_first_apply_runs(self):
+        """Rules are applied when no previous apply was recorded."""
+        issued, executor = self.apply(self.RULES, self.DISPLAYS)
+        self.assertTrue(issued)
+        self.assertEqual(executor.executed_commands, [["yabai", "-m", "rule", "--apply"]])
+
+    def test_unchanged_rules_and_displays_skip(self):
+        """An identical rule set and display set should skip the apply."""
+        self.apply(self.RULES, self.DISPLAYS)
+        issued, executor = self.apply(self.RULES, self.DISPLAYS)
+        self.assertFalse(issued)
+        self.assertEqual(executor.executed_commands, [])
+
+    def test_force_reapplies(self):
+        """The force flag bypasses the fingerprint check."""
+        self.apply(self.RULES, self.DISPLAYS)
+        issued, _ = self.apply(self.RULES, self.DISPLAYS, force=True)
+        self.assertTrue(issued)
+
+    def test_rule_change_reapplies(self):
+        """Adding a rule changes the fingerprint."""
+        self.apply(self.RULES, self.DISPLAYS)
+        rules = self.RULES + [{"index": 1, "app": "^mpv$", "manage": False}]
+        issued, _ = self.apply(rules, self.DISPLAYS)
+        self.assertTrue(issued)
+
+    def test_display_change_reapplies(self):
+        """Connecting a display changes the fingerprint."""
+        self.apply(self.RULES, self.DISPLAYS)
+        displays = self.DISPLAYS + [{"index": 2, "uuid": "uuid-2", "frame": {"x": 1920, "y": 0, "w": 1920, "h": 1080}}]
+        issued, _ = self.apply(self.RULES, displays)
+        self.assertTrue(issued)
+
+    def test_failed_apply_is_retried(self):
+        """A failed apply must not be recorded as successful."""
+        self.apply(self.RULES, self.DISPLAYS, ok=False)
+        issued, _ = self.apply(self.RULES, self.DISPLAYS)
+        self.assertTrue(issued)
+
+    def test_state_from_older_format_reapplies(self):
+        """A hash recorded without the state version is rewritten with manage_off."""
+        import hashlib
+
+        payload = {"rules": self.RULES, "displays": ["uuid-1"]}
+        old_hash = hashlib.sha1(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+        yut.write_state(yut.RULES_STATE_FILE, {"hash": old_hash, "applied_at": 0})
+        issued, _ = self.apply(self.RULES, self.DISPLAYS)
+        self.assertTrue(issued)
+        self.assertEqual(yut.read_state(yut.RULES_STATE_FILE)["manage_off"], self.RULES)
+
+    def test_dry_run_does_not_record(self):
+        """Dry runs never persist the fingerprint."""
+        executor = yut.YabaiCommandExecutor(dry_run=True)
+        yut.apply_rules_if_changed(self.RULES, self.DISPLAYS, executor)
+        self.assertIsNone(yut.read_state(yut.RULES_STATE_FILE))
+
+
+class TestSessionRestoreSuspend(StateDirTestCase):
+    """Tests for suspend/resume and automatic event storm detection."""
+
+    def test_suspended_events_are_recorded_and_counted_on_resume(self):
+        """Events during a suspension are recorded; resume reports and clears them."""
+        self.assertFalse(yut.tiling_suspended())
+        self.assertTrue(yut.suspend_tiling("manual", exclusive=False))
+        self.assertTrue(yut.tiling_suspended())
+        for _ in range(3):
+            yut.record_suspended_event("window_created")
+        self.assertEqual(yut.resume_tiling(), 3)
+        self.assertFalse(yut.tiling_suspended())
+        self.assertEqual(yut.read_state_lines(yut.SUSPENDED_EVENTS_FILE), [])
+
+    def test_exclusive_suspend_has_single_owner(self):
+        """Only the first concurrent storm detector owns the suspension."""
+        self.assertTrue(yut.suspend_tiling("storm"))
+        self.assertFalse(yut.suspend_tiling("storm"))
+
+    def test_storm_detected_at_threshold(self):
+        """A burst of events within the window is a storm; a trickle is not."""
+        now = 1000.0
+        results = [
+            yut.detect_event_storm(now + i * 0.1) for i in range(yut.STORM_THRESHOLD)
+        ]
+        self.assertEqual(results, [False] * (yut.STORM_THRESHOLD - 1) + [True])
+
+    def test_spread_out_events_are_not_a_storm(self):
+        """Events further apart than the storm window never accumulate."""
+        step = yut.STORM_WINDOW_SECONDS + 0.5
+        for i in range(yut.STORM_THRESHOLD * 5):
+            self.assertFalse(yut.detect_event_storm(1000.0 + i * step))
+        # The log is trimmed instead of growing without bound
+        self.assertLessEqual(
+            len(yut.read_state_lines(yut.RECENT_EVENTS_FILE)), yut.STORM_THRESHOLD * 4 + 1
+        )
+
+    def test_stale_automatic_suspension_is_cleared(self):
+        """An auto-suspension whose owner died must not block tiling forever."""
+        yut.write_state(
+            yut.SUSPEND_STATE_FILE,
+            {"since": 0, "reason": "storm", "pid": 1},
+        )
+        self.assertFalse(yut.tiling_suspended())
+        self.assertIsNone(yut.read_state(yut.SUSPEND_STATE_FILE))
+
+    def test_manual_suspension_never_expires(self):
+        """Manual suspensions last until an explicit resume."""
+        yut.write_state(
+            yut.SUSPEND_STATE_FILE,
+            {"since": 0, "reason": "manual", "pid": 1},
+        )
+        self.assertTrue(yut.tiling_suspended())
+
+    def test_deferred_config_event_upgrades_window_pass(self):
+        """A config event dropped while the lock was held makes the pass refresh config."""
+        yut.defer_event("window_moved")
+        yut.defer_event("display_changed")
+        deferred = yut.take_deferred_events()
+        self.assertEqual(deferred, ["window_moved", "display_changed"])
+        self.assertEqual(yut.pass_event("window_created", deferred), "display_changed")
+        self.assertEqual(yut.take_deferred_events(), [])
+
+    def test_deferred_window_events_keep_pass_event(self):
+        """Window events deferred to the holder do not change what it runs as."""
+        yut.defer_event("window_resized")
+        self.assertEqual(yut.pass_event("window_created", yut.take_deferred_events()), "window_created")
+        yut.defer_event("")
+        self.assertEqual(yut.pass_event("window_created", yut.take_deferred_events()), "")
+
+    def test_timed_pass_reports_planning_and_execution(self):
+        """The resume pass returns non-negative planning and execution times."""
+        test_data = EMBEDDED_SCENARIOS["three-displays-uw-center"]
+        provider = yut.MockYabaiProvider(test_data)
+        executor = yut.YabaiCommandExecutor(dry_run=True)
+        with patch("builtins.print"):
+            planning, execution = yut.timed_update_tiling(provider, executor, "")
+        self.assertGreaterEqual(planning, 0.0)
+        self.assertGreaterEqual(execution, 0.0)
+        self.assertTrue(any("--grid" in cmd for cmd in executor.executed_commands))
+
+
+class TestFastPlacement(StateDirTestCase):
+    """Tests for predictive window_created placement from the cached plan."""
+
+    DISPLAYS = TestLayoutPlanCache.THREE_DISPLAYS
+
+    def setUp(self):
+        super().setUp()
+        self._old_rules = (yut.MANAGE_OFF_RULES, yut.MANAGE_OFF_APPS)
+
+    def tearDown(self):
+        yut.MANAGE_OFF_RULES, yut.MANAGE_OFF_APPS = self._old_rules
+        super().tearDown()
+
+    def make_window(self, **overrides):
+        """Return a regular window on the center display's right third."""
+        win = {
+            "id": 42,
+            "app": "Safari",
+            "title": "Start Page",
+            "role": "AXWindow",
+            "subrole": "AXStandardWindow",
+            "display": 2,
+            "space": 2,
+            "frame": {"x": 3900, "y": 0, "w": 500, "h": 800},
+        }
+        win.update(overrides)
+        return win
+
+    def record_rules(self, manage_off=()):
+        """Record the manage-off rules a successful rule apply would leave."""
+        yut.write_state(yut.RULES_STATE_FILE, {"hash": "x", "manage_off": list(manage_off)})
+
+    def place(self, win):
+        """Run the fast path against a mock provider holding one window."""
+        provider = yut.MockYabaiProvider({"windows": [win]})
+        executor = yut.YabaiCommandExecutor(dry_run=True)
+        with patch("builtins.print"):
+            placed = yut.fast_place_window(win["id"], provider, executor)
+        return placed, executor
+
+    def test_places_window_in_predicted_bucket(self):
+        """A new window is gridded into the bucket under its current position."""
+        plan = yut.get_layout_plan(self.DISPLAYS)
+        self.record_rules()
+        placed, executor = self.place(self.make_window())
+        self.assertTrue(placed)
+        right = plan["bucket_layouts"][2]["right"]
+        self.assertEqual(
+            executor.executed_commands,
+            [["yabai", "-m", "window", "42", "--grid", f"1:{yut.GRID_COLUMNS}:{right['col']}:0:{right['span']}:1"]],
+        )
+
+    def test_no_cached_plan_skips(self):
+        """Without a cached plan the fast path defers to the full pass."""
+        placed, executor = self.place(self.make_window())
+        self.assertFalse(placed)
+        self.assertEqual(executor.executed_commands, [])
+
+    def test_standard_mode_skips(self):
+        """Standard mode has no buckets to predict."""
+        yut.get_layout_plan([{"index": 1, "uuid": "laptop", "frame": {"x": 0, "y": 0, "w": 1440, "h": 900}}])
+        placed, _ = self.place(self.make_window(display=1))
+        self.assertFalse(placed)
+
+    def test_manage_off_rule_from_last_apply_is_respected(self):
+        """Manage-off rules recorded at the last rule apply exclude the window."""
+        yut.get_layout_plan(self.DISPLAYS)
+        self.record_rules([{"app": "^Safari$", "manage": False}])
+        placed, _ = self.place(self.make_window())
+        self.assertFalse(placed)
+
+    def test_missing_manage_off_rules_skip(self):
+        """Rule state without a manage_off list (older format) fails closed."""
+        yut.get_layout_plan(self.DISPLAYS)
+        yut.write_state(yut.RULES_STATE_FILE, {"hash": "x", "applied_at": 0})
+        placed, executor = self.place(self.make_window())
+        self.assertFalse(placed)
+        self.assertEqual(executor.executed_commands, [])
+
+    def test_no_placement_while_lock_is_held(self):
+        """The fast path never moves a window while another update holds the lock."""
+        yut.get_layout_plan(self.DISPLAYS)
+        self.record_rules()
+        lock_path = os.path.join(self._tmp.name, "lock")
+        Path(lock_path).touch()
+        win = self.make_window()
+        provider = yut.MockYabaiProvider({"windows": [win]})
+        executor = yut.YabaiCommandExecutor(dry_run=True)
+
+        held = yut.acquire_lock(lock_path)
+        try:
+            with patch("builtins.print"):
+                lock_fd = yut.fast_place_window_locked(win["id"], provider, executor, lock_path)
+            self.assertIsNone(lock_fd)
+            self.assertEqual(executor.executed_commands, [])
+        finally:
+            yut.release_lock(held)
+
+        with patch("builtins.print"):
+            lock_fd = yut.fast_place_window_locked(win["id"], provider, executor, lock_path)
+        try:
+            self.assertIsNotNone(lock_fd)
+            self.assertEqual(len(executor.executed_commands), 1)
+            # Still held: the signals fired by the placement are skipped
+            self.assertIsNone(yut.acquire_lock(lock_path))
+        finally:
+            yut.release_lock(lock_fd)
+
+    def test_hidden_windows_skip(self):
+        """Hidden or invisible windows are left alone."""
+        yut.get_layout_plan(self.DISPLAYS)
+        self.record_rules()
+        placed, _ = self.place(self.make_window(**{"is-hidden": True}))
+        self.assertFalse(placed)
+        placed, _ = self.place(self.make_window(**{"is-visible": False}))
+        self.assertFalse(placed)
+
+    def test_journal_and_dialog_windows_skip(self):
+        """Special placement and floating UI are left to the full pass."""
+        yut.get_layout_plan(self.DISPLAYS)
+        self.record_rules()
+        placed, _ = self.place(self.make_window(title="wiki_journal_today"))
+        self.assertFalse(placed)
+        placed, _ = self.place(self.make_window(subrole="AXDialog"))
+        self.assertFalse(placed)
+
+
 def run_tests():
     """Run all tests and return exit code."""
     # Disable verbose logging for tests
@@ -2566,6 +2934,10 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestUltrawideBucketTiling))
     suite.addTests(loader.loadTestsFromTestCase(TestPaddingConfiguration))
     suite.addTests(loader.loadTestsFromTestCase(TestLockAndDebounce))
+    suite.addTests(loader.loadTestsFromTestCase(TestLayoutPlanCache))
+    suite.addTests(loader.loadTestsFromTestCase(TestRuleApplySkip))
+    suite.addTests(loader.loadTestsFromTestCase(TestSessionRestoreSuspend))
+    suite.addTests(loader.loadTestsFromTestCase(TestFastPlacement))
     suite.addTests(loader.loadTestsFromTestCase(TestScenarioIntegration))
 
     # Run tests